@@ -0,0 +1,246 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+"""
+Compiles and runs generated mocks on the host for several plugin combinations.
+
+    python benchmarks/bench_host.py --counts 10,100,1000,10000 --json host.json
+
+For each combination it reports how long the compiler needs for every mock source,
+the size of the resulting objects, and the cost per expectation of setting up,
+calling, verifying and destroying mocks as the number of expectations grows.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+sys.path.insert(0, HERE)
+
+from cmock import CMock
+from synthetic_header import SyntheticHeader
+
+COMBINATIONS = {
+    'expect': {':plugins': []},
+    'ignore_return_thru_ptr': {':plugins': [':ignore', ':return_thru_ptr']},
+    'array_smart': {':plugins': [':array'], ':when_ptr': ':smart'},
+    'callback': {':plugins': [':callback']},
+}
+
+BENCH_HEADER = """#include <stdint.h>
+#include <stddef.h>
+int bench_scalar(int a, int b);
+void bench_buffer(const uint8_t* buf, size_t len);
+void bench_out(int* out);
+"""
+
+DRIVER = r"""
+#define _POSIX_C_SOURCE 199309L
+#include <time.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include "unity.h"
+#include "cmock.h"
+#include "Mockbench_api.h"
+
+void setUp(void) {}
+void tearDown(void) {}
+
+static volatile int sink;
+static uint8_t buffer[64];
+static int bench_count;
+
+static double now_ns(void)
+{
+  struct timespec t;
+  clock_gettime(CLOCK_MONOTONIC, &t);
+  return (double)t.tv_sec * 1e9 + (double)t.tv_nsec;
+}
+
+static void report(const char* metric, int n, double start)
+{
+  printf("RESULT %s %d %.1f\n", metric, n, (now_ns() - start) / n);
+}
+
+#ifdef BENCH_CALLBACK
+static int bench_callback(int a, int b, int cmock_num_calls) { return a + b + cmock_num_calls; }
+#endif
+
+static void bench_expectations(void)
+{
+  int i, out = 0, n = bench_count;
+  double t;
+
+  Mockbench_api_Init();
+  t = now_ns(); for (i = 0; i < n; i++) bench_scalar_ExpectAndReturn(i, i + 1, i); report("expect_setup", n, t);
+  t = now_ns(); for (i = 0; i < n; i++) sink += bench_scalar(i, i + 1); report("expect_call", n, t);
+  t = now_ns(); Mockbench_api_Verify(); report("verify", n, t);
+  t = now_ns(); Mockbench_api_Destroy(); report("destroy", n, t);
+
+  Mockbench_api_Init();
+  t = now_ns(); for (i = 0; i < n; i++) bench_buffer_Expect(buffer, sizeof(buffer)); report("pointer_setup", n, t);
+  t = now_ns(); for (i = 0; i < n; i++) bench_buffer(buffer, sizeof(buffer)); report("pointer_call", n, t);
+  Mockbench_api_Verify();
+  Mockbench_api_Destroy();
+
+#ifdef BENCH_ARRAY
+  Mockbench_api_Init();
+  t = now_ns(); for (i = 0; i < n; i++) bench_buffer_ExpectWithArray(buffer, sizeof(buffer), sizeof(buffer)); report("array_setup", n, t);
+  t = now_ns(); for (i = 0; i < n; i++) bench_buffer(buffer, sizeof(buffer)); report("array_call", n, t);
+  Mockbench_api_Verify();
+  Mockbench_api_Destroy();
+#endif
+
+#ifdef BENCH_IGNORE
+  Mockbench_api_Init();
+  bench_scalar_IgnoreAndReturn(7);
+  t = now_ns(); for (i = 0; i < n; i++) sink += bench_scalar(i, i + 1); report("ignore_call", n, t);
+  Mockbench_api_Verify();
+  Mockbench_api_Destroy();
+#endif
+
+#ifdef BENCH_RETURN_THRU_PTR
+  Mockbench_api_Init();
+  for (i = 0; i < n; i++) { bench_out_Expect(&out); bench_out_ReturnThruPtr_out(&i); }
+  t = now_ns(); for (i = 0; i < n; i++) bench_out(&out); report("return_thru_ptr_call", n, t);
+  Mockbench_api_Verify();
+  Mockbench_api_Destroy();
+#endif
+
+#ifdef BENCH_CALLBACK
+  Mockbench_api_Init();
+  bench_scalar_Stub(bench_callback);
+  t = now_ns(); for (i = 0; i < n; i++) sink += bench_scalar(i, i + 1); report("callback_call", n, t);
+  Mockbench_api_Verify();
+  Mockbench_api_Destroy();
+#endif
+  (void)out;
+}
+
+int main(int argc, char** argv)
+{
+  int i;
+  UnityBegin("bench_host");
+  for (i = 1; i < argc; i++)
+  {
+    bench_count = atoi(argv[i]);
+    UnityDefaultTestRun(bench_expectations, "bench_expectations", __LINE__);
+  }
+  return UnityEnd();
+}
+"""
+
+
+class HostBenchmark:
+    def __init__(self, cc, cflags, unity, work):
+        self.cc = cc
+        self.cflags = cflags
+        self.unity_src = os.path.join(unity, 'src')
+        self.work = work
+
+    def compile(self, source, output, defines=()):
+        command = [self.cc] + self.cflags + [f"-D{define}" for define in defines] + \
+            ['-I', self.unity_src, '-I', os.path.join(ROOT, 'src'), '-I', self.work, '-I', os.path.dirname(source), '-c', source, '-o', output]
+        start = time.perf_counter()
+        subprocess.run(command, check=True)
+        return time.perf_counter() - start
+
+    def object_size(self, path):
+        if shutil.which('size'):
+            lines = subprocess.run(['size', path], check=True, capture_output=True, text=True).stdout.splitlines()
+            text, data, bss = lines[-1].split()[:3]
+            return int(text) + int(data)
+        return os.path.getsize(path)
+
+    def run(self, name, options, functions, counts):
+        mock_path = os.path.join(self.work, name)
+        headers = {
+            'bench_api': BENCH_HEADER,
+            'bench_synthetic': SyntheticHeader(seed=1, functions=functions, func_ptrs=0.0).generate('bench_synthetic'),
+        }
+        for header, content in headers.items():
+            with open(os.path.join(self.work, f"{header}.h"), 'w') as f:
+                f.write(content)
+        cmock = CMock({**options, ':mock_path': mock_path, ':verbosity': 0})
+        cmock.setup_mocks([os.path.join(self.work, f"{header}.h") for header in headers])
+
+        defines = ['CMOCK_MEM_DYNAMIC'] + [f"BENCH_{plugin[1:].upper()}" for plugin in options[':plugins']]
+        result = {'compile_seconds': {}, 'object_bytes': {}, 'runtime_ns': {}}
+        objects = []
+        for source in sorted(os.listdir(mock_path)):
+            if source.endswith('.c'):
+                obj = os.path.join(mock_path, source[:-2] + '.o')
+                result['compile_seconds'][source] = self.compile(os.path.join(mock_path, source), obj, defines)
+                result['object_bytes'][source] = self.object_size(obj)
+                objects.append(obj)
+        for source in [os.path.join(self.unity_src, 'unity.c'), os.path.join(ROOT, 'src', 'cmock.c')]:
+            obj = os.path.join(mock_path, os.path.basename(source)[:-2] + '.o')
+            self.compile(source, obj, defines)
+            objects.append(obj)
+        driver = os.path.join(mock_path, 'bench_driver.c')
+        with open(driver, 'w') as f:
+            f.write(DRIVER)
+        objects.append(driver[:-2] + '.o')
+        self.compile(driver, objects[-1], defines)
+        binary = os.path.join(mock_path, 'bench_driver')
+        subprocess.run([self.cc] + objects + ['-o', binary], check=True)
+
+        output = subprocess.run([binary] + [str(count) for count in counts], check=True, capture_output=True, text=True).stdout
+        for metric, count, ns in re.findall(r'^RESULT (\w+) (\d+) ([\d.]+)$', output, re.M):
+            result['runtime_ns'].setdefault(metric, {})[int(count)] = float(ns)
+        return result
+
+
+def report(name, result):
+    print(f"{name}")
+    for source, seconds in result['compile_seconds'].items():
+        print(f"  compile {source:<32} {seconds * 1000:8.1f} ms  {result['object_bytes'][source]:>8} bytes")
+    for metric, by_count in result['runtime_ns'].items():
+        print(f"  {metric:<24} " + "  ".join(f"n={count}: {ns:.1f} ns" for count, ns in sorted(by_count.items())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark compiling and running generated mocks on the host")
+    parser.add_argument('--cc', default=os.getenv('CC', 'gcc'))
+    parser.add_argument('--cflags', default='-O2', help="compiler flags for every object (default -O2)")
+    parser.add_argument('--unity', default=os.path.join(ROOT, 'vendor', 'unity'), help="Unity checkout to build against")
+    parser.add_argument('--functions', type=int, default=200, help="size of the synthetic header compiled alongside")
+    parser.add_argument('--counts', default='10,100,1000,10000', help="expectation counts to measure")
+    parser.add_argument('--only', action='append', choices=list(COMBINATIONS), help="only run this combination (repeatable)")
+    parser.add_argument('--json', help="also write the results to this file")
+    parser.add_argument('--keep', action='store_true', help="keep the generated sources and binaries")
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.unity, 'src', 'unity.c')):
+        sys.exit(f"ERROR: no Unity sources found in {args.unity} (try 'git submodule update --init' or --unity)")
+
+    work = tempfile.mkdtemp(prefix='cmock_bench_')
+    results = {}
+    try:
+        bench = HostBenchmark(args.cc, args.cflags.split(), args.unity, work)
+        for name, options in COMBINATIONS.items():
+            if not args.only or name in args.only:
+                results[name] = bench.run(name, options, args.functions, [int(count) for count in args.counts.split(',')])
+                report(name, results[name])
+    finally:
+        if args.keep:
+            print(f"sources kept in {work}")
+        else:
+            shutil.rmtree(work)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
@@ -0,0 +1,159 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+"""
+Times the parse -> generate -> write pipeline stage by stage.
+
+    python benchmarks/bench_pipeline.py                  # run and compare against the baseline
+    python benchmarks/bench_pipeline.py --save-baseline  # run and store the result as new baseline
+
+Stage times are inclusive: plugin hooks run inside create_file, and parse_declaration
+runs inside parse. Peak memory is measured in a separate pass, as tracemalloc skews timing.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+sys.path.insert(0, HERE)
+
+from cmock import CMock
+from synthetic_header import SyntheticHeader
+
+PLUGINS = [':ignore', ':ignore_arg', ':expect_any_args', ':array', ':callback', ':return_thru_ptr', ':cexception']
+HOOKS = ['instance_typedefs', 'instance_structure', 'mock_function_declarations', 'mock_module_declarations',
+         'mock_implementation_precheck', 'mock_implementation', 'mock_interfaces', 'mock_module_interfaces',
+         'mock_verify', 'mock_destroy', 'mock_ignore', 'include_files']
+
+SYNTHETIC = {
+    'synthetic_small': dict(functions=50),
+    'synthetic_large': dict(functions=1000, args=6),
+    'synthetic_pointers': dict(functions=300, pointers=0.6, arrays=0.2, func_ptrs=0.1),
+    'synthetic_inlines': dict(functions=200, inlines=0.5, nesting=2),
+    'synthetic_comments': dict(functions=300, comments=1.0),
+}
+
+
+def corpora():
+    headers = {name: SyntheticHeader(seed=1, **settings).generate(name) for name, settings in SYNTHETIC.items()}
+    for path in [os.path.join(ROOT, 'examples', 'temp_sensor', 'src', 'AT91SAM7X256.h')] + \
+            sorted(glob.glob(os.path.join(ROOT, 'test', 'system', 'test_compilation', '*.h'))):
+        with open(path, 'r') as f:
+            headers[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return headers
+
+
+class StageTimer:
+    def __init__(self):
+        self.times = defaultdict(float)
+
+    def wrap(self, owner, method, stage):
+        original = getattr(owner, method)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.times[stage] += time.perf_counter() - start
+        setattr(owner, method, timed)
+
+
+def run_once(name, source, mock_path, timer=None):
+    cmock = CMock({':plugins': PLUGINS, ':mock_path': mock_path, ':verbosity': 0, ':treat_inlines': ':include'})
+    parser = cmock.cm_parser
+    generator = cmock.cm_generator
+    if timer:
+        timer.wrap(parser, 'parse', 'parse')
+        timer.wrap(parser, 'import_source', 'import_source')
+        timer.wrap(parser, 'parse_declaration', 'parse_declaration')
+        timer.wrap(generator, 'create_mock', 'generate')
+        timer.wrap(generator.file_writer, 'create_file', 'create_file')
+        for plugin in generator.plugins.plugins:
+            for hook in HOOKS:
+                if hasattr(plugin, hook):
+                    timer.wrap(plugin, hook, f"{type(plugin).__name__.replace('CMockGeneratorPlugin', '')}.{hook}")
+    generator.create_mock(name, parser.parse(name, source))
+
+
+def measure(name, source, repeat):
+    best = {}
+    with tempfile.TemporaryDirectory() as mock_path:
+        for _ in range(repeat):
+            timer = StageTimer()
+            start = time.perf_counter()
+            run_once(name, source, mock_path, timer)
+            timer.times['total'] = time.perf_counter() - start
+            for stage, seconds in timer.times.items():
+                best[stage] = min(seconds, best.get(stage, seconds))
+        tracemalloc.start()
+        run_once(name, source, mock_path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {'stages': best, 'peak_bytes': peak}
+
+
+def compare(results, baseline, threshold, min_seconds):
+    regressions = []
+    for corpus, result in results.items():
+        for stage, seconds in result['stages'].items():
+            before = baseline.get(corpus, {}).get('stages', {}).get(stage)
+            if before is not None and seconds - before > min_seconds and seconds > before * (1 + threshold):
+                regressions.append(f"{corpus} {stage}: {before * 1000:.2f} ms -> {seconds * 1000:.2f} ms")
+        before = baseline.get(corpus, {}).get('peak_bytes')
+        if before and result['peak_bytes'] > before * (1 + threshold):
+            regressions.append(f"{corpus} peak memory: {before} -> {result['peak_bytes']} bytes")
+    return regressions
+
+
+def report(results):
+    for corpus, result in results.items():
+        print(f"{corpus}  (peak {result['peak_bytes'] / 1024:.0f} KiB)")
+        for stage, seconds in sorted(result['stages'].items(), key=lambda item: -item[1]):
+            print(f"  {stage:<48} {seconds * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CMock parse/generate/write pipeline")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per corpus, the fastest one counts")
+    parser.add_argument('--only', action='append', help="only run corpora with this name (repeatable)")
+    parser.add_argument('--baseline', default=os.path.join(HERE, 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.15, help="allowed relative slowdown (default 0.15)")
+    parser.add_argument('--min-ms', type=float, default=1.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    results = {}
+    for name, source in corpora().items():
+        if not args.only or name in args.only:
+            try:
+                results[name] = measure(name, source, args.repeat)
+            except Exception as e:
+                print(f"FAILED {name}: {e}")
+    report(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            regressions = compare(results, json.load(f), args.threshold, args.min_ms / 1000)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
+    else:
+        print(f"no baseline at {args.baseline}, run with --save-baseline to create one")
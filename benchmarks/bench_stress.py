@@ -0,0 +1,76 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+"""
+Feeds the header parser pathological input and reports how long it takes.
+
+    python benchmarks/bench_stress.py                # guarded parse only
+    python benchmarks/bench_stress.py --unguarded    # also the plain parse, each in a process of its own
+
+The plain parse of a case is stopped after --timeout seconds and reported as TIMEOUT.
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from cmock_config import CMockConfig
+from cmock_header_parser import CMockHeaderParser
+
+VALID = "int valid_before(int a);\n{}\nint valid_after(int b);\n"
+
+STRESS = {
+    # C++ references are not part of a C argument list, so the matcher has to give up the hard way
+    'reference_args': "void refs(" + ", ".join(f"int& arg{i}" for i in range(100)) + ");",
+    'attribute_chain': "int attrs(int a) " + "__attribute__((x(" * 32 + "&);",
+    'paren_soup': "int parens" + "(a)" * 128 + "(&);",
+    'long_type': "int " + " ".join(f"w{i}" for i in range(256)) + " words(int a, &c);",
+    'nested_function_pointers': "int " + "(*" * 64 + "nested(int)" + ")(int)" * 64 + ";",
+    'many_arguments': "void many(" + ", ".join(f"unsigned long long argument{i}" for i in range(40)) + ");",
+    'unbalanced_braces': "struct s { int a; " * 200 + "\nint after(int a);",
+    'huge_comment': "/* " + "x " * 200000 + " */",
+    'long_macro': "#define M(a) \\\n" + "  (a) + \\\n" * 2000 + "  0",
+}
+
+
+def parse(case, guarded):
+    options = {':verbosity': 1, ':parse_guard': guarded}
+    parser = CMockHeaderParser(CMockConfig(options))
+    started = time.perf_counter()
+    functions = parser.parse(case, VALID.format(STRESS[case]))['functions']
+    return time.perf_counter() - started, [function['name'] for function in functions]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress the CMock header parser with pathological headers")
+    parser.add_argument('--unguarded', action='store_true', help="also time the parse without :parse_guard")
+    parser.add_argument('--timeout', type=float, default=10.0, help="limit for each unguarded parse, in seconds")
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        seconds, names = parse(args.case, False)
+        print(f"{seconds:.3f} {' '.join(names)}")
+        sys.exit(0)
+
+    for case in STRESS:
+        seconds, names = parse(case, True)
+        print(f"{case:<26} guarded   {seconds:8.3f} s  {', '.join(names)}")
+        if args.unguarded:
+            try:
+                output = subprocess.run([sys.executable, __file__, '--case', case], capture_output=True, text=True,
+                                        timeout=args.timeout).stdout.split()
+                print(f"{case:<26} unguarded {float(output[0]):8.3f} s  {', '.join(output[1:])}" if output else
+                      f"{case:<26} unguarded    FAILED")
+            except subprocess.TimeoutExpired:
+                print(f"{case:<26} unguarded   TIMEOUT after {args.timeout:.0f} s")
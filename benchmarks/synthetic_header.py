@@ -0,0 +1,110 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import random
+import argparse
+
+SCALAR_TYPES = ['int', 'unsigned int', 'char', 'uint8_t', 'uint16_t', 'uint32_t', 'int32_t', 'float', 'bool', 'size_t']
+RETURN_TYPES = ['void', 'void', 'int', 'uint8_t', 'uint32_t', 'bool', 'float']
+
+
+class SyntheticHeader:
+    """
+    Seeded generator of C headers for benchmarking. The same seed and settings always
+    produce the same header, so timings of different revisions stay comparable.
+    """
+
+    def __init__(self, seed=1, functions=100, args=4, pointers=0.3, arrays=0.1, func_ptrs=0.05,
+                 inlines=0.0, nesting=2, comments=0.5, structs=4):
+        self.random = random.Random(seed)
+        self.functions = functions
+        self.args = args
+        self.pointers = pointers
+        self.arrays = arrays
+        self.func_ptrs = func_ptrs
+        self.inlines = inlines
+        self.nesting = nesting
+        self.comments = comments
+        self.structs = structs
+
+    def generate(self, name='Synthetic'):
+        guard = f"{name.upper()}_H"
+        lines = [f"#ifndef {guard}", f"#define {guard}", "",
+                 "#include <stdint.h>", "#include <stdbool.h>", "#include <stddef.h>", ""]
+        for index in range(self.structs):
+            lines += self._comment()
+            lines += [f"typedef struct {{ int id; uint8_t data[{4 << (index % 4)}]; float scale; }} {name}_Struct{index}_t;", ""]
+        for index in range(self.functions):
+            lines += self._comment()
+            lines += self._function(name, index)
+        lines += ["", f"#endif /* {guard} */", ""]
+        return "\n".join(lines)
+
+    def _comment(self):
+        if self.random.random() >= self.comments:
+            return []
+        if self.random.random() < 0.5:
+            return [f"// {self._words()}"]
+        return ["/**", f" * {self._words()}", f" * {self._words()}", " */"]
+
+    def _words(self):
+        return " ".join(self.random.choice(['read', 'the', 'register', 'value', 'from', 'buffer', 'returns', 'status', 'of', 'device'])
+                        for _ in range(self.random.randint(3, 10)))
+
+    def _type(self, name):
+        if self.structs and self.random.random() < 0.15:
+            return f"{name}_Struct{self.random.randrange(self.structs)}_t"
+        return self.random.choice(SCALAR_TYPES)
+
+    def _argument(self, name, index):
+        roll = self.random.random()
+        arg_name = f"arg{index}"
+        if roll < self.func_ptrs:
+            return f"void (*{arg_name})(int, void*)"
+        roll -= self.func_ptrs
+        if roll < self.arrays:
+            return f"{self._type(name)} {arg_name}[{self.random.choice([2, 4, 8, 16])}]"
+        roll -= self.arrays
+        if roll < self.pointers:
+            return f"{self.random.choice(['', 'const '])}{self._type(name)}* {arg_name}"
+        return f"{self._type(name)} {arg_name}"
+
+    def _function(self, name, index):
+        ret = self.random.choice(RETURN_TYPES)
+        args = [self._argument(name, arg) for arg in range(self.random.randint(0, self.args))]
+        signature = f"{ret} {name}_Function{index}({', '.join(args) if args else 'void'})"
+        if self.random.random() >= self.inlines:
+            return [f"{signature};", ""]
+        body = self._body(self.nesting, '  ')
+        if ret != 'void':
+            body.append(f"  return ({ret})0;")
+        return [f"static inline {signature}", "{"] + body + ["}", ""]
+
+    def _body(self, depth, indent):
+        lines = [f"{indent}volatile int cmock_local{depth} = {depth};"]
+        if depth > 0:
+            lines.append(f"{indent}if (cmock_local{depth} > 0) {{")
+            lines += self._body(depth - 1, indent + '  ')
+            lines.append(f"{indent}}}")
+        return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a seeded synthetic C header to stdout")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--functions', type=int, default=100)
+    parser.add_argument('--args', type=int, default=4)
+    parser.add_argument('--pointers', type=float, default=0.3)
+    parser.add_argument('--arrays', type=float, default=0.1)
+    parser.add_argument('--func-ptrs', type=float, default=0.05)
+    parser.add_argument('--inlines', type=float, default=0.0)
+    parser.add_argument('--nesting', type=int, default=2)
+    parser.add_argument('--comments', type=float, default=0.5)
+    parser.add_argument('--name', default='Synthetic')
+    args = parser.parse_args()
+    print(SyntheticHeader(args.seed, args.functions, args.args, args.pointers, args.arrays, args.func_ptrs,
+                          args.inlines, args.nesting, args.comments).generate(args.name), end='')
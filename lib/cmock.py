@@ -17,33 +17,77 @@ from cmock_generator_utils import CMockGeneratorUtils
 from cmock_plugin_manager import CMockPluginManager
 from cmock_header_parser import CMockHeaderParser
 from cmock_generator import CMockGenerator
+from cmock_usage_scanner import CMockUsageScanner
+from cmock_stats import CMockStats, measure
 
 class CMock:
-    def __init__(self, options=None):
+    def __init__(self, options=None, stats=None):
         cm_config = CMockConfig(options)
-        cm_unityhelper = CMockUnityHelperParser(cm_config)
-        cm_writer = CMockFileWriter(cm_config)
+        self.stats = stats
+        cm_unityhelper = CMockUnityHelperParser(cm_config, stats)
+        cm_writer = CMockFileWriter(cm_config, stats)
         cm_gen_utils = CMockGeneratorUtils(cm_config, helpers={'unity_helper': cm_unityhelper})
-        cm_gen_plugins = CMockPluginManager(cm_config, cm_gen_utils)
-        self.cm_parser = CMockHeaderParser(cm_config)
-        self.cm_generator = CMockGenerator(cm_config, cm_writer, cm_gen_utils, cm_gen_plugins)
+        cm_gen_plugins = CMockPluginManager(cm_config, cm_gen_utils, stats)
+        self.cm_parser = CMockHeaderParser(cm_config, stats)
+        cm_usage = CMockUsageScanner(cm_config) if cm_config.options[':usage_sources'] else None
+        self.cm_generator = CMockGenerator(cm_config, cm_writer, cm_gen_utils, cm_gen_plugins, cm_usage)
         self.silent = cm_config.options[':verbosity'] < 2
+        self.streaming = cm_config.options[':streaming']
 
     def setup_mocks(self, files, folder=None):
-        for src in files if isinstance(files, list) else [files]:
-            self.generate_mock(src, folder)
+        try:
+            for src in files if isinstance(files, list) else [files]:
+                self.generate_mock(src, folder)
+            self.cm_generator.create_string_pool()
+            self.cm_generator.create_aggregate()
+        finally:
+            self.close()
+
+    def close(self):
+        """Shuts down the render workers, if any. Later mocks start them again when they need them."""
+        self.cm_generator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def setup_skeletons(self, files):
         for src in files if isinstance(files, list) else [files]:
             self.generate_skeleton(src)
 
-    def generate_mock(self, src, folder):
+    def generate_mock(self, src, folder, parsed_headers=None):
         name, ext = os.path.splitext(os.path.basename(src))
         if not self.silent:
             print(f"Creating mock for {name}...")
-        with open(src, 'r') as f:
-            content = f.read()
-        self.cm_generator.create_mock(name, self.cm_parser.parse(name, content), ext, folder)
+        if self.stats:
+            self.stats.begin_file(src)
+        if self.streaming:
+            # the functions are parsed while the mock is generated, so parsing is timed as part of it
+            with measure(self.stats, 'generate'):
+                count = self.cm_generator.create_mock_streaming(name, self.cm_parser.parse_file(name, src), ext, folder)
+            if self.stats:
+                self.stats.count_functions(count)
+                self.stats.end_file()
+            return
+        # in a batch, the first target to get to a header parses it for all targets with the same parser options
+        parsed = parsed_headers.get(self.cm_parser.fingerprint) if parsed_headers is not None else None
+        if parsed is None:
+            with open(src, 'r') as f:
+                content = f.read()
+            with measure(self.stats, 'parse'):
+                parsed = self.cm_parser.parse(name, content)
+            if parsed_headers is not None:
+                parsed_headers[self.cm_parser.fingerprint] = parsed
+            if not self.silent and parsed.get('changes'):
+                print("  " + ", ".join(f"{len(names)} {change}" for change, names in parsed['changes'].items()))
+        if self.stats:
+            self.stats.count_functions(len(parsed['functions']))
+        with measure(self.stats, 'generate'):
+            self.cm_generator.create_mock(name, parsed, ext, folder)
+        if self.stats:
+            self.stats.end_file()
 
     def generate_skeleton(self, src):
         name, _ = os.path.splitext(os.path.basename(src))
@@ -54,6 +98,34 @@ class CMock:
         self.cm_generator.create_skeleton(name, self.cm_parser.parse(name, content))
 
 
+class CMockBatch:
+    """
+    Generates mocks of the same headers for several targets, each with its own options and
+    mock path. A header is parsed once for all targets with the same parser options, and
+    only the generation runs for each target.
+    """
+
+    def __init__(self, targets, stats=None):
+        self.targets = []
+        for options, mock_path in targets:
+            if isinstance(options, str):
+                options = CMockConfig().load_config_file_from_yaml(options)
+            self.targets.append(CMock({**options, ':mock_path': mock_path} if mock_path else options, stats))
+
+    def setup_mocks(self, files, folder=None):
+        try:
+            for src in files if isinstance(files, list) else [files]:
+                parsed_headers = {}
+                for cmock in self.targets:
+                    cmock.generate_mock(src, folder, parsed_headers)
+            for cmock in self.targets:
+                cmock.cm_generator.create_string_pool()
+                cmock.cm_generator.create_aggregate()
+        finally:
+            for cmock in self.targets:
+                cmock.close()
+
+
 def option_maker(options, key, val):
     if key not in options:
         options[key] = []
@@ -67,6 +139,11 @@ if __name__ == "__main__":
     parser.add_argument('--skeleton', action='store_true', help="Generate skeletons")
     parser.add_argument('--version', action='store_true', help="Show version")
     parser.add_argument('--strippables', help="Strippables", required=False)
+    parser.add_argument('--stats', action='store_true', help="Print where the generation spent its time")
+    parser.add_argument('--stats-json', help="Write the generation statistics to this JSON file", required=False)
+    parser.add_argument('--profile', help="Write a cProfile of the whole run to this .pstats file", required=False)
+    parser.add_argument('--target', nargs=2, action='append', metavar=('OPTIONS', 'MOCK_PATH'),
+                        help="Generate the mocks with this options file into this mock path; repeat for more targets", required=False)
     parser.add_argument('files', nargs='*', help="Files to mock")
 
     args = parser.parse_args()
@@ -91,8 +168,30 @@ if __name__ == "__main__":
 
     filelist = args.files
 
-    cmock = CMock(options)
-    if options.get(':skeleton'):
-        cmock.setup_skeletons(filelist)
+    stats = CMockStats() if args.stats or args.stats_json else None
+    profile = None
+    if args.profile:
+        import cProfile
+        profile = cProfile.Profile()
+        profile.enable()
+
+    if args.target:
+        if options.get(':skeleton'):
+            parser.error("--target can't be combined with --skeleton")
+        # options given for the whole run apply to every target, unless its options file sets them itself
+        targets = [({**options, **CMockConfig().load_config_file_from_yaml(target)}, mock_path) for target, mock_path in args.target]
+        CMockBatch(targets, stats).setup_mocks(filelist)
     else:
-        cmock.setup_mocks(filelist)
+        cmock = CMock(options, stats)
+        if options.get(':skeleton'):
+            cmock.setup_skeletons(filelist)
+        else:
+            cmock.setup_mocks(filelist)
+
+    if profile:
+        profile.disable()
+        profile.dump_stats(args.profile)
+    if args.stats:
+        print(stats.summary())
+    if args.stats_json:
+        stats.write_json(args.stats_json)
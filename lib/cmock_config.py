@@ -47,6 +47,26 @@ class CMockConfig:
         ':array_size_name': 'size|len',
         ':skeleton': False,
         ':exclude_setjmp_h': False,
+        ':fast_verify': False,
+        ':track_touched_functions': False,
+        ':mock_registry': False,
+        ':compact_instances': False,
+        ':usage_sources': None,
+        ':functions_include': [],
+        ':functions_exclude': [],
+        ':mock_shards': 1,
+        ':aggregate_mocks': False,
+        ':shared_string_pool': False,
+        ':shared_verify_helpers': False,
+        ':parse_guard': False,
+        ':parse_stage_budget': 1.0,
+        ':parse_max_statement_length': 4096,
+        ':when_parse_budget_exceeded': ':warn',  # options: ignore, warn, error
+        ':render_cache': False,
+        ':streaming': False,
+        ':render_workers': 0,
+        ':render_workers_threshold': 2000,
+        ':incremental_parse': False,
         ':inline_function_patterns': [
             r'(static\s+inline|inline\s+static)\s*',
             r'(\binline\b)\s*',
@@ -73,7 +93,8 @@ class CMockConfig:
                     print(f"WARNING: '{opt}' should be a list.")
 
         for opt in [':includes', ':includes_h_pre_orig_header', ':includes_h_post_orig_header',
-                    ':includes_c_pre_header', ':includes_c_post_header']:
+                    ':includes_c_pre_header', ':includes_c_post_header', ':usage_sources',
+                    ':functions_include', ':functions_exclude']:
             if self.options.get(opt) is not None and not isinstance(self.options[opt], list):
                 self.options[opt] = []
                 if self.options.get(':verbosity', 2) > 0:
@@ -119,7 +140,8 @@ class CMockConfig:
                 helper_paths.append(rel_path)
             except ValueError:
                 helper_paths.append(path)
-        self.options[':includes_c_post_header'] = list(set(post_headers + helper_paths))
+        # keep the configured order, so the generated includes don't change from one run to the next
+        self.options[':includes_c_post_header'] = list(dict.fromkeys(post_headers + helper_paths))
 
     def load_unity_helper(self):
         if not self.options[':unity_helper_path']:
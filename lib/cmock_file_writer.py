@@ -8,10 +8,12 @@
 import os
 import shutil
 import filecmp
+from cmock_stats import measure
 
 class CMockFileWriter:
-    def __init__(self, config):
+    def __init__(self, config, stats=None):
         self.config = config
+        self.stats = stats
 
     def create_subdir(self, subdir=None):
         """
@@ -38,14 +40,21 @@ class CMockFileWriter:
         final_file = os.path.join(subdir_path, filename)
         temp_file = f"{final_file}.new"
 
-        with open(temp_file, 'w') as file:
-            callback(file, *args, **kwargs)
+        with measure(self.stats, 'write.render'):
+            with open(temp_file, 'w') as file:
+                callback(file, *args, **kwargs)
 
         # Avoid unnecessary file updates
-        if os.path.exists(final_file) and filecmp.cmp(temp_file, final_file, shallow=False):
-            os.remove(temp_file)  # No change, discard temp file
-        else:
-            shutil.move(temp_file, final_file)  # Replace only if changed
+        with measure(self.stats, 'write.compare_and_replace'):
+            size = os.path.getsize(temp_file) if self.stats else 0
+            if os.path.exists(final_file) and filecmp.cmp(temp_file, final_file, shallow=False):
+                os.remove(temp_file)  # No change, discard temp file
+                rewritten = False
+            else:
+                shutil.move(temp_file, final_file)  # Replace only if changed
+                rewritten = True
+        if self.stats:
+            self.stats.record_write(final_file, size, rewritten)
 
     def append_file(self, filename, callback, subdir, *args, **kwargs):
         """
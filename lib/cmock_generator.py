@@ -7,15 +7,19 @@
 
 import os
 import re
+import shutil
+import tempfile
 from pathlib import Path
 
 from io import StringIO
+from cmock_render_pool import CMockRenderPool
 
 class CMockGenerator:
-    def __init__(self, config, file_writer, utils, plugins):
+    def __init__(self, config, file_writer, utils, plugins, usage=None):
         self.file_writer = file_writer
         self.utils = utils
         self.plugins = plugins
+        self.usage = usage
         self.config = config
         self.prefix = config.options[':mock_prefix']
         self.suffix = config.options[':mock_suffix']
@@ -26,6 +30,21 @@ class CMockGenerator:
         self.fail_on_unexpected_calls = config.options[':fail_on_unexpected_calls']
         self.exclude_setjmp_h = config.options[':exclude_setjmp_h']
         self.subdir = config.options[':subdir']
+        self.track_touched = config.options[':track_touched_functions']
+        self.registry = config.options[':mock_registry']
+        self.compact = config.options[':compact_instances']
+        self.shards = config.options[':mock_shards'] or 1
+        self.aggregate = config.options[':aggregate_mocks']
+        self.aggregated = []
+        self.string_pool = config.options[':shared_string_pool']
+        self.pooled_strings = set()
+        self.streaming = config.options[':streaming']
+        if self.streaming and self.shards > 1:
+            raise Exception("ERROR: :streaming can't be combined with :mock_shards. Disable one option.")
+        if self.streaming and self.include_inline == ':include':
+            raise Exception("ERROR: :streaming can't be combined with :treat_inlines :include. Disable one option.")
+        self.render_threshold = config.options[':render_workers_threshold']
+        self.render_pool = CMockRenderPool(config) if config.options[':render_workers'] > 1 else None
 
         self.includes_h_pre_orig_header = self._format_includes(
             (config.options[':includes'] or []) + (config.options[':includes_h_pre_orig_header'] or [])
@@ -53,6 +72,11 @@ class CMockGenerator:
         mock_name = f"{self.prefix}{module_name}{self.suffix}"
         mock_folder = self._determine_mock_folder(folder)
         clean_name = self.type_sanitizer.sanitize_c_identifier(mock_name)
+        pruned = []
+        if self.usage:
+            # functions the tests never set up only need a stub, not the whole mock API
+            pruned = [function for function in parsed_stuff["functions"] if not self.usage.is_used(function)]
+            parsed_stuff = {**parsed_stuff, "functions": [function for function in parsed_stuff["functions"] if self.usage.is_used(function)]}
         mock_project = {
             "module_name": module_name,
             "module_ext": module_ext or ".h",
@@ -60,6 +84,7 @@ class CMockGenerator:
             "clean_name": clean_name,
             "folder": mock_folder,
             "parsed_stuff": parsed_stuff,
+            "pruned_functions": pruned,
             "skeleton": False,
         }
         self._create_mock_subdir(mock_project)
@@ -67,6 +92,84 @@ class CMockGenerator:
         # Create Mock header file
         self._create_mock_header_file(mock_project)
         self._create_mock_source_file(mock_project)
+        if self.aggregate:
+            self.aggregated.append(mock_project)
+        if self.string_pool:
+            self.pooled_strings.update(self._mock_strings(mock_project))
+
+    def create_mock_streaming(self, module_name, parsed_stuff, module_ext=None, folder=None):
+        """
+        Like create_mock, but for functions which are handed over one by one while they are parsed.
+        Their code goes to temporary files right away, and only the parsed functions are kept for
+        the parts of the mock which need all of them. Returns the number of functions parsed.
+        """
+        mock_name = f"{self.prefix}{module_name}{self.suffix}"
+        mock_project = {
+            "module_name": module_name,
+            "module_ext": module_ext or ".h",
+            "mock_name": mock_name,
+            "clean_name": self.type_sanitizer.sanitize_c_identifier(mock_name),
+            "folder": self._determine_mock_folder(folder),
+            "parsed_stuff": {**parsed_stuff, "functions": []},
+            "pruned_functions": [],
+            "skeleton": False,
+        }
+        self._create_mock_subdir(mock_project)
+
+        functions = mock_project["parsed_stuff"]["functions"]
+        with tempfile.TemporaryFile('w+') as declarations, tempfile.TemporaryFile('w+') as typedefs, \
+                tempfile.TemporaryFile('w+') as implementations, tempfile.TemporaryFile('w+') as pruned:
+            for function in parsed_stuff["functions"]:
+                if self.usage and not self.usage.is_used(function):
+                    mock_project["pruned_functions"].append(function)
+                    self._create_pruned_implementation(pruned, function)
+                    continue
+                functions.append(function)
+                self._write_function_declaration(declarations, function)
+                self._create_instance_typedef(typedefs, function)
+                self._create_mock_implementation(implementations, function)
+                self._create_mock_interfaces(implementations, function)
+
+            spools = {"declarations": declarations, "typedefs": typedefs, "implementations": implementations, "pruned": pruned}
+            self._create_mock_header_file(mock_project, spools)
+            self._create_mock_source_file(mock_project, spools)
+        if self.aggregate:
+            self.aggregated.append(mock_project)
+        if self.string_pool:
+            self.pooled_strings.update(self._mock_strings(mock_project))
+        return len(functions) + len(mock_project["pruned_functions"])
+
+    def close(self):
+        if self.render_pool:
+            self.render_pool.close()
+
+    def create_string_pool(self):
+        if not self.pooled_strings:
+            return
+        # mocks generated by earlier runs still refer to the pool, so it holds whatever the mocks on disk use
+        self.pooled_strings.update(self._strings_used_in(self.config.options[':mock_path']))
+        strs = sorted(self.pooled_strings)
+        self.file_writer.create_file("cmock_strings.h", self._write_string_pool_header, subdir=None, strs=strs)
+        self.file_writer.create_file("cmock_strings.c", self._write_string_pool_source, subdir=None, strs=strs)
+        self.pooled_strings = set()
+
+    def _strings_used_in(self, mock_path):
+        used = set()
+        pool_files = {"cmock_strings.h", "cmock_strings.c"}
+        for folder, _, filenames in os.walk(mock_path):
+            for filename in filenames:
+                if filename in pool_files or not filename.endswith(('.c', '.h')):
+                    continue
+                with open(os.path.join(folder, filename), 'r', errors='replace') as f:
+                    used.update(re.findall(r'\bCMockString_(\w+)', f.read()))
+        return used
+
+    def create_aggregate(self):
+        if not self.aggregated:
+            return
+        filename = self.aggregate if isinstance(self.aggregate, str) else "cmock_all_mocks.c"
+        self.file_writer.create_file(filename, self._write_aggregate_content, subdir=None, mock_projects=self.aggregated)
+        self.aggregated = []
 
     def create_skeleton(self, module_name, parsed_stuff):
         mock_project = {
@@ -105,7 +208,11 @@ class CMockGenerator:
     def _create_mock_subdir(self, mock_project):
         self.file_writer.create_subdir(mock_project["folder"])
 
-    def _create_mock_header_file(self, mock_project):
+    def _copy_spool(self, file, spool):
+        spool.seek(0)
+        shutil.copyfileobj(spool, file)
+
+    def _create_mock_header_file(self, mock_project, spools=None):
         if self.include_inline == ":include":
             self.file_writer.create_file(
                 mock_project["module_name"] + mock_project["module_ext"],
@@ -118,14 +225,15 @@ class CMockGenerator:
             mock_project["mock_name"] + mock_project["module_ext"],
             self._write_mock_header_content,
             subdir=mock_project["folder"],
-            mock_project=mock_project
+            mock_project=mock_project,
+            spools=spools
         )
 
     def _write_module_inline_content(self, file, mock_project):
 
         file.write(mock_project["parsed_stuff"]["normalized_source"])
 
-    def _write_mock_header_content(self, file, mock_project):
+    def _write_mock_header_content(self, file, mock_project, spools=None):
         clean_name = mock_project["clean_name"]
         define_name = clean_name.upper()
         if mock_project["folder"]:
@@ -164,11 +272,14 @@ class CMockGenerator:
         file.write("\n")
         file.write("#ifdef __cplusplus\nextern \"C\" {\n#endif\n\n")
         
-        self._create_service_call_declarations(file, clean_name)
+        self._create_service_call_declarations(file, mock_project)
         self._create_typedefs(file, mock_project)
 
-        for func in mock_project["parsed_stuff"]["functions"]:
-            self._write_function_declaration(file, func)
+        if spools:
+            self._copy_spool(file, spools["declarations"])
+        else:
+            for func in mock_project["parsed_stuff"]["functions"]:
+                self._write_function_declaration(file, func)
 
         file.write("\n")
         file.write("#ifdef __cplusplus\n")
@@ -189,10 +300,13 @@ class CMockGenerator:
             file.write(f"{typedef}\n")
         file.write("\n\n")
 
-    def _create_service_call_declarations(self, file, clean_name):
+    def _create_service_call_declarations(self, file, mock_project):
+        clean_name = mock_project["clean_name"]
         file.write(f"void {clean_name}_Init(void);\n")
         file.write(f"void {clean_name}_Destroy(void);\n")
-        file.write(f"void {clean_name}_Verify(void);\n\n")
+        file.write(f"void {clean_name}_Verify(void);\n")
+        file.write(self.plugins.run("mock_module_declarations", mock_project))
+        file.write("\n")
 
     def _write_function_declaration(self, file, function):
         using_namespace = "::".join(function.get("namespace", []))
@@ -200,28 +314,149 @@ class CMockGenerator:
             file.write(f"using namespace {using_namespace};\n")
         file.write(self.plugins.run("mock_function_declarations", function))
 
-    def _create_mock_source_file(self, mock_project):
+    def _create_mock_source_file(self, mock_project, spools=None):
+        if self.shards > 1 and mock_project['parsed_stuff']['functions']:
+            self._create_sharded_mock_source_files(mock_project)
+            return
         self.file_writer.create_file(
             f"{mock_project['mock_name']}.c",
             self._write_mock_source_content,
             subdir=mock_project["folder"],
+            mock_project=mock_project,
+            spools=spools
+        )
+
+    def _create_sharded_mock_source_files(self, mock_project):
+        # everything the shards share lives in an internal header, the module-wide functions in the core file
+        self.file_writer.create_file(
+            f"{mock_project['mock_name']}_internal.h",
+            self._write_mock_internal_header_content,
+            subdir=mock_project["folder"],
+            mock_project=mock_project
+        )
+        self.file_writer.create_file(
+            f"{mock_project['mock_name']}.c",
+            self._write_mock_core_content,
+            subdir=mock_project["folder"],
             mock_project=mock_project
         )
+        for shard in range(self.shards):
+            self.file_writer.create_file(
+                f"{mock_project['mock_name']}_part{shard + 1}.c",
+                self._write_mock_shard_content,
+                subdir=mock_project["folder"],
+                mock_project=mock_project,
+                shard=shard
+            )
+
+    def _shard_of(self, items, shard):
+        size = -(-len(items) // self.shards)
+        return items[shard * size:(shard + 1) * size]
+
+    def _write_mock_internal_header_content(self, file, mock_project):
+        define_name = f"_{mock_project['clean_name'].upper()}_INTERNAL_H"
+        file.write(f"#ifndef {define_name}\n#define {define_name}\n\n")
+        self._create_source_header_section(file, mock_project, shared=True)
+        # the shared state needs names of its own once it is no longer static
+        file.write(f"#define Mock {mock_project['clean_name']}_Mock\n")
+        if self._persistent_members(mock_project):
+            file.write(f"#define MockPersistent {mock_project['clean_name']}_MockPersistent\n")
+        if self.registry:
+            file.write(f"#define CMockRegistry {mock_project['clean_name']}_CMockRegistry\n")
+            file.write(f"#define CMockActivate {mock_project['clean_name']}_CMockActivate\n")
+        file.write("\n")
+        self._create_instance_structure(file, mock_project, shared=True)
+        self._create_extern_declarations(file)
+        self._create_registry_entry(file, mock_project, shared=True)
+        for function in mock_project['parsed_stuff']['functions']:
+            file.write(self.utils.code_add_argument_loader_declaration(function))
+        file.write(f"\n#endif /* {define_name} */\n")
 
-    def _write_mock_source_content(self, file, mock_project):
+    def _write_mock_core_content(self, file, mock_project):
+        file.write("/* AUTOGENERATED FILE. DO NOT EDIT. */\n")
+        file.write(f"#include \"{mock_project['mock_name']}_internal.h\"\n\n")
+        file.write(f"CMOCK_THREAD_STORAGE struct {mock_project['clean_name']}Instance Mock;\n\n")
+        if self._persistent_members(mock_project):
+            file.write(f"CMOCK_THREAD_STORAGE struct {mock_project['clean_name']}Persistent MockPersistent;\n\n")
+        if not self.string_pool:
+            for str in self._mock_strings(mock_project):
+                file.write(f"const char CMockString_{str}[] = \"{str}\";\n")
+            file.write("\n")
+        self._create_registry_entry(file, mock_project)
+        self._create_mock_verify_function(file, mock_project)
+        self._create_mock_init_function(file, mock_project)
+        self._create_mock_destroy_function(file, mock_project)
+        file.write(self.plugins.run('mock_module_interfaces', mock_project))
+
+    def _write_mock_shard_content(self, file, mock_project, shard):
+        file.write("/* AUTOGENERATED FILE. DO NOT EDIT. */\n")
+        file.write(f"#include \"{mock_project['mock_name']}_internal.h\"\n\n")
+        self._create_mock_bodies(file, mock_project, self._shard_of(mock_project['parsed_stuff']['functions'], shard))
+        for function in self._shard_of(mock_project['pruned_functions'], shard):
+            self._create_pruned_implementation(file, function)
+
+    def _write_string_pool_header(self, file, strs):
+        file.write("/* AUTOGENERATED FILE. DO NOT EDIT. */\n")
+        file.write("#ifndef _CMOCK_STRINGS_H\n#define _CMOCK_STRINGS_H\n\n")
+        for str in strs:
+            file.write(f"extern const char CMockString_{str}[];\n")
+        file.write("\n#endif /* _CMOCK_STRINGS_H */\n")
+
+    def _write_string_pool_source(self, file, strs):
+        file.write("/* AUTOGENERATED FILE. DO NOT EDIT. */\n")
+        file.write("#include \"cmock_strings.h\"\n\n")
+        for str in strs:
+            file.write(f"const char CMockString_{str}[] = \"{str}\";\n")
+
+    def _write_aggregate_content(self, file, mock_projects):
+        file.write("/* AUTOGENERATED FILE. DO NOT EDIT. */\n")
+        if self.string_pool:
+            file.write("#include \"cmock_strings.c\"\n")
+        for mock_project in mock_projects:
+            # every file-local name of a mock gets its own prefix, so all of them can share this translation unit
+            renames = ["Mock"]
+            if self._persistent_members(mock_project):
+                renames.append("MockPersistent")
+            if self.registry:
+                renames += ["CMockRegistry", "CMockActivate"]
+            if not self.string_pool:
+                renames += [f"CMockString_{str}" for str in self._mock_strings(mock_project)]
+            file.write("\n")
+            for name in renames:
+                file.write(f"#define {name} {mock_project['clean_name']}_{name}\n")
+            for source in self._mock_source_files(mock_project):
+                file.write(f"#include \"{source}\"\n")
+            for name in renames + ["CMOCK_TOUCH", "CMOCK_CLEAR", "CMOCK_REGISTER"]:
+                file.write(f"#undef {name}\n")
+
+    def _mock_source_files(self, mock_project):
+        sources = [f"{mock_project['mock_name']}.c"]
+        if self.shards > 1 and mock_project['parsed_stuff']['functions']:
+            sources += [f"{mock_project['mock_name']}_part{shard + 1}.c" for shard in range(self.shards)]
+        if mock_project["folder"]:
+            sources = [Path(mock_project["folder"], source).as_posix() for source in sources]
+        return sources
+
+    def _write_mock_source_content(self, file, mock_project, spools=None):
         
         # Additional content generation logic can be added here
         self._create_source_header_section(file, mock_project)
-        self._create_instance_structure(file, mock_project)
+        self._create_instance_structure(file, mock_project, typedefs=spools and spools['typedefs'])
         self._create_extern_declarations(file)
+        self._create_registry_entry(file, mock_project)
         self._create_mock_verify_function(file, mock_project)
         self._create_mock_init_function(file, mock_project)
         self._create_mock_destroy_function(file, mock_project)
-        for function in mock_project['parsed_stuff']['functions']:
-            self._create_mock_implementation(file, function)
-            self._create_mock_interfaces(file, function)
+        if spools:
+            self._copy_spool(file, spools['implementations'])
+            self._copy_spool(file, spools['pruned'])
+        else:
+            self._create_mock_bodies(file, mock_project, mock_project['parsed_stuff']['functions'])
+            for function in mock_project['pruned_functions']:
+                self._create_pruned_implementation(file, function)
+        file.write(self.plugins.run('mock_module_interfaces', mock_project))
 
-    def _create_source_header_section(self, file, mock_project, filename=None):
+    def _create_source_header_section(self, file, mock_project, filename=None, shared=False):
         
         if "folder" in mock_project.keys() and mock_project["folder"] != None:
             header_file = os.path.join(
@@ -231,13 +466,17 @@ class CMockGenerator:
         else:
             header_file = mock_project["module_name"] + mock_project["module_ext"]
 
-        if mock_project['parsed_stuff']['functions']:
+        if mock_project['parsed_stuff']['functions'] or mock_project.get('pruned_functions'):
             file.write("/* AUTOGENERATED FILE. DO NOT EDIT. */\n")
         file.write("#include <string.h>\n")
         file.write("#include <stdlib.h>\n")
+        if self.track_touched:
+            file.write("#include <stddef.h>\n")
         if not self.exclude_setjmp_h:
             file.write("#include <setjmp.h>\n")
         file.write("#include \"cmock.h\"\n")
+        if self.string_pool:
+            file.write("#include \"cmock_strings.h\"\n")
         for inc in self.includes_c_pre_header:
             file.write(f"#include {inc}\n")
 
@@ -249,38 +488,175 @@ class CMockGenerator:
         for inc in self.includes_c_post_header:
             file.write(f"#include {inc}\n")
         file.write("\n")
+        if self.string_pool:
+            return
+        if shared:
+            # the core source defines each string once, under a name of its own like the shared state
+            for str in self._mock_strings(mock_project):
+                file.write(f"#define CMockString_{str} {mock_project['clean_name']}_CMockString_{str}\n")
+                file.write(f"extern const char CMockString_{str}[];\n")
+            file.write("\n")
+            return
+        for str in self._mock_strings(mock_project):
+            file.write(f"static const char* CMockString_{str} = \"{str}\";\n")
+        file.write("\n")
+
+    def _mock_strings(self, mock_project):
         strs = []
         for func in mock_project['parsed_stuff']['functions']:
             strs.append(func['name'])
             for arg in func['args']:
                 strs.append(arg['name'])
-        for str in sorted(set(strs)):
-            file.write(f"static const char* CMockString_{str} = \"{str}\";\n")
-        file.write("\n")
-
-    def _create_instance_structure(self, file, mock_project):
-        functions = mock_project['parsed_stuff']['functions']
-        for function in functions:
-            file.write(f"typedef struct _CMOCK_{function['name']}_CALL_INSTANCE\n{{\n")
+        if self.fail_on_unexpected_calls:
+            strs.extend(func['name'] for func in mock_project.get('pruned_functions', []))
+        return sorted(set(strs))
+
+    def _create_instance_typedef(self, file, function):
+        file.write(f"typedef struct _CMOCK_{function['name']}_CALL_INSTANCE\n{{\n")
+        if self.compact:
+            file.write(self._compact_members("  UNITY_LINE_TYPE LineNumber;\n" + self.plugins.run('instance_typedefs', function)))
+        else:
             file.write("  UNITY_LINE_TYPE LineNumber;\n")
             file.write(self.plugins.run('instance_typedefs', function))
-            file.write(f"\n}} CMOCK_{function['name']}_CALL_INSTANCE;\n\n")
-        file.write(f"static struct {mock_project['clean_name']}Instance\n{{\n")
+        file.write(f"\n}} CMOCK_{function['name']}_CALL_INSTANCE;\n\n")
+
+    def _create_instance_structure(self, file, mock_project, shared=False, typedefs=None):
+        functions = mock_project['parsed_stuff']['functions']
+        if typedefs:
+            self._copy_spool(file, typedefs)
+        else:
+            for function in functions:
+                self._create_instance_typedef(file, function)
+        if self.track_touched and functions:
+            file.write("enum\n{\n")
+            file.write(''.join([f"  CMOCK_{function['name']}_ID,\n" for function in functions]))
+            file.write(f"  CMOCK_{mock_project['clean_name']}_FUNCTION_COUNT\n}};\n\n")
+        if shared:
+            file.write(f"struct {mock_project['clean_name']}Instance\n{{\n")
+        else:
+            file.write(f"static CMOCK_THREAD_STORAGE struct {mock_project['clean_name']}Instance\n{{\n")
         if not functions:
             file.write("  unsigned char placeHolder;\n")
         for function in functions:
-            file.write(self.plugins.run('instance_structure', function))
+            if self.track_touched:
+                file.write(f"  char {function['name']}_Touched;\n")
+            if self.compact:
+                file.write(self._compact_members(self.plugins.run('instance_structure', function)))
+            else:
+                file.write(self.plugins.run('instance_structure', function))
             file.write(f"  CMOCK_MEM_INDEX_TYPE {function['name']}_CallInstance;\n")
-        file.write("} Mock;\n\n")
+        if self.track_touched and functions:
+            file.write(f"  int CMockTouchedList[CMOCK_{mock_project['clean_name']}_FUNCTION_COUNT];\n")
+            file.write("  int CMockTouchedCount;\n")
+            if not self.fail_on_unexpected_calls:
+                file.write("  char CMockDefaultsApplied;\n")
+        if shared:
+            file.write("};\n")
+            file.write(f"extern CMOCK_THREAD_STORAGE struct {mock_project['clean_name']}Instance Mock;\n\n")
+        else:
+            file.write("} Mock;\n\n")
+        persistent = self._persistent_members(mock_project)
+        if persistent:
+            # state which outlives a test, so Destroy leaves it alone
+            if shared:
+                file.write(f"struct {mock_project['clean_name']}Persistent\n{{\n{persistent}}};\n")
+                file.write(f"extern CMOCK_THREAD_STORAGE struct {mock_project['clean_name']}Persistent MockPersistent;\n\n")
+            else:
+                file.write(f"static CMOCK_THREAD_STORAGE struct {mock_project['clean_name']}Persistent\n{{\n{persistent}}} MockPersistent;\n\n")
+        if self.track_touched and functions:
+            # remember each function the test configures, so Verify and Destroy only visit those
+            file.write("#define CMOCK_TOUCH(func) \\\n")
+            file.write("  do { if (!Mock.func##_Touched) { Mock.func##_Touched = 1; Mock.CMockTouchedList[Mock.CMockTouchedCount++] = CMOCK_##func##_ID; } } while (0)\n")
+            # each function's members run from its _Touched flag up to and including its _CallInstance
+            file.write("#define CMOCK_CLEAR(func) \\\n")
+            file.write(f"  memset(&Mock.func##_Touched, 0, offsetof(struct {mock_project['clean_name']}Instance, func##_CallInstance) + sizeof(CMOCK_MEM_INDEX_TYPE) - offsetof(struct {mock_project['clean_name']}Instance, func##_Touched))\n\n")
+
+    def _persistent_members(self, mock_project):
+        return ''.join([self.plugins.run('persistent_structure', function) for function in mock_project['parsed_stuff']['functions']])
+
+    def _member_size(self, declaration):
+        # rough size class of a struct member, good enough to keep padding down
+        if re.search(r':\s*\d+$', declaration):
+            return 0
+        c_type = declaration.rsplit(None, 1)[0].replace('const ', '').strip()
+        if '*' in c_type or c_type in ('size_t', 'CMOCK_MEM_INDEX_TYPE') or c_type.endswith('_CALLBACK'):
+            return 8
+        if c_type in ('char', 'signed char', 'unsigned char'):
+            return 1
+        if c_type in ('short', 'unsigned short', 'CMOCK_COMPACT_DEPTH_TYPE'):
+            return 2
+        if c_type in ('int', 'unsigned int', 'UNITY_LINE_TYPE', 'CEXCEPTION_T'):
+            return 4
+        if c_type in ('double', 'long long', 'unsigned long long') or 'long' in c_type:
+            return 8
+        kind = self.utils.treat_as.get(c_type, '')
+        if kind in ('INT8', 'HEX8', 'UINT8', 'CHAR'):
+            return 1
+        if kind in ('INT16', 'HEX16', 'UINT16'):
+            return 2
+        if kind in ('INT', 'INT32', 'HEX32', 'UINT32', 'FLOAT'):
+            return 4
+        # structs, enums and other unknown types go first, since their alignment is a guess
+        return 16
+
+    def _compact_members(self, members):
+        declarations = [line for line in members.splitlines() if line.strip()]
+        declarations.sort(key=lambda line: -self._member_size(line.strip().rstrip(';')))
+        return ''.join(f"{line}\n" for line in declarations)
 
     def _create_extern_declarations(self, file):
         if self.ordered:
-            file.write("extern int GlobalExpectCount;\n")
-            file.write("extern int GlobalVerifyOrder;\n")
+            file.write("#ifdef CMOCK_OWN_ORDERING\n")
+            file.write("#define GlobalExpectCount CMock_GlobalExpectCount\n")
+            file.write("#define GlobalVerifyOrder CMock_GlobalVerifyOrder\n")
+            file.write("#endif\n")
+            file.write("extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;\n")
+            file.write("extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;\n")
         file.write("\n")
 
+    def _create_registry_entry(self, file, mock_project, shared=False):
+        functions = mock_project['parsed_stuff']['functions']
+        if not (self.registry and functions):
+            return
+        clean_name = mock_project['clean_name']
+        sharded = self.shards > 1
+        if shared:
+            file.write("extern CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY CMockRegistry;\n")
+            file.write("void CMockActivate(void);\n\n")
+        else:
+            storage = "" if sharded else "static "
+            file.write(f"{storage}CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY CMockRegistry = {{ {clean_name}_Verify, {clean_name}_Destroy, NULL, 0 }};\n\n")
+            file.write(f"{storage}void CMockActivate(void)\n{{\n")
+            file.write("  CMock_Register(&CMockRegistry);\n")
+            if not self.fail_on_unexpected_calls:
+                file.write(''.join([self.plugins.run('mock_ignore', function) for function in functions]))
+            file.write("}\n\n")
+        if shared or not sharded:
+            # a mock joins the registry the first time a test configures or (with default ignores) calls it
+            file.write("#define CMOCK_REGISTER() \\\n")
+            file.write("  do { if (!CMockRegistry.Active) { CMockActivate(); } } while (0)\n\n")
+
+    def _touched_switch(self, file, cases):
+        file.write("  for (cmock_touched = 0; cmock_touched < Mock.CMockTouchedCount; cmock_touched++)\n  {\n")
+        file.write("    switch (Mock.CMockTouchedList[cmock_touched])\n    {\n")
+        for func_name, code in cases:
+            file.write(f"      case CMOCK_{func_name}_ID:\n")
+            file.write(''.join([f"      {line}" for line in code.splitlines(keepends=True)]))
+            file.write("        break;\n")
+        file.write("      default:\n        break;\n")
+        file.write("    }\n  }\n")
+
     def _create_mock_verify_function(self, file, mock_project):
         file.write(f"void {mock_project['clean_name']}_Verify(void)\n{{\n")
+        if self.track_touched and mock_project['parsed_stuff']['functions']:
+            cases = [(function['name'], f"  call_instance = Mock.{function['name']}_CallInstance;\n{self.plugins.run('mock_verify', function)}") for function in mock_project['parsed_stuff']['functions'] if self.plugins.run('mock_verify', function)]
+            if cases:
+                file.write("  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;\n")
+                file.write("  CMOCK_MEM_INDEX_TYPE call_instance;\n")
+                file.write("  int cmock_touched;\n")
+                self._touched_switch(file, cases)
+            file.write("}\n\n")
+            return
         verifications = ''.join([f"  call_instance = Mock.{function['name']}_CallInstance;\n{self.plugins.run('mock_verify', function)}" for function in mock_project['parsed_stuff']['functions'] if self.plugins.run('mock_verify', function)])
         if verifications:
             file.write("  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;\n")
@@ -295,6 +671,10 @@ class CMockGenerator:
 
     def _create_mock_destroy_function(self, file, mock_project):
         file.write(f"void {mock_project['clean_name']}_Destroy(void)\n{{\n")
+        if self.track_touched and mock_project['parsed_stuff']['functions']:
+            self._create_touched_destroy_body(file, mock_project)
+            file.write("}\n\n")
+            return
         file.write("  CMock_Guts_MemFreeAll();\n")
         file.write("  memset(&Mock, 0, sizeof(Mock));\n")
         file.write(''.join([self.plugins.run('mock_destroy', function) for function in mock_project['parsed_stuff']['functions']]))
@@ -305,7 +685,28 @@ class CMockGenerator:
             file.write("  GlobalVerifyOrder = 0;\n")
         file.write("}\n\n")
 
-    def _create_mock_implementation(self, file, function):
+    def _create_touched_destroy_body(self, file, mock_project):
+        functions = mock_project['parsed_stuff']['functions']
+        file.write("  int cmock_touched;\n")
+        file.write("  CMock_Guts_MemFreeAll();\n")
+        cases = []
+        for function in functions:
+            code = f"  CMOCK_CLEAR({function['name']});\n"
+            code += self.plugins.run('mock_destroy', function)
+            if not self.fail_on_unexpected_calls:
+                code += self.plugins.run('mock_ignore', function)
+            cases.append((function['name'], code))
+        self._touched_switch(file, cases)
+        file.write("  Mock.CMockTouchedCount = 0;\n")
+        if not self.fail_on_unexpected_calls:
+            file.write("  if (!Mock.CMockDefaultsApplied)\n  {\n")
+            file.write(''.join([f"  {line}" for function in functions for line in self.plugins.run('mock_ignore', function).splitlines(keepends=True)]))
+            file.write("    Mock.CMockDefaultsApplied = 1;\n  }\n")
+        if self.ordered:
+            file.write("  GlobalExpectCount = 0;\n")
+            file.write("  GlobalVerifyOrder = 0;\n")
+
+    def _create_function_opening(self, file, function):
         function_mod_and_rettype = f"{function['modifier']} {function['return']['type']}" if function['modifier'] else function['return']['type']
         if 'c_calling_convention' in function.keys() and function['c_calling_convention'] != None:
             function_mod_and_rettype += f" {function['c_calling_convention']}"
@@ -326,9 +727,22 @@ class CMockGenerator:
             file.write("#endif\n\n")
         file.write(f"{function_mod_and_rettype} {cls_pre}{function['unscoped_name']}({args_string})\n")
         file.write("{\n")
+
+    def _create_function_closing(self, file, function):
+        file.write("}\n")
+
+        for ns in function['namespace']:
+            file.write("}\n")
+
+        file.write("\n")
+
+    def _create_mock_implementation(self, file, function):
+        self._create_function_opening(file, function)
         file.write("  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;\n")
         file.write(f"  CMOCK_{function['name']}_CALL_INSTANCE* cmock_call_instance;\n")
         file.write(f"  UNITY_SET_DETAIL(CMockString_{function['name']});\n")
+        if self.registry and not self.fail_on_unexpected_calls:
+            file.write("  CMOCK_REGISTER();\n")
         file.write(f"  cmock_call_instance = (CMOCK_{function['name']}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.{function['name']}_CallInstance);\n")
         file.write(f"  Mock.{function['name']}_CallInstance = CMock_Guts_MemNext(Mock.{function['name']}_CallInstance);\n")
         file.write(self.plugins.run('mock_implementation_precheck', function))
@@ -343,17 +757,37 @@ class CMockGenerator:
         file.write("  UNITY_CLR_DETAILS();\n")
         if not function['return']['void?']:
             file.write("  return cmock_call_instance->ReturnVal;\n")
-        file.write("}\n")
+        self._create_function_closing(file, function)
 
-        for ns in function['namespace']:
-            file.write("}\n")
-
-        file.write("\n")
+    def _create_pruned_implementation(self, file, function):
+        self._create_function_opening(file, function)
+        if self.fail_on_unexpected_calls:
+            file.write("  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;\n")
+        if not function['return']['void?']:
+            file.write(f"  {function['return']['type']} cmock_retval;\n")
+        for arg in function['args']:
+            file.write(f"  (void){arg['name']};\n")
+        if self.fail_on_unexpected_calls:
+            file.write(f"  UNITY_SET_DETAIL(CMockString_{function['name']});\n")
+            file.write("  UNITY_TEST_FAIL(cmock_line, CMockStringCalledMore);\n")
+        if not function['return']['void?']:
+            file.write("  memset(&cmock_retval, 0, sizeof(cmock_retval));\n")
+            file.write("  return cmock_retval;\n")
+        self._create_function_closing(file, function)
 
     def _create_mock_interfaces(self, file, function):
         file.write(self.utils.code_add_argument_loader(function))
         file.write(self.plugins.run('mock_interfaces', function))
 
+    def _create_mock_bodies(self, file, mock_project, functions):
+        # the implementations and interfaces are most of the work, so those of big headers are rendered in worker processes
+        if self.render_pool and len(mock_project['parsed_stuff']['functions']) >= self.render_threshold:
+            self.render_pool.render(file, functions)
+            return
+        for function in functions:
+            self._create_mock_implementation(file, function)
+            self._create_mock_interfaces(file, function)
+
     def _create_function_skeleton(self, file, function, existing):
         # Prepare return value and arguments
         function_mod_and_rettype = (f"{function['modifier']} " if function['modifier'] else '') + \
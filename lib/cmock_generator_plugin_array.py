@@ -15,7 +15,7 @@ class CMockGeneratorPluginArray:
         Generate typedefs for instances with pointer depth.
         """
         return "".join(
-            f"  int Expected_{arg['name']}_Depth;\n"
+            self.utils.code_depth_member(f"Expected_{arg['name']}_Depth")
             for arg in function["args"]
             if arg.get("ptr?")
         )
@@ -14,7 +14,7 @@ class CMockGeneratorPluginCallback:
         """
         func_name = function["name"]
         return (
-            f"  char {func_name}_CallbackBool;\n"
+            self.utils.code_flag_member(f"{func_name}_CallbackBool") +
             f"  CMOCK_{func_name}_CALLBACK {func_name}_CallbackFunctionPointer;\n"
             f"  int {func_name}_CallbackCalls;\n"
         )
@@ -55,19 +55,15 @@ class CMockGeneratorPluginCallback:
         """
         func_name = function["name"]
         if function["return"]["void?"]:
-            return (
-                f"  if (Mock.{func_name}_CallbackFunctionPointer != NULL)\n"
-                f"  {{\n"
-                f"    {self.generate_call(function)};\n"
-                f"  }}\n"
-            )
+            call = f"    {self.generate_call(function)};\n"
         else:
-            return (
-                f"  if (Mock.{func_name}_CallbackFunctionPointer != NULL)\n"
-                f"  {{\n"
-                f"    cmock_call_instance->ReturnVal = {self.generate_call(function)};\n"
-                f"  }}\n"
-            )
+            call = f"    cmock_call_instance->ReturnVal = {self.generate_call(function)};\n"
+        return (
+            f"  if (Mock.{func_name}_CallbackFunctionPointer != NULL)\n"
+            f"  {{\n"
+            f"{self.utils.code_instrument(func_name, 'CallbackTime', call, '    ')}"
+            f"  }}\n"
+        )
 
     def mock_implementation_precheck(self, function):
         """
@@ -75,15 +71,29 @@ class CMockGeneratorPluginCallback:
         """
         func_name = function["name"]
         if function["return"]["void?"]:
+            call = f"    {self.generate_call(function)};\n"
             return (
                 f"  if (!Mock.{func_name}_CallbackBool &&\n"
                 f"      Mock.{func_name}_CallbackFunctionPointer != NULL)\n"
                 f"  {{\n"
-                f"    {self.generate_call(function)};\n"
+                f"{self.utils.code_instrument(func_name, 'CallbackTime', call, '    ')}"
                 f"    UNITY_CLR_DETAILS();\n"
                 f"    return;\n"
                 f"  }}\n"
             )
+        elif self.utils.instrument:
+            call = f"    cmock_cb_ret = {self.generate_call(function)};\n"
+            # the hooks are statements, so the result can't be declared and assigned in one go
+            return (
+                f"  if (!Mock.{func_name}_CallbackBool &&\n"
+                f"      Mock.{func_name}_CallbackFunctionPointer != NULL)\n"
+                f"  {{\n"
+                f"    {function['return']['type']} cmock_cb_ret;\n"
+                f"{self.utils.code_instrument(func_name, 'CallbackTime', call, '    ')}"
+                f"    UNITY_CLR_DETAILS();\n"
+                f"    return cmock_cb_ret;\n"
+                f"  }}\n"
+            )
         else:
             return (
                 f"  if (!Mock.{func_name}_CallbackBool &&\n"
@@ -103,12 +113,14 @@ class CMockGeneratorPluginCallback:
         has_ignore = ":ignore" in self.config.options[':plugins']
         lines = []
         lines.append(f"void {func_name}_AddCallback(CMOCK_{func_name}_CALLBACK Callback)\n{{\n")
+        lines.append(self.utils.code_touch(func_name))
         if has_ignore:
             lines.append(f"  Mock.{func_name}_IgnoreBool = (char)0;\n")
         lines.append(f"  Mock.{func_name}_CallbackBool = (char)1;\n")
         lines.append(f"  Mock.{func_name}_CallbackFunctionPointer = Callback;\n")
         lines.append("}\n\n")
         lines.append(f"void {func_name}_Stub(CMOCK_{func_name}_CALLBACK Callback)\n{{\n")
+        lines.append(self.utils.code_touch(func_name))
         if has_ignore:
             lines.append(f"  Mock.{func_name}_IgnoreBool = (char)0;\n")
         lines.append(f"  Mock.{func_name}_CallbackBool = (char)0;\n")
@@ -6,6 +6,7 @@ class CMockGeneratorPluginExpect:
         self.config = config
         self.ptr_handling = self.config.options[':when_ptr']
         self.ordered = self.config.options[':enforce_strict_ordering']
+        self.fast_verify = self.config.options[':fast_verify']
         self.utils = utils
         self.unity_helper = self.utils.helpers['unity_helper']
         self.priority = 5
@@ -32,6 +33,9 @@ class CMockGeneratorPluginExpect:
         """
         Generate mock function declarations based on function signature.
         """
+        return self._expect_declarations(function) + self._expect_table_declarations(function)
+
+    def _expect_declarations(self, function):
         if not function["args"]:
             if function["return"]["void?"]:
                 return (
@@ -65,15 +69,33 @@ class CMockGeneratorPluginExpect:
                 f"void {function['name']}_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, {function['args_string']}, {function['return']['str']});\n"
             )
 
-    def mock_implementation_always_check_args(self, function):
+    def _expect_table_declarations(self, function):
         """
-        Always verify arguments in the mock implementation.
+        Generate the row type and the bulk loader for queueing many expectations at once.
         """
-        lines = ""
+        if not function["args"] and function["return"]["void?"]:
+            return ""
+
+        func_name = function["name"]
+        lines = f"typedef struct _CMOCK_{func_name}_EXPECT_ROW\n{{\n"
         for arg in function["args"]:
-            lines += self.utils.code_verify_an_arg_expectation(function, arg)
+            lines += f"  {arg['type']} {arg['name']};\n"
+        if not function["return"]["void?"]:
+            lines += f"  {function['return']['type']} ReturnVal;\n"
+        lines += f"}} {func_name}_ExpectRow;\n"
+        lines += (
+            f"#define {func_name}_ExpectTable(cmock_rows, cmock_count) "
+            f"{func_name}_CMockExpectTable(__LINE__, cmock_rows, cmock_count)\n"
+            f"void {func_name}_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const {func_name}_ExpectRow* cmock_rows, size_t cmock_count);\n"
+        )
         return lines
 
+    def mock_implementation_always_check_args(self, function):
+        """
+        Always verify arguments in the mock implementation.
+        """
+        return self.utils.code_instrument(function["name"], "VerifyTime", self._verify_args(function))
+
     def mock_implementation_might_check_args(self, function):
         """
         Optionally verify arguments in the mock implementation based on configuration.
@@ -82,10 +104,28 @@ class CMockGeneratorPluginExpect:
             return ""
 
         lines = "  if (!cmock_call_instance->ExpectAnyArgsBool)\n  {\n"
+        lines += self._verify_args(function)
+        lines += "  }\n"
+        return self.utils.code_instrument(function["name"], "VerifyTime", lines)
+
+    def _verify_args(self, function):
+        """
+        Generate the argument checks, guarded by a single combined comparison when :fast_verify is on.
+        """
+        lines = ""
         for arg in function["args"]:
             lines += self.utils.code_verify_an_arg_expectation(function, arg)
-        lines += "  }\n"
-        return lines
+        if not (self.fast_verify and function["args"]):
+            return lines
+
+        # the detailed checks (and their failure messages) only run once something differs
+        nested = "".join(f"  {line}" if line.strip() else line for line in lines.splitlines(keepends=True))
+        return (
+            f"  if (!({self.utils.code_fast_verify_condition(function)}))\n"
+            "  {\n"
+            f"{nested}"
+            "  }\n"
+        )
 
     def mock_interfaces(self, function):
         """
@@ -108,6 +148,43 @@ class CMockGeneratorPluginExpect:
         if not function["return"]["void?"]:
             lines += self.utils.code_assign_argument_quickly("cmock_call_instance->ReturnVal", function["return"])
         lines += "}\n\n"
+        lines += self._expect_table_interface(function)
+        return lines
+
+    def _expect_table_interface(self, function):
+        """
+        Generate the bulk loader, which claims one contiguous block for all rows and links them in a single pass.
+        """
+        if not function["args"] and function["return"]["void?"]:
+            return ""
+
+        func_name = function["name"]
+        lines = (
+            f"void {func_name}_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const {func_name}_ExpectRow* cmock_rows, size_t cmock_count)\n{{\n"
+            "  CMOCK_MEM_INDEX_TYPE cmock_guts_index;\n"
+            f"  CMOCK_{func_name}_CALL_INSTANCE* cmock_call_instance;\n"
+            "  size_t cmock_row;\n"
+            "  if (cmock_count == 0)\n"
+            "    return;\n"
+            "  /* a count the index type can't hold would claim fewer rows than the loop fills */\n"
+            "  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);\n"
+            f"  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_{func_name}_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);\n"
+            "  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);\n"
+            f"  Mock.{func_name}_CallInstance = CMock_Guts_MemChain(Mock.{func_name}_CallInstance, cmock_guts_index);\n"
+            "  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)\n"
+            "  {\n"
+            f"    cmock_call_instance = (CMOCK_{func_name}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);\n"
+        )
+        lines += self.utils.code_init_base_expectation(func_name, indent="    ")
+        lines += self.utils.code_call_argument_loader(function, source="cmock_rows[cmock_row].", indent="    ")
+        if not function["return"]["void?"]:
+            retval = {**function["return"], "name": "cmock_rows[cmock_row].ReturnVal"}
+            lines += "  " + self.utils.code_assign_argument_quickly("cmock_call_instance->ReturnVal", retval)
+        lines += (
+            "    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);\n"
+            "  }\n"
+            "}\n\n"
+        )
         return lines
 
     def mock_verify(self, function):
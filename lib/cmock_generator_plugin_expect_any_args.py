@@ -11,7 +11,7 @@ class CMockGeneratorPluginExpectAnyArgs:
         """
         Generate typedefs for handling the "ExpectAnyArgs" flag in mock instances.
         """
-        return "  char ExpectAnyArgsBool;\n"
+        return self.utils.code_flag_member("ExpectAnyArgsBool")
 
     def mock_function_declarations(self, function):
         """
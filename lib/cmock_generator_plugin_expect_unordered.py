@@ -0,0 +1,218 @@
+import re
+
+
+class CMockGeneratorPluginExpectUnordered:
+    """
+    Plugin for generating expectations which may be consumed in any order.
+
+    Each function gets a small table of hash buckets in the CMock arena. Expectations
+    are filed under the hash of their comparable scalar arguments, so an incoming call
+    looks in a single bucket instead of scanning every outstanding expectation.
+    """
+    HASHABLE_KINDS = re.compile(r'(U?INT|HEX)(8|16|32|64)?')
+
+    def __init__(self, config, utils):
+        self.config = config
+        self.utils = utils
+        self.priority = 4
+
+        if self.config.options[':enforce_strict_ordering']:
+            raise Exception("ERROR: the expect_unordered plugin can't be combined with :enforce_strict_ordering. Disable one option.")
+
+    def hashed_args(self, function):
+        """
+        Return the arguments whose values are compared with == and can safely be hashed by their bytes.
+        """
+        return [
+            arg for arg in function["args"]
+            if not arg.get("ptr?")
+            and not self.utils.ptr_or_str(arg["type"])
+            and self.HASHABLE_KINDS.fullmatch(self.utils.treat_as.get(arg["type"], ""))
+        ]
+
+    def instance_typedefs(self, function):
+        """
+        Generate typedefs for mock instance variables.
+        """
+        return self.utils.code_flag_member("UnorderedUsed")
+
+    def instance_structure(self, function):
+        """
+        Generate instance structure entries for the bucket table.
+        """
+        return (
+            f"  CMOCK_MEM_INDEX_TYPE {function['name']}_UnorderedTable;\n"
+            f"  int {function['name']}_UnorderedCount;\n"
+        )
+
+    def mock_function_declarations(self, function):
+        """
+        Generate mock function declarations for unordered expectations.
+        """
+        func_name = function["name"]
+        if not function["args"]:
+            if function["return"]["void?"]:
+                return (
+                    f"#define {func_name}_ExpectUnorderedAndReturn(cmock_retval) "
+                    f"TEST_FAIL_MESSAGE(\"{func_name} requires _ExpectUnordered (not AndReturn)\");\n"
+                    f"#define {func_name}_ExpectUnordered() {func_name}_CMockExpectUnordered(__LINE__)\n"
+                    f"void {func_name}_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line);\n"
+                )
+            else:
+                return (
+                    f"#define {func_name}_ExpectUnordered() "
+                    f"TEST_FAIL_MESSAGE(\"{func_name} requires _ExpectUnorderedAndReturn\");\n"
+                    f"#define {func_name}_ExpectUnorderedAndReturn(cmock_retval) "
+                    f"{func_name}_CMockExpectUnorderedAndReturn(__LINE__, cmock_retval)\n"
+                    f"void {func_name}_CMockExpectUnorderedAndReturn(UNITY_LINE_TYPE cmock_line, {function['return']['str']});\n"
+                )
+        elif function["return"]["void?"]:
+            return (
+                f"#define {func_name}_ExpectUnorderedAndReturn({function['args_call']}, cmock_retval) "
+                f"TEST_FAIL_MESSAGE(\"{func_name} requires _ExpectUnordered (not AndReturn)\");\n"
+                f"#define {func_name}_ExpectUnordered({function['args_call']}) "
+                f"{func_name}_CMockExpectUnordered(__LINE__, {function['args_call']})\n"
+                f"void {func_name}_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, {function['args_string']});\n"
+            )
+        else:
+            return (
+                f"#define {func_name}_ExpectUnordered({function['args_call']}) "
+                f"TEST_FAIL_MESSAGE(\"{func_name} requires _ExpectUnorderedAndReturn\");\n"
+                f"#define {func_name}_ExpectUnorderedAndReturn({function['args_call']}, cmock_retval) "
+                f"{func_name}_CMockExpectUnorderedAndReturn(__LINE__, {function['args_call']}, cmock_retval)\n"
+                f"void {func_name}_CMockExpectUnorderedAndReturn(UNITY_LINE_TYPE cmock_line, {function['args_string']}, {function['return']['str']});\n"
+            )
+
+    def _code_hash(self, function, source, indent):
+        lines = ""
+        for arg in self.hashed_args(function):
+            value = f"{source}{arg['name']}"
+            lines += f"{indent}cmock_hash = CMock_Guts_Hash(cmock_hash, &{value}, (CMOCK_MEM_INDEX_TYPE)sizeof({value}));\n"
+        return lines
+
+    def mock_implementation_precheck(self, function):
+        """
+        Once the ordered expectations are used up, claim a matching unordered expectation from its bucket.
+        """
+        func_name = function["name"]
+        lines = (
+            f"  if ((cmock_call_instance == NULL) && (Mock.{func_name}_UnorderedCount != 0))\n"
+            "  {\n"
+            f"    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.{func_name}_UnorderedTable);\n"
+            "    CMOCK_MEM_INDEX_TYPE* cmock_bucket;\n"
+            "    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;\n"
+            f"    CMOCK_{func_name}_CALL_INSTANCE* cmock_candidate;\n"
+            "    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;\n"
+        )
+        lines += self._code_hash(function, "", "    ")
+        lines += (
+            "    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];\n"
+            "    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))\n"
+            "    {\n"
+            f"      cmock_candidate = (CMOCK_{func_name}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);\n"
+        )
+        # an exact match wins, so the order of the calls doesn't matter for arguments which aren't hashed either
+        exact = self.utils.code_exact_match_condition(function, "cmock_candidate")
+        hashed = "".join(f" && (cmock_candidate->Expected_{arg['name']} == {arg['name']})" for arg in self.hashed_args(function))
+        if exact is None:
+            # a custom unity helper decides, so the first one with the same hashed arguments is checked
+            lines += self._code_claim(func_name, "!cmock_candidate->UnorderedUsed" + hashed)
+        else:
+            lines += self._code_claim(func_name, "!cmock_candidate->UnorderedUsed" + (f" &&\n        {exact}" if exact else ""))
+        lines += "    }\n"
+        if exact:
+            # otherwise the first one with the same hashed arguments is checked, which reports what differs
+            lines += (
+                "    for (cmock_unordered_index = *cmock_bucket; (cmock_call_instance == NULL) && (cmock_unordered_index != CMOCK_GUTS_NONE); cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))\n"
+                "    {\n"
+                f"      cmock_candidate = (CMOCK_{func_name}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);\n"
+            )
+            lines += self._code_claim(func_name, "!cmock_candidate->UnorderedUsed" + hashed)
+            lines += "    }\n"
+        lines += (
+            "    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&\n"
+            f"           ((CMOCK_{func_name}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)\n"
+            "    {\n"
+            "      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);\n"
+            "    }\n"
+            "    if (cmock_call_instance == NULL)\n"
+            "      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);\n"
+            "  }\n"
+        )
+        return lines
+
+    def _code_claim(self, func_name, condition):
+        return (
+            f"      if ({condition})\n"
+            "      {\n"
+            "        cmock_candidate->UnorderedUsed = 1;\n"
+            f"        Mock.{func_name}_UnorderedCount--;\n"
+            "        cmock_call_instance = cmock_candidate;\n"
+            "        break;\n"
+            "      }\n"
+        )
+
+    def mock_interfaces(self, function):
+        """
+        Generate the interfaces which file an expectation under the hash of its arguments.
+        """
+        func_name = function["name"]
+        if function["return"]["void?"]:
+            if function["args_string"] == "void":
+                lines = f"void {func_name}_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line)\n{{\n"
+            else:
+                lines = f"void {func_name}_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, {function['args_string']})\n{{\n"
+        elif function["args_string"] == "void":
+            lines = f"void {func_name}_CMockExpectUnorderedAndReturn(UNITY_LINE_TYPE cmock_line, {function['return']['str']})\n{{\n"
+        else:
+            lines = f"void {func_name}_CMockExpectUnorderedAndReturn(UNITY_LINE_TYPE cmock_line, {function['args_string']}, {function['return']['str']})\n{{\n"
+
+        lines += (
+            "  CMOCK_MEM_INDEX_TYPE cmock_guts_index;\n"
+            f"  CMOCK_{func_name}_CALL_INSTANCE* cmock_call_instance;\n"
+            "  CMOCK_MEM_INDEX_TYPE* cmock_buckets;\n"
+            "  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;\n"
+            f"  if (Mock.{func_name}_UnorderedTable == CMOCK_GUTS_NONE)\n"
+            "  {\n"
+            f"    Mock.{func_name}_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);\n"
+            f"    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.{func_name}_UnorderedTable), cmock_line, CMockStringOutOfMemory);\n"
+            "  }\n"
+            f"  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_{func_name}_CALL_INSTANCE));\n"
+            f"  cmock_call_instance = (CMOCK_{func_name}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);\n"
+            "  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);\n"
+            "  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));\n"
+        )
+        lines += self.utils.code_init_base_expectation(func_name, False)
+        lines += self.utils.code_call_argument_loader(function)
+        if not function["return"]["void?"]:
+            lines += self.utils.code_assign_argument_quickly("cmock_call_instance->ReturnVal", function["return"])
+        lines += self._code_hash(function, "cmock_call_instance->Expected_", "  ")
+        # the table holds the head of every bucket followed by its tail, so appending never walks a chain
+        lines += (
+            f"  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.{func_name}_UnorderedTable);\n"
+            "  cmock_hash %= CMOCK_UNORDERED_BUCKETS;\n"
+            "  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)\n"
+            "    cmock_buckets[cmock_hash] = cmock_guts_index;\n"
+            "  else\n"
+            "    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);\n"
+            "  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;\n"
+            f"  Mock.{func_name}_UnorderedCount++;\n"
+            "}\n\n"
+        )
+        return lines
+
+    def mock_verify(self, function):
+        """
+        Verify that every unordered expectation has been claimed.
+        """
+        func_name = function["name"]
+        condition = f"Mock.{func_name}_UnorderedCount != 0"
+        if self.utils.ignore or self.utils.ignore_stateless:
+            condition = f"({condition}) && !Mock.{func_name}_IgnoreBool"
+        return (
+            f"  if ({condition})\n"
+            "  {\n"
+            f"    UNITY_SET_DETAIL(CMockString_{func_name});\n"
+            "    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);\n"
+            "  }\n"
+        )
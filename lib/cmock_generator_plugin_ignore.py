@@ -11,13 +11,10 @@ class CMockGeneratorPluginIgnore:
         """
         Generate instance structure entries for ignore behavior.
         """
-        if function["return"]["void?"]:
-            return f"  char {function['name']}_IgnoreBool;\n"
-        else:
-            return (
-                f"  char {function['name']}_IgnoreBool;\n"
-                f"  {function['return']['type']} {function['name']}_FinalReturn;\n"
-            )
+        lines = self.utils.code_flag_member(f"{function['name']}_IgnoreBool")
+        if not function["return"]["void?"]:
+            lines += f"  {function['return']['type']} {function['name']}_FinalReturn;\n"
+        return lines
 
     def mock_function_declarations(self, function):
         """
@@ -72,6 +69,7 @@ class CMockGeneratorPluginIgnore:
         lines = ""
         if function["return"]["void?"]:
             lines += f"void {function['name']}_CMockIgnore(void)\n{{\n"
+            lines += self.utils.code_touch(function["name"])
         else:
             lines += (
                 f"void {function['name']}_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, "
@@ -85,6 +83,7 @@ class CMockGeneratorPluginIgnore:
 
         # Add stop ignore implementation
         lines += f"void {function['name']}_CMockStopIgnore(void)\n{{\n"
+        lines += self.utils.code_touch(function["name"])
         if not function["return"]["void?"]:
             lines += (
                 f"  if(Mock.{function['name']}_IgnoreBool)\n"
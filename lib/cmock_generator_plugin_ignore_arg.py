@@ -12,7 +12,7 @@ class CMockGeneratorPluginIgnoreArg:
         """
         lines = ""
         for arg in function["args"]:
-            lines += f"  char IgnoreArg_{arg['name']};\n"
+            lines += self.utils.code_flag_member(f"IgnoreArg_{arg['name']}")
         return lines
 
     def mock_function_declarations(self, function):
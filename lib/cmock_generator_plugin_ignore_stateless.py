@@ -11,13 +11,10 @@ class CMockGeneratorPluginIgnoreStateless:
         """
         Generate the instance structure for stateless ignore functionality.
         """
-        if function["return"]["void?"]:
-            return f"  char {function['name']}_IgnoreBool;\n"
-        else:
-            return (
-                f"  char {function['name']}_IgnoreBool;\n"
-                f"  {function['return']['type']} {function['name']}_FinalReturn;\n"
-            )
+        lines = self.utils.code_flag_member(f"{function['name']}_IgnoreBool")
+        if not function["return"]["void?"]:
+            lines += f"  {function['return']['type']} {function['name']}_FinalReturn;\n"
+        return lines
 
     def mock_function_declarations(self, function):
         """
@@ -73,10 +70,12 @@ class CMockGeneratorPluginIgnoreStateless:
         lines = []
         if function["return"]["void?"]:
             lines.append(f"void {function['name']}_CMockIgnore(void)\n{{\n")
+            lines.append(self.utils.code_touch(function["name"]))
         else:
             lines.append(
                 f"void {function['name']}_CMockIgnoreAndReturn({function['return']['str']})\n{{\n"
             )
+            lines.append(self.utils.code_touch(function["name"]))
             lines.append(f"  Mock.{function['name']}_CallInstance = CMOCK_GUTS_NONE;\n")
             lines.append(f"  Mock.{function['name']}_FinalReturn = cmock_to_return;\n")
         lines.append(f"  Mock.{function['name']}_IgnoreBool = (char)1;\n")
@@ -84,6 +83,7 @@ class CMockGeneratorPluginIgnoreStateless:
 
         # Stop ignore function
         lines.append(f"void {function['name']}_CMockStopIgnore(void)\n{{\n")
+        lines.append(self.utils.code_touch(function["name"]))
         lines.append(f"  Mock.{function['name']}_IgnoreBool = (char)0;\n")
         lines.append("}\n\n")
 
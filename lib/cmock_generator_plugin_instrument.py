@@ -0,0 +1,70 @@
+class CMockGeneratorPluginInstrument:
+    """
+    Plugin for generating call counters and timing hooks for mocked functions in CMock.
+    """
+    def __init__(self, config, utils):
+        self.config = config
+        self.utils = utils
+        self.priority = 0
+
+    def include_files(self):
+        """
+        Generate include directives for the statistics type.
+        """
+        return '#include "cmock.h"\n'
+
+    def persistent_structure(self, function):
+        """
+        Generate the function's statistics, which are kept from one test to the next.
+        """
+        return f"  CMOCK_INSTRUMENT_STATS {function['name']}_Stats;\n"
+
+    def mock_function_declarations(self, function):
+        """
+        Generate mock function declarations for reading the statistics.
+        """
+        return f"const CMOCK_INSTRUMENT_STATS* {function['name']}_GetStats(void);\n"
+
+    def mock_implementation_precheck(self, function):
+        """
+        Count every call, including the ones which are ignored or stubbed.
+        """
+        lines = self.utils.code_touch(function["name"])
+        lines += f"  MockPersistent.{function['name']}_Stats.Calls++;\n"
+        return lines
+
+    def mock_interfaces(self, function):
+        """
+        Generate the interface for reading the statistics.
+        """
+        return (
+            f"const CMOCK_INSTRUMENT_STATS* {function['name']}_GetStats(void)\n{{\n"
+            f"  return &MockPersistent.{function['name']}_Stats;\n"
+            "}\n\n"
+        )
+
+    def mock_module_declarations(self, mock_project):
+        """
+        Generate the declarations of the module's statistics report and reset.
+        """
+        return (
+            f"void {mock_project['clean_name']}_DumpStats(void);\n"
+            f"void {mock_project['clean_name']}_ResetStats(void);\n"
+        )
+
+    def mock_module_interfaces(self, mock_project):
+        """
+        Generate the report, with a line for each function which has been called, and its reset.
+        """
+        lines = f"void {mock_project['clean_name']}_DumpStats(void)\n{{\n"
+        for function in mock_project["parsed_stuff"]["functions"]:
+            lines += (
+                f"  if (MockPersistent.{function['name']}_Stats.Calls != 0)\n"
+                f"    CMock_Instrument_Print(CMockString_{function['name']}, &MockPersistent.{function['name']}_Stats);\n"
+            )
+        lines += "}\n\n"
+        lines += f"void {mock_project['clean_name']}_ResetStats(void)\n{{\n"
+        if mock_project["parsed_stuff"]["functions"]:
+            lines += "  memset(&MockPersistent, 0, sizeof(MockPersistent));\n"
+        lines += "}\n\n"
+        return lines
@@ -0,0 +1,248 @@
+import re
+
+
+class CMockGeneratorPluginRecord:
+    """
+    Plugin for recording calls to a real implementation and replaying them as expectations in CMock.
+
+    In record mode the mock forwards to the real function and appends its arguments and return
+    value to a trace, laid out as the function's ExpectRow. Replaying the trace queues the records
+    in bulk through the CMockExpectParameters loaders. Functions which take or return pointers are left out, because
+    the addresses they carry mean nothing in another run.
+    """
+    FUNC_PTR_TYPE = re.compile(r'cmock_\w+_func_ptr\d+')
+
+    def __init__(self, config, utils):
+        self.config = config
+        self.utils = utils
+        self.ordered = config.options[':enforce_strict_ordering']
+        self.priority = 1
+        self.render_cacheable = False  # record ids hash the function name
+
+    def recordable(self, function):
+        """
+        Return whether the function's arguments and return value can be stored by value.
+        """
+        if function.get("var_arg"):
+            return False
+        if any(arg.get("ptr?") or self.utils.ptr_or_str(arg["type"]) or self.FUNC_PTR_TYPE.fullmatch(arg["type"]) for arg in function["args"]):
+            return False
+        return function["return"]["void?"] or not (function["return"].get("ptr?") or self.utils.ptr_or_str(function["return"]["type"]))
+
+    @staticmethod
+    def record_id(function):
+        """
+        Identify the function's records by the FNV-1a hash of its name, as CMock_Guts_Hash would.
+        """
+        value = 2166136261
+        for byte in function["name"].encode():
+            value = ((value ^ byte) * 16777619) & 0xFFFFFFFF
+        return f"0x{value:08X}u"
+
+    def _has_row(self, function):
+        return bool(function["args"]) or not function["return"]["void?"]
+
+    def include_files(self):
+        """
+        Generate include directives for the record and replay API.
+        """
+        return '#include "cmock.h"\n'
+
+    def instance_structure(self, function):
+        """
+        Generate instance structure entries for the real function being recorded.
+        """
+        if not self.recordable(function):
+            return ""
+        return f"  CMOCK_{function['name']}_REAL {function['name']}_RecordFunctionPointer;\n"
+
+    def mock_function_declarations(self, function):
+        """
+        Generate mock function declarations for recording calls.
+        """
+        if not self.recordable(function):
+            return ""
+        func_name = function["name"]
+        return (
+            f"typedef {function['return']['type']} (* CMOCK_{func_name}_REAL)({function['args_string']});\n"
+            f"void {func_name}_Record(CMOCK_{func_name}_REAL Real);\n"
+        )
+
+    def mock_implementation_precheck(self, function):
+        """
+        While recording, forward the call to the real function and log it instead of checking it.
+        """
+        if not self.recordable(function):
+            return ""
+        func_name = function["name"]
+        args = ", ".join(arg["name"] for arg in function["args"])
+        lines = (
+            f"  if (Mock.{func_name}_RecordFunctionPointer != NULL)\n"
+            "  {\n"
+        )
+        if not self._has_row(function):
+            return lines + (
+                f"    Mock.{func_name}_RecordFunctionPointer();\n"
+                f"    CMock_Record_Write({self.record_id(function)}, NULL, 0);\n"
+                "    UNITY_CLR_DETAILS();\n"
+                "    return;\n"
+                "  }\n"
+            )
+        lines += (
+            f"    {func_name}_ExpectRow cmock_record;\n"
+            "    memset(&cmock_record, 0, sizeof(cmock_record));\n"
+        )
+        for arg in function["args"]:
+            lines += "  " + self.utils.code_assign_argument_quickly(f"cmock_record.{arg['name']}", arg)
+        if function["return"]["void?"]:
+            lines += f"    Mock.{func_name}_RecordFunctionPointer({args});\n"
+        else:
+            lines += f"    cmock_record.ReturnVal = Mock.{func_name}_RecordFunctionPointer({args});\n"
+        lines += (
+            f"    CMock_Record_Write({self.record_id(function)}, &cmock_record, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_record));\n"
+            "    UNITY_CLR_DETAILS();\n"
+        )
+        lines += "    return;\n" if function["return"]["void?"] else "    return cmock_record.ReturnVal;\n"
+        lines += "  }\n"
+        return lines
+
+    def mock_interfaces(self, function):
+        """
+        Generate the interface which switches the function into record mode.
+        """
+        if not self.recordable(function):
+            return ""
+        func_name = function["name"]
+        return (
+            f"void {func_name}_Record(CMOCK_{func_name}_REAL Real)\n{{\n"
+            f"{self.utils.code_touch(func_name)}"
+            f"  Mock.{func_name}_RecordFunctionPointer = Real;\n"
+            "}\n\n"
+        )
+
+    def mock_module_declarations(self, mock_project):
+        """
+        Generate the declaration of the module's trace loader.
+        """
+        return f"void {mock_project['clean_name']}_Replay(void);\n"
+
+    def mock_module_interfaces(self, mock_project):
+        """
+        Generate the trace loader. A first pass counts this module's records for each function so
+        that every function gets one block of call instances, and a second pass fills them in order.
+        """
+        functions = [function for function in mock_project["parsed_stuff"]["functions"] if self.recordable(function)]
+        ids = [self.record_id(function) for function in functions]
+        if len(set(ids)) != len(ids):
+            raise Exception(f"ERROR: function names in {mock_project['module_name']} collide in the :record trace.")
+
+        # the record and replay API only exists in cmock.c when it is built with CMOCK_RECORD
+        lines = (
+            "#ifndef CMOCK_RECORD\n"
+            "#error \"The record plugin needs CMOCK_RECORD defined for cmock.c and the mocks.\"\n"
+            "#endif\n\n"
+        )
+        lines += f"void {mock_project['clean_name']}_Replay(void)\n{{\n"
+        if not functions:
+            return lines + "}\n\n"
+        lines += (
+            "  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;\n"
+            "  CMOCK_MEM_INDEX_TYPE cmock_cursor = 0;\n"
+            "  CMOCK_MEM_INDEX_TYPE cmock_size;\n"
+            "  UNITY_UINT32 cmock_id;\n"
+            "  const void* cmock_data;\n"
+        )
+        if self.ordered:
+            # calls are ordered by their place in the whole trace, so every module's replay agrees
+            lines += (
+                "  int cmock_origin = CMock_Replay_Origin(GlobalExpectCount);\n"
+                "  int cmock_ordinal = 0;\n"
+            )
+        for function in functions:
+            lines += (
+                f"  CMOCK_MEM_INDEX_TYPE cmock_{function['name']}_count = 0;\n"
+                f"  CMOCK_MEM_INDEX_TYPE cmock_{function['name']}_next = CMOCK_GUTS_NONE;\n"
+            )
+        lines += (
+            "  while ((cmock_data = CMock_Replay_Next(&cmock_cursor, &cmock_id, &cmock_size)) != NULL)\n"
+            "  {\n"
+            "    switch (cmock_id)\n"
+            "    {\n"
+        )
+        for function in functions:
+            func_name = function["name"]
+            size = f"sizeof({func_name}_ExpectRow)" if self._has_row(function) else "0"
+            lines += (
+                f"      case {self.record_id(function)}:\n"
+                f"        if (cmock_size != {size})\n"
+                "        {\n"
+                f"          UNITY_SET_DETAIL(CMockString_{func_name});\n"
+                "          UNITY_TEST_FAIL(cmock_line, CMockStringMismatch);\n"
+                "        }\n"
+                f"        cmock_{func_name}_count++;\n"
+                "        break;\n"
+            )
+        lines += (
+            "      default:\n"
+            "        break;\n"
+            "    }\n"
+            "  }\n"
+        )
+        for function in functions:
+            func_name = function["name"]
+            lines += (
+                f"  if (cmock_{func_name}_count != 0)\n"
+                "  {\n"
+                f"    cmock_{func_name}_next = CMock_Guts_MemNewChain(sizeof(CMOCK_{func_name}_CALL_INSTANCE), cmock_{func_name}_count);\n"
+                f"    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_{func_name}_next), cmock_line, CMockStringOutOfMemory);\n"
+                f"    Mock.{func_name}_CallInstance = CMock_Guts_MemChain(Mock.{func_name}_CallInstance, cmock_{func_name}_next);\n"
+                "  }\n"
+            )
+        lines += (
+            "  cmock_cursor = 0;\n"
+            "  while ((cmock_data = CMock_Replay_Next(&cmock_cursor, &cmock_id, &cmock_size)) != NULL)\n"
+            "  {\n"
+        )
+        if self.ordered:
+            lines += "    cmock_ordinal++;\n"
+        lines += (
+            "    switch (cmock_id)\n"
+            "    {\n"
+        )
+        for function in functions:
+            func_name = function["name"]
+            lines += (
+                f"      case {self.record_id(function)}:\n"
+                "      {\n"
+                f"        CMOCK_{func_name}_CALL_INSTANCE* cmock_call_instance = (CMOCK_{func_name}_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_{func_name}_next);\n"
+            )
+            if self._has_row(function):
+                lines += (
+                    f"        {func_name}_ExpectRow cmock_row;\n"
+                    "        memcpy(&cmock_row, cmock_data, sizeof(cmock_row));\n"
+                )
+            lines += self.utils.code_init_base_expectation(func_name, False, indent="        ")
+            if self.ordered:
+                lines += "        cmock_call_instance->CallOrder = cmock_origin + cmock_ordinal;\n"
+            lines += self.utils.code_call_argument_loader(function, source="cmock_row.", indent="        ")
+            if not function["return"]["void?"]:
+                retval = {**function["return"], "name": "cmock_row.ReturnVal"}
+                lines += "      " + self.utils.code_assign_argument_quickly("cmock_call_instance->ReturnVal", retval)
+            lines += (
+                f"        cmock_{func_name}_next = CMock_Guts_MemNext(cmock_{func_name}_next);\n"
+                "        break;\n"
+                "      }\n"
+            )
+        lines += (
+            "      default:\n"
+            "        break;\n"
+            "    }\n"
+            "  }\n"
+        )
+        if self.ordered:
+            lines += (
+                "  if (GlobalExpectCount < (cmock_origin + cmock_ordinal))\n"
+                "    GlobalExpectCount = cmock_origin + cmock_ordinal;\n"
+            )
+        lines += "}\n\n"
+        return lines
@@ -20,7 +20,7 @@ class CMockGeneratorPluginReturnThruPtr:
         lines = []
         for arg in function['args']:
             if self.utils.ptr_or_str(arg['type']) and not arg.get('const?', False):
-                lines.append(f"  char ReturnThruPtr_{arg['name']}_Used;")
+                lines.append(self.utils.code_flag_member(f"ReturnThruPtr_{arg['name']}_Used").rstrip("\n"))
                 lines.append(f"  {self.ptr_to_const(arg['type'])} ReturnThruPtr_{arg['name']}_Val;")
                 lines.append(f"  size_t ReturnThruPtr_{arg['name']}_Size;\n")
         return "\n".join(lines)
@@ -5,7 +5,20 @@
 #   SPDX-License-Identifier: MIT
 # =========================================================================
 
+import re
+
+
 class CMockGeneratorUtils:
+    # unity checks which pass exactly when the compared bytes are equal, or stricter for floats
+    EXACT_KINDS = re.compile(r'(U?INT|HEX)(8|16|32|64)?|CHAR|PTR|MEMORY|FLOAT|DOUBLE')
+    # integer assertions the shared helpers can take over, with the cast Unity applies to each of them
+    SHARED_NUMBER_CASTS = {
+        'INT': '', 'INT8': 'UNITY_INT8', 'INT16': 'UNITY_INT16', 'INT32': 'UNITY_INT32', 'INT64': 'UNITY_INT64',
+        'UINT': 'UNITY_UINT', 'UINT8': 'UNITY_UINT8', 'UINT16': 'UNITY_UINT16', 'UINT32': 'UNITY_UINT32', 'UINT64': 'UNITY_UINT64',
+        'HEX8': 'UNITY_INT8', 'HEX16': 'UNITY_INT16', 'HEX32': 'UNITY_INT32', 'HEX64': 'UNITY_INT64',
+        'CHAR': 'UNITY_INT8',
+    }
+
     def __init__(self, config, helpers={}):
         self.config = config
         self.ptr_handling = self.config.options[':when_ptr']
@@ -17,7 +30,12 @@ class CMockGeneratorUtils:
         self.ignore_arg = ':ignore_arg' in self.config.options[':plugins']
         self.ignore = ':ignore' in self.config.options[':plugins']
         self.ignore_stateless = ':ignore_stateless' in self.config.options[':plugins']
+        self.instrument = ':instrument' in self.config.options[':plugins']
         self.treat_as = self.config.options[':treat_as']
+        self.track_touched = self.config.options[':track_touched_functions']
+        self.registry = self.config.options[':mock_registry']
+        self.compact = self.config.options[':compact_instances']
+        self.shared_verify = self.config.options[':shared_verify_helpers']
         self.helpers = helpers
 
     @staticmethod
@@ -29,6 +47,10 @@ class CMockGeneratorUtils:
             return f"const {arg['type']}" if arg.get('const?') else arg['type']
 
     def code_verify_an_arg_expectation(self, function, arg):
+        if self.shared_verify:
+            lines = self.code_verify_an_arg_expectation_with_shared_helpers(function, arg)
+            if lines:
+                return lines
         if self.arrays:
             if self.ptr_handling == ':smart':
                 return self.code_verify_an_arg_expectation_with_smart_arrays(function, arg)
@@ -45,15 +67,48 @@ class CMockGeneratorUtils:
         lines += "  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);\n"
         lines += "  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));\n"
         lines += f"  Mock.{func_name}_CallInstance = CMock_Guts_MemChain(Mock.{func_name}_CallInstance, cmock_guts_index);\n"
+        lines += self.code_init_base_expectation(func_name, global_ordering_supported)
+        return lines
+
+    def code_flag_member(self, name):
+        if self.compact:
+            return f"  unsigned int {name} : 1;\n"
+        return f"  char {name};\n"
+
+    def code_depth_member(self, name):
+        if self.compact:
+            return f"  CMOCK_COMPACT_DEPTH_TYPE {name};\n"
+        return f"  int {name};\n"
+
+    def code_instrument(self, func_name, total, body, indent='  '):
+        if not (self.instrument and body):
+            return body
+        stats = f"CMockString_{func_name}, MockPersistent.{func_name}_Stats"
+        return (
+            f"{indent}CMOCK_INSTRUMENT_ENTER({stats});\n"
+            f"{body}"
+            f"{indent}CMOCK_INSTRUMENT_EXIT({stats}, {total});\n"
+        )
+
+    def code_touch(self, func_name, indent='  '):
+        lines = ''
+        if self.registry:
+            lines += f"{indent}CMOCK_REGISTER();\n"
+        if self.track_touched:
+            lines += f"{indent}CMOCK_TOUCH({func_name});\n"
+        return lines
+
+    def code_init_base_expectation(self, func_name, global_ordering_supported=True, indent='  '):
+        lines = self.code_touch(func_name, indent)
         if self.ignore or self.ignore_stateless:
-            lines += f"  Mock.{func_name}_IgnoreBool = (char)0;\n"
-        lines += "  cmock_call_instance->LineNumber = cmock_line;\n"
+            lines += f"{indent}Mock.{func_name}_IgnoreBool = (char)0;\n"
+        lines += f"{indent}cmock_call_instance->LineNumber = cmock_line;\n"
         if self.ordered and global_ordering_supported:
-            lines += "  cmock_call_instance->CallOrder = ++GlobalExpectCount;\n"
+            lines += f"{indent}cmock_call_instance->CallOrder = ++GlobalExpectCount;\n"
         if self.cexception:
-            lines += "  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;\n"
+            lines += f"{indent}cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;\n"
         if self.expect_any:
-            lines += "  cmock_call_instance->ExpectAnyArgsBool = (char)0;\n"
+            lines += f"{indent}cmock_call_instance->ExpectAnyArgsBool = (char)0;\n"
         return lines
 
     def code_add_an_arg_expectation(self, arg, depth=1):
@@ -75,22 +130,33 @@ class CMockGeneratorUtils:
             return f"  memcpy((void*)(&{dest}), (void*)(&{arg['name']}),\n" \
                    f"         sizeof({arg['type']}[{assert_expr}])); {comment}\n"
 
+    def code_add_argument_loader_declaration(self, function):
+        if function['args_string'] == 'void':
+            return ''
+
+        if self.arrays:
+            args_string = ', '.join(
+                [f"{self.arg_type_with_const(m)} {m['name']}, int {m['name']}_Depth" if m.get('ptr?') else f"{self.arg_type_with_const(m)} {m['name']}" for m in function['args']]
+            )
+        else:
+            args_string = function['args_string']
+        return f"void CMockExpectParameters_{function['name']}(CMOCK_{function['name']}_CALL_INSTANCE* cmock_call_instance, {args_string});\n"
+
     def code_add_argument_loader(self, function):
         if function['args_string'] == 'void':
             return ''
 
+        function_signature = self.code_add_argument_loader_declaration(function)
         if self.arrays:
             args_string = ', '.join(
                 [f"{self.arg_type_with_const(m)} {m['name']}, int {m['name']}_Depth" if m.get('ptr?') else f"{self.arg_type_with_const(m)} {m['name']}" for m in function['args']]
             )
-            function_signature = f"void CMockExpectParameters_{function['name']}(CMOCK_{function['name']}_CALL_INSTANCE* cmock_call_instance, {args_string});\n"
             function_body = f"void CMockExpectParameters_{function['name']}(CMOCK_{function['name']}_CALL_INSTANCE* cmock_call_instance, {args_string})\n{{\n"
             function_body += ''.join(
                 [self.code_add_an_arg_expectation(arg, f"{arg['name']}_Depth" if arg.get('ptr?') else 1) for arg in function['args']]
             )
             function_body += "}\n\n"
         else:
-            function_signature = f"void CMockExpectParameters_{function['name']}(CMOCK_{function['name']}_CALL_INSTANCE* cmock_call_instance, {function['args_string']});\n"
             function_body = f"void CMockExpectParameters_{function['name']}(CMOCK_{function['name']}_CALL_INSTANCE* cmock_call_instance, {function['args_string']})\n{{\n"
             function_body += ''.join(
                 [self.code_add_an_arg_expectation(arg) for arg in function['args']]
@@ -99,20 +165,80 @@ class CMockGeneratorUtils:
 
         return function_signature + function_body
 
-    def code_call_argument_loader(self, function):
+    def code_call_argument_loader(self, function, source='', indent='  '):
         if function['args_string'] != 'void':
             args = []
             for m in function['args']:
                 if self.arrays and m.get('ptr?') and not m.get('array_data?'):
-                    args.append(f"{m['name']}, 1")
+                    args.append(f"{source}{m['name']}, 1")
                 elif self.arrays and m.get('array_size?'):
-                    args.append(f"{m['name']}, {m['name']}")
+                    args.append(f"{source}{m['name']}, {source}{m['name']}")
                 else:
-                    args.append(m['name'])
-            return f"  CMockExpectParameters_{function['name']}(cmock_call_instance, {', '.join(args)});\n"
+                    args.append(f"{source}{m['name']}")
+            return f"{indent}CMockExpectParameters_{function['name']}(cmock_call_instance, {', '.join(args)});\n"
         else:
             return ''
 
+    def code_fast_verify_condition(self, function, instance='cmock_call_instance'):
+        conditions = []
+        for arg in function['args']:
+            expected = f"{instance}->Expected_{arg['name']}"
+            kind = self.treat_as.get(arg['type'], '')
+            if arg.get('ptr?') or self.ptr_or_str(arg['type']) or re.fullmatch(r'(U?INT|HEX)(8|16|32|64)?', kind):
+                # identical pointers always pass, whichever way the data behind them is checked
+                check = f"({expected} == {arg['name']})"
+            else:
+                check = f"(memcmp(&{expected}, &{arg['name']}, sizeof({arg['type']})) == 0)"
+            if self.ignore_arg:
+                check = f"({instance}->IgnoreArg_{arg['name']} || {check})"
+            conditions.append(check)
+        return ' &&\n        '.join(conditions)
+
+    def code_exact_match_condition(self, function, instance='cmock_call_instance'):
+        """
+        Condition which only holds when every argument would pass its verification against the expectation in
+        instance. Returns None when a custom unity helper decides for some argument, since it can't be asked quietly.
+        """
+        conditions = []
+        for arg in function['args']:
+            check = self._code_exact_arg_check(function, arg, f"{instance}->Expected_{arg['name']}", instance)
+            if check is None:
+                return None
+            if self.ignore_arg:
+                check = f"({instance}->IgnoreArg_{arg['name']} || {check})"
+            conditions.append(check)
+        return ' &&\n        '.join(conditions)
+
+    def _code_exact_arg_check(self, function, arg, expected, instance):
+        c_type, arg_name, _, _, unity_func, pre = self.lookup_expect_type(function, arg)
+        kind = unity_func.replace('UNITY_TEST_ASSERT_EQUAL_', '')
+        element = kind[:-len('_ARRAY')] if kind.endswith('_ARRAY') else kind
+        if kind == 'STRING':
+            return f"(({expected} == {arg_name}) || (({expected} != NULL) && ({arg_name} != NULL) && (strcmp({expected}, {arg_name}) == 0)))"
+        if not self.EXACT_KINDS.fullmatch(element):
+            return None
+        if kind == 'PTR' or not arg.get('ptr?'):
+            if pre == '&' or element == 'MEMORY':
+                return f"(memcmp(&{expected}, &{arg_name}, sizeof({c_type})) == 0)"
+            return f"({expected} == {arg_name})"
+        # the data behind a pointer, as many elements as the verification compares
+        width = re.search(r'(8|16|32|64)$', element)
+        if width:
+            size = str(int(width.group(1)) // 8)
+        elif re.sub(r'\bconst\b|\*', '', c_type).strip() == 'void':
+            size = '1'
+        else:
+            size = f"sizeof(*{expected})"
+        depth = f"{instance}->Expected_{arg_name}_Depth" if self.arrays and pre != '*' else None
+        same = f"({expected} == {arg_name})"
+        data = f"(({arg_name} != NULL) && (memcmp({expected}, {arg_name}, {f'(size_t){depth} * ' if depth else ''}{size}) == 0))"
+        if depth is None:
+            return f"({same} || (({expected} != NULL) && {data}))"
+        if self.ptr_handling == ':smart':
+            return f"(({expected} == NULL) ? ({arg_name} == NULL) : (({depth} == 0) ? {same} : ({same} || {data})))"
+        # unity refuses to compare zero elements
+        return f"(({expected} == NULL) ? ({arg_name} == NULL) : (({depth} > 0) && ({same} || {data})))"
+
     def ptr_or_str(self, arg_type):
         return '*' in arg_type or '*' in self.treat_as.get(arg_type, '')
 
@@ -127,6 +253,32 @@ class CMockGeneratorUtils:
             unity_func = self.helpers.get('unity_helper').get_helper(c_type) if self.helpers and 'unity_helper' in self.helpers else ['UNITY_TEST_ASSERT_EQUAL', '']
         return [c_type, arg_name, expected, ignore, unity_func[0], unity_func[1]]
 
+    def code_verify_an_arg_expectation_with_shared_helpers(self, function, arg):
+        c_type, arg_name, expected, ignore, unity_func, pre = self.lookup_expect_type(function, arg)
+        names = f"CMockString_{function['name']}, CMockString_{arg_name}"
+        depth = f"cmock_call_instance->Expected_{arg_name}_Depth" if self.arrays and arg.get('ptr?') else 1
+        smart = 1 if self.arrays and self.ptr_handling == ':smart' else 0
+        kind = unity_func.replace('UNITY_TEST_ASSERT_EQUAL_', '')
+        if kind in ('MEMORY', 'MEMORY_ARRAY'):
+            if kind == 'MEMORY':
+                depth = 1
+            call = f"CMock_VerifyMemory({names}, (const void*)({pre}{expected}), (const void*)({pre}{arg_name}), sizeof({c_type.rstrip('*')}), {depth}, {smart}, cmock_line);"
+        elif kind.endswith('_ARRAY') and kind[:-len('_ARRAY')] in self.SHARED_NUMBER_CASTS:
+            call = f"CMock_VerifyIntArray({names}, (const void*)({pre}{expected}), (const void*)({pre}{arg_name}), {depth}, {smart}, UNITY_DISPLAY_STYLE_{kind[:-len('_ARRAY')]}, cmock_line);"
+        elif kind in self.SHARED_NUMBER_CASTS:
+            cast = "(UNITY_INT)" + (f"({self.SHARED_NUMBER_CASTS[kind]})" if self.SHARED_NUMBER_CASTS[kind] else "")
+            call = f"CMock_VerifyNumber({names}, {cast}({pre}{expected}), {cast}({pre}{arg_name}), UNITY_DISPLAY_STYLE_{kind}, cmock_line);"
+        elif kind == 'STRING':
+            call = f"CMock_VerifyString({names}, {pre}{expected}, {pre}{arg_name}, cmock_line);"
+        else:
+            # floats, pointers and custom helpers keep their inline assertions
+            return None
+        lines = ''
+        if self.ignore_arg:
+            lines += f"  if (!{ignore})\n"
+        lines += f"  {{ {call} }}\n"
+        return lines
+
     def code_verify_an_arg_expectation_with_no_arrays(self, function, arg):
         c_type, arg_name, expected, ignore, unity_func, pre = self.lookup_expect_type(function, arg)
         lines = ''
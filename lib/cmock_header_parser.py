@@ -1,30 +1,75 @@
+import io
 import re
+import json
+import time
+import zlib
+import itertools
+import fnmatch
+from cmock_stats import measure
 
 class CMockHeaderParser:
-    def __init__(self, config):
-        self.c_strippables = config.options[':strippables']
-        self.c_attr_noconst = list(set(config.options[':attributes']) - {'const'})
+    VOID_TYPEDEF = re.compile(r'typedef\s+(?:\(\s*)?void(?:\s*\))?\s+(\w+)\s*;')
+    STREAM_CHUNK_SIZE = 1 << 20
+    STREAM_BRACKETS = re.compile(r'[{}()]')
+    STREAM_EXTERN_C = re.compile(r'extern\s+"C"\s*$')
+    STREAM_ASM = re.compile(r'\s*#\s*pragma\s+asm\s')
+    STREAM_ENDASM = re.compile(r'#\s*pragma\s+endasm')
+    # pieces of declaration_parse_matcher which could_be_prototype checks in linear time
+    PROTOTYPE_ARGUMENTS = re.compile(r'[\w\s\*\(\),\.\[\]+\-\/]*')
+    PROTOTYPE_FRONT = re.compile(r'[\w\s\*\(\),\[\]]+')
+    PROTOTYPE_WORD = re.compile(r'\w')
+    # incremental chunks end at every INCREMENTAL_ANCHOR-th possible end on average, chosen by content
+    INCREMENTAL_CHUNK_SIZE = 256
+    INCREMENTAL_ANCHOR = 16
+    # every option the parser reads; configs which agree on all of them parse a header the same
+    PARSER_OPTIONS = [
+        ':strippables', ':attributes', ':c_calling_conventions', ':treat_as_array', ':treat_as_void', ':treat_as',
+        ':array_size_name', ':array_size_type', ':when_no_prototypes', ':verbosity', ':treat_externs', ':treat_inlines',
+        ':inline_function_patterns', ':functions_include', ':functions_exclude', ':parse_guard', ':parse_stage_budget',
+        ':parse_max_statement_length', ':when_parse_budget_exceeded'
+    ]
+
+    def __init__(self, config, stats=None):
+        self.stats = stats
+        self.fingerprint = json.dumps([config.options[option] for option in self.PARSER_OPTIONS], sort_keys=True, default=str)
+        self.c_strippables = list(config.options[':strippables'])
+        self.c_attr_noconst = [attr for attr in dict.fromkeys(config.options[':attributes']) if attr != 'const']
         self.c_attributes = ['const'] + self.c_attr_noconst
-        self.c_calling_conventions = list(set(config.options[':c_calling_conventions']))
+        self.c_calling_conventions = list(dict.fromkeys(config.options[':c_calling_conventions']))
         self.treat_as_array = config.options[':treat_as_array']
-        self.treat_as_void = list(set(['void'] + config.options[':treat_as_void']))
+        self.treat_as_void = list(dict.fromkeys(['void'] + config.options[':treat_as_void']))
         self.function_declaration_parse_base_match = r'([\w\s\*\(\),\[\]]*?\w[\w\s\*\(\),\[\]]*?)\(([\w\s\*\(\),\.\[\]+\-\/]*)\)'
         self.declaration_parse_matcher = re.compile(self.function_declaration_parse_base_match + r'$', re.MULTILINE)
-        self.standards = list(set(['int', 'short', 'char', 'long', 'unsigned', 'signed'] + list(config.options[':treat_as'].keys())))
+        self.standards = list(dict.fromkeys(['int', 'short', 'char', 'long', 'unsigned', 'signed'] + list(config.options[':treat_as'].keys())))
         self.array_size_name = config.options[':array_size_name']
-        self.array_size_type = list(set(['int', 'size_t'] + config.options[':array_size_type']))
+        self.array_size_type = list(dict.fromkeys(['int', 'size_t'] + config.options[':array_size_type']))
         self.when_no_prototypes = config.options[':when_no_prototypes']
         self.local_as_void = self.treat_as_void
         self.verbosity = config.options[':verbosity']
         self.treat_externs = config.options[':treat_externs']
         self.treat_inlines = config.options[':treat_inlines']
         self.inline_function_patterns = config.options[':inline_function_patterns']
+        self.functions_include = self.compile_name_filter(config.options[':functions_include'])
+        self.functions_exclude = self.compile_name_filter(config.options[':functions_exclude'])
+        # the name of a function returning a function pointer sits inside the first parentheses, e.g. int (*name(void))(int)
+        self.func_ptr_return_name = re.compile(r'[^(]*\(\s*\*[\s\*]*(?:const\s+)?(\w+)\s*\(')
+        self.parse_guard = config.options[':parse_guard']
+        self.parse_stage_budget = config.options[':parse_stage_budget']
+        self.parse_max_statement_length = config.options[':parse_max_statement_length']
+        self.when_parse_budget_exceeded = config.options[':when_parse_budget_exceeded']
+        self.guard_name = None
+        self.guard_source = ''
+        self.incremental_parse = config.options[':incremental_parse']
+        self.incremental_cache = {}
         if self.treat_externs == ':include':
             self.c_strippables.append('extern')
         if self.treat_inlines == ':include':
             self.c_strippables.append('inline')
 
     def parse(self, name, source):
+        if self.incremental_parse:
+            return self.parse_incremental(name, source)
+
         parse_project = {
             'module_name': re.sub(r'\W', '', name),
             'typedefs': [],
@@ -33,24 +78,401 @@ class CMockHeaderParser:
         }
 
         function_names = []
+        self.guard_name = name
+        self.guard_source = source
+
+        with measure(self.stats, 'parse.import_source'):
+            all_funcs = self.parse_functions(name, self.import_source(source, parse_project))
+            all_funcs += self.parse_cpp_functions(self.import_source(source, parse_project, True))
+        if self.functions_include or self.functions_exclude:
+            all_funcs = [decl for decl in all_funcs if self.is_function_wanted(decl)]
+        with measure(self.stats, 'parse.declarations'):
+            for decl in all_funcs:
+                func = self.guarded_parse_declaration(parse_project, decl) if self.parse_guard else self.parse_declaration(parse_project, decl)
+                if func is None or not self.is_name_wanted(func['unscoped_name']):
+                    continue
+                if func['name'] not in function_names:
+                    parse_project['functions'].append(func)
+                    function_names.append(func['name'])
 
-        all_funcs = self.parse_functions(name, self.import_source(source, parse_project))
-        all_funcs += self.parse_cpp_functions(self.import_source(source, parse_project, True))
-        for decl in all_funcs:
-            func = self.parse_declaration(parse_project, decl)
-            if func['name'] not in function_names:
+        parse_project['normalized_source'] = self.transform_inline_functions(source) if self.treat_inlines == ':include' else ''
+
+        return {
+            'includes': None,
+            'functions': parse_project['functions'],
+            'typedefs': parse_project['typedefs'],
+            'normalized_source': parse_project['normalized_source']
+        }
+
+    def parse_file(self, name, path):
+        """Streaming counterpart of parse for headers too big to be held in memory as a whole.
+        The header is read in chunks for each pass over it, and the functions are parsed lazily
+        while the caller iterates over them. The results are the same as parse gives for the
+        whole header, in the same order.
+
+        Args:
+            name (String): Module name
+            path (String): Header to parse
+
+        Returns:
+            Dict: Parsed header, with a generator for the functions
+        """
+        parse_project = {
+            'module_name': re.sub(r'\W', '', name),
+            'typedefs': [],
+            'functions': [],
+            'normalized_source': ''
+        }
+
+        self.guard_name = name
+        self.guard_source = ''
+
+        with measure(self.stats, 'parse.import_source'):
+            void_types = []
+            sizes = []
+            with open(path, 'r') as f:
+                for chunk in self.source_chunks(f, sizes, self.STREAM_CHUNK_SIZE):
+                    void_types += self.VOID_TYPEDEF.findall(chunk)
+            all_funcs = []
+            seen = set()
+            with open(path, 'r') as f:
+                for chunk in self.split_source(f, sizes):
+                    for func in self.scan_prototypes(self.import_source(chunk, parse_project)):
+                        if func not in seen:
+                            seen.add(func)
+                            all_funcs.append(func)
+            self.check_prototypes_found(name, all_funcs)
+            scope = {'ns': [], 'pub': False}
+            with open(path, 'r') as f:
+                for chunk in self.split_source(f, sizes):
+                    all_funcs += self.parse_cpp_functions(self.import_source(chunk, parse_project, True), scope)
+        # each chunk only knows its own void typedefs
+        self.local_as_void = list(dict.fromkeys(self.treat_as_void + void_types))
+        if self.functions_include or self.functions_exclude:
+            all_funcs = [decl for decl in all_funcs if self.is_function_wanted(decl)]
+
+        return {
+            'includes': None,
+            'functions': self.stream_declarations(parse_project, all_funcs),
+            'typedefs': parse_project['typedefs'],
+            'normalized_source': parse_project['normalized_source']
+        }
+
+    def parse_incremental(self, name, source):
+        """Counterpart of parse which reuses what it can of the previous parse of the same header.
+        The header is split into chunks which end where their content says so, so an edit only
+        changes the chunk it is in. Imported chunks and parsed declarations are looked up by their
+        text, and a reused result adds its typedefs again, renumbered if there are more or fewer
+        typedefs before it now, so the function pointer typedefs are numbered the same as by a
+        full parse.
+
+        Args:
+            name (String): Module name
+            source (String): Header source
+
+        Returns:
+            Dict: Parsed header as from parse, with the names of the functions added, removed and
+            changed since the previous parse of the header under 'changes'
+        """
+        parse_project = {
+            'module_name': re.sub(r'\W', '', name),
+            'typedefs': [],
+            'functions': [],
+            'normalized_source': None
+        }
+
+        self.guard_name = name
+        self.guard_source = source
+        typedefs = parse_project['typedefs']
+        previous = self.incremental_cache.get(name, {'results': {}, 'functions': {}})
+        results = {}
+        func_ptr = re.compile(re.escape(f"cmock_{parse_project['module_name']}_func_ptr") + r'(\d+)\b')
+
+        # results are kept as JSON, which gives a fresh copy each time one is reused
+        def reuse(key, compute, cache=lambda result: True):
+            start = len(typedefs)
+            entry = results.get(key) or previous['results'].get(key)
+            if entry is None:
+                result = compute()
+                if not cache(result):
+                    return result, None
+                results[key] = (json.dumps(result), typedefs[start:], start)
+                return result, results[key][0]
+            results[key] = entry
+            text, added, first = entry
+            if added and first != start:
+                def renumber(match):
+                    number = int(match.group(1))
+                    return match.group().replace(match.group(1), str(number - first + start)) if first < number <= first + len(added) else match.group()
+                text = func_ptr.sub(renumber, text)
+                added = [func_ptr.sub(renumber, typedef) for typedef in added]
+            typedefs.extend(added)
+            return json.loads(text), text
+
+        def import_cpp(chunk):
+            funcs = self.parse_cpp_functions(self.import_source(chunk, parse_project, True), scope)
+            return funcs, json.dumps(scope)
+
+        with measure(self.stats, 'parse.import_source'):
+            sizes = []
+            chunks = list(self.source_chunks(io.StringIO(source), sizes, self.INCREMENTAL_CHUNK_SIZE, self.INCREMENTAL_ANCHOR))
+            all_funcs = []
+            seen = set()
+            for chunk in chunks:
+                for func in reuse(('c', chunk), lambda: self.scan_prototypes(self.import_source(chunk, parse_project)))[0]:
+                    if func not in seen:
+                        seen.add(func)
+                        all_funcs.append(func)
+            self.check_prototypes_found(name, all_funcs)
+            scope = {'ns': [], 'pub': False}
+            for chunk in chunks:
+                funcs, scope_after = reuse(('cpp', chunk, json.dumps(scope)), lambda: import_cpp(chunk))[0]
+                scope = json.loads(scope_after)
+                all_funcs += funcs
+        self.local_as_void = list(dict.fromkeys(self.treat_as_void + self.VOID_TYPEDEF.findall(source)))
+        if self.functions_include or self.functions_exclude:
+            all_funcs = [decl for decl in all_funcs if self.is_function_wanted(decl)]
+
+        # a declaration which failed to parse is tried again, as it may have run out of parse budget
+        parse = self.guarded_parse_declaration if self.parse_guard else self.parse_declaration
+        as_void = json.dumps(self.local_as_void)
+        functions = {}
+        with measure(self.stats, 'parse.declarations'):
+            for decl in all_funcs:
+                key = ('decl', decl if isinstance(decl, str) else json.dumps(decl), as_void)
+                func, text = reuse(key, lambda: parse(parse_project, decl), lambda result: result is not None)
+                if func is None or func['name'] in functions:
+                    continue
+                functions[func['name']] = text
                 parse_project['functions'].append(func)
-                function_names.append(func['name'])
 
         parse_project['normalized_source'] = self.transform_inline_functions(source) if self.treat_inlines == ':include' else ''
 
+        before = previous['functions']
+        self.incremental_cache[name] = {'results': results, 'functions': functions}
+
         return {
             'includes': None,
             'functions': parse_project['functions'],
             'typedefs': parse_project['typedefs'],
-            'normalized_source': parse_project['normalized_source']
+            'normalized_source': parse_project['normalized_source'],
+            'changes': {
+                'added': [func for func in functions if func not in before],
+                'removed': [func for func in before if func not in functions],
+                'changed': [func for func in functions if func in before and functions[func] != before[func]]
+            }
         }
 
+    def stream_declarations(self, parse_project, all_funcs):
+        function_names = set()
+        for decl in all_funcs:
+            with measure(self.stats, 'parse.declarations'):
+                func = self.guarded_parse_declaration(parse_project, decl) if self.parse_guard else self.parse_declaration(parse_project, decl)
+            if func is None or func['name'] in function_names or not self.is_name_wanted(func['unscoped_name']):
+                continue
+            function_names.add(func['name'])
+            yield func
+
+    def source_chunks(self, lines, sizes, chunk_size, anchor=None):
+        """Split a header into chunks of about chunk_size characters. A chunk only ends with a
+        line which ends a statement outside of any braces (but those of extern "C"), parentheses,
+        comments, continued lines and assembler sections, so import_source handles each statement
+        the same as in the whole header. Every later chunk starts with a ';' in place of the end of
+        the statement before it, which keeps the expressions anchored at the start of the source
+        from matching there.
+
+        Args:
+            lines (Iterable): Lines of the header, e.g. an open file
+            sizes (List): Gets the number of lines of each chunk, for split_source
+            chunk_size (Integer): Characters after which a chunk ends at the next possible line
+            anchor (Integer): If given, a chunk only ends with a line whose checksum is a multiple of it
+
+        Returns:
+            Generator: Chunks of the header
+        """
+        chunk = []
+        size = 0
+        braces = []  # True for the braces of extern "C", which import_source removes
+        parens = 0
+        in_comment = False
+        in_line_comment = False
+        in_directive = False
+        in_asm = False
+        at_start = True  # import_source only removes an assembler section at the very start
+        extern_c = False
+        continued = False
+        for line in lines:
+            chunk.append(line)
+            size += len(line)
+            was_continued = continued
+            continued = '\\' in line and line.rstrip().endswith('\\')
+
+            # continued lines are joined before comments are removed, so a line comment may go on
+            if was_continued and in_line_comment:
+                code = ''
+            elif not in_comment and '/' not in line:
+                code = line
+                in_line_comment = False
+                if not was_continued:
+                    in_directive = code.lstrip().startswith('#')
+            else:
+                starts_in_comment = in_comment
+                code, in_comment, in_line_comment = self.split_line_comments(line, in_comment)
+                if not was_continued:
+                    in_directive = not starts_in_comment and code.lstrip().startswith('#')
+            if in_asm:
+                in_asm = not self.STREAM_ENDASM.search(code)
+            elif in_directive:
+                in_asm = at_start and bool(self.STREAM_ASM.match(code))
+            else:
+                for match in self.STREAM_BRACKETS.finditer(code):
+                    bracket = match.group()
+                    if bracket == '{':
+                        before = code[:match.start()]
+                        braces.append(bool(self.STREAM_EXTERN_C.search(before)) or (extern_c and not before.strip()))
+                    elif bracket == '}':
+                        if braces:
+                            braces.pop()
+                    elif bracket == '(':
+                        parens += 1
+                    elif parens:
+                        parens -= 1
+                if code and not code.isspace():
+                    extern_c = 'extern' in code and bool(self.STREAM_EXTERN_C.search(code))
+            at_start = at_start and (not code or code.isspace())
+
+            if (size >= chunk_size and line.endswith('\n') and code.rstrip().endswith(';')
+                    and not (continued or in_comment or in_directive or in_asm or parens) and all(braces)
+                    and (anchor is None or zlib.crc32(line.encode(errors='ignore')) % anchor == 0)):
+                yield ''.join(chunk)[:-1]
+                sizes.append(len(chunk))
+                chunk = [';\n']
+                size = 0
+        sizes.append(len(chunk))
+        yield ''.join(chunk)
+
+    def split_source(self, lines, sizes):
+        # the same chunks again, without looking for their ends
+        lines = iter(lines)
+        for index, count in enumerate(sizes):
+            chunk = [';\n'] if index else []
+            chunk += itertools.islice(lines, count - len(chunk))
+            yield ''.join(chunk)[:-1] if index < len(sizes) - 1 else ''.join(chunk)
+
+    def split_line_comments(self, line, in_comment):
+        # code of a line without its comments, whether a block comment is still open, and whether it ends in a line comment
+        code = []
+        pos = 0
+        while pos < len(line):
+            if in_comment:
+                end = line.find('*/', pos)
+                if end < 0:
+                    break
+                in_comment = False
+                pos = end + 2
+                continue
+            block = line.find('/*', pos)
+            single = line.find('//', pos)
+            if single >= 0 and (block < 0 or single < block):
+                code.append(line[pos:single])
+                return ''.join(code), in_comment, True
+            if block < 0:
+                code.append(line[pos:])
+                break
+            code.append(line[pos:block])
+            in_comment = True
+            pos = block + 2
+        return ''.join(code), in_comment, False
+
+    def compile_name_filter(self, patterns):
+        # entries are globs, or regexes when wrapped in slashes; all of them are folded into one regex
+        if not patterns:
+            return None
+        parts = []
+        for pattern in patterns:
+            pattern = str(pattern)
+            if len(pattern) > 1 and pattern.startswith('/') and pattern.endswith('/'):
+                parts.append(f"(?:{pattern[1:-1]})")
+            else:
+                parts.append(f"(?:{fnmatch.translate(pattern)})")
+        return re.compile('|'.join(parts))
+
+    def is_function_wanted(self, declaration):
+        line = declaration[0] if isinstance(declaration, list) else declaration
+        name_match = self.func_ptr_return_name.match(line)
+        if name_match is None:
+            regex_match = self.declaration_parse_matcher.match(line)
+            name_match = re.search(r'(\w+)\s*$', regex_match.group(1)) if regex_match else None
+        if name_match is None:
+            return True  # leave anything unusual to parse_declaration, whose name is checked afterwards
+        return self.is_name_wanted(name_match.group(1))
+
+    def is_name_wanted(self, name):
+        if self.functions_include and not self.functions_include.fullmatch(name):
+            return False
+        return not (self.functions_exclude and self.functions_exclude.fullmatch(name))
+
+    def report_parse_budget(self, message, declaration=None):
+        if declaration is not None:
+            line = declaration[0] if isinstance(declaration, list) else declaration
+            message += f" at {self.guard_name}:{self.source_line_of(line)}: '{line[:80]}{'...' if len(line) > 80 else ''}'"
+        policy = str(self.when_parse_budget_exceeded).lstrip(':')
+        if policy == 'error':
+            raise Exception(f"ERROR: {message}")
+        elif policy == 'warn' and self.verbosity >= 1:
+            print(f"WARNING: {message}")
+
+    def source_line_of(self, line):
+        # normalized declarations no longer know where they came from, so look for the function name again
+        name = re.search(r'(\w+)\s*\(', line)
+        found = re.search(r'\b' + re.escape(name.group(1)) + r'\s*\(', self.guard_source) if name else None
+        return self.guard_source.count('\n', 0, found.start()) + 1 if found else '?'
+
+    def stage_clock(self):
+        # returns a callable that checks the time since its previous call against the stage budget
+        if not self.parse_guard:
+            return lambda stage: None
+        last = [time.perf_counter()]
+
+        def check(stage):
+            now = time.perf_counter()
+            if now - last[0] > self.parse_stage_budget:
+                self.report_parse_budget(f"Parser stage '{stage}' took {now - last[0]:.2f}s in {self.guard_name}")
+            last[0] = time.perf_counter()
+        return check
+
+    def within_parse_budget(self, stage, declaration, started=None):
+        line = declaration[0] if isinstance(declaration, list) else declaration
+        if len(line) > self.parse_max_statement_length:
+            self.report_parse_budget(f"Skipped {len(line)} character statement in '{stage}'", declaration)
+            return False
+        if started is not None and time.perf_counter() - started > self.parse_stage_budget:
+            self.report_parse_budget(f"Skipped statement which took {time.perf_counter() - started:.2f}s in '{stage}'", declaration)
+            return False
+        return True
+
+    def drop_long_statements(self, source, report=True):
+        # the stages below scan whole runs of words and spaces, which costs quadratic time in a long enough
+        # run. None of them reach past a ';', '{' or '}', so cutting out longer stretches bounds them all
+        pieces = re.split(r'([;{}])', source)
+        for index in range(0, len(pieces), 2):
+            if len(pieces[index]) > self.parse_max_statement_length:
+                if report:
+                    self.report_parse_budget(f"Skipped {len(pieces[index])} character statement in 'import'", ' '.join(pieces[index][:200].split()))
+                pieces[index] = ''
+        return ''.join(pieces)
+
+    def guarded_parse_declaration(self, parse_project, declaration):
+        if not self.within_parse_budget('parse_declaration', declaration):
+            return None
+        started = time.perf_counter()
+        try:
+            func = self.parse_declaration(parse_project, declaration)
+        except Exception as e:
+            self.report_parse_budget(f"Skipped declaration which could not be parsed ({str(e).splitlines()[0]})", declaration)
+            return None
+        return func if self.within_parse_budget('parse_declaration', declaration, started) else None
+
     def remove_comments_from_source(self, source):
         # remove comments (block and line, in three steps to ensure correct precedence)
         # Remove line comments that comment out the start of blocks
@@ -205,15 +627,14 @@ class CMockHeaderParser:
         return source
 
     def import_source(self, source, parse_project, cpp=False):
+        stage = self.stage_clock()
         # let's clean up the encoding in case they've done anything weird with the characters we might find
         source = source.encode('ISO-8859-1', errors='ignore').decode('UTF-8', errors='ignore')
 
         # void must be void for cmock _ExpectAndReturn calls to process properly, not some weird typedef which equates to void
         # to a certain extent, this action assumes we're chewing on pre-processed header files, otherwise we'll most likely just get stuff from @treat_as_void
-        self.local_as_void = self.treat_as_void
-        void_types = re.findall(r'typedef\s+(?:\(\s*)?void(?:\s*\))?\s+(\w+)\s*;', source)
-        if void_types:
-            self.local_as_void += list(set(void_types))
+        void_types = self.VOID_TYPEDEF.findall(source)
+        self.local_as_void = list(dict.fromkeys(self.treat_as_void + void_types))
 
         # If user wants to mock inline functions,
         # remove the (user specific) inline keywords before removing anything else to avoid missing an inline function
@@ -224,12 +645,17 @@ class CMockHeaderParser:
         # smush multiline macros into single line (checking for continuation character at end of line '\')
         source = re.sub(r'\s*\\\s*', ' ', source, flags=re.DOTALL)
         source = self.remove_comments_from_source(source)
+        stage('comments')
+        if self.parse_guard:
+            # the C++ pass imports the same source again, which has been reported already
+            source = self.drop_long_statements(source, report=not cpp)
 
         # remove assembler pragma sections
         source = re.sub(r'^\s*#\s*pragma\s+asm\s+.*?#\s*pragma\s+endasm', '', source, flags=re.DOTALL)
 
         # remove gcc's __attribute__ tags
         source = re.sub(r'__attribute(?:__)?\s*\(\(+.*\)\)+', '', source)
+        stage('attributes')
 
         # remove preprocessor statements and extern "C"
         source = re.sub(r'extern\s+"C"\s*\{', '', source)
@@ -241,6 +667,7 @@ class CMockHeaderParser:
 
          # remove struct, union, and enum definitions and typedefs with braces
         source = re.sub(r'^[\w\s]*(enum|union|struct|typedef)[\w\s]*\{[^}]+\}[\w\s*,]*;', '', source, flags=re.MULTILINE)
+        stage('definitions')
 
         # remove problem keywords
         source = re.sub(r'(\W)(?:register|auto|restrict)(\W)', r'\1\2', source)
@@ -259,6 +686,7 @@ class CMockHeaderParser:
         # remove known attributes slated to be stripped
         if self.c_strippables:
             source = re.sub(r'(^|\W+)(?:' + '|'.join(self.c_strippables) + r')(?=$|\W+)', r'\1', source)
+        stage('strippables')
 
         # scan standalone function pointers and remove them, because they can just be ignored
         source = re.sub(r'\w+\s*\(\s*\*\s*\w+\s*\)\s*\([^)]*\)\s*;', ';', source)
@@ -270,8 +698,10 @@ class CMockHeaderParser:
         
         # scan for functions which return function pointers, because they are a pain
         source = re.sub(r'([\w\s*]+)\(*\(\s*\*([\w\s*]+)\s*\(([\w\s*,]*)\)\)\s*\(([\w\s*,]*)\)\)*', _replace_func_ptr, source)
+        stage('function pointers')
 
         source = self.remove_nested_pairs_of_braces(source) if not cpp else source
+        stage('braces')
 
         if self.treat_inlines == ':include':
             source = re.sub(r'\{ \}', ';', source)
@@ -298,10 +728,11 @@ class CMockHeaderParser:
             src_lines = [line for line in src_lines if not re.search(r'(?:^|\s+)(?:inline)\s+', line)]
 
         src_lines = [line for line in src_lines if line]
+        stage('statements')
 
         return src_lines
 
-    def parse_cpp_functions(self, source):
+    def parse_cpp_functions(self, source, scope=None):
         """Rudimentary C++ parser
         Does not handle all situations - e.g.:
         * A namespace function appears after a class with private members (should be parsed)
@@ -310,14 +741,17 @@ class CMockHeaderParser:
 
         Args:
             source (String): Source to parsed
+            scope (Dict): Namespaces and visibility left open by the previous chunk, if any
 
         Returns:
             List: List of Functions found in the source
         """
         funcs = []
 
-        ns = []
-        pub = False
+        # a shared scope carries namespaces and visibility over to the next chunk of a streamed header
+        scope = scope if scope is not None else {'ns': [], 'pub': False}
+        ns = scope['ns']
+        pub = scope['pub']
         for line in source:
             # Search for namespace, class, opening and closing braces
             for item in re.findall(r'(?:(?:\b(?:namespace|class)\s+(?:\S+)\s*)?{)|}', line):
@@ -342,6 +776,8 @@ class CMockHeaderParser:
                 continue
 
             line = re.sub(r'^.*static', '', line)
+            if self.parse_guard and not self.within_parse_budget('prototype scan', line):
+                continue
             if not re.search(self.declaration_parse_matcher, line):
                 continue
 
@@ -358,16 +794,60 @@ class CMockHeaderParser:
 
             funcs.append([line.strip().replace(r'\s+', ' '), tmp, cls])
 
+        scope['pub'] = pub
         return funcs
 
     def parse_functions(self, filename, source):
-        funcs = [line.strip().replace(r'\s+', ' ') for line in source if re.search(self.declaration_parse_matcher, line)]
+        funcs = self.scan_prototypes(source)
+        self.check_prototypes_found(filename, funcs)
+        return funcs
+
+    def scan_prototypes(self, source):
+        funcs = []
+        for line in source:
+            if not self.could_be_prototype(line):
+                continue
+            if self.parse_guard and not self.within_parse_budget('prototype scan', line):
+                continue
+            started = time.perf_counter()
+            if re.search(self.declaration_parse_matcher, line):
+                if not self.parse_guard or self.within_parse_budget('prototype scan', line, started):
+                    funcs.append(line.strip().replace(r'\s+', ' '))
+        return funcs
+
+    def check_prototypes_found(self, filename, funcs):
         if not funcs:
             if self.when_no_prototypes == 'error':
                 raise Exception(f"ERROR: No function prototypes found by CMock in {filename}")
             elif self.when_no_prototypes == 'warn' and self.verbosity >= 1:
                 print(f"WARNING: No function prototypes found by CMock in {filename}")
-        return funcs
+
+    def could_be_prototype(self, line):
+        """Linear time check whether declaration_parse_matcher can find a match in the line.
+        The matcher backtracks heavily on lines it cannot match, so those are weeded out here.
+
+        Args:
+            line (String): Normalized statement
+
+        Returns:
+            Boolean: False when the matcher can't match, True when it can
+        """
+        line = line[:-1] if line.endswith('\n') else line
+        if '\n' in line:
+            # the matcher is anchored per line, so leave statements spanning lines to it
+            return True
+        if not line.endswith(')'):
+            return False
+        # the argument list is the longest run of argument characters before the final parenthesis
+        start = len(line) - 1 - self.PROTOTYPE_ARGUMENTS.match(line[-2::-1]).end()
+        # it has to open with a parenthesis which follows a word within the characters allowed in front of it
+        for front in self.PROTOTYPE_FRONT.finditer(line, 0, len(line) - 1):
+            if front.end() <= start:
+                continue
+            word = self.PROTOTYPE_WORD.search(line, front.start(), front.end())
+            if word and line.find('(', max(word.end(), start), front.end()) != -1:
+                return True
+        return False
 
     def parse_type_and_name(self, arg):
         """Split up words and remove known attributes.
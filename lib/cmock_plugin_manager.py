@@ -1,13 +1,28 @@
+import re
 import importlib
 import threading
+from itertools import chain
 from pathlib import Path
 
 
 class CMockPluginManager:
-    def __init__(self, config, utils):
+    NAME_PLACEHOLDER = re.compile(r'(CMOCKRC_(?:F|A\d+)_)')
+    WORD = re.compile(r'\b\w+\b')
+    FUNCTION_FIELDS = {'name', 'unscoped_name', 'namespace', 'class', 'args', 'args_string', 'args_call', 'return', 'var_arg', 'modifier', 'contains_ptr?'}
+    ARG_FIELDS = {'name', 'type', 'ptr?', 'const?', 'const_ptr?'}
+    RETURN_FIELDS = {'name', 'type', 'str', 'void?', 'ptr?', 'const?', 'const_ptr?'}
+
+    def __init__(self, config, utils, stats=None):
         """
         Initialize the plugin manager with configuration and utility instances.
         """
+        self.stats = stats
+        self.render_cache = config.options[':render_cache']
+        self.templates = {}
+        self.shapes = {}
+        self.implementers = {}
+        self.shape_keys = {}
+        self.shape_functions = {}
         self.plugins = []
         plugins_to_load = [':expect'] + (config.options[':plugins'] or [])
         plugins_to_load = list(dict.fromkeys(plugins_to_load))  # Remove duplicates while maintaining order
@@ -25,13 +40,145 @@ class CMockPluginManager:
         """
         Execute the specified method on all loaded plugins.
         """
+        if self.render_cache:
+            implementers = self.implementers.get(method)
+            if implementers is None:
+                implementers = self.implementers[method] = [plugin for plugin in self.plugins if hasattr(plugin, method)]
+            if not implementers:
+                return ""
+            shape = self._shape_of(args, kwargs)
+            if shape:
+                return self._instantiate(method, shape, args)
+
         data = ""
         for plugin in self.plugins:
             if hasattr(plugin, method):
-                data += getattr(plugin, method)(*args, **kwargs)
+                data += self._call(plugin, method, args, kwargs)
 
         return data
 
+    def _call(self, plugin, method, args, kwargs):
+        if self.stats:
+            with self.stats.measure(f"plugin.{type(plugin).__name__.replace('CMockGeneratorPlugin', '')}.{method}"):
+                return getattr(plugin, method)(*args, **kwargs)
+        return getattr(plugin, method)(*args, **kwargs)
+
+    def _instantiate(self, method, shape, args):
+        """
+        Render the plugins' code for a function shape once, then fill in the names of each function.
+        """
+        key, template_function, names = shape
+        template = self.templates.get((method, key))
+        if template is None:
+            template = self.templates[(method, key)] = self._render_template(method, template_function)
+        if len(template) == 1 and isinstance(template[0], tuple):
+            return self._fill(template[0], names)
+        return "".join(self._fill(part, names) if isinstance(part, tuple) else self._call(part, method, args, {}) for part in template)
+
+    @staticmethod
+    def _fill(part, names):
+        literals, placeholders = part
+        if not placeholders:
+            return literals[0]
+        return "".join(chain.from_iterable(zip(literals, map(names.__getitem__, placeholders)))) + literals[-1]
+
+    def _render_template(self, method, template_function):
+        # a template holds the code of the cacheable plugins split around the placeholders,
+        # with the plugins which can't be cached in between
+        template = []
+        code = ""
+        for plugin in self.implementers[method]:
+            if getattr(plugin, 'render_cacheable', True):
+                code += self._call(plugin, method, (template_function,), {})
+                continue
+            if code:
+                template.append(self._split(code))
+                code = ""
+            template.append(plugin)
+        if code or not template:
+            template.append(self._split(code))
+        return template
+
+    def _split(self, code):
+        pieces = self.NAME_PLACEHOLDER.split(code)
+        return tuple(pieces[0::2]), tuple(pieces[1::2])
+
+    def _shape_of(self, args, kwargs):
+        """
+        Return the cache key, the function with placeholder names, and the names to fill in,
+        or None when the hook doesn't work on a single function or it can't be cached.
+        """
+        if kwargs or len(args) != 1 or not isinstance(args[0], dict) or 'args' not in args[0]:
+            return None
+        function = args[0]
+        known = self.shapes.get(id(function))
+        if known and known[0] is function:
+            return known[1]
+        if len(self.shapes) > 65536:
+            self.shapes.clear()
+        shape = self._normalize(function)
+        # holding on to the function keeps its id from being reused by another one
+        self.shapes[id(function)] = (function, shape)
+        return shape
+
+    def _normalize(self, function):
+        if function.get('class') or function.get('namespace') or function.get('unscoped_name', function['name']) != function['name']:
+            return None
+        arg_names = [arg['name'] for arg in function['args']]
+        names = {'CMOCKRC_F_': function['name']}
+        names.update({f"CMOCKRC_A{index}_": name for index, name in enumerate(arg_names)})
+        if len(set(names.values())) != len(names) or any('CMOCKRC_' in name for name in names.values()):
+            return None
+        # most argument lists are just types and names, which follow from the arguments themselves
+        plain_string = not arg_names or function['args_string'] == ", ".join(f"{arg['type']} {arg['name']}" for arg in function['args'])
+        plain_call = not arg_names or function['args_call'] == ", ".join(arg_names)
+        if plain_string and plain_call and function.keys() == self.FUNCTION_FIELDS and function['return'].keys() == self.RETURN_FIELDS and all(arg.keys() == self.ARG_FIELDS for arg in function['args']):
+            shape = (
+                tuple((arg['type'], arg['ptr?'], arg['const?'], arg['const_ptr?']) for arg in function['args']),
+                tuple(function['return'].items()), function['var_arg'], function['modifier'], function['contains_ptr?'],
+                None if arg_names else (function['args_string'], function['args_call']),
+            )
+        else:
+            plain_string = plain_call = False
+            shape = repr(self._template_function(function, names))
+        key = self.shape_keys.get(shape)
+        if key is None:
+            key = self.shape_keys[shape] = len(self.shape_keys)
+            self.shape_functions[key] = self._template_function(function, names, plain_string and plain_call)
+        return key, self.shape_functions[key], names
+
+    def _template_function(self, function, names, plain=False):
+        """
+        Copy the function with placeholders in place of its own and its arguments' names.
+        A plain argument list is rebuilt from the arguments, as its key only holds their types;
+        any other one has every word which is an argument's name replaced, which its key holds.
+        """
+        args = [{**arg, 'name': f"CMOCKRC_A{index}_"} for index, arg in enumerate(function['args'])]
+        if plain:
+            return {
+                **function,
+                'name': 'CMOCKRC_F_',
+                'unscoped_name': 'CMOCKRC_F_',
+                'args': args,
+                'args_string': ", ".join(f"{arg['type']} {arg['name']}" for arg in args) if args else function['args_string'],
+                'args_call': ", ".join(arg['name'] for arg in args) if args else function['args_call'],
+            }
+
+        placeholders = {name: placeholder for placeholder, name in names.items() if placeholder != 'CMOCKRC_F_'}
+
+        def rename(text):
+            if not placeholders or not text:
+                return text
+            return self.WORD.sub(lambda match: placeholders.get(match.group(0), match.group(0)), text)
+
+        return {
+            **function,
+            'name': 'CMOCKRC_F_',
+            'unscoped_name': 'CMOCKRC_F_',
+            'args': args,
+            'args_string': rename(function['args_string']),
+            'args_call': rename(function['args_call']),
+        }
 
     @staticmethod
     def camelize(lower_case_and_underscored_word):
@@ -0,0 +1,75 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait
+
+# the generator of a worker process, set up once by _start_worker
+_generator = None
+
+
+def _start_worker(options):
+    # workers can't share the generator of the main process, so each one builds its own from the same options
+    global _generator
+    from cmock_config import CMockConfig
+    from cmock_unityhelper_parser import CMockUnityHelperParser
+    from cmock_generator_utils import CMockGeneratorUtils
+    from cmock_plugin_manager import CMockPluginManager
+    from cmock_generator import CMockGenerator
+    config = CMockConfig(options)
+    utils = CMockGeneratorUtils(config, helpers={'unity_helper': CMockUnityHelperParser(config)})
+    _generator = CMockGenerator(config, None, utils, CMockPluginManager(config, utils))
+
+
+def _render_functions(functions):
+    # rendered code is big, so it is handed back in a temporary file rather than through the pipe
+    with tempfile.NamedTemporaryFile('w', suffix='.c', delete=False) as file:
+        for function in functions:
+            _generator._create_mock_implementation(file, function)
+            _generator._create_mock_interfaces(file, function)
+    return file.name
+
+
+class CMockRenderPool:
+    """
+    Renders the implementations and interfaces of the functions of a big header in worker
+    processes. The functions are split into consecutive slices, and the rendered slices come
+    back in the same order, so the mock is the same as when it is rendered in one process.
+    """
+
+    SLICES_PER_WORKER = 4
+
+    def __init__(self, config):
+        self.options = config.options
+        self.workers = config.options[':render_workers']
+        self.executor = None
+
+    def render(self, file, functions):
+        if not functions:
+            return
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers, initializer=_start_worker, initargs=(self.options,))
+        size = -(-len(functions) // (self.workers * self.SLICES_PER_WORKER))
+        slices = [functions[start:start + size] for start in range(0, len(functions), size)]
+        futures = [self.executor.submit(_render_functions, part) for part in slices]
+        try:
+            for future in futures:
+                with open(future.result(), 'r') as part:
+                    shutil.copyfileobj(part, file)
+        finally:
+            # every slice which was rendered left a file behind, also when another slice failed
+            wait(futures)
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    os.remove(future.result())
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -0,0 +1,102 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+
+def measure(stats, stage):
+    """
+    Time a stage into stats, or do nothing when no stats are collected.
+    """
+    return stats.measure(stage) if stats else nullcontext()
+
+
+class CMockStats:
+    """
+    Collects timings and counters while mocks are generated, for --stats and --stats-json.
+    Stage times are inclusive: plugin hooks run while a file is written, and everything
+    of a header runs inside its 'generate' stage.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.files = {}
+        self.current = None
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def measure(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - started)
+
+    def add_time(self, stage, seconds):
+        entry = self.stages.setdefault(stage, {'seconds': 0.0, 'calls': 0})
+        entry['seconds'] += seconds
+        entry['calls'] += 1
+        if self.current is not None and stage in ('parse', 'generate'):
+            self.current[f"{stage}_seconds"] += seconds
+
+    def begin_file(self, name):
+        self.current = self.files.setdefault(name, {
+            'parse_seconds': 0.0, 'generate_seconds': 0.0, 'functions': 0,
+            'bytes_written': 0, 'files_written': 0, 'files_rewritten': 0,
+        })
+
+    def end_file(self):
+        self.current = None
+
+    def count_functions(self, count):
+        if self.current is not None:
+            self.current['functions'] += count
+
+    def record_write(self, path, size, rewritten):
+        # files of the whole batch (string pool, aggregate) don't belong to a header
+        target = self.current if self.current is not None else self.files.setdefault('(batch)', {
+            'parse_seconds': 0.0, 'generate_seconds': 0.0, 'functions': 0,
+            'bytes_written': 0, 'files_written': 0, 'files_rewritten': 0,
+        })
+        target['bytes_written'] += size
+        target['files_written'] += 1
+        target['files_rewritten'] += 1 if rewritten else 0
+
+    def totals(self):
+        keys = ['functions', 'bytes_written', 'files_written', 'files_rewritten']
+        totals = {key: sum(entry[key] for entry in self.files.values()) for key in keys}
+        totals['headers'] = len([name for name in self.files if name != '(batch)'])
+        totals['seconds'] = time.perf_counter() - self.started
+        return totals
+
+    def to_dict(self):
+        return {'totals': self.totals(), 'files': self.files, 'stages': self.stages}
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+    def summary(self):
+        totals = self.totals()
+        lines = [
+            f"CMock stats: {totals['headers']} headers, {totals['functions']} functions in {totals['seconds'] * 1000:.1f} ms",
+            f"  {totals['files_written']} files written, {totals['files_rewritten']} rewritten, "
+            f"{totals['files_written'] - totals['files_rewritten']} unchanged, {totals['bytes_written']} bytes",
+            "",
+            f"  {'header':<32} {'functions':>9} {'parse ms':>10} {'generate ms':>12} {'bytes':>10} {'rewritten':>10}",
+        ]
+        for name, entry in self.files.items():
+            lines.append(f"  {os.path.basename(name):<32} {entry['functions']:>9} {entry['parse_seconds'] * 1000:>10.2f} "
+                         f"{entry['generate_seconds'] * 1000:>12.2f} {entry['bytes_written']:>10} "
+                         f"{entry['files_rewritten']:>4} of {entry['files_written']:<2}")
+        lines += ["", f"  {'stage (inclusive)':<56} {'ms':>10} {'calls':>8}"]
+        for stage, entry in sorted(self.stages.items(), key=lambda item: -item[1]['seconds']):
+            lines.append(f"  {stage:<56} {entry['seconds'] * 1000:>10.2f} {entry['calls']:>8}")
+        return "\n".join(lines)
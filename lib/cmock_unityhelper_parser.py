@@ -6,35 +6,38 @@
 # =========================================================================
 
 import re
+from cmock_stats import measure
 
 class CMockUnityHelperParser:
-    def __init__(self, config):
+    def __init__(self, config, stats=None):
         self.config = config
+        self.stats = stats
         self.fallback = 'UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY' if ':array' in self.config.options[':plugins'] else 'UNITY_TEST_ASSERT_EQUAL_MEMORY'
         self.c_types = self.map_c_types()
         self.c_types.update(self.import_source())
 
     def get_helper(self, ctype):
-        lookup = re.sub(r'(?:^|(\S?)(\s*)|(\W))const(?:$|(\s*)(\S)|(\W))', r'\1\3\5\6', ctype).strip().replace(' ', '_')
-        if lookup in self.c_types:
-            return [self.c_types[lookup], '']
-
-        if lookup.endswith('*'):
-            lookup = lookup.rstrip('*')
-            if lookup in self.c_types:
-                return [self.c_types[lookup], '*']
-        else:
-            lookup += '*'
+        with measure(self.stats, 'unity_helper.get_helper'):
+            lookup = re.sub(r'(?:^|(\S?)(\s*)|(\W))const(?:$|(\s*)(\S)|(\W))', r'\1\3\5\6', ctype).strip().replace(' ', '_')
             if lookup in self.c_types:
-                return [self.c_types[lookup], '&']
+                return [self.c_types[lookup], '']
+
+            if lookup.endswith('*'):
+                lookup = lookup.rstrip('*')
+                if lookup in self.c_types:
+                    return [self.c_types[lookup], '*']
+            else:
+                lookup += '*'
+                if lookup in self.c_types:
+                    return [self.c_types[lookup], '&']
 
-        if re.search(r'cmock_\w+_ptr\d+', ctype):
-            return ['UNITY_TEST_ASSERT_EQUAL_PTR', '']
+            if re.search(r'cmock_\w+_ptr\d+', ctype):
+                return ['UNITY_TEST_ASSERT_EQUAL_PTR', '']
         
-        if not self.config.options[':memcmp_if_unknown']:
-            raise Exception(f"Don't know how to test {ctype} and memory tests are disabled!")
+            if not self.config.options[':memcmp_if_unknown']:
+                raise Exception(f"Don't know how to test {ctype} and memory tests are disabled!")
 
-        return [self.fallback, '&'] if lookup.endswith('*') else [self.fallback, '']
+            return [self.fallback, '&'] if lookup.endswith('*') else [self.fallback, '']
 
     def map_c_types(self):
         c_types = {}
@@ -0,0 +1,43 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#   
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import glob
+import re
+
+class CMockUsageScanner:
+    IDENTIFIER = re.compile(r'\b[A-Za-z_]\w*\b')
+
+    def __init__(self, config):
+        self.config = config
+        self.sources = self.expand_sources(self.config.options[':usage_sources'] or [])
+        self.used_prefixes = self.scan()
+
+    def expand_sources(self, patterns):
+        sources = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"ERROR: :usage_sources entry '{pattern}' doesn't match any file")
+            sources.extend(match for match in matches if match not in sources)
+        return sources
+
+    def scan(self):
+        # the generated API always looks like func_Expect, func_IgnoreArg_x, CMOCK_func_CALLBACK and so on,
+        # so every identifier which has an underscore followed by a capital names a candidate function
+        prefixes = set()
+        for source in self.sources:
+            with open(source, 'r', errors='replace') as file:
+                identifiers = set(self.IDENTIFIER.findall(file.read()))
+            for identifier in identifiers:
+                if identifier.startswith('CMOCK_'):
+                    identifier = identifier[6:]
+                for match in re.finditer(r'_(?=[A-Z])', identifier):
+                    prefixes.add(identifier[:match.start()])
+        return prefixes
+
+    def is_used(self, function):
+        return function['name'] in self.used_prefixes
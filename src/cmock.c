@@ -11,7 +11,12 @@
     [Released under MIT License. Please refer to license.txt for details]
 ========================================== */
 
+#include <string.h>
 #include "cmock.h"
+#ifdef CMOCK_RECORD
+#include <stdio.h>
+#include <stdlib.h>
+#endif
 
 /* public constants to be used by mocks */
 const char* CMockStringOutOfMemory = "CMock has run out of memory. Please allocate more.";
@@ -25,52 +30,92 @@ const char* CMockStringPtrPreExp   = "ReturnThruPtr called before Expect.";
 const char* CMockStringPtrIsNULL   = "Pointer is NULL.";
 const char* CMockStringExpNULL     = "Expected NULL.";
 const char* CMockStringMismatch    = "Function called with unexpected argument value.";
+const char* CMockStringNoMatch     = "Called with arguments matching no expectation.";
 
 /* private variables */
 #ifdef CMOCK_MEM_DYNAMIC
-static unsigned char*         CMock_Guts_Buffer = NULL;
-static CMOCK_MEM_INDEX_TYPE   CMock_Guts_BufferSize = CMOCK_MEM_ALIGN_SIZE;
-static CMOCK_MEM_INDEX_TYPE   CMock_Guts_FreePtr = CMOCK_MEM_ALIGN_SIZE;
+static CMOCK_THREAD_STORAGE unsigned char*         CMock_Guts_Buffer = NULL;
+static CMOCK_THREAD_STORAGE CMOCK_MEM_INDEX_TYPE   CMock_Guts_BufferSize = CMOCK_MEM_ALIGN_SIZE;
+static CMOCK_THREAD_STORAGE CMOCK_MEM_INDEX_TYPE   CMock_Guts_FreePtr = CMOCK_MEM_ALIGN_SIZE;
+#else
+static CMOCK_THREAD_STORAGE long long              CMock_Guts_Space[(CMOCK_MEM_SIZE + CMOCK_MEM_ALIGN_SIZE + sizeof(long long) - 1) / sizeof(long long)];
+#ifdef CMOCK_THREAD_LOCAL
+/* the address of a thread-local array isn't a constant, so it can't initialize another thread-local */
+#define CMock_Guts_Buffer ((unsigned char *)CMock_Guts_Space)
 #else
-static long long              CMock_Guts_Space[(CMOCK_MEM_SIZE + CMOCK_MEM_ALIGN_SIZE + sizeof(long long) - 1) / sizeof(long long)];
 static unsigned char*         CMock_Guts_Buffer = (unsigned char *)CMock_Guts_Space;
-static CMOCK_MEM_INDEX_TYPE   CMock_Guts_BufferSize = CMOCK_MEM_SIZE + CMOCK_MEM_ALIGN_SIZE;//sizeof(CMock_Guts_Space);
-static CMOCK_MEM_INDEX_TYPE   CMock_Guts_FreePtr = CMOCK_MEM_ALIGN_SIZE;
+#endif
+static CMOCK_THREAD_STORAGE CMOCK_MEM_INDEX_TYPE   CMock_Guts_BufferSize = CMOCK_MEM_SIZE + CMOCK_MEM_ALIGN_SIZE;//sizeof(CMock_Guts_Space);
+static CMOCK_THREAD_STORAGE CMOCK_MEM_INDEX_TYPE   CMock_Guts_FreePtr = CMOCK_MEM_ALIGN_SIZE;
+#endif
+static CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY*  CMock_Registry_Head = NULL;
+static CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY*  CMock_Registry_Tail = NULL;
+#ifdef CMOCK_OWN_ORDERING
+CMOCK_THREAD_STORAGE int                       CMock_GlobalExpectCount = 0;
+CMOCK_THREAD_STORAGE int                       CMock_GlobalVerifyOrder = 0;
+#endif
+#ifdef CMOCK_RECORD
+static CMOCK_THREAD_STORAGE FILE*                  CMock_Record_File = NULL;
+static CMOCK_THREAD_STORAGE unsigned char*         CMock_Replay_Buffer = NULL;
+static CMOCK_THREAD_STORAGE CMOCK_MEM_INDEX_TYPE   CMock_Replay_Size = 0;
+static CMOCK_THREAD_STORAGE int                    CMock_Replay_Base = -1;
 #endif
 
 /*-------------------------------------------------------
- * CMock_Guts_MemNew
+ * CMock_Guts_MemBlockSize
  *-------------------------------------------------------*/
-CMOCK_MEM_INDEX_TYPE CMock_Guts_MemNew(CMOCK_MEM_INDEX_TYPE size)
+static CMOCK_MEM_INDEX_TYPE CMock_Guts_MemBlockSize(CMOCK_MEM_INDEX_TYPE size)
 {
-  CMOCK_MEM_INDEX_TYPE index;
-
-  /* verify arguments valid (we must be allocating space for at least 1 byte, and the existing chain must be in memory somewhere) */
-  if (size < 1)
-  {
-    return CMOCK_GUTS_NONE;
-  }
-
-  /* verify we have enough room */
+  /* every block carries the index of the next block in its chain, and is aligned */
   size = size + CMOCK_MEM_INDEX_SIZE;
   if (size & CMOCK_MEM_ALIGN_MASK)
   {
     size = (size + CMOCK_MEM_ALIGN_MASK) & ~CMOCK_MEM_ALIGN_MASK;
   }
+  return size;
+}
+
+/*-------------------------------------------------------
+ * CMock_Guts_MemReserve
+ *-------------------------------------------------------*/
+static int CMock_Guts_MemReserve(CMOCK_MEM_INDEX_TYPE size)
+{
   if ((CMock_Guts_BufferSize - CMock_Guts_FreePtr) < size)
   {
 #ifndef CMOCK_MEM_DYNAMIC
-    return CMOCK_GUTS_NONE; /* nothing we can do; our static buffer is out of memory */
+    return 0; /* nothing we can do; our static buffer is out of memory */
 #else
     /* our dynamic buffer does not have enough room; request more via realloc() */
     CMOCK_MEM_INDEX_TYPE new_buffersize = CMock_Guts_BufferSize + CMOCK_MEM_SIZE + size;
     unsigned char* new_buffer = realloc(CMock_Guts_Buffer, (size_t)new_buffersize);
     if (new_buffer == NULL)
-      return CMOCK_GUTS_NONE; /* realloc() failed; out of memory */
+      return 0; /* realloc() failed; out of memory */
     CMock_Guts_Buffer = new_buffer;
     CMock_Guts_BufferSize = new_buffersize;
 #endif
   }
+  return 1;
+}
+
+/*-------------------------------------------------------
+ * CMock_Guts_MemNew
+ *-------------------------------------------------------*/
+CMOCK_MEM_INDEX_TYPE CMock_Guts_MemNew(CMOCK_MEM_INDEX_TYPE size)
+{
+  CMOCK_MEM_INDEX_TYPE index;
+
+  /* verify arguments valid (we must be allocating space for at least 1 byte, and the existing chain must be in memory somewhere) */
+  if (size < 1)
+  {
+    return CMOCK_GUTS_NONE;
+  }
+
+  /* verify we have enough room */
+  size = CMock_Guts_MemBlockSize(size);
+  if (!CMock_Guts_MemReserve(size))
+  {
+    return CMOCK_GUTS_NONE;
+  }
 
   /* determine where we're putting this new block, and init its pointer to be the end of the line */
   index = CMock_Guts_FreePtr + CMOCK_MEM_INDEX_SIZE;
@@ -80,6 +125,45 @@ CMOCK_MEM_INDEX_TYPE CMock_Guts_MemNew(CMOCK_MEM_INDEX_TYPE size)
   return index;
 }
 
+/*-------------------------------------------------------
+ * CMock_Guts_MemNewChain
+ *-------------------------------------------------------*/
+CMOCK_MEM_INDEX_TYPE CMock_Guts_MemNewChain(CMOCK_MEM_INDEX_TYPE size, CMOCK_MEM_INDEX_TYPE count)
+{
+  CMOCK_MEM_INDEX_TYPE index;
+  CMOCK_MEM_INDEX_TYPE total;
+  CMOCK_MEM_INDEX_TYPE i;
+
+  /* verify arguments valid (we must be allocating at least one block of at least 1 byte) */
+  if ((size < 1) || (count < 1))
+  {
+    return CMOCK_GUTS_NONE;
+  }
+
+  /* verify we have enough room for all blocks in one contiguous piece */
+  size = CMock_Guts_MemBlockSize(size);
+  total = size * count;
+  if ((total / count) != size)
+  {
+    return CMOCK_GUTS_NONE;
+  }
+  if (!CMock_Guts_MemReserve(total))
+  {
+    return CMOCK_GUTS_NONE;
+  }
+
+  /* clear all blocks at once, then link each block to the one following it (the last one ends the chain) */
+  index = CMock_Guts_FreePtr + CMOCK_MEM_INDEX_SIZE;
+  memset(&CMock_Guts_Buffer[CMock_Guts_FreePtr], 0, (size_t)total);
+  for (i = 1; i < count; i++)
+  {
+    *(CMOCK_MEM_INDEX_TYPE*)(&CMock_Guts_Buffer[CMock_Guts_FreePtr + ((i - 1) * size)]) = index + (i * size);
+  }
+  CMock_Guts_FreePtr += total;
+
+  return index;
+}
+
 /*-------------------------------------------------------
  * CMock_Guts_MemChain
  *-------------------------------------------------------*/
@@ -189,6 +273,22 @@ void* CMock_Guts_GetAddressFor(CMOCK_MEM_INDEX_TYPE index)
   }
 }
 
+/*-------------------------------------------------------
+ * CMock_Guts_Hash
+ *-------------------------------------------------------*/
+UNITY_UINT32 CMock_Guts_Hash(UNITY_UINT32 hash, const void* data, CMOCK_MEM_INDEX_TYPE size)
+{
+  const unsigned char* bytes = (const unsigned char*)data;
+
+  /* FNV-1a; cheap and good enough to spread argument values over a handful of buckets */
+  while (size-- > 0)
+  {
+    hash ^= (UNITY_UINT32)(*bytes++);
+    hash *= (UNITY_UINT32)16777619u;
+  }
+  return hash;
+}
+
 /*-------------------------------------------------------
  * CMock_Guts_MemBytesCapacity
  *-------------------------------------------------------*/
@@ -236,3 +336,244 @@ void CMock_Guts_MemFreeFinal(void)
 #endif
 }
 
+
+/*-------------------------------------------------------
+ * CMock_Register
+ *-------------------------------------------------------*/
+void CMock_Register(CMOCK_REGISTRY_ENTRY* entry)
+{
+  if (entry->Active)
+    return;
+
+  entry->Active = 1;
+  entry->Next = NULL;
+  if (CMock_Registry_Tail == NULL)
+    CMock_Registry_Head = entry;
+  else
+    CMock_Registry_Tail->Next = entry;
+  CMock_Registry_Tail = entry;
+}
+
+/*-------------------------------------------------------
+ * CMock_VerifyAll
+ *-------------------------------------------------------*/
+void CMock_VerifyAll(void)
+{
+  CMOCK_REGISTRY_ENTRY* entry;
+
+  for (entry = CMock_Registry_Head; entry != NULL; entry = entry->Next)
+  {
+    entry->Verify();
+  }
+}
+
+/*-------------------------------------------------------
+ * CMock_DestroyAll
+ *-------------------------------------------------------*/
+void CMock_DestroyAll(void)
+{
+  CMOCK_REGISTRY_ENTRY* entry = CMock_Registry_Head;
+  CMOCK_REGISTRY_ENTRY* next;
+
+  /* unhook everything first, so a Destroy which touches its mock again can't corrupt the walk */
+  CMock_Registry_Head = NULL;
+  CMock_Registry_Tail = NULL;
+  while (entry != NULL)
+  {
+    next = entry->Next;
+    entry->Active = 0;
+    entry->Next = NULL;
+    entry->Destroy();
+    entry = next;
+  }
+  CMock_Guts_MemFreeAll();
+}
+
+/*-------------------------------------------------------
+ * CMock_VerifyNumber
+ *-------------------------------------------------------*/
+void CMock_VerifyNumber(const char* func, const char* arg, UNITY_INT expected, UNITY_INT actual, UNITY_DISPLAY_STYLE_T style, UNITY_LINE_TYPE line)
+{
+  UNITY_SET_DETAILS(func, arg);
+  UnityAssertEqualNumber(expected, actual, CMockStringMismatch, line, style);
+}
+
+/*-------------------------------------------------------
+ * CMock_VerifyString
+ *-------------------------------------------------------*/
+void CMock_VerifyString(const char* func, const char* arg, const char* expected, const char* actual, UNITY_LINE_TYPE line)
+{
+  UNITY_SET_DETAILS(func, arg);
+  UNITY_TEST_ASSERT_EQUAL_STRING(expected, actual, line, CMockStringMismatch);
+}
+
+/*-------------------------------------------------------
+ * CMock_VerifyMemory
+ *-------------------------------------------------------*/
+void CMock_VerifyMemory(const char* func, const char* arg, const void* expected, const void* actual, CMOCK_MEM_INDEX_TYPE size, int depth, int smart, UNITY_LINE_TYPE line)
+{
+  UNITY_SET_DETAILS(func, arg);
+  if (expected == NULL)
+    { UNITY_TEST_ASSERT_NULL(actual, line, CMockStringExpNULL); }
+  else if (smart && (depth == 0))
+    { UNITY_TEST_ASSERT_EQUAL_PTR(expected, actual, line, CMockStringMismatch); }
+  else
+    { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY(expected, actual, size, depth, line, CMockStringMismatch); }
+}
+
+/*-------------------------------------------------------
+ * CMock_VerifyIntArray
+ *-------------------------------------------------------*/
+void CMock_VerifyIntArray(const char* func, const char* arg, const void* expected, const void* actual, int depth, int smart, UNITY_DISPLAY_STYLE_T style, UNITY_LINE_TYPE line)
+{
+  UNITY_SET_DETAILS(func, arg);
+  if (expected == NULL)
+    { UNITY_TEST_ASSERT_NULL(actual, line, CMockStringExpNULL); }
+  else if (smart && (depth == 0))
+    { UNITY_TEST_ASSERT_EQUAL_PTR(expected, actual, line, CMockStringMismatch); }
+  else
+    { UnityAssertEqualIntArray(expected, actual, (UNITY_UINT32)depth, CMockStringMismatch, line, style, UNITY_ARRAY_TO_ARRAY); }
+}
+
+/*-------------------------------------------------------
+ * CMock_Instrument_Print
+ *-------------------------------------------------------*/
+void CMock_Instrument_Print(const char* name, const CMOCK_INSTRUMENT_STATS* stats)
+{
+  UnityPrint(name);
+  UnityPrint(": calls=");
+  UnityPrintNumberUnsigned((UNITY_UINT)stats->Calls);
+  UnityPrint(" verify=");
+  UnityPrintNumberUnsigned((UNITY_UINT)stats->VerifyTime);
+  UnityPrint(" callback=");
+  UnityPrintNumberUnsigned((UNITY_UINT)stats->CallbackTime);
+  UNITY_PRINT_EOL();
+}
+
+#ifdef CMOCK_RECORD
+/*-------------------------------------------------------
+ * CMock_Record_Open
+ *-------------------------------------------------------*/
+int CMock_Record_Open(const char* path)
+{
+  CMock_Record_Close();
+  CMock_Record_File = fopen(path, "wb");
+  return (CMock_Record_File != NULL);
+}
+
+/*-------------------------------------------------------
+ * CMock_Record_Write
+ *-------------------------------------------------------*/
+void CMock_Record_Write(UNITY_UINT32 id, const void* data, CMOCK_MEM_INDEX_TYPE size)
+{
+  UNITY_UINT32 header[2];
+
+  if (CMock_Record_File == NULL)
+  {
+    return;
+  }
+
+  /* each record is the id of the function, the size of its payload, then the payload itself */
+  header[0] = id;
+  header[1] = (UNITY_UINT32)size;
+  fwrite(header, sizeof(header), 1, CMock_Record_File);
+  if (size > 0)
+  {
+    fwrite(data, (size_t)size, 1, CMock_Record_File);
+  }
+}
+
+/*-------------------------------------------------------
+ * CMock_Record_Close
+ *-------------------------------------------------------*/
+void CMock_Record_Close(void)
+{
+  if (CMock_Record_File != NULL)
+  {
+    fclose(CMock_Record_File);
+    CMock_Record_File = NULL;
+  }
+}
+
+/*-------------------------------------------------------
+ * CMock_Replay_Load
+ *-------------------------------------------------------*/
+int CMock_Replay_Load(const char* path)
+{
+  FILE* file;
+  long size;
+
+  CMock_Replay_Unload();
+  file = fopen(path, "rb");
+  if (file == NULL)
+  {
+    return 0;
+  }
+
+  /* the whole trace is read in one go, so every mock walks the same buffer */
+  if ((fseek(file, 0, SEEK_END) == 0) && ((size = ftell(file)) > 0) && (fseek(file, 0, SEEK_SET) == 0))
+  {
+    CMock_Replay_Buffer = (unsigned char*)malloc((size_t)size);
+    if ((CMock_Replay_Buffer != NULL) && (fread(CMock_Replay_Buffer, (size_t)size, 1, file) == 1))
+    {
+      CMock_Replay_Size = (CMOCK_MEM_INDEX_TYPE)size;
+    }
+    else
+    {
+      CMock_Replay_Unload();
+    }
+  }
+  fclose(file);
+  return (CMock_Replay_Buffer != NULL);
+}
+
+/*-------------------------------------------------------
+ * CMock_Replay_Origin
+ *-------------------------------------------------------*/
+int CMock_Replay_Origin(int expect_count)
+{
+  /* the first mock to replay a trace fixes where its call order starts, and the others follow it */
+  if (CMock_Replay_Base < 0)
+  {
+    CMock_Replay_Base = expect_count;
+  }
+  return CMock_Replay_Base;
+}
+
+/*-------------------------------------------------------
+ * CMock_Replay_Next
+ *-------------------------------------------------------*/
+const void* CMock_Replay_Next(CMOCK_MEM_INDEX_TYPE* cursor, UNITY_UINT32* id, CMOCK_MEM_INDEX_TYPE* size)
+{
+  UNITY_UINT32 header[2];
+  CMOCK_MEM_INDEX_TYPE payload;
+
+  if ((CMock_Replay_Buffer == NULL) || (*cursor > CMock_Replay_Size) || ((size_t)(CMock_Replay_Size - *cursor) < sizeof(header)))
+  {
+    return NULL;
+  }
+  memcpy(header, &CMock_Replay_Buffer[*cursor], sizeof(header));
+  payload = *cursor + sizeof(header);
+
+  /* a truncated record ends the trace */
+  if ((CMOCK_MEM_INDEX_TYPE)header[1] > (CMock_Replay_Size - payload))
+  {
+    return NULL;
+  }
+  *id = header[0];
+  *size = (CMOCK_MEM_INDEX_TYPE)header[1];
+  *cursor = payload + *size;
+  return &CMock_Replay_Buffer[payload];
+}
+
+/*-------------------------------------------------------
+ * CMock_Replay_Unload
+ *-------------------------------------------------------*/
+void CMock_Replay_Unload(void)
+{
+  free(CMock_Replay_Buffer);
+  CMock_Replay_Buffer = NULL;
+  CMock_Replay_Size = 0;
+  CMock_Replay_Base = -1;
+}
+#endif
@@ -39,16 +39,66 @@
  * Memory API
  *-------------------------------------------------------*/
 CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemNew(CMOCK_MEM_INDEX_TYPE size);
+CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemNewChain(CMOCK_MEM_INDEX_TYPE size, CMOCK_MEM_INDEX_TYPE count);
 CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemChain(CMOCK_MEM_INDEX_TYPE root_index, CMOCK_MEM_INDEX_TYPE obj_index);
 CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemNext(CMOCK_MEM_INDEX_TYPE previous_item_index) CMOCK_FUNCTION_ATTR(pure);
 CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemEndOfChain(CMOCK_MEM_INDEX_TYPE root_index) CMOCK_FUNCTION_ATTR(pure);
 
 void*                 CMock_Guts_GetAddressFor(CMOCK_MEM_INDEX_TYPE index) CMOCK_FUNCTION_ATTR(pure);
 
+UNITY_UINT32          CMock_Guts_Hash(UNITY_UINT32 hash, const void* data, CMOCK_MEM_INDEX_TYPE size) CMOCK_FUNCTION_ATTR(pure);
+
 CMOCK_MEM_INDEX_TYPE CMock_Guts_MemBytesCapacity(void) CMOCK_FUNCTION_ATTR(const);
 CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemBytesFree(void) CMOCK_FUNCTION_ATTR(pure);
 CMOCK_MEM_INDEX_TYPE  CMock_Guts_MemBytesUsed(void) CMOCK_FUNCTION_ATTR(pure);
 void                  CMock_Guts_MemFreeAll(void);
 void                  CMock_Guts_MemFreeFinal(void);
 
+/*-------------------------------------------------------
+ * Verification API
+ *-------------------------------------------------------*/
+void                  CMock_VerifyNumber(const char* func, const char* arg, UNITY_INT expected, UNITY_INT actual, UNITY_DISPLAY_STYLE_T style, UNITY_LINE_TYPE line);
+void                  CMock_VerifyString(const char* func, const char* arg, const char* expected, const char* actual, UNITY_LINE_TYPE line);
+void                  CMock_VerifyMemory(const char* func, const char* arg, const void* expected, const void* actual, CMOCK_MEM_INDEX_TYPE size, int depth, int smart, UNITY_LINE_TYPE line);
+void                  CMock_VerifyIntArray(const char* func, const char* arg, const void* expected, const void* actual, int depth, int smart, UNITY_DISPLAY_STYLE_T style, UNITY_LINE_TYPE line);
+
+/*-------------------------------------------------------
+ * Instrumentation API
+ *-------------------------------------------------------*/
+typedef struct _CMOCK_INSTRUMENT_STATS
+{
+  unsigned long Calls;
+  CMOCK_INSTRUMENT_TIME_TYPE VerifyTime;
+  CMOCK_INSTRUMENT_TIME_TYPE CallbackTime;
+  CMOCK_INSTRUMENT_TIME_TYPE Start;
+} CMOCK_INSTRUMENT_STATS;
+
+void                  CMock_Instrument_Print(const char* name, const CMOCK_INSTRUMENT_STATS* stats);
+
+/*-------------------------------------------------------
+ * Record API (only available when built with CMOCK_RECORD)
+ *-------------------------------------------------------*/
+int                   CMock_Record_Open(const char* path);
+void                  CMock_Record_Write(UNITY_UINT32 id, const void* data, CMOCK_MEM_INDEX_TYPE size);
+void                  CMock_Record_Close(void);
+int                   CMock_Replay_Load(const char* path);
+int                   CMock_Replay_Origin(int expect_count);
+const void*           CMock_Replay_Next(CMOCK_MEM_INDEX_TYPE* cursor, UNITY_UINT32* id, CMOCK_MEM_INDEX_TYPE* size);
+void                  CMock_Replay_Unload(void);
+
+/*-------------------------------------------------------
+ * Registry API
+ *-------------------------------------------------------*/
+typedef struct _CMOCK_REGISTRY_ENTRY
+{
+  void (*Verify)(void);
+  void (*Destroy)(void);
+  struct _CMOCK_REGISTRY_ENTRY* Next;
+  char Active;
+} CMOCK_REGISTRY_ENTRY;
+
+void                  CMock_Register(CMOCK_REGISTRY_ENTRY* entry);
+void                  CMock_VerifyAll(void);
+void                  CMock_DestroyAll(void);
+
 #endif /* end of CMOCK_FRAMEWORK_H */
@@ -28,6 +28,7 @@ extern const char* CMockStringPtrPreExp;
 extern const char* CMockStringPtrIsNULL;
 extern const char* CMockStringExpNULL;
 extern const char* CMockStringMismatch;
+extern const char* CMockStringNoMatch;
 
 /* define CMOCK_MEM_DYNAMIC to grab memory as needed with malloc
  * when you do that, CMOCK_MEM_SIZE is used for incremental size instead of total */
@@ -89,6 +90,65 @@ extern const char* CMockStringMismatch;
 #define CMOCK_MEM_SIZE (32768)
 #endif
 
+/* define CMOCK_THREAD_LOCAL to give every thread its own CMock memory and mock state,
+ * so tests can run in parallel threads of one process */
+#ifndef CMOCK_THREAD_STORAGE
+  #ifdef CMOCK_THREAD_LOCAL
+    #if defined(__STDC_VERSION__) && (__STDC_VERSION__ >= 201112L) && !defined(__STDC_NO_THREADS__)
+      #define CMOCK_THREAD_STORAGE _Thread_local
+    #elif defined(__cplusplus) && (__cplusplus >= 201103L)
+      #define CMOCK_THREAD_STORAGE thread_local
+    #elif defined(_MSC_VER)
+      #define CMOCK_THREAD_STORAGE __declspec(thread)
+    #else
+      #define CMOCK_THREAD_STORAGE __thread
+    #endif
+  #else
+    #define CMOCK_THREAD_STORAGE
+  #endif
+#endif
+
+/* the strict ordering counters follow the rest of the mock state. Unity's runner defines
+ * plain ones, so thread-local mocks count in their own from cmock.c instead. Define this
+ * to the storage class of the runner's counters to have the mocks use those after all */
+#ifndef CMOCK_ORDERING_STORAGE
+#define CMOCK_ORDERING_STORAGE CMOCK_THREAD_STORAGE
+#ifdef CMOCK_THREAD_LOCAL
+#define CMOCK_OWN_ORDERING
+#endif
+#endif
+
+/* number of hash buckets each function gets for its unordered expectations */
+#ifndef CMOCK_UNORDERED_BUCKETS
+#define CMOCK_UNORDERED_BUCKETS (32)
+#endif
+
+/* type used for array depths in call instances when :compact_instances is enabled */
+#ifndef CMOCK_COMPACT_DEPTH_TYPE
+#define CMOCK_COMPACT_DEPTH_TYPE unsigned short
+#endif
+
+/* hooks used by the instrument plugin. Override CMOCK_INSTRUMENT_CLOCK with something
+ * that counts time or cycles on your target, or the ENTER/EXIT hooks to trace calls */
+#ifndef CMOCK_INSTRUMENT_TIME_TYPE
+#define CMOCK_INSTRUMENT_TIME_TYPE unsigned long
+#endif
+
+#ifndef CMOCK_INSTRUMENT_CLOCK
+#define CMOCK_INSTRUMENT_CLOCK() ((CMOCK_INSTRUMENT_TIME_TYPE)0)
+#endif
+
+#ifndef CMOCK_INSTRUMENT_ENTER
+#define CMOCK_INSTRUMENT_ENTER(name, stats) ((stats).Start = CMOCK_INSTRUMENT_CLOCK())
+#endif
+
+#ifndef CMOCK_INSTRUMENT_EXIT
+#define CMOCK_INSTRUMENT_EXIT(name, stats, total) ((stats).total += CMOCK_INSTRUMENT_CLOCK() - (stats).Start)
+#endif
+
+/* starting value for hashing expected argument values */
+#define CMOCK_HASH_SEED ((UNITY_UINT32)2166136261u)
+
 /* automatically calculated defs for easier reading */
 #define CMOCK_MEM_ALIGN_SIZE  (CMOCK_MEM_INDEX_TYPE)(1u << CMOCK_MEM_ALIGN)
 #define CMOCK_MEM_ALIGN_MASK  (CMOCK_MEM_INDEX_TYPE)(CMOCK_MEM_ALIGN_SIZE - 1)
@@ -13,8 +13,22 @@
 
 #include "unity.h"
 #include "cmock.h"
+#include <string.h>
+#ifdef CMOCK_RECORD
+#include <stdio.h>
+#endif
 
 #define TEST_MEM_INDEX_SIZE  (sizeof(CMOCK_MEM_INDEX_TYPE))
+#define TEST_TRACE_PATH      "./system/build/TestCMockC.trace"
+
+//the failure has to be the last thing a test does, since later failures would land back in TEST_PROTECT
+#define EXPECT_ABORT_BEGIN \
+  if (TEST_PROTECT())      \
+  {
+
+#define VERIFY_FAILS_END \
+  }                      \
+  Unity.CurrentTestFailed = (Unity.CurrentTestFailed != 0) ? 0 : 1;
 
 void setUp(void)
 {
@@ -338,3 +352,355 @@ void test_MemEndOfChain(void)
   TEST_ASSERT_EQUAL(0, CMock_Guts_MemBytesUsed());
   TEST_ASSERT_EQUAL(CMOCK_MEM_SIZE, CMock_Guts_MemBytesFree());
 }
+
+void test_MemNewChainWillReturnNoneIfGivenIllegalSizes(void)
+{
+  TEST_ASSERT_EQUAL_HEX( CMOCK_GUTS_NONE, CMock_Guts_MemNewChain(0, 3) );
+  TEST_ASSERT_EQUAL_HEX( CMOCK_GUTS_NONE, CMock_Guts_MemNewChain(sizeof(unsigned int), 0) );
+
+  //verify we're cleared still
+  TEST_ASSERT_EQUAL(0, CMock_Guts_MemBytesUsed());
+  TEST_ASSERT_EQUAL(CMOCK_MEM_SIZE, CMock_Guts_MemBytesFree());
+}
+
+void test_MemNewChainWillLinkEveryBlockInOrder(void)
+{
+  unsigned int  i;
+  CMOCK_MEM_INDEX_TYPE next;
+  CMOCK_MEM_INDEX_TYPE first = CMock_Guts_MemNewChain(sizeof(unsigned int), 4);
+  TEST_ASSERT_MESSAGE(first != CMOCK_GUTS_NONE, "Should Not Have Returned CMOCK_GUTS_NONE");
+
+  //verify we're using the same amount of memory as four separate blocks
+  TEST_ASSERT_EQUAL(4 * (TEST_MEM_INDEX_SIZE + sizeof(unsigned int)), CMock_Guts_MemBytesUsed());
+  TEST_ASSERT_EQUAL(CMOCK_MEM_SIZE - 4 * (TEST_MEM_INDEX_SIZE + sizeof(unsigned int)), CMock_Guts_MemBytesFree());
+
+  //verify every block is cleared and can be written
+  next = first;
+  for (i = 0; i < 4; i++)
+  {
+    TEST_ASSERT_MESSAGE(next != CMOCK_GUTS_NONE, "Should Not Have Returned CMOCK_GUTS_NONE");
+    TEST_ASSERT_EQUAL(0, *((unsigned int*)CMock_Guts_GetAddressFor(next)));
+    *((unsigned int*)CMock_Guts_GetAddressFor(next)) = i;
+    next = CMock_Guts_MemNext(next);
+  }
+  TEST_ASSERT_EQUAL_HEX(CMOCK_GUTS_NONE, next);
+
+  //verify the data survived the walk
+  next = first;
+  for (i = 0; i < 4; i++)
+  {
+    TEST_ASSERT_EQUAL(i, *((unsigned int*)CMock_Guts_GetAddressFor(next)));
+    next = CMock_Guts_MemNext(next);
+  }
+}
+
+void test_MemNewChainCanBeChainedOntoAnExistingChain(void)
+{
+  CMOCK_MEM_INDEX_TYPE root = CMock_Guts_MemNew(sizeof(unsigned int));
+  CMOCK_MEM_INDEX_TYPE chain = CMock_Guts_MemNewChain(sizeof(unsigned int), 2);
+  TEST_ASSERT_MESSAGE(chain != CMOCK_GUTS_NONE, "Should Not Have Returned CMOCK_GUTS_NONE");
+
+  TEST_ASSERT_EQUAL(root, CMock_Guts_MemChain(root, chain));
+  TEST_ASSERT_EQUAL(chain, CMock_Guts_MemNext(root));
+  TEST_ASSERT_EQUAL(CMock_Guts_MemNext(chain), CMock_Guts_MemEndOfChain(root));
+  TEST_ASSERT_EQUAL_HEX(CMOCK_GUTS_NONE, CMock_Guts_MemNext(CMock_Guts_MemNext(chain)));
+}
+
+void test_MemNewChainWillReturnNoneIfTheWholeChainDoesNotFit(void)
+{
+  CMOCK_MEM_INDEX_TYPE blocks = CMOCK_MEM_SIZE / (TEST_MEM_INDEX_SIZE + sizeof(unsigned int));
+
+  //one block too many fails as a whole, without claiming anything
+  TEST_ASSERT_EQUAL_HEX(CMOCK_GUTS_NONE, CMock_Guts_MemNewChain(sizeof(unsigned int), blocks + 1));
+  TEST_ASSERT_EQUAL(0, CMock_Guts_MemBytesUsed());
+
+  //but exactly enough blocks use up all the memory
+  TEST_ASSERT_MESSAGE(CMock_Guts_MemNewChain(sizeof(unsigned int), blocks) != CMOCK_GUTS_NONE, "Should Not Have Returned CMOCK_GUTS_NONE");
+  TEST_ASSERT_EQUAL(blocks * (TEST_MEM_INDEX_SIZE + sizeof(unsigned int)), CMock_Guts_MemBytesUsed());
+  TEST_ASSERT_EQUAL_HEX(CMOCK_GUTS_NONE, CMock_Guts_MemNewChain(1, 1));
+}
+
+void test_HashOfNothingIsTheSeed(void)
+{
+  TEST_ASSERT_EQUAL_HEX32(0x811C9DC5u, CMock_Guts_Hash(0x811C9DC5u, NULL, 0));
+  TEST_ASSERT_EQUAL_HEX32(0x12345678u, CMock_Guts_Hash(0x12345678u, "ignored", 0));
+}
+
+void test_HashIsFnv1a(void)
+{
+  TEST_ASSERT_EQUAL_HEX32(0xE40C292Cu, CMock_Guts_Hash(0x811C9DC5u, "a", 1));
+  TEST_ASSERT_EQUAL_HEX32(0xBF9CF968u, CMock_Guts_Hash(0x811C9DC5u, "foobar", 6));
+}
+
+void test_HashCanBeChainedOverSeveralArguments(void)
+{
+  int first = 1;
+  int second = 2;
+  UNITY_UINT32 hash = CMock_Guts_Hash(0x811C9DC5u, &first, sizeof(first));
+
+  TEST_ASSERT_EQUAL_HEX32(CMock_Guts_Hash(0x811C9DC5u, "foobar", 6), CMock_Guts_Hash(CMock_Guts_Hash(0x811C9DC5u, "foo", 3), "bar", 3));
+  TEST_ASSERT_NOT_EQUAL(CMock_Guts_Hash(hash, &second, sizeof(second)), CMock_Guts_Hash(CMock_Guts_Hash(0x811C9DC5u, &second, sizeof(second)), &first, sizeof(first)));
+}
+
+static char RegistryLog[16];
+static int  RegistryLogLength;
+static int  RegistryFailVerify;
+static CMOCK_REGISTRY_ENTRY EntryA;
+static CMOCK_REGISTRY_ENTRY EntryB;
+
+static void Log(char c)
+{
+  if (RegistryLogLength < (int)(sizeof(RegistryLog) - 1))
+    RegistryLog[RegistryLogLength++] = c;
+}
+
+static void VerifyA(void)  { Log('A'); }
+static void DestroyA(void) { Log('a'); }
+static void VerifyB(void)  { Log('B'); TEST_ASSERT_EQUAL_MESSAGE(0, RegistryFailVerify, "Mock B was left with expectations"); }
+static void DestroyB(void) { Log('b'); CMock_Register(&EntryB); }
+
+static void ResetRegistry(void)
+{
+  CMOCK_REGISTRY_ENTRY a = { VerifyA, DestroyA, NULL, 0 };
+  CMOCK_REGISTRY_ENTRY b = { VerifyB, DestroyB, NULL, 0 };
+
+  EntryA = a;
+  EntryB = b;
+  memset(RegistryLog, 0, sizeof(RegistryLog));
+  RegistryLogLength = 0;
+  RegistryFailVerify = 0;
+}
+
+void test_VerifyAllAndDestroyAllDoNothingWithoutActiveMocks(void)
+{
+  ResetRegistry();
+  CMock_DestroyAll();
+  CMock_VerifyAll();
+  CMock_DestroyAll();
+  TEST_ASSERT_EQUAL_STRING("", RegistryLog);
+}
+
+void test_RegisterKeepsEachMockOnceInTheOrderTheyWereUsed(void)
+{
+  ResetRegistry();
+  CMock_Register(&EntryA);
+  CMock_Register(&EntryB);
+  CMock_Register(&EntryA);
+  CMock_VerifyAll();
+  TEST_ASSERT_EQUAL_STRING("AB", RegistryLog);
+
+  //destroying unhooks every mock before B registers itself again from its Destroy
+  EntryB.Destroy = DestroyA;
+  CMock_DestroyAll();
+  TEST_ASSERT_EQUAL_STRING("ABaa", RegistryLog);
+  CMock_VerifyAll();
+  TEST_ASSERT_EQUAL_STRING("ABaa", RegistryLog);
+  TEST_ASSERT_EQUAL(0, EntryA.Active);
+  TEST_ASSERT_EQUAL(0, EntryB.Active);
+}
+
+void test_DestroyAllLetsAMockRegisterAgainFromItsDestroy(void)
+{
+  ResetRegistry();
+  CMock_Register(&EntryB);
+  CMock_Register(&EntryA);
+  CMock_DestroyAll();
+  TEST_ASSERT_EQUAL_STRING("ba", RegistryLog);
+
+  //only B came back, so only B is verified and destroyed next time
+  CMock_VerifyAll();
+  TEST_ASSERT_EQUAL_STRING("baB", RegistryLog);
+  EntryB.Destroy = DestroyA;
+  CMock_DestroyAll();
+  TEST_ASSERT_EQUAL_STRING("baBa", RegistryLog);
+}
+
+void test_DestroyAllFreesTheMemoryOfCMock(void)
+{
+  ResetRegistry();
+  CMock_Register(&EntryA);
+  TEST_ASSERT_MESSAGE(CMock_Guts_MemNew(8) != CMOCK_GUTS_NONE, "Should Not Have Returned CMOCK_GUTS_NONE");
+  CMock_DestroyAll();
+  TEST_ASSERT_EQUAL(0, CMock_Guts_MemBytesUsed());
+}
+
+void test_VerifyAllFailsWhenAnActiveMockFails(void)
+{
+  ResetRegistry();
+  CMock_Register(&EntryA);
+  CMock_Register(&EntryB);
+  RegistryFailVerify = 1;
+
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyAll();
+  VERIFY_FAILS_END
+}
+
+#ifdef CMOCK_RECORD
+void test_RecordAndReplayIgnoreCallsWithoutATrace(void)
+{
+  CMOCK_MEM_INDEX_TYPE cursor = 0;
+  CMOCK_MEM_INDEX_TYPE size;
+  UNITY_UINT32 id;
+  unsigned int value = 7;
+
+  CMock_Record_Close();
+  CMock_Record_Write(1, &value, sizeof(value));
+  TEST_ASSERT_FALSE(CMock_Replay_Load("./system/build/NoSuchTrace.trace"));
+  TEST_ASSERT_NULL(CMock_Replay_Next(&cursor, &id, &size));
+  CMock_Replay_Unload();
+}
+
+void test_ReplayReadsBackWhatWasRecorded(void)
+{
+  CMOCK_MEM_INDEX_TYPE cursor = 0;
+  CMOCK_MEM_INDEX_TYPE size;
+  UNITY_UINT32 id;
+  unsigned int value = 0x12345678u;
+  const void* data;
+
+  TEST_ASSERT_TRUE(CMock_Record_Open(TEST_TRACE_PATH));
+  CMock_Record_Write(0xAAAAu, &value, sizeof(value));
+  CMock_Record_Write(0xBBBBu, NULL, 0);
+  CMock_Record_Close();
+
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TEST_TRACE_PATH));
+  data = CMock_Replay_Next(&cursor, &id, &size);
+  TEST_ASSERT_NOT_NULL(data);
+  TEST_ASSERT_EQUAL_HEX32(0xAAAAu, id);
+  TEST_ASSERT_EQUAL(sizeof(value), size);
+  TEST_ASSERT_EQUAL_MEMORY(&value, data, sizeof(value));
+  TEST_ASSERT_NOT_NULL(CMock_Replay_Next(&cursor, &id, &size));
+  TEST_ASSERT_EQUAL_HEX32(0xBBBBu, id);
+  TEST_ASSERT_EQUAL(0, size);
+  TEST_ASSERT_NULL(CMock_Replay_Next(&cursor, &id, &size));
+
+  //after unloading there is nothing left to walk
+  CMock_Replay_Unload();
+  cursor = 0;
+  TEST_ASSERT_NULL(CMock_Replay_Next(&cursor, &id, &size));
+}
+
+void test_ReplayRefusesAnEmptyTrace(void)
+{
+  TEST_ASSERT_TRUE(CMock_Record_Open(TEST_TRACE_PATH));
+  CMock_Record_Close();
+  TEST_ASSERT_FALSE(CMock_Replay_Load(TEST_TRACE_PATH));
+  CMock_Replay_Unload();
+}
+
+void test_ReplayStopsAtATruncatedRecord(void)
+{
+  CMOCK_MEM_INDEX_TYPE cursor = 0;
+  CMOCK_MEM_INDEX_TYPE size;
+  UNITY_UINT32 id;
+  UNITY_UINT32 header[2] = {0xCCCCu, 8};
+  unsigned int value = 1;
+  FILE* file = fopen(TEST_TRACE_PATH, "wb");
+  TEST_ASSERT_NOT_NULL(file);
+
+  //the header promises more payload than the file holds
+  fwrite(header, sizeof(header), 1, file);
+  fwrite(&value, sizeof(value), 1, file);
+  fclose(file);
+
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TEST_TRACE_PATH));
+  TEST_ASSERT_NULL(CMock_Replay_Next(&cursor, &id, &size));
+  CMock_Replay_Unload();
+}
+
+void test_ReplayOriginIsFixedByTheFirstMockToAsk(void)
+{
+  unsigned int value = 1;
+
+  TEST_ASSERT_TRUE(CMock_Record_Open(TEST_TRACE_PATH));
+  CMock_Record_Write(1, &value, sizeof(value));
+  CMock_Record_Close();
+
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TEST_TRACE_PATH));
+  TEST_ASSERT_EQUAL(5, CMock_Replay_Origin(5));
+  TEST_ASSERT_EQUAL(5, CMock_Replay_Origin(9));
+
+  //loading a trace again starts over
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TEST_TRACE_PATH));
+  TEST_ASSERT_EQUAL(9, CMock_Replay_Origin(9));
+  CMock_Replay_Unload();
+}
+#endif
+
+void test_VerifyHelpersPassOnMatchingValues(void)
+{
+  short expected[3] = {1, 2, 3};
+  short actual[3] = {1, 2, 3};
+  char text[] = "text";
+
+  CMock_VerifyNumber("func", "arg", 5, 5, UNITY_DISPLAY_STYLE_INT, __LINE__);
+  CMock_VerifyString("func", "arg", "text", text, __LINE__);
+  CMock_VerifyString("func", "arg", NULL, NULL, __LINE__);
+  CMock_VerifyMemory("func", "arg", expected, actual, sizeof(short), 3, 0, __LINE__);
+  CMock_VerifyMemory("func", "arg", NULL, NULL, sizeof(short), 3, 0, __LINE__);
+  CMock_VerifyMemory("func", "arg", expected, expected, sizeof(short), 0, 1, __LINE__);
+  CMock_VerifyIntArray("func", "arg", expected, actual, 3, 0, UNITY_DISPLAY_STYLE_INT16, __LINE__);
+  CMock_VerifyIntArray("func", "arg", NULL, NULL, 3, 1, UNITY_DISPLAY_STYLE_INT16, __LINE__);
+  CMock_VerifyIntArray("func", "arg", expected, expected, 0, 1, UNITY_DISPLAY_STYLE_INT16, __LINE__);
+}
+
+void test_VerifyNumberFailsOnADifferentValue(void)
+{
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyNumber("func", "arg", 5, 6, UNITY_DISPLAY_STYLE_INT, __LINE__);
+  VERIFY_FAILS_END
+}
+
+void test_VerifyStringFailsOnADifferentString(void)
+{
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyString("func", "arg", "text", "test", __LINE__);
+  VERIFY_FAILS_END
+}
+
+void test_VerifyStringFailsOnAMissingString(void)
+{
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyString("func", "arg", "text", NULL, __LINE__);
+  VERIFY_FAILS_END
+}
+
+void test_VerifyMemoryFailsOnADifferenceBeyondTheFirstElement(void)
+{
+  short expected[3] = {1, 2, 3};
+  short actual[3] = {1, 2, 4};
+
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyMemory("func", "arg", expected, actual, sizeof(short), 3, 0, __LINE__);
+  VERIFY_FAILS_END
+}
+
+void test_VerifyMemoryFailsWhenNullWasExpected(void)
+{
+  short actual[3] = {1, 2, 3};
+
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyMemory("func", "arg", NULL, actual, sizeof(short), 3, 0, __LINE__);
+  VERIFY_FAILS_END
+}
+
+void test_VerifyMemoryComparesPointersForSmartDepthZero(void)
+{
+  short expected[3] = {1, 2, 3};
+  short actual[3] = {1, 2, 3};
+
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyMemory("func", "arg", expected, actual, sizeof(short), 0, 1, __LINE__);
+  VERIFY_FAILS_END
+}
+
+void test_VerifyIntArrayFailsOnADifferentElement(void)
+{
+  short expected[3] = {1, 2, 3};
+  short actual[3] = {1, 5, 3};
+
+  EXPECT_ABORT_BEGIN
+  CMock_VerifyIntArray("func", "arg", expected, actual, 3, 0, UNITY_DISPLAY_STYLE_INT16, __LINE__);
+  VERIFY_FAILS_END
+}
@@ -27,6 +27,33 @@ extern void test_MemEndOfChain(void);
 extern void test_ThatCMockStopsReturningMoreDataWhenItRunsOutOfMemory(void);
 extern void test_ThatCMockStopsReturningMoreDataWhenAskForMoreThanItHasLeftEvenIfNotAtExactEnd(void);
 extern void test_ThatWeCanAskForAllSortsOfSizes(void);
+extern void test_MemNewChainWillReturnNoneIfGivenIllegalSizes(void);
+extern void test_MemNewChainWillLinkEveryBlockInOrder(void);
+extern void test_MemNewChainCanBeChainedOntoAnExistingChain(void);
+extern void test_MemNewChainWillReturnNoneIfTheWholeChainDoesNotFit(void);
+extern void test_HashOfNothingIsTheSeed(void);
+extern void test_HashIsFnv1a(void);
+extern void test_HashCanBeChainedOverSeveralArguments(void);
+extern void test_VerifyAllAndDestroyAllDoNothingWithoutActiveMocks(void);
+extern void test_RegisterKeepsEachMockOnceInTheOrderTheyWereUsed(void);
+extern void test_DestroyAllLetsAMockRegisterAgainFromItsDestroy(void);
+extern void test_DestroyAllFreesTheMemoryOfCMock(void);
+extern void test_VerifyAllFailsWhenAnActiveMockFails(void);
+#ifdef CMOCK_RECORD
+extern void test_RecordAndReplayIgnoreCallsWithoutATrace(void);
+extern void test_ReplayReadsBackWhatWasRecorded(void);
+extern void test_ReplayRefusesAnEmptyTrace(void);
+extern void test_ReplayStopsAtATruncatedRecord(void);
+extern void test_ReplayOriginIsFixedByTheFirstMockToAsk(void);
+extern void test_VerifyHelpersPassOnMatchingValues(void);
+extern void test_VerifyNumberFailsOnADifferentValue(void);
+extern void test_VerifyStringFailsOnADifferentString(void);
+extern void test_VerifyStringFailsOnAMissingString(void);
+extern void test_VerifyMemoryFailsOnADifferenceBeyondTheFirstElement(void);
+extern void test_VerifyMemoryFailsWhenNullWasExpected(void);
+extern void test_VerifyMemoryComparesPointersForSmartDepthZero(void);
+extern void test_VerifyIntArrayFailsOnADifferentElement(void);
+#endif
 
 int main(void)
 {
@@ -42,6 +69,33 @@ int main(void)
   RUN_TEST(test_ThatCMockStopsReturningMoreDataWhenItRunsOutOfMemory, 195);
   RUN_TEST(test_ThatCMockStopsReturningMoreDataWhenAskForMoreThanItHasLeftEvenIfNotAtExactEnd, 244);
   RUN_TEST(test_ThatWeCanAskForAllSortsOfSizes, 298);
+  RUN_TEST(test_MemNewChainWillReturnNoneIfGivenIllegalSizes, 356);
+  RUN_TEST(test_MemNewChainWillLinkEveryBlockInOrder, 366);
+  RUN_TEST(test_MemNewChainCanBeChainedOntoAnExistingChain, 397);
+  RUN_TEST(test_MemNewChainWillReturnNoneIfTheWholeChainDoesNotFit, 409);
+  RUN_TEST(test_HashOfNothingIsTheSeed, 423);
+  RUN_TEST(test_HashIsFnv1a, 429);
+  RUN_TEST(test_HashCanBeChainedOverSeveralArguments, 435);
+  RUN_TEST(test_VerifyAllAndDestroyAllDoNothingWithoutActiveMocks, 474);
+  RUN_TEST(test_RegisterKeepsEachMockOnceInTheOrderTheyWereUsed, 483);
+  RUN_TEST(test_DestroyAllLetsAMockRegisterAgainFromItsDestroy, 502);
+  RUN_TEST(test_DestroyAllFreesTheMemoryOfCMock, 518);
+  RUN_TEST(test_VerifyAllFailsWhenAnActiveMockFails, 527);
+#ifdef CMOCK_RECORD
+  RUN_TEST(test_RecordAndReplayIgnoreCallsWithoutATrace, 540);
+  RUN_TEST(test_ReplayReadsBackWhatWasRecorded, 554);
+  RUN_TEST(test_ReplayRefusesAnEmptyTrace, 584);
+  RUN_TEST(test_ReplayStopsAtATruncatedRecord, 592);
+  RUN_TEST(test_ReplayOriginIsFixedByTheFirstMockToAsk, 612);
+  RUN_TEST(test_VerifyHelpersPassOnMatchingValues, 631);
+  RUN_TEST(test_VerifyNumberFailsOnADifferentValue, 648);
+  RUN_TEST(test_VerifyStringFailsOnADifferentString, 655);
+  RUN_TEST(test_VerifyStringFailsOnAMissingString, 662);
+  RUN_TEST(test_VerifyMemoryFailsOnADifferenceBeyondTheFirstElement, 669);
+  RUN_TEST(test_VerifyMemoryFailsWhenNullWasExpected, 679);
+  RUN_TEST(test_VerifyMemoryComparesPointersForSmartDepthZero, 688);
+  RUN_TEST(test_VerifyIntArrayFailsOnADifferentElement, 698);
+#endif
 
   UnityEnd();
   return 0;
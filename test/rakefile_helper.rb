@@ -194,6 +194,13 @@ module RakefileHelpers
     fail_out "FAIL: There were failures" if (summary.failures > 0)
   end
 
+  # extra preprocessor symbols a test case asks for in :systest: :defines:, applied to everything it builds
+  def systest_defines(test_case_files, test_base)
+    test_case = test_case_files.find { |file| File.basename(file, '.yml') == test_base.sub(/^test_/, '') }
+    return [] if test_case.nil?
+    return load_yaml(test_case)[:systest][:defines] || []
+  end
+
   def run_system_test_interactions(test_case_files)
 
     SystemTestGenerator.new.generate_files(test_case_files)
@@ -211,6 +218,10 @@ module RakefileHelpers
     
       test_base    = File.basename(test, C_EXTENSION)
       cmock_config = test_base.gsub(/test_/, '') + '_cmock.yml'
+      defines      = systest_defines(test_case_files, test_base)
+      cmock_opts   = load_yaml(SYSTEST_GENERATED_FILES_PATH + cmock_config)[:cmock]
+      aggregate    = cmock_opts[:aggregate_mocks]
+      aggregate    = 'cmock_all_mocks.c' if aggregate == true
     
       report "Executing system tests in #{File.basename(test)}..."
     
@@ -222,11 +233,22 @@ module RakefileHelpers
           module_name = $1
           # Use the Python version of CMock
           system("python3 ../lib/cmock.py -o#{SYSTEST_GENERATED_FILES_PATH + cmock_config} #{$cfg['compiler']['source_path']}#{module_name}.h")
+          # an aggregate includes the sources of its mocks, so it is built in their place
+          if aggregate
+            obj_list << compile(SYSTEST_GENERATED_FILES_PATH + aggregate, defines)
+            next
+          end
+          # a sharded mock spreads its functions over part files next to its core source
+          Dir[SYSTEST_GENERATED_FILES_PATH + "mock_#{module_name}_part*#{C_EXTENSION}"].sort.each do |part|
+            obj_list << compile(part, defines)
+          end
+          # pooled mocks share the names they report from one source
+          obj_list << compile(SYSTEST_GENERATED_FILES_PATH + 'cmock_strings' + C_EXTENSION, defines) if cmock_opts[:shared_string_pool]
         end
         # Compile corresponding source file if it exists
         src_file = find_source_file(header, include_dirs)
         if !src_file.nil?
-          obj_list << compile(src_file)
+          obj_list << compile(src_file, defines)
         end
       end
 
@@ -234,10 +256,10 @@ module RakefileHelpers
       runner_name = test_base + '_runner.c'
       runner_path = $cfg['compiler']['source_path'] + runner_name
       UnityTestRunnerGenerator.new(SYSTEST_GENERATED_FILES_PATH + cmock_config).run(test, runner_path)
-      obj_list << compile(runner_path)
+      obj_list << compile(runner_path, defines)
 
       # Build the test module
-      obj_list << compile(test)
+      obj_list << compile(test, defines)
 
       # Link the test executable
       link_it(test_base, obj_list)
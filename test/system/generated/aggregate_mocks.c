@@ -0,0 +1,18 @@
+#include "aggregate_mocks_types.h"
+#include "aggregate_mocks_mockable.h"
+#include "aggregate_mocks.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(int from, int to)
+{
+  write_value(to, read_value(from));
+  flush();
+}
+
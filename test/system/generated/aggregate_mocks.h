@@ -0,0 +1,17 @@
+#ifndef _AGGREGATE_MOCKS
+#define _AGGREGATE_MOCKS
+
+#include "aggregate_mocks_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(int from, int to);
+
+#endif // _AGGREGATE_MOCKS
+
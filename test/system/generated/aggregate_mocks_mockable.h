@@ -0,0 +1,19 @@
+#ifndef _AGGREGATE_MOCKS_MOCKABLE_H
+#define _AGGREGATE_MOCKS_MOCKABLE_H
+
+#include "aggregate_mocks_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(int channel);
+void write_value(int channel, int value);
+void flush(void);
+
+#endif // _AGGREGATE_MOCKS_MOCKABLE_H
+
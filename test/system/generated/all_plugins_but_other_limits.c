@@ -0,0 +1,40 @@
+#include "all_plugins_but_other_limits_types.h"
+#include "all_plugins_but_other_limits_mockable.h"
+#include "all_plugins_but_other_limits.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void)
+{
+  foo(bar());
+}
+
+void function_b(void) {
+  fooa(bar());
+}
+
+void function_c(void) {
+  CEXCEPTION_T e;
+  Try {
+    foos(bars());
+  } Catch(e) { foos("err"); }
+}
+
+int function_d(void) {
+  int test_list[] = { 1, 2, 3, 4, 5 };
+  no_pointers(1, "silly");
+  return mixed(6, test_list, 7);
+}
+
+void function_e(void) {
+  foos("Hello");
+  foos("Tuna");
+  foos("Oranges");
+}
+
@@ -0,0 +1,22 @@
+#ifndef _ALL_PLUGINS_BUT_OTHER_LIMITS
+#define _ALL_PLUGINS_BUT_OTHER_LIMITS
+
+#include "all_plugins_but_other_limits_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void function_a(void);
+void function_b(void);
+void function_c(void);
+int function_d(void);
+void function_e(void);
+
+#endif // _ALL_PLUGINS_BUT_OTHER_LIMITS
+
@@ -0,0 +1,25 @@
+#ifndef _ALL_PLUGINS_BUT_OTHER_LIMITS_MOCKABLE_H
+#define _ALL_PLUGINS_BUT_OTHER_LIMITS_MOCKABLE_H
+
+#include "all_plugins_but_other_limits_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include  "CException.h"
+void foo(POINT_T* a);
+POINT_T* bar(void);
+void fooa(POINT_T a[]);
+void foos(const char * a);
+extern const char* bars(void);
+void no_pointers(int a, const char* b);
+int mixed(int a, int* b, int c);
+void no_args(void);
+
+#endif // _ALL_PLUGINS_BUT_OTHER_LIMITS_MOCKABLE_H
+
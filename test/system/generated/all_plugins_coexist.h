@@ -0,0 +1,23 @@
+#ifndef _ALL_PLUGINS_COEXIST
+#define _ALL_PLUGINS_COEXIST
+
+#include "all_plugins_coexist_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void function_a(void);
+void function_b(void);
+void function_c(void);
+int function_d(void);
+void function_e(void);
+int function_f(void);
+
+#endif // _ALL_PLUGINS_COEXIST
+
@@ -0,0 +1,41 @@
+#include "array_and_pointer_handling_types.h"
+#include "array_and_pointer_handling_mockable.h"
+#include "array_and_pointer_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void)
+{
+  foo(bar());
+}
+
+void function_b(void) {
+  fooa(bar());
+}
+
+void function_c(void) {
+  foos(bars());
+}
+
+int function_d(void) {
+  int test_list[] = { 1, 2, 3, 4, 5 };
+  no_pointers(1, "silly");
+  return mixed(6, test_list, 7);
+}
+
+void function_e(void) {
+  short test_list[] = {-1, -2, -3, -4};
+  potential_packing_problem(&test_list[1]);
+}
+
+void function_f(void) {
+  char arg[6] = "hello";
+  voidpointerfunc(arg);
+}
+
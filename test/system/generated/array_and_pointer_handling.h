@@ -0,0 +1,22 @@
+#ifndef _ARRAY_AND_POINTER_HANDLING
+#define _ARRAY_AND_POINTER_HANDLING
+
+#include "array_and_pointer_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void);
+void function_b(void);
+void function_c(void);
+int  function_d(void);
+void function_e(void);
+void function_f(void);
+
+#endif // _ARRAY_AND_POINTER_HANDLING
+
@@ -0,0 +1,25 @@
+#ifndef _ARRAY_AND_POINTER_HANDLING_MOCKABLE_H
+#define _ARRAY_AND_POINTER_HANDLING_MOCKABLE_H
+
+#include "array_and_pointer_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void foo(POINT_T* a);
+POINT_T* bar(void);
+void fooa(POINT_T a[ARRAY_A_SIZE+1-1]);
+void foos(const char * a);
+const char * bars(void);
+void no_pointers(int a, const char* b);
+int mixed(int a, int* b, int c);
+void potential_packing_problem(short *a);
+void voidpointerfunc(void* a);
+
+#endif // _ARRAY_AND_POINTER_HANDLING_MOCKABLE_H
+
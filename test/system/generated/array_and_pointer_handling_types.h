@@ -0,0 +1,20 @@
+#ifndef _ARRAY_AND_POINTER_HANDLING_TYPES_H
+#define _ARRAY_AND_POINTER_HANDLING_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef struct _POINT_T {
+  int x;
+  int y;
+} POINT_T;
+#define ARRAY_A_SIZE  (5)
+
+#endif // _ARRAY_AND_POINTER_HANDLING_TYPES_H
+
@@ -0,0 +1,29 @@
+#include "basic_expect_and_return_types.h"
+#include "basic_expect_and_return_mockable.h"
+#include "basic_expect_and_return.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a, int b)
+{
+  return foo((custom_type)a) + bar((custom_type)b);
+}
+
+void function_b(void) { }
+
+UINT32 function_c(int a)
+{
+  return foo_varargs((custom_type)a, "ignored", 5);
+}
+
+const char* function_d(const char a[], const char* b)
+{
+  return foo_char_strings(a, b);
+}
+
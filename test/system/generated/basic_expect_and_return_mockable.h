@@ -0,0 +1,20 @@
+#ifndef _BASIC_EXPECT_AND_RETURN_MOCKABLE_H
+#define _BASIC_EXPECT_AND_RETURN_MOCKABLE_H
+
+#include "basic_expect_and_return_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 foo(custom_type a);
+UINT32 bar(custom_type b);
+UINT32 foo_varargs(custom_type a, ...);
+const char* foo_char_strings(const char a[], const char* b);
+
+#endif // _BASIC_EXPECT_AND_RETURN_MOCKABLE_H
+
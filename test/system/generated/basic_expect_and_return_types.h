@@ -0,0 +1,18 @@
+#ifndef _BASIC_EXPECT_AND_RETURN_TYPES_H
+#define _BASIC_EXPECT_AND_RETURN_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#define UINT32 unsigned int
+
+typedef signed int custom_type;
+
+#endif // _BASIC_EXPECT_AND_RETURN_TYPES_H
+
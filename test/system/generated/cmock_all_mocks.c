@@ -0,0 +1,24 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+
+#define Mock mock_aggregate_mocks_mockable_Mock
+#define CMockRegistry mock_aggregate_mocks_mockable_CMockRegistry
+#define CMockActivate mock_aggregate_mocks_mockable_CMockActivate
+#define CMockString_channel mock_aggregate_mocks_mockable_CMockString_channel
+#define CMockString_flush mock_aggregate_mocks_mockable_CMockString_flush
+#define CMockString_read_value mock_aggregate_mocks_mockable_CMockString_read_value
+#define CMockString_value mock_aggregate_mocks_mockable_CMockString_value
+#define CMockString_write_value mock_aggregate_mocks_mockable_CMockString_write_value
+#include "mock_aggregate_mocks_mockable.c"
+#include "mock_aggregate_mocks_mockable_part1.c"
+#include "mock_aggregate_mocks_mockable_part2.c"
+#undef Mock
+#undef CMockRegistry
+#undef CMockActivate
+#undef CMockString_channel
+#undef CMockString_flush
+#undef CMockString_read_value
+#undef CMockString_value
+#undef CMockString_write_value
+#undef CMOCK_TOUCH
+#undef CMOCK_CLEAR
+#undef CMOCK_REGISTER
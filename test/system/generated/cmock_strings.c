@@ -0,0 +1,110 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "cmock_strings.h"
+
+const char CMockString_a[] = "a";
+const char CMockString_address[] = "address";
+const char CMockString_b[] = "b";
+const char CMockString_bar[] = "bar";
+const char CMockString_bars[] = "bars";
+const char CMockString_baz[] = "baz";
+const char CMockString_c[] = "c";
+const char CMockString_caramel[] = "caramel";
+const char CMockString_channel[] = "channel";
+const char CMockString_cmock_arg1[] = "cmock_arg1";
+const char CMockString_cmock_arg2[] = "cmock_arg2";
+const char CMockString_cmock_arg3[] = "cmock_arg3";
+const char CMockString_count[] = "count";
+const char CMockString_crazy_multiline[] = "crazy_multiline";
+const char CMockString_data[] = "data";
+const char CMockString_dev_read[] = "dev_read";
+const char CMockString_dev_write[] = "dev_write";
+const char CMockString_fill[] = "fill";
+const char CMockString_flags[] = "flags";
+const char CMockString_float_adder[] = "float_adder";
+const char CMockString_flush[] = "flush";
+const char CMockString_foo[] = "foo";
+const char CMockString_foo_char_strings[] = "foo_char_strings";
+const char CMockString_foo_varargs[] = "foo_varargs";
+const char CMockString_fooa[] = "fooa";
+const char CMockString_foos[] = "foos";
+const char CMockString_fudge[] = "fudge";
+const char CMockString_func_ptr[] = "func_ptr";
+const char CMockString_get[] = "get";
+const char CMockString_id[] = "id";
+const char CMockString_incredible_descriptors[] = "incredible_descriptors";
+const char CMockString_io_read[] = "io_read";
+const char CMockString_io_write[] = "io_write";
+const char CMockString_key[] = "key";
+const char CMockString_len[] = "len";
+const char CMockString_length[] = "length";
+const char CMockString_mixed[] = "mixed";
+const char CMockString_move[] = "move";
+const char CMockString_myfunc[] = "myfunc";
+const char CMockString_no_args[] = "no_args";
+const char CMockString_no_pointers[] = "no_pointers";
+const char CMockString_oh_brackets1[] = "oh_brackets1";
+const char CMockString_oh_brackets2[] = "oh_brackets2";
+const char CMockString_oh_brackets3[] = "oh_brackets3";
+const char CMockString_oh_brackets4[] = "oh_brackets4";
+const char CMockString_op_code[] = "op_code";
+const char CMockString_param1[] = "param1";
+const char CMockString_param2[] = "param2";
+const char CMockString_param3[] = "param3";
+const char CMockString_place[] = "place";
+const char CMockString_point[] = "point";
+const char CMockString_pointer_bar[] = "pointer_bar";
+const char CMockString_pointer_foo[] = "pointer_foo";
+const char CMockString_points[] = "points";
+const char CMockString_potential_packing_problem[] = "potential_packing_problem";
+const char CMockString_ptr_ptr_return1[] = "ptr_ptr_return1";
+const char CMockString_ptr_ptr_return2[] = "ptr_ptr_return2";
+const char CMockString_ptr_ptr_return3[] = "ptr_ptr_return3";
+const char CMockString_ptr_ptr_return4[] = "ptr_ptr_return4";
+const char CMockString_ptr_ret_abstract[] = "ptr_ret_abstract";
+const char CMockString_ptr_ret_abstract_array[] = "ptr_ret_abstract_array";
+const char CMockString_ptr_ret_array[] = "ptr_ret_array";
+const char CMockString_ptr_ret_const_int[] = "ptr_ret_const_int";
+const char CMockString_ptr_ret_int[] = "ptr_ret_int";
+const char CMockString_ptr_ret_ints[] = "ptr_ret_ints";
+const char CMockString_ptr_ret_string[] = "ptr_ret_string";
+const char CMockString_ptr_ret_struct[] = "ptr_ret_struct";
+const char CMockString_ptr_ret_typedef[] = "ptr_ret_typedef";
+const char CMockString_ptr_return1[] = "ptr_return1";
+const char CMockString_ptr_return2[] = "ptr_return2";
+const char CMockString_ptr_return3[] = "ptr_return3";
+const char CMockString_put[] = "put";
+const char CMockString_r[] = "r";
+const char CMockString_read_a[] = "read_a";
+const char CMockString_read_b[] = "read_b";
+const char CMockString_read_reg[] = "read_reg";
+const char CMockString_read_value[] = "read_value";
+const char CMockString_reset[] = "reset";
+const char CMockString_returns_function_ptr[] = "returns_function_ptr";
+const char CMockString_s[] = "s";
+const char CMockString_scale[] = "scale";
+const char CMockString_send[] = "send";
+const char CMockString_sync[] = "sync";
+const char CMockString_taffy[] = "taffy";
+const char CMockString_tag[] = "tag";
+const char CMockString_takes_const_function_ptr[] = "takes_const_function_ptr";
+const char CMockString_takes_function_ptr[] = "takes_function_ptr";
+const char CMockString_takes_function_ptr_shorthand[] = "takes_function_ptr_shorthand";
+const char CMockString_takes_function_type[] = "takes_function_type";
+const char CMockString_toffee[] = "toffee";
+const char CMockString_typedefvar[] = "typedefvar";
+const char CMockString_unused[] = "unused";
+const char CMockString_uses_typedef_like_names[] = "uses_typedef_like_names";
+const char CMockString_value[] = "value";
+const char CMockString_values[] = "values";
+const char CMockString_var_args1[] = "var_args1";
+const char CMockString_var_args2[] = "var_args2";
+const char CMockString_void_type_craziness1[] = "void_type_craziness1";
+const char CMockString_void_type_craziness2[] = "void_type_craziness2";
+const char CMockString_void_type_craziness3[] = "void_type_craziness3";
+const char CMockString_voidpointerfunc[] = "voidpointerfunc";
+const char CMockString_where[] = "where";
+const char CMockString_write_a[] = "write_a";
+const char CMockString_write_b[] = "write_b";
+const char CMockString_write_reg[] = "write_reg";
+const char CMockString_write_value[] = "write_value";
+const char CMockString_zoink[] = "zoink";
@@ -0,0 +1,113 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _CMOCK_STRINGS_H
+#define _CMOCK_STRINGS_H
+
+extern const char CMockString_a[];
+extern const char CMockString_address[];
+extern const char CMockString_b[];
+extern const char CMockString_bar[];
+extern const char CMockString_bars[];
+extern const char CMockString_baz[];
+extern const char CMockString_c[];
+extern const char CMockString_caramel[];
+extern const char CMockString_channel[];
+extern const char CMockString_cmock_arg1[];
+extern const char CMockString_cmock_arg2[];
+extern const char CMockString_cmock_arg3[];
+extern const char CMockString_count[];
+extern const char CMockString_crazy_multiline[];
+extern const char CMockString_data[];
+extern const char CMockString_dev_read[];
+extern const char CMockString_dev_write[];
+extern const char CMockString_fill[];
+extern const char CMockString_flags[];
+extern const char CMockString_float_adder[];
+extern const char CMockString_flush[];
+extern const char CMockString_foo[];
+extern const char CMockString_foo_char_strings[];
+extern const char CMockString_foo_varargs[];
+extern const char CMockString_fooa[];
+extern const char CMockString_foos[];
+extern const char CMockString_fudge[];
+extern const char CMockString_func_ptr[];
+extern const char CMockString_get[];
+extern const char CMockString_id[];
+extern const char CMockString_incredible_descriptors[];
+extern const char CMockString_io_read[];
+extern const char CMockString_io_write[];
+extern const char CMockString_key[];
+extern const char CMockString_len[];
+extern const char CMockString_length[];
+extern const char CMockString_mixed[];
+extern const char CMockString_move[];
+extern const char CMockString_myfunc[];
+extern const char CMockString_no_args[];
+extern const char CMockString_no_pointers[];
+extern const char CMockString_oh_brackets1[];
+extern const char CMockString_oh_brackets2[];
+extern const char CMockString_oh_brackets3[];
+extern const char CMockString_oh_brackets4[];
+extern const char CMockString_op_code[];
+extern const char CMockString_param1[];
+extern const char CMockString_param2[];
+extern const char CMockString_param3[];
+extern const char CMockString_place[];
+extern const char CMockString_point[];
+extern const char CMockString_pointer_bar[];
+extern const char CMockString_pointer_foo[];
+extern const char CMockString_points[];
+extern const char CMockString_potential_packing_problem[];
+extern const char CMockString_ptr_ptr_return1[];
+extern const char CMockString_ptr_ptr_return2[];
+extern const char CMockString_ptr_ptr_return3[];
+extern const char CMockString_ptr_ptr_return4[];
+extern const char CMockString_ptr_ret_abstract[];
+extern const char CMockString_ptr_ret_abstract_array[];
+extern const char CMockString_ptr_ret_array[];
+extern const char CMockString_ptr_ret_const_int[];
+extern const char CMockString_ptr_ret_int[];
+extern const char CMockString_ptr_ret_ints[];
+extern const char CMockString_ptr_ret_string[];
+extern const char CMockString_ptr_ret_struct[];
+extern const char CMockString_ptr_ret_typedef[];
+extern const char CMockString_ptr_return1[];
+extern const char CMockString_ptr_return2[];
+extern const char CMockString_ptr_return3[];
+extern const char CMockString_put[];
+extern const char CMockString_r[];
+extern const char CMockString_read_a[];
+extern const char CMockString_read_b[];
+extern const char CMockString_read_reg[];
+extern const char CMockString_read_value[];
+extern const char CMockString_reset[];
+extern const char CMockString_returns_function_ptr[];
+extern const char CMockString_s[];
+extern const char CMockString_scale[];
+extern const char CMockString_send[];
+extern const char CMockString_sync[];
+extern const char CMockString_taffy[];
+extern const char CMockString_tag[];
+extern const char CMockString_takes_const_function_ptr[];
+extern const char CMockString_takes_function_ptr[];
+extern const char CMockString_takes_function_ptr_shorthand[];
+extern const char CMockString_takes_function_type[];
+extern const char CMockString_toffee[];
+extern const char CMockString_typedefvar[];
+extern const char CMockString_unused[];
+extern const char CMockString_uses_typedef_like_names[];
+extern const char CMockString_value[];
+extern const char CMockString_values[];
+extern const char CMockString_var_args1[];
+extern const char CMockString_var_args2[];
+extern const char CMockString_void_type_craziness1[];
+extern const char CMockString_void_type_craziness2[];
+extern const char CMockString_void_type_craziness3[];
+extern const char CMockString_voidpointerfunc[];
+extern const char CMockString_where[];
+extern const char CMockString_write_a[];
+extern const char CMockString_write_b[];
+extern const char CMockString_write_reg[];
+extern const char CMockString_write_value[];
+extern const char CMockString_zoink[];
+
+#endif /* _CMOCK_STRINGS_H */
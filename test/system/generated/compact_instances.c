@@ -0,0 +1,31 @@
+#include "compact_instances_types.h"
+#include "compact_instances_mockable.h"
+#include "compact_instances.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int fill_and_sum(int count, char tag)
+{
+  int values[4] = {0, 0, 0, 0};
+  POINT_T where = {0, 0};
+  int sum = 0;
+  int i;
+  sum += fill(values, count, tag, &where);
+  for (i = 0; i < count; i++)
+    sum += values[i];
+  return sum + where.x + where.y;
+}
+void send_two(short first, short second)
+{
+  short data[2];
+  data[0] = first;
+  data[1] = second;
+  send(data, 2);
+}
+
@@ -0,0 +1,18 @@
+#ifndef _COMPACT_INSTANCES
+#define _COMPACT_INSTANCES
+
+#include "compact_instances_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int fill_and_sum(int count, char tag);
+void send_two(short first, short second);
+
+#endif // _COMPACT_INSTANCES
+
@@ -0,0 +1,18 @@
+#ifndef _COMPACT_INSTANCES_MOCKABLE_H
+#define _COMPACT_INSTANCES_MOCKABLE_H
+
+#include "compact_instances_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+char fill(int* values, int count, char tag, POINT_T* where);
+void send(const short* data, int length);
+
+#endif // _COMPACT_INSTANCES_MOCKABLE_H
+
@@ -0,0 +1,30 @@
+#include "const_primitives_handling_types.h"
+#include "const_primitives_handling_mockable.h"
+#include "const_primitives_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+char value1 = '1';
+char value2 = '2';
+
+const char* A = &value1;
+char* const B = &value2;
+const char* C = "C";
+const char* D = "D";
+
+void exercise_const1(char const* param1, char* const param2, const char* param3)
+{
+  foo(param1, param2, param3);
+}
+
+void exercise_const2(char const* param1, char* const param2, const char* param3)
+{
+  bar(param1, param2, param3);
+}
+
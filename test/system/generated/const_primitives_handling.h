@@ -0,0 +1,18 @@
+#ifndef _CONST_PRIMITIVES_HANDLING
+#define _CONST_PRIMITIVES_HANDLING
+
+#include "const_primitives_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void exercise_const1(char const* param1, char* const param2, const char* param3);
+void exercise_const2(char const* param1, char* const param2, const char* param3);
+
+#endif // _CONST_PRIMITIVES_HANDLING
+
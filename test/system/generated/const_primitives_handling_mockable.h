@@ -0,0 +1,21 @@
+#ifndef _CONST_PRIMITIVES_HANDLING_MOCKABLE_H
+#define _CONST_PRIMITIVES_HANDLING_MOCKABLE_H
+
+#include "const_primitives_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+// no argument names
+void foo(char const*, char* const, const char*);
+
+// argument names
+void bar(char const* param1, char* const param2, const char* param3);
+
+#endif // _CONST_PRIMITIVES_HANDLING_MOCKABLE_H
+
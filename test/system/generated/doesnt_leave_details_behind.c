@@ -0,0 +1,25 @@
+#include "doesnt_leave_details_behind_types.h"
+#include "doesnt_leave_details_behind_mockable.h"
+#include "doesnt_leave_details_behind.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void)
+{
+  foo(bar());
+  no_args();
+}
+
+int function_b(void)
+{
+  POINT_T pt = { 1, 2 };
+  foo(&pt);
+  return (pt.x + pt.y);
+}
+
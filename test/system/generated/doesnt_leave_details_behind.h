@@ -0,0 +1,19 @@
+#ifndef _DOESNT_LEAVE_DETAILS_BEHIND
+#define _DOESNT_LEAVE_DETAILS_BEHIND
+
+#include "doesnt_leave_details_behind_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void function_a(void);
+int function_b(void);
+
+#endif // _DOESNT_LEAVE_DETAILS_BEHIND
+
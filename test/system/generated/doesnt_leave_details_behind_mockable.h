@@ -0,0 +1,20 @@
+#ifndef _DOESNT_LEAVE_DETAILS_BEHIND_MOCKABLE_H
+#define _DOESNT_LEAVE_DETAILS_BEHIND_MOCKABLE_H
+
+#include "doesnt_leave_details_behind_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include  "CException.h"
+extern void foo(POINT_T* a);
+POINT_T* bar(void);
+void no_args(void);
+
+#endif // _DOESNT_LEAVE_DETAILS_BEHIND_MOCKABLE_H
+
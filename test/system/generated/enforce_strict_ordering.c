@@ -0,0 +1,57 @@
+#include "enforce_strict_ordering_types.h"
+#include "enforce_strict_ordering_mockable.h"
+#include "enforce_strict_ordering.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a, int b)
+{
+  return foo((custom_type)a) + bar((custom_type)b);
+}
+
+void function_b(void)
+{
+  baz((custom_type)1);
+  foo((custom_type)2);
+  bar((custom_type)3);
+  baz((custom_type)4);
+  foo((custom_type)5);
+  bar((custom_type)6);
+  baz((custom_type)7);
+}
+
+void function_c(void)
+{
+  foo((custom_type)1);
+  foo((custom_type)2);
+  bar((custom_type)3);
+  bar((custom_type)4);
+  foo((custom_type)5);
+}
+
+void function_d(void)
+{
+  CEXCEPTION_T e;
+  Try
+  {
+    foo((custom_type)1);
+  }
+  Catch(e) {}
+  Try
+  {
+    bar((custom_type)2);
+  }
+  Catch(e) {}
+  Try
+  {
+    foo((custom_type)3);
+  }
+  Catch(e) {}
+}
+
@@ -0,0 +1,21 @@
+#ifndef _ENFORCE_STRICT_ORDERING
+#define _ENFORCE_STRICT_ORDERING
+
+#include "enforce_strict_ordering_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+UINT32 function_a(int a, int b);
+void function_b(void);
+void function_c(void);
+void function_d(void);
+
+#endif // _ENFORCE_STRICT_ORDERING
+
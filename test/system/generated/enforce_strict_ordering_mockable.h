@@ -0,0 +1,20 @@
+#ifndef _ENFORCE_STRICT_ORDERING_MOCKABLE_H
+#define _ENFORCE_STRICT_ORDERING_MOCKABLE_H
+
+#include "enforce_strict_ordering_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include  "CException.h"
+UINT32 foo(custom_type a);
+UINT32 bar(custom_type b);
+void baz(custom_type c);
+
+#endif // _ENFORCE_STRICT_ORDERING_MOCKABLE_H
+
@@ -0,0 +1,28 @@
+#include "expect_and_return_custom_types_types.h"
+#include "expect_and_return_custom_types_mockable.h"
+#include "expect_and_return_custom_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+EXAMPLE_STRUCT_T function_a(EXAMPLE_STRUCT_T a, EXAMPLE_STRUCT_T b)
+{
+  EXAMPLE_STRUCT_T retval = foo(a);
+  retval.x += b.x;
+  retval.y += b.y;
+  return retval;
+}
+
+EXAMPLE_STRUCT_T function_b(EXAMPLE_STRUCT_T a, EXAMPLE_STRUCT_T b)
+{
+  EXAMPLE_STRUCT_T retval = foo(b);
+  retval.x *= a.x;
+  retval.y *= a.y;
+  return retval;
+}
+
@@ -0,0 +1,18 @@
+#ifndef _EXPECT_AND_RETURN_CUSTOM_TYPES
+#define _EXPECT_AND_RETURN_CUSTOM_TYPES
+
+#include "expect_and_return_custom_types_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+EXAMPLE_STRUCT_T function_a(EXAMPLE_STRUCT_T a, EXAMPLE_STRUCT_T b);
+EXAMPLE_STRUCT_T function_b(EXAMPLE_STRUCT_T a, EXAMPLE_STRUCT_T b);
+
+#endif // _EXPECT_AND_RETURN_CUSTOM_TYPES
+
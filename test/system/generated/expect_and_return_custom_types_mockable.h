@@ -0,0 +1,17 @@
+#ifndef _EXPECT_AND_RETURN_CUSTOM_TYPES_MOCKABLE_H
+#define _EXPECT_AND_RETURN_CUSTOM_TYPES_MOCKABLE_H
+
+#include "expect_and_return_custom_types_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+EXAMPLE_STRUCT_T foo(EXAMPLE_STRUCT_T a);
+
+#endif // _EXPECT_AND_RETURN_CUSTOM_TYPES_MOCKABLE_H
+
@@ -0,0 +1,16 @@
+#ifndef _EXPECT_AND_RETURN_CUSTOM_TYPES_TYPES_H
+#define _EXPECT_AND_RETURN_CUSTOM_TYPES_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef struct _EXAMPLE_STRUCT_T { int x; int y; } EXAMPLE_STRUCT_T;
+
+#endif // _EXPECT_AND_RETURN_CUSTOM_TYPES_TYPES_H
+
@@ -0,0 +1,39 @@
+#include "expect_and_return_treat_as_types.h"
+#include "expect_and_return_treat_as_mockable.h"
+#include "expect_and_return_treat_as.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+MY_INT function_a(MY_INT a, MY_INT b)
+{
+  return foo((MY_HEX)a) + bar((MY_HEX)b);
+}
+
+MY_STRING function_b(MY_STRING a, MY_STRING b)
+{
+  return foo_char_strings(a, b);
+}
+
+float function_c(float a, float b)
+{
+  return float_adder(b, a);
+}
+
+MY_INT function_d(MY_HEX a)
+{
+  MY_HEX b = a;
+  MY_INT* c = pointer_foo(&b);
+  return *c;
+}
+
+void function_e(PTR_INT a)
+{
+  pointer_bar(a);
+}
+
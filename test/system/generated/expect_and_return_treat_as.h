@@ -0,0 +1,21 @@
+#ifndef _EXPECT_AND_RETURN_TREAT_AS
+#define _EXPECT_AND_RETURN_TREAT_AS
+
+#include "expect_and_return_treat_as_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+MY_INT function_a(MY_INT a, MY_INT b);
+MY_STRING function_b(MY_STRING a, MY_STRING b);
+float function_c(float a, float b);
+MY_INT function_d(MY_HEX a);
+void function_e(PTR_INT a);
+
+#endif // _EXPECT_AND_RETURN_TREAT_AS
+
@@ -0,0 +1,22 @@
+#ifndef _EXPECT_AND_RETURN_TREAT_AS_MOCKABLE_H
+#define _EXPECT_AND_RETURN_TREAT_AS_MOCKABLE_H
+
+#include "expect_and_return_treat_as_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+MY_INT foo(MY_HEX a);
+MY_INT bar(MY_HEX b);
+MY_STRING foo_char_strings(MY_STRING a, MY_STRING b);
+float float_adder(float a, float b);
+MY_INT* pointer_foo(MY_HEX* a);
+void pointer_bar(PTR_INT a);
+
+#endif // _EXPECT_AND_RETURN_TREAT_AS_MOCKABLE_H
+
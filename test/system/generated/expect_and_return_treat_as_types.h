@@ -0,0 +1,19 @@
+#ifndef _EXPECT_AND_RETURN_TREAT_AS_TYPES_H
+#define _EXPECT_AND_RETURN_TREAT_AS_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef const char* MY_STRING;
+typedef int MY_INT;
+typedef unsigned int MY_HEX;
+typedef int* PTR_INT;
+
+#endif // _EXPECT_AND_RETURN_TREAT_AS_TYPES_H
+
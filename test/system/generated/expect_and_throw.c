@@ -0,0 +1,36 @@
+#include "expect_and_throw_types.h"
+#include "expect_and_throw_mockable.h"
+#include "expect_and_throw.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a)    
+{
+  UINT32 r = 0;
+  CEXCEPTION_T e;
+  
+  Try
+  {
+    r = (UINT32)foo((custom_type)a);
+  }
+  Catch(e)
+  {
+    r = (UINT32)e*2;
+  }
+  return r;
+}
+
+void function_b(char a)
+{
+  if (a)
+  {
+    Throw((CEXCEPTION_T)a);
+  }
+}
+
@@ -0,0 +1,19 @@
+#ifndef _EXPECT_AND_THROW
+#define _EXPECT_AND_THROW
+
+#include "expect_and_throw_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+UINT32 function_a(int a);
+void function_b(char a);
+
+#endif // _EXPECT_AND_THROW
+
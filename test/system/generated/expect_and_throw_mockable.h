@@ -0,0 +1,20 @@
+#ifndef _EXPECT_AND_THROW_MOCKABLE_H
+#define _EXPECT_AND_THROW_MOCKABLE_H
+
+#include "expect_and_throw_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+UINT32 foo(custom_type a);
+UINT32 bar(custom_type b);
+UINT32 foo_varargs(custom_type a, ...);
+
+#endif // _EXPECT_AND_THROW_MOCKABLE_H
+
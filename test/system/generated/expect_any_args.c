@@ -0,0 +1,22 @@
+#include "expect_any_args_types.h"
+#include "expect_any_args_mockable.h"
+#include "expect_any_args.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int function(int a, int b, int c)
+{
+  bar(b);
+  return foo(a) + foo(b) + foo(c);
+}
+void func_b(int a)
+{
+  bar(a);
+}
+
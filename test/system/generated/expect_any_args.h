@@ -0,0 +1,18 @@
+#ifndef _EXPECT_ANY_ARGS
+#define _EXPECT_ANY_ARGS
+
+#include "expect_any_args_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int function(int a, int b, int c);
+void func_b(int a);
+
+#endif // _EXPECT_ANY_ARGS
+
@@ -0,0 +1,18 @@
+#ifndef _EXPECT_ANY_ARGS_MOCKABLE_H
+#define _EXPECT_ANY_ARGS_MOCKABLE_H
+
+#include "expect_any_args_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int foo(int a);
+void bar(int b);
+
+#endif // _EXPECT_ANY_ARGS_MOCKABLE_H
+
@@ -0,0 +1,26 @@
+#include "expect_table_types.h"
+#include "expect_table_mockable.h"
+#include "expect_table.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int copy_regs(int from, int to, int count)
+{
+  int i;
+  int sum = 0;
+  for (i = 0; i < count; i++)
+  {
+    int value = read_reg(from + i);
+    write_reg(to + i, value);
+    sum += value;
+  }
+  sync();
+  return sum;
+}
+
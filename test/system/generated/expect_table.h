@@ -0,0 +1,17 @@
+#ifndef _EXPECT_TABLE
+#define _EXPECT_TABLE
+
+#include "expect_table_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int copy_regs(int from, int to, int count);
+
+#endif // _EXPECT_TABLE
+
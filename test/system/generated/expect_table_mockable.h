@@ -0,0 +1,19 @@
+#ifndef _EXPECT_TABLE_MOCKABLE_H
+#define _EXPECT_TABLE_MOCKABLE_H
+
+#include "expect_table_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_reg(int address);
+void write_reg(int address, int value);
+void sync(void);
+
+#endif // _EXPECT_TABLE_MOCKABLE_H
+
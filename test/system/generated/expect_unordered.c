@@ -0,0 +1,32 @@
+#include "expect_unordered_types.h"
+#include "expect_unordered_mockable.h"
+#include "expect_unordered.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int sum_of(int first, int second, int third)
+{
+  return get(first) + get(second) + get(third);
+}
+void store(const char* first, const char* second, int value)
+{
+  put(first, value);
+  put(second, value);
+}
+void move_both(POINT_T* a, POINT_T* b, int id)
+{
+  move(a, id);
+  move(b, id);
+}
+void reset_and_get(int id)
+{
+  reset();
+  get(id);
+}
+
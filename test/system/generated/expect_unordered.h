@@ -0,0 +1,20 @@
+#ifndef _EXPECT_UNORDERED
+#define _EXPECT_UNORDERED
+
+#include "expect_unordered_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int sum_of(int first, int second, int third);
+void store(const char* first, const char* second, int value);
+void move_both(POINT_T* a, POINT_T* b, int id);
+void reset_and_get(int id);
+
+#endif // _EXPECT_UNORDERED
+
@@ -0,0 +1,29 @@
+#include "expect_unordered_arrays_types.h"
+#include "expect_unordered_arrays_mockable.h"
+#include "expect_unordered_arrays.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void send_two(short a, short b, short c)
+{
+  short first[3];
+  short second[3];
+  first[0] = a; first[1] = b; first[2] = c;
+  second[0] = a; second[1] = b; second[2] = (short)(c - 1);
+  send(first, 3);
+  send(second, 3);
+}
+void move_two(int x, int y)
+{
+  POINT_T first[2] = { {0, 0}, {x, y} };
+  POINT_T second[2] = { {0, 0}, {y, x} };
+  move(first, 2);
+  move(second, 2);
+}
+
@@ -0,0 +1,18 @@
+#ifndef _EXPECT_UNORDERED_ARRAYS
+#define _EXPECT_UNORDERED_ARRAYS
+
+#include "expect_unordered_arrays_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void send_two(short a, short b, short c);
+void move_two(int x, int y);
+
+#endif // _EXPECT_UNORDERED_ARRAYS
+
@@ -0,0 +1,18 @@
+#ifndef _EXPECT_UNORDERED_ARRAYS_MOCKABLE_H
+#define _EXPECT_UNORDERED_ARRAYS_MOCKABLE_H
+
+#include "expect_unordered_arrays_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void send(const short* data, int len);
+void move(POINT_T* points, int len);
+
+#endif // _EXPECT_UNORDERED_ARRAYS_MOCKABLE_H
+
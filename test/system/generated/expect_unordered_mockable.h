@@ -0,0 +1,20 @@
+#ifndef _EXPECT_UNORDERED_MOCKABLE_H
+#define _EXPECT_UNORDERED_MOCKABLE_H
+
+#include "expect_unordered_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int get(int id);
+void put(const char* key, int value);
+void move(POINT_T* point, int id);
+void reset(void);
+
+#endif // _EXPECT_UNORDERED_MOCKABLE_H
+
@@ -0,0 +1,31 @@
+#include "fancy_pointer_handling_types.h"
+#include "fancy_pointer_handling_mockable.h"
+#include "fancy_pointer_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void)
+{
+  foo(bar());
+}
+
+void function_b(void) {
+  fooa(bar());
+}
+
+void function_c(void) {
+  foos(bars());
+}
+
+int function_d(void) {
+  int i = 456;
+  INT_PTR ptr = (INT_PTR)(&i);
+  return (int)(*(zoink(ptr)));
+}
+
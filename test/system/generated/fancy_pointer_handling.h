@@ -0,0 +1,20 @@
+#ifndef _FANCY_POINTER_HANDLING
+#define _FANCY_POINTER_HANDLING
+
+#include "fancy_pointer_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void);
+void function_b(void);
+void function_c(void);
+int  function_d(void);
+
+#endif // _FANCY_POINTER_HANDLING
+
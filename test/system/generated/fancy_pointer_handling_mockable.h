@@ -0,0 +1,22 @@
+#ifndef _FANCY_POINTER_HANDLING_MOCKABLE_H
+#define _FANCY_POINTER_HANDLING_MOCKABLE_H
+
+#include "fancy_pointer_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void foo(POINT_T* a);
+POINT_T* bar(void);
+void fooa(POINT_T a[]);
+void foos(const char *a);
+const char* bars(void);
+INT_PTR zoink(INT_PTR a);
+
+#endif // _FANCY_POINTER_HANDLING_MOCKABLE_H
+
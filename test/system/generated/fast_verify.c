@@ -0,0 +1,31 @@
+#include "fast_verify_types.h"
+#include "fast_verify_mockable.h"
+#include "fast_verify.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int get_twice(int id, unsigned char flags)
+{
+  return get(id, flags) + get(id, flags);
+}
+void store(const char* key, int value)
+{
+  put(key, value);
+}
+void place_at(int x, int y, float scale)
+{
+  POINT_T point = {x, y};
+  place(point, scale);
+}
+void move_to(int x, int y)
+{
+  POINT_T point = {x, y};
+  move(&point);
+}
+
@@ -0,0 +1,20 @@
+#ifndef _FAST_VERIFY
+#define _FAST_VERIFY
+
+#include "fast_verify_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int get_twice(int id, unsigned char flags);
+void store(const char* key, int value);
+void place_at(int x, int y, float scale);
+void move_to(int x, int y);
+
+#endif // _FAST_VERIFY
+
@@ -0,0 +1,20 @@
+#ifndef _FAST_VERIFY_MOCKABLE_H
+#define _FAST_VERIFY_MOCKABLE_H
+
+#include "fast_verify_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int get(int id, unsigned char flags);
+void put(const char* key, int value);
+void place(POINT_T point, float scale);
+void move(POINT_T* point);
+
+#endif // _FAST_VERIFY_MOCKABLE_H
+
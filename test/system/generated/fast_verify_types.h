@@ -0,0 +1,16 @@
+#ifndef _FAST_VERIFY_TYPES_H
+#define _FAST_VERIFY_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef struct _POINT_T { int x; int y; } POINT_T;
+
+#endif // _FAST_VERIFY_TYPES_H
+
@@ -0,0 +1,42 @@
+#include "function_pointer_handling_types.h"
+#include "function_pointer_handling_mockable.h"
+#include "function_pointer_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+/*
+ * functions used in tests
+ */
+
+unsigned int dummy_function1(int a, char b)
+{
+  // prevent compiler warnings by using everything
+  return (unsigned int)a + (unsigned int)b;
+}
+
+unsigned short dummy_function2(int a, long int b)
+{
+  // prevent compiler warnings by using everything
+  return (unsigned short)a + (unsigned short)b;
+}
+
+/*
+ * functions executed by tests
+ */
+
+void exercise_function_pointer_param(void)
+{
+  takes_function_ptr(dummy_function1);
+}
+
+unsigned short (*exercise_function_pointer_return( const char op_code ))( int, long int )
+{
+  return returns_function_ptr(op_code);
+}
+
@@ -0,0 +1,22 @@
+#ifndef _FUNCTION_POINTER_HANDLING
+#define _FUNCTION_POINTER_HANDLING
+
+#include "function_pointer_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void exercise_function_pointer_param(void);
+unsigned short (*exercise_function_pointer_return( const char op_code ))( int, long int );
+
+// functions for function pointer tests
+unsigned int dummy_function1(int a, char b);
+unsigned short dummy_function2(int a, long int b);
+
+#endif // _FUNCTION_POINTER_HANDLING
+
@@ -0,0 +1,21 @@
+#ifndef _FUNCTION_POINTER_HANDLING_MOCKABLE_H
+#define _FUNCTION_POINTER_HANDLING_MOCKABLE_H
+
+#include "function_pointer_handling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void takes_function_type( FUNCTION_T myfunc );
+void takes_function_ptr( unsigned int (*func_ptr)(int, char) );
+void takes_function_ptr_shorthand( unsigned int func_ptr(int, char*) );
+void takes_const_function_ptr( unsigned int (* const)(int, char) );
+unsigned short (*returns_function_ptr( const char op_code ))( int, long int );
+
+#endif // _FUNCTION_POINTER_HANDLING_MOCKABLE_H
+
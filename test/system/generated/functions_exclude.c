@@ -0,0 +1,21 @@
+#include "functions_exclude_types.h"
+#include "functions_exclude_mockable.h"
+#include "functions_exclude.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+static int twice(int value) { return 2 * value; }
+static int negate(int value) { return -value; }
+int (*debug_hook(const char name[4]))(int) { (void)name; return twice; }
+int (*debug_handler(void))(int) { return negate; }
+int call_hooks(int value)
+{
+  return debug_hook("abc")(value) + debug_handler()(read_value());
+}
+
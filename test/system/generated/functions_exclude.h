@@ -0,0 +1,17 @@
+#ifndef _FUNCTIONS_EXCLUDE
+#define _FUNCTIONS_EXCLUDE
+
+#include "functions_exclude_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int call_hooks(int value);
+
+#endif // _FUNCTIONS_EXCLUDE
+
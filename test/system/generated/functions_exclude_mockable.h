@@ -0,0 +1,19 @@
+#ifndef _FUNCTIONS_EXCLUDE_MOCKABLE_H
+#define _FUNCTIONS_EXCLUDE_MOCKABLE_H
+
+#include "functions_exclude_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(void);
+int (*debug_hook(const char name[4]))(int);
+int (*debug_handler(void))(int);
+
+#endif // _FUNCTIONS_EXCLUDE_MOCKABLE_H
+
@@ -0,0 +1,27 @@
+#include "functions_include_types.h"
+#include "functions_include_mockable.h"
+#include "functions_include.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int io_debug_level(void) { return 42; }
+int dev_status(void) { return 7; }
+void copy_io(void)
+{
+  io_write(io_read());
+}
+void copy_dev(void)
+{
+  dev_write(dev_read());
+}
+int debug_and_status(void)
+{
+  return io_debug_level() + dev_status();
+}
+
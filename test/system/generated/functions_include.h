@@ -0,0 +1,19 @@
+#ifndef _FUNCTIONS_INCLUDE
+#define _FUNCTIONS_INCLUDE
+
+#include "functions_include_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_io(void);
+void copy_dev(void);
+int debug_and_status(void);
+
+#endif // _FUNCTIONS_INCLUDE
+
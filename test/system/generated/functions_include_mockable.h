@@ -0,0 +1,22 @@
+#ifndef _FUNCTIONS_INCLUDE_MOCKABLE_H
+#define _FUNCTIONS_INCLUDE_MOCKABLE_H
+
+#include "functions_include_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int io_read(void);
+void io_write(int value);
+int io_debug_level(void);
+int dev_read(void);
+void dev_write(int value);
+int dev_status(void);
+
+#endif // _FUNCTIONS_INCLUDE_MOCKABLE_H
+
@@ -0,0 +1,16 @@
+#ifndef _FUNCTIONS_INCLUDE_TYPES_H
+#define _FUNCTIONS_INCLUDE_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+
+
+#endif // _FUNCTIONS_INCLUDE_TYPES_H
+
@@ -0,0 +1,18 @@
+#include "ignore_and_return_types.h"
+#include "ignore_and_return_mockable.h"
+#include "ignore_and_return.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int function(int a, int b, int c)
+{
+  bar(b);
+  return foo(a) + foo(b) + foo(c);
+}
+
@@ -0,0 +1,18 @@
+#ifndef _IGNORE_AND_RETURN_MOCKABLE_H
+#define _IGNORE_AND_RETURN_MOCKABLE_H
+
+#include "ignore_and_return_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int foo(int a);
+void bar(int b);
+
+#endif // _IGNORE_AND_RETURN_MOCKABLE_H
+
@@ -0,0 +1,17 @@
+#ifndef _IGNORE_STRICT_MOCK_CALLING
+#define _IGNORE_STRICT_MOCK_CALLING
+
+#include "ignore_strict_mock_calling_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int function(int a, int b, int c);
+
+#endif // _IGNORE_STRICT_MOCK_CALLING
+
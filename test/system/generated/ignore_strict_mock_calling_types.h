@@ -0,0 +1,16 @@
+#ifndef _IGNORE_STRICT_MOCK_CALLING_TYPES_H
+#define _IGNORE_STRICT_MOCK_CALLING_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+
+
+#endif // _IGNORE_STRICT_MOCK_CALLING_TYPES_H
+
@@ -0,0 +1,12 @@
+
+
+
+int dummy_func_0(void);
+
+int dummy_func_1(int a);
+
+int dummy_func_2(int a, char b, float c);
+
+void dummy_normal_func(int a);
+
+void dummy_func_3(void);
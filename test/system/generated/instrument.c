@@ -0,0 +1,17 @@
+#include "instrument_types.h"
+#include "instrument_mockable.h"
+#include "instrument.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(void)
+{
+  write_value(read_value());
+}
+
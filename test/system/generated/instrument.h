@@ -0,0 +1,17 @@
+#ifndef _INSTRUMENT
+#define _INSTRUMENT
+
+#include "instrument_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(void);
+
+#endif // _INSTRUMENT
+
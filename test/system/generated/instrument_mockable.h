@@ -0,0 +1,19 @@
+#ifndef _INSTRUMENT_MOCKABLE_H
+#define _INSTRUMENT_MOCKABLE_H
+
+#include "instrument_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(void);
+void write_value(int value);
+void unused(void);
+
+#endif // _INSTRUMENT_MOCKABLE_H
+
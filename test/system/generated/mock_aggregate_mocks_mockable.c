@@ -0,0 +1,59 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "mock_aggregate_mocks_mockable_internal.h"
+
+CMOCK_THREAD_STORAGE struct mock_aggregate_mocks_mockableInstance Mock;
+
+const char CMockString_channel[] = "channel";
+const char CMockString_flush[] = "flush";
+const char CMockString_read_value[] = "read_value";
+const char CMockString_value[] = "value";
+const char CMockString_write_value[] = "write_value";
+
+CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY CMockRegistry = { mock_aggregate_mocks_mockable_Verify, mock_aggregate_mocks_mockable_Destroy, NULL, 0 };
+
+void CMockActivate(void)
+{
+  CMock_Register(&CMockRegistry);
+}
+
+void mock_aggregate_mocks_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.read_value_CallInstance;
+  if (Mock.read_value_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_read_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.write_value_CallInstance;
+  if (Mock.write_value_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_write_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.flush_CallInstance;
+  if (Mock.flush_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_flush);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_aggregate_mocks_mockable_Init(void)
+{
+  mock_aggregate_mocks_mockable_Destroy();
+}
+
+void mock_aggregate_mocks_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
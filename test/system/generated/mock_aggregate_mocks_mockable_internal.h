@@ -0,0 +1,73 @@
+#ifndef _MOCK_AGGREGATE_MOCKS_MOCKABLE_INTERNAL_H
+#define _MOCK_AGGREGATE_MOCKS_MOCKABLE_INTERNAL_H
+
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_aggregate_mocks_mockable.h"
+
+#define CMockString_channel mock_aggregate_mocks_mockable_CMockString_channel
+extern const char CMockString_channel[];
+#define CMockString_flush mock_aggregate_mocks_mockable_CMockString_flush
+extern const char CMockString_flush[];
+#define CMockString_read_value mock_aggregate_mocks_mockable_CMockString_read_value
+extern const char CMockString_read_value[];
+#define CMockString_value mock_aggregate_mocks_mockable_CMockString_value
+extern const char CMockString_value[];
+#define CMockString_write_value mock_aggregate_mocks_mockable_CMockString_write_value
+extern const char CMockString_write_value[];
+
+#define Mock mock_aggregate_mocks_mockable_Mock
+#define CMockRegistry mock_aggregate_mocks_mockable_CMockRegistry
+#define CMockActivate mock_aggregate_mocks_mockable_CMockActivate
+
+typedef struct _CMOCK_read_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int ReturnVal;
+  int Expected_channel;
+
+} CMOCK_read_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int Expected_channel;
+  int Expected_value;
+
+} CMOCK_write_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_flush_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+
+} CMOCK_flush_CALL_INSTANCE;
+
+struct mock_aggregate_mocks_mockableInstance
+{
+  char read_value_IgnoreBool;
+  int read_value_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE read_value_CallInstance;
+  char write_value_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE write_value_CallInstance;
+  char flush_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE flush_CallInstance;
+};
+extern CMOCK_THREAD_STORAGE struct mock_aggregate_mocks_mockableInstance Mock;
+
+
+extern CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY CMockRegistry;
+void CMockActivate(void);
+
+#define CMOCK_REGISTER() \
+  do { if (!CMockRegistry.Active) { CMockActivate(); } } while (0)
+
+void CMockExpectParameters_read_value(CMOCK_read_value_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+
+#endif /* _MOCK_AGGREGATE_MOCKS_MOCKABLE_INTERNAL_H */
@@ -0,0 +1,214 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "mock_aggregate_mocks_mockable_internal.h"
+
+int read_value(int channel)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_value);
+  cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_value_CallInstance);
+  Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  if (Mock.read_value_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_value_FinalReturn;
+  Mock.read_value_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_read_value,CMockString_channel);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_channel, channel, cmock_line, CMockStringMismatch);
+  }
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_read_value(CMOCK_read_value_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_read_value(CMOCK_read_value_CALL_INSTANCE* cmock_call_instance, int channel)
+{
+  cmock_call_instance->Expected_channel = channel;
+}
+
+void read_value_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_value_IgnoreBool = (char)1;
+}
+
+void read_value_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  if(Mock.read_value_IgnoreBool)
+    Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  Mock.read_value_IgnoreBool = (char)0;
+}
+
+void read_value_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int channel, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_read_value(cmock_call_instance, channel);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_REGISTER();
+    Mock.read_value_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_read_value(cmock_call_instance, cmock_rows[cmock_row].channel);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_value(int channel, int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_value);
+  cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_value_CallInstance);
+  Mock.write_value_CallInstance = CMock_Guts_MemNext(Mock.write_value_CallInstance);
+  if (Mock.write_value_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_write_value,CMockString_channel);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_channel, channel, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_write_value,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int channel, int value)
+{
+  cmock_call_instance->Expected_channel = channel;
+  cmock_call_instance->Expected_value = value;
+}
+
+void write_value_CMockIgnore(void)
+{
+  CMOCK_REGISTER();
+  Mock.write_value_IgnoreBool = (char)1;
+}
+
+void write_value_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  Mock.write_value_IgnoreBool = (char)0;
+}
+
+void write_value_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_value_CALL_INSTANCE));
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  Mock.write_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void write_value_CMockExpect(UNITY_LINE_TYPE cmock_line, int channel, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_value_CALL_INSTANCE));
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  Mock.write_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_write_value(cmock_call_instance, channel, value);
+}
+
+void write_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_REGISTER();
+    Mock.write_value_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_write_value(cmock_call_instance, cmock_rows[cmock_row].channel, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,45 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "mock_aggregate_mocks_mockable_internal.h"
+
+void flush(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_flush_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_flush);
+  cmock_call_instance = (CMOCK_flush_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.flush_CallInstance);
+  Mock.flush_CallInstance = CMock_Guts_MemNext(Mock.flush_CallInstance);
+  if (Mock.flush_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void flush_CMockIgnore(void)
+{
+  CMOCK_REGISTER();
+  Mock.flush_IgnoreBool = (char)1;
+}
+
+void flush_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  Mock.flush_IgnoreBool = (char)0;
+}
+
+void flush_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_flush_CALL_INSTANCE));
+  CMOCK_flush_CALL_INSTANCE* cmock_call_instance = (CMOCK_flush_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.flush_CallInstance = CMock_Guts_MemChain(Mock.flush_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  Mock.flush_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+}
+
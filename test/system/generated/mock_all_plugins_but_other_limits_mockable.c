@@ -0,0 +1,1587 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_all_plugins_but_other_limits_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_bar = "bar";
+static const char* CMockString_bars = "bars";
+static const char* CMockString_c = "c";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_fooa = "fooa";
+static const char* CMockString_foos = "foos";
+static const char* CMockString_mixed = "mixed";
+static const char* CMockString_no_args = "no_args";
+static const char* CMockString_no_pointers = "no_pointers";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  POINT_T* Expected_a;
+  CEXCEPTION_T ExceptionToThrow;
+  int Expected_a_Depth;
+  char ReturnThruPtr_a_Used;
+  POINT_T const* ReturnThruPtr_a_Val;
+  size_t ReturnThruPtr_a_Size;
+  char IgnoreArg_a;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  POINT_T* ReturnVal;
+  int CallOrder;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+typedef struct _CMOCK_fooa_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  POINT_T* Expected_a;
+  CEXCEPTION_T ExceptionToThrow;
+  int Expected_a_Depth;
+  char ReturnThruPtr_a_Used;
+  POINT_T const* ReturnThruPtr_a_Val;
+  size_t ReturnThruPtr_a_Size;
+  char IgnoreArg_a;
+
+} CMOCK_fooa_CALL_INSTANCE;
+
+typedef struct _CMOCK_foos_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  const char* Expected_a;
+  CEXCEPTION_T ExceptionToThrow;
+  char IgnoreArg_a;
+
+} CMOCK_foos_CALL_INSTANCE;
+
+typedef struct _CMOCK_bars_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  const char* ReturnVal;
+  int CallOrder;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_bars_CALL_INSTANCE;
+
+typedef struct _CMOCK_no_pointers_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  int Expected_a;
+  const char* Expected_b;
+  CEXCEPTION_T ExceptionToThrow;
+  char IgnoreArg_a;
+  char IgnoreArg_b;
+
+} CMOCK_no_pointers_CALL_INSTANCE;
+
+typedef struct _CMOCK_mixed_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int ReturnVal;
+  int CallOrder;
+  int Expected_a;
+  int* Expected_b;
+  int Expected_c;
+  CEXCEPTION_T ExceptionToThrow;
+  int Expected_b_Depth;
+  char ReturnThruPtr_b_Used;
+  int const* ReturnThruPtr_b_Val;
+  size_t ReturnThruPtr_b_Size;
+  char IgnoreArg_a;
+  char IgnoreArg_b;
+  char IgnoreArg_c;
+
+} CMOCK_mixed_CALL_INSTANCE;
+
+typedef struct _CMOCK_no_args_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_no_args_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_all_plugins_but_other_limits_mockableInstance
+{
+  char foo_IgnoreBool;
+  char foo_CallbackBool;
+  CMOCK_foo_CALLBACK foo_CallbackFunctionPointer;
+  int foo_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  char bar_IgnoreBool;
+  POINT_T* bar_FinalReturn;
+  char bar_CallbackBool;
+  CMOCK_bar_CALLBACK bar_CallbackFunctionPointer;
+  int bar_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+  char fooa_IgnoreBool;
+  char fooa_CallbackBool;
+  CMOCK_fooa_CALLBACK fooa_CallbackFunctionPointer;
+  int fooa_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE fooa_CallInstance;
+  char foos_IgnoreBool;
+  char foos_CallbackBool;
+  CMOCK_foos_CALLBACK foos_CallbackFunctionPointer;
+  int foos_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foos_CallInstance;
+  char bars_IgnoreBool;
+  const char* bars_FinalReturn;
+  char bars_CallbackBool;
+  CMOCK_bars_CALLBACK bars_CallbackFunctionPointer;
+  int bars_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE bars_CallInstance;
+  char no_pointers_IgnoreBool;
+  char no_pointers_CallbackBool;
+  CMOCK_no_pointers_CALLBACK no_pointers_CallbackFunctionPointer;
+  int no_pointers_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE no_pointers_CallInstance;
+  char mixed_IgnoreBool;
+  int mixed_FinalReturn;
+  char mixed_CallbackBool;
+  CMOCK_mixed_CALLBACK mixed_CallbackFunctionPointer;
+  int mixed_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE mixed_CallInstance;
+  char no_args_IgnoreBool;
+  char no_args_CallbackBool;
+  CMOCK_no_args_CALLBACK no_args_CallbackFunctionPointer;
+  int no_args_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE no_args_CallInstance;
+} Mock;
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+void mock_all_plugins_but_other_limits_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (Mock.foo_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (Mock.bar_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.fooa_CallInstance;
+  if (Mock.fooa_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_fooa);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.fooa_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.foos_CallInstance;
+  if (Mock.foos_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foos);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foos_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.bars_CallInstance;
+  if (Mock.bars_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bars);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.bars_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.no_pointers_CallInstance;
+  if (Mock.no_pointers_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_no_pointers);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.no_pointers_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.mixed_CallInstance;
+  if (Mock.mixed_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_mixed);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.mixed_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.no_args_CallInstance;
+  if (Mock.no_args_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_no_args);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.no_args_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+}
+
+void mock_all_plugins_but_other_limits_mockable_Init(void)
+{
+  mock_all_plugins_but_other_limits_mockable_Destroy();
+}
+
+void mock_all_plugins_but_other_limits_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
+void foo(POINT_T* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  if (Mock.foo_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.foo_CallbackBool &&
+      Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_CallbackFunctionPointer(a, Mock.foo_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_a)
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_a), (void*)(a), sizeof(POINT_T), cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_CallbackFunctionPointer(a, Mock.foo_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  if (cmock_call_instance->ReturnThruPtr_a_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(a, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)a, (const void*)cmock_call_instance->ReturnThruPtr_a_Val, 
+      cmock_call_instance->ReturnThruPtr_a_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+  cmock_call_instance->IgnoreArg_a = 0;
+  cmock_call_instance->ReturnThruPtr_a_Used = 0;
+}
+
+void foo_CMockIgnore(void)
+{
+  Mock.foo_IgnoreBool = (char)1;
+}
+
+void foo_CMockStopIgnore(void)
+{
+  Mock.foo_IgnoreBool = (char)0;
+}
+
+void foo_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foo(cmock_call_instance, a, 1);
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foo_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_AddCallback(CMOCK_foo_CALLBACK Callback)
+{
+  Mock.foo_IgnoreBool = (char)0;
+  Mock.foo_CallbackBool = (char)1;
+  Mock.foo_CallbackFunctionPointer = Callback;
+}
+
+void foo_Stub(CMOCK_foo_CALLBACK Callback)
+{
+  Mock.foo_IgnoreBool = (char)0;
+  Mock.foo_CallbackBool = (char)0;
+  Mock.foo_CallbackFunctionPointer = Callback;
+}
+
+void foo_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, POINT_T* a, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foo(cmock_call_instance, a, 1);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foo(cmock_call_instance, a, a_Depth);
+}
+
+void foo_CMockReturnMemThruPtr_a(UNITY_LINE_TYPE cmock_line, POINT_T const* a, size_t cmock_size)
+{
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_a_Used = 1;
+  cmock_call_instance->ReturnThruPtr_a_Val = a;
+  cmock_call_instance->ReturnThruPtr_a_Size = cmock_size;
+}
+
+void foo_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_a = 1;
+}
+
+POINT_T* bar(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  if (Mock.bar_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.bar_FinalReturn;
+  Mock.bar_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.bar_CallbackBool &&
+      Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    POINT_T* cmock_cb_ret = Mock.bar_CallbackFunctionPointer(Mock.bar_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.bar_CallbackFunctionPointer(Mock.bar_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void bar_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  Mock.bar_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.bar_IgnoreBool = (char)1;
+}
+
+void bar_CMockStopIgnore(void)
+{
+  if(Mock.bar_IgnoreBool)
+    Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  Mock.bar_IgnoreBool = (char)0;
+}
+
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  Mock.bar_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.bar_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void bar_AddCallback(CMOCK_bar_CALLBACK Callback)
+{
+  Mock.bar_IgnoreBool = (char)0;
+  Mock.bar_CallbackBool = (char)1;
+  Mock.bar_CallbackFunctionPointer = Callback;
+}
+
+void bar_Stub(CMOCK_bar_CALLBACK Callback)
+{
+  Mock.bar_IgnoreBool = (char)0;
+  Mock.bar_CallbackBool = (char)0;
+  Mock.bar_CallbackFunctionPointer = Callback;
+}
+
+void bar_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  Mock.bar_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void fooa(POINT_T* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_fooa);
+  cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.fooa_CallInstance);
+  Mock.fooa_CallInstance = CMock_Guts_MemNext(Mock.fooa_CallInstance);
+  if (Mock.fooa_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.fooa_CallbackBool &&
+      Mock.fooa_CallbackFunctionPointer != NULL)
+  {
+    Mock.fooa_CallbackFunctionPointer(a, Mock.fooa_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_a)
+  {
+    UNITY_SET_DETAILS(CMockString_fooa,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_a), (void*)(a), sizeof(POINT_T), cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (Mock.fooa_CallbackFunctionPointer != NULL)
+  {
+    Mock.fooa_CallbackFunctionPointer(a, Mock.fooa_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  if (cmock_call_instance->ReturnThruPtr_a_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(a, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)a, (const void*)cmock_call_instance->ReturnThruPtr_a_Val, 
+      cmock_call_instance->ReturnThruPtr_a_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_fooa(CMOCK_fooa_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth);
+void CMockExpectParameters_fooa(CMOCK_fooa_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+  cmock_call_instance->IgnoreArg_a = 0;
+  cmock_call_instance->ReturnThruPtr_a_Used = 0;
+}
+
+void fooa_CMockIgnore(void)
+{
+  Mock.fooa_IgnoreBool = (char)1;
+}
+
+void fooa_CMockStopIgnore(void)
+{
+  Mock.fooa_IgnoreBool = (char)0;
+}
+
+void fooa_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fooa_CALL_INSTANCE));
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  Mock.fooa_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void fooa_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fooa_CALL_INSTANCE));
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  Mock.fooa_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_fooa(cmock_call_instance, a, 1);
+}
+
+void fooa_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fooa_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_fooa_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.fooa_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_fooa(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void fooa_AddCallback(CMOCK_fooa_CALLBACK Callback)
+{
+  Mock.fooa_IgnoreBool = (char)0;
+  Mock.fooa_CallbackBool = (char)1;
+  Mock.fooa_CallbackFunctionPointer = Callback;
+}
+
+void fooa_Stub(CMOCK_fooa_CALLBACK Callback)
+{
+  Mock.fooa_IgnoreBool = (char)0;
+  Mock.fooa_CallbackBool = (char)0;
+  Mock.fooa_CallbackFunctionPointer = Callback;
+}
+
+void fooa_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, POINT_T* a, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fooa_CALL_INSTANCE));
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  Mock.fooa_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_fooa(cmock_call_instance, a, 1);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void fooa_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fooa_CALL_INSTANCE));
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  Mock.fooa_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_fooa(cmock_call_instance, a, a_Depth);
+}
+
+void fooa_CMockReturnMemThruPtr_a(UNITY_LINE_TYPE cmock_line, POINT_T const* a, size_t cmock_size)
+{
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fooa_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_a_Used = 1;
+  cmock_call_instance->ReturnThruPtr_a_Val = a;
+  cmock_call_instance->ReturnThruPtr_a_Size = cmock_size;
+}
+
+void fooa_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fooa_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_a = 1;
+}
+
+void foos(const char* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foos);
+  cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foos_CallInstance);
+  Mock.foos_CallInstance = CMock_Guts_MemNext(Mock.foos_CallInstance);
+  if (Mock.foos_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.foos_CallbackBool &&
+      Mock.foos_CallbackFunctionPointer != NULL)
+  {
+    Mock.foos_CallbackFunctionPointer(a, Mock.foos_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_a)
+  {
+    UNITY_SET_DETAILS(CMockString_foos,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  }
+  if (Mock.foos_CallbackFunctionPointer != NULL)
+  {
+    Mock.foos_CallbackFunctionPointer(a, Mock.foos_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foos(CMOCK_foos_CALL_INSTANCE* cmock_call_instance, const char* a);
+void CMockExpectParameters_foos(CMOCK_foos_CALL_INSTANCE* cmock_call_instance, const char* a)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->IgnoreArg_a = 0;
+}
+
+void foos_CMockIgnore(void)
+{
+  Mock.foos_IgnoreBool = (char)1;
+}
+
+void foos_CMockStopIgnore(void)
+{
+  Mock.foos_IgnoreBool = (char)0;
+}
+
+void foos_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foos_CALL_INSTANCE));
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  Mock.foos_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foos_CALL_INSTANCE));
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  Mock.foos_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foos(cmock_call_instance, a);
+}
+
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foos_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foos_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_foos(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foos_AddCallback(CMOCK_foos_CALLBACK Callback)
+{
+  Mock.foos_IgnoreBool = (char)0;
+  Mock.foos_CallbackBool = (char)1;
+  Mock.foos_CallbackFunctionPointer = Callback;
+}
+
+void foos_Stub(CMOCK_foos_CALLBACK Callback)
+{
+  Mock.foos_IgnoreBool = (char)0;
+  Mock.foos_CallbackBool = (char)0;
+  Mock.foos_CallbackFunctionPointer = Callback;
+}
+
+void foos_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, const char* a, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foos_CALL_INSTANCE));
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  Mock.foos_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foos(cmock_call_instance, a);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void foos_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foos_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_a = 1;
+}
+
+const char* bars(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bars);
+  cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bars_CallInstance);
+  Mock.bars_CallInstance = CMock_Guts_MemNext(Mock.bars_CallInstance);
+  if (Mock.bars_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.bars_FinalReturn;
+  Mock.bars_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.bars_CallbackBool &&
+      Mock.bars_CallbackFunctionPointer != NULL)
+  {
+    const char* cmock_cb_ret = Mock.bars_CallbackFunctionPointer(Mock.bars_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.bars_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.bars_CallbackFunctionPointer(Mock.bars_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void bars_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  Mock.bars_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.bars_IgnoreBool = (char)1;
+}
+
+void bars_CMockStopIgnore(void)
+{
+  if(Mock.bars_IgnoreBool)
+    Mock.bars_CallInstance = CMock_Guts_MemNext(Mock.bars_CallInstance);
+  Mock.bars_IgnoreBool = (char)0;
+}
+
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  Mock.bars_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bars_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.bars_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void bars_AddCallback(CMOCK_bars_CALLBACK Callback)
+{
+  Mock.bars_IgnoreBool = (char)0;
+  Mock.bars_CallbackBool = (char)1;
+  Mock.bars_CallbackFunctionPointer = Callback;
+}
+
+void bars_Stub(CMOCK_bars_CALLBACK Callback)
+{
+  Mock.bars_IgnoreBool = (char)0;
+  Mock.bars_CallbackBool = (char)0;
+  Mock.bars_CallbackFunctionPointer = Callback;
+}
+
+void bars_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  Mock.bars_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void no_pointers(int a, const char* b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_no_pointers);
+  cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.no_pointers_CallInstance);
+  Mock.no_pointers_CallInstance = CMock_Guts_MemNext(Mock.no_pointers_CallInstance);
+  if (Mock.no_pointers_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.no_pointers_CallbackBool &&
+      Mock.no_pointers_CallbackFunctionPointer != NULL)
+  {
+    Mock.no_pointers_CallbackFunctionPointer(a, b, Mock.no_pointers_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_a)
+  {
+    UNITY_SET_DETAILS(CMockString_no_pointers,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  if (!cmock_call_instance->IgnoreArg_b)
+  {
+    UNITY_SET_DETAILS(CMockString_no_pointers,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  }
+  if (Mock.no_pointers_CallbackFunctionPointer != NULL)
+  {
+    Mock.no_pointers_CallbackFunctionPointer(a, b, Mock.no_pointers_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_no_pointers(CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance, int a, const char* b);
+void CMockExpectParameters_no_pointers(CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance, int a, const char* b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->IgnoreArg_a = 0;
+  cmock_call_instance->Expected_b = b;
+  cmock_call_instance->IgnoreArg_b = 0;
+}
+
+void no_pointers_CMockIgnore(void)
+{
+  Mock.no_pointers_IgnoreBool = (char)1;
+}
+
+void no_pointers_CMockStopIgnore(void)
+{
+  Mock.no_pointers_IgnoreBool = (char)0;
+}
+
+void no_pointers_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_pointers_CALL_INSTANCE));
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_pointers_CallInstance = CMock_Guts_MemChain(Mock.no_pointers_CallInstance, cmock_guts_index);
+  Mock.no_pointers_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void no_pointers_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, const char* b)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_pointers_CALL_INSTANCE));
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_pointers_CallInstance = CMock_Guts_MemChain(Mock.no_pointers_CallInstance, cmock_guts_index);
+  Mock.no_pointers_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_no_pointers(cmock_call_instance, a, b);
+}
+
+void no_pointers_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const no_pointers_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_no_pointers_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.no_pointers_CallInstance = CMock_Guts_MemChain(Mock.no_pointers_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.no_pointers_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_no_pointers(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void no_pointers_AddCallback(CMOCK_no_pointers_CALLBACK Callback)
+{
+  Mock.no_pointers_IgnoreBool = (char)0;
+  Mock.no_pointers_CallbackBool = (char)1;
+  Mock.no_pointers_CallbackFunctionPointer = Callback;
+}
+
+void no_pointers_Stub(CMOCK_no_pointers_CALLBACK Callback)
+{
+  Mock.no_pointers_IgnoreBool = (char)0;
+  Mock.no_pointers_CallbackBool = (char)0;
+  Mock.no_pointers_CallbackFunctionPointer = Callback;
+}
+
+void no_pointers_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, int a, const char* b, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_pointers_CALL_INSTANCE));
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_pointers_CallInstance = CMock_Guts_MemChain(Mock.no_pointers_CallInstance, cmock_guts_index);
+  Mock.no_pointers_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_no_pointers(cmock_call_instance, a, b);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void no_pointers_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.no_pointers_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_a = 1;
+}
+
+void no_pointers_CMockIgnoreArg_b(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.no_pointers_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_b = 1;
+}
+
+int mixed(int a, int* b, int c)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_mixed);
+  cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.mixed_CallInstance);
+  Mock.mixed_CallInstance = CMock_Guts_MemNext(Mock.mixed_CallInstance);
+  if (Mock.mixed_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.mixed_FinalReturn;
+  Mock.mixed_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.mixed_CallbackBool &&
+      Mock.mixed_CallbackFunctionPointer != NULL)
+  {
+    int cmock_cb_ret = Mock.mixed_CallbackFunctionPointer(a, b, c, Mock.mixed_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_a)
+  {
+    UNITY_SET_DETAILS(CMockString_mixed,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  if (!cmock_call_instance->IgnoreArg_b)
+  {
+    UNITY_SET_DETAILS(CMockString_mixed,CMockString_b);
+    if (cmock_call_instance->Expected_b == NULL)
+      { UNITY_TEST_ASSERT_NULL(b, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_b, b, cmock_call_instance->Expected_b_Depth, cmock_line, CMockStringMismatch); }
+  }
+  if (!cmock_call_instance->IgnoreArg_c)
+  {
+    UNITY_SET_DETAILS(CMockString_mixed,CMockString_c);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_c, c, cmock_line, CMockStringMismatch);
+  }
+  }
+  if (Mock.mixed_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.mixed_CallbackFunctionPointer(a, b, c, Mock.mixed_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  if (cmock_call_instance->ReturnThruPtr_b_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(b, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)b, (const void*)cmock_call_instance->ReturnThruPtr_b_Val, 
+      cmock_call_instance->ReturnThruPtr_b_Size);
+  }  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_mixed(CMOCK_mixed_CALL_INSTANCE* cmock_call_instance, int a, int* b, int b_Depth, int c);
+void CMockExpectParameters_mixed(CMOCK_mixed_CALL_INSTANCE* cmock_call_instance, int a, int* b, int b_Depth, int c)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->IgnoreArg_a = 0;
+  cmock_call_instance->Expected_b = b;
+  cmock_call_instance->Expected_b_Depth = b_Depth;
+  cmock_call_instance->IgnoreArg_b = 0;
+  cmock_call_instance->ReturnThruPtr_b_Used = 0;
+  cmock_call_instance->Expected_c = c;
+  cmock_call_instance->IgnoreArg_c = 0;
+}
+
+void mixed_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  Mock.mixed_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.mixed_IgnoreBool = (char)1;
+}
+
+void mixed_CMockStopIgnore(void)
+{
+  if(Mock.mixed_IgnoreBool)
+    Mock.mixed_CallInstance = CMock_Guts_MemNext(Mock.mixed_CallInstance);
+  Mock.mixed_IgnoreBool = (char)0;
+}
+
+void mixed_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  Mock.mixed_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void mixed_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int c, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  Mock.mixed_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_mixed(cmock_call_instance, a, b, 1, c);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void mixed_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const mixed_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_mixed_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.mixed_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_mixed(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b, 1, cmock_rows[cmock_row].c);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void mixed_AddCallback(CMOCK_mixed_CALLBACK Callback)
+{
+  Mock.mixed_IgnoreBool = (char)0;
+  Mock.mixed_CallbackBool = (char)1;
+  Mock.mixed_CallbackFunctionPointer = Callback;
+}
+
+void mixed_Stub(CMOCK_mixed_CALLBACK Callback)
+{
+  Mock.mixed_IgnoreBool = (char)0;
+  Mock.mixed_CallbackBool = (char)0;
+  Mock.mixed_CallbackFunctionPointer = Callback;
+}
+
+void mixed_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, int a, int* b, int c, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  Mock.mixed_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_mixed(cmock_call_instance, a, b, 1, c);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void mixed_CMockExpectWithArrayAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int b_Depth, int c, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  Mock.mixed_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_mixed(cmock_call_instance, a, b, b_Depth, c);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void mixed_CMockReturnMemThruPtr_b(UNITY_LINE_TYPE cmock_line, int const* b, size_t cmock_size)
+{
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.mixed_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_b_Used = 1;
+  cmock_call_instance->ReturnThruPtr_b_Val = b;
+  cmock_call_instance->ReturnThruPtr_b_Size = cmock_size;
+}
+
+void mixed_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.mixed_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_a = 1;
+}
+
+void mixed_CMockIgnoreArg_b(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.mixed_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_b = 1;
+}
+
+void mixed_CMockIgnoreArg_c(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.mixed_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_c = 1;
+}
+
+void no_args(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_no_args_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_no_args);
+  cmock_call_instance = (CMOCK_no_args_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.no_args_CallInstance);
+  Mock.no_args_CallInstance = CMock_Guts_MemNext(Mock.no_args_CallInstance);
+  if (Mock.no_args_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.no_args_CallbackBool &&
+      Mock.no_args_CallbackFunctionPointer != NULL)
+  {
+    Mock.no_args_CallbackFunctionPointer(Mock.no_args_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.no_args_CallbackFunctionPointer != NULL)
+  {
+    Mock.no_args_CallbackFunctionPointer(Mock.no_args_CallbackCalls++);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void no_args_CMockIgnore(void)
+{
+  Mock.no_args_IgnoreBool = (char)1;
+}
+
+void no_args_CMockStopIgnore(void)
+{
+  Mock.no_args_IgnoreBool = (char)0;
+}
+
+void no_args_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_args_CALL_INSTANCE));
+  CMOCK_no_args_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_args_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_args_CallInstance = CMock_Guts_MemChain(Mock.no_args_CallInstance, cmock_guts_index);
+  Mock.no_args_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+}
+
+void no_args_AddCallback(CMOCK_no_args_CALLBACK Callback)
+{
+  Mock.no_args_IgnoreBool = (char)0;
+  Mock.no_args_CallbackBool = (char)1;
+  Mock.no_args_CallbackFunctionPointer = Callback;
+}
+
+void no_args_Stub(CMOCK_no_args_CALLBACK Callback)
+{
+  Mock.no_args_IgnoreBool = (char)0;
+  Mock.no_args_CallbackBool = (char)0;
+  Mock.no_args_CallbackFunctionPointer = Callback;
+}
+
+void no_args_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_args_CALL_INSTANCE));
+  CMOCK_no_args_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_args_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_args_CallInstance = CMock_Guts_MemChain(Mock.no_args_CallInstance, cmock_guts_index);
+  Mock.no_args_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
@@ -0,0 +1,272 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_ALL_PLUGINS_COEXIST_MOCKABLE_H
+#define _MOCK_ALL_PLUGINS_COEXIST_MOCKABLE_H
+
+#include "unity.h"
+#include "all_plugins_coexist_types.h"
+#include "all_plugins_coexist_mockable.h"
+#include "CException.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_all_plugins_coexist_mockable_Init(void);
+void mock_all_plugins_coexist_mockable_Destroy(void);
+void mock_all_plugins_coexist_mockable_Verify(void);
+
+
+
+
+
+#define foo_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo requires _Ignore (not AndReturn)");
+#define foo_Ignore() foo_CMockIgnore()
+void foo_CMockIgnore(void);
+#define foo_StopIgnore() foo_CMockStopIgnore()
+void foo_CMockStopIgnore(void);
+
+#define foo_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo requires _ExpectAnyArgs (not AndReturn)");
+#define foo_ExpectAnyArgs() foo_CMockExpectAnyArgs(__LINE__)
+void foo_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define foo_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foo requires _Expect (not AndReturn)");
+#define foo_Expect(a) foo_CMockExpect(__LINE__, a)
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  POINT_T* a;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_foo_CALLBACK)(POINT_T* a);
+void foo_AddCallback(CMOCK_foo_CALLBACK Callback);
+void foo_Stub(CMOCK_foo_CALLBACK Callback);
+#define foo_StubWithCallback foo_AddCallback
+#define foo_ExpectAndThrow(a, cmock_to_throw) foo_CMockExpectAndThrow(__LINE__, a, cmock_to_throw)
+void foo_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, POINT_T* a, CEXCEPTION_T cmock_to_throw);
+#define foo_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("foo requires _ExpectWithArray (not AndReturn)");
+#define foo_ExpectWithArray(a, a_Depth) foo_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth);
+#define foo_ReturnThruPtr_a(a) foo_CMockReturnMemThruPtr_a(__LINE__, a, sizeof(POINT_T))
+#define foo_ReturnArrayThruPtr_a(a, cmock_len) foo_CMockReturnMemThruPtr_a(__LINE__, a, (cmock_len * sizeof(*a)))
+#define foo_ReturnMemThruPtr_a(a, cmock_size) foo_CMockReturnMemThruPtr_a(__LINE__, a, (cmock_size))
+void foo_CMockReturnMemThruPtr_a(UNITY_LINE_TYPE cmock_line, POINT_T const* a, size_t cmock_size);
+#define foo_IgnoreArg_a() foo_CMockIgnoreArg_a(__LINE__)
+void foo_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line);
+
+#define bar_Ignore() TEST_FAIL_MESSAGE("bar requires _IgnoreAndReturn");
+#define bar_IgnoreAndReturn(cmock_retval) bar_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void bar_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return);
+#define bar_StopIgnore() bar_CMockStopIgnore()
+void bar_CMockStopIgnore(void);
+#define bar_Expect() TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(cmock_retval) bar_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  POINT_T* ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+typedef POINT_T* (* CMOCK_bar_CALLBACK)(void);
+void bar_AddCallback(CMOCK_bar_CALLBACK Callback);
+void bar_Stub(CMOCK_bar_CALLBACK Callback);
+#define bar_StubWithCallback bar_AddCallback
+#define bar_ExpectAndThrow(cmock_to_throw) bar_CMockExpectAndThrow(__LINE__, cmock_to_throw)
+void bar_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw);
+
+#define fooa_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("fooa requires _Ignore (not AndReturn)");
+#define fooa_Ignore() fooa_CMockIgnore()
+void fooa_CMockIgnore(void);
+#define fooa_StopIgnore() fooa_CMockStopIgnore()
+void fooa_CMockStopIgnore(void);
+
+#define fooa_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("fooa requires _ExpectAnyArgs (not AndReturn)");
+#define fooa_ExpectAnyArgs() fooa_CMockExpectAnyArgs(__LINE__)
+void fooa_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define fooa_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("fooa requires _Expect (not AndReturn)");
+#define fooa_Expect(a) fooa_CMockExpect(__LINE__, a)
+void fooa_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_fooa_EXPECT_ROW
+{
+  POINT_T* a;
+} fooa_ExpectRow;
+#define fooa_ExpectTable(cmock_rows, cmock_count) fooa_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void fooa_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fooa_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_fooa_CALLBACK)(POINT_T* a);
+void fooa_AddCallback(CMOCK_fooa_CALLBACK Callback);
+void fooa_Stub(CMOCK_fooa_CALLBACK Callback);
+#define fooa_StubWithCallback fooa_AddCallback
+#define fooa_ExpectAndThrow(a, cmock_to_throw) fooa_CMockExpectAndThrow(__LINE__, a, cmock_to_throw)
+void fooa_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, POINT_T* a, CEXCEPTION_T cmock_to_throw);
+#define fooa_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("fooa requires _ExpectWithArray (not AndReturn)");
+#define fooa_ExpectWithArray(a, a_Depth) fooa_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void fooa_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth);
+#define fooa_ReturnThruPtr_a(a) fooa_CMockReturnMemThruPtr_a(__LINE__, a, sizeof(POINT_T))
+#define fooa_ReturnArrayThruPtr_a(a, cmock_len) fooa_CMockReturnMemThruPtr_a(__LINE__, a, (cmock_len * sizeof(*a)))
+#define fooa_ReturnMemThruPtr_a(a, cmock_size) fooa_CMockReturnMemThruPtr_a(__LINE__, a, (cmock_size))
+void fooa_CMockReturnMemThruPtr_a(UNITY_LINE_TYPE cmock_line, POINT_T const* a, size_t cmock_size);
+#define fooa_IgnoreArg_a() fooa_CMockIgnoreArg_a(__LINE__)
+void fooa_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line);
+
+#define foos_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foos requires _Ignore (not AndReturn)");
+#define foos_Ignore() foos_CMockIgnore()
+void foos_CMockIgnore(void);
+#define foos_StopIgnore() foos_CMockStopIgnore()
+void foos_CMockStopIgnore(void);
+
+#define foos_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foos requires _ExpectAnyArgs (not AndReturn)");
+#define foos_ExpectAnyArgs() foos_CMockExpectAnyArgs(__LINE__)
+void foos_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define foos_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foos requires _Expect (not AndReturn)");
+#define foos_Expect(a) foos_CMockExpect(__LINE__, a)
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a);
+typedef struct _CMOCK_foos_EXPECT_ROW
+{
+  const char* a;
+} foos_ExpectRow;
+#define foos_ExpectTable(cmock_rows, cmock_count) foos_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_foos_CALLBACK)(const char* a);
+void foos_AddCallback(CMOCK_foos_CALLBACK Callback);
+void foos_Stub(CMOCK_foos_CALLBACK Callback);
+#define foos_StubWithCallback foos_AddCallback
+#define foos_ExpectAndThrow(a, cmock_to_throw) foos_CMockExpectAndThrow(__LINE__, a, cmock_to_throw)
+void foos_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, const char* a, CEXCEPTION_T cmock_to_throw);
+
+#define foos_IgnoreArg_a() foos_CMockIgnoreArg_a(__LINE__)
+void foos_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line);
+
+#define bars_Ignore() TEST_FAIL_MESSAGE("bars requires _IgnoreAndReturn");
+#define bars_IgnoreAndReturn(cmock_retval) bars_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void bars_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return);
+#define bars_StopIgnore() bars_CMockStopIgnore()
+void bars_CMockStopIgnore(void);
+#define bars_Expect() TEST_FAIL_MESSAGE("bars requires _ExpectAndReturn");
+#define bars_ExpectAndReturn(cmock_retval) bars_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return);
+typedef struct _CMOCK_bars_EXPECT_ROW
+{
+  const char* ReturnVal;
+} bars_ExpectRow;
+#define bars_ExpectTable(cmock_rows, cmock_count) bars_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count);
+typedef const char* (* CMOCK_bars_CALLBACK)(void);
+void bars_AddCallback(CMOCK_bars_CALLBACK Callback);
+void bars_Stub(CMOCK_bars_CALLBACK Callback);
+#define bars_StubWithCallback bars_AddCallback
+#define bars_ExpectAndThrow(cmock_to_throw) bars_CMockExpectAndThrow(__LINE__, cmock_to_throw)
+void bars_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw);
+
+#define no_pointers_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("no_pointers requires _Ignore (not AndReturn)");
+#define no_pointers_Ignore() no_pointers_CMockIgnore()
+void no_pointers_CMockIgnore(void);
+#define no_pointers_StopIgnore() no_pointers_CMockStopIgnore()
+void no_pointers_CMockStopIgnore(void);
+
+#define no_pointers_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("no_pointers requires _ExpectAnyArgs (not AndReturn)");
+#define no_pointers_ExpectAnyArgs() no_pointers_CMockExpectAnyArgs(__LINE__)
+void no_pointers_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define no_pointers_ExpectAndReturn(a, b, cmock_retval) TEST_FAIL_MESSAGE("no_pointers requires _Expect (not AndReturn)");
+#define no_pointers_Expect(a, b) no_pointers_CMockExpect(__LINE__, a, b)
+void no_pointers_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, const char* b);
+typedef struct _CMOCK_no_pointers_EXPECT_ROW
+{
+  int a;
+  const char* b;
+} no_pointers_ExpectRow;
+#define no_pointers_ExpectTable(cmock_rows, cmock_count) no_pointers_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void no_pointers_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const no_pointers_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_no_pointers_CALLBACK)(int a, const char* b);
+void no_pointers_AddCallback(CMOCK_no_pointers_CALLBACK Callback);
+void no_pointers_Stub(CMOCK_no_pointers_CALLBACK Callback);
+#define no_pointers_StubWithCallback no_pointers_AddCallback
+#define no_pointers_ExpectAndThrow(a, b, cmock_to_throw) no_pointers_CMockExpectAndThrow(__LINE__, a, b, cmock_to_throw)
+void no_pointers_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, int a, const char* b, CEXCEPTION_T cmock_to_throw);
+
+#define no_pointers_IgnoreArg_a() no_pointers_CMockIgnoreArg_a(__LINE__)
+void no_pointers_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line);
+
+#define no_pointers_IgnoreArg_b() no_pointers_CMockIgnoreArg_b(__LINE__)
+void no_pointers_CMockIgnoreArg_b(UNITY_LINE_TYPE cmock_line);
+
+#define mixed_Ignore() TEST_FAIL_MESSAGE("mixed requires _IgnoreAndReturn");
+#define mixed_IgnoreAndReturn(cmock_retval) mixed_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void mixed_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define mixed_StopIgnore() mixed_CMockStopIgnore()
+void mixed_CMockStopIgnore(void);
+
+#define mixed_ExpectAnyArgs() TEST_FAIL_MESSAGE("mixed requires _ExpectAnyArgsAndReturn");
+#define mixed_ExpectAnyArgsAndReturn(cmock_retval) mixed_CMockExpectAnyArgsAndReturn(__LINE__, cmock_retval)
+void mixed_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define mixed_Expect(a, b, c) TEST_FAIL_MESSAGE("mixed requires _ExpectAndReturn");
+#define mixed_ExpectAndReturn(a, b, c, cmock_retval) mixed_CMockExpectAndReturn(__LINE__, a, b, c, cmock_retval)
+void mixed_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int c, int cmock_to_return);
+typedef struct _CMOCK_mixed_EXPECT_ROW
+{
+  int a;
+  int* b;
+  int c;
+  int ReturnVal;
+} mixed_ExpectRow;
+#define mixed_ExpectTable(cmock_rows, cmock_count) mixed_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void mixed_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const mixed_ExpectRow* cmock_rows, size_t cmock_count);
+typedef int (* CMOCK_mixed_CALLBACK)(int a, int* b, int c);
+void mixed_AddCallback(CMOCK_mixed_CALLBACK Callback);
+void mixed_Stub(CMOCK_mixed_CALLBACK Callback);
+#define mixed_StubWithCallback mixed_AddCallback
+#define mixed_ExpectAndThrow(a, b, c, cmock_to_throw) mixed_CMockExpectAndThrow(__LINE__, a, b, c, cmock_to_throw)
+void mixed_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, int a, int* b, int c, CEXCEPTION_T cmock_to_throw);
+#define mixed_ExpectWithArray(a, b, b_Depth, c) TEST_FAIL_MESSAGE("mixed requires _ExpectWithArrayAndReturn");
+#define mixed_ExpectWithArrayAndReturn(a, b, b_Depth, c, cmock_retval) mixed_CMockExpectWithArrayAndReturn(__LINE__, a, b, (b_Depth), c, cmock_retval)
+void mixed_CMockExpectWithArrayAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int b_Depth, int c, int cmock_to_return);
+#define mixed_ReturnThruPtr_b(b) mixed_CMockReturnMemThruPtr_b(__LINE__, b, sizeof(int))
+#define mixed_ReturnArrayThruPtr_b(b, cmock_len) mixed_CMockReturnMemThruPtr_b(__LINE__, b, (cmock_len * sizeof(*b)))
+#define mixed_ReturnMemThruPtr_b(b, cmock_size) mixed_CMockReturnMemThruPtr_b(__LINE__, b, (cmock_size))
+void mixed_CMockReturnMemThruPtr_b(UNITY_LINE_TYPE cmock_line, int const* b, size_t cmock_size);
+#define mixed_IgnoreArg_a() mixed_CMockIgnoreArg_a(__LINE__)
+void mixed_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line);
+
+#define mixed_IgnoreArg_b() mixed_CMockIgnoreArg_b(__LINE__)
+void mixed_CMockIgnoreArg_b(UNITY_LINE_TYPE cmock_line);
+
+#define mixed_IgnoreArg_c() mixed_CMockIgnoreArg_c(__LINE__)
+void mixed_CMockIgnoreArg_c(UNITY_LINE_TYPE cmock_line);
+
+#define no_args_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("no_args requires _Ignore (not AndReturn)");
+#define no_args_Ignore() no_args_CMockIgnore()
+void no_args_CMockIgnore(void);
+#define no_args_StopIgnore() no_args_CMockStopIgnore()
+void no_args_CMockStopIgnore(void);
+#define no_args_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("no_args requires _Expect (not AndReturn)");
+#define no_args_Expect() no_args_CMockExpect(__LINE__)
+void no_args_CMockExpect(UNITY_LINE_TYPE cmock_line);
+typedef void (* CMOCK_no_args_CALLBACK)(void);
+void no_args_AddCallback(CMOCK_no_args_CALLBACK Callback);
+void no_args_Stub(CMOCK_no_args_CALLBACK Callback);
+#define no_args_StubWithCallback no_args_AddCallback
+#define no_args_ExpectAndThrow(cmock_to_throw) no_args_CMockExpectAndThrow(__LINE__, cmock_to_throw)
+void no_args_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
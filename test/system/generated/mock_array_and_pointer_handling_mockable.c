@@ -0,0 +1,749 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_array_and_pointer_handling_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_bar = "bar";
+static const char* CMockString_bars = "bars";
+static const char* CMockString_c = "c";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_fooa = "fooa";
+static const char* CMockString_foos = "foos";
+static const char* CMockString_mixed = "mixed";
+static const char* CMockString_no_pointers = "no_pointers";
+static const char* CMockString_potential_packing_problem = "potential_packing_problem";
+static const char* CMockString_voidpointerfunc = "voidpointerfunc";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T* Expected_a;
+  int Expected_a_Depth;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T* ReturnVal;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+typedef struct _CMOCK_fooa_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T* Expected_a;
+  int Expected_a_Depth;
+
+} CMOCK_fooa_CALL_INSTANCE;
+
+typedef struct _CMOCK_foos_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char* Expected_a;
+
+} CMOCK_foos_CALL_INSTANCE;
+
+typedef struct _CMOCK_bars_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char* ReturnVal;
+
+} CMOCK_bars_CALL_INSTANCE;
+
+typedef struct _CMOCK_no_pointers_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_a;
+  const char* Expected_b;
+
+} CMOCK_no_pointers_CALL_INSTANCE;
+
+typedef struct _CMOCK_mixed_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int Expected_a;
+  int* Expected_b;
+  int Expected_c;
+  int Expected_b_Depth;
+
+} CMOCK_mixed_CALL_INSTANCE;
+
+typedef struct _CMOCK_potential_packing_problem_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  short* Expected_a;
+  int Expected_a_Depth;
+
+} CMOCK_potential_packing_problem_CALL_INSTANCE;
+
+typedef struct _CMOCK_voidpointerfunc_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  void* Expected_a;
+  int Expected_a_Depth;
+
+} CMOCK_voidpointerfunc_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_array_and_pointer_handling_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+  CMOCK_MEM_INDEX_TYPE fooa_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foos_CallInstance;
+  CMOCK_MEM_INDEX_TYPE bars_CallInstance;
+  CMOCK_MEM_INDEX_TYPE no_pointers_CallInstance;
+  CMOCK_MEM_INDEX_TYPE mixed_CallInstance;
+  CMOCK_MEM_INDEX_TYPE potential_packing_problem_CallInstance;
+  CMOCK_MEM_INDEX_TYPE voidpointerfunc_CallInstance;
+} Mock;
+
+
+void mock_array_and_pointer_handling_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.fooa_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_fooa);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foos_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foos);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.bars_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bars);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.no_pointers_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_no_pointers);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.mixed_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_mixed);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.potential_packing_problem_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_potential_packing_problem);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.voidpointerfunc_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_voidpointerfunc);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_array_and_pointer_handling_mockable_Init(void)
+{
+  mock_array_and_pointer_handling_mockable_Destroy();
+}
+
+void mock_array_and_pointer_handling_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void foo(POINT_T* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_a_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_a), (void*)(a), sizeof(POINT_T), cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+}
+
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, a, 1);
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, a, a_Depth);
+}
+
+POINT_T* bar(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void fooa(POINT_T* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_fooa);
+  cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.fooa_CallInstance);
+  Mock.fooa_CallInstance = CMock_Guts_MemNext(Mock.fooa_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_fooa,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_a_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_a), (void*)(a), sizeof(POINT_T), cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_fooa(CMOCK_fooa_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth);
+void CMockExpectParameters_fooa(CMOCK_fooa_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+}
+
+void fooa_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fooa_CALL_INSTANCE));
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_fooa(cmock_call_instance, a, 1);
+}
+
+void fooa_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fooa_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_fooa_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_fooa(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void fooa_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fooa_CALL_INSTANCE));
+  CMOCK_fooa_CALL_INSTANCE* cmock_call_instance = (CMOCK_fooa_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fooa_CallInstance = CMock_Guts_MemChain(Mock.fooa_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_fooa(cmock_call_instance, a, a_Depth);
+}
+
+void foos(const char* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foos);
+  cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foos_CallInstance);
+  Mock.foos_CallInstance = CMock_Guts_MemNext(Mock.foos_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foos,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foos(CMOCK_foos_CALL_INSTANCE* cmock_call_instance, const char* a);
+void CMockExpectParameters_foos(CMOCK_foos_CALL_INSTANCE* cmock_call_instance, const char* a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foos_CALL_INSTANCE));
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foos(cmock_call_instance, a);
+}
+
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foos_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foos(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+const char* bars(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bars);
+  cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bars_CallInstance);
+  Mock.bars_CallInstance = CMock_Guts_MemNext(Mock.bars_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bars_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void no_pointers(int a, const char* b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_no_pointers);
+  cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.no_pointers_CallInstance);
+  Mock.no_pointers_CallInstance = CMock_Guts_MemNext(Mock.no_pointers_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_no_pointers,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_no_pointers,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_no_pointers(CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance, int a, const char* b);
+void CMockExpectParameters_no_pointers(CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance, int a, const char* b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void no_pointers_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, const char* b)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_pointers_CALL_INSTANCE));
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_pointers_CallInstance = CMock_Guts_MemChain(Mock.no_pointers_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_no_pointers(cmock_call_instance, a, b);
+}
+
+void no_pointers_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const no_pointers_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_no_pointers_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_no_pointers_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.no_pointers_CallInstance = CMock_Guts_MemChain(Mock.no_pointers_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_no_pointers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_no_pointers(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int mixed(int a, int* b, int c)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_mixed);
+  cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.mixed_CallInstance);
+  Mock.mixed_CallInstance = CMock_Guts_MemNext(Mock.mixed_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_mixed,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_mixed,CMockString_b);
+    if (cmock_call_instance->Expected_b == NULL)
+      { UNITY_TEST_ASSERT_NULL(b, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_b_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_b, b, cmock_call_instance->Expected_b_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_mixed,CMockString_c);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_c, c, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_mixed(CMOCK_mixed_CALL_INSTANCE* cmock_call_instance, int a, int* b, int b_Depth, int c);
+void CMockExpectParameters_mixed(CMOCK_mixed_CALL_INSTANCE* cmock_call_instance, int a, int* b, int b_Depth, int c)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+  cmock_call_instance->Expected_b_Depth = b_Depth;
+  cmock_call_instance->Expected_c = c;
+}
+
+void mixed_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int c, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_mixed(cmock_call_instance, a, b, 1, c);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void mixed_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const mixed_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_mixed_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_mixed(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b, 1, cmock_rows[cmock_row].c);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void mixed_CMockExpectWithArrayAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int b_Depth, int c, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_mixed_CALL_INSTANCE));
+  CMOCK_mixed_CALL_INSTANCE* cmock_call_instance = (CMOCK_mixed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.mixed_CallInstance = CMock_Guts_MemChain(Mock.mixed_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_mixed(cmock_call_instance, a, b, b_Depth, c);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void potential_packing_problem(short* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_potential_packing_problem_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_potential_packing_problem);
+  cmock_call_instance = (CMOCK_potential_packing_problem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.potential_packing_problem_CallInstance);
+  Mock.potential_packing_problem_CallInstance = CMock_Guts_MemNext(Mock.potential_packing_problem_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_potential_packing_problem,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_a_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT16_ARRAY(cmock_call_instance->Expected_a, a, cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_potential_packing_problem(CMOCK_potential_packing_problem_CALL_INSTANCE* cmock_call_instance, short* a, int a_Depth);
+void CMockExpectParameters_potential_packing_problem(CMOCK_potential_packing_problem_CALL_INSTANCE* cmock_call_instance, short* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+}
+
+void potential_packing_problem_CMockExpect(UNITY_LINE_TYPE cmock_line, short* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_potential_packing_problem_CALL_INSTANCE));
+  CMOCK_potential_packing_problem_CALL_INSTANCE* cmock_call_instance = (CMOCK_potential_packing_problem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.potential_packing_problem_CallInstance = CMock_Guts_MemChain(Mock.potential_packing_problem_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_potential_packing_problem(cmock_call_instance, a, 1);
+}
+
+void potential_packing_problem_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const potential_packing_problem_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_potential_packing_problem_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_potential_packing_problem_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.potential_packing_problem_CallInstance = CMock_Guts_MemChain(Mock.potential_packing_problem_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_potential_packing_problem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_potential_packing_problem(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void potential_packing_problem_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, short* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_potential_packing_problem_CALL_INSTANCE));
+  CMOCK_potential_packing_problem_CALL_INSTANCE* cmock_call_instance = (CMOCK_potential_packing_problem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.potential_packing_problem_CallInstance = CMock_Guts_MemChain(Mock.potential_packing_problem_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_potential_packing_problem(cmock_call_instance, a, a_Depth);
+}
+
+void voidpointerfunc(void* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_voidpointerfunc_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_voidpointerfunc);
+  cmock_call_instance = (CMOCK_voidpointerfunc_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.voidpointerfunc_CallInstance);
+  Mock.voidpointerfunc_CallInstance = CMock_Guts_MemNext(Mock.voidpointerfunc_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_voidpointerfunc,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_a_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX8_ARRAY(cmock_call_instance->Expected_a, a, cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_voidpointerfunc(CMOCK_voidpointerfunc_CALL_INSTANCE* cmock_call_instance, void* a, int a_Depth);
+void CMockExpectParameters_voidpointerfunc(CMOCK_voidpointerfunc_CALL_INSTANCE* cmock_call_instance, void* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+}
+
+void voidpointerfunc_CMockExpect(UNITY_LINE_TYPE cmock_line, void* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_voidpointerfunc_CALL_INSTANCE));
+  CMOCK_voidpointerfunc_CALL_INSTANCE* cmock_call_instance = (CMOCK_voidpointerfunc_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.voidpointerfunc_CallInstance = CMock_Guts_MemChain(Mock.voidpointerfunc_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_voidpointerfunc(cmock_call_instance, a, 1);
+}
+
+void voidpointerfunc_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const voidpointerfunc_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_voidpointerfunc_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_voidpointerfunc_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.voidpointerfunc_CallInstance = CMock_Guts_MemChain(Mock.voidpointerfunc_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_voidpointerfunc_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_voidpointerfunc(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void voidpointerfunc_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, void* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_voidpointerfunc_CALL_INSTANCE));
+  CMOCK_voidpointerfunc_CALL_INSTANCE* cmock_call_instance = (CMOCK_voidpointerfunc_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.voidpointerfunc_CallInstance = CMock_Guts_MemChain(Mock.voidpointerfunc_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_voidpointerfunc(cmock_call_instance, a, a_Depth);
+}
+
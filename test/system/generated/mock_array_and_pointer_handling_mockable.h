@@ -0,0 +1,143 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_ARRAY_AND_POINTER_HANDLING_MOCKABLE_H
+#define _MOCK_ARRAY_AND_POINTER_HANDLING_MOCKABLE_H
+
+#include "unity.h"
+#include "array_and_pointer_handling_types.h"
+#include "array_and_pointer_handling_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_array_and_pointer_handling_mockable_Init(void);
+void mock_array_and_pointer_handling_mockable_Destroy(void);
+void mock_array_and_pointer_handling_mockable_Verify(void);
+
+
+
+
+#define foo_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foo requires _Expect (not AndReturn)");
+#define foo_Expect(a) foo_CMockExpect(__LINE__, a)
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  POINT_T* a;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("foo requires _ExpectWithArray (not AndReturn)");
+#define foo_ExpectWithArray(a, a_Depth) foo_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth);
+#define bar_Expect() TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(cmock_retval) bar_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  POINT_T* ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+#define fooa_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("fooa requires _Expect (not AndReturn)");
+#define fooa_Expect(a) fooa_CMockExpect(__LINE__, a)
+void fooa_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_fooa_EXPECT_ROW
+{
+  POINT_T* a;
+} fooa_ExpectRow;
+#define fooa_ExpectTable(cmock_rows, cmock_count) fooa_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void fooa_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fooa_ExpectRow* cmock_rows, size_t cmock_count);
+#define fooa_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("fooa requires _ExpectWithArray (not AndReturn)");
+#define fooa_ExpectWithArray(a, a_Depth) fooa_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void fooa_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth);
+#define foos_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foos requires _Expect (not AndReturn)");
+#define foos_Expect(a) foos_CMockExpect(__LINE__, a)
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a);
+typedef struct _CMOCK_foos_EXPECT_ROW
+{
+  const char* a;
+} foos_ExpectRow;
+#define foos_ExpectTable(cmock_rows, cmock_count) foos_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count);
+#define bars_Expect() TEST_FAIL_MESSAGE("bars requires _ExpectAndReturn");
+#define bars_ExpectAndReturn(cmock_retval) bars_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return);
+typedef struct _CMOCK_bars_EXPECT_ROW
+{
+  const char* ReturnVal;
+} bars_ExpectRow;
+#define bars_ExpectTable(cmock_rows, cmock_count) bars_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count);
+#define no_pointers_ExpectAndReturn(a, b, cmock_retval) TEST_FAIL_MESSAGE("no_pointers requires _Expect (not AndReturn)");
+#define no_pointers_Expect(a, b) no_pointers_CMockExpect(__LINE__, a, b)
+void no_pointers_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, const char* b);
+typedef struct _CMOCK_no_pointers_EXPECT_ROW
+{
+  int a;
+  const char* b;
+} no_pointers_ExpectRow;
+#define no_pointers_ExpectTable(cmock_rows, cmock_count) no_pointers_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void no_pointers_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const no_pointers_ExpectRow* cmock_rows, size_t cmock_count);
+#define mixed_Expect(a, b, c) TEST_FAIL_MESSAGE("mixed requires _ExpectAndReturn");
+#define mixed_ExpectAndReturn(a, b, c, cmock_retval) mixed_CMockExpectAndReturn(__LINE__, a, b, c, cmock_retval)
+void mixed_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int c, int cmock_to_return);
+typedef struct _CMOCK_mixed_EXPECT_ROW
+{
+  int a;
+  int* b;
+  int c;
+  int ReturnVal;
+} mixed_ExpectRow;
+#define mixed_ExpectTable(cmock_rows, cmock_count) mixed_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void mixed_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const mixed_ExpectRow* cmock_rows, size_t cmock_count);
+#define mixed_ExpectWithArray(a, b, b_Depth, c) TEST_FAIL_MESSAGE("mixed requires _ExpectWithArrayAndReturn");
+#define mixed_ExpectWithArrayAndReturn(a, b, b_Depth, c, cmock_retval) mixed_CMockExpectWithArrayAndReturn(__LINE__, a, b, (b_Depth), c, cmock_retval)
+void mixed_CMockExpectWithArrayAndReturn(UNITY_LINE_TYPE cmock_line, int a, int* b, int b_Depth, int c, int cmock_to_return);
+#define potential_packing_problem_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("potential_packing_problem requires _Expect (not AndReturn)");
+#define potential_packing_problem_Expect(a) potential_packing_problem_CMockExpect(__LINE__, a)
+void potential_packing_problem_CMockExpect(UNITY_LINE_TYPE cmock_line, short* a);
+typedef struct _CMOCK_potential_packing_problem_EXPECT_ROW
+{
+  short* a;
+} potential_packing_problem_ExpectRow;
+#define potential_packing_problem_ExpectTable(cmock_rows, cmock_count) potential_packing_problem_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void potential_packing_problem_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const potential_packing_problem_ExpectRow* cmock_rows, size_t cmock_count);
+#define potential_packing_problem_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("potential_packing_problem requires _ExpectWithArray (not AndReturn)");
+#define potential_packing_problem_ExpectWithArray(a, a_Depth) potential_packing_problem_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void potential_packing_problem_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, short* a, int a_Depth);
+#define voidpointerfunc_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("voidpointerfunc requires _Expect (not AndReturn)");
+#define voidpointerfunc_Expect(a) voidpointerfunc_CMockExpect(__LINE__, a)
+void voidpointerfunc_CMockExpect(UNITY_LINE_TYPE cmock_line, void* a);
+typedef struct _CMOCK_voidpointerfunc_EXPECT_ROW
+{
+  void* a;
+} voidpointerfunc_ExpectRow;
+#define voidpointerfunc_ExpectTable(cmock_rows, cmock_count) voidpointerfunc_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void voidpointerfunc_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const voidpointerfunc_ExpectRow* cmock_rows, size_t cmock_count);
+#define voidpointerfunc_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("voidpointerfunc requires _ExpectWithArray (not AndReturn)");
+#define voidpointerfunc_ExpectWithArray(a, a_Depth) voidpointerfunc_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void voidpointerfunc_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, void* a, int a_Depth);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
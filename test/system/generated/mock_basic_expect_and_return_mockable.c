@@ -0,0 +1,333 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_basic_expect_and_return_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_bar = "bar";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_foo_char_strings = "foo_char_strings";
+static const char* CMockString_foo_varargs = "foo_varargs";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  UINT32 ReturnVal;
+  custom_type Expected_a;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  UINT32 ReturnVal;
+  custom_type Expected_b;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_varargs_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  UINT32 ReturnVal;
+  custom_type Expected_a;
+
+} CMOCK_foo_varargs_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_char_strings_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char* ReturnVal;
+  const char* Expected_a;
+  const char* Expected_b;
+
+} CMOCK_foo_char_strings_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_basic_expect_and_return_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foo_varargs_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foo_char_strings_CallInstance;
+} Mock;
+
+
+void mock_basic_expect_and_return_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foo_varargs_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_varargs);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foo_char_strings_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_char_strings);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_basic_expect_and_return_mockable_Init(void)
+{
+  mock_basic_expect_and_return_mockable_Destroy();
+}
+
+void mock_basic_expect_and_return_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+UINT32 foo(custom_type a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_a), (void*)(&a), sizeof(custom_type), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, custom_type a);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, custom_type a)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(custom_type[sizeof(a) == sizeof(custom_type) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+UINT32 bar(custom_type b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_bar,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_b), (void*)(&b), sizeof(custom_type), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, custom_type b);
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, custom_type b)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_b), (void*)(&b),
+         sizeof(custom_type[sizeof(b) == sizeof(custom_type) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type b, UINT32 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_bar(cmock_call_instance, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_bar(cmock_call_instance, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+UINT32 foo_varargs(custom_type a, ...)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_varargs_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_varargs);
+  cmock_call_instance = (CMOCK_foo_varargs_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_varargs_CallInstance);
+  Mock.foo_varargs_CallInstance = CMock_Guts_MemNext(Mock.foo_varargs_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_varargs,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_a), (void*)(&a), sizeof(custom_type), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo_varargs(CMOCK_foo_varargs_CALL_INSTANCE* cmock_call_instance, custom_type a);
+void CMockExpectParameters_foo_varargs(CMOCK_foo_varargs_CALL_INSTANCE* cmock_call_instance, custom_type a)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(custom_type[sizeof(a) == sizeof(custom_type) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_varargs_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_varargs_CALL_INSTANCE));
+  CMOCK_foo_varargs_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_varargs_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_varargs_CallInstance = CMock_Guts_MemChain(Mock.foo_varargs_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_varargs(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void foo_varargs_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_varargs_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_varargs_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_varargs_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_varargs_CallInstance = CMock_Guts_MemChain(Mock.foo_varargs_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_varargs_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_varargs(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+const char* foo_char_strings(const char* a, const char* b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_char_strings);
+  cmock_call_instance = (CMOCK_foo_char_strings_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_char_strings_CallInstance);
+  Mock.foo_char_strings_CallInstance = CMock_Guts_MemNext(Mock.foo_char_strings_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_char_strings,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_char_strings,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo_char_strings(CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance, const char* a, const char* b);
+void CMockExpectParameters_foo_char_strings(CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance, const char* a, const char* b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void foo_char_strings_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* a, const char* b, const char* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_char_strings_CALL_INSTANCE));
+  CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_char_strings_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_char_strings_CallInstance = CMock_Guts_MemChain(Mock.foo_char_strings_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_char_strings(cmock_call_instance, a, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void foo_char_strings_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_char_strings_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_char_strings_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_char_strings_CallInstance = CMock_Guts_MemChain(Mock.foo_char_strings_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_char_strings_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_char_strings(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,84 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_BASIC_EXPECT_AND_RETURN_MOCKABLE_H
+#define _MOCK_BASIC_EXPECT_AND_RETURN_MOCKABLE_H
+
+#include "unity.h"
+#include "basic_expect_and_return_types.h"
+#include "basic_expect_and_return_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_basic_expect_and_return_mockable_Init(void);
+void mock_basic_expect_and_return_mockable_Destroy(void);
+void mock_basic_expect_and_return_mockable_Verify(void);
+
+
+
+
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  custom_type a;
+  UINT32 ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define bar_Expect(b) TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(b, cmock_retval) bar_CMockExpectAndReturn(__LINE__, b, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type b, UINT32 cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  custom_type b;
+  UINT32 ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_varargs_Expect(a) TEST_FAIL_MESSAGE("foo_varargs requires _ExpectAndReturn");
+#define foo_varargs_ExpectAndReturn(a, cmock_retval) foo_varargs_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_varargs_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return);
+typedef struct _CMOCK_foo_varargs_EXPECT_ROW
+{
+  custom_type a;
+  UINT32 ReturnVal;
+} foo_varargs_ExpectRow;
+#define foo_varargs_ExpectTable(cmock_rows, cmock_count) foo_varargs_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_varargs_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_varargs_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_char_strings_Expect(a, b) TEST_FAIL_MESSAGE("foo_char_strings requires _ExpectAndReturn");
+#define foo_char_strings_ExpectAndReturn(a, b, cmock_retval) foo_char_strings_CMockExpectAndReturn(__LINE__, a, b, cmock_retval)
+void foo_char_strings_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* a, const char* b, const char* cmock_to_return);
+typedef struct _CMOCK_foo_char_strings_EXPECT_ROW
+{
+  const char* a;
+  const char* b;
+  const char* ReturnVal;
+} foo_char_strings_ExpectRow;
+#define foo_char_strings_ExpectTable(cmock_rows, cmock_count) foo_char_strings_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_char_strings_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_char_strings_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
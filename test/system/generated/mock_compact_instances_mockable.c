@@ -0,0 +1,436 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_compact_instances_mockable.h"
+
+static const char* CMockString_count = "count";
+static const char* CMockString_data = "data";
+static const char* CMockString_fill = "fill";
+static const char* CMockString_length = "length";
+static const char* CMockString_send = "send";
+static const char* CMockString_tag = "tag";
+static const char* CMockString_values = "values";
+static const char* CMockString_where = "where";
+
+typedef struct _CMOCK_fill_CALL_INSTANCE
+{
+  int* Expected_values;
+  POINT_T* Expected_where;
+  int const* ReturnThruPtr_values_Val;
+  size_t ReturnThruPtr_values_Size;
+  POINT_T const* ReturnThruPtr_where_Val;
+  size_t ReturnThruPtr_where_Size;
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_count;
+  CMOCK_COMPACT_DEPTH_TYPE Expected_values_Depth;
+  CMOCK_COMPACT_DEPTH_TYPE Expected_where_Depth;
+  char ReturnVal;
+  char Expected_tag;
+  unsigned int ExpectAnyArgsBool : 1;
+  unsigned int ReturnThruPtr_values_Used : 1;
+  unsigned int ReturnThruPtr_where_Used : 1;
+  unsigned int IgnoreArg_values : 1;
+  unsigned int IgnoreArg_count : 1;
+  unsigned int IgnoreArg_tag : 1;
+  unsigned int IgnoreArg_where : 1;
+
+} CMOCK_fill_CALL_INSTANCE;
+
+typedef struct _CMOCK_send_CALL_INSTANCE
+{
+  const short* Expected_data;
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_length;
+  CMOCK_COMPACT_DEPTH_TYPE Expected_data_Depth;
+  unsigned int ExpectAnyArgsBool : 1;
+  unsigned int IgnoreArg_data : 1;
+  unsigned int IgnoreArg_length : 1;
+
+} CMOCK_send_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_compact_instances_mockableInstance
+{
+  char fill_FinalReturn;
+  unsigned int fill_IgnoreBool : 1;
+  CMOCK_MEM_INDEX_TYPE fill_CallInstance;
+  unsigned int send_IgnoreBool : 1;
+  CMOCK_MEM_INDEX_TYPE send_CallInstance;
+} Mock;
+
+
+void mock_compact_instances_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.fill_CallInstance;
+  if (Mock.fill_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_fill);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.send_CallInstance;
+  if (Mock.send_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_send);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_compact_instances_mockable_Init(void)
+{
+  mock_compact_instances_mockable_Destroy();
+}
+
+void mock_compact_instances_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+char fill(int* values, int count, char tag, POINT_T* where)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_fill);
+  cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.fill_CallInstance);
+  Mock.fill_CallInstance = CMock_Guts_MemNext(Mock.fill_CallInstance);
+  if (Mock.fill_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.fill_FinalReturn;
+  Mock.fill_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_values)
+  {
+    UNITY_SET_DETAILS(CMockString_fill,CMockString_values);
+    if (cmock_call_instance->Expected_values == NULL)
+      { UNITY_TEST_ASSERT_NULL(values, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_values, values, cmock_call_instance->Expected_values_Depth, cmock_line, CMockStringMismatch); }
+  }
+  if (!cmock_call_instance->IgnoreArg_count)
+  {
+    UNITY_SET_DETAILS(CMockString_fill,CMockString_count);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_count, count, cmock_line, CMockStringMismatch);
+  }
+  if (!cmock_call_instance->IgnoreArg_tag)
+  {
+    UNITY_SET_DETAILS(CMockString_fill,CMockString_tag);
+    UNITY_TEST_ASSERT_EQUAL_INT8(cmock_call_instance->Expected_tag, tag, cmock_line, CMockStringMismatch);
+  }
+  if (!cmock_call_instance->IgnoreArg_where)
+  {
+    UNITY_SET_DETAILS(CMockString_fill,CMockString_where);
+    if (cmock_call_instance->Expected_where == NULL)
+      { UNITY_TEST_ASSERT_NULL(where, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_where), (void*)(where), sizeof(POINT_T), cmock_call_instance->Expected_where_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_values_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(values, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)values, (const void*)cmock_call_instance->ReturnThruPtr_values_Val, 
+      cmock_call_instance->ReturnThruPtr_values_Size);
+  }
+  if (cmock_call_instance->ReturnThruPtr_where_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(where, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)where, (const void*)cmock_call_instance->ReturnThruPtr_where_Val, 
+      cmock_call_instance->ReturnThruPtr_where_Size);
+  }  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_fill(CMOCK_fill_CALL_INSTANCE* cmock_call_instance, int* values, int values_Depth, int count, char tag, POINT_T* where, int where_Depth);
+void CMockExpectParameters_fill(CMOCK_fill_CALL_INSTANCE* cmock_call_instance, int* values, int values_Depth, int count, char tag, POINT_T* where, int where_Depth)
+{
+  cmock_call_instance->Expected_values = values;
+  cmock_call_instance->Expected_values_Depth = values_Depth;
+  cmock_call_instance->IgnoreArg_values = 0;
+  cmock_call_instance->ReturnThruPtr_values_Used = 0;
+  cmock_call_instance->Expected_count = count;
+  cmock_call_instance->IgnoreArg_count = 0;
+  cmock_call_instance->Expected_tag = tag;
+  cmock_call_instance->IgnoreArg_tag = 0;
+  cmock_call_instance->Expected_where = where;
+  cmock_call_instance->Expected_where_Depth = where_Depth;
+  cmock_call_instance->IgnoreArg_where = 0;
+  cmock_call_instance->ReturnThruPtr_where_Used = 0;
+}
+
+void fill_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fill_CALL_INSTANCE));
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fill_CallInstance = CMock_Guts_MemChain(Mock.fill_CallInstance, cmock_guts_index);
+  Mock.fill_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.fill_IgnoreBool = (char)1;
+}
+
+void fill_CMockStopIgnore(void)
+{
+  if(Mock.fill_IgnoreBool)
+    Mock.fill_CallInstance = CMock_Guts_MemNext(Mock.fill_CallInstance);
+  Mock.fill_IgnoreBool = (char)0;
+}
+
+void fill_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fill_CALL_INSTANCE));
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fill_CallInstance = CMock_Guts_MemChain(Mock.fill_CallInstance, cmock_guts_index);
+  Mock.fill_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void fill_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int* values, int count, char tag, POINT_T* where, char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fill_CALL_INSTANCE));
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fill_CallInstance = CMock_Guts_MemChain(Mock.fill_CallInstance, cmock_guts_index);
+  Mock.fill_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_fill(cmock_call_instance, values, 1, count, tag, where, 1);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void fill_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fill_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_fill_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.fill_CallInstance = CMock_Guts_MemChain(Mock.fill_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.fill_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_fill(cmock_call_instance, cmock_rows[cmock_row].values, 1, cmock_rows[cmock_row].count, cmock_rows[cmock_row].tag, cmock_rows[cmock_row].where, 1);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void fill_CMockExpectWithArrayAndReturn(UNITY_LINE_TYPE cmock_line, int* values, int values_Depth, int count, char tag, POINT_T* where, int where_Depth, char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fill_CALL_INSTANCE));
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fill_CallInstance = CMock_Guts_MemChain(Mock.fill_CallInstance, cmock_guts_index);
+  Mock.fill_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_fill(cmock_call_instance, values, values_Depth, count, tag, where, where_Depth);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void fill_CMockReturnMemThruPtr_values(UNITY_LINE_TYPE cmock_line, int const* values, size_t cmock_size)
+{
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fill_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_values_Used = 1;
+  cmock_call_instance->ReturnThruPtr_values_Val = values;
+  cmock_call_instance->ReturnThruPtr_values_Size = cmock_size;
+}
+
+
+void fill_CMockReturnMemThruPtr_where(UNITY_LINE_TYPE cmock_line, POINT_T const* where, size_t cmock_size)
+{
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fill_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_where_Used = 1;
+  cmock_call_instance->ReturnThruPtr_where_Val = where;
+  cmock_call_instance->ReturnThruPtr_where_Size = cmock_size;
+}
+
+void fill_CMockIgnoreArg_values(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fill_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_values = 1;
+}
+
+void fill_CMockIgnoreArg_count(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fill_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_count = 1;
+}
+
+void fill_CMockIgnoreArg_tag(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fill_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_tag = 1;
+}
+
+void fill_CMockIgnoreArg_where(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_fill_CALL_INSTANCE* cmock_call_instance = (CMOCK_fill_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.fill_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_where = 1;
+}
+
+void send(const short* data, int length)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_send);
+  cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.send_CallInstance);
+  Mock.send_CallInstance = CMock_Guts_MemNext(Mock.send_CallInstance);
+  if (Mock.send_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_data)
+  {
+    UNITY_SET_DETAILS(CMockString_send,CMockString_data);
+    if (cmock_call_instance->Expected_data == NULL)
+      { UNITY_TEST_ASSERT_NULL(data, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT16_ARRAY(cmock_call_instance->Expected_data, data, cmock_call_instance->Expected_data_Depth, cmock_line, CMockStringMismatch); }
+  }
+  if (!cmock_call_instance->IgnoreArg_length)
+  {
+    UNITY_SET_DETAILS(CMockString_send,CMockString_length);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_length, length, cmock_line, CMockStringMismatch);
+  }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_send(CMOCK_send_CALL_INSTANCE* cmock_call_instance, const short* data, int data_Depth, int length);
+void CMockExpectParameters_send(CMOCK_send_CALL_INSTANCE* cmock_call_instance, const short* data, int data_Depth, int length)
+{
+  cmock_call_instance->Expected_data = data;
+  cmock_call_instance->Expected_data_Depth = data_Depth;
+  cmock_call_instance->IgnoreArg_data = 0;
+  cmock_call_instance->Expected_length = length;
+  cmock_call_instance->IgnoreArg_length = 0;
+}
+
+void send_CMockIgnore(void)
+{
+  Mock.send_IgnoreBool = (char)1;
+}
+
+void send_CMockStopIgnore(void)
+{
+  Mock.send_IgnoreBool = (char)0;
+}
+
+void send_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  Mock.send_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void send_CMockExpect(UNITY_LINE_TYPE cmock_line, const short* data, int length)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  Mock.send_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_send(cmock_call_instance, data, length, length);
+}
+
+void send_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const send_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_send_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.send_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_send(cmock_call_instance, cmock_rows[cmock_row].data, cmock_rows[cmock_row].length, cmock_rows[cmock_row].length);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void send_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, const short* data, int data_Depth, int length)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  Mock.send_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_send(cmock_call_instance, data, data_Depth, length);
+}
+
+void send_CMockIgnoreArg_data(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.send_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_data = 1;
+}
+
+void send_CMockIgnoreArg_length(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.send_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_length = 1;
+}
+
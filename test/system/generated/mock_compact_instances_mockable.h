@@ -0,0 +1,117 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_COMPACT_INSTANCES_MOCKABLE_H
+#define _MOCK_COMPACT_INSTANCES_MOCKABLE_H
+
+#include "unity.h"
+#include "compact_instances_types.h"
+#include "compact_instances_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_compact_instances_mockable_Init(void);
+void mock_compact_instances_mockable_Destroy(void);
+void mock_compact_instances_mockable_Verify(void);
+
+
+
+
+
+#define fill_Ignore() TEST_FAIL_MESSAGE("fill requires _IgnoreAndReturn");
+#define fill_IgnoreAndReturn(cmock_retval) fill_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void fill_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, char cmock_to_return);
+#define fill_StopIgnore() fill_CMockStopIgnore()
+void fill_CMockStopIgnore(void);
+
+#define fill_ExpectAnyArgs() TEST_FAIL_MESSAGE("fill requires _ExpectAnyArgsAndReturn");
+#define fill_ExpectAnyArgsAndReturn(cmock_retval) fill_CMockExpectAnyArgsAndReturn(__LINE__, cmock_retval)
+void fill_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, char cmock_to_return);
+#define fill_Expect(values, count, tag, where) TEST_FAIL_MESSAGE("fill requires _ExpectAndReturn");
+#define fill_ExpectAndReturn(values, count, tag, where, cmock_retval) fill_CMockExpectAndReturn(__LINE__, values, count, tag, where, cmock_retval)
+void fill_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int* values, int count, char tag, POINT_T* where, char cmock_to_return);
+typedef struct _CMOCK_fill_EXPECT_ROW
+{
+  int* values;
+  int count;
+  char tag;
+  POINT_T* where;
+  char ReturnVal;
+} fill_ExpectRow;
+#define fill_ExpectTable(cmock_rows, cmock_count) fill_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void fill_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fill_ExpectRow* cmock_rows, size_t cmock_count);
+#define fill_ExpectWithArray(values, values_Depth, count, tag, where, where_Depth) TEST_FAIL_MESSAGE("fill requires _ExpectWithArrayAndReturn");
+#define fill_ExpectWithArrayAndReturn(values, values_Depth, count, tag, where, where_Depth, cmock_retval) fill_CMockExpectWithArrayAndReturn(__LINE__, values, (values_Depth), count, tag, where, (where_Depth), cmock_retval)
+void fill_CMockExpectWithArrayAndReturn(UNITY_LINE_TYPE cmock_line, int* values, int values_Depth, int count, char tag, POINT_T* where, int where_Depth, char cmock_to_return);
+#define fill_ReturnThruPtr_values(values) fill_CMockReturnMemThruPtr_values(__LINE__, values, sizeof(int))
+#define fill_ReturnArrayThruPtr_values(values, cmock_len) fill_CMockReturnMemThruPtr_values(__LINE__, values, (cmock_len * sizeof(*values)))
+#define fill_ReturnMemThruPtr_values(values, cmock_size) fill_CMockReturnMemThruPtr_values(__LINE__, values, (cmock_size))
+void fill_CMockReturnMemThruPtr_values(UNITY_LINE_TYPE cmock_line, int const* values, size_t cmock_size);
+#define fill_ReturnThruPtr_where(where) fill_CMockReturnMemThruPtr_where(__LINE__, where, sizeof(POINT_T))
+#define fill_ReturnArrayThruPtr_where(where, cmock_len) fill_CMockReturnMemThruPtr_where(__LINE__, where, (cmock_len * sizeof(*where)))
+#define fill_ReturnMemThruPtr_where(where, cmock_size) fill_CMockReturnMemThruPtr_where(__LINE__, where, (cmock_size))
+void fill_CMockReturnMemThruPtr_where(UNITY_LINE_TYPE cmock_line, POINT_T const* where, size_t cmock_size);
+#define fill_IgnoreArg_values() fill_CMockIgnoreArg_values(__LINE__)
+void fill_CMockIgnoreArg_values(UNITY_LINE_TYPE cmock_line);
+
+#define fill_IgnoreArg_count() fill_CMockIgnoreArg_count(__LINE__)
+void fill_CMockIgnoreArg_count(UNITY_LINE_TYPE cmock_line);
+
+#define fill_IgnoreArg_tag() fill_CMockIgnoreArg_tag(__LINE__)
+void fill_CMockIgnoreArg_tag(UNITY_LINE_TYPE cmock_line);
+
+#define fill_IgnoreArg_where() fill_CMockIgnoreArg_where(__LINE__)
+void fill_CMockIgnoreArg_where(UNITY_LINE_TYPE cmock_line);
+
+#define send_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("send requires _Ignore (not AndReturn)");
+#define send_Ignore() send_CMockIgnore()
+void send_CMockIgnore(void);
+#define send_StopIgnore() send_CMockStopIgnore()
+void send_CMockStopIgnore(void);
+
+#define send_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("send requires _ExpectAnyArgs (not AndReturn)");
+#define send_ExpectAnyArgs() send_CMockExpectAnyArgs(__LINE__)
+void send_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define send_ExpectAndReturn(data, length, cmock_retval) TEST_FAIL_MESSAGE("send requires _Expect (not AndReturn)");
+#define send_Expect(data, length) send_CMockExpect(__LINE__, data, length)
+void send_CMockExpect(UNITY_LINE_TYPE cmock_line, const short* data, int length);
+typedef struct _CMOCK_send_EXPECT_ROW
+{
+  const short* data;
+  int length;
+} send_ExpectRow;
+#define send_ExpectTable(cmock_rows, cmock_count) send_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void send_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const send_ExpectRow* cmock_rows, size_t cmock_count);
+#define send_ExpectWithArrayAndReturn(data, data_Depth, length, cmock_retval) TEST_FAIL_MESSAGE("send requires _ExpectWithArray (not AndReturn)");
+#define send_ExpectWithArray(data, data_Depth, length) send_CMockExpectWithArray(__LINE__, data, (data_Depth), length)
+void send_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, const short* data, int data_Depth, int length);
+
+#define send_IgnoreArg_data() send_CMockIgnoreArg_data(__LINE__)
+void send_CMockIgnoreArg_data(UNITY_LINE_TYPE cmock_line);
+
+#define send_IgnoreArg_length() send_CMockIgnoreArg_length(__LINE__)
+void send_CMockIgnoreArg_length(UNITY_LINE_TYPE cmock_line);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
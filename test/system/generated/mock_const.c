@@ -0,0 +1,561 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_const.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_c = "c";
+static const char* CMockString_cmock_arg2 = "cmock_arg2";
+static const char* CMockString_const_retval1 = "const_retval1";
+static const char* CMockString_const_retval2 = "const_retval2";
+static const char* CMockString_const_retval5 = "const_retval5";
+static const char* CMockString_const_retval6 = "const_retval6";
+static const char* CMockString_const_retval9 = "const_retval9";
+static const char* CMockString_const_retvalA = "const_retvalA";
+static const char* CMockString_const_variants1 = "const_variants1";
+static const char* CMockString_const_variants2 = "const_variants2";
+static const char* CMockString_param1 = "param1";
+static const char* CMockString_param2 = "param2";
+static const char* CMockString_param3 = "param3";
+
+typedef struct _CMOCK_const_variants1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char* Expected_a;
+  int Expected_cmock_arg2;
+  unsigned short const* Expected_c;
+
+} CMOCK_const_variants1_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_variants2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  struct _DUMMY_T const* Expected_param1;
+  const unsigned long int const* Expected_param2;
+  const struct _DUMMY_T const* Expected_param3;
+
+} CMOCK_const_variants2_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_retval1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const int* ReturnVal;
+
+} CMOCK_const_retval1_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_retval2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int const* ReturnVal;
+
+} CMOCK_const_retval2_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_retval5_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const int* ReturnVal;
+
+} CMOCK_const_retval5_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_retval6_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int const* ReturnVal;
+
+} CMOCK_const_retval6_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_retval9_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const int* ReturnVal;
+
+} CMOCK_const_retval9_CALL_INSTANCE;
+
+typedef struct _CMOCK_const_retvalA_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int const* ReturnVal;
+
+} CMOCK_const_retvalA_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_constInstance
+{
+  CMOCK_MEM_INDEX_TYPE const_variants1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_variants2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_retval1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_retval2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_retval5_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_retval6_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_retval9_CallInstance;
+  CMOCK_MEM_INDEX_TYPE const_retvalA_CallInstance;
+} Mock;
+
+
+void mock_const_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.const_variants1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_variants1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_variants2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_variants2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_retval1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_retval1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_retval2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_retval2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_retval5_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_retval5);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_retval6_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_retval6);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_retval9_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_retval9);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.const_retvalA_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_const_retvalA);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_const_Init(void)
+{
+  mock_const_Destroy();
+}
+
+void mock_const_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void const_variants1(const char* a, int const cmock_arg2, unsigned short const* c)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_variants1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_variants1);
+  cmock_call_instance = (CMOCK_const_variants1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_variants1_CallInstance);
+  Mock.const_variants1_CallInstance = CMock_Guts_MemNext(Mock.const_variants1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_const_variants1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_const_variants1,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_cmock_arg2, cmock_arg2, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_const_variants1,CMockString_c);
+    if (cmock_call_instance->Expected_c == NULL)
+      { UNITY_TEST_ASSERT_NULL(c, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX16_ARRAY(cmock_call_instance->Expected_c, c, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_const_variants1(CMOCK_const_variants1_CALL_INSTANCE* cmock_call_instance, const char* a, int const cmock_arg2, unsigned short const* c);
+void CMockExpectParameters_const_variants1(CMOCK_const_variants1_CALL_INSTANCE* cmock_call_instance, const char* a, int const cmock_arg2, unsigned short const* c)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_cmock_arg2 = cmock_arg2;
+  cmock_call_instance->Expected_c = c;
+}
+
+void const_variants1_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a, int const cmock_arg2, unsigned short const* c)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_variants1_CALL_INSTANCE));
+  CMOCK_const_variants1_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_variants1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_variants1_CallInstance = CMock_Guts_MemChain(Mock.const_variants1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_const_variants1(cmock_call_instance, a, cmock_arg2, c);
+}
+
+void const_variants1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_variants1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_variants1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_variants1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_variants1_CallInstance = CMock_Guts_MemChain(Mock.const_variants1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_variants1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_const_variants1(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].cmock_arg2, cmock_rows[cmock_row].c);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void const_variants2(struct _DUMMY_T const* const param1, const unsigned long int const* const param2, const struct _DUMMY_T const* param3)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_variants2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_variants2);
+  cmock_call_instance = (CMOCK_const_variants2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_variants2_CallInstance);
+  Mock.const_variants2_CallInstance = CMock_Guts_MemNext(Mock.const_variants2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_const_variants2,CMockString_param1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_param1), (void*)(param1), sizeof(struct _DUMMY_T const), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_const_variants2,CMockString_param2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_param2), (void*)(param2), sizeof(const unsigned long int const), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_const_variants2,CMockString_param3);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_param3), (void*)(param3), sizeof(const struct _DUMMY_T const), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_const_variants2(CMOCK_const_variants2_CALL_INSTANCE* cmock_call_instance, struct _DUMMY_T const* const param1, const unsigned long int const* const param2, const struct _DUMMY_T const* param3);
+void CMockExpectParameters_const_variants2(CMOCK_const_variants2_CALL_INSTANCE* cmock_call_instance, struct _DUMMY_T const* const param1, const unsigned long int const* const param2, const struct _DUMMY_T const* param3)
+{
+  cmock_call_instance->Expected_param1 = param1;
+  cmock_call_instance->Expected_param2 = param2;
+  cmock_call_instance->Expected_param3 = param3;
+}
+
+void const_variants2_CMockExpect(UNITY_LINE_TYPE cmock_line, struct _DUMMY_T const* const param1, const unsigned long int const* const param2, const struct _DUMMY_T const* param3)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_variants2_CALL_INSTANCE));
+  CMOCK_const_variants2_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_variants2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_variants2_CallInstance = CMock_Guts_MemChain(Mock.const_variants2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_const_variants2(cmock_call_instance, param1, param2, param3);
+}
+
+void const_variants2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_variants2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_variants2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_variants2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_variants2_CallInstance = CMock_Guts_MemChain(Mock.const_variants2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_variants2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_const_variants2(cmock_call_instance, cmock_rows[cmock_row].param1, cmock_rows[cmock_row].param2, cmock_rows[cmock_row].param3);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+const int* const_retval1(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_retval1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_retval1);
+  cmock_call_instance = (CMOCK_const_retval1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_retval1_CallInstance);
+  Mock.const_retval1_CallInstance = CMock_Guts_MemNext(Mock.const_retval1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void const_retval1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const int* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_retval1_CALL_INSTANCE));
+  CMOCK_const_retval1_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_retval1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_retval1_CallInstance = CMock_Guts_MemChain(Mock.const_retval1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void const_retval1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_retval1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_retval1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_retval1_CallInstance = CMock_Guts_MemChain(Mock.const_retval1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_retval1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int const* const_retval2(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_retval2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_retval2);
+  cmock_call_instance = (CMOCK_const_retval2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_retval2_CallInstance);
+  Mock.const_retval2_CallInstance = CMock_Guts_MemNext(Mock.const_retval2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void const_retval2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int const* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_retval2_CALL_INSTANCE));
+  CMOCK_const_retval2_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_retval2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_retval2_CallInstance = CMock_Guts_MemChain(Mock.const_retval2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void const_retval2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_retval2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_retval2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_retval2_CallInstance = CMock_Guts_MemChain(Mock.const_retval2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_retval2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+const int* const_retval5(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_retval5_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_retval5);
+  cmock_call_instance = (CMOCK_const_retval5_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_retval5_CallInstance);
+  Mock.const_retval5_CallInstance = CMock_Guts_MemNext(Mock.const_retval5_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void const_retval5_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const int* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_retval5_CALL_INSTANCE));
+  CMOCK_const_retval5_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_retval5_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_retval5_CallInstance = CMock_Guts_MemChain(Mock.const_retval5_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void const_retval5_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval5_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_retval5_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_retval5_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_retval5_CallInstance = CMock_Guts_MemChain(Mock.const_retval5_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_retval5_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int const* const_retval6(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_retval6_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_retval6);
+  cmock_call_instance = (CMOCK_const_retval6_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_retval6_CallInstance);
+  Mock.const_retval6_CallInstance = CMock_Guts_MemNext(Mock.const_retval6_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void const_retval6_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int const* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_retval6_CALL_INSTANCE));
+  CMOCK_const_retval6_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_retval6_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_retval6_CallInstance = CMock_Guts_MemChain(Mock.const_retval6_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void const_retval6_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval6_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_retval6_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_retval6_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_retval6_CallInstance = CMock_Guts_MemChain(Mock.const_retval6_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_retval6_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+const int* const_retval9(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_retval9_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_retval9);
+  cmock_call_instance = (CMOCK_const_retval9_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_retval9_CallInstance);
+  Mock.const_retval9_CallInstance = CMock_Guts_MemNext(Mock.const_retval9_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void const_retval9_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const int* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_retval9_CALL_INSTANCE));
+  CMOCK_const_retval9_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_retval9_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_retval9_CallInstance = CMock_Guts_MemChain(Mock.const_retval9_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void const_retval9_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval9_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_retval9_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_retval9_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_retval9_CallInstance = CMock_Guts_MemChain(Mock.const_retval9_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_retval9_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int const* const_retvalA(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_const_retvalA_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_const_retvalA);
+  cmock_call_instance = (CMOCK_const_retvalA_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.const_retvalA_CallInstance);
+  Mock.const_retvalA_CallInstance = CMock_Guts_MemNext(Mock.const_retvalA_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void const_retvalA_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int const* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_const_retvalA_CALL_INSTANCE));
+  CMOCK_const_retvalA_CALL_INSTANCE* cmock_call_instance = (CMOCK_const_retvalA_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.const_retvalA_CallInstance = CMock_Guts_MemChain(Mock.const_retvalA_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void const_retvalA_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retvalA_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_const_retvalA_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_const_retvalA_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.const_retvalA_CallInstance = CMock_Guts_MemChain(Mock.const_retvalA_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_const_retvalA_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,118 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_CONST_H
+#define _MOCK_CONST_H
+
+#include "unity.h"
+#include "const.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_const_Init(void);
+void mock_const_Destroy(void);
+void mock_const_Verify(void);
+
+
+
+
+#define const_variants1_ExpectAndReturn(a, cmock_arg2, c, cmock_retval) TEST_FAIL_MESSAGE("const_variants1 requires _Expect (not AndReturn)");
+#define const_variants1_Expect(a, cmock_arg2, c) const_variants1_CMockExpect(__LINE__, a, cmock_arg2, c)
+void const_variants1_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a, int const cmock_arg2, unsigned short const* c);
+typedef struct _CMOCK_const_variants1_EXPECT_ROW
+{
+  const char* a;
+  int cmock_arg2;
+  unsigned short const* c;
+} const_variants1_ExpectRow;
+#define const_variants1_ExpectTable(cmock_rows, cmock_count) const_variants1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_variants1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_variants1_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_variants2_ExpectAndReturn(param1, param2, param3, cmock_retval) TEST_FAIL_MESSAGE("const_variants2 requires _Expect (not AndReturn)");
+#define const_variants2_Expect(param1, param2, param3) const_variants2_CMockExpect(__LINE__, param1, param2, param3)
+void const_variants2_CMockExpect(UNITY_LINE_TYPE cmock_line, struct _DUMMY_T const* const param1, const unsigned long int const* const param2, const struct _DUMMY_T const* param3);
+typedef struct _CMOCK_const_variants2_EXPECT_ROW
+{
+  struct _DUMMY_T const* param1;
+  const unsigned long int const* param2;
+  const struct _DUMMY_T const* param3;
+} const_variants2_ExpectRow;
+#define const_variants2_ExpectTable(cmock_rows, cmock_count) const_variants2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_variants2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_variants2_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_retval1_Expect() TEST_FAIL_MESSAGE("const_retval1 requires _ExpectAndReturn");
+#define const_retval1_ExpectAndReturn(cmock_retval) const_retval1_CMockExpectAndReturn(__LINE__, cmock_retval)
+void const_retval1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const int* cmock_to_return);
+typedef struct _CMOCK_const_retval1_EXPECT_ROW
+{
+  const int* ReturnVal;
+} const_retval1_ExpectRow;
+#define const_retval1_ExpectTable(cmock_rows, cmock_count) const_retval1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_retval1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval1_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_retval2_Expect() TEST_FAIL_MESSAGE("const_retval2 requires _ExpectAndReturn");
+#define const_retval2_ExpectAndReturn(cmock_retval) const_retval2_CMockExpectAndReturn(__LINE__, cmock_retval)
+void const_retval2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int const* cmock_to_return);
+typedef struct _CMOCK_const_retval2_EXPECT_ROW
+{
+  int const* ReturnVal;
+} const_retval2_ExpectRow;
+#define const_retval2_ExpectTable(cmock_rows, cmock_count) const_retval2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_retval2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval2_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_retval5_Expect() TEST_FAIL_MESSAGE("const_retval5 requires _ExpectAndReturn");
+#define const_retval5_ExpectAndReturn(cmock_retval) const_retval5_CMockExpectAndReturn(__LINE__, cmock_retval)
+void const_retval5_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const int* cmock_to_return);
+typedef struct _CMOCK_const_retval5_EXPECT_ROW
+{
+  const int* ReturnVal;
+} const_retval5_ExpectRow;
+#define const_retval5_ExpectTable(cmock_rows, cmock_count) const_retval5_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_retval5_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval5_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_retval6_Expect() TEST_FAIL_MESSAGE("const_retval6 requires _ExpectAndReturn");
+#define const_retval6_ExpectAndReturn(cmock_retval) const_retval6_CMockExpectAndReturn(__LINE__, cmock_retval)
+void const_retval6_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int const* cmock_to_return);
+typedef struct _CMOCK_const_retval6_EXPECT_ROW
+{
+  int const* ReturnVal;
+} const_retval6_ExpectRow;
+#define const_retval6_ExpectTable(cmock_rows, cmock_count) const_retval6_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_retval6_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval6_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_retval9_Expect() TEST_FAIL_MESSAGE("const_retval9 requires _ExpectAndReturn");
+#define const_retval9_ExpectAndReturn(cmock_retval) const_retval9_CMockExpectAndReturn(__LINE__, cmock_retval)
+void const_retval9_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const int* cmock_to_return);
+typedef struct _CMOCK_const_retval9_EXPECT_ROW
+{
+  const int* ReturnVal;
+} const_retval9_ExpectRow;
+#define const_retval9_ExpectTable(cmock_rows, cmock_count) const_retval9_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_retval9_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retval9_ExpectRow* cmock_rows, size_t cmock_count);
+#define const_retvalA_Expect() TEST_FAIL_MESSAGE("const_retvalA requires _ExpectAndReturn");
+#define const_retvalA_ExpectAndReturn(cmock_retval) const_retvalA_CMockExpectAndReturn(__LINE__, cmock_retval)
+void const_retvalA_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int const* cmock_to_return);
+typedef struct _CMOCK_const_retvalA_EXPECT_ROW
+{
+  int const* ReturnVal;
+} const_retvalA_ExpectRow;
+#define const_retvalA_ExpectTable(cmock_rows, cmock_count) const_retvalA_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void const_retvalA_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const const_retvalA_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
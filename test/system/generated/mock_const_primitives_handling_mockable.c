@@ -0,0 +1,198 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_const_primitives_handling_mockable.h"
+
+static const char* CMockString_bar = "bar";
+static const char* CMockString_cmock_arg1 = "cmock_arg1";
+static const char* CMockString_cmock_arg2 = "cmock_arg2";
+static const char* CMockString_cmock_arg3 = "cmock_arg3";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_param1 = "param1";
+static const char* CMockString_param2 = "param2";
+static const char* CMockString_param3 = "param3";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char const* Expected_cmock_arg1;
+  char* Expected_cmock_arg2;
+  const char* Expected_cmock_arg3;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char const* Expected_param1;
+  char* Expected_param2;
+  const char* Expected_param3;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_const_primitives_handling_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+} Mock;
+
+
+void mock_const_primitives_handling_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_const_primitives_handling_mockable_Init(void)
+{
+  mock_const_primitives_handling_mockable_Destroy();
+}
+
+void mock_const_primitives_handling_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void foo(char const* cmock_arg1, char* const cmock_arg2, const char* cmock_arg3)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_cmock_arg1, cmock_arg1, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_cmock_arg2, cmock_arg2, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_cmock_arg3);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_cmock_arg3, cmock_arg3, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, char const* cmock_arg1, char* const cmock_arg2, const char* cmock_arg3);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, char const* cmock_arg1, char* const cmock_arg2, const char* cmock_arg3)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+  cmock_call_instance->Expected_cmock_arg2 = cmock_arg2;
+  cmock_call_instance->Expected_cmock_arg3 = cmock_arg3;
+}
+
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, char const* cmock_arg1, char* const cmock_arg2, const char* cmock_arg3)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, cmock_arg1, cmock_arg2, cmock_arg3);
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2, cmock_rows[cmock_row].cmock_arg3);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void bar(char const* param1, char* const param2, const char* param3)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_bar,CMockString_param1);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_param1, param1, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_bar,CMockString_param2);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_param2, param2, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_bar,CMockString_param3);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_param3, param3, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, char const* param1, char* const param2, const char* param3);
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, char const* param1, char* const param2, const char* param3)
+{
+  cmock_call_instance->Expected_param1 = param1;
+  cmock_call_instance->Expected_param2 = param2;
+  cmock_call_instance->Expected_param3 = param3;
+}
+
+void bar_CMockExpect(UNITY_LINE_TYPE cmock_line, char const* param1, char* const param2, const char* param3)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_bar(cmock_call_instance, param1, param2, param3);
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_bar(cmock_call_instance, cmock_rows[cmock_row].param1, cmock_rows[cmock_row].param2, cmock_rows[cmock_row].param3);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
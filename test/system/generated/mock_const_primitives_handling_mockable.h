@@ -0,0 +1,65 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_CONST_PRIMITIVES_HANDLING_MOCKABLE_H
+#define _MOCK_CONST_PRIMITIVES_HANDLING_MOCKABLE_H
+
+#include "unity.h"
+#include "const_primitives_handling_types.h"
+#include "const_primitives_handling_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_const_primitives_handling_mockable_Init(void);
+void mock_const_primitives_handling_mockable_Destroy(void);
+void mock_const_primitives_handling_mockable_Verify(void);
+
+
+
+
+#define foo_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_arg3, cmock_retval) TEST_FAIL_MESSAGE("foo requires _Expect (not AndReturn)");
+#define foo_Expect(cmock_arg1, cmock_arg2, cmock_arg3) foo_CMockExpect(__LINE__, cmock_arg1, cmock_arg2, cmock_arg3)
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, char const* cmock_arg1, char* const cmock_arg2, const char* cmock_arg3);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  char const* cmock_arg1;
+  char* cmock_arg2;
+  const char* cmock_arg3;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define bar_ExpectAndReturn(param1, param2, param3, cmock_retval) TEST_FAIL_MESSAGE("bar requires _Expect (not AndReturn)");
+#define bar_Expect(param1, param2, param3) bar_CMockExpect(__LINE__, param1, param2, param3)
+void bar_CMockExpect(UNITY_LINE_TYPE cmock_line, char const* param1, char* const param2, const char* param3);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  char const* param1;
+  char* param2;
+  const char* param3;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
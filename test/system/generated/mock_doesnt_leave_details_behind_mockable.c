@@ -0,0 +1,541 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_doesnt_leave_details_behind_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_bar = "bar";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_no_args = "no_args";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  POINT_T* Expected_a;
+  CEXCEPTION_T ExceptionToThrow;
+  int Expected_a_Depth;
+  char ReturnThruPtr_a_Used;
+  POINT_T const* ReturnThruPtr_a_Val;
+  size_t ReturnThruPtr_a_Size;
+  char IgnoreArg_a;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  POINT_T* ReturnVal;
+  int CallOrder;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+typedef struct _CMOCK_no_args_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int CallOrder;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_no_args_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_doesnt_leave_details_behind_mockableInstance
+{
+  char foo_IgnoreBool;
+  char foo_CallbackBool;
+  CMOCK_foo_CALLBACK foo_CallbackFunctionPointer;
+  int foo_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  char bar_IgnoreBool;
+  POINT_T* bar_FinalReturn;
+  char bar_CallbackBool;
+  CMOCK_bar_CALLBACK bar_CallbackFunctionPointer;
+  int bar_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+  char no_args_IgnoreBool;
+  char no_args_CallbackBool;
+  CMOCK_no_args_CALLBACK no_args_CallbackFunctionPointer;
+  int no_args_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE no_args_CallInstance;
+} Mock;
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+void mock_doesnt_leave_details_behind_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (Mock.foo_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (Mock.bar_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.no_args_CallInstance;
+  if (Mock.no_args_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_no_args);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.no_args_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+}
+
+void mock_doesnt_leave_details_behind_mockable_Init(void)
+{
+  mock_doesnt_leave_details_behind_mockable_Destroy();
+}
+
+void mock_doesnt_leave_details_behind_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
+void foo(POINT_T* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  if (Mock.foo_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.foo_CallbackBool &&
+      Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_CallbackFunctionPointer(a);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  if (!cmock_call_instance->IgnoreArg_a)
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_a), (void*)(a), sizeof(POINT_T), cmock_call_instance->Expected_a_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_CallbackFunctionPointer(a);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  if (cmock_call_instance->ReturnThruPtr_a_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(a, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)a, (const void*)cmock_call_instance->ReturnThruPtr_a_Val, 
+      cmock_call_instance->ReturnThruPtr_a_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, POINT_T* a, int a_Depth)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_a_Depth = a_Depth;
+  cmock_call_instance->IgnoreArg_a = 0;
+  cmock_call_instance->ReturnThruPtr_a_Used = 0;
+}
+
+void foo_CMockIgnore(void)
+{
+  Mock.foo_IgnoreBool = (char)1;
+}
+
+void foo_CMockStopIgnore(void)
+{
+  Mock.foo_IgnoreBool = (char)0;
+}
+
+void foo_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foo(cmock_call_instance, a, 1);
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foo_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_AddCallback(CMOCK_foo_CALLBACK Callback)
+{
+  Mock.foo_IgnoreBool = (char)0;
+  Mock.foo_CallbackBool = (char)1;
+  Mock.foo_CallbackFunctionPointer = Callback;
+}
+
+void foo_Stub(CMOCK_foo_CALLBACK Callback)
+{
+  Mock.foo_IgnoreBool = (char)0;
+  Mock.foo_CallbackBool = (char)0;
+  Mock.foo_CallbackFunctionPointer = Callback;
+}
+
+void foo_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, POINT_T* a, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foo(cmock_call_instance, a, 1);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  Mock.foo_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_foo(cmock_call_instance, a, a_Depth);
+}
+
+void foo_CMockReturnMemThruPtr_a(UNITY_LINE_TYPE cmock_line, POINT_T const* a, size_t cmock_size)
+{
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_a_Used = 1;
+  cmock_call_instance->ReturnThruPtr_a_Val = a;
+  cmock_call_instance->ReturnThruPtr_a_Size = cmock_size;
+}
+
+void foo_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_a = 1;
+}
+
+POINT_T* bar(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  if (Mock.bar_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.bar_FinalReturn;
+  Mock.bar_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.bar_CallbackBool &&
+      Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    POINT_T* cmock_cb_ret = Mock.bar_CallbackFunctionPointer();
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.bar_CallbackFunctionPointer();
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void bar_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  Mock.bar_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.bar_IgnoreBool = (char)1;
+}
+
+void bar_CMockStopIgnore(void)
+{
+  if(Mock.bar_IgnoreBool)
+    Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  Mock.bar_IgnoreBool = (char)0;
+}
+
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  Mock.bar_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.bar_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void bar_AddCallback(CMOCK_bar_CALLBACK Callback)
+{
+  Mock.bar_IgnoreBool = (char)0;
+  Mock.bar_CallbackBool = (char)1;
+  Mock.bar_CallbackFunctionPointer = Callback;
+}
+
+void bar_Stub(CMOCK_bar_CALLBACK Callback)
+{
+  Mock.bar_IgnoreBool = (char)0;
+  Mock.bar_CallbackBool = (char)0;
+  Mock.bar_CallbackFunctionPointer = Callback;
+}
+
+void bar_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  Mock.bar_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+void no_args(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_no_args_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_no_args);
+  cmock_call_instance = (CMOCK_no_args_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.no_args_CallInstance);
+  Mock.no_args_CallInstance = CMock_Guts_MemNext(Mock.no_args_CallInstance);
+  if (Mock.no_args_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.no_args_CallbackBool &&
+      Mock.no_args_CallbackFunctionPointer != NULL)
+  {
+    Mock.no_args_CallbackFunctionPointer();
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.no_args_CallbackFunctionPointer != NULL)
+  {
+    Mock.no_args_CallbackFunctionPointer();
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void no_args_CMockIgnore(void)
+{
+  Mock.no_args_IgnoreBool = (char)1;
+}
+
+void no_args_CMockStopIgnore(void)
+{
+  Mock.no_args_IgnoreBool = (char)0;
+}
+
+void no_args_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_args_CALL_INSTANCE));
+  CMOCK_no_args_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_args_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_args_CallInstance = CMock_Guts_MemChain(Mock.no_args_CallInstance, cmock_guts_index);
+  Mock.no_args_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+}
+
+void no_args_AddCallback(CMOCK_no_args_CALLBACK Callback)
+{
+  Mock.no_args_IgnoreBool = (char)0;
+  Mock.no_args_CallbackBool = (char)1;
+  Mock.no_args_CallbackFunctionPointer = Callback;
+}
+
+void no_args_Stub(CMOCK_no_args_CALLBACK Callback)
+{
+  Mock.no_args_IgnoreBool = (char)0;
+  Mock.no_args_CallbackBool = (char)0;
+  Mock.no_args_CallbackFunctionPointer = Callback;
+}
+
+void no_args_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_no_args_CALL_INSTANCE));
+  CMOCK_no_args_CALL_INSTANCE* cmock_call_instance = (CMOCK_no_args_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.no_args_CallInstance = CMock_Guts_MemChain(Mock.no_args_CallInstance, cmock_guts_index);
+  Mock.no_args_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
@@ -0,0 +1,114 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_DOESNT_LEAVE_DETAILS_BEHIND_MOCKABLE_H
+#define _MOCK_DOESNT_LEAVE_DETAILS_BEHIND_MOCKABLE_H
+
+#include "unity.h"
+#include "doesnt_leave_details_behind_types.h"
+#include "doesnt_leave_details_behind_mockable.h"
+#include "CException.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_doesnt_leave_details_behind_mockable_Init(void);
+void mock_doesnt_leave_details_behind_mockable_Destroy(void);
+void mock_doesnt_leave_details_behind_mockable_Verify(void);
+
+
+
+
+
+#define foo_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo requires _Ignore (not AndReturn)");
+#define foo_Ignore() foo_CMockIgnore()
+void foo_CMockIgnore(void);
+#define foo_StopIgnore() foo_CMockStopIgnore()
+void foo_CMockStopIgnore(void);
+
+#define foo_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo requires _ExpectAnyArgs (not AndReturn)");
+#define foo_ExpectAnyArgs() foo_CMockExpectAnyArgs(__LINE__)
+void foo_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define foo_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foo requires _Expect (not AndReturn)");
+#define foo_Expect(a) foo_CMockExpect(__LINE__, a)
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  POINT_T* a;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_foo_CALLBACK)(POINT_T* a);
+void foo_AddCallback(CMOCK_foo_CALLBACK Callback);
+void foo_Stub(CMOCK_foo_CALLBACK Callback);
+#define foo_StubWithCallback foo_Stub
+#define foo_ExpectAndThrow(a, cmock_to_throw) foo_CMockExpectAndThrow(__LINE__, a, cmock_to_throw)
+void foo_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, POINT_T* a, CEXCEPTION_T cmock_to_throw);
+#define foo_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("foo requires _ExpectWithArray (not AndReturn)");
+#define foo_ExpectWithArray(a, a_Depth) foo_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* a, int a_Depth);
+#define foo_ReturnThruPtr_a(a) foo_CMockReturnMemThruPtr_a(__LINE__, a, sizeof(POINT_T))
+#define foo_ReturnArrayThruPtr_a(a, cmock_len) foo_CMockReturnMemThruPtr_a(__LINE__, a, (cmock_len * sizeof(*a)))
+#define foo_ReturnMemThruPtr_a(a, cmock_size) foo_CMockReturnMemThruPtr_a(__LINE__, a, (cmock_size))
+void foo_CMockReturnMemThruPtr_a(UNITY_LINE_TYPE cmock_line, POINT_T const* a, size_t cmock_size);
+#define foo_IgnoreArg_a() foo_CMockIgnoreArg_a(__LINE__)
+void foo_CMockIgnoreArg_a(UNITY_LINE_TYPE cmock_line);
+
+#define bar_Ignore() TEST_FAIL_MESSAGE("bar requires _IgnoreAndReturn");
+#define bar_IgnoreAndReturn(cmock_retval) bar_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void bar_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return);
+#define bar_StopIgnore() bar_CMockStopIgnore()
+void bar_CMockStopIgnore(void);
+#define bar_Expect() TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(cmock_retval) bar_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  POINT_T* ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+typedef POINT_T* (* CMOCK_bar_CALLBACK)(void);
+void bar_AddCallback(CMOCK_bar_CALLBACK Callback);
+void bar_Stub(CMOCK_bar_CALLBACK Callback);
+#define bar_StubWithCallback bar_Stub
+#define bar_ExpectAndThrow(cmock_to_throw) bar_CMockExpectAndThrow(__LINE__, cmock_to_throw)
+void bar_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw);
+
+#define no_args_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("no_args requires _Ignore (not AndReturn)");
+#define no_args_Ignore() no_args_CMockIgnore()
+void no_args_CMockIgnore(void);
+#define no_args_StopIgnore() no_args_CMockStopIgnore()
+void no_args_CMockStopIgnore(void);
+#define no_args_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("no_args requires _Expect (not AndReturn)");
+#define no_args_Expect() no_args_CMockExpect(__LINE__)
+void no_args_CMockExpect(UNITY_LINE_TYPE cmock_line);
+typedef void (* CMOCK_no_args_CALLBACK)(void);
+void no_args_AddCallback(CMOCK_no_args_CALLBACK Callback);
+void no_args_Stub(CMOCK_no_args_CALLBACK Callback);
+#define no_args_StubWithCallback no_args_Stub
+#define no_args_ExpectAndThrow(cmock_to_throw) no_args_CMockExpectAndThrow(__LINE__, cmock_to_throw)
+void no_args_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
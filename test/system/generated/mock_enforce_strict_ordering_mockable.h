@@ -0,0 +1,97 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_ENFORCE_STRICT_ORDERING_MOCKABLE_H
+#define _MOCK_ENFORCE_STRICT_ORDERING_MOCKABLE_H
+
+#include "unity.h"
+#include "enforce_strict_ordering_types.h"
+#include "enforce_strict_ordering_mockable.h"
+#include "CException.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_enforce_strict_ordering_mockable_Init(void);
+void mock_enforce_strict_ordering_mockable_Destroy(void);
+void mock_enforce_strict_ordering_mockable_Verify(void);
+
+
+
+
+
+#define foo_Ignore() TEST_FAIL_MESSAGE("foo requires _IgnoreAndReturn");
+#define foo_IgnoreAndReturn(cmock_retval) foo_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void foo_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define foo_StopIgnore() foo_CMockStopIgnore()
+void foo_CMockStopIgnore(void);
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  custom_type a;
+  UINT32 ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_ExpectAndThrow(a, cmock_to_throw) foo_CMockExpectAndThrow(__LINE__, a, cmock_to_throw)
+void foo_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, custom_type a, CEXCEPTION_T cmock_to_throw);
+
+#define bar_Ignore() TEST_FAIL_MESSAGE("bar requires _IgnoreAndReturn");
+#define bar_IgnoreAndReturn(cmock_retval) bar_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void bar_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define bar_StopIgnore() bar_CMockStopIgnore()
+void bar_CMockStopIgnore(void);
+#define bar_Expect(b) TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(b, cmock_retval) bar_CMockExpectAndReturn(__LINE__, b, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type b, UINT32 cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  custom_type b;
+  UINT32 ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+#define bar_ExpectAndThrow(b, cmock_to_throw) bar_CMockExpectAndThrow(__LINE__, b, cmock_to_throw)
+void bar_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, custom_type b, CEXCEPTION_T cmock_to_throw);
+
+#define baz_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("baz requires _Ignore (not AndReturn)");
+#define baz_Ignore() baz_CMockIgnore()
+void baz_CMockIgnore(void);
+#define baz_StopIgnore() baz_CMockStopIgnore()
+void baz_CMockStopIgnore(void);
+#define baz_ExpectAndReturn(c, cmock_retval) TEST_FAIL_MESSAGE("baz requires _Expect (not AndReturn)");
+#define baz_Expect(c) baz_CMockExpect(__LINE__, c)
+void baz_CMockExpect(UNITY_LINE_TYPE cmock_line, custom_type c);
+typedef struct _CMOCK_baz_EXPECT_ROW
+{
+  custom_type c;
+} baz_ExpectRow;
+#define baz_ExpectTable(cmock_rows, cmock_count) baz_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void baz_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const baz_ExpectRow* cmock_rows, size_t cmock_count);
+#define baz_ExpectAndThrow(c, cmock_to_throw) baz_CMockExpectAndThrow(__LINE__, c, cmock_to_throw)
+void baz_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, custom_type c, CEXCEPTION_T cmock_to_throw);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,108 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_expect_and_return_custom_types_mockable.h"
+#include "expect_and_return_custom_types_unity_helper.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_foo = "foo";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  EXAMPLE_STRUCT_T ReturnVal;
+  EXAMPLE_STRUCT_T Expected_a;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_expect_and_return_custom_types_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+} Mock;
+
+
+void mock_expect_and_return_custom_types_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_expect_and_return_custom_types_mockable_Init(void)
+{
+  mock_expect_and_return_custom_types_mockable_Destroy();
+}
+
+void mock_expect_and_return_custom_types_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+EXAMPLE_STRUCT_T foo(EXAMPLE_STRUCT_T a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_EXAMPLE_STRUCT_T(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, EXAMPLE_STRUCT_T a);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, EXAMPLE_STRUCT_T a)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(EXAMPLE_STRUCT_T[sizeof(a) == sizeof(EXAMPLE_STRUCT_T) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EXAMPLE_STRUCT_T a, EXAMPLE_STRUCT_T cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, a);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(EXAMPLE_STRUCT_T[sizeof(cmock_to_return) == sizeof(EXAMPLE_STRUCT_T) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(EXAMPLE_STRUCT_T[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(EXAMPLE_STRUCT_T) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
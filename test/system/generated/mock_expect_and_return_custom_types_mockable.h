@@ -0,0 +1,54 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_EXPECT_AND_RETURN_CUSTOM_TYPES_MOCKABLE_H
+#define _MOCK_EXPECT_AND_RETURN_CUSTOM_TYPES_MOCKABLE_H
+
+#include "unity.h"
+#include "expect_and_return_custom_types_types.h"
+#include "expect_and_return_custom_types_unity_helper.h"
+#include "expect_and_return_custom_types_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_expect_and_return_custom_types_mockable_Init(void);
+void mock_expect_and_return_custom_types_mockable_Destroy(void);
+void mock_expect_and_return_custom_types_mockable_Verify(void);
+
+
+
+
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EXAMPLE_STRUCT_T a, EXAMPLE_STRUCT_T cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  EXAMPLE_STRUCT_T a;
+  EXAMPLE_STRUCT_T ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
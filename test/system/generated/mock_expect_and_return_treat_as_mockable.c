@@ -0,0 +1,484 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_expect_and_return_treat_as_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_bar = "bar";
+static const char* CMockString_float_adder = "float_adder";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_foo_char_strings = "foo_char_strings";
+static const char* CMockString_pointer_bar = "pointer_bar";
+static const char* CMockString_pointer_foo = "pointer_foo";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  MY_INT ReturnVal;
+  MY_HEX Expected_a;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  MY_INT ReturnVal;
+  MY_HEX Expected_b;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_char_strings_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  MY_STRING ReturnVal;
+  MY_STRING Expected_a;
+  MY_STRING Expected_b;
+
+} CMOCK_foo_char_strings_CALL_INSTANCE;
+
+typedef struct _CMOCK_float_adder_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  float ReturnVal;
+  float Expected_a;
+  float Expected_b;
+
+} CMOCK_float_adder_CALL_INSTANCE;
+
+typedef struct _CMOCK_pointer_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  MY_INT* ReturnVal;
+  MY_HEX* Expected_a;
+
+} CMOCK_pointer_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_pointer_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  PTR_INT Expected_a;
+
+} CMOCK_pointer_bar_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_expect_and_return_treat_as_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foo_char_strings_CallInstance;
+  CMOCK_MEM_INDEX_TYPE float_adder_CallInstance;
+  CMOCK_MEM_INDEX_TYPE pointer_foo_CallInstance;
+  CMOCK_MEM_INDEX_TYPE pointer_bar_CallInstance;
+} Mock;
+
+
+void mock_expect_and_return_treat_as_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foo_char_strings_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_char_strings);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.float_adder_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_float_adder);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.pointer_foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_pointer_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.pointer_bar_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_pointer_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_expect_and_return_treat_as_mockable_Init(void)
+{
+  mock_expect_and_return_treat_as_mockable_Destroy();
+}
+
+void mock_expect_and_return_treat_as_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+MY_INT foo(MY_HEX a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_HEX32(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, MY_HEX a);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, MY_HEX a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_HEX a, MY_INT cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+MY_INT bar(MY_HEX b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_bar,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_HEX32(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, MY_HEX b);
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, MY_HEX b)
+{
+  cmock_call_instance->Expected_b = b;
+}
+
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_HEX b, MY_INT cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_bar(cmock_call_instance, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_bar(cmock_call_instance, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+MY_STRING foo_char_strings(MY_STRING a, MY_STRING b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_char_strings);
+  cmock_call_instance = (CMOCK_foo_char_strings_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_char_strings_CallInstance);
+  Mock.foo_char_strings_CallInstance = CMock_Guts_MemNext(Mock.foo_char_strings_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_char_strings,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_char_strings,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo_char_strings(CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance, MY_STRING a, MY_STRING b);
+void CMockExpectParameters_foo_char_strings(CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance, MY_STRING a, MY_STRING b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void foo_char_strings_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_STRING a, MY_STRING b, MY_STRING cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_char_strings_CALL_INSTANCE));
+  CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_char_strings_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_char_strings_CallInstance = CMock_Guts_MemChain(Mock.foo_char_strings_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_char_strings(cmock_call_instance, a, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void foo_char_strings_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_char_strings_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_char_strings_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_char_strings_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_char_strings_CallInstance = CMock_Guts_MemChain(Mock.foo_char_strings_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_char_strings_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_char_strings(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+float float_adder(float a, float b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_float_adder_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_float_adder);
+  cmock_call_instance = (CMOCK_float_adder_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.float_adder_CallInstance);
+  Mock.float_adder_CallInstance = CMock_Guts_MemNext(Mock.float_adder_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_float_adder,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_FLOAT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_float_adder,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_FLOAT(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_float_adder(CMOCK_float_adder_CALL_INSTANCE* cmock_call_instance, float a, float b);
+void CMockExpectParameters_float_adder(CMOCK_float_adder_CALL_INSTANCE* cmock_call_instance, float a, float b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void float_adder_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, float a, float b, float cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_float_adder_CALL_INSTANCE));
+  CMOCK_float_adder_CALL_INSTANCE* cmock_call_instance = (CMOCK_float_adder_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.float_adder_CallInstance = CMock_Guts_MemChain(Mock.float_adder_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_float_adder(cmock_call_instance, a, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void float_adder_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const float_adder_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_float_adder_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_float_adder_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.float_adder_CallInstance = CMock_Guts_MemChain(Mock.float_adder_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_float_adder_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_float_adder(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+MY_INT* pointer_foo(MY_HEX* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_pointer_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_pointer_foo);
+  cmock_call_instance = (CMOCK_pointer_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.pointer_foo_CallInstance);
+  Mock.pointer_foo_CallInstance = CMock_Guts_MemNext(Mock.pointer_foo_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_pointer_foo,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX32_ARRAY(cmock_call_instance->Expected_a, a, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_pointer_foo(CMOCK_pointer_foo_CALL_INSTANCE* cmock_call_instance, MY_HEX* a);
+void CMockExpectParameters_pointer_foo(CMOCK_pointer_foo_CALL_INSTANCE* cmock_call_instance, MY_HEX* a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void pointer_foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_HEX* a, MY_INT* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_pointer_foo_CALL_INSTANCE));
+  CMOCK_pointer_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_pointer_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.pointer_foo_CallInstance = CMock_Guts_MemChain(Mock.pointer_foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_pointer_foo(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void pointer_foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const pointer_foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_pointer_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_pointer_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.pointer_foo_CallInstance = CMock_Guts_MemChain(Mock.pointer_foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_pointer_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_pointer_foo(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void pointer_bar(PTR_INT a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_pointer_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_pointer_bar);
+  cmock_call_instance = (CMOCK_pointer_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.pointer_bar_CallInstance);
+  Mock.pointer_bar_CallInstance = CMock_Guts_MemNext(Mock.pointer_bar_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_pointer_bar,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_a, a, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_pointer_bar(CMOCK_pointer_bar_CALL_INSTANCE* cmock_call_instance, PTR_INT a);
+void CMockExpectParameters_pointer_bar(CMOCK_pointer_bar_CALL_INSTANCE* cmock_call_instance, PTR_INT a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void pointer_bar_CMockExpect(UNITY_LINE_TYPE cmock_line, PTR_INT a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_pointer_bar_CALL_INSTANCE));
+  CMOCK_pointer_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_pointer_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.pointer_bar_CallInstance = CMock_Guts_MemChain(Mock.pointer_bar_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_pointer_bar(cmock_call_instance, a);
+}
+
+void pointer_bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const pointer_bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_pointer_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_pointer_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.pointer_bar_CallInstance = CMock_Guts_MemChain(Mock.pointer_bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_pointer_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_pointer_bar(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,104 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_EXPECT_AND_RETURN_TREAT_AS_MOCKABLE_H
+#define _MOCK_EXPECT_AND_RETURN_TREAT_AS_MOCKABLE_H
+
+#include "unity.h"
+#include "expect_and_return_treat_as_types.h"
+#include "expect_and_return_treat_as_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_expect_and_return_treat_as_mockable_Init(void);
+void mock_expect_and_return_treat_as_mockable_Destroy(void);
+void mock_expect_and_return_treat_as_mockable_Verify(void);
+
+
+
+
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_HEX a, MY_INT cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  MY_HEX a;
+  MY_INT ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define bar_Expect(b) TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(b, cmock_retval) bar_CMockExpectAndReturn(__LINE__, b, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_HEX b, MY_INT cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  MY_HEX b;
+  MY_INT ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_char_strings_Expect(a, b) TEST_FAIL_MESSAGE("foo_char_strings requires _ExpectAndReturn");
+#define foo_char_strings_ExpectAndReturn(a, b, cmock_retval) foo_char_strings_CMockExpectAndReturn(__LINE__, a, b, cmock_retval)
+void foo_char_strings_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_STRING a, MY_STRING b, MY_STRING cmock_to_return);
+typedef struct _CMOCK_foo_char_strings_EXPECT_ROW
+{
+  MY_STRING a;
+  MY_STRING b;
+  MY_STRING ReturnVal;
+} foo_char_strings_ExpectRow;
+#define foo_char_strings_ExpectTable(cmock_rows, cmock_count) foo_char_strings_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_char_strings_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_char_strings_ExpectRow* cmock_rows, size_t cmock_count);
+#define float_adder_Expect(a, b) TEST_FAIL_MESSAGE("float_adder requires _ExpectAndReturn");
+#define float_adder_ExpectAndReturn(a, b, cmock_retval) float_adder_CMockExpectAndReturn(__LINE__, a, b, cmock_retval)
+void float_adder_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, float a, float b, float cmock_to_return);
+typedef struct _CMOCK_float_adder_EXPECT_ROW
+{
+  float a;
+  float b;
+  float ReturnVal;
+} float_adder_ExpectRow;
+#define float_adder_ExpectTable(cmock_rows, cmock_count) float_adder_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void float_adder_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const float_adder_ExpectRow* cmock_rows, size_t cmock_count);
+#define pointer_foo_Expect(a) TEST_FAIL_MESSAGE("pointer_foo requires _ExpectAndReturn");
+#define pointer_foo_ExpectAndReturn(a, cmock_retval) pointer_foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void pointer_foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, MY_HEX* a, MY_INT* cmock_to_return);
+typedef struct _CMOCK_pointer_foo_EXPECT_ROW
+{
+  MY_HEX* a;
+  MY_INT* ReturnVal;
+} pointer_foo_ExpectRow;
+#define pointer_foo_ExpectTable(cmock_rows, cmock_count) pointer_foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void pointer_foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const pointer_foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define pointer_bar_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("pointer_bar requires _Expect (not AndReturn)");
+#define pointer_bar_Expect(a) pointer_bar_CMockExpect(__LINE__, a)
+void pointer_bar_CMockExpect(UNITY_LINE_TYPE cmock_line, PTR_INT a);
+typedef struct _CMOCK_pointer_bar_EXPECT_ROW
+{
+  PTR_INT a;
+} pointer_bar_ExpectRow;
+#define pointer_bar_ExpectTable(cmock_rows, cmock_count) pointer_bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void pointer_bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const pointer_bar_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
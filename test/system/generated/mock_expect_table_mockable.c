@@ -0,0 +1,244 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_expect_table_mockable.h"
+
+static const char* CMockString_address = "address";
+static const char* CMockString_read_reg = "read_reg";
+static const char* CMockString_sync = "sync";
+static const char* CMockString_value = "value";
+static const char* CMockString_write_reg = "write_reg";
+
+typedef struct _CMOCK_read_reg_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int CallOrder;
+  int Expected_address;
+
+} CMOCK_read_reg_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_reg_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_address;
+  int Expected_value;
+
+} CMOCK_write_reg_CALL_INSTANCE;
+
+typedef struct _CMOCK_sync_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+
+} CMOCK_sync_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_expect_table_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE read_reg_CallInstance;
+  CMOCK_MEM_INDEX_TYPE write_reg_CallInstance;
+  CMOCK_MEM_INDEX_TYPE sync_CallInstance;
+} Mock;
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+void mock_expect_table_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.read_reg_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_read_reg);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.write_reg_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_write_reg);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.sync_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_sync);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_expect_table_mockable_Init(void)
+{
+  mock_expect_table_mockable_Destroy();
+}
+
+void mock_expect_table_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
+int read_reg(int address)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_reg_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_reg);
+  cmock_call_instance = (CMOCK_read_reg_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_reg_CallInstance);
+  Mock.read_reg_CallInstance = CMock_Guts_MemNext(Mock.read_reg_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_read_reg,CMockString_address);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_address, address, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_read_reg(CMOCK_read_reg_CALL_INSTANCE* cmock_call_instance, int address);
+void CMockExpectParameters_read_reg(CMOCK_read_reg_CALL_INSTANCE* cmock_call_instance, int address)
+{
+  cmock_call_instance->Expected_address = address;
+}
+
+void read_reg_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int address, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_reg_CALL_INSTANCE));
+  CMOCK_read_reg_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_reg_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_reg_CallInstance = CMock_Guts_MemChain(Mock.read_reg_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_read_reg(cmock_call_instance, address);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_reg_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_reg_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_reg_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_reg_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_reg_CallInstance = CMock_Guts_MemChain(Mock.read_reg_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_reg_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_read_reg(cmock_call_instance, cmock_rows[cmock_row].address);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_reg(int address, int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_reg_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_reg);
+  cmock_call_instance = (CMOCK_write_reg_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_reg_CallInstance);
+  Mock.write_reg_CallInstance = CMock_Guts_MemNext(Mock.write_reg_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_write_reg,CMockString_address);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_address, address, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_write_reg,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_reg(CMOCK_write_reg_CALL_INSTANCE* cmock_call_instance, int address, int value);
+void CMockExpectParameters_write_reg(CMOCK_write_reg_CALL_INSTANCE* cmock_call_instance, int address, int value)
+{
+  cmock_call_instance->Expected_address = address;
+  cmock_call_instance->Expected_value = value;
+}
+
+void write_reg_CMockExpect(UNITY_LINE_TYPE cmock_line, int address, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_reg_CALL_INSTANCE));
+  CMOCK_write_reg_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_reg_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_reg_CallInstance = CMock_Guts_MemChain(Mock.write_reg_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_write_reg(cmock_call_instance, address, value);
+}
+
+void write_reg_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_reg_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_reg_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_reg_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_reg_CallInstance = CMock_Guts_MemChain(Mock.write_reg_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_reg_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_write_reg(cmock_call_instance, cmock_rows[cmock_row].address, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void sync(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_sync_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_sync);
+  cmock_call_instance = (CMOCK_sync_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.sync_CallInstance);
+  Mock.sync_CallInstance = CMock_Guts_MemNext(Mock.sync_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  UNITY_CLR_DETAILS();
+}
+
+void sync_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_sync_CALL_INSTANCE));
+  CMOCK_sync_CALL_INSTANCE* cmock_call_instance = (CMOCK_sync_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.sync_CallInstance = CMock_Guts_MemChain(Mock.sync_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+}
+
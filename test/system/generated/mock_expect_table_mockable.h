@@ -0,0 +1,66 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_EXPECT_TABLE_MOCKABLE_H
+#define _MOCK_EXPECT_TABLE_MOCKABLE_H
+
+#include "unity.h"
+#include "expect_table_types.h"
+#include "expect_table_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_expect_table_mockable_Init(void);
+void mock_expect_table_mockable_Destroy(void);
+void mock_expect_table_mockable_Verify(void);
+
+
+
+
+#define read_reg_Expect(address) TEST_FAIL_MESSAGE("read_reg requires _ExpectAndReturn");
+#define read_reg_ExpectAndReturn(address, cmock_retval) read_reg_CMockExpectAndReturn(__LINE__, address, cmock_retval)
+void read_reg_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int address, int cmock_to_return);
+typedef struct _CMOCK_read_reg_EXPECT_ROW
+{
+  int address;
+  int ReturnVal;
+} read_reg_ExpectRow;
+#define read_reg_ExpectTable(cmock_rows, cmock_count) read_reg_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_reg_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_reg_ExpectRow* cmock_rows, size_t cmock_count);
+#define write_reg_ExpectAndReturn(address, value, cmock_retval) TEST_FAIL_MESSAGE("write_reg requires _Expect (not AndReturn)");
+#define write_reg_Expect(address, value) write_reg_CMockExpect(__LINE__, address, value)
+void write_reg_CMockExpect(UNITY_LINE_TYPE cmock_line, int address, int value);
+typedef struct _CMOCK_write_reg_EXPECT_ROW
+{
+  int address;
+  int value;
+} write_reg_ExpectRow;
+#define write_reg_ExpectTable(cmock_rows, cmock_count) write_reg_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_reg_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_reg_ExpectRow* cmock_rows, size_t cmock_count);
+#define sync_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("sync requires _Expect (not AndReturn)");
+#define sync_Expect() sync_CMockExpect(__LINE__)
+void sync_CMockExpect(UNITY_LINE_TYPE cmock_line);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
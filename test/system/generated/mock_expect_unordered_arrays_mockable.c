@@ -0,0 +1,369 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_expect_unordered_arrays_mockable.h"
+
+static const char* CMockString_data = "data";
+static const char* CMockString_len = "len";
+static const char* CMockString_move = "move";
+static const char* CMockString_points = "points";
+static const char* CMockString_send = "send";
+
+typedef struct _CMOCK_send_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char UnorderedUsed;
+  const short* Expected_data;
+  int Expected_len;
+  int Expected_data_Depth;
+
+} CMOCK_send_CALL_INSTANCE;
+
+typedef struct _CMOCK_move_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char UnorderedUsed;
+  POINT_T* Expected_points;
+  int Expected_len;
+  int Expected_points_Depth;
+
+} CMOCK_move_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_expect_unordered_arrays_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE send_UnorderedTable;
+  int send_UnorderedCount;
+  CMOCK_MEM_INDEX_TYPE send_CallInstance;
+  CMOCK_MEM_INDEX_TYPE move_UnorderedTable;
+  int move_UnorderedCount;
+  CMOCK_MEM_INDEX_TYPE move_CallInstance;
+} Mock;
+
+
+void mock_expect_unordered_arrays_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.send_CallInstance;
+  if (Mock.send_UnorderedCount != 0)
+  {
+    UNITY_SET_DETAIL(CMockString_send);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_send);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.move_CallInstance;
+  if (Mock.move_UnorderedCount != 0)
+  {
+    UNITY_SET_DETAIL(CMockString_move);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_move);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_expect_unordered_arrays_mockable_Init(void)
+{
+  mock_expect_unordered_arrays_mockable_Destroy();
+}
+
+void mock_expect_unordered_arrays_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void send(const short* data, int len)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_send);
+  cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.send_CallInstance);
+  Mock.send_CallInstance = CMock_Guts_MemNext(Mock.send_CallInstance);
+  if ((cmock_call_instance == NULL) && (Mock.send_UnorderedCount != 0))
+  {
+    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.send_UnorderedTable);
+    CMOCK_MEM_INDEX_TYPE* cmock_bucket;
+    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;
+    CMOCK_send_CALL_INSTANCE* cmock_candidate;
+    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+    cmock_hash = CMock_Guts_Hash(cmock_hash, &len, (CMOCK_MEM_INDEX_TYPE)sizeof(len));
+    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];
+    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed &&
+        ((cmock_candidate->Expected_data == NULL) ? (data == NULL) : ((cmock_candidate->Expected_data_Depth > 0) && ((cmock_candidate->Expected_data == data) || ((data != NULL) && (memcmp(cmock_candidate->Expected_data, data, (size_t)cmock_candidate->Expected_data_Depth * 2) == 0))))) &&
+        (cmock_candidate->Expected_len == len))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.send_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    for (cmock_unordered_index = *cmock_bucket; (cmock_call_instance == NULL) && (cmock_unordered_index != CMOCK_GUTS_NONE); cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed && (cmock_candidate->Expected_len == len))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.send_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&
+           ((CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)
+    {
+      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);
+    }
+    if (cmock_call_instance == NULL)
+      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_send,CMockString_data);
+    if (cmock_call_instance->Expected_data == NULL)
+      { UNITY_TEST_ASSERT_NULL(data, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT16_ARRAY(cmock_call_instance->Expected_data, data, cmock_call_instance->Expected_data_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_send,CMockString_len);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_len, len, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_send(CMOCK_send_CALL_INSTANCE* cmock_call_instance, const short* data, int data_Depth, int len);
+void CMockExpectParameters_send(CMOCK_send_CALL_INSTANCE* cmock_call_instance, const short* data, int data_Depth, int len)
+{
+  cmock_call_instance->Expected_data = data;
+  cmock_call_instance->Expected_data_Depth = data_Depth;
+  cmock_call_instance->Expected_len = len;
+}
+
+void send_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, const short* data, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  CMOCK_MEM_INDEX_TYPE* cmock_buckets;
+  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+  if (Mock.send_UnorderedTable == CMOCK_GUTS_NONE)
+  {
+    Mock.send_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.send_UnorderedTable), cmock_line, CMockStringOutOfMemory);
+  }
+  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_send(cmock_call_instance, data, len, len);
+  cmock_hash = CMock_Guts_Hash(cmock_hash, &cmock_call_instance->Expected_len, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_call_instance->Expected_len));
+  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.send_UnorderedTable);
+  cmock_hash %= CMOCK_UNORDERED_BUCKETS;
+  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)
+    cmock_buckets[cmock_hash] = cmock_guts_index;
+  else
+    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);
+  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;
+  Mock.send_UnorderedCount++;
+}
+
+void send_CMockExpect(UNITY_LINE_TYPE cmock_line, const short* data, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_send(cmock_call_instance, data, len, len);
+}
+
+void send_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const send_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_send_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_send(cmock_call_instance, cmock_rows[cmock_row].data, cmock_rows[cmock_row].len, cmock_rows[cmock_row].len);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void send_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, const short* data, int data_Depth, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_send(cmock_call_instance, data, data_Depth, len);
+}
+
+void move(POINT_T* points, int len)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_move);
+  cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.move_CallInstance);
+  Mock.move_CallInstance = CMock_Guts_MemNext(Mock.move_CallInstance);
+  if ((cmock_call_instance == NULL) && (Mock.move_UnorderedCount != 0))
+  {
+    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.move_UnorderedTable);
+    CMOCK_MEM_INDEX_TYPE* cmock_bucket;
+    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;
+    CMOCK_move_CALL_INSTANCE* cmock_candidate;
+    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+    cmock_hash = CMock_Guts_Hash(cmock_hash, &len, (CMOCK_MEM_INDEX_TYPE)sizeof(len));
+    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];
+    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed &&
+        ((cmock_candidate->Expected_points == NULL) ? (points == NULL) : ((cmock_candidate->Expected_points_Depth > 0) && ((cmock_candidate->Expected_points == points) || ((points != NULL) && (memcmp(cmock_candidate->Expected_points, points, (size_t)cmock_candidate->Expected_points_Depth * sizeof(*cmock_candidate->Expected_points)) == 0))))) &&
+        (cmock_candidate->Expected_len == len))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.move_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    for (cmock_unordered_index = *cmock_bucket; (cmock_call_instance == NULL) && (cmock_unordered_index != CMOCK_GUTS_NONE); cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed && (cmock_candidate->Expected_len == len))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.move_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&
+           ((CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)
+    {
+      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);
+    }
+    if (cmock_call_instance == NULL)
+      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_move,CMockString_points);
+    if (cmock_call_instance->Expected_points == NULL)
+      { UNITY_TEST_ASSERT_NULL(points, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_points), (void*)(points), sizeof(POINT_T), cmock_call_instance->Expected_points_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_move,CMockString_len);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_len, len, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* points, int points_Depth, int len);
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* points, int points_Depth, int len)
+{
+  cmock_call_instance->Expected_points = points;
+  cmock_call_instance->Expected_points_Depth = points_Depth;
+  cmock_call_instance->Expected_len = len;
+}
+
+void move_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, POINT_T* points, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  CMOCK_MEM_INDEX_TYPE* cmock_buckets;
+  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+  if (Mock.move_UnorderedTable == CMOCK_GUTS_NONE)
+  {
+    Mock.move_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.move_UnorderedTable), cmock_line, CMockStringOutOfMemory);
+  }
+  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, points, len, len);
+  cmock_hash = CMock_Guts_Hash(cmock_hash, &cmock_call_instance->Expected_len, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_call_instance->Expected_len));
+  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.move_UnorderedTable);
+  cmock_hash %= CMOCK_UNORDERED_BUCKETS;
+  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)
+    cmock_buckets[cmock_hash] = cmock_guts_index;
+  else
+    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);
+  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;
+  Mock.move_UnorderedCount++;
+}
+
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* points, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, points, len, len);
+}
+
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_move_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_move(cmock_call_instance, cmock_rows[cmock_row].points, cmock_rows[cmock_row].len, cmock_rows[cmock_row].len);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void move_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* points, int points_Depth, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, points, points_Depth, len);
+}
+
@@ -0,0 +1,75 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_EXPECT_UNORDERED_ARRAYS_MOCKABLE_H
+#define _MOCK_EXPECT_UNORDERED_ARRAYS_MOCKABLE_H
+
+#include "unity.h"
+#include "expect_unordered_arrays_types.h"
+#include "expect_unordered_arrays_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_expect_unordered_arrays_mockable_Init(void);
+void mock_expect_unordered_arrays_mockable_Destroy(void);
+void mock_expect_unordered_arrays_mockable_Verify(void);
+
+
+
+
+#define send_ExpectUnorderedAndReturn(data, len, cmock_retval) TEST_FAIL_MESSAGE("send requires _ExpectUnordered (not AndReturn)");
+#define send_ExpectUnordered(data, len) send_CMockExpectUnordered(__LINE__, data, len)
+void send_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, const short* data, int len);
+#define send_ExpectAndReturn(data, len, cmock_retval) TEST_FAIL_MESSAGE("send requires _Expect (not AndReturn)");
+#define send_Expect(data, len) send_CMockExpect(__LINE__, data, len)
+void send_CMockExpect(UNITY_LINE_TYPE cmock_line, const short* data, int len);
+typedef struct _CMOCK_send_EXPECT_ROW
+{
+  const short* data;
+  int len;
+} send_ExpectRow;
+#define send_ExpectTable(cmock_rows, cmock_count) send_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void send_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const send_ExpectRow* cmock_rows, size_t cmock_count);
+#define send_ExpectWithArrayAndReturn(data, data_Depth, len, cmock_retval) TEST_FAIL_MESSAGE("send requires _ExpectWithArray (not AndReturn)");
+#define send_ExpectWithArray(data, data_Depth, len) send_CMockExpectWithArray(__LINE__, data, (data_Depth), len)
+void send_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, const short* data, int data_Depth, int len);
+#define move_ExpectUnorderedAndReturn(points, len, cmock_retval) TEST_FAIL_MESSAGE("move requires _ExpectUnordered (not AndReturn)");
+#define move_ExpectUnordered(points, len) move_CMockExpectUnordered(__LINE__, points, len)
+void move_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, POINT_T* points, int len);
+#define move_ExpectAndReturn(points, len, cmock_retval) TEST_FAIL_MESSAGE("move requires _Expect (not AndReturn)");
+#define move_Expect(points, len) move_CMockExpect(__LINE__, points, len)
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* points, int len);
+typedef struct _CMOCK_move_EXPECT_ROW
+{
+  POINT_T* points;
+  int len;
+} move_ExpectRow;
+#define move_ExpectTable(cmock_rows, cmock_count) move_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count);
+#define move_ExpectWithArrayAndReturn(points, points_Depth, len, cmock_retval) TEST_FAIL_MESSAGE("move requires _ExpectWithArray (not AndReturn)");
+#define move_ExpectWithArray(points, points_Depth, len) move_CMockExpectWithArray(__LINE__, points, (points_Depth), len)
+void move_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* points, int points_Depth, int len);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,585 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_expect_unordered_mockable.h"
+
+static const char* CMockString_get = "get";
+static const char* CMockString_id = "id";
+static const char* CMockString_key = "key";
+static const char* CMockString_move = "move";
+static const char* CMockString_point = "point";
+static const char* CMockString_put = "put";
+static const char* CMockString_reset = "reset";
+static const char* CMockString_value = "value";
+
+typedef struct _CMOCK_get_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char UnorderedUsed;
+  int ReturnVal;
+  int Expected_id;
+
+} CMOCK_get_CALL_INSTANCE;
+
+typedef struct _CMOCK_put_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char UnorderedUsed;
+  const char* Expected_key;
+  int Expected_value;
+
+} CMOCK_put_CALL_INSTANCE;
+
+typedef struct _CMOCK_move_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char UnorderedUsed;
+  POINT_T* Expected_point;
+  int Expected_id;
+
+} CMOCK_move_CALL_INSTANCE;
+
+typedef struct _CMOCK_reset_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char UnorderedUsed;
+
+} CMOCK_reset_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_expect_unordered_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE get_UnorderedTable;
+  int get_UnorderedCount;
+  CMOCK_MEM_INDEX_TYPE get_CallInstance;
+  CMOCK_MEM_INDEX_TYPE put_UnorderedTable;
+  int put_UnorderedCount;
+  CMOCK_MEM_INDEX_TYPE put_CallInstance;
+  CMOCK_MEM_INDEX_TYPE move_UnorderedTable;
+  int move_UnorderedCount;
+  CMOCK_MEM_INDEX_TYPE move_CallInstance;
+  CMOCK_MEM_INDEX_TYPE reset_UnorderedTable;
+  int reset_UnorderedCount;
+  CMOCK_MEM_INDEX_TYPE reset_CallInstance;
+} Mock;
+
+
+void mock_expect_unordered_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.get_CallInstance;
+  if (Mock.get_UnorderedCount != 0)
+  {
+    UNITY_SET_DETAIL(CMockString_get);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_get);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.put_CallInstance;
+  if (Mock.put_UnorderedCount != 0)
+  {
+    UNITY_SET_DETAIL(CMockString_put);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_put);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.move_CallInstance;
+  if (Mock.move_UnorderedCount != 0)
+  {
+    UNITY_SET_DETAIL(CMockString_move);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_move);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.reset_CallInstance;
+  if (Mock.reset_UnorderedCount != 0)
+  {
+    UNITY_SET_DETAIL(CMockString_reset);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_reset);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_expect_unordered_mockable_Init(void)
+{
+  mock_expect_unordered_mockable_Destroy();
+}
+
+void mock_expect_unordered_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+int get(int id)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_get);
+  cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.get_CallInstance);
+  Mock.get_CallInstance = CMock_Guts_MemNext(Mock.get_CallInstance);
+  if ((cmock_call_instance == NULL) && (Mock.get_UnorderedCount != 0))
+  {
+    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.get_UnorderedTable);
+    CMOCK_MEM_INDEX_TYPE* cmock_bucket;
+    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;
+    CMOCK_get_CALL_INSTANCE* cmock_candidate;
+    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+    cmock_hash = CMock_Guts_Hash(cmock_hash, &id, (CMOCK_MEM_INDEX_TYPE)sizeof(id));
+    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];
+    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed &&
+        (cmock_candidate->Expected_id == id))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.get_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    for (cmock_unordered_index = *cmock_bucket; (cmock_call_instance == NULL) && (cmock_unordered_index != CMOCK_GUTS_NONE); cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed && (cmock_candidate->Expected_id == id))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.get_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&
+           ((CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)
+    {
+      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);
+    }
+    if (cmock_call_instance == NULL)
+      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_get,CMockString_id);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_id, id, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_get(CMOCK_get_CALL_INSTANCE* cmock_call_instance, int id);
+void CMockExpectParameters_get(CMOCK_get_CALL_INSTANCE* cmock_call_instance, int id)
+{
+  cmock_call_instance->Expected_id = id;
+}
+
+void get_CMockExpectUnorderedAndReturn(UNITY_LINE_TYPE cmock_line, int id, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance;
+  CMOCK_MEM_INDEX_TYPE* cmock_buckets;
+  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+  if (Mock.get_UnorderedTable == CMOCK_GUTS_NONE)
+  {
+    Mock.get_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.get_UnorderedTable), cmock_line, CMockStringOutOfMemory);
+  }
+  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_CALL_INSTANCE));
+  cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get(cmock_call_instance, id);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  cmock_hash = CMock_Guts_Hash(cmock_hash, &cmock_call_instance->Expected_id, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_call_instance->Expected_id));
+  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.get_UnorderedTable);
+  cmock_hash %= CMOCK_UNORDERED_BUCKETS;
+  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)
+    cmock_buckets[cmock_hash] = cmock_guts_index;
+  else
+    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);
+  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;
+  Mock.get_UnorderedCount++;
+}
+
+void get_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int id, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_CALL_INSTANCE));
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.get_CallInstance = CMock_Guts_MemChain(Mock.get_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get(cmock_call_instance, id);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void get_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_get_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.get_CallInstance = CMock_Guts_MemChain(Mock.get_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_get(cmock_call_instance, cmock_rows[cmock_row].id);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void put(const char* key, int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_put);
+  cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.put_CallInstance);
+  Mock.put_CallInstance = CMock_Guts_MemNext(Mock.put_CallInstance);
+  if ((cmock_call_instance == NULL) && (Mock.put_UnorderedCount != 0))
+  {
+    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.put_UnorderedTable);
+    CMOCK_MEM_INDEX_TYPE* cmock_bucket;
+    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;
+    CMOCK_put_CALL_INSTANCE* cmock_candidate;
+    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+    cmock_hash = CMock_Guts_Hash(cmock_hash, &value, (CMOCK_MEM_INDEX_TYPE)sizeof(value));
+    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];
+    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed &&
+        ((cmock_candidate->Expected_key == key) || ((cmock_candidate->Expected_key != NULL) && (key != NULL) && (strcmp(cmock_candidate->Expected_key, key) == 0))) &&
+        (cmock_candidate->Expected_value == value))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.put_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    for (cmock_unordered_index = *cmock_bucket; (cmock_call_instance == NULL) && (cmock_unordered_index != CMOCK_GUTS_NONE); cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed && (cmock_candidate->Expected_value == value))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.put_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&
+           ((CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)
+    {
+      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);
+    }
+    if (cmock_call_instance == NULL)
+      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_put,CMockString_key);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_key, key, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_put,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_put(CMOCK_put_CALL_INSTANCE* cmock_call_instance, const char* key, int value);
+void CMockExpectParameters_put(CMOCK_put_CALL_INSTANCE* cmock_call_instance, const char* key, int value)
+{
+  cmock_call_instance->Expected_key = key;
+  cmock_call_instance->Expected_value = value;
+}
+
+void put_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, const char* key, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  CMOCK_MEM_INDEX_TYPE* cmock_buckets;
+  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+  if (Mock.put_UnorderedTable == CMOCK_GUTS_NONE)
+  {
+    Mock.put_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.put_UnorderedTable), cmock_line, CMockStringOutOfMemory);
+  }
+  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_put_CALL_INSTANCE));
+  cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_put(cmock_call_instance, key, value);
+  cmock_hash = CMock_Guts_Hash(cmock_hash, &cmock_call_instance->Expected_value, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_call_instance->Expected_value));
+  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.put_UnorderedTable);
+  cmock_hash %= CMOCK_UNORDERED_BUCKETS;
+  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)
+    cmock_buckets[cmock_hash] = cmock_guts_index;
+  else
+    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);
+  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;
+  Mock.put_UnorderedCount++;
+}
+
+void put_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* key, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_put_CALL_INSTANCE));
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.put_CallInstance = CMock_Guts_MemChain(Mock.put_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_put(cmock_call_instance, key, value);
+}
+
+void put_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const put_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_put_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.put_CallInstance = CMock_Guts_MemChain(Mock.put_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_put(cmock_call_instance, cmock_rows[cmock_row].key, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void move(POINT_T* point, int id)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_move);
+  cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.move_CallInstance);
+  Mock.move_CallInstance = CMock_Guts_MemNext(Mock.move_CallInstance);
+  if ((cmock_call_instance == NULL) && (Mock.move_UnorderedCount != 0))
+  {
+    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.move_UnorderedTable);
+    CMOCK_MEM_INDEX_TYPE* cmock_bucket;
+    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;
+    CMOCK_move_CALL_INSTANCE* cmock_candidate;
+    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+    cmock_hash = CMock_Guts_Hash(cmock_hash, &id, (CMOCK_MEM_INDEX_TYPE)sizeof(id));
+    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];
+    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed &&
+        ((cmock_candidate->Expected_point == point) || ((cmock_candidate->Expected_point != NULL) && ((point != NULL) && (memcmp(cmock_candidate->Expected_point, point, sizeof(*cmock_candidate->Expected_point)) == 0)))) &&
+        (cmock_candidate->Expected_id == id))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.move_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    for (cmock_unordered_index = *cmock_bucket; (cmock_call_instance == NULL) && (cmock_unordered_index != CMOCK_GUTS_NONE); cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed && (cmock_candidate->Expected_id == id))
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.move_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&
+           ((CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)
+    {
+      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);
+    }
+    if (cmock_call_instance == NULL)
+      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_move,CMockString_point);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_point), (void*)(point), sizeof(POINT_T), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_move,CMockString_id);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_id, id, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* point, int id);
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* point, int id)
+{
+  cmock_call_instance->Expected_point = point;
+  cmock_call_instance->Expected_id = id;
+}
+
+void move_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, POINT_T* point, int id)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  CMOCK_MEM_INDEX_TYPE* cmock_buckets;
+  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+  if (Mock.move_UnorderedTable == CMOCK_GUTS_NONE)
+  {
+    Mock.move_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.move_UnorderedTable), cmock_line, CMockStringOutOfMemory);
+  }
+  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, point, id);
+  cmock_hash = CMock_Guts_Hash(cmock_hash, &cmock_call_instance->Expected_id, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_call_instance->Expected_id));
+  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.move_UnorderedTable);
+  cmock_hash %= CMOCK_UNORDERED_BUCKETS;
+  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)
+    cmock_buckets[cmock_hash] = cmock_guts_index;
+  else
+    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);
+  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;
+  Mock.move_UnorderedCount++;
+}
+
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* point, int id)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, point, id);
+}
+
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_move_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_move(cmock_call_instance, cmock_rows[cmock_row].point, cmock_rows[cmock_row].id);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void reset(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_reset_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_reset);
+  cmock_call_instance = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.reset_CallInstance);
+  Mock.reset_CallInstance = CMock_Guts_MemNext(Mock.reset_CallInstance);
+  if ((cmock_call_instance == NULL) && (Mock.reset_UnorderedCount != 0))
+  {
+    CMOCK_MEM_INDEX_TYPE* cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.reset_UnorderedTable);
+    CMOCK_MEM_INDEX_TYPE* cmock_bucket;
+    CMOCK_MEM_INDEX_TYPE cmock_unordered_index;
+    CMOCK_reset_CALL_INSTANCE* cmock_candidate;
+    UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+    cmock_bucket = &cmock_buckets[cmock_hash % CMOCK_UNORDERED_BUCKETS];
+    for (cmock_unordered_index = *cmock_bucket; cmock_unordered_index != CMOCK_GUTS_NONE; cmock_unordered_index = CMock_Guts_MemNext(cmock_unordered_index))
+    {
+      cmock_candidate = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_unordered_index);
+      if (!cmock_candidate->UnorderedUsed)
+      {
+        cmock_candidate->UnorderedUsed = 1;
+        Mock.reset_UnorderedCount--;
+        cmock_call_instance = cmock_candidate;
+        break;
+      }
+    }
+    while ((*cmock_bucket != CMOCK_GUTS_NONE) &&
+           ((CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(*cmock_bucket))->UnorderedUsed)
+    {
+      *cmock_bucket = CMock_Guts_MemNext(*cmock_bucket);
+    }
+    if (cmock_call_instance == NULL)
+      UNITY_TEST_FAIL(cmock_line, CMockStringNoMatch);
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void reset_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_reset_CALL_INSTANCE* cmock_call_instance;
+  CMOCK_MEM_INDEX_TYPE* cmock_buckets;
+  UNITY_UINT32 cmock_hash = CMOCK_HASH_SEED;
+  if (Mock.reset_UnorderedTable == CMOCK_GUTS_NONE)
+  {
+    Mock.reset_UnorderedTable = CMock_Guts_MemNewChain(2 * CMOCK_UNORDERED_BUCKETS * sizeof(CMOCK_MEM_INDEX_TYPE), 1);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(Mock.reset_UnorderedTable), cmock_line, CMockStringOutOfMemory);
+  }
+  cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_reset_CALL_INSTANCE));
+  cmock_call_instance = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_buckets = (CMOCK_MEM_INDEX_TYPE*)CMock_Guts_GetAddressFor(Mock.reset_UnorderedTable);
+  cmock_hash %= CMOCK_UNORDERED_BUCKETS;
+  if (cmock_buckets[cmock_hash] == CMOCK_GUTS_NONE)
+    cmock_buckets[cmock_hash] = cmock_guts_index;
+  else
+    CMock_Guts_MemChain(cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash], cmock_guts_index);
+  cmock_buckets[CMOCK_UNORDERED_BUCKETS + cmock_hash] = cmock_guts_index;
+  Mock.reset_UnorderedCount++;
+}
+
+void reset_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_reset_CALL_INSTANCE));
+  CMOCK_reset_CALL_INSTANCE* cmock_call_instance = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.reset_CallInstance = CMock_Guts_MemChain(Mock.reset_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
@@ -0,0 +1,88 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_EXPECT_UNORDERED_MOCKABLE_H
+#define _MOCK_EXPECT_UNORDERED_MOCKABLE_H
+
+#include "unity.h"
+#include "expect_unordered_types.h"
+#include "expect_unordered_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_expect_unordered_mockable_Init(void);
+void mock_expect_unordered_mockable_Destroy(void);
+void mock_expect_unordered_mockable_Verify(void);
+
+
+
+
+#define get_ExpectUnordered(id) TEST_FAIL_MESSAGE("get requires _ExpectUnorderedAndReturn");
+#define get_ExpectUnorderedAndReturn(id, cmock_retval) get_CMockExpectUnorderedAndReturn(__LINE__, id, cmock_retval)
+void get_CMockExpectUnorderedAndReturn(UNITY_LINE_TYPE cmock_line, int id, int cmock_to_return);
+#define get_Expect(id) TEST_FAIL_MESSAGE("get requires _ExpectAndReturn");
+#define get_ExpectAndReturn(id, cmock_retval) get_CMockExpectAndReturn(__LINE__, id, cmock_retval)
+void get_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int id, int cmock_to_return);
+typedef struct _CMOCK_get_EXPECT_ROW
+{
+  int id;
+  int ReturnVal;
+} get_ExpectRow;
+#define get_ExpectTable(cmock_rows, cmock_count) get_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void get_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_ExpectRow* cmock_rows, size_t cmock_count);
+#define put_ExpectUnorderedAndReturn(key, value, cmock_retval) TEST_FAIL_MESSAGE("put requires _ExpectUnordered (not AndReturn)");
+#define put_ExpectUnordered(key, value) put_CMockExpectUnordered(__LINE__, key, value)
+void put_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, const char* key, int value);
+#define put_ExpectAndReturn(key, value, cmock_retval) TEST_FAIL_MESSAGE("put requires _Expect (not AndReturn)");
+#define put_Expect(key, value) put_CMockExpect(__LINE__, key, value)
+void put_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* key, int value);
+typedef struct _CMOCK_put_EXPECT_ROW
+{
+  const char* key;
+  int value;
+} put_ExpectRow;
+#define put_ExpectTable(cmock_rows, cmock_count) put_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void put_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const put_ExpectRow* cmock_rows, size_t cmock_count);
+#define move_ExpectUnorderedAndReturn(point, id, cmock_retval) TEST_FAIL_MESSAGE("move requires _ExpectUnordered (not AndReturn)");
+#define move_ExpectUnordered(point, id) move_CMockExpectUnordered(__LINE__, point, id)
+void move_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line, POINT_T* point, int id);
+#define move_ExpectAndReturn(point, id, cmock_retval) TEST_FAIL_MESSAGE("move requires _Expect (not AndReturn)");
+#define move_Expect(point, id) move_CMockExpect(__LINE__, point, id)
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* point, int id);
+typedef struct _CMOCK_move_EXPECT_ROW
+{
+  POINT_T* point;
+  int id;
+} move_ExpectRow;
+#define move_ExpectTable(cmock_rows, cmock_count) move_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count);
+#define reset_ExpectUnorderedAndReturn(cmock_retval) TEST_FAIL_MESSAGE("reset requires _ExpectUnordered (not AndReturn)");
+#define reset_ExpectUnordered() reset_CMockExpectUnordered(__LINE__)
+void reset_CMockExpectUnordered(UNITY_LINE_TYPE cmock_line);
+#define reset_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("reset requires _Expect (not AndReturn)");
+#define reset_Expect() reset_CMockExpect(__LINE__)
+void reset_CMockExpect(UNITY_LINE_TYPE cmock_line);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
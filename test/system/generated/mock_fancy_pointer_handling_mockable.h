@@ -0,0 +1,98 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_FANCY_POINTER_HANDLING_MOCKABLE_H
+#define _MOCK_FANCY_POINTER_HANDLING_MOCKABLE_H
+
+#include "unity.h"
+#include "fancy_pointer_handling_types.h"
+#include "fancy_pointer_handling_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_fancy_pointer_handling_mockable_Init(void);
+void mock_fancy_pointer_handling_mockable_Destroy(void);
+void mock_fancy_pointer_handling_mockable_Verify(void);
+
+
+
+
+#define foo_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foo requires _Expect (not AndReturn)");
+#define foo_Expect(a) foo_CMockExpect(__LINE__, a)
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  POINT_T* a;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define bar_Expect() TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(cmock_retval) bar_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, POINT_T* cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  POINT_T* ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+#define fooa_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("fooa requires _Expect (not AndReturn)");
+#define fooa_Expect(a) fooa_CMockExpect(__LINE__, a)
+void fooa_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* a);
+typedef struct _CMOCK_fooa_EXPECT_ROW
+{
+  POINT_T* a;
+} fooa_ExpectRow;
+#define fooa_ExpectTable(cmock_rows, cmock_count) fooa_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void fooa_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fooa_ExpectRow* cmock_rows, size_t cmock_count);
+#define foos_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foos requires _Expect (not AndReturn)");
+#define foos_Expect(a) foos_CMockExpect(__LINE__, a)
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* a);
+typedef struct _CMOCK_foos_EXPECT_ROW
+{
+  const char* a;
+} foos_ExpectRow;
+#define foos_ExpectTable(cmock_rows, cmock_count) foos_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count);
+#define bars_Expect() TEST_FAIL_MESSAGE("bars requires _ExpectAndReturn");
+#define bars_ExpectAndReturn(cmock_retval) bars_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char* cmock_to_return);
+typedef struct _CMOCK_bars_EXPECT_ROW
+{
+  const char* ReturnVal;
+} bars_ExpectRow;
+#define bars_ExpectTable(cmock_rows, cmock_count) bars_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count);
+#define zoink_Expect(a) TEST_FAIL_MESSAGE("zoink requires _ExpectAndReturn");
+#define zoink_ExpectAndReturn(a, cmock_retval) zoink_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void zoink_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, INT_PTR a, INT_PTR cmock_to_return);
+typedef struct _CMOCK_zoink_EXPECT_ROW
+{
+  INT_PTR a;
+  INT_PTR ReturnVal;
+} zoink_ExpectRow;
+#define zoink_ExpectTable(cmock_rows, cmock_count) zoink_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void zoink_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const zoink_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
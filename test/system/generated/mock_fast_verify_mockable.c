@@ -0,0 +1,420 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_fast_verify_mockable.h"
+
+static const char* CMockString_flags = "flags";
+static const char* CMockString_get = "get";
+static const char* CMockString_id = "id";
+static const char* CMockString_key = "key";
+static const char* CMockString_move = "move";
+static const char* CMockString_place = "place";
+static const char* CMockString_point = "point";
+static const char* CMockString_put = "put";
+static const char* CMockString_scale = "scale";
+static const char* CMockString_value = "value";
+
+typedef struct _CMOCK_get_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int Expected_id;
+  unsigned char Expected_flags;
+  char IgnoreArg_id;
+  char IgnoreArg_flags;
+
+} CMOCK_get_CALL_INSTANCE;
+
+typedef struct _CMOCK_put_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char* Expected_key;
+  int Expected_value;
+  char IgnoreArg_key;
+  char IgnoreArg_value;
+
+} CMOCK_put_CALL_INSTANCE;
+
+typedef struct _CMOCK_place_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T Expected_point;
+  float Expected_scale;
+  char IgnoreArg_point;
+  char IgnoreArg_scale;
+
+} CMOCK_place_CALL_INSTANCE;
+
+typedef struct _CMOCK_move_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T* Expected_point;
+  char IgnoreArg_point;
+
+} CMOCK_move_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_fast_verify_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE get_CallInstance;
+  CMOCK_MEM_INDEX_TYPE put_CallInstance;
+  CMOCK_MEM_INDEX_TYPE place_CallInstance;
+  CMOCK_MEM_INDEX_TYPE move_CallInstance;
+} Mock;
+
+
+void mock_fast_verify_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.get_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_get);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.put_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_put);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.place_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_place);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.move_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_move);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_fast_verify_mockable_Init(void)
+{
+  mock_fast_verify_mockable_Destroy();
+}
+
+void mock_fast_verify_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+int get(int id, unsigned char flags)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_get);
+  cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.get_CallInstance);
+  Mock.get_CallInstance = CMock_Guts_MemNext(Mock.get_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!((cmock_call_instance->IgnoreArg_id || (cmock_call_instance->Expected_id == id)) &&
+        (cmock_call_instance->IgnoreArg_flags || (cmock_call_instance->Expected_flags == flags))))
+  {
+    if (!cmock_call_instance->IgnoreArg_id)
+    {
+      UNITY_SET_DETAILS(CMockString_get,CMockString_id);
+      UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_id, id, cmock_line, CMockStringMismatch);
+    }
+    if (!cmock_call_instance->IgnoreArg_flags)
+    {
+      UNITY_SET_DETAILS(CMockString_get,CMockString_flags);
+      UNITY_TEST_ASSERT_EQUAL_HEX8(cmock_call_instance->Expected_flags, flags, cmock_line, CMockStringMismatch);
+    }
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_get(CMOCK_get_CALL_INSTANCE* cmock_call_instance, int id, unsigned char flags);
+void CMockExpectParameters_get(CMOCK_get_CALL_INSTANCE* cmock_call_instance, int id, unsigned char flags)
+{
+  cmock_call_instance->Expected_id = id;
+  cmock_call_instance->IgnoreArg_id = 0;
+  cmock_call_instance->Expected_flags = flags;
+  cmock_call_instance->IgnoreArg_flags = 0;
+}
+
+void get_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int id, unsigned char flags, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_CALL_INSTANCE));
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.get_CallInstance = CMock_Guts_MemChain(Mock.get_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get(cmock_call_instance, id, flags);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void get_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_get_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.get_CallInstance = CMock_Guts_MemChain(Mock.get_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_get(cmock_call_instance, cmock_rows[cmock_row].id, cmock_rows[cmock_row].flags);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void get_CMockIgnoreArg_id(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.get_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_id = 1;
+}
+
+void get_CMockIgnoreArg_flags(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_get_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.get_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_flags = 1;
+}
+
+void put(const char* key, int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_put);
+  cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.put_CallInstance);
+  Mock.put_CallInstance = CMock_Guts_MemNext(Mock.put_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!((cmock_call_instance->IgnoreArg_key || (cmock_call_instance->Expected_key == key)) &&
+        (cmock_call_instance->IgnoreArg_value || (cmock_call_instance->Expected_value == value))))
+  {
+    if (!cmock_call_instance->IgnoreArg_key)
+    {
+      UNITY_SET_DETAILS(CMockString_put,CMockString_key);
+      UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_key, key, cmock_line, CMockStringMismatch);
+    }
+    if (!cmock_call_instance->IgnoreArg_value)
+    {
+      UNITY_SET_DETAILS(CMockString_put,CMockString_value);
+      UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+    }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_put(CMOCK_put_CALL_INSTANCE* cmock_call_instance, const char* key, int value);
+void CMockExpectParameters_put(CMOCK_put_CALL_INSTANCE* cmock_call_instance, const char* key, int value)
+{
+  cmock_call_instance->Expected_key = key;
+  cmock_call_instance->IgnoreArg_key = 0;
+  cmock_call_instance->Expected_value = value;
+  cmock_call_instance->IgnoreArg_value = 0;
+}
+
+void put_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* key, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_put_CALL_INSTANCE));
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.put_CallInstance = CMock_Guts_MemChain(Mock.put_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_put(cmock_call_instance, key, value);
+}
+
+void put_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const put_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_put_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.put_CallInstance = CMock_Guts_MemChain(Mock.put_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_put(cmock_call_instance, cmock_rows[cmock_row].key, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void put_CMockIgnoreArg_key(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.put_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_key = 1;
+}
+
+void put_CMockIgnoreArg_value(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.put_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_value = 1;
+}
+
+void place(POINT_T point, float scale)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_place);
+  cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.place_CallInstance);
+  Mock.place_CallInstance = CMock_Guts_MemNext(Mock.place_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!((cmock_call_instance->IgnoreArg_point || (memcmp(&cmock_call_instance->Expected_point, &point, sizeof(POINT_T)) == 0)) &&
+        (cmock_call_instance->IgnoreArg_scale || (memcmp(&cmock_call_instance->Expected_scale, &scale, sizeof(float)) == 0))))
+  {
+    if (!cmock_call_instance->IgnoreArg_point)
+    {
+      UNITY_SET_DETAILS(CMockString_place,CMockString_point);
+      UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_point), (void*)(&point), sizeof(POINT_T), cmock_line, CMockStringMismatch);
+    }
+    if (!cmock_call_instance->IgnoreArg_scale)
+    {
+      UNITY_SET_DETAILS(CMockString_place,CMockString_scale);
+      UNITY_TEST_ASSERT_EQUAL_FLOAT(cmock_call_instance->Expected_scale, scale, cmock_line, CMockStringMismatch);
+    }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_place(CMOCK_place_CALL_INSTANCE* cmock_call_instance, POINT_T point, float scale);
+void CMockExpectParameters_place(CMOCK_place_CALL_INSTANCE* cmock_call_instance, POINT_T point, float scale)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_point), (void*)(&point),
+         sizeof(POINT_T[sizeof(point) == sizeof(POINT_T) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  cmock_call_instance->IgnoreArg_point = 0;
+  cmock_call_instance->Expected_scale = scale;
+  cmock_call_instance->IgnoreArg_scale = 0;
+}
+
+void place_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T point, float scale)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_place_CALL_INSTANCE));
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.place_CallInstance = CMock_Guts_MemChain(Mock.place_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_place(cmock_call_instance, point, scale);
+}
+
+void place_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const place_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_place_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.place_CallInstance = CMock_Guts_MemChain(Mock.place_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_place(cmock_call_instance, cmock_rows[cmock_row].point, cmock_rows[cmock_row].scale);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void place_CMockIgnoreArg_point(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.place_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_point = 1;
+}
+
+void place_CMockIgnoreArg_scale(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.place_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_scale = 1;
+}
+
+void move(POINT_T* point)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_move);
+  cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.move_CallInstance);
+  Mock.move_CallInstance = CMock_Guts_MemNext(Mock.move_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!((cmock_call_instance->IgnoreArg_point || (cmock_call_instance->Expected_point == point))))
+  {
+    if (!cmock_call_instance->IgnoreArg_point)
+    {
+      UNITY_SET_DETAILS(CMockString_move,CMockString_point);
+      UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_point), (void*)(point), sizeof(POINT_T), cmock_line, CMockStringMismatch);
+    }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* point);
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* point)
+{
+  cmock_call_instance->Expected_point = point;
+  cmock_call_instance->IgnoreArg_point = 0;
+}
+
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* point)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, point);
+}
+
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_move_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_move(cmock_call_instance, cmock_rows[cmock_row].point);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void move_CMockIgnoreArg_point(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.move_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_point = 1;
+}
+
@@ -0,0 +1,104 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_FAST_VERIFY_MOCKABLE_H
+#define _MOCK_FAST_VERIFY_MOCKABLE_H
+
+#include "unity.h"
+#include "fast_verify_types.h"
+#include "fast_verify_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_fast_verify_mockable_Init(void);
+void mock_fast_verify_mockable_Destroy(void);
+void mock_fast_verify_mockable_Verify(void);
+
+
+
+
+#define get_Expect(id, flags) TEST_FAIL_MESSAGE("get requires _ExpectAndReturn");
+#define get_ExpectAndReturn(id, flags, cmock_retval) get_CMockExpectAndReturn(__LINE__, id, flags, cmock_retval)
+void get_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int id, unsigned char flags, int cmock_to_return);
+typedef struct _CMOCK_get_EXPECT_ROW
+{
+  int id;
+  unsigned char flags;
+  int ReturnVal;
+} get_ExpectRow;
+#define get_ExpectTable(cmock_rows, cmock_count) get_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void get_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define get_IgnoreArg_id() get_CMockIgnoreArg_id(__LINE__)
+void get_CMockIgnoreArg_id(UNITY_LINE_TYPE cmock_line);
+
+#define get_IgnoreArg_flags() get_CMockIgnoreArg_flags(__LINE__)
+void get_CMockIgnoreArg_flags(UNITY_LINE_TYPE cmock_line);
+#define put_ExpectAndReturn(key, value, cmock_retval) TEST_FAIL_MESSAGE("put requires _Expect (not AndReturn)");
+#define put_Expect(key, value) put_CMockExpect(__LINE__, key, value)
+void put_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* key, int value);
+typedef struct _CMOCK_put_EXPECT_ROW
+{
+  const char* key;
+  int value;
+} put_ExpectRow;
+#define put_ExpectTable(cmock_rows, cmock_count) put_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void put_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const put_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define put_IgnoreArg_key() put_CMockIgnoreArg_key(__LINE__)
+void put_CMockIgnoreArg_key(UNITY_LINE_TYPE cmock_line);
+
+#define put_IgnoreArg_value() put_CMockIgnoreArg_value(__LINE__)
+void put_CMockIgnoreArg_value(UNITY_LINE_TYPE cmock_line);
+#define place_ExpectAndReturn(point, scale, cmock_retval) TEST_FAIL_MESSAGE("place requires _Expect (not AndReturn)");
+#define place_Expect(point, scale) place_CMockExpect(__LINE__, point, scale)
+void place_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T point, float scale);
+typedef struct _CMOCK_place_EXPECT_ROW
+{
+  POINT_T point;
+  float scale;
+} place_ExpectRow;
+#define place_ExpectTable(cmock_rows, cmock_count) place_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void place_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const place_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define place_IgnoreArg_point() place_CMockIgnoreArg_point(__LINE__)
+void place_CMockIgnoreArg_point(UNITY_LINE_TYPE cmock_line);
+
+#define place_IgnoreArg_scale() place_CMockIgnoreArg_scale(__LINE__)
+void place_CMockIgnoreArg_scale(UNITY_LINE_TYPE cmock_line);
+#define move_ExpectAndReturn(point, cmock_retval) TEST_FAIL_MESSAGE("move requires _Expect (not AndReturn)");
+#define move_Expect(point) move_CMockExpect(__LINE__, point)
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* point);
+typedef struct _CMOCK_move_EXPECT_ROW
+{
+  POINT_T* point;
+} move_ExpectRow;
+#define move_ExpectTable(cmock_rows, cmock_count) move_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define move_IgnoreArg_point() move_CMockIgnoreArg_point(__LINE__)
+void move_CMockIgnoreArg_point(UNITY_LINE_TYPE cmock_line);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
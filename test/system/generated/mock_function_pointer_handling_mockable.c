@@ -0,0 +1,388 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_function_pointer_handling_mockable.h"
+
+static const char* CMockString_cmock_arg1 = "cmock_arg1";
+static const char* CMockString_func_ptr = "func_ptr";
+static const char* CMockString_myfunc = "myfunc";
+static const char* CMockString_op_code = "op_code";
+static const char* CMockString_returns_function_ptr = "returns_function_ptr";
+static const char* CMockString_takes_const_function_ptr = "takes_const_function_ptr";
+static const char* CMockString_takes_function_ptr = "takes_function_ptr";
+static const char* CMockString_takes_function_ptr_shorthand = "takes_function_ptr_shorthand";
+static const char* CMockString_takes_function_type = "takes_function_type";
+
+typedef struct _CMOCK_takes_function_type_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  FUNCTION_T Expected_myfunc;
+
+} CMOCK_takes_function_type_CALL_INSTANCE;
+
+typedef struct _CMOCK_takes_function_ptr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  cmock_function_pointer_handling_mockable_func_ptr3 Expected_func_ptr;
+
+} CMOCK_takes_function_ptr_CALL_INSTANCE;
+
+typedef struct _CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  cmock_function_pointer_handling_mockable_func_ptr4 Expected_func_ptr;
+
+} CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE;
+
+typedef struct _CMOCK_takes_const_function_ptr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  cmock_function_pointer_handling_mockable_func_ptr5 Expected_cmock_arg1;
+
+} CMOCK_takes_const_function_ptr_CALL_INSTANCE;
+
+typedef struct _CMOCK_returns_function_ptr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  cmock_function_pointer_handling_mockable_func_ptr1 ReturnVal;
+  char Expected_op_code;
+
+} CMOCK_returns_function_ptr_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_function_pointer_handling_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE takes_function_type_CallInstance;
+  CMOCK_MEM_INDEX_TYPE takes_function_ptr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE takes_function_ptr_shorthand_CallInstance;
+  CMOCK_MEM_INDEX_TYPE takes_const_function_ptr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE returns_function_ptr_CallInstance;
+} Mock;
+
+
+void mock_function_pointer_handling_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.takes_function_type_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_takes_function_type);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.takes_function_ptr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_takes_function_ptr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.takes_function_ptr_shorthand_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_takes_function_ptr_shorthand);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.takes_const_function_ptr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_takes_const_function_ptr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.returns_function_ptr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_returns_function_ptr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_function_pointer_handling_mockable_Init(void)
+{
+  mock_function_pointer_handling_mockable_Destroy();
+}
+
+void mock_function_pointer_handling_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void takes_function_type(FUNCTION_T myfunc)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_takes_function_type_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_takes_function_type);
+  cmock_call_instance = (CMOCK_takes_function_type_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.takes_function_type_CallInstance);
+  Mock.takes_function_type_CallInstance = CMock_Guts_MemNext(Mock.takes_function_type_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_takes_function_type,CMockString_myfunc);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_myfunc, myfunc, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_takes_function_type(CMOCK_takes_function_type_CALL_INSTANCE* cmock_call_instance, FUNCTION_T myfunc);
+void CMockExpectParameters_takes_function_type(CMOCK_takes_function_type_CALL_INSTANCE* cmock_call_instance, FUNCTION_T myfunc)
+{
+  cmock_call_instance->Expected_myfunc = myfunc;
+}
+
+void takes_function_type_CMockExpect(UNITY_LINE_TYPE cmock_line, FUNCTION_T myfunc)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_takes_function_type_CALL_INSTANCE));
+  CMOCK_takes_function_type_CALL_INSTANCE* cmock_call_instance = (CMOCK_takes_function_type_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.takes_function_type_CallInstance = CMock_Guts_MemChain(Mock.takes_function_type_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_takes_function_type(cmock_call_instance, myfunc);
+}
+
+void takes_function_type_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_function_type_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_takes_function_type_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_takes_function_type_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.takes_function_type_CallInstance = CMock_Guts_MemChain(Mock.takes_function_type_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_takes_function_type_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_takes_function_type(cmock_call_instance, cmock_rows[cmock_row].myfunc);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void takes_function_ptr(cmock_function_pointer_handling_mockable_func_ptr3 func_ptr)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_takes_function_ptr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_takes_function_ptr);
+  cmock_call_instance = (CMOCK_takes_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.takes_function_ptr_CallInstance);
+  Mock.takes_function_ptr_CallInstance = CMock_Guts_MemNext(Mock.takes_function_ptr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_takes_function_ptr,CMockString_func_ptr);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_func_ptr, func_ptr, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_takes_function_ptr(CMOCK_takes_function_ptr_CALL_INSTANCE* cmock_call_instance, cmock_function_pointer_handling_mockable_func_ptr3 func_ptr);
+void CMockExpectParameters_takes_function_ptr(CMOCK_takes_function_ptr_CALL_INSTANCE* cmock_call_instance, cmock_function_pointer_handling_mockable_func_ptr3 func_ptr)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_func_ptr), (void*)(&func_ptr),
+         sizeof(cmock_function_pointer_handling_mockable_func_ptr3[sizeof(func_ptr) == sizeof(cmock_function_pointer_handling_mockable_func_ptr3) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void takes_function_ptr_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_function_pointer_handling_mockable_func_ptr3 func_ptr)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_takes_function_ptr_CALL_INSTANCE));
+  CMOCK_takes_function_ptr_CALL_INSTANCE* cmock_call_instance = (CMOCK_takes_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.takes_function_ptr_CallInstance = CMock_Guts_MemChain(Mock.takes_function_ptr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_takes_function_ptr(cmock_call_instance, func_ptr);
+}
+
+void takes_function_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_function_ptr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_takes_function_ptr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_takes_function_ptr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.takes_function_ptr_CallInstance = CMock_Guts_MemChain(Mock.takes_function_ptr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_takes_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_takes_function_ptr(cmock_call_instance, cmock_rows[cmock_row].func_ptr);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void takes_function_ptr_shorthand(cmock_function_pointer_handling_mockable_func_ptr4 func_ptr)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_takes_function_ptr_shorthand);
+  cmock_call_instance = (CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.takes_function_ptr_shorthand_CallInstance);
+  Mock.takes_function_ptr_shorthand_CallInstance = CMock_Guts_MemNext(Mock.takes_function_ptr_shorthand_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_takes_function_ptr_shorthand,CMockString_func_ptr);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_func_ptr, func_ptr, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_takes_function_ptr_shorthand(CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE* cmock_call_instance, cmock_function_pointer_handling_mockable_func_ptr4 func_ptr);
+void CMockExpectParameters_takes_function_ptr_shorthand(CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE* cmock_call_instance, cmock_function_pointer_handling_mockable_func_ptr4 func_ptr)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_func_ptr), (void*)(&func_ptr),
+         sizeof(cmock_function_pointer_handling_mockable_func_ptr4[sizeof(func_ptr) == sizeof(cmock_function_pointer_handling_mockable_func_ptr4) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void takes_function_ptr_shorthand_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_function_pointer_handling_mockable_func_ptr4 func_ptr)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE));
+  CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE* cmock_call_instance = (CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.takes_function_ptr_shorthand_CallInstance = CMock_Guts_MemChain(Mock.takes_function_ptr_shorthand_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_takes_function_ptr_shorthand(cmock_call_instance, func_ptr);
+}
+
+void takes_function_ptr_shorthand_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_function_ptr_shorthand_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.takes_function_ptr_shorthand_CallInstance = CMock_Guts_MemChain(Mock.takes_function_ptr_shorthand_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_takes_function_ptr_shorthand_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_takes_function_ptr_shorthand(cmock_call_instance, cmock_rows[cmock_row].func_ptr);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void takes_const_function_ptr(cmock_function_pointer_handling_mockable_func_ptr5 const cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_takes_const_function_ptr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_takes_const_function_ptr);
+  cmock_call_instance = (CMOCK_takes_const_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.takes_const_function_ptr_CallInstance);
+  Mock.takes_const_function_ptr_CallInstance = CMock_Guts_MemNext(Mock.takes_const_function_ptr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_takes_const_function_ptr,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_cmock_arg1, cmock_arg1, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_takes_const_function_ptr(CMOCK_takes_const_function_ptr_CALL_INSTANCE* cmock_call_instance, cmock_function_pointer_handling_mockable_func_ptr5 const cmock_arg1);
+void CMockExpectParameters_takes_const_function_ptr(CMOCK_takes_const_function_ptr_CALL_INSTANCE* cmock_call_instance, cmock_function_pointer_handling_mockable_func_ptr5 const cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(cmock_function_pointer_handling_mockable_func_ptr5[sizeof(cmock_arg1) == sizeof(cmock_function_pointer_handling_mockable_func_ptr5) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void takes_const_function_ptr_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_function_pointer_handling_mockable_func_ptr5 const cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_takes_const_function_ptr_CALL_INSTANCE));
+  CMOCK_takes_const_function_ptr_CALL_INSTANCE* cmock_call_instance = (CMOCK_takes_const_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.takes_const_function_ptr_CallInstance = CMock_Guts_MemChain(Mock.takes_const_function_ptr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_takes_const_function_ptr(cmock_call_instance, cmock_arg1);
+}
+
+void takes_const_function_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_const_function_ptr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_takes_const_function_ptr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_takes_const_function_ptr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.takes_const_function_ptr_CallInstance = CMock_Guts_MemChain(Mock.takes_const_function_ptr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_takes_const_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_takes_const_function_ptr(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+cmock_function_pointer_handling_mockable_func_ptr1 returns_function_ptr(const char op_code)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_returns_function_ptr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_returns_function_ptr);
+  cmock_call_instance = (CMOCK_returns_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.returns_function_ptr_CallInstance);
+  Mock.returns_function_ptr_CallInstance = CMock_Guts_MemNext(Mock.returns_function_ptr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_returns_function_ptr,CMockString_op_code);
+    UNITY_TEST_ASSERT_EQUAL_INT8(cmock_call_instance->Expected_op_code, op_code, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_returns_function_ptr(CMOCK_returns_function_ptr_CALL_INSTANCE* cmock_call_instance, const char op_code);
+void CMockExpectParameters_returns_function_ptr(CMOCK_returns_function_ptr_CALL_INSTANCE* cmock_call_instance, const char op_code)
+{
+  cmock_call_instance->Expected_op_code = op_code;
+}
+
+void returns_function_ptr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char op_code, cmock_function_pointer_handling_mockable_func_ptr1 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_returns_function_ptr_CALL_INSTANCE));
+  CMOCK_returns_function_ptr_CALL_INSTANCE* cmock_call_instance = (CMOCK_returns_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.returns_function_ptr_CallInstance = CMock_Guts_MemChain(Mock.returns_function_ptr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_returns_function_ptr(cmock_call_instance, op_code);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(cmock_function_pointer_handling_mockable_func_ptr1[sizeof(cmock_to_return) == sizeof(cmock_function_pointer_handling_mockable_func_ptr1) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void returns_function_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const returns_function_ptr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_returns_function_ptr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_returns_function_ptr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.returns_function_ptr_CallInstance = CMock_Guts_MemChain(Mock.returns_function_ptr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_returns_function_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_returns_function_ptr(cmock_call_instance, cmock_rows[cmock_row].op_code);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(cmock_function_pointer_handling_mockable_func_ptr1[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(cmock_function_pointer_handling_mockable_func_ptr1) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
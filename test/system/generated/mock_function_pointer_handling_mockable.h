@@ -0,0 +1,94 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_FUNCTION_POINTER_HANDLING_MOCKABLE_H
+#define _MOCK_FUNCTION_POINTER_HANDLING_MOCKABLE_H
+
+#include "unity.h"
+#include "function_pointer_handling_types.h"
+#include "function_pointer_handling_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_function_pointer_handling_mockable_Init(void);
+void mock_function_pointer_handling_mockable_Destroy(void);
+void mock_function_pointer_handling_mockable_Verify(void);
+
+
+typedef unsigned short(*cmock_function_pointer_handling_mockable_func_ptr1)( int, long int );
+typedef unsigned short(*cmock_function_pointer_handling_mockable_func_ptr2)( int, long int );
+typedef unsigned int(*cmock_function_pointer_handling_mockable_func_ptr3)(int, char);
+typedef unsigned int(*cmock_function_pointer_handling_mockable_func_ptr4)(int, char*);
+typedef unsigned int(*cmock_function_pointer_handling_mockable_func_ptr5)(int, char);
+
+
+#define takes_function_type_ExpectAndReturn(myfunc, cmock_retval) TEST_FAIL_MESSAGE("takes_function_type requires _Expect (not AndReturn)");
+#define takes_function_type_Expect(myfunc) takes_function_type_CMockExpect(__LINE__, myfunc)
+void takes_function_type_CMockExpect(UNITY_LINE_TYPE cmock_line, FUNCTION_T myfunc);
+typedef struct _CMOCK_takes_function_type_EXPECT_ROW
+{
+  FUNCTION_T myfunc;
+} takes_function_type_ExpectRow;
+#define takes_function_type_ExpectTable(cmock_rows, cmock_count) takes_function_type_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void takes_function_type_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_function_type_ExpectRow* cmock_rows, size_t cmock_count);
+#define takes_function_ptr_ExpectAndReturn(func_ptr, cmock_retval) TEST_FAIL_MESSAGE("takes_function_ptr requires _Expect (not AndReturn)");
+#define takes_function_ptr_Expect(func_ptr) takes_function_ptr_CMockExpect(__LINE__, func_ptr)
+void takes_function_ptr_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_function_pointer_handling_mockable_func_ptr3 func_ptr);
+typedef struct _CMOCK_takes_function_ptr_EXPECT_ROW
+{
+  cmock_function_pointer_handling_mockable_func_ptr3 func_ptr;
+} takes_function_ptr_ExpectRow;
+#define takes_function_ptr_ExpectTable(cmock_rows, cmock_count) takes_function_ptr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void takes_function_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_function_ptr_ExpectRow* cmock_rows, size_t cmock_count);
+#define takes_function_ptr_shorthand_ExpectAndReturn(func_ptr, cmock_retval) TEST_FAIL_MESSAGE("takes_function_ptr_shorthand requires _Expect (not AndReturn)");
+#define takes_function_ptr_shorthand_Expect(func_ptr) takes_function_ptr_shorthand_CMockExpect(__LINE__, func_ptr)
+void takes_function_ptr_shorthand_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_function_pointer_handling_mockable_func_ptr4 func_ptr);
+typedef struct _CMOCK_takes_function_ptr_shorthand_EXPECT_ROW
+{
+  cmock_function_pointer_handling_mockable_func_ptr4 func_ptr;
+} takes_function_ptr_shorthand_ExpectRow;
+#define takes_function_ptr_shorthand_ExpectTable(cmock_rows, cmock_count) takes_function_ptr_shorthand_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void takes_function_ptr_shorthand_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_function_ptr_shorthand_ExpectRow* cmock_rows, size_t cmock_count);
+#define takes_const_function_ptr_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("takes_const_function_ptr requires _Expect (not AndReturn)");
+#define takes_const_function_ptr_Expect(cmock_arg1) takes_const_function_ptr_CMockExpect(__LINE__, cmock_arg1)
+void takes_const_function_ptr_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_function_pointer_handling_mockable_func_ptr5 const cmock_arg1);
+typedef struct _CMOCK_takes_const_function_ptr_EXPECT_ROW
+{
+  cmock_function_pointer_handling_mockable_func_ptr5 cmock_arg1;
+} takes_const_function_ptr_ExpectRow;
+#define takes_const_function_ptr_ExpectTable(cmock_rows, cmock_count) takes_const_function_ptr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void takes_const_function_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const takes_const_function_ptr_ExpectRow* cmock_rows, size_t cmock_count);
+#define returns_function_ptr_Expect(op_code) TEST_FAIL_MESSAGE("returns_function_ptr requires _ExpectAndReturn");
+#define returns_function_ptr_ExpectAndReturn(op_code, cmock_retval) returns_function_ptr_CMockExpectAndReturn(__LINE__, op_code, cmock_retval)
+void returns_function_ptr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char op_code, cmock_function_pointer_handling_mockable_func_ptr1 cmock_to_return);
+typedef struct _CMOCK_returns_function_ptr_EXPECT_ROW
+{
+  char op_code;
+  cmock_function_pointer_handling_mockable_func_ptr1 ReturnVal;
+} returns_function_ptr_ExpectRow;
+#define returns_function_ptr_ExpectTable(cmock_rows, cmock_count) returns_function_ptr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void returns_function_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const returns_function_ptr_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
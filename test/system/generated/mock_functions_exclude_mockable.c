@@ -0,0 +1,124 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_functions_exclude_mockable.h"
+
+static const char* CMockString_read_value = "read_value";
+
+typedef struct _CMOCK_read_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_read_value_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_functions_exclude_mockableInstance
+{
+  char read_value_IgnoreBool;
+  int read_value_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE read_value_CallInstance;
+} Mock;
+
+
+void mock_functions_exclude_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.read_value_CallInstance;
+  if (Mock.read_value_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_read_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_functions_exclude_mockable_Init(void)
+{
+  mock_functions_exclude_mockable_Destroy();
+}
+
+void mock_functions_exclude_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+int read_value(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_value);
+  cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_value_CallInstance);
+  Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  if (Mock.read_value_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_value_FinalReturn;
+  Mock.read_value_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void read_value_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_value_IgnoreBool = (char)1;
+}
+
+void read_value_CMockStopIgnore(void)
+{
+  if(Mock.read_value_IgnoreBool)
+    Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  Mock.read_value_IgnoreBool = (char)0;
+}
+
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.read_value_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
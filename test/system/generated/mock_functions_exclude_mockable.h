@@ -0,0 +1,60 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_FUNCTIONS_EXCLUDE_MOCKABLE_H
+#define _MOCK_FUNCTIONS_EXCLUDE_MOCKABLE_H
+
+#include "unity.h"
+#include "functions_exclude_types.h"
+#include "functions_exclude_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_functions_exclude_mockable_Init(void);
+void mock_functions_exclude_mockable_Destroy(void);
+void mock_functions_exclude_mockable_Verify(void);
+
+
+typedef int(*cmock_functions_exclude_mockable_func_ptr1)(int);
+typedef int(*cmock_functions_exclude_mockable_func_ptr2)(int);
+
+
+
+#define read_value_Ignore() TEST_FAIL_MESSAGE("read_value requires _IgnoreAndReturn");
+#define read_value_IgnoreAndReturn(cmock_retval) read_value_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_value_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_value_StopIgnore() read_value_CMockStopIgnore()
+void read_value_CMockStopIgnore(void);
+#define read_value_Expect() TEST_FAIL_MESSAGE("read_value requires _ExpectAndReturn");
+#define read_value_ExpectAndReturn(cmock_retval) read_value_CMockExpectAndReturn(__LINE__, cmock_retval)
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_read_value_EXPECT_ROW
+{
+  int ReturnVal;
+} read_value_ExpectRow;
+#define read_value_ExpectTable(cmock_rows, cmock_count) read_value_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
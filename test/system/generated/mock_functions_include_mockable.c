@@ -0,0 +1,397 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_functions_include_mockable.h"
+
+static const char* CMockString_dev_read = "dev_read";
+static const char* CMockString_dev_write = "dev_write";
+static const char* CMockString_io_read = "io_read";
+static const char* CMockString_io_write = "io_write";
+static const char* CMockString_value = "value";
+
+typedef struct _CMOCK_io_read_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_io_read_CALL_INSTANCE;
+
+typedef struct _CMOCK_io_write_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_value;
+
+} CMOCK_io_write_CALL_INSTANCE;
+
+typedef struct _CMOCK_dev_read_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_dev_read_CALL_INSTANCE;
+
+typedef struct _CMOCK_dev_write_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_value;
+
+} CMOCK_dev_write_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_functions_include_mockableInstance
+{
+  char io_read_IgnoreBool;
+  int io_read_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE io_read_CallInstance;
+  char io_write_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE io_write_CallInstance;
+  char dev_read_IgnoreBool;
+  int dev_read_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE dev_read_CallInstance;
+  char dev_write_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE dev_write_CallInstance;
+} Mock;
+
+
+void mock_functions_include_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.io_read_CallInstance;
+  if (Mock.io_read_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_io_read);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.io_write_CallInstance;
+  if (Mock.io_write_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_io_write);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.dev_read_CallInstance;
+  if (Mock.dev_read_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_dev_read);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.dev_write_CallInstance;
+  if (Mock.dev_write_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_dev_write);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_functions_include_mockable_Init(void)
+{
+  mock_functions_include_mockable_Destroy();
+}
+
+void mock_functions_include_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+int io_read(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_io_read_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_io_read);
+  cmock_call_instance = (CMOCK_io_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.io_read_CallInstance);
+  Mock.io_read_CallInstance = CMock_Guts_MemNext(Mock.io_read_CallInstance);
+  if (Mock.io_read_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.io_read_FinalReturn;
+  Mock.io_read_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void io_read_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_io_read_CALL_INSTANCE));
+  CMOCK_io_read_CALL_INSTANCE* cmock_call_instance = (CMOCK_io_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.io_read_CallInstance = CMock_Guts_MemChain(Mock.io_read_CallInstance, cmock_guts_index);
+  Mock.io_read_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.io_read_IgnoreBool = (char)1;
+}
+
+void io_read_CMockStopIgnore(void)
+{
+  if(Mock.io_read_IgnoreBool)
+    Mock.io_read_CallInstance = CMock_Guts_MemNext(Mock.io_read_CallInstance);
+  Mock.io_read_IgnoreBool = (char)0;
+}
+
+void io_read_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_io_read_CALL_INSTANCE));
+  CMOCK_io_read_CALL_INSTANCE* cmock_call_instance = (CMOCK_io_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.io_read_CallInstance = CMock_Guts_MemChain(Mock.io_read_CallInstance, cmock_guts_index);
+  Mock.io_read_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void io_read_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const io_read_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_io_read_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_io_read_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.io_read_CallInstance = CMock_Guts_MemChain(Mock.io_read_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_io_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.io_read_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void io_write(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_io_write_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_io_write);
+  cmock_call_instance = (CMOCK_io_write_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.io_write_CallInstance);
+  Mock.io_write_CallInstance = CMock_Guts_MemNext(Mock.io_write_CallInstance);
+  if (Mock.io_write_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_io_write,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_io_write(CMOCK_io_write_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_io_write(CMOCK_io_write_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void io_write_CMockIgnore(void)
+{
+  Mock.io_write_IgnoreBool = (char)1;
+}
+
+void io_write_CMockStopIgnore(void)
+{
+  Mock.io_write_IgnoreBool = (char)0;
+}
+
+void io_write_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_io_write_CALL_INSTANCE));
+  CMOCK_io_write_CALL_INSTANCE* cmock_call_instance = (CMOCK_io_write_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.io_write_CallInstance = CMock_Guts_MemChain(Mock.io_write_CallInstance, cmock_guts_index);
+  Mock.io_write_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_io_write(cmock_call_instance, value);
+}
+
+void io_write_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const io_write_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_io_write_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_io_write_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.io_write_CallInstance = CMock_Guts_MemChain(Mock.io_write_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_io_write_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.io_write_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_io_write(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int dev_read(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_dev_read_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_dev_read);
+  cmock_call_instance = (CMOCK_dev_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.dev_read_CallInstance);
+  Mock.dev_read_CallInstance = CMock_Guts_MemNext(Mock.dev_read_CallInstance);
+  if (Mock.dev_read_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.dev_read_FinalReturn;
+  Mock.dev_read_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void dev_read_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_dev_read_CALL_INSTANCE));
+  CMOCK_dev_read_CALL_INSTANCE* cmock_call_instance = (CMOCK_dev_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.dev_read_CallInstance = CMock_Guts_MemChain(Mock.dev_read_CallInstance, cmock_guts_index);
+  Mock.dev_read_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.dev_read_IgnoreBool = (char)1;
+}
+
+void dev_read_CMockStopIgnore(void)
+{
+  if(Mock.dev_read_IgnoreBool)
+    Mock.dev_read_CallInstance = CMock_Guts_MemNext(Mock.dev_read_CallInstance);
+  Mock.dev_read_IgnoreBool = (char)0;
+}
+
+void dev_read_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_dev_read_CALL_INSTANCE));
+  CMOCK_dev_read_CALL_INSTANCE* cmock_call_instance = (CMOCK_dev_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.dev_read_CallInstance = CMock_Guts_MemChain(Mock.dev_read_CallInstance, cmock_guts_index);
+  Mock.dev_read_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void dev_read_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dev_read_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_dev_read_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_dev_read_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.dev_read_CallInstance = CMock_Guts_MemChain(Mock.dev_read_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_dev_read_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.dev_read_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void dev_write(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_dev_write_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_dev_write);
+  cmock_call_instance = (CMOCK_dev_write_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.dev_write_CallInstance);
+  Mock.dev_write_CallInstance = CMock_Guts_MemNext(Mock.dev_write_CallInstance);
+  if (Mock.dev_write_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_dev_write,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_dev_write(CMOCK_dev_write_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_dev_write(CMOCK_dev_write_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void dev_write_CMockIgnore(void)
+{
+  Mock.dev_write_IgnoreBool = (char)1;
+}
+
+void dev_write_CMockStopIgnore(void)
+{
+  Mock.dev_write_IgnoreBool = (char)0;
+}
+
+void dev_write_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_dev_write_CALL_INSTANCE));
+  CMOCK_dev_write_CALL_INSTANCE* cmock_call_instance = (CMOCK_dev_write_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.dev_write_CallInstance = CMock_Guts_MemChain(Mock.dev_write_CallInstance, cmock_guts_index);
+  Mock.dev_write_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_dev_write(cmock_call_instance, value);
+}
+
+void dev_write_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dev_write_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_dev_write_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_dev_write_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.dev_write_CallInstance = CMock_Guts_MemChain(Mock.dev_write_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_dev_write_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.dev_write_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_dev_write(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,103 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_FUNCTIONS_INCLUDE_MOCKABLE_H
+#define _MOCK_FUNCTIONS_INCLUDE_MOCKABLE_H
+
+#include "unity.h"
+#include "functions_include_types.h"
+#include "functions_include_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_functions_include_mockable_Init(void);
+void mock_functions_include_mockable_Destroy(void);
+void mock_functions_include_mockable_Verify(void);
+
+
+
+
+
+#define io_read_Ignore() TEST_FAIL_MESSAGE("io_read requires _IgnoreAndReturn");
+#define io_read_IgnoreAndReturn(cmock_retval) io_read_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void io_read_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define io_read_StopIgnore() io_read_CMockStopIgnore()
+void io_read_CMockStopIgnore(void);
+#define io_read_Expect() TEST_FAIL_MESSAGE("io_read requires _ExpectAndReturn");
+#define io_read_ExpectAndReturn(cmock_retval) io_read_CMockExpectAndReturn(__LINE__, cmock_retval)
+void io_read_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_io_read_EXPECT_ROW
+{
+  int ReturnVal;
+} io_read_ExpectRow;
+#define io_read_ExpectTable(cmock_rows, cmock_count) io_read_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void io_read_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const io_read_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define io_write_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("io_write requires _Ignore (not AndReturn)");
+#define io_write_Ignore() io_write_CMockIgnore()
+void io_write_CMockIgnore(void);
+#define io_write_StopIgnore() io_write_CMockStopIgnore()
+void io_write_CMockStopIgnore(void);
+#define io_write_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("io_write requires _Expect (not AndReturn)");
+#define io_write_Expect(value) io_write_CMockExpect(__LINE__, value)
+void io_write_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_io_write_EXPECT_ROW
+{
+  int value;
+} io_write_ExpectRow;
+#define io_write_ExpectTable(cmock_rows, cmock_count) io_write_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void io_write_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const io_write_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define dev_read_Ignore() TEST_FAIL_MESSAGE("dev_read requires _IgnoreAndReturn");
+#define dev_read_IgnoreAndReturn(cmock_retval) dev_read_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void dev_read_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define dev_read_StopIgnore() dev_read_CMockStopIgnore()
+void dev_read_CMockStopIgnore(void);
+#define dev_read_Expect() TEST_FAIL_MESSAGE("dev_read requires _ExpectAndReturn");
+#define dev_read_ExpectAndReturn(cmock_retval) dev_read_CMockExpectAndReturn(__LINE__, cmock_retval)
+void dev_read_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_dev_read_EXPECT_ROW
+{
+  int ReturnVal;
+} dev_read_ExpectRow;
+#define dev_read_ExpectTable(cmock_rows, cmock_count) dev_read_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void dev_read_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dev_read_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define dev_write_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("dev_write requires _Ignore (not AndReturn)");
+#define dev_write_Ignore() dev_write_CMockIgnore()
+void dev_write_CMockIgnore(void);
+#define dev_write_StopIgnore() dev_write_CMockStopIgnore()
+void dev_write_CMockStopIgnore(void);
+#define dev_write_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("dev_write requires _Expect (not AndReturn)");
+#define dev_write_Expect(value) dev_write_CMockExpect(__LINE__, value)
+void dev_write_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_dev_write_EXPECT_ROW
+{
+  int value;
+} dev_write_ExpectRow;
+#define dev_write_ExpectTable(cmock_rows, cmock_count) dev_write_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void dev_write_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dev_write_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
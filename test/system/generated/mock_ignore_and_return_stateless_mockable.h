@@ -0,0 +1,72 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_IGNORE_AND_RETURN_STATELESS_MOCKABLE_H
+#define _MOCK_IGNORE_AND_RETURN_STATELESS_MOCKABLE_H
+
+#include "unity.h"
+#include "ignore_and_return_stateless_types.h"
+#include "ignore_and_return_stateless_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_ignore_and_return_stateless_mockable_Init(void);
+void mock_ignore_and_return_stateless_mockable_Destroy(void);
+void mock_ignore_and_return_stateless_mockable_Verify(void);
+
+
+
+
+#define foo_Ignore() TEST_FAIL_MESSAGE("foo requires _IgnoreAndReturn");
+#define foo_IgnoreAndReturn(cmock_retval) foo_CMockIgnoreAndReturn(cmock_retval)
+void foo_CMockIgnoreAndReturn(int cmock_to_return);
+#define foo_StopIgnore() foo_CMockStopIgnore()
+void foo_CMockStopIgnore(void);
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, int cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  int a;
+  int ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define bar_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("bar requires _Ignore (not AndReturn)");
+#define bar_Ignore() bar_CMockIgnore()
+void bar_CMockIgnore(void);
+#define bar_StopIgnore() bar_CMockStopIgnore()
+void bar_CMockStopIgnore(void);
+#define bar_ExpectAndReturn(b, cmock_retval) TEST_FAIL_MESSAGE("bar requires _Expect (not AndReturn)");
+#define bar_Expect(b) bar_CMockExpect(__LINE__, b)
+void bar_CMockExpect(UNITY_LINE_TYPE cmock_line, int b);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  int b;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,85 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_INLINE_H
+#define _MOCK_INLINE_H
+
+#include "unity.h"
+#include "inline.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_inline_Init(void);
+void mock_inline_Destroy(void);
+void mock_inline_Verify(void);
+
+
+
+
+#define dummy_func_0_Expect() TEST_FAIL_MESSAGE("dummy_func_0 requires _ExpectAndReturn");
+#define dummy_func_0_ExpectAndReturn(cmock_retval) dummy_func_0_CMockExpectAndReturn(__LINE__, cmock_retval)
+void dummy_func_0_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_dummy_func_0_EXPECT_ROW
+{
+  int ReturnVal;
+} dummy_func_0_ExpectRow;
+#define dummy_func_0_ExpectTable(cmock_rows, cmock_count) dummy_func_0_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void dummy_func_0_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dummy_func_0_ExpectRow* cmock_rows, size_t cmock_count);
+#define dummy_func_1_Expect(a) TEST_FAIL_MESSAGE("dummy_func_1 requires _ExpectAndReturn");
+#define dummy_func_1_ExpectAndReturn(a, cmock_retval) dummy_func_1_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void dummy_func_1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, int cmock_to_return);
+typedef struct _CMOCK_dummy_func_1_EXPECT_ROW
+{
+  int a;
+  int ReturnVal;
+} dummy_func_1_ExpectRow;
+#define dummy_func_1_ExpectTable(cmock_rows, cmock_count) dummy_func_1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void dummy_func_1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dummy_func_1_ExpectRow* cmock_rows, size_t cmock_count);
+#define dummy_func_2_Expect(a, b, c) TEST_FAIL_MESSAGE("dummy_func_2 requires _ExpectAndReturn");
+#define dummy_func_2_ExpectAndReturn(a, b, c, cmock_retval) dummy_func_2_CMockExpectAndReturn(__LINE__, a, b, c, cmock_retval)
+void dummy_func_2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, char b, float c, int cmock_to_return);
+typedef struct _CMOCK_dummy_func_2_EXPECT_ROW
+{
+  int a;
+  char b;
+  float c;
+  int ReturnVal;
+} dummy_func_2_ExpectRow;
+#define dummy_func_2_ExpectTable(cmock_rows, cmock_count) dummy_func_2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void dummy_func_2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dummy_func_2_ExpectRow* cmock_rows, size_t cmock_count);
+#define dummy_normal_func_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("dummy_normal_func requires _Expect (not AndReturn)");
+#define dummy_normal_func_Expect(a) dummy_normal_func_CMockExpect(__LINE__, a)
+void dummy_normal_func_CMockExpect(UNITY_LINE_TYPE cmock_line, int a);
+typedef struct _CMOCK_dummy_normal_func_EXPECT_ROW
+{
+  int a;
+} dummy_normal_func_ExpectRow;
+#define dummy_normal_func_ExpectTable(cmock_rows, cmock_count) dummy_normal_func_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void dummy_normal_func_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const dummy_normal_func_ExpectRow* cmock_rows, size_t cmock_count);
+#define dummy_func_3_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("dummy_func_3 requires _Expect (not AndReturn)");
+#define dummy_func_3_Expect() dummy_func_3_CMockExpect(__LINE__)
+void dummy_func_3_CMockExpect(UNITY_LINE_TYPE cmock_line);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
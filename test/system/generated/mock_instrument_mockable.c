@@ -0,0 +1,423 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_instrument_mockable.h"
+
+static const char* CMockString_read_value = "read_value";
+static const char* CMockString_unused = "unused";
+static const char* CMockString_value = "value";
+static const char* CMockString_write_value = "write_value";
+
+typedef struct _CMOCK_read_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_read_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_value;
+
+} CMOCK_write_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_unused_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_unused_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_instrument_mockableInstance
+{
+  char read_value_IgnoreBool;
+  int read_value_FinalReturn;
+  char read_value_CallbackBool;
+  CMOCK_read_value_CALLBACK read_value_CallbackFunctionPointer;
+  int read_value_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE read_value_CallInstance;
+  char write_value_IgnoreBool;
+  char write_value_CallbackBool;
+  CMOCK_write_value_CALLBACK write_value_CallbackFunctionPointer;
+  int write_value_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE write_value_CallInstance;
+  char unused_IgnoreBool;
+  char unused_CallbackBool;
+  CMOCK_unused_CALLBACK unused_CallbackFunctionPointer;
+  int unused_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE unused_CallInstance;
+} Mock;
+
+static CMOCK_THREAD_STORAGE struct mock_instrument_mockablePersistent
+{
+  CMOCK_INSTRUMENT_STATS read_value_Stats;
+  CMOCK_INSTRUMENT_STATS write_value_Stats;
+  CMOCK_INSTRUMENT_STATS unused_Stats;
+} MockPersistent;
+
+
+void mock_instrument_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.read_value_CallInstance;
+  if (Mock.read_value_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_read_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.read_value_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.write_value_CallInstance;
+  if (Mock.write_value_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_write_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.write_value_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.unused_CallInstance;
+  if (Mock.unused_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_unused);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.unused_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+}
+
+void mock_instrument_mockable_Init(void)
+{
+  mock_instrument_mockable_Destroy();
+}
+
+void mock_instrument_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+int read_value(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_value);
+  cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_value_CallInstance);
+  Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  MockPersistent.read_value_Stats.Calls++;
+  if (Mock.read_value_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_value_FinalReturn;
+  Mock.read_value_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.read_value_CallbackBool &&
+      Mock.read_value_CallbackFunctionPointer != NULL)
+  {
+    int cmock_cb_ret;
+    CMOCK_INSTRUMENT_ENTER(CMockString_read_value, MockPersistent.read_value_Stats);
+    cmock_cb_ret = Mock.read_value_CallbackFunctionPointer(Mock.read_value_CallbackCalls++);
+    CMOCK_INSTRUMENT_EXIT(CMockString_read_value, MockPersistent.read_value_Stats, CallbackTime);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (Mock.read_value_CallbackFunctionPointer != NULL)
+  {
+    CMOCK_INSTRUMENT_ENTER(CMockString_read_value, MockPersistent.read_value_Stats);
+    cmock_call_instance->ReturnVal = Mock.read_value_CallbackFunctionPointer(Mock.read_value_CallbackCalls++);
+    CMOCK_INSTRUMENT_EXIT(CMockString_read_value, MockPersistent.read_value_Stats, CallbackTime);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+const CMOCK_INSTRUMENT_STATS* read_value_GetStats(void)
+{
+  return &MockPersistent.read_value_Stats;
+}
+
+void read_value_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_value_IgnoreBool = (char)1;
+}
+
+void read_value_CMockStopIgnore(void)
+{
+  if(Mock.read_value_IgnoreBool)
+    Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  Mock.read_value_IgnoreBool = (char)0;
+}
+
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  Mock.read_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.read_value_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void read_value_AddCallback(CMOCK_read_value_CALLBACK Callback)
+{
+  Mock.read_value_IgnoreBool = (char)0;
+  Mock.read_value_CallbackBool = (char)1;
+  Mock.read_value_CallbackFunctionPointer = Callback;
+}
+
+void read_value_Stub(CMOCK_read_value_CALLBACK Callback)
+{
+  Mock.read_value_IgnoreBool = (char)0;
+  Mock.read_value_CallbackBool = (char)0;
+  Mock.read_value_CallbackFunctionPointer = Callback;
+}
+
+void write_value(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_value);
+  cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_value_CallInstance);
+  Mock.write_value_CallInstance = CMock_Guts_MemNext(Mock.write_value_CallInstance);
+  MockPersistent.write_value_Stats.Calls++;
+  if (Mock.write_value_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.write_value_CallbackBool &&
+      Mock.write_value_CallbackFunctionPointer != NULL)
+  {
+    CMOCK_INSTRUMENT_ENTER(CMockString_write_value, MockPersistent.write_value_Stats);
+    Mock.write_value_CallbackFunctionPointer(value, Mock.write_value_CallbackCalls++);
+    CMOCK_INSTRUMENT_EXIT(CMockString_write_value, MockPersistent.write_value_Stats, CallbackTime);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  CMOCK_INSTRUMENT_ENTER(CMockString_write_value, MockPersistent.write_value_Stats);
+  {
+    UNITY_SET_DETAILS(CMockString_write_value,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  CMOCK_INSTRUMENT_EXIT(CMockString_write_value, MockPersistent.write_value_Stats, VerifyTime);
+  if (Mock.write_value_CallbackFunctionPointer != NULL)
+  {
+    CMOCK_INSTRUMENT_ENTER(CMockString_write_value, MockPersistent.write_value_Stats);
+    Mock.write_value_CallbackFunctionPointer(value, Mock.write_value_CallbackCalls++);
+    CMOCK_INSTRUMENT_EXIT(CMockString_write_value, MockPersistent.write_value_Stats, CallbackTime);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+const CMOCK_INSTRUMENT_STATS* write_value_GetStats(void)
+{
+  return &MockPersistent.write_value_Stats;
+}
+
+void write_value_CMockIgnore(void)
+{
+  Mock.write_value_IgnoreBool = (char)1;
+}
+
+void write_value_CMockStopIgnore(void)
+{
+  Mock.write_value_IgnoreBool = (char)0;
+}
+
+void write_value_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_value_CALL_INSTANCE));
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  Mock.write_value_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_write_value(cmock_call_instance, value);
+}
+
+void write_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.write_value_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_write_value(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_value_AddCallback(CMOCK_write_value_CALLBACK Callback)
+{
+  Mock.write_value_IgnoreBool = (char)0;
+  Mock.write_value_CallbackBool = (char)1;
+  Mock.write_value_CallbackFunctionPointer = Callback;
+}
+
+void write_value_Stub(CMOCK_write_value_CALLBACK Callback)
+{
+  Mock.write_value_IgnoreBool = (char)0;
+  Mock.write_value_CallbackBool = (char)0;
+  Mock.write_value_CallbackFunctionPointer = Callback;
+}
+
+void unused(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_unused_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_unused);
+  cmock_call_instance = (CMOCK_unused_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.unused_CallInstance);
+  Mock.unused_CallInstance = CMock_Guts_MemNext(Mock.unused_CallInstance);
+  MockPersistent.unused_Stats.Calls++;
+  if (Mock.unused_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.unused_CallbackBool &&
+      Mock.unused_CallbackFunctionPointer != NULL)
+  {
+    CMOCK_INSTRUMENT_ENTER(CMockString_unused, MockPersistent.unused_Stats);
+    Mock.unused_CallbackFunctionPointer(Mock.unused_CallbackCalls++);
+    CMOCK_INSTRUMENT_EXIT(CMockString_unused, MockPersistent.unused_Stats, CallbackTime);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (Mock.unused_CallbackFunctionPointer != NULL)
+  {
+    CMOCK_INSTRUMENT_ENTER(CMockString_unused, MockPersistent.unused_Stats);
+    Mock.unused_CallbackFunctionPointer(Mock.unused_CallbackCalls++);
+    CMOCK_INSTRUMENT_EXIT(CMockString_unused, MockPersistent.unused_Stats, CallbackTime);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+const CMOCK_INSTRUMENT_STATS* unused_GetStats(void)
+{
+  return &MockPersistent.unused_Stats;
+}
+
+void unused_CMockIgnore(void)
+{
+  Mock.unused_IgnoreBool = (char)1;
+}
+
+void unused_CMockStopIgnore(void)
+{
+  Mock.unused_IgnoreBool = (char)0;
+}
+
+void unused_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_unused_CALL_INSTANCE));
+  CMOCK_unused_CALL_INSTANCE* cmock_call_instance = (CMOCK_unused_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.unused_CallInstance = CMock_Guts_MemChain(Mock.unused_CallInstance, cmock_guts_index);
+  Mock.unused_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void unused_AddCallback(CMOCK_unused_CALLBACK Callback)
+{
+  Mock.unused_IgnoreBool = (char)0;
+  Mock.unused_CallbackBool = (char)1;
+  Mock.unused_CallbackFunctionPointer = Callback;
+}
+
+void unused_Stub(CMOCK_unused_CALLBACK Callback)
+{
+  Mock.unused_IgnoreBool = (char)0;
+  Mock.unused_CallbackBool = (char)0;
+  Mock.unused_CallbackFunctionPointer = Callback;
+}
+
+void mock_instrument_mockable_DumpStats(void)
+{
+  if (MockPersistent.read_value_Stats.Calls != 0)
+    CMock_Instrument_Print(CMockString_read_value, &MockPersistent.read_value_Stats);
+  if (MockPersistent.write_value_Stats.Calls != 0)
+    CMock_Instrument_Print(CMockString_write_value, &MockPersistent.write_value_Stats);
+  if (MockPersistent.unused_Stats.Calls != 0)
+    CMock_Instrument_Print(CMockString_unused, &MockPersistent.unused_Stats);
+}
+
+void mock_instrument_mockable_ResetStats(void)
+{
+  memset(&MockPersistent, 0, sizeof(MockPersistent));
+}
+
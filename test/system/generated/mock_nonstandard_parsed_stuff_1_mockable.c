@@ -0,0 +1,286 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_nonstandard_parsed_stuff_1_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_bars = "bars";
+static const char* CMockString_foos = "foos";
+
+typedef struct _CMOCK_foos_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  const char const* Expected_a;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_foos_CALL_INSTANCE;
+
+typedef struct _CMOCK_bars_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char const* ReturnVal;
+  int CallOrder;
+  CEXCEPTION_T ExceptionToThrow;
+
+} CMOCK_bars_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_nonstandard_parsed_stuff_1_mockableInstance
+{
+  char foos_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE foos_CallInstance;
+  char bars_IgnoreBool;
+  const char const* bars_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE bars_CallInstance;
+} Mock;
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+void mock_nonstandard_parsed_stuff_1_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foos_CallInstance;
+  if (Mock.foos_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foos);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.bars_CallInstance;
+  if (Mock.bars_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bars);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_nonstandard_parsed_stuff_1_mockable_Init(void)
+{
+  mock_nonstandard_parsed_stuff_1_mockable_Destroy();
+}
+
+void mock_nonstandard_parsed_stuff_1_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
+void foos(const char const* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foos);
+  cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foos_CallInstance);
+  Mock.foos_CallInstance = CMock_Guts_MemNext(Mock.foos_CallInstance);
+  if (Mock.foos_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_foos,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foos(CMOCK_foos_CALL_INSTANCE* cmock_call_instance, const char const* a);
+void CMockExpectParameters_foos(CMOCK_foos_CALL_INSTANCE* cmock_call_instance, const char const* a)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(const char const*[sizeof(a) == sizeof(const char const*) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foos_CMockIgnore(void)
+{
+  Mock.foos_IgnoreBool = (char)1;
+}
+
+void foos_CMockStopIgnore(void)
+{
+  Mock.foos_IgnoreBool = (char)0;
+}
+
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char const* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foos_CALL_INSTANCE));
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  Mock.foos_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  CMockExpectParameters_foos(cmock_call_instance, a);
+}
+
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foos_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foos_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    CMockExpectParameters_foos(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foos_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, const char const* a, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foos_CALL_INSTANCE));
+  CMOCK_foos_CALL_INSTANCE* cmock_call_instance = (CMOCK_foos_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foos_CallInstance = CMock_Guts_MemChain(Mock.foos_CallInstance, cmock_guts_index);
+  Mock.foos_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  CMockExpectParameters_foos(cmock_call_instance, a);
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
+const char const* bars(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bars);
+  cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bars_CallInstance);
+  Mock.bars_CallInstance = CMock_Guts_MemNext(Mock.bars_CallInstance);
+  if (Mock.bars_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.bars_FinalReturn;
+  memcpy((void*)(&Mock.bars_FinalReturn), (void*)(&cmock_call_instance->ReturnVal),
+         sizeof(const char const*[sizeof(cmock_call_instance->ReturnVal) == sizeof(const char const*) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (cmock_call_instance->ExceptionToThrow != CEXCEPTION_NONE)
+  {
+    UNITY_CLR_DETAILS();
+    Throw(cmock_call_instance->ExceptionToThrow);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void bars_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, const char const* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  Mock.bars_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.bars_IgnoreBool = (char)1;
+}
+
+void bars_CMockStopIgnore(void)
+{
+  if(Mock.bars_IgnoreBool)
+    Mock.bars_CallInstance = CMock_Guts_MemNext(Mock.bars_CallInstance);
+  Mock.bars_IgnoreBool = (char)0;
+}
+
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char const* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  Mock.bars_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(const char const*[sizeof(cmock_to_return) == sizeof(const char const*) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bars_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.bars_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(const char const*[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(const char const*) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void bars_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bars_CALL_INSTANCE));
+  CMOCK_bars_CALL_INSTANCE* cmock_call_instance = (CMOCK_bars_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bars_CallInstance = CMock_Guts_MemChain(Mock.bars_CallInstance, cmock_guts_index);
+  Mock.bars_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ExceptionToThrow = CEXCEPTION_NONE;
+  cmock_call_instance->ExceptionToThrow = cmock_to_throw;
+}
+
@@ -0,0 +1,78 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_NONSTANDARD_PARSED_STUFF_1_MOCKABLE_H
+#define _MOCK_NONSTANDARD_PARSED_STUFF_1_MOCKABLE_H
+
+#include "unity.h"
+#include "nonstandard_parsed_stuff_1_types.h"
+#include "nonstandard_parsed_stuff_1_mockable.h"
+#include "CException.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_nonstandard_parsed_stuff_1_mockable_Init(void);
+void mock_nonstandard_parsed_stuff_1_mockable_Destroy(void);
+void mock_nonstandard_parsed_stuff_1_mockable_Verify(void);
+
+
+
+
+
+#define foos_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foos requires _Ignore (not AndReturn)");
+#define foos_Ignore() foos_CMockIgnore()
+void foos_CMockIgnore(void);
+#define foos_StopIgnore() foos_CMockStopIgnore()
+void foos_CMockStopIgnore(void);
+#define foos_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foos requires _Expect (not AndReturn)");
+#define foos_Expect(a) foos_CMockExpect(__LINE__, a)
+void foos_CMockExpect(UNITY_LINE_TYPE cmock_line, const char const* a);
+typedef struct _CMOCK_foos_EXPECT_ROW
+{
+  const char const* a;
+} foos_ExpectRow;
+#define foos_ExpectTable(cmock_rows, cmock_count) foos_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foos_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foos_ExpectRow* cmock_rows, size_t cmock_count);
+#define foos_ExpectAndThrow(a, cmock_to_throw) foos_CMockExpectAndThrow(__LINE__, a, cmock_to_throw)
+void foos_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, const char const* a, CEXCEPTION_T cmock_to_throw);
+
+#define bars_Ignore() TEST_FAIL_MESSAGE("bars requires _IgnoreAndReturn");
+#define bars_IgnoreAndReturn(cmock_retval) bars_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void bars_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, const char const* cmock_to_return);
+#define bars_StopIgnore() bars_CMockStopIgnore()
+void bars_CMockStopIgnore(void);
+#define bars_Expect() TEST_FAIL_MESSAGE("bars requires _ExpectAndReturn");
+#define bars_ExpectAndReturn(cmock_retval) bars_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bars_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const char const* cmock_to_return);
+typedef struct _CMOCK_bars_EXPECT_ROW
+{
+  const char const* ReturnVal;
+} bars_ExpectRow;
+#define bars_ExpectTable(cmock_rows, cmock_count) bars_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bars_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bars_ExpectRow* cmock_rows, size_t cmock_count);
+#define bars_ExpectAndThrow(cmock_to_throw) bars_CMockExpectAndThrow(__LINE__, cmock_to_throw)
+void bars_CMockExpectAndThrow(UNITY_LINE_TYPE cmock_line, CEXCEPTION_T cmock_to_throw);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,64 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_NONSTANDARD_PARSED_STUFF_2_MOCKABLE_H
+#define _MOCK_NONSTANDARD_PARSED_STUFF_2_MOCKABLE_H
+
+#include "unity.h"
+#include "nonstandard_parsed_stuff_2_types.h"
+#include "nonstandard_parsed_stuff_2_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_nonstandard_parsed_stuff_2_mockable_Init(void);
+void mock_nonstandard_parsed_stuff_2_mockable_Destroy(void);
+void mock_nonstandard_parsed_stuff_2_mockable_Verify(void);
+
+
+
+
+#define foo_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("foo requires _Expect (not AndReturn)");
+#define foo_Expect(a) foo_CMockExpect(__LINE__, a)
+void foo_CMockExpect(UNITY_LINE_TYPE cmock_line, unsigned char** a);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  unsigned char** a;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_ExpectWithArrayAndReturn(a, a_Depth, cmock_retval) TEST_FAIL_MESSAGE("foo requires _ExpectWithArray (not AndReturn)");
+#define foo_ExpectWithArray(a, a_Depth) foo_CMockExpectWithArray(__LINE__, a, (a_Depth))
+void foo_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, unsigned char** a, int a_Depth);
+#define bar_Expect() TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(cmock_retval) bar_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned char** cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  unsigned char** ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,6866 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_osek.h"
+
+static const char* CMockString_A = "A";
+static const char* CMockString_ActivateTask = "ActivateTask";
+static const char* CMockString_AdvCntr = "AdvCntr";
+static const char* CMockString_B = "B";
+static const char* CMockString_C = "C";
+static const char* CMockString_CancelAlarm = "CancelAlarm";
+static const char* CMockString_ChainTask = "ChainTask";
+static const char* CMockString_ClearEvent = "ClearEvent";
+static const char* CMockString_DisableAllInterrupts = "DisableAllInterrupts";
+static const char* CMockString_EnableAllInterrupts = "EnableAllInterrupts";
+static const char* CMockString_ErrorHook = "ErrorHook";
+static const char* CMockString_GetActiveApplicationMode = "GetActiveApplicationMode";
+static const char* CMockString_GetAlarm = "GetAlarm";
+static const char* CMockString_GetAlarmBase = "GetAlarmBase";
+static const char* CMockString_GetEvent = "GetEvent";
+static const char* CMockString_GetResource = "GetResource";
+static const char* CMockString_GetTaskID = "GetTaskID";
+static const char* CMockString_GetTaskState = "GetTaskState";
+static const char* CMockString_IAdvCntr = "IAdvCntr";
+static const char* CMockString_OSEKOSActivateTask = "OSEKOSActivateTask";
+static const char* CMockString_OSEKOSAdvCntr = "OSEKOSAdvCntr";
+static const char* CMockString_OSEKOSAsmDispatch = "OSEKOSAsmDispatch";
+static const char* CMockString_OSEKOSAsmIDispatch = "OSEKOSAsmIDispatch";
+static const char* CMockString_OSEKOSCancelAlarm = "OSEKOSCancelAlarm";
+static const char* CMockString_OSEKOSDisable = "OSEKOSDisable";
+static const char* CMockString_OSEKOSDisableAll = "OSEKOSDisableAll";
+static const char* CMockString_OSEKOSDisableInterrupt_intern = "OSEKOSDisableInterrupt_intern";
+static const char* CMockString_OSEKOSEnable = "OSEKOSEnable";
+static const char* CMockString_OSEKOSEnableAll = "OSEKOSEnableAll";
+static const char* CMockString_OSEKOSEnableInterrupt_intern = "OSEKOSEnableInterrupt_intern";
+static const char* CMockString_OSEKOSEnableSystemTimers = "OSEKOSEnableSystemTimers";
+static const char* CMockString_OSEKOSError = "OSEKOSError";
+static const char* CMockString_OSEKOSGetAlarm = "OSEKOSGetAlarm";
+static const char* CMockString_OSEKOSNop = "OSEKOSNop";
+static const char* CMockString_OSEKOSResumeAllInterrupts = "OSEKOSResumeAllInterrupts";
+static const char* CMockString_OSEKOSResumeOSInterrupts = "OSEKOSResumeOSInterrupts";
+static const char* CMockString_OSEKOSReturn = "OSEKOSReturn";
+static const char* CMockString_OSEKOSSetAbsAlarm = "OSEKOSSetAbsAlarm";
+static const char* CMockString_OSEKOSSetAlarm = "OSEKOSSetAlarm";
+static const char* CMockString_OSEKOSSetEvent = "OSEKOSSetEvent";
+static const char* CMockString_OSEKOSShutdownOS = "OSEKOSShutdownOS";
+static const char* CMockString_OSEKOSStartupEnable = "OSEKOSStartupEnable";
+static const char* CMockString_OSEKOSSuspendAllInterrupts = "OSEKOSSuspendAllInterrupts";
+static const char* CMockString_OSEKOSSuspendOSInterrupts = "OSEKOSSuspendOSInterrupts";
+static const char* CMockString_OSEKOSTaskSwitch = "OSEKOSTaskSwitch";
+static const char* CMockString_OSEKOSTerminateTask = "OSEKOSTerminateTask";
+static const char* CMockString_OSEKOSV850ASyncContextLoad = "OSEKOSV850ASyncContextLoad";
+static const char* CMockString_OSEKOSV850ASyncContextLoadFromIRQ = "OSEKOSV850ASyncContextLoadFromIRQ";
+static const char* CMockString_OSEKOSV850CheckIsrSwitch = "OSEKOSV850CheckIsrSwitch";
+static const char* CMockString_OSEKOSV850InitInterrupts = "OSEKOSV850InitInterrupts";
+static const char* CMockString_OSEKOSV850SetupInterrupts = "OSEKOSV850SetupInterrupts";
+static const char* CMockString_OSEKOSV850StartContext = "OSEKOSV850StartContext";
+static const char* CMockString_OSEKOSV850StartContextFromIRQ = "OSEKOSV850StartContextFromIRQ";
+static const char* CMockString_OSEKOSV850SyncContextLoad = "OSEKOSV850SyncContextLoad";
+static const char* CMockString_OSEKOSV850SyncContextLoadFromIRQ = "OSEKOSV850SyncContextLoadFromIRQ";
+static const char* CMockString_OSEKOSWaitEvent = "OSEKOSWaitEvent";
+static const char* CMockString_OSEKOS_ISR_ALSTimeoutInt = "OSEKOS_ISR_ALSTimeoutInt";
+static const char* CMockString_OSEKOS_ISR_AmbientReturnInt = "OSEKOS_ISR_AmbientReturnInt";
+static const char* CMockString_OSEKOS_ISR_CanErrInterrupt = "OSEKOS_ISR_CanErrInterrupt";
+static const char* CMockString_OSEKOS_ISR_CanRxInterrupt = "OSEKOS_ISR_CanRxInterrupt";
+static const char* CMockString_OSEKOS_ISR_CanRxInterrupt_1 = "OSEKOS_ISR_CanRxInterrupt_1";
+static const char* CMockString_OSEKOS_ISR_CanTxInterrupt = "OSEKOS_ISR_CanTxInterrupt";
+static const char* CMockString_OSEKOS_ISR_CompFreqHandler = "OSEKOS_ISR_CompFreqHandler";
+static const char* CMockString_OSEKOS_ISR_GlareReturnInt = "OSEKOS_ISR_GlareReturnInt";
+static const char* CMockString_OSEKOS_ISR_LINDelayInt = "OSEKOS_ISR_LINDelayInt";
+static const char* CMockString_OSEKOS_ISR_LINError_SCI1 = "OSEKOS_ISR_LINError_SCI1";
+static const char* CMockString_OSEKOS_ISR_LINRxTx_SCI1 = "OSEKOS_ISR_LINRxTx_SCI1";
+static const char* CMockString_OSEKOS_ISR_LINTimerInt = "OSEKOS_ISR_LINTimerInt";
+static const char* CMockString_OSEKOS_ISR_SCIRxInterrupt = "OSEKOS_ISR_SCIRxInterrupt";
+static const char* CMockString_OSEKOS_ISR_SCITxInterrupt = "OSEKOS_ISR_SCITxInterrupt";
+static const char* CMockString_OSEKOS_ISR_SysCounter = "OSEKOS_ISR_SysCounter";
+static const char* CMockString_OSEKOS_ISR_TimerMExpire = "OSEKOS_ISR_TimerMExpire";
+static const char* CMockString_OSEKOS_ISR_UP_DMA_Interrupt_0 = "OSEKOS_ISR_UP_DMA_Interrupt_0";
+static const char* CMockString_OSEKOS_ISR_UP_DMA_Interrupt_1 = "OSEKOS_ISR_UP_DMA_Interrupt_1";
+static const char* CMockString_OSEKOS_ISR_UP_DMA_Interrupt_2 = "OSEKOS_ISR_UP_DMA_Interrupt_2";
+static const char* CMockString_OSEKOS_ISR_UP_DMA_Interrupt_3 = "OSEKOS_ISR_UP_DMA_Interrupt_3";
+static const char* CMockString_OSEKOS_T_BackgroundTask = "OSEKOS_T_BackgroundTask";
+static const char* CMockString_OSEKOS_T_CalibrateMagTask = "OSEKOS_T_CalibrateMagTask";
+static const char* CMockString_OSEKOS_T_ProcessMagForCompass = "OSEKOS_T_ProcessMagForCompass";
+static const char* CMockString_OSEKOS_T_ReadMag = "OSEKOS_T_ReadMag";
+static const char* CMockString_OSEKOS_T_SmartBeam = "OSEKOS_T_SmartBeam";
+static const char* CMockString_OSEKOS_T_Task_ALS = "OSEKOS_T_Task_ALS";
+static const char* CMockString_OSEKOS_T_Task_Cyclic10 = "OSEKOS_T_Task_Cyclic10";
+static const char* CMockString_OSEKOS_T_Task_Cyclic1000 = "OSEKOS_T_Task_Cyclic1000";
+static const char* CMockString_OSEKOS_T_Task_Cyclic2 = "OSEKOS_T_Task_Cyclic2";
+static const char* CMockString_OSEKOS_T_Task_Cyclic20 = "OSEKOS_T_Task_Cyclic20";
+static const char* CMockString_OSEKOS_T_Task_DbgCAN = "OSEKOS_T_Task_DbgCAN";
+static const char* CMockString_OSEKOS_T_Task_IAQ = "OSEKOS_T_Task_IAQ";
+static const char* CMockString_OSEKOS_T_Task_QbertTestImage = "OSEKOS_T_Task_QbertTestImage";
+static const char* CMockString_OSEKOS_T_Task_TestQbertMem = "OSEKOS_T_Task_TestQbertMem";
+static const char* CMockString_OSEKOS_T_Task_Wdm = "OSEKOS_T_Task_Wdm";
+static const char* CMockString_OSEKOS_Twrap_BackgroundTask = "OSEKOS_Twrap_BackgroundTask";
+static const char* CMockString_OSEKOS_Twrap_CalibrateMagTask = "OSEKOS_Twrap_CalibrateMagTask";
+static const char* CMockString_OSEKOS_Twrap_ProcessMagForCompass = "OSEKOS_Twrap_ProcessMagForCompass";
+static const char* CMockString_OSEKOS_Twrap_ReadMag = "OSEKOS_Twrap_ReadMag";
+static const char* CMockString_OSEKOS_Twrap_SmartBeam = "OSEKOS_Twrap_SmartBeam";
+static const char* CMockString_OSEKOS_Twrap_Task_ALS = "OSEKOS_Twrap_Task_ALS";
+static const char* CMockString_OSEKOS_Twrap_Task_Cyclic10 = "OSEKOS_Twrap_Task_Cyclic10";
+static const char* CMockString_OSEKOS_Twrap_Task_Cyclic1000 = "OSEKOS_Twrap_Task_Cyclic1000";
+static const char* CMockString_OSEKOS_Twrap_Task_Cyclic2 = "OSEKOS_Twrap_Task_Cyclic2";
+static const char* CMockString_OSEKOS_Twrap_Task_Cyclic20 = "OSEKOS_Twrap_Task_Cyclic20";
+static const char* CMockString_OSEKOS_Twrap_Task_DbgCAN = "OSEKOS_Twrap_Task_DbgCAN";
+static const char* CMockString_OSEKOS_Twrap_Task_IAQ = "OSEKOS_Twrap_Task_IAQ";
+static const char* CMockString_OSEKOS_Twrap_Task_QbertTestImage = "OSEKOS_Twrap_Task_QbertTestImage";
+static const char* CMockString_OSEKOS_Twrap_Task_TestQbertMem = "OSEKOS_Twrap_Task_TestQbertMem";
+static const char* CMockString_OSEKOS_Twrap_Task_Wdm = "OSEKOS_Twrap_Task_Wdm";
+static const char* CMockString_OSEKOScheckSuspendResumeNesting = "OSEKOScheckSuspendResumeNesting";
+static const char* CMockString_OSEKOSgetSR = "OSEKOSgetSR";
+static const char* CMockString_OSEKOSgetStackPointer = "OSEKOSgetStackPointer";
+static const char* CMockString_OSEKOSisrStackCheck = "OSEKOSisrStackCheck";
+static const char* CMockString_OSEKOSisrStackCheckFatal = "OSEKOSisrStackCheckFatal";
+static const char* CMockString_OSEKOSrtcGetSeconds = "OSEKOSrtcGetSeconds";
+static const char* CMockString_OSEKOSrtcIncrement = "OSEKOSrtcIncrement";
+static const char* CMockString_OSEKOStaskStackCheck = "OSEKOStaskStackCheck";
+static const char* CMockString_OSEKOStaskStackCheckFatal = "OSEKOStaskStackCheckFatal";
+static const char* CMockString_OSEKOStaskStackCheckInit = "OSEKOStaskStackCheckInit";
+static const char* CMockString_ReleaseResource = "ReleaseResource";
+static const char* CMockString_ResumeAllInterrupts = "ResumeAllInterrupts";
+static const char* CMockString_ResumeOSInterrupts = "ResumeOSInterrupts";
+static const char* CMockString_Schedule = "Schedule";
+static const char* CMockString_SetAbsAlarm = "SetAbsAlarm";
+static const char* CMockString_SetEvent = "SetEvent";
+static const char* CMockString_SetRelAlarm = "SetRelAlarm";
+static const char* CMockString_ShutdownHook = "ShutdownHook";
+static const char* CMockString_StartOS = "StartOS";
+static const char* CMockString_StartupHook = "StartupHook";
+static const char* CMockString_SuspendAllInterrupts = "SuspendAllInterrupts";
+static const char* CMockString_SuspendOSInterrupts = "SuspendOSInterrupts";
+static const char* CMockString_TerminateTask = "TerminateTask";
+static const char* CMockString_WaitEvent = "WaitEvent";
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_c = "c";
+static const char* CMockString_cmock_arg1 = "cmock_arg1";
+static const char* CMockString_cmock_arg2 = "cmock_arg2";
+static const char* CMockString_cmock_arg3 = "cmock_arg3";
+static const char* CMockString_getUnusedIsrStack = "getUnusedIsrStack";
+static const char* CMockString_getUnusedTaskStack = "getUnusedTaskStack";
+static const char* CMockString_getUsedIsrStack = "getUsedIsrStack";
+static const char* CMockString_getUsedTaskStack = "getUsedTaskStack";
+static const char* CMockString_nr = "nr";
+static const char* CMockString_nsec = "nsec";
+static const char* CMockString_p = "p";
+
+typedef struct _CMOCK_OSEKOSDisableAll_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSDisableAll_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSEnableAll_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSEnableAll_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned long ReturnVal;
+
+} CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned long Expected_nsec;
+
+} CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSError_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  StatusType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSError_CALL_INSTANCE;
+
+typedef struct _CMOCK_ErrorHook_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType Expected_cmock_arg1;
+
+} CMOCK_ErrorHook_CALL_INSTANCE;
+
+typedef struct _CMOCK_StartupHook_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_StartupHook_CALL_INSTANCE;
+
+typedef struct _CMOCK_ShutdownHook_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType Expected_cmock_arg1;
+
+} CMOCK_ShutdownHook_CALL_INSTANCE;
+
+typedef struct _CMOCK_getUsedTaskStack_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  TaskType Expected_cmock_arg1;
+
+} CMOCK_getUsedTaskStack_CALL_INSTANCE;
+
+typedef struct _CMOCK_getUnusedTaskStack_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  TaskType Expected_cmock_arg1;
+
+} CMOCK_getUnusedTaskStack_CALL_INSTANCE;
+
+typedef struct _CMOCK_getUsedIsrStack_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_getUsedIsrStack_CALL_INSTANCE;
+
+typedef struct _CMOCK_getUnusedIsrStack_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_getUnusedIsrStack_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  signed char ReturnVal;
+  OSEK_U8* Expected_cmock_arg1;
+
+} CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  signed char ReturnVal;
+  OSEK_U8* Expected_cmock_arg1;
+
+} CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEK_U8* Expected_cmock_arg1;
+
+} CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEK_U8* Expected_cmock_arg1;
+
+} CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEK_U8* ReturnVal;
+
+} CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSReturn_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  StatusType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSReturn_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSActivateTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSActivateTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSTerminateTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  TaskType Expected_cmock_arg1;
+  TaskType Expected_cmock_arg2;
+
+} CMOCK_OSEKOSTerminateTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSSetEvent_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  TaskType Expected_cmock_arg1;
+  EventMaskType Expected_cmock_arg2;
+
+} CMOCK_OSEKOSSetEvent_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSWaitEvent_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  EventMaskType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSWaitEvent_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSGetAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  TickType ReturnVal;
+  AlarmType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSGetAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSSetAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  AlarmType Expected_cmock_arg1;
+  TickType Expected_cmock_arg2;
+  TickType Expected_cmock_arg3;
+
+} CMOCK_OSEKOSSetAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_a;
+  TickType Expected_b;
+  TickType Expected_c;
+
+} CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSAdvCntr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSAdvCntr_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetActiveApplicationMode_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  AppModeType ReturnVal;
+
+} CMOCK_GetActiveApplicationMode_CALL_INSTANCE;
+
+typedef struct _CMOCK_StartOS_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  AppModeType Expected_cmock_arg1;
+
+} CMOCK_StartOS_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSShutdownOS_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSShutdownOS_CALL_INSTANCE;
+
+typedef struct _CMOCK_ActivateTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskType Expected_A;
+
+} CMOCK_ActivateTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_TerminateTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+
+} CMOCK_TerminateTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_ChainTask_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskType Expected_A;
+
+} CMOCK_ChainTask_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetTaskState_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskType Expected_A;
+  TaskStateRefType Expected_B;
+
+} CMOCK_GetTaskState_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetTaskID_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskRefType Expected_A;
+
+} CMOCK_GetTaskID_CALL_INSTANCE;
+
+typedef struct _CMOCK_Schedule_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+
+} CMOCK_Schedule_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetResource_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  ResourceType Expected_A;
+
+} CMOCK_GetResource_CALL_INSTANCE;
+
+typedef struct _CMOCK_ReleaseResource_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  ResourceType Expected_A;
+
+} CMOCK_ReleaseResource_CALL_INSTANCE;
+
+typedef struct _CMOCK_SetEvent_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskType Expected_A;
+  EventMaskType Expected_B;
+
+} CMOCK_SetEvent_CALL_INSTANCE;
+
+typedef struct _CMOCK_ClearEvent_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  EventMaskType Expected_A;
+
+} CMOCK_ClearEvent_CALL_INSTANCE;
+
+typedef struct _CMOCK_WaitEvent_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  EventMaskType Expected_A;
+
+} CMOCK_WaitEvent_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetEvent_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  TaskType Expected_A;
+  EventMaskRefType Expected_B;
+
+} CMOCK_GetEvent_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_A;
+  TickRefType Expected_B;
+
+} CMOCK_GetAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_GetAlarmBase_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_A;
+  AlarmBaseRefType Expected_B;
+
+} CMOCK_GetAlarmBase_CALL_INSTANCE;
+
+typedef struct _CMOCK_SetRelAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_A;
+  TickType Expected_B;
+  TickType Expected_C;
+
+} CMOCK_SetRelAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_SetAbsAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_A;
+  TickType Expected_B;
+  TickType Expected_C;
+
+} CMOCK_SetAbsAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_CancelAlarm_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  AlarmType Expected_A;
+
+} CMOCK_CancelAlarm_CALL_INSTANCE;
+
+typedef struct _CMOCK_AdvCntr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  CounterType Expected_A;
+
+} CMOCK_AdvCntr_CALL_INSTANCE;
+
+typedef struct _CMOCK_IAdvCntr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  StatusType ReturnVal;
+  CounterType Expected_A;
+
+} CMOCK_IAdvCntr_CALL_INSTANCE;
+
+typedef struct _CMOCK_SuspendOSInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_SuspendOSInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_ResumeOSInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_ResumeOSInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_SuspendAllInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_SuspendAllInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_ResumeAllInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_ResumeAllInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_DisableAllInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_DisableAllInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_EnableAllInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_EnableAllInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSDisable_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSDisable_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSEnable_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSEnable_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned long* Expected_cmock_arg1;
+
+} CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEKOSPrioType Expected_p;
+
+} CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSStartupEnable_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSStartupEnable_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSNop_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSNop_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int ReturnVal;
+
+} CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEKOSSaveType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEKOSSaveType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEKOSSaveType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  OSEKOSSaveType Expected_cmock_arg1;
+
+} CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850StartContext_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  cmock_osek_func_ptr1 Expected_cmock_arg1;
+  OSEK_U8* Expected_cmock_arg2;
+
+} CMOCK_OSEKOSV850StartContext_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  cmock_osek_func_ptr2 Expected_cmock_arg1;
+  OSEK_U8* Expected_cmock_arg2;
+
+} CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSgetSR_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_OSEKOSgetSR_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_nr;
+
+} CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE;
+
+typedef struct _CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_nr;
+
+} CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_osekInstance
+{
+  CMOCK_MEM_INDEX_TYPE OSEKOSDisableAll_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSEnableAll_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_DbgCAN_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_ALS_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_CalibrateMagTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_IAQ_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_SmartBeam_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_QbertTestImage_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_TestQbertMem_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_Cyclic1000_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_ProcessMagForCompass_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_ReadMag_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_Cyclic10_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_Wdm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_BackgroundTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_Cyclic20_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_T_Task_Cyclic2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_DbgCAN_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_ALS_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_CalibrateMagTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_IAQ_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_SmartBeam_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_QbertTestImage_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_TestQbertMem_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_Cyclic1000_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_ProcessMagForCompass_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_ReadMag_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_Cyclic10_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_Wdm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_BackgroundTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_Cyclic20_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_Twrap_Task_Cyclic2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSEnableSystemTimers_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_CanTxInterrupt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_CanRxInterrupt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_CanErrInterrupt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_SCIRxInterrupt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_SCITxInterrupt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_CompFreqHandler_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_AmbientReturnInt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_GlareReturnInt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_ALSTimeoutInt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_LINTimerInt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_LINDelayInt_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_TimerMExpire_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_LINRxTx_SCI1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_CanRxInterrupt_1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_LINError_SCI1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOS_ISR_SysCounter_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSrtcGetSeconds_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSrtcIncrement_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSError_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ErrorHook_CallInstance;
+  CMOCK_MEM_INDEX_TYPE StartupHook_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ShutdownHook_CallInstance;
+  CMOCK_MEM_INDEX_TYPE getUsedTaskStack_CallInstance;
+  CMOCK_MEM_INDEX_TYPE getUnusedTaskStack_CallInstance;
+  CMOCK_MEM_INDEX_TYPE getUsedIsrStack_CallInstance;
+  CMOCK_MEM_INDEX_TYPE getUnusedIsrStack_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOStaskStackCheckInit_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOStaskStackCheck_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSisrStackCheck_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOStaskStackCheckFatal_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSisrStackCheckFatal_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSgetStackPointer_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSTaskSwitch_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSReturn_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSActivateTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSTerminateTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSSetEvent_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSWaitEvent_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSGetAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSSetAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSSetAbsAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSCancelAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSAdvCntr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetActiveApplicationMode_CallInstance;
+  CMOCK_MEM_INDEX_TYPE StartOS_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSShutdownOS_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ActivateTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE TerminateTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ChainTask_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetTaskState_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetTaskID_CallInstance;
+  CMOCK_MEM_INDEX_TYPE Schedule_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetResource_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ReleaseResource_CallInstance;
+  CMOCK_MEM_INDEX_TYPE SetEvent_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ClearEvent_CallInstance;
+  CMOCK_MEM_INDEX_TYPE WaitEvent_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetEvent_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE GetAlarmBase_CallInstance;
+  CMOCK_MEM_INDEX_TYPE SetRelAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE SetAbsAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE CancelAlarm_CallInstance;
+  CMOCK_MEM_INDEX_TYPE AdvCntr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE IAdvCntr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE SuspendOSInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ResumeOSInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE SuspendAllInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ResumeAllInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE DisableAllInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE EnableAllInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSDisable_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSEnable_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSAsmIDispatch_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSAsmDispatch_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSStartupEnable_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSNop_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850CheckIsrSwitch_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850InitInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850SetupInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850SyncContextLoad_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850SyncContextLoadFromIRQ_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850ASyncContextLoad_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850ASyncContextLoadFromIRQ_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850StartContext_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSV850StartContextFromIRQ_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSSuspendOSInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSResumeOSInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSSuspendAllInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSResumeAllInterrupts_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOScheckSuspendResumeNesting_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSgetSR_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSEnableInterrupt_intern_CallInstance;
+  CMOCK_MEM_INDEX_TYPE OSEKOSDisableInterrupt_intern_CallInstance;
+} Mock;
+
+
+void mock_osek_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.OSEKOSDisableAll_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSDisableAll);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSEnableAll_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSEnableAll);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_DbgCAN_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_DbgCAN);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_ALS_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_ALS);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_CalibrateMagTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_CalibrateMagTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_IAQ_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_IAQ);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_SmartBeam_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_SmartBeam);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_QbertTestImage_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_QbertTestImage);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_TestQbertMem_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_TestQbertMem);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_Cyclic1000_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic1000);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_ProcessMagForCompass_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_ProcessMagForCompass);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_ReadMag_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_ReadMag);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_Cyclic10_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic10);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_Wdm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Wdm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_BackgroundTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_BackgroundTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_Cyclic20_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic20);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_T_Task_Cyclic2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_DbgCAN_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_DbgCAN);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_ALS_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_ALS);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_CalibrateMagTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_CalibrateMagTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_IAQ_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_IAQ);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_SmartBeam_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_SmartBeam);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_QbertTestImage_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_QbertTestImage);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_TestQbertMem_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_TestQbertMem);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_Cyclic1000_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic1000);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_ProcessMagForCompass_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_ProcessMagForCompass);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_ReadMag_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_ReadMag);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_Cyclic10_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic10);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_Wdm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Wdm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_BackgroundTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_BackgroundTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_Cyclic20_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic20);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_Twrap_Task_Cyclic2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSEnableSystemTimers_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSEnableSystemTimers);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_CanTxInterrupt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanTxInterrupt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_CanRxInterrupt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanRxInterrupt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_CanErrInterrupt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanErrInterrupt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_SCIRxInterrupt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_SCIRxInterrupt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_SCITxInterrupt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_SCITxInterrupt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_0);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_CompFreqHandler_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CompFreqHandler);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_AmbientReturnInt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_AmbientReturnInt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_GlareReturnInt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_GlareReturnInt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_ALSTimeoutInt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_ALSTimeoutInt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_LINTimerInt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINTimerInt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_LINDelayInt_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINDelayInt);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_TimerMExpire_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_TimerMExpire);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_LINRxTx_SCI1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINRxTx_SCI1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_CanRxInterrupt_1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanRxInterrupt_1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_LINError_SCI1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINError_SCI1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOS_ISR_SysCounter_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_SysCounter);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSrtcGetSeconds_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSrtcGetSeconds);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSrtcIncrement_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSrtcIncrement);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSError_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSError);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ErrorHook_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ErrorHook);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.StartupHook_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_StartupHook);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ShutdownHook_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ShutdownHook);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.getUsedTaskStack_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_getUsedTaskStack);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.getUnusedTaskStack_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_getUnusedTaskStack);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.getUsedIsrStack_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_getUsedIsrStack);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.getUnusedIsrStack_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_getUnusedIsrStack);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOStaskStackCheckInit_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOStaskStackCheckInit);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOStaskStackCheck_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOStaskStackCheck);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSisrStackCheck_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSisrStackCheck);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOStaskStackCheckFatal_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOStaskStackCheckFatal);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSisrStackCheckFatal_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSisrStackCheckFatal);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSgetStackPointer_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSgetStackPointer);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSTaskSwitch_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSTaskSwitch);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSReturn_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSReturn);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSActivateTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSActivateTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSTerminateTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSTerminateTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSSetEvent_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSSetEvent);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSWaitEvent_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSWaitEvent);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSGetAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSGetAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSSetAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSSetAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSSetAbsAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSSetAbsAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSCancelAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSCancelAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSAdvCntr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSAdvCntr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetActiveApplicationMode_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetActiveApplicationMode);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.StartOS_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_StartOS);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSShutdownOS_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSShutdownOS);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ActivateTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ActivateTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.TerminateTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_TerminateTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ChainTask_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ChainTask);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetTaskState_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetTaskState);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetTaskID_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetTaskID);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.Schedule_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_Schedule);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetResource_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetResource);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ReleaseResource_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ReleaseResource);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.SetEvent_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_SetEvent);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ClearEvent_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ClearEvent);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.WaitEvent_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_WaitEvent);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetEvent_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetEvent);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.GetAlarmBase_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_GetAlarmBase);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.SetRelAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_SetRelAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.SetAbsAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_SetAbsAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.CancelAlarm_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_CancelAlarm);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.AdvCntr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_AdvCntr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.IAdvCntr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_IAdvCntr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.SuspendOSInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_SuspendOSInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ResumeOSInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ResumeOSInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.SuspendAllInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_SuspendAllInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ResumeAllInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ResumeAllInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.DisableAllInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_DisableAllInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.EnableAllInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_EnableAllInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSDisable_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSDisable);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSEnable_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSEnable);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSAsmIDispatch_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSAsmIDispatch);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSAsmDispatch_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSAsmDispatch);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSStartupEnable_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSStartupEnable);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSNop_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSNop);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850CheckIsrSwitch_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850CheckIsrSwitch);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850InitInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850InitInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850SetupInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850SetupInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850SyncContextLoad_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850SyncContextLoad);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850SyncContextLoadFromIRQ);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850ASyncContextLoad_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850ASyncContextLoad);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850ASyncContextLoadFromIRQ);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850StartContext_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850StartContext);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSV850StartContextFromIRQ_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSV850StartContextFromIRQ);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSSuspendOSInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSSuspendOSInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSResumeOSInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSResumeOSInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSSuspendAllInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSSuspendAllInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSResumeAllInterrupts_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSResumeAllInterrupts);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOScheckSuspendResumeNesting_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOScheckSuspendResumeNesting);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSgetSR_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSgetSR);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSEnableInterrupt_intern_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSEnableInterrupt_intern);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.OSEKOSDisableInterrupt_intern_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_OSEKOSDisableInterrupt_intern);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_osek_Init(void)
+{
+  mock_osek_Destroy();
+}
+
+void mock_osek_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void OSEKOSDisableAll(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSDisableAll_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSDisableAll);
+  cmock_call_instance = (CMOCK_OSEKOSDisableAll_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSDisableAll_CallInstance);
+  Mock.OSEKOSDisableAll_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSDisableAll_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSDisableAll_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSDisableAll_CALL_INSTANCE));
+  CMOCK_OSEKOSDisableAll_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSDisableAll_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSDisableAll_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSDisableAll_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSEnableAll(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSEnableAll_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSEnableAll);
+  cmock_call_instance = (CMOCK_OSEKOSEnableAll_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSEnableAll_CallInstance);
+  Mock.OSEKOSEnableAll_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSEnableAll_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSEnableAll_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSEnableAll_CALL_INSTANCE));
+  CMOCK_OSEKOSEnableAll_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSEnableAll_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSEnableAll_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSEnableAll_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_DbgCAN(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_DbgCAN);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_DbgCAN_CallInstance);
+  Mock.OSEKOS_T_Task_DbgCAN_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_DbgCAN_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_DbgCAN_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_DbgCAN_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_DbgCAN_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_DbgCAN_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_ALS(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_ALS);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_ALS_CallInstance);
+  Mock.OSEKOS_T_Task_ALS_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_ALS_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_ALS_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_ALS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_ALS_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_ALS_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_CalibrateMagTask(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_CalibrateMagTask);
+  cmock_call_instance = (CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_CalibrateMagTask_CallInstance);
+  Mock.OSEKOS_T_CalibrateMagTask_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_CalibrateMagTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_CalibrateMagTask_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_CalibrateMagTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_CalibrateMagTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_CalibrateMagTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_IAQ(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_IAQ);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_IAQ_CallInstance);
+  Mock.OSEKOS_T_Task_IAQ_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_IAQ_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_IAQ_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_IAQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_IAQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_IAQ_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_SmartBeam(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_SmartBeam);
+  cmock_call_instance = (CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_SmartBeam_CallInstance);
+  Mock.OSEKOS_T_SmartBeam_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_SmartBeam_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_SmartBeam_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_SmartBeam_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_SmartBeam_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_SmartBeam_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_QbertTestImage(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_QbertTestImage);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_QbertTestImage_CallInstance);
+  Mock.OSEKOS_T_Task_QbertTestImage_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_QbertTestImage_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_QbertTestImage_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_QbertTestImage_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_QbertTestImage_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_QbertTestImage_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_TestQbertMem(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_TestQbertMem);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_TestQbertMem_CallInstance);
+  Mock.OSEKOS_T_Task_TestQbertMem_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_TestQbertMem_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_TestQbertMem_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_TestQbertMem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_TestQbertMem_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_TestQbertMem_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_Cyclic1000(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic1000);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_Cyclic1000_CallInstance);
+  Mock.OSEKOS_T_Task_Cyclic1000_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_Cyclic1000_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_Cyclic1000_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic1000_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_Cyclic1000_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_Cyclic1000_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_ProcessMagForCompass(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_ProcessMagForCompass);
+  cmock_call_instance = (CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_ProcessMagForCompass_CallInstance);
+  Mock.OSEKOS_T_ProcessMagForCompass_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_ProcessMagForCompass_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_ProcessMagForCompass_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_ProcessMagForCompass_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_ProcessMagForCompass_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_ProcessMagForCompass_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_ReadMag(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_ReadMag);
+  cmock_call_instance = (CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_ReadMag_CallInstance);
+  Mock.OSEKOS_T_ReadMag_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_ReadMag_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_ReadMag_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_ReadMag_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_ReadMag_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_ReadMag_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_Cyclic10(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic10);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_Cyclic10_CallInstance);
+  Mock.OSEKOS_T_Task_Cyclic10_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_Cyclic10_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_Cyclic10_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic10_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_Cyclic10_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_Cyclic10_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_Wdm(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Wdm);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_Wdm_CallInstance);
+  Mock.OSEKOS_T_Task_Wdm_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_Wdm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_Wdm_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_Wdm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_Wdm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_Wdm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_BackgroundTask(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_BackgroundTask);
+  cmock_call_instance = (CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_BackgroundTask_CallInstance);
+  Mock.OSEKOS_T_BackgroundTask_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_BackgroundTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_BackgroundTask_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_BackgroundTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_BackgroundTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_BackgroundTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_Cyclic20(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic20);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_Cyclic20_CallInstance);
+  Mock.OSEKOS_T_Task_Cyclic20_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_Cyclic20_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_Cyclic20_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic20_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_Cyclic20_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_Cyclic20_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_T_Task_Cyclic2(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_T_Task_Cyclic2);
+  cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_T_Task_Cyclic2_CallInstance);
+  Mock.OSEKOS_T_Task_Cyclic2_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_T_Task_Cyclic2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_T_Task_Cyclic2_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE));
+  CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_T_Task_Cyclic2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_T_Task_Cyclic2_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_T_Task_Cyclic2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_DbgCAN(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_DbgCAN);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_DbgCAN_CallInstance);
+  Mock.OSEKOS_Twrap_Task_DbgCAN_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_DbgCAN_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_DbgCAN_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_DbgCAN_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_DbgCAN_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_DbgCAN_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_ALS(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_ALS);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_ALS_CallInstance);
+  Mock.OSEKOS_Twrap_Task_ALS_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_ALS_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_ALS_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_ALS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_ALS_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_ALS_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_CalibrateMagTask(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_CalibrateMagTask);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_CalibrateMagTask_CallInstance);
+  Mock.OSEKOS_Twrap_CalibrateMagTask_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_CalibrateMagTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_CalibrateMagTask_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_CalibrateMagTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_CalibrateMagTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_CalibrateMagTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_IAQ(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_IAQ);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_IAQ_CallInstance);
+  Mock.OSEKOS_Twrap_Task_IAQ_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_IAQ_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_IAQ_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_IAQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_IAQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_IAQ_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_SmartBeam(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_SmartBeam);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_SmartBeam_CallInstance);
+  Mock.OSEKOS_Twrap_SmartBeam_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_SmartBeam_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_SmartBeam_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_SmartBeam_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_SmartBeam_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_SmartBeam_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_QbertTestImage(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_QbertTestImage);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_QbertTestImage_CallInstance);
+  Mock.OSEKOS_Twrap_Task_QbertTestImage_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_QbertTestImage_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_QbertTestImage_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_QbertTestImage_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_QbertTestImage_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_QbertTestImage_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_TestQbertMem(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_TestQbertMem);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_TestQbertMem_CallInstance);
+  Mock.OSEKOS_Twrap_Task_TestQbertMem_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_TestQbertMem_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_TestQbertMem_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_TestQbertMem_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_TestQbertMem_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_TestQbertMem_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_Cyclic1000(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic1000);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_Cyclic1000_CallInstance);
+  Mock.OSEKOS_Twrap_Task_Cyclic1000_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_Cyclic1000_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_Cyclic1000_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic1000_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_Cyclic1000_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_Cyclic1000_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_ProcessMagForCompass(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_ProcessMagForCompass);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_ProcessMagForCompass_CallInstance);
+  Mock.OSEKOS_Twrap_ProcessMagForCompass_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_ProcessMagForCompass_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_ProcessMagForCompass_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_ProcessMagForCompass_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_ProcessMagForCompass_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_ProcessMagForCompass_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_ReadMag(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_ReadMag);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_ReadMag_CallInstance);
+  Mock.OSEKOS_Twrap_ReadMag_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_ReadMag_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_ReadMag_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_ReadMag_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_ReadMag_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_ReadMag_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_Cyclic10(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic10);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_Cyclic10_CallInstance);
+  Mock.OSEKOS_Twrap_Task_Cyclic10_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_Cyclic10_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_Cyclic10_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic10_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_Cyclic10_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_Cyclic10_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_Wdm(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Wdm);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_Wdm_CallInstance);
+  Mock.OSEKOS_Twrap_Task_Wdm_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_Wdm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_Wdm_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Wdm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_Wdm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_Wdm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_BackgroundTask(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_BackgroundTask);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_BackgroundTask_CallInstance);
+  Mock.OSEKOS_Twrap_BackgroundTask_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_BackgroundTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_BackgroundTask_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_BackgroundTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_BackgroundTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_BackgroundTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_Cyclic20(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic20);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_Cyclic20_CallInstance);
+  Mock.OSEKOS_Twrap_Task_Cyclic20_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_Cyclic20_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_Cyclic20_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic20_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_Cyclic20_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_Cyclic20_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_Twrap_Task_Cyclic2(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_Twrap_Task_Cyclic2);
+  cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_Twrap_Task_Cyclic2_CallInstance);
+  Mock.OSEKOS_Twrap_Task_Cyclic2_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_Twrap_Task_Cyclic2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_Twrap_Task_Cyclic2_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE));
+  CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_Twrap_Task_Cyclic2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_Twrap_Task_Cyclic2_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_Twrap_Task_Cyclic2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSEnableSystemTimers(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSEnableSystemTimers);
+  cmock_call_instance = (CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSEnableSystemTimers_CallInstance);
+  Mock.OSEKOSEnableSystemTimers_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSEnableSystemTimers_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSEnableSystemTimers_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE));
+  CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSEnableSystemTimers_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSEnableSystemTimers_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSEnableSystemTimers_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_CanTxInterrupt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanTxInterrupt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_CanTxInterrupt_CallInstance);
+  Mock.OSEKOS_ISR_CanTxInterrupt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_CanTxInterrupt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_CanTxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_CanTxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_CanTxInterrupt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_CanTxInterrupt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_CanRxInterrupt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanRxInterrupt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_CanRxInterrupt_CallInstance);
+  Mock.OSEKOS_ISR_CanRxInterrupt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_CanRxInterrupt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_CanRxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_CanRxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_CanRxInterrupt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_CanRxInterrupt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_CanErrInterrupt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanErrInterrupt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_CanErrInterrupt_CallInstance);
+  Mock.OSEKOS_ISR_CanErrInterrupt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_CanErrInterrupt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_CanErrInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_CanErrInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_CanErrInterrupt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_CanErrInterrupt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_SCIRxInterrupt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_SCIRxInterrupt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_SCIRxInterrupt_CallInstance);
+  Mock.OSEKOS_ISR_SCIRxInterrupt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_SCIRxInterrupt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_SCIRxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_SCIRxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_SCIRxInterrupt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_SCIRxInterrupt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_SCITxInterrupt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_SCITxInterrupt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_SCITxInterrupt_CallInstance);
+  Mock.OSEKOS_ISR_SCITxInterrupt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_SCITxInterrupt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_SCITxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_SCITxInterrupt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_SCITxInterrupt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_SCITxInterrupt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_0(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_0);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance);
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_0_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_0_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_UP_DMA_Interrupt_0_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_1(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_1);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance);
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_1_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_UP_DMA_Interrupt_1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_2(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_2);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance);
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_2_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_UP_DMA_Interrupt_2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_3(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_UP_DMA_Interrupt_3);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance);
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_UP_DMA_Interrupt_3_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_UP_DMA_Interrupt_3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_UP_DMA_Interrupt_3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_CompFreqHandler(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CompFreqHandler);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_CompFreqHandler_CallInstance);
+  Mock.OSEKOS_ISR_CompFreqHandler_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_CompFreqHandler_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_CompFreqHandler_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_CompFreqHandler_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_CompFreqHandler_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_CompFreqHandler_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_AmbientReturnInt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_AmbientReturnInt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_AmbientReturnInt_CallInstance);
+  Mock.OSEKOS_ISR_AmbientReturnInt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_AmbientReturnInt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_AmbientReturnInt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_AmbientReturnInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_AmbientReturnInt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_AmbientReturnInt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_GlareReturnInt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_GlareReturnInt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_GlareReturnInt_CallInstance);
+  Mock.OSEKOS_ISR_GlareReturnInt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_GlareReturnInt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_GlareReturnInt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_GlareReturnInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_GlareReturnInt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_GlareReturnInt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_ALSTimeoutInt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_ALSTimeoutInt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_ALSTimeoutInt_CallInstance);
+  Mock.OSEKOS_ISR_ALSTimeoutInt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_ALSTimeoutInt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_ALSTimeoutInt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_ALSTimeoutInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_ALSTimeoutInt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_ALSTimeoutInt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_LINTimerInt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINTimerInt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_LINTimerInt_CallInstance);
+  Mock.OSEKOS_ISR_LINTimerInt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_LINTimerInt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_LINTimerInt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_LINTimerInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_LINTimerInt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_LINTimerInt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_LINDelayInt(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINDelayInt);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_LINDelayInt_CallInstance);
+  Mock.OSEKOS_ISR_LINDelayInt_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_LINDelayInt_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_LINDelayInt_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_LINDelayInt_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_LINDelayInt_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_LINDelayInt_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_TimerMExpire(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_TimerMExpire);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_TimerMExpire_CallInstance);
+  Mock.OSEKOS_ISR_TimerMExpire_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_TimerMExpire_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_TimerMExpire_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_TimerMExpire_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_TimerMExpire_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_TimerMExpire_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_LINRxTx_SCI1(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINRxTx_SCI1);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_LINRxTx_SCI1_CallInstance);
+  Mock.OSEKOS_ISR_LINRxTx_SCI1_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_LINRxTx_SCI1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_LINRxTx_SCI1_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_LINRxTx_SCI1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_LINRxTx_SCI1_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_LINRxTx_SCI1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_CanRxInterrupt_1(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_CanRxInterrupt_1);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_CanRxInterrupt_1_CallInstance);
+  Mock.OSEKOS_ISR_CanRxInterrupt_1_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_CanRxInterrupt_1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_CanRxInterrupt_1_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_CanRxInterrupt_1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_CanRxInterrupt_1_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_CanRxInterrupt_1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_LINError_SCI1(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_LINError_SCI1);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_LINError_SCI1_CallInstance);
+  Mock.OSEKOS_ISR_LINError_SCI1_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_LINError_SCI1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_LINError_SCI1_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_LINError_SCI1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_LINError_SCI1_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_LINError_SCI1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOS_ISR_SysCounter(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOS_ISR_SysCounter);
+  cmock_call_instance = (CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOS_ISR_SysCounter_CallInstance);
+  Mock.OSEKOS_ISR_SysCounter_CallInstance = CMock_Guts_MemNext(Mock.OSEKOS_ISR_SysCounter_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOS_ISR_SysCounter_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE));
+  CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOS_ISR_SysCounter_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOS_ISR_SysCounter_CallInstance = CMock_Guts_MemChain(Mock.OSEKOS_ISR_SysCounter_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+unsigned long OSEKOSrtcGetSeconds(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSrtcGetSeconds);
+  cmock_call_instance = (CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSrtcGetSeconds_CallInstance);
+  Mock.OSEKOSrtcGetSeconds_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSrtcGetSeconds_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void OSEKOSrtcGetSeconds_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned long cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE));
+  CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSrtcGetSeconds_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSrtcGetSeconds_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void OSEKOSrtcGetSeconds_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSrtcGetSeconds_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSrtcGetSeconds_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSrtcGetSeconds_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSrtcGetSeconds_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSrtcIncrement(unsigned long nsec)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSrtcIncrement);
+  cmock_call_instance = (CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSrtcIncrement_CallInstance);
+  Mock.OSEKOSrtcIncrement_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSrtcIncrement_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSrtcIncrement,CMockString_nsec);
+    UNITY_TEST_ASSERT_EQUAL_HEX32(cmock_call_instance->Expected_nsec, nsec, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSrtcIncrement(CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE* cmock_call_instance, unsigned long nsec);
+void CMockExpectParameters_OSEKOSrtcIncrement(CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE* cmock_call_instance, unsigned long nsec)
+{
+  cmock_call_instance->Expected_nsec = nsec;
+}
+
+void OSEKOSrtcIncrement_CMockExpect(UNITY_LINE_TYPE cmock_line, unsigned long nsec)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE));
+  CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSrtcIncrement_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSrtcIncrement_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSrtcIncrement(cmock_call_instance, nsec);
+}
+
+void OSEKOSrtcIncrement_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSrtcIncrement_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSrtcIncrement_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSrtcIncrement_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSrtcIncrement_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSrtcIncrement(cmock_call_instance, cmock_rows[cmock_row].nsec);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType OSEKOSError(StatusType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSError_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSError);
+  cmock_call_instance = (CMOCK_OSEKOSError_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSError_CallInstance);
+  Mock.OSEKOSError_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSError_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSError,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(StatusType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSError(CMOCK_OSEKOSError_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1);
+void CMockExpectParameters_OSEKOSError(CMOCK_OSEKOSError_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(StatusType[sizeof(cmock_arg1) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSError_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSError_CALL_INSTANCE));
+  CMOCK_OSEKOSError_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSError_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSError_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSError_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSError(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSError_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSError_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSError_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSError_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSError_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSError_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSError_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSError(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ErrorHook(StatusType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ErrorHook_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ErrorHook);
+  cmock_call_instance = (CMOCK_ErrorHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ErrorHook_CallInstance);
+  Mock.ErrorHook_CallInstance = CMock_Guts_MemNext(Mock.ErrorHook_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ErrorHook,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(StatusType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ErrorHook(CMOCK_ErrorHook_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1);
+void CMockExpectParameters_ErrorHook(CMOCK_ErrorHook_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(StatusType[sizeof(cmock_arg1) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ErrorHook_CMockExpect(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ErrorHook_CALL_INSTANCE));
+  CMOCK_ErrorHook_CALL_INSTANCE* cmock_call_instance = (CMOCK_ErrorHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ErrorHook_CallInstance = CMock_Guts_MemChain(Mock.ErrorHook_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ErrorHook(cmock_call_instance, cmock_arg1);
+}
+
+void ErrorHook_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ErrorHook_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ErrorHook_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ErrorHook_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ErrorHook_CallInstance = CMock_Guts_MemChain(Mock.ErrorHook_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ErrorHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ErrorHook(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void StartupHook(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_StartupHook_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_StartupHook);
+  cmock_call_instance = (CMOCK_StartupHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.StartupHook_CallInstance);
+  Mock.StartupHook_CallInstance = CMock_Guts_MemNext(Mock.StartupHook_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void StartupHook_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_StartupHook_CALL_INSTANCE));
+  CMOCK_StartupHook_CALL_INSTANCE* cmock_call_instance = (CMOCK_StartupHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.StartupHook_CallInstance = CMock_Guts_MemChain(Mock.StartupHook_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void ShutdownHook(StatusType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ShutdownHook_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ShutdownHook);
+  cmock_call_instance = (CMOCK_ShutdownHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ShutdownHook_CallInstance);
+  Mock.ShutdownHook_CallInstance = CMock_Guts_MemNext(Mock.ShutdownHook_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ShutdownHook,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(StatusType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ShutdownHook(CMOCK_ShutdownHook_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1);
+void CMockExpectParameters_ShutdownHook(CMOCK_ShutdownHook_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(StatusType[sizeof(cmock_arg1) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ShutdownHook_CMockExpect(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ShutdownHook_CALL_INSTANCE));
+  CMOCK_ShutdownHook_CALL_INSTANCE* cmock_call_instance = (CMOCK_ShutdownHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ShutdownHook_CallInstance = CMock_Guts_MemChain(Mock.ShutdownHook_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ShutdownHook(cmock_call_instance, cmock_arg1);
+}
+
+void ShutdownHook_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ShutdownHook_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ShutdownHook_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ShutdownHook_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ShutdownHook_CallInstance = CMock_Guts_MemChain(Mock.ShutdownHook_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ShutdownHook_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ShutdownHook(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int getUsedTaskStack(TaskType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_getUsedTaskStack_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_getUsedTaskStack);
+  cmock_call_instance = (CMOCK_getUsedTaskStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.getUsedTaskStack_CallInstance);
+  Mock.getUsedTaskStack_CallInstance = CMock_Guts_MemNext(Mock.getUsedTaskStack_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_getUsedTaskStack,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_getUsedTaskStack(CMOCK_getUsedTaskStack_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1);
+void CMockExpectParameters_getUsedTaskStack(CMOCK_getUsedTaskStack_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(TaskType[sizeof(cmock_arg1) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void getUsedTaskStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_getUsedTaskStack_CALL_INSTANCE));
+  CMOCK_getUsedTaskStack_CALL_INSTANCE* cmock_call_instance = (CMOCK_getUsedTaskStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.getUsedTaskStack_CallInstance = CMock_Guts_MemChain(Mock.getUsedTaskStack_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_getUsedTaskStack(cmock_call_instance, cmock_arg1);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void getUsedTaskStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUsedTaskStack_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_getUsedTaskStack_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_getUsedTaskStack_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.getUsedTaskStack_CallInstance = CMock_Guts_MemChain(Mock.getUsedTaskStack_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_getUsedTaskStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_getUsedTaskStack(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int getUnusedTaskStack(TaskType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_getUnusedTaskStack_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_getUnusedTaskStack);
+  cmock_call_instance = (CMOCK_getUnusedTaskStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.getUnusedTaskStack_CallInstance);
+  Mock.getUnusedTaskStack_CallInstance = CMock_Guts_MemNext(Mock.getUnusedTaskStack_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_getUnusedTaskStack,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_getUnusedTaskStack(CMOCK_getUnusedTaskStack_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1);
+void CMockExpectParameters_getUnusedTaskStack(CMOCK_getUnusedTaskStack_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(TaskType[sizeof(cmock_arg1) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void getUnusedTaskStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_getUnusedTaskStack_CALL_INSTANCE));
+  CMOCK_getUnusedTaskStack_CALL_INSTANCE* cmock_call_instance = (CMOCK_getUnusedTaskStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.getUnusedTaskStack_CallInstance = CMock_Guts_MemChain(Mock.getUnusedTaskStack_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_getUnusedTaskStack(cmock_call_instance, cmock_arg1);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void getUnusedTaskStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUnusedTaskStack_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_getUnusedTaskStack_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_getUnusedTaskStack_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.getUnusedTaskStack_CallInstance = CMock_Guts_MemChain(Mock.getUnusedTaskStack_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_getUnusedTaskStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_getUnusedTaskStack(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int getUsedIsrStack(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_getUsedIsrStack_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_getUsedIsrStack);
+  cmock_call_instance = (CMOCK_getUsedIsrStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.getUsedIsrStack_CallInstance);
+  Mock.getUsedIsrStack_CallInstance = CMock_Guts_MemNext(Mock.getUsedIsrStack_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void getUsedIsrStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_getUsedIsrStack_CALL_INSTANCE));
+  CMOCK_getUsedIsrStack_CALL_INSTANCE* cmock_call_instance = (CMOCK_getUsedIsrStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.getUsedIsrStack_CallInstance = CMock_Guts_MemChain(Mock.getUsedIsrStack_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void getUsedIsrStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUsedIsrStack_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_getUsedIsrStack_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_getUsedIsrStack_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.getUsedIsrStack_CallInstance = CMock_Guts_MemChain(Mock.getUsedIsrStack_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_getUsedIsrStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int getUnusedIsrStack(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_getUnusedIsrStack_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_getUnusedIsrStack);
+  cmock_call_instance = (CMOCK_getUnusedIsrStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.getUnusedIsrStack_CallInstance);
+  Mock.getUnusedIsrStack_CallInstance = CMock_Guts_MemNext(Mock.getUnusedIsrStack_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void getUnusedIsrStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_getUnusedIsrStack_CALL_INSTANCE));
+  CMOCK_getUnusedIsrStack_CALL_INSTANCE* cmock_call_instance = (CMOCK_getUnusedIsrStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.getUnusedIsrStack_CallInstance = CMock_Guts_MemChain(Mock.getUnusedIsrStack_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void getUnusedIsrStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUnusedIsrStack_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_getUnusedIsrStack_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_getUnusedIsrStack_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.getUnusedIsrStack_CallInstance = CMock_Guts_MemChain(Mock.getUnusedIsrStack_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_getUnusedIsrStack_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOStaskStackCheckInit(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOStaskStackCheckInit);
+  cmock_call_instance = (CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOStaskStackCheckInit_CallInstance);
+  Mock.OSEKOStaskStackCheckInit_CallInstance = CMock_Guts_MemNext(Mock.OSEKOStaskStackCheckInit_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOStaskStackCheckInit_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE));
+  CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOStaskStackCheckInit_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOStaskStackCheckInit_CallInstance = CMock_Guts_MemChain(Mock.OSEKOStaskStackCheckInit_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+signed char OSEKOStaskStackCheck(OSEK_U8* cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOStaskStackCheck);
+  cmock_call_instance = (CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOStaskStackCheck_CallInstance);
+  Mock.OSEKOStaskStackCheck_CallInstance = CMock_Guts_MemNext(Mock.OSEKOStaskStackCheck_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOStaskStackCheck,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(OSEK_U8), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOStaskStackCheck(CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1);
+void CMockExpectParameters_OSEKOStaskStackCheck(CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+}
+
+void OSEKOStaskStackCheck_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1, signed char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE));
+  CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOStaskStackCheck_CallInstance = CMock_Guts_MemChain(Mock.OSEKOStaskStackCheck_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOStaskStackCheck(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(signed char[sizeof(cmock_to_return) == sizeof(signed char) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOStaskStackCheck_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOStaskStackCheck_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOStaskStackCheck_CallInstance = CMock_Guts_MemChain(Mock.OSEKOStaskStackCheck_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOStaskStackCheck_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOStaskStackCheck(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(signed char[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(signed char) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+signed char OSEKOSisrStackCheck(OSEK_U8* cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSisrStackCheck);
+  cmock_call_instance = (CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSisrStackCheck_CallInstance);
+  Mock.OSEKOSisrStackCheck_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSisrStackCheck_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSisrStackCheck,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(OSEK_U8), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSisrStackCheck(CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1);
+void CMockExpectParameters_OSEKOSisrStackCheck(CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+}
+
+void OSEKOSisrStackCheck_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1, signed char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE));
+  CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSisrStackCheck_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSisrStackCheck_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSisrStackCheck(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(signed char[sizeof(cmock_to_return) == sizeof(signed char) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSisrStackCheck_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSisrStackCheck_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSisrStackCheck_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSisrStackCheck_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSisrStackCheck_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSisrStackCheck(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(signed char[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(signed char) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOStaskStackCheckFatal(OSEK_U8* cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOStaskStackCheckFatal);
+  cmock_call_instance = (CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOStaskStackCheckFatal_CallInstance);
+  Mock.OSEKOStaskStackCheckFatal_CallInstance = CMock_Guts_MemNext(Mock.OSEKOStaskStackCheckFatal_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOStaskStackCheckFatal,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(OSEK_U8), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOStaskStackCheckFatal(CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1);
+void CMockExpectParameters_OSEKOStaskStackCheckFatal(CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+}
+
+void OSEKOStaskStackCheckFatal_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE));
+  CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOStaskStackCheckFatal_CallInstance = CMock_Guts_MemChain(Mock.OSEKOStaskStackCheckFatal_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOStaskStackCheckFatal(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOStaskStackCheckFatal_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOStaskStackCheckFatal_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOStaskStackCheckFatal_CallInstance = CMock_Guts_MemChain(Mock.OSEKOStaskStackCheckFatal_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOStaskStackCheckFatal_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOStaskStackCheckFatal(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSisrStackCheckFatal(OSEK_U8* cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSisrStackCheckFatal);
+  cmock_call_instance = (CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSisrStackCheckFatal_CallInstance);
+  Mock.OSEKOSisrStackCheckFatal_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSisrStackCheckFatal_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSisrStackCheckFatal,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(OSEK_U8), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSisrStackCheckFatal(CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1);
+void CMockExpectParameters_OSEKOSisrStackCheckFatal(CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE* cmock_call_instance, OSEK_U8* cmock_arg1)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+}
+
+void OSEKOSisrStackCheckFatal_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE));
+  CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSisrStackCheckFatal_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSisrStackCheckFatal_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSisrStackCheckFatal(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSisrStackCheckFatal_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSisrStackCheckFatal_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSisrStackCheckFatal_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSisrStackCheckFatal_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSisrStackCheckFatal_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSisrStackCheckFatal(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+OSEK_U8* OSEKOSgetStackPointer(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSgetStackPointer);
+  cmock_call_instance = (CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSgetStackPointer_CallInstance);
+  Mock.OSEKOSgetStackPointer_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSgetStackPointer_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void OSEKOSgetStackPointer_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE));
+  CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSgetStackPointer_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSgetStackPointer_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void OSEKOSgetStackPointer_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSgetStackPointer_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSgetStackPointer_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSgetStackPointer_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSgetStackPointer_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSTaskSwitch(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSTaskSwitch);
+  cmock_call_instance = (CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSTaskSwitch_CallInstance);
+  Mock.OSEKOSTaskSwitch_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSTaskSwitch_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSTaskSwitch_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE));
+  CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSTaskSwitch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSTaskSwitch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSTaskSwitch_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+StatusType OSEKOSReturn(StatusType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSReturn_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSReturn);
+  cmock_call_instance = (CMOCK_OSEKOSReturn_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSReturn_CallInstance);
+  Mock.OSEKOSReturn_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSReturn_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSReturn,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(StatusType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSReturn(CMOCK_OSEKOSReturn_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1);
+void CMockExpectParameters_OSEKOSReturn(CMOCK_OSEKOSReturn_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(StatusType[sizeof(cmock_arg1) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSReturn_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSReturn_CALL_INSTANCE));
+  CMOCK_OSEKOSReturn_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSReturn_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSReturn_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSReturn_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSReturn(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSReturn_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSReturn_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSReturn_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSReturn_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSReturn_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSReturn_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSReturn_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSReturn(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType OSEKOSActivateTask(TaskType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSActivateTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSActivateTask);
+  cmock_call_instance = (CMOCK_OSEKOSActivateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSActivateTask_CallInstance);
+  Mock.OSEKOSActivateTask_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSActivateTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSActivateTask,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSActivateTask(CMOCK_OSEKOSActivateTask_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1);
+void CMockExpectParameters_OSEKOSActivateTask(CMOCK_OSEKOSActivateTask_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(TaskType[sizeof(cmock_arg1) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSActivateTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSActivateTask_CALL_INSTANCE));
+  CMOCK_OSEKOSActivateTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSActivateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSActivateTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSActivateTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSActivateTask(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSActivateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSActivateTask_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSActivateTask_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSActivateTask_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSActivateTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSActivateTask_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSActivateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSActivateTask(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSTerminateTask(TaskType cmock_arg1, TaskType cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSTerminateTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSTerminateTask);
+  cmock_call_instance = (CMOCK_OSEKOSTerminateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSTerminateTask_CallInstance);
+  Mock.OSEKOSTerminateTask_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSTerminateTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSTerminateTask,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSTerminateTask,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSTerminateTask(CMOCK_OSEKOSTerminateTask_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1, TaskType cmock_arg2);
+void CMockExpectParameters_OSEKOSTerminateTask(CMOCK_OSEKOSTerminateTask_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1, TaskType cmock_arg2)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(TaskType[sizeof(cmock_arg1) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(TaskType[sizeof(cmock_arg2) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSTerminateTask_CMockExpect(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, TaskType cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSTerminateTask_CALL_INSTANCE));
+  CMOCK_OSEKOSTerminateTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSTerminateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSTerminateTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSTerminateTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSTerminateTask(cmock_call_instance, cmock_arg1, cmock_arg2);
+}
+
+void OSEKOSTerminateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSTerminateTask_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSTerminateTask_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSTerminateTask_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSTerminateTask_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSTerminateTask_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSTerminateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSTerminateTask(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int OSEKOSSetEvent(TaskType cmock_arg1, EventMaskType cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSSetEvent_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSSetEvent);
+  cmock_call_instance = (CMOCK_OSEKOSSetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSSetEvent_CallInstance);
+  Mock.OSEKOSSetEvent_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSSetEvent_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetEvent,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetEvent,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(EventMaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSSetEvent(CMOCK_OSEKOSSetEvent_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1, EventMaskType cmock_arg2);
+void CMockExpectParameters_OSEKOSSetEvent(CMOCK_OSEKOSSetEvent_CALL_INSTANCE* cmock_call_instance, TaskType cmock_arg1, EventMaskType cmock_arg2)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(TaskType[sizeof(cmock_arg1) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(EventMaskType[sizeof(cmock_arg2) == sizeof(EventMaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSSetEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, EventMaskType cmock_arg2, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSSetEvent_CALL_INSTANCE));
+  CMOCK_OSEKOSSetEvent_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSSetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSSetEvent_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSetEvent_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSSetEvent(cmock_call_instance, cmock_arg1, cmock_arg2);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void OSEKOSSetEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSSetEvent_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSSetEvent_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSSetEvent_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSSetEvent_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSetEvent_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSSetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSSetEvent(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int OSEKOSWaitEvent(EventMaskType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSWaitEvent_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSWaitEvent);
+  cmock_call_instance = (CMOCK_OSEKOSWaitEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSWaitEvent_CallInstance);
+  Mock.OSEKOSWaitEvent_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSWaitEvent_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSWaitEvent,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(EventMaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSWaitEvent(CMOCK_OSEKOSWaitEvent_CALL_INSTANCE* cmock_call_instance, EventMaskType cmock_arg1);
+void CMockExpectParameters_OSEKOSWaitEvent(CMOCK_OSEKOSWaitEvent_CALL_INSTANCE* cmock_call_instance, EventMaskType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(EventMaskType[sizeof(cmock_arg1) == sizeof(EventMaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSWaitEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EventMaskType cmock_arg1, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSWaitEvent_CALL_INSTANCE));
+  CMOCK_OSEKOSWaitEvent_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSWaitEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSWaitEvent_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSWaitEvent_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSWaitEvent(cmock_call_instance, cmock_arg1);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void OSEKOSWaitEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSWaitEvent_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSWaitEvent_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSWaitEvent_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSWaitEvent_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSWaitEvent_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSWaitEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSWaitEvent(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+TickType OSEKOSGetAlarm(AlarmType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSGetAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSGetAlarm);
+  cmock_call_instance = (CMOCK_OSEKOSGetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSGetAlarm_CallInstance);
+  Mock.OSEKOSGetAlarm_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSGetAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSGetAlarm,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSGetAlarm(CMOCK_OSEKOSGetAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType cmock_arg1);
+void CMockExpectParameters_OSEKOSGetAlarm(CMOCK_OSEKOSGetAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(AlarmType[sizeof(cmock_arg1) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSGetAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType cmock_arg1, TickType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSGetAlarm_CALL_INSTANCE));
+  CMOCK_OSEKOSGetAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSGetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSGetAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSGetAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSGetAlarm(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(TickType[sizeof(cmock_to_return) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSGetAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSGetAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSGetAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSGetAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSGetAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSGetAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSGetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSGetAlarm(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(TickType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSSetAlarm(AlarmType cmock_arg1, TickType cmock_arg2, TickType cmock_arg3)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSSetAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSSetAlarm);
+  cmock_call_instance = (CMOCK_OSEKOSSetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSSetAlarm_CallInstance);
+  Mock.OSEKOSSetAlarm_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSSetAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetAlarm,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetAlarm,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetAlarm,CMockString_cmock_arg3);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg3), (void*)(&cmock_arg3), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSSetAlarm(CMOCK_OSEKOSSetAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType cmock_arg1, TickType cmock_arg2, TickType cmock_arg3);
+void CMockExpectParameters_OSEKOSSetAlarm(CMOCK_OSEKOSSetAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType cmock_arg1, TickType cmock_arg2, TickType cmock_arg3)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(AlarmType[sizeof(cmock_arg1) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(TickType[sizeof(cmock_arg2) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg3), (void*)(&cmock_arg3),
+         sizeof(TickType[sizeof(cmock_arg3) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSSetAlarm_CMockExpect(UNITY_LINE_TYPE cmock_line, AlarmType cmock_arg1, TickType cmock_arg2, TickType cmock_arg3)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSSetAlarm_CALL_INSTANCE));
+  CMOCK_OSEKOSSetAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSSetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSSetAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSetAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSSetAlarm(cmock_call_instance, cmock_arg1, cmock_arg2, cmock_arg3);
+}
+
+void OSEKOSSetAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSSetAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSSetAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSSetAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSSetAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSetAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSSetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSSetAlarm(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2, cmock_rows[cmock_row].cmock_arg3);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType OSEKOSSetAbsAlarm(AlarmType a, TickType b, TickType c)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSSetAbsAlarm);
+  cmock_call_instance = (CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSSetAbsAlarm_CallInstance);
+  Mock.OSEKOSSetAbsAlarm_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSSetAbsAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetAbsAlarm,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_a), (void*)(&a), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetAbsAlarm,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_b), (void*)(&b), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSSetAbsAlarm,CMockString_c);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_c), (void*)(&c), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSSetAbsAlarm(CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType a, TickType b, TickType c);
+void CMockExpectParameters_OSEKOSSetAbsAlarm(CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType a, TickType b, TickType c)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(AlarmType[sizeof(a) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_b), (void*)(&b),
+         sizeof(TickType[sizeof(b) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_c), (void*)(&c),
+         sizeof(TickType[sizeof(c) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSSetAbsAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType a, TickType b, TickType c, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE));
+  CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSSetAbsAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSetAbsAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSSetAbsAlarm(cmock_call_instance, a, b, c);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSSetAbsAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSSetAbsAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSSetAbsAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSetAbsAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSSetAbsAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSSetAbsAlarm(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b, cmock_rows[cmock_row].c);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType OSEKOSCancelAlarm(AlarmType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSCancelAlarm);
+  cmock_call_instance = (CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSCancelAlarm_CallInstance);
+  Mock.OSEKOSCancelAlarm_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSCancelAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSCancelAlarm,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_OSEKOSCancelAlarm(CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType cmock_arg1);
+void CMockExpectParameters_OSEKOSCancelAlarm(CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(AlarmType[sizeof(cmock_arg1) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSCancelAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType cmock_arg1, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE));
+  CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSCancelAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSCancelAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSCancelAlarm(cmock_call_instance, cmock_arg1);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSCancelAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSCancelAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSCancelAlarm_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSCancelAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSCancelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSCancelAlarm(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSAdvCntr(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSAdvCntr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSAdvCntr);
+  cmock_call_instance = (CMOCK_OSEKOSAdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSAdvCntr_CallInstance);
+  Mock.OSEKOSAdvCntr_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSAdvCntr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSAdvCntr_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSAdvCntr_CALL_INSTANCE));
+  CMOCK_OSEKOSAdvCntr_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSAdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSAdvCntr_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSAdvCntr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+AppModeType GetActiveApplicationMode(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetActiveApplicationMode_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetActiveApplicationMode);
+  cmock_call_instance = (CMOCK_GetActiveApplicationMode_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetActiveApplicationMode_CallInstance);
+  Mock.GetActiveApplicationMode_CallInstance = CMock_Guts_MemNext(Mock.GetActiveApplicationMode_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void GetActiveApplicationMode_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AppModeType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetActiveApplicationMode_CALL_INSTANCE));
+  CMOCK_GetActiveApplicationMode_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetActiveApplicationMode_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetActiveApplicationMode_CallInstance = CMock_Guts_MemChain(Mock.GetActiveApplicationMode_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(AppModeType[sizeof(cmock_to_return) == sizeof(AppModeType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetActiveApplicationMode_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetActiveApplicationMode_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetActiveApplicationMode_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetActiveApplicationMode_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetActiveApplicationMode_CallInstance = CMock_Guts_MemChain(Mock.GetActiveApplicationMode_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetActiveApplicationMode_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(AppModeType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(AppModeType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void StartOS(AppModeType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_StartOS_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_StartOS);
+  cmock_call_instance = (CMOCK_StartOS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.StartOS_CallInstance);
+  Mock.StartOS_CallInstance = CMock_Guts_MemNext(Mock.StartOS_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_StartOS,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(AppModeType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_StartOS(CMOCK_StartOS_CALL_INSTANCE* cmock_call_instance, AppModeType cmock_arg1);
+void CMockExpectParameters_StartOS(CMOCK_StartOS_CALL_INSTANCE* cmock_call_instance, AppModeType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(AppModeType[sizeof(cmock_arg1) == sizeof(AppModeType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void StartOS_CMockExpect(UNITY_LINE_TYPE cmock_line, AppModeType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_StartOS_CALL_INSTANCE));
+  CMOCK_StartOS_CALL_INSTANCE* cmock_call_instance = (CMOCK_StartOS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.StartOS_CallInstance = CMock_Guts_MemChain(Mock.StartOS_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_StartOS(cmock_call_instance, cmock_arg1);
+}
+
+void StartOS_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const StartOS_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_StartOS_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_StartOS_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.StartOS_CallInstance = CMock_Guts_MemChain(Mock.StartOS_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_StartOS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_StartOS(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSShutdownOS(StatusType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSShutdownOS_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSShutdownOS);
+  cmock_call_instance = (CMOCK_OSEKOSShutdownOS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSShutdownOS_CallInstance);
+  Mock.OSEKOSShutdownOS_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSShutdownOS_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSShutdownOS,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(StatusType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSShutdownOS(CMOCK_OSEKOSShutdownOS_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1);
+void CMockExpectParameters_OSEKOSShutdownOS(CMOCK_OSEKOSShutdownOS_CALL_INSTANCE* cmock_call_instance, StatusType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(StatusType[sizeof(cmock_arg1) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSShutdownOS_CMockExpect(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSShutdownOS_CALL_INSTANCE));
+  CMOCK_OSEKOSShutdownOS_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSShutdownOS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSShutdownOS_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSShutdownOS_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSShutdownOS(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSShutdownOS_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSShutdownOS_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSShutdownOS_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSShutdownOS_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSShutdownOS_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSShutdownOS_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSShutdownOS_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSShutdownOS(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType ActivateTask(TaskType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ActivateTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ActivateTask);
+  cmock_call_instance = (CMOCK_ActivateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ActivateTask_CallInstance);
+  Mock.ActivateTask_CallInstance = CMock_Guts_MemNext(Mock.ActivateTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ActivateTask,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ActivateTask(CMOCK_ActivateTask_CALL_INSTANCE* cmock_call_instance, TaskType A);
+void CMockExpectParameters_ActivateTask(CMOCK_ActivateTask_CALL_INSTANCE* cmock_call_instance, TaskType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(TaskType[sizeof(A) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ActivateTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ActivateTask_CALL_INSTANCE));
+  CMOCK_ActivateTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_ActivateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ActivateTask_CallInstance = CMock_Guts_MemChain(Mock.ActivateTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ActivateTask(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ActivateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ActivateTask_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ActivateTask_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ActivateTask_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ActivateTask_CallInstance = CMock_Guts_MemChain(Mock.ActivateTask_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ActivateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ActivateTask(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType TerminateTask(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_TerminateTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_TerminateTask);
+  cmock_call_instance = (CMOCK_TerminateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.TerminateTask_CallInstance);
+  Mock.TerminateTask_CallInstance = CMock_Guts_MemNext(Mock.TerminateTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void TerminateTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_TerminateTask_CALL_INSTANCE));
+  CMOCK_TerminateTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_TerminateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.TerminateTask_CallInstance = CMock_Guts_MemChain(Mock.TerminateTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void TerminateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const TerminateTask_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_TerminateTask_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_TerminateTask_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.TerminateTask_CallInstance = CMock_Guts_MemChain(Mock.TerminateTask_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_TerminateTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType ChainTask(TaskType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ChainTask_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ChainTask);
+  cmock_call_instance = (CMOCK_ChainTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ChainTask_CallInstance);
+  Mock.ChainTask_CallInstance = CMock_Guts_MemNext(Mock.ChainTask_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ChainTask,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ChainTask(CMOCK_ChainTask_CALL_INSTANCE* cmock_call_instance, TaskType A);
+void CMockExpectParameters_ChainTask(CMOCK_ChainTask_CALL_INSTANCE* cmock_call_instance, TaskType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(TaskType[sizeof(A) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ChainTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ChainTask_CALL_INSTANCE));
+  CMOCK_ChainTask_CALL_INSTANCE* cmock_call_instance = (CMOCK_ChainTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ChainTask_CallInstance = CMock_Guts_MemChain(Mock.ChainTask_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ChainTask(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ChainTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ChainTask_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ChainTask_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ChainTask_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ChainTask_CallInstance = CMock_Guts_MemChain(Mock.ChainTask_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ChainTask_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ChainTask(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType GetTaskState(TaskType A, TaskStateRefType B)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetTaskState_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetTaskState);
+  cmock_call_instance = (CMOCK_GetTaskState_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetTaskState_CallInstance);
+  Mock.GetTaskState_CallInstance = CMock_Guts_MemNext(Mock.GetTaskState_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_GetTaskState,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_GetTaskState,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(TaskStateRefType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_GetTaskState(CMOCK_GetTaskState_CALL_INSTANCE* cmock_call_instance, TaskType A, TaskStateRefType B);
+void CMockExpectParameters_GetTaskState(CMOCK_GetTaskState_CALL_INSTANCE* cmock_call_instance, TaskType A, TaskStateRefType B)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(TaskType[sizeof(A) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(TaskStateRefType[sizeof(B) == sizeof(TaskStateRefType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetTaskState_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, TaskStateRefType B, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetTaskState_CALL_INSTANCE));
+  CMOCK_GetTaskState_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetTaskState_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetTaskState_CallInstance = CMock_Guts_MemChain(Mock.GetTaskState_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_GetTaskState(cmock_call_instance, A, B);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetTaskState_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetTaskState_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetTaskState_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetTaskState_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetTaskState_CallInstance = CMock_Guts_MemChain(Mock.GetTaskState_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetTaskState_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_GetTaskState(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType GetTaskID(TaskRefType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetTaskID_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetTaskID);
+  cmock_call_instance = (CMOCK_GetTaskID_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetTaskID_CallInstance);
+  Mock.GetTaskID_CallInstance = CMock_Guts_MemNext(Mock.GetTaskID_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_GetTaskID,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(TaskRefType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_GetTaskID(CMOCK_GetTaskID_CALL_INSTANCE* cmock_call_instance, TaskRefType A);
+void CMockExpectParameters_GetTaskID(CMOCK_GetTaskID_CALL_INSTANCE* cmock_call_instance, TaskRefType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(TaskRefType[sizeof(A) == sizeof(TaskRefType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetTaskID_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskRefType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetTaskID_CALL_INSTANCE));
+  CMOCK_GetTaskID_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetTaskID_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetTaskID_CallInstance = CMock_Guts_MemChain(Mock.GetTaskID_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_GetTaskID(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetTaskID_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetTaskID_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetTaskID_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetTaskID_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetTaskID_CallInstance = CMock_Guts_MemChain(Mock.GetTaskID_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetTaskID_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_GetTaskID(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType Schedule(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_Schedule_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_Schedule);
+  cmock_call_instance = (CMOCK_Schedule_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.Schedule_CallInstance);
+  Mock.Schedule_CallInstance = CMock_Guts_MemNext(Mock.Schedule_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void Schedule_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_Schedule_CALL_INSTANCE));
+  CMOCK_Schedule_CALL_INSTANCE* cmock_call_instance = (CMOCK_Schedule_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.Schedule_CallInstance = CMock_Guts_MemChain(Mock.Schedule_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void Schedule_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const Schedule_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_Schedule_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_Schedule_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.Schedule_CallInstance = CMock_Guts_MemChain(Mock.Schedule_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_Schedule_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType GetResource(ResourceType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetResource_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetResource);
+  cmock_call_instance = (CMOCK_GetResource_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetResource_CallInstance);
+  Mock.GetResource_CallInstance = CMock_Guts_MemNext(Mock.GetResource_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_GetResource,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(ResourceType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_GetResource(CMOCK_GetResource_CALL_INSTANCE* cmock_call_instance, ResourceType A);
+void CMockExpectParameters_GetResource(CMOCK_GetResource_CALL_INSTANCE* cmock_call_instance, ResourceType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(ResourceType[sizeof(A) == sizeof(ResourceType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetResource_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, ResourceType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetResource_CALL_INSTANCE));
+  CMOCK_GetResource_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetResource_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetResource_CallInstance = CMock_Guts_MemChain(Mock.GetResource_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_GetResource(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetResource_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetResource_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetResource_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetResource_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetResource_CallInstance = CMock_Guts_MemChain(Mock.GetResource_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetResource_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_GetResource(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType ReleaseResource(ResourceType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ReleaseResource_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ReleaseResource);
+  cmock_call_instance = (CMOCK_ReleaseResource_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ReleaseResource_CallInstance);
+  Mock.ReleaseResource_CallInstance = CMock_Guts_MemNext(Mock.ReleaseResource_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ReleaseResource,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(ResourceType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ReleaseResource(CMOCK_ReleaseResource_CALL_INSTANCE* cmock_call_instance, ResourceType A);
+void CMockExpectParameters_ReleaseResource(CMOCK_ReleaseResource_CALL_INSTANCE* cmock_call_instance, ResourceType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(ResourceType[sizeof(A) == sizeof(ResourceType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ReleaseResource_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, ResourceType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ReleaseResource_CALL_INSTANCE));
+  CMOCK_ReleaseResource_CALL_INSTANCE* cmock_call_instance = (CMOCK_ReleaseResource_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ReleaseResource_CallInstance = CMock_Guts_MemChain(Mock.ReleaseResource_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ReleaseResource(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ReleaseResource_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ReleaseResource_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ReleaseResource_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ReleaseResource_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ReleaseResource_CallInstance = CMock_Guts_MemChain(Mock.ReleaseResource_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ReleaseResource_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ReleaseResource(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType SetEvent(TaskType A, EventMaskType B)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_SetEvent_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_SetEvent);
+  cmock_call_instance = (CMOCK_SetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.SetEvent_CallInstance);
+  Mock.SetEvent_CallInstance = CMock_Guts_MemNext(Mock.SetEvent_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_SetEvent,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_SetEvent,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(EventMaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_SetEvent(CMOCK_SetEvent_CALL_INSTANCE* cmock_call_instance, TaskType A, EventMaskType B);
+void CMockExpectParameters_SetEvent(CMOCK_SetEvent_CALL_INSTANCE* cmock_call_instance, TaskType A, EventMaskType B)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(TaskType[sizeof(A) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(EventMaskType[sizeof(B) == sizeof(EventMaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void SetEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, EventMaskType B, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_SetEvent_CALL_INSTANCE));
+  CMOCK_SetEvent_CALL_INSTANCE* cmock_call_instance = (CMOCK_SetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.SetEvent_CallInstance = CMock_Guts_MemChain(Mock.SetEvent_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_SetEvent(cmock_call_instance, A, B);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void SetEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const SetEvent_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_SetEvent_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_SetEvent_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.SetEvent_CallInstance = CMock_Guts_MemChain(Mock.SetEvent_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_SetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_SetEvent(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType ClearEvent(EventMaskType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ClearEvent_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ClearEvent);
+  cmock_call_instance = (CMOCK_ClearEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ClearEvent_CallInstance);
+  Mock.ClearEvent_CallInstance = CMock_Guts_MemNext(Mock.ClearEvent_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ClearEvent,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(EventMaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ClearEvent(CMOCK_ClearEvent_CALL_INSTANCE* cmock_call_instance, EventMaskType A);
+void CMockExpectParameters_ClearEvent(CMOCK_ClearEvent_CALL_INSTANCE* cmock_call_instance, EventMaskType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(EventMaskType[sizeof(A) == sizeof(EventMaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ClearEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EventMaskType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ClearEvent_CALL_INSTANCE));
+  CMOCK_ClearEvent_CALL_INSTANCE* cmock_call_instance = (CMOCK_ClearEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ClearEvent_CallInstance = CMock_Guts_MemChain(Mock.ClearEvent_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ClearEvent(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void ClearEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ClearEvent_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ClearEvent_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ClearEvent_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ClearEvent_CallInstance = CMock_Guts_MemChain(Mock.ClearEvent_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ClearEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ClearEvent(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType WaitEvent(EventMaskType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_WaitEvent_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_WaitEvent);
+  cmock_call_instance = (CMOCK_WaitEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.WaitEvent_CallInstance);
+  Mock.WaitEvent_CallInstance = CMock_Guts_MemNext(Mock.WaitEvent_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_WaitEvent,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(EventMaskType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_WaitEvent(CMOCK_WaitEvent_CALL_INSTANCE* cmock_call_instance, EventMaskType A);
+void CMockExpectParameters_WaitEvent(CMOCK_WaitEvent_CALL_INSTANCE* cmock_call_instance, EventMaskType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(EventMaskType[sizeof(A) == sizeof(EventMaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void WaitEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EventMaskType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_WaitEvent_CALL_INSTANCE));
+  CMOCK_WaitEvent_CALL_INSTANCE* cmock_call_instance = (CMOCK_WaitEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.WaitEvent_CallInstance = CMock_Guts_MemChain(Mock.WaitEvent_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_WaitEvent(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void WaitEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const WaitEvent_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_WaitEvent_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_WaitEvent_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.WaitEvent_CallInstance = CMock_Guts_MemChain(Mock.WaitEvent_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_WaitEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_WaitEvent(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType GetEvent(TaskType A, EventMaskRefType B)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetEvent_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetEvent);
+  cmock_call_instance = (CMOCK_GetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetEvent_CallInstance);
+  Mock.GetEvent_CallInstance = CMock_Guts_MemNext(Mock.GetEvent_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_GetEvent,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(TaskType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_GetEvent,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(EventMaskRefType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_GetEvent(CMOCK_GetEvent_CALL_INSTANCE* cmock_call_instance, TaskType A, EventMaskRefType B);
+void CMockExpectParameters_GetEvent(CMOCK_GetEvent_CALL_INSTANCE* cmock_call_instance, TaskType A, EventMaskRefType B)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(TaskType[sizeof(A) == sizeof(TaskType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(EventMaskRefType[sizeof(B) == sizeof(EventMaskRefType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, EventMaskRefType B, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetEvent_CALL_INSTANCE));
+  CMOCK_GetEvent_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetEvent_CallInstance = CMock_Guts_MemChain(Mock.GetEvent_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_GetEvent(cmock_call_instance, A, B);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetEvent_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetEvent_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetEvent_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetEvent_CallInstance = CMock_Guts_MemChain(Mock.GetEvent_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetEvent_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_GetEvent(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType GetAlarm(AlarmType A, TickRefType B)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetAlarm);
+  cmock_call_instance = (CMOCK_GetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetAlarm_CallInstance);
+  Mock.GetAlarm_CallInstance = CMock_Guts_MemNext(Mock.GetAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_GetAlarm,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_GetAlarm,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(TickRefType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_GetAlarm(CMOCK_GetAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A, TickRefType B);
+void CMockExpectParameters_GetAlarm(CMOCK_GetAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A, TickRefType B)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(AlarmType[sizeof(A) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(TickRefType[sizeof(B) == sizeof(TickRefType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, TickRefType B, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetAlarm_CALL_INSTANCE));
+  CMOCK_GetAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetAlarm_CallInstance = CMock_Guts_MemChain(Mock.GetAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_GetAlarm(cmock_call_instance, A, B);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetAlarm_CallInstance = CMock_Guts_MemChain(Mock.GetAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_GetAlarm(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType GetAlarmBase(AlarmType A, AlarmBaseRefType B)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_GetAlarmBase_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_GetAlarmBase);
+  cmock_call_instance = (CMOCK_GetAlarmBase_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.GetAlarmBase_CallInstance);
+  Mock.GetAlarmBase_CallInstance = CMock_Guts_MemNext(Mock.GetAlarmBase_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_GetAlarmBase,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_GetAlarmBase,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(AlarmBaseRefType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_GetAlarmBase(CMOCK_GetAlarmBase_CALL_INSTANCE* cmock_call_instance, AlarmType A, AlarmBaseRefType B);
+void CMockExpectParameters_GetAlarmBase(CMOCK_GetAlarmBase_CALL_INSTANCE* cmock_call_instance, AlarmType A, AlarmBaseRefType B)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(AlarmType[sizeof(A) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(AlarmBaseRefType[sizeof(B) == sizeof(AlarmBaseRefType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetAlarmBase_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, AlarmBaseRefType B, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_GetAlarmBase_CALL_INSTANCE));
+  CMOCK_GetAlarmBase_CALL_INSTANCE* cmock_call_instance = (CMOCK_GetAlarmBase_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.GetAlarmBase_CallInstance = CMock_Guts_MemChain(Mock.GetAlarmBase_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_GetAlarmBase(cmock_call_instance, A, B);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void GetAlarmBase_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetAlarmBase_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_GetAlarmBase_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_GetAlarmBase_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.GetAlarmBase_CallInstance = CMock_Guts_MemChain(Mock.GetAlarmBase_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_GetAlarmBase_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_GetAlarmBase(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType SetRelAlarm(AlarmType A, TickType B, TickType C)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_SetRelAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_SetRelAlarm);
+  cmock_call_instance = (CMOCK_SetRelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.SetRelAlarm_CallInstance);
+  Mock.SetRelAlarm_CallInstance = CMock_Guts_MemNext(Mock.SetRelAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_SetRelAlarm,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_SetRelAlarm,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_SetRelAlarm,CMockString_C);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_C), (void*)(&C), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_SetRelAlarm(CMOCK_SetRelAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A, TickType B, TickType C);
+void CMockExpectParameters_SetRelAlarm(CMOCK_SetRelAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A, TickType B, TickType C)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(AlarmType[sizeof(A) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(TickType[sizeof(B) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_C), (void*)(&C),
+         sizeof(TickType[sizeof(C) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void SetRelAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, TickType B, TickType C, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_SetRelAlarm_CALL_INSTANCE));
+  CMOCK_SetRelAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_SetRelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.SetRelAlarm_CallInstance = CMock_Guts_MemChain(Mock.SetRelAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_SetRelAlarm(cmock_call_instance, A, B, C);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void SetRelAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const SetRelAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_SetRelAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_SetRelAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.SetRelAlarm_CallInstance = CMock_Guts_MemChain(Mock.SetRelAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_SetRelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_SetRelAlarm(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B, cmock_rows[cmock_row].C);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType SetAbsAlarm(AlarmType A, TickType B, TickType C)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_SetAbsAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_SetAbsAlarm);
+  cmock_call_instance = (CMOCK_SetAbsAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.SetAbsAlarm_CallInstance);
+  Mock.SetAbsAlarm_CallInstance = CMock_Guts_MemNext(Mock.SetAbsAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_SetAbsAlarm,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_SetAbsAlarm,CMockString_B);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_B), (void*)(&B), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_SetAbsAlarm,CMockString_C);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_C), (void*)(&C), sizeof(TickType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_SetAbsAlarm(CMOCK_SetAbsAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A, TickType B, TickType C);
+void CMockExpectParameters_SetAbsAlarm(CMOCK_SetAbsAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A, TickType B, TickType C)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(AlarmType[sizeof(A) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_B), (void*)(&B),
+         sizeof(TickType[sizeof(B) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_C), (void*)(&C),
+         sizeof(TickType[sizeof(C) == sizeof(TickType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void SetAbsAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, TickType B, TickType C, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_SetAbsAlarm_CALL_INSTANCE));
+  CMOCK_SetAbsAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_SetAbsAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.SetAbsAlarm_CallInstance = CMock_Guts_MemChain(Mock.SetAbsAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_SetAbsAlarm(cmock_call_instance, A, B, C);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void SetAbsAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const SetAbsAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_SetAbsAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_SetAbsAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.SetAbsAlarm_CallInstance = CMock_Guts_MemChain(Mock.SetAbsAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_SetAbsAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_SetAbsAlarm(cmock_call_instance, cmock_rows[cmock_row].A, cmock_rows[cmock_row].B, cmock_rows[cmock_row].C);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType CancelAlarm(AlarmType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_CancelAlarm_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_CancelAlarm);
+  cmock_call_instance = (CMOCK_CancelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.CancelAlarm_CallInstance);
+  Mock.CancelAlarm_CallInstance = CMock_Guts_MemNext(Mock.CancelAlarm_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_CancelAlarm,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(AlarmType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_CancelAlarm(CMOCK_CancelAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A);
+void CMockExpectParameters_CancelAlarm(CMOCK_CancelAlarm_CALL_INSTANCE* cmock_call_instance, AlarmType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(AlarmType[sizeof(A) == sizeof(AlarmType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void CancelAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_CancelAlarm_CALL_INSTANCE));
+  CMOCK_CancelAlarm_CALL_INSTANCE* cmock_call_instance = (CMOCK_CancelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.CancelAlarm_CallInstance = CMock_Guts_MemChain(Mock.CancelAlarm_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_CancelAlarm(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void CancelAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const CancelAlarm_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_CancelAlarm_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_CancelAlarm_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.CancelAlarm_CallInstance = CMock_Guts_MemChain(Mock.CancelAlarm_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_CancelAlarm_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_CancelAlarm(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType AdvCntr(CounterType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_AdvCntr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_AdvCntr);
+  cmock_call_instance = (CMOCK_AdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.AdvCntr_CallInstance);
+  Mock.AdvCntr_CallInstance = CMock_Guts_MemNext(Mock.AdvCntr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_AdvCntr,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(CounterType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_AdvCntr(CMOCK_AdvCntr_CALL_INSTANCE* cmock_call_instance, CounterType A);
+void CMockExpectParameters_AdvCntr(CMOCK_AdvCntr_CALL_INSTANCE* cmock_call_instance, CounterType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(CounterType[sizeof(A) == sizeof(CounterType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void AdvCntr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, CounterType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_AdvCntr_CALL_INSTANCE));
+  CMOCK_AdvCntr_CALL_INSTANCE* cmock_call_instance = (CMOCK_AdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.AdvCntr_CallInstance = CMock_Guts_MemChain(Mock.AdvCntr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_AdvCntr(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void AdvCntr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const AdvCntr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_AdvCntr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_AdvCntr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.AdvCntr_CallInstance = CMock_Guts_MemChain(Mock.AdvCntr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_AdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_AdvCntr(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+StatusType IAdvCntr(CounterType A)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_IAdvCntr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_IAdvCntr);
+  cmock_call_instance = (CMOCK_IAdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.IAdvCntr_CallInstance);
+  Mock.IAdvCntr_CallInstance = CMock_Guts_MemNext(Mock.IAdvCntr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_IAdvCntr,CMockString_A);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_A), (void*)(&A), sizeof(CounterType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_IAdvCntr(CMOCK_IAdvCntr_CALL_INSTANCE* cmock_call_instance, CounterType A);
+void CMockExpectParameters_IAdvCntr(CMOCK_IAdvCntr_CALL_INSTANCE* cmock_call_instance, CounterType A)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_A), (void*)(&A),
+         sizeof(CounterType[sizeof(A) == sizeof(CounterType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void IAdvCntr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, CounterType A, StatusType cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_IAdvCntr_CALL_INSTANCE));
+  CMOCK_IAdvCntr_CALL_INSTANCE* cmock_call_instance = (CMOCK_IAdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.IAdvCntr_CallInstance = CMock_Guts_MemChain(Mock.IAdvCntr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_IAdvCntr(cmock_call_instance, A);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(StatusType[sizeof(cmock_to_return) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void IAdvCntr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const IAdvCntr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_IAdvCntr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_IAdvCntr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.IAdvCntr_CallInstance = CMock_Guts_MemChain(Mock.IAdvCntr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_IAdvCntr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_IAdvCntr(cmock_call_instance, cmock_rows[cmock_row].A);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(StatusType[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(StatusType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void SuspendOSInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_SuspendOSInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_SuspendOSInterrupts);
+  cmock_call_instance = (CMOCK_SuspendOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.SuspendOSInterrupts_CallInstance);
+  Mock.SuspendOSInterrupts_CallInstance = CMock_Guts_MemNext(Mock.SuspendOSInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void SuspendOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_SuspendOSInterrupts_CALL_INSTANCE));
+  CMOCK_SuspendOSInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_SuspendOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.SuspendOSInterrupts_CallInstance = CMock_Guts_MemChain(Mock.SuspendOSInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void ResumeOSInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ResumeOSInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ResumeOSInterrupts);
+  cmock_call_instance = (CMOCK_ResumeOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ResumeOSInterrupts_CallInstance);
+  Mock.ResumeOSInterrupts_CallInstance = CMock_Guts_MemNext(Mock.ResumeOSInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void ResumeOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ResumeOSInterrupts_CALL_INSTANCE));
+  CMOCK_ResumeOSInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_ResumeOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ResumeOSInterrupts_CallInstance = CMock_Guts_MemChain(Mock.ResumeOSInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void SuspendAllInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_SuspendAllInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_SuspendAllInterrupts);
+  cmock_call_instance = (CMOCK_SuspendAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.SuspendAllInterrupts_CallInstance);
+  Mock.SuspendAllInterrupts_CallInstance = CMock_Guts_MemNext(Mock.SuspendAllInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void SuspendAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_SuspendAllInterrupts_CALL_INSTANCE));
+  CMOCK_SuspendAllInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_SuspendAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.SuspendAllInterrupts_CallInstance = CMock_Guts_MemChain(Mock.SuspendAllInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void ResumeAllInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ResumeAllInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ResumeAllInterrupts);
+  cmock_call_instance = (CMOCK_ResumeAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ResumeAllInterrupts_CallInstance);
+  Mock.ResumeAllInterrupts_CallInstance = CMock_Guts_MemNext(Mock.ResumeAllInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void ResumeAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ResumeAllInterrupts_CALL_INSTANCE));
+  CMOCK_ResumeAllInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_ResumeAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ResumeAllInterrupts_CallInstance = CMock_Guts_MemChain(Mock.ResumeAllInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void DisableAllInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_DisableAllInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_DisableAllInterrupts);
+  cmock_call_instance = (CMOCK_DisableAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.DisableAllInterrupts_CallInstance);
+  Mock.DisableAllInterrupts_CallInstance = CMock_Guts_MemNext(Mock.DisableAllInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void DisableAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_DisableAllInterrupts_CALL_INSTANCE));
+  CMOCK_DisableAllInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_DisableAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.DisableAllInterrupts_CallInstance = CMock_Guts_MemChain(Mock.DisableAllInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void EnableAllInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_EnableAllInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_EnableAllInterrupts);
+  cmock_call_instance = (CMOCK_EnableAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.EnableAllInterrupts_CallInstance);
+  Mock.EnableAllInterrupts_CallInstance = CMock_Guts_MemNext(Mock.EnableAllInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void EnableAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_EnableAllInterrupts_CALL_INSTANCE));
+  CMOCK_EnableAllInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_EnableAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.EnableAllInterrupts_CallInstance = CMock_Guts_MemChain(Mock.EnableAllInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSDisable(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSDisable_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSDisable);
+  cmock_call_instance = (CMOCK_OSEKOSDisable_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSDisable_CallInstance);
+  Mock.OSEKOSDisable_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSDisable_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSDisable_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSDisable_CALL_INSTANCE));
+  CMOCK_OSEKOSDisable_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSDisable_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSDisable_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSDisable_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSEnable(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSEnable_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSEnable);
+  cmock_call_instance = (CMOCK_OSEKOSEnable_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSEnable_CallInstance);
+  Mock.OSEKOSEnable_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSEnable_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSEnable_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSEnable_CALL_INSTANCE));
+  CMOCK_OSEKOSEnable_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSEnable_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSEnable_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSEnable_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSAsmIDispatch(unsigned long* cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSAsmIDispatch);
+  cmock_call_instance = (CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSAsmIDispatch_CallInstance);
+  Mock.OSEKOSAsmIDispatch_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSAsmIDispatch_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSAsmIDispatch,CMockString_cmock_arg1);
+    if (cmock_call_instance->Expected_cmock_arg1 == NULL)
+      { UNITY_TEST_ASSERT_NULL(cmock_arg1, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX32_ARRAY(cmock_call_instance->Expected_cmock_arg1, cmock_arg1, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSAsmIDispatch(CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE* cmock_call_instance, unsigned long* cmock_arg1);
+void CMockExpectParameters_OSEKOSAsmIDispatch(CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE* cmock_call_instance, unsigned long* cmock_arg1)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+}
+
+void OSEKOSAsmIDispatch_CMockExpect(UNITY_LINE_TYPE cmock_line, unsigned long* cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE));
+  CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSAsmIDispatch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSAsmIDispatch_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSAsmIDispatch(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSAsmIDispatch_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSAsmIDispatch_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSAsmIDispatch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSAsmIDispatch_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSAsmIDispatch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSAsmIDispatch(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSAsmDispatch(OSEKOSPrioType p)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSAsmDispatch);
+  cmock_call_instance = (CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSAsmDispatch_CallInstance);
+  Mock.OSEKOSAsmDispatch_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSAsmDispatch_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSAsmDispatch,CMockString_p);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_p), (void*)(&p), sizeof(OSEKOSPrioType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSAsmDispatch(CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE* cmock_call_instance, OSEKOSPrioType p);
+void CMockExpectParameters_OSEKOSAsmDispatch(CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE* cmock_call_instance, OSEKOSPrioType p)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_p), (void*)(&p),
+         sizeof(OSEKOSPrioType[sizeof(p) == sizeof(OSEKOSPrioType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSAsmDispatch_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSPrioType p)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE));
+  CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSAsmDispatch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSAsmDispatch_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSAsmDispatch(cmock_call_instance, p);
+}
+
+void OSEKOSAsmDispatch_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSAsmDispatch_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSAsmDispatch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSAsmDispatch_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSAsmDispatch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSAsmDispatch(cmock_call_instance, cmock_rows[cmock_row].p);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSStartupEnable(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSStartupEnable_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSStartupEnable);
+  cmock_call_instance = (CMOCK_OSEKOSStartupEnable_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSStartupEnable_CallInstance);
+  Mock.OSEKOSStartupEnable_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSStartupEnable_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSStartupEnable_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSStartupEnable_CALL_INSTANCE));
+  CMOCK_OSEKOSStartupEnable_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSStartupEnable_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSStartupEnable_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSStartupEnable_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSNop(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSNop_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSNop);
+  cmock_call_instance = (CMOCK_OSEKOSNop_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSNop_CallInstance);
+  Mock.OSEKOSNop_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSNop_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSNop_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSNop_CALL_INSTANCE));
+  CMOCK_OSEKOSNop_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSNop_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSNop_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSNop_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+unsigned int OSEKOSV850CheckIsrSwitch(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850CheckIsrSwitch);
+  cmock_call_instance = (CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850CheckIsrSwitch_CallInstance);
+  Mock.OSEKOSV850CheckIsrSwitch_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850CheckIsrSwitch_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void OSEKOSV850CheckIsrSwitch_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE));
+  CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850CheckIsrSwitch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850CheckIsrSwitch_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void OSEKOSV850CheckIsrSwitch_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850CheckIsrSwitch_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850CheckIsrSwitch_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850CheckIsrSwitch_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850CheckIsrSwitch_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSV850InitInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850InitInterrupts);
+  cmock_call_instance = (CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850InitInterrupts_CallInstance);
+  Mock.OSEKOSV850InitInterrupts_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850InitInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSV850InitInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE));
+  CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850InitInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850InitInterrupts_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850InitInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSV850SetupInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850SetupInterrupts);
+  cmock_call_instance = (CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850SetupInterrupts_CallInstance);
+  Mock.OSEKOSV850SetupInterrupts_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850SetupInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSV850SetupInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE));
+  CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850SetupInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850SetupInterrupts_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850SetupInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSV850SyncContextLoad(OSEKOSSaveType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850SyncContextLoad);
+  cmock_call_instance = (CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850SyncContextLoad_CallInstance);
+  Mock.OSEKOSV850SyncContextLoad_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850SyncContextLoad_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850SyncContextLoad,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(OSEKOSSaveType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSV850SyncContextLoad(CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1);
+void CMockExpectParameters_OSEKOSV850SyncContextLoad(CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(OSEKOSSaveType[sizeof(cmock_arg1) == sizeof(OSEKOSSaveType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSV850SyncContextLoad_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE));
+  CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850SyncContextLoad_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850SyncContextLoad_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSV850SyncContextLoad(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSV850SyncContextLoad_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850SyncContextLoad_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850SyncContextLoad_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850SyncContextLoad_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850SyncContextLoad_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSV850SyncContextLoad(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSV850SyncContextLoadFromIRQ(OSEKOSSaveType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850SyncContextLoadFromIRQ);
+  cmock_call_instance = (CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance);
+  Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850SyncContextLoadFromIRQ,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(OSEKOSSaveType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSV850SyncContextLoadFromIRQ(CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1);
+void CMockExpectParameters_OSEKOSV850SyncContextLoadFromIRQ(CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(OSEKOSSaveType[sizeof(cmock_arg1) == sizeof(OSEKOSSaveType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSV850SyncContextLoadFromIRQ_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE));
+  CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSV850SyncContextLoadFromIRQ(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSV850SyncContextLoadFromIRQ_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850SyncContextLoadFromIRQ_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850SyncContextLoadFromIRQ_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850SyncContextLoadFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSV850SyncContextLoadFromIRQ(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSV850ASyncContextLoad(OSEKOSSaveType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850ASyncContextLoad);
+  cmock_call_instance = (CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850ASyncContextLoad_CallInstance);
+  Mock.OSEKOSV850ASyncContextLoad_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850ASyncContextLoad_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850ASyncContextLoad,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(OSEKOSSaveType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSV850ASyncContextLoad(CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1);
+void CMockExpectParameters_OSEKOSV850ASyncContextLoad(CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(OSEKOSSaveType[sizeof(cmock_arg1) == sizeof(OSEKOSSaveType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSV850ASyncContextLoad_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE));
+  CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850ASyncContextLoad_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850ASyncContextLoad_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSV850ASyncContextLoad(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSV850ASyncContextLoad_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850ASyncContextLoad_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850ASyncContextLoad_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850ASyncContextLoad_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850ASyncContextLoad_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSV850ASyncContextLoad(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSV850ASyncContextLoadFromIRQ(OSEKOSSaveType cmock_arg1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850ASyncContextLoadFromIRQ);
+  cmock_call_instance = (CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance);
+  Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850ASyncContextLoadFromIRQ,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1), sizeof(OSEKOSSaveType), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSV850ASyncContextLoadFromIRQ(CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1);
+void CMockExpectParameters_OSEKOSV850ASyncContextLoadFromIRQ(CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance, OSEKOSSaveType cmock_arg1)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(OSEKOSSaveType[sizeof(cmock_arg1) == sizeof(OSEKOSSaveType) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void OSEKOSV850ASyncContextLoadFromIRQ_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE));
+  CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSV850ASyncContextLoadFromIRQ(cmock_call_instance, cmock_arg1);
+}
+
+void OSEKOSV850ASyncContextLoadFromIRQ_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850ASyncContextLoadFromIRQ_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850ASyncContextLoadFromIRQ_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSV850ASyncContextLoadFromIRQ(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSV850StartContext(cmock_osek_func_ptr1 const cmock_arg1, OSEK_U8* const cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850StartContext_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850StartContext);
+  cmock_call_instance = (CMOCK_OSEKOSV850StartContext_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850StartContext_CallInstance);
+  Mock.OSEKOSV850StartContext_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850StartContext_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850StartContext,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_cmock_arg1, cmock_arg1, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850StartContext,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg2), (void*)(cmock_arg2), sizeof(OSEK_U8), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSV850StartContext(CMOCK_OSEKOSV850StartContext_CALL_INSTANCE* cmock_call_instance, cmock_osek_func_ptr1 const cmock_arg1, OSEK_U8* const cmock_arg2);
+void CMockExpectParameters_OSEKOSV850StartContext(CMOCK_OSEKOSV850StartContext_CALL_INSTANCE* cmock_call_instance, cmock_osek_func_ptr1 const cmock_arg1, OSEK_U8* const cmock_arg2)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(cmock_osek_func_ptr1[sizeof(cmock_arg1) == sizeof(cmock_osek_func_ptr1) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  cmock_call_instance->Expected_cmock_arg2 = cmock_arg2;
+}
+
+void OSEKOSV850StartContext_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_osek_func_ptr1 const cmock_arg1, OSEK_U8* const cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850StartContext_CALL_INSTANCE));
+  CMOCK_OSEKOSV850StartContext_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850StartContext_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850StartContext_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850StartContext_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSV850StartContext(cmock_call_instance, cmock_arg1, cmock_arg2);
+}
+
+void OSEKOSV850StartContext_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850StartContext_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850StartContext_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850StartContext_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850StartContext_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850StartContext_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850StartContext_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSV850StartContext(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSV850StartContextFromIRQ(cmock_osek_func_ptr2 const cmock_arg1, OSEK_U8* const cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSV850StartContextFromIRQ);
+  cmock_call_instance = (CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSV850StartContextFromIRQ_CallInstance);
+  Mock.OSEKOSV850StartContextFromIRQ_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSV850StartContextFromIRQ_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850StartContextFromIRQ,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_cmock_arg1, cmock_arg1, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSV850StartContextFromIRQ,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg2), (void*)(cmock_arg2), sizeof(OSEK_U8), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSV850StartContextFromIRQ(CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE* cmock_call_instance, cmock_osek_func_ptr2 const cmock_arg1, OSEK_U8* const cmock_arg2);
+void CMockExpectParameters_OSEKOSV850StartContextFromIRQ(CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE* cmock_call_instance, cmock_osek_func_ptr2 const cmock_arg1, OSEK_U8* const cmock_arg2)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg1), (void*)(&cmock_arg1),
+         sizeof(cmock_osek_func_ptr2[sizeof(cmock_arg1) == sizeof(cmock_osek_func_ptr2) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  cmock_call_instance->Expected_cmock_arg2 = cmock_arg2;
+}
+
+void OSEKOSV850StartContextFromIRQ_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_osek_func_ptr2 const cmock_arg1, OSEK_U8* const cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE));
+  CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSV850StartContextFromIRQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850StartContextFromIRQ_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSV850StartContextFromIRQ(cmock_call_instance, cmock_arg1, cmock_arg2);
+}
+
+void OSEKOSV850StartContextFromIRQ_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850StartContextFromIRQ_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSV850StartContextFromIRQ_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSV850StartContextFromIRQ_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSV850StartContextFromIRQ_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSV850StartContextFromIRQ(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSSuspendOSInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSSuspendOSInterrupts);
+  cmock_call_instance = (CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSSuspendOSInterrupts_CallInstance);
+  Mock.OSEKOSSuspendOSInterrupts_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSSuspendOSInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSSuspendOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE));
+  CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSSuspendOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSSuspendOSInterrupts_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSuspendOSInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSResumeOSInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSResumeOSInterrupts);
+  cmock_call_instance = (CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSResumeOSInterrupts_CallInstance);
+  Mock.OSEKOSResumeOSInterrupts_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSResumeOSInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSResumeOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE));
+  CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSResumeOSInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSResumeOSInterrupts_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSResumeOSInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSSuspendAllInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSSuspendAllInterrupts);
+  cmock_call_instance = (CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSSuspendAllInterrupts_CallInstance);
+  Mock.OSEKOSSuspendAllInterrupts_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSSuspendAllInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSSuspendAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE));
+  CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSSuspendAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSSuspendAllInterrupts_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSSuspendAllInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSResumeAllInterrupts(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSResumeAllInterrupts);
+  cmock_call_instance = (CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSResumeAllInterrupts_CallInstance);
+  Mock.OSEKOSResumeAllInterrupts_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSResumeAllInterrupts_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSResumeAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE));
+  CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSResumeAllInterrupts_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSResumeAllInterrupts_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSResumeAllInterrupts_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOScheckSuspendResumeNesting(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOScheckSuspendResumeNesting);
+  cmock_call_instance = (CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOScheckSuspendResumeNesting_CallInstance);
+  Mock.OSEKOScheckSuspendResumeNesting_CallInstance = CMock_Guts_MemNext(Mock.OSEKOScheckSuspendResumeNesting_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOScheckSuspendResumeNesting_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE));
+  CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOScheckSuspendResumeNesting_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOScheckSuspendResumeNesting_CallInstance = CMock_Guts_MemChain(Mock.OSEKOScheckSuspendResumeNesting_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSgetSR(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSgetSR_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSgetSR);
+  cmock_call_instance = (CMOCK_OSEKOSgetSR_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSgetSR_CallInstance);
+  Mock.OSEKOSgetSR_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSgetSR_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void OSEKOSgetSR_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSgetSR_CALL_INSTANCE));
+  CMOCK_OSEKOSgetSR_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSgetSR_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSgetSR_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSgetSR_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void OSEKOSEnableInterrupt_intern(int nr)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSEnableInterrupt_intern);
+  cmock_call_instance = (CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSEnableInterrupt_intern_CallInstance);
+  Mock.OSEKOSEnableInterrupt_intern_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSEnableInterrupt_intern_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSEnableInterrupt_intern,CMockString_nr);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_nr, nr, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSEnableInterrupt_intern(CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE* cmock_call_instance, int nr);
+void CMockExpectParameters_OSEKOSEnableInterrupt_intern(CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE* cmock_call_instance, int nr)
+{
+  cmock_call_instance->Expected_nr = nr;
+}
+
+void OSEKOSEnableInterrupt_intern_CMockExpect(UNITY_LINE_TYPE cmock_line, int nr)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE));
+  CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSEnableInterrupt_intern_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSEnableInterrupt_intern_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSEnableInterrupt_intern(cmock_call_instance, nr);
+}
+
+void OSEKOSEnableInterrupt_intern_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSEnableInterrupt_intern_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSEnableInterrupt_intern_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSEnableInterrupt_intern_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSEnableInterrupt_intern_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSEnableInterrupt_intern(cmock_call_instance, cmock_rows[cmock_row].nr);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void OSEKOSDisableInterrupt_intern(int nr)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_OSEKOSDisableInterrupt_intern);
+  cmock_call_instance = (CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.OSEKOSDisableInterrupt_intern_CallInstance);
+  Mock.OSEKOSDisableInterrupt_intern_CallInstance = CMock_Guts_MemNext(Mock.OSEKOSDisableInterrupt_intern_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_OSEKOSDisableInterrupt_intern,CMockString_nr);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_nr, nr, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_OSEKOSDisableInterrupt_intern(CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE* cmock_call_instance, int nr);
+void CMockExpectParameters_OSEKOSDisableInterrupt_intern(CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE* cmock_call_instance, int nr)
+{
+  cmock_call_instance->Expected_nr = nr;
+}
+
+void OSEKOSDisableInterrupt_intern_CMockExpect(UNITY_LINE_TYPE cmock_line, int nr)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE));
+  CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE* cmock_call_instance = (CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.OSEKOSDisableInterrupt_intern_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSDisableInterrupt_intern_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_OSEKOSDisableInterrupt_intern(cmock_call_instance, nr);
+}
+
+void OSEKOSDisableInterrupt_intern_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSDisableInterrupt_intern_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.OSEKOSDisableInterrupt_intern_CallInstance = CMock_Guts_MemChain(Mock.OSEKOSDisableInterrupt_intern_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_OSEKOSDisableInterrupt_intern_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_OSEKOSDisableInterrupt_intern(cmock_call_instance, cmock_rows[cmock_row].nr);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,819 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_OSEK_H
+#define _MOCK_OSEK_H
+
+#include "unity.h"
+#include "osek.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_osek_Init(void);
+void mock_osek_Destroy(void);
+void mock_osek_Verify(void);
+
+
+typedef OSEK_TASK(*cmock_osek_func_ptr1)(void);
+typedef OSEK_TASK(*cmock_osek_func_ptr2)(void);
+
+
+#define OSEKOSDisableAll_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSDisableAll requires _Expect (not AndReturn)");
+#define OSEKOSDisableAll_Expect() OSEKOSDisableAll_CMockExpect(__LINE__)
+void OSEKOSDisableAll_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSEnableAll_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSEnableAll requires _Expect (not AndReturn)");
+#define OSEKOSEnableAll_Expect() OSEKOSEnableAll_CMockExpect(__LINE__)
+void OSEKOSEnableAll_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_DbgCAN_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_DbgCAN requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_DbgCAN_Expect() OSEKOS_T_Task_DbgCAN_CMockExpect(__LINE__)
+void OSEKOS_T_Task_DbgCAN_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_ALS_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_ALS requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_ALS_Expect() OSEKOS_T_Task_ALS_CMockExpect(__LINE__)
+void OSEKOS_T_Task_ALS_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_CalibrateMagTask_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_CalibrateMagTask requires _Expect (not AndReturn)");
+#define OSEKOS_T_CalibrateMagTask_Expect() OSEKOS_T_CalibrateMagTask_CMockExpect(__LINE__)
+void OSEKOS_T_CalibrateMagTask_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_IAQ_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_IAQ requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_IAQ_Expect() OSEKOS_T_Task_IAQ_CMockExpect(__LINE__)
+void OSEKOS_T_Task_IAQ_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_SmartBeam_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_SmartBeam requires _Expect (not AndReturn)");
+#define OSEKOS_T_SmartBeam_Expect() OSEKOS_T_SmartBeam_CMockExpect(__LINE__)
+void OSEKOS_T_SmartBeam_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_QbertTestImage_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_QbertTestImage requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_QbertTestImage_Expect() OSEKOS_T_Task_QbertTestImage_CMockExpect(__LINE__)
+void OSEKOS_T_Task_QbertTestImage_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_TestQbertMem_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_TestQbertMem requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_TestQbertMem_Expect() OSEKOS_T_Task_TestQbertMem_CMockExpect(__LINE__)
+void OSEKOS_T_Task_TestQbertMem_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_Cyclic1000_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_Cyclic1000 requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_Cyclic1000_Expect() OSEKOS_T_Task_Cyclic1000_CMockExpect(__LINE__)
+void OSEKOS_T_Task_Cyclic1000_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_ProcessMagForCompass_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_ProcessMagForCompass requires _Expect (not AndReturn)");
+#define OSEKOS_T_ProcessMagForCompass_Expect() OSEKOS_T_ProcessMagForCompass_CMockExpect(__LINE__)
+void OSEKOS_T_ProcessMagForCompass_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_ReadMag_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_ReadMag requires _Expect (not AndReturn)");
+#define OSEKOS_T_ReadMag_Expect() OSEKOS_T_ReadMag_CMockExpect(__LINE__)
+void OSEKOS_T_ReadMag_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_Cyclic10_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_Cyclic10 requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_Cyclic10_Expect() OSEKOS_T_Task_Cyclic10_CMockExpect(__LINE__)
+void OSEKOS_T_Task_Cyclic10_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_Wdm_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_Wdm requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_Wdm_Expect() OSEKOS_T_Task_Wdm_CMockExpect(__LINE__)
+void OSEKOS_T_Task_Wdm_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_BackgroundTask_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_BackgroundTask requires _Expect (not AndReturn)");
+#define OSEKOS_T_BackgroundTask_Expect() OSEKOS_T_BackgroundTask_CMockExpect(__LINE__)
+void OSEKOS_T_BackgroundTask_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_Cyclic20_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_Cyclic20 requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_Cyclic20_Expect() OSEKOS_T_Task_Cyclic20_CMockExpect(__LINE__)
+void OSEKOS_T_Task_Cyclic20_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_T_Task_Cyclic2_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_T_Task_Cyclic2 requires _Expect (not AndReturn)");
+#define OSEKOS_T_Task_Cyclic2_Expect() OSEKOS_T_Task_Cyclic2_CMockExpect(__LINE__)
+void OSEKOS_T_Task_Cyclic2_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_DbgCAN_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_DbgCAN requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_DbgCAN_Expect() OSEKOS_Twrap_Task_DbgCAN_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_DbgCAN_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_ALS_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_ALS requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_ALS_Expect() OSEKOS_Twrap_Task_ALS_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_ALS_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_CalibrateMagTask_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_CalibrateMagTask requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_CalibrateMagTask_Expect() OSEKOS_Twrap_CalibrateMagTask_CMockExpect(__LINE__)
+void OSEKOS_Twrap_CalibrateMagTask_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_IAQ_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_IAQ requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_IAQ_Expect() OSEKOS_Twrap_Task_IAQ_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_IAQ_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_SmartBeam_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_SmartBeam requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_SmartBeam_Expect() OSEKOS_Twrap_SmartBeam_CMockExpect(__LINE__)
+void OSEKOS_Twrap_SmartBeam_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_QbertTestImage_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_QbertTestImage requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_QbertTestImage_Expect() OSEKOS_Twrap_Task_QbertTestImage_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_QbertTestImage_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_TestQbertMem_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_TestQbertMem requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_TestQbertMem_Expect() OSEKOS_Twrap_Task_TestQbertMem_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_TestQbertMem_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_Cyclic1000_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_Cyclic1000 requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_Cyclic1000_Expect() OSEKOS_Twrap_Task_Cyclic1000_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_Cyclic1000_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_ProcessMagForCompass_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_ProcessMagForCompass requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_ProcessMagForCompass_Expect() OSEKOS_Twrap_ProcessMagForCompass_CMockExpect(__LINE__)
+void OSEKOS_Twrap_ProcessMagForCompass_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_ReadMag_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_ReadMag requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_ReadMag_Expect() OSEKOS_Twrap_ReadMag_CMockExpect(__LINE__)
+void OSEKOS_Twrap_ReadMag_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_Cyclic10_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_Cyclic10 requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_Cyclic10_Expect() OSEKOS_Twrap_Task_Cyclic10_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_Cyclic10_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_Wdm_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_Wdm requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_Wdm_Expect() OSEKOS_Twrap_Task_Wdm_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_Wdm_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_BackgroundTask_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_BackgroundTask requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_BackgroundTask_Expect() OSEKOS_Twrap_BackgroundTask_CMockExpect(__LINE__)
+void OSEKOS_Twrap_BackgroundTask_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_Cyclic20_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_Cyclic20 requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_Cyclic20_Expect() OSEKOS_Twrap_Task_Cyclic20_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_Cyclic20_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_Twrap_Task_Cyclic2_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_Twrap_Task_Cyclic2 requires _Expect (not AndReturn)");
+#define OSEKOS_Twrap_Task_Cyclic2_Expect() OSEKOS_Twrap_Task_Cyclic2_CMockExpect(__LINE__)
+void OSEKOS_Twrap_Task_Cyclic2_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSEnableSystemTimers_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSEnableSystemTimers requires _Expect (not AndReturn)");
+#define OSEKOSEnableSystemTimers_Expect() OSEKOSEnableSystemTimers_CMockExpect(__LINE__)
+void OSEKOSEnableSystemTimers_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_CanTxInterrupt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_CanTxInterrupt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_CanTxInterrupt_Expect() OSEKOS_ISR_CanTxInterrupt_CMockExpect(__LINE__)
+void OSEKOS_ISR_CanTxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_CanRxInterrupt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_CanRxInterrupt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_CanRxInterrupt_Expect() OSEKOS_ISR_CanRxInterrupt_CMockExpect(__LINE__)
+void OSEKOS_ISR_CanRxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_CanErrInterrupt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_CanErrInterrupt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_CanErrInterrupt_Expect() OSEKOS_ISR_CanErrInterrupt_CMockExpect(__LINE__)
+void OSEKOS_ISR_CanErrInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_SCIRxInterrupt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_SCIRxInterrupt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_SCIRxInterrupt_Expect() OSEKOS_ISR_SCIRxInterrupt_CMockExpect(__LINE__)
+void OSEKOS_ISR_SCIRxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_SCITxInterrupt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_SCITxInterrupt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_SCITxInterrupt_Expect() OSEKOS_ISR_SCITxInterrupt_CMockExpect(__LINE__)
+void OSEKOS_ISR_SCITxInterrupt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_UP_DMA_Interrupt_0_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_UP_DMA_Interrupt_0 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_UP_DMA_Interrupt_0_Expect() OSEKOS_ISR_UP_DMA_Interrupt_0_CMockExpect(__LINE__)
+void OSEKOS_ISR_UP_DMA_Interrupt_0_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_UP_DMA_Interrupt_1_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_UP_DMA_Interrupt_1 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_UP_DMA_Interrupt_1_Expect() OSEKOS_ISR_UP_DMA_Interrupt_1_CMockExpect(__LINE__)
+void OSEKOS_ISR_UP_DMA_Interrupt_1_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_UP_DMA_Interrupt_2_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_UP_DMA_Interrupt_2 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_UP_DMA_Interrupt_2_Expect() OSEKOS_ISR_UP_DMA_Interrupt_2_CMockExpect(__LINE__)
+void OSEKOS_ISR_UP_DMA_Interrupt_2_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_UP_DMA_Interrupt_3_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_UP_DMA_Interrupt_3 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_UP_DMA_Interrupt_3_Expect() OSEKOS_ISR_UP_DMA_Interrupt_3_CMockExpect(__LINE__)
+void OSEKOS_ISR_UP_DMA_Interrupt_3_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_CompFreqHandler_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_CompFreqHandler requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_CompFreqHandler_Expect() OSEKOS_ISR_CompFreqHandler_CMockExpect(__LINE__)
+void OSEKOS_ISR_CompFreqHandler_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_AmbientReturnInt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_AmbientReturnInt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_AmbientReturnInt_Expect() OSEKOS_ISR_AmbientReturnInt_CMockExpect(__LINE__)
+void OSEKOS_ISR_AmbientReturnInt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_GlareReturnInt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_GlareReturnInt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_GlareReturnInt_Expect() OSEKOS_ISR_GlareReturnInt_CMockExpect(__LINE__)
+void OSEKOS_ISR_GlareReturnInt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_ALSTimeoutInt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_ALSTimeoutInt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_ALSTimeoutInt_Expect() OSEKOS_ISR_ALSTimeoutInt_CMockExpect(__LINE__)
+void OSEKOS_ISR_ALSTimeoutInt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_LINTimerInt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_LINTimerInt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_LINTimerInt_Expect() OSEKOS_ISR_LINTimerInt_CMockExpect(__LINE__)
+void OSEKOS_ISR_LINTimerInt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_LINDelayInt_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_LINDelayInt requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_LINDelayInt_Expect() OSEKOS_ISR_LINDelayInt_CMockExpect(__LINE__)
+void OSEKOS_ISR_LINDelayInt_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_TimerMExpire_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_TimerMExpire requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_TimerMExpire_Expect() OSEKOS_ISR_TimerMExpire_CMockExpect(__LINE__)
+void OSEKOS_ISR_TimerMExpire_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_LINRxTx_SCI1_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_LINRxTx_SCI1 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_LINRxTx_SCI1_Expect() OSEKOS_ISR_LINRxTx_SCI1_CMockExpect(__LINE__)
+void OSEKOS_ISR_LINRxTx_SCI1_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_CanRxInterrupt_1_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_CanRxInterrupt_1 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_CanRxInterrupt_1_Expect() OSEKOS_ISR_CanRxInterrupt_1_CMockExpect(__LINE__)
+void OSEKOS_ISR_CanRxInterrupt_1_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_LINError_SCI1_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_LINError_SCI1 requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_LINError_SCI1_Expect() OSEKOS_ISR_LINError_SCI1_CMockExpect(__LINE__)
+void OSEKOS_ISR_LINError_SCI1_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOS_ISR_SysCounter_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOS_ISR_SysCounter requires _Expect (not AndReturn)");
+#define OSEKOS_ISR_SysCounter_Expect() OSEKOS_ISR_SysCounter_CMockExpect(__LINE__)
+void OSEKOS_ISR_SysCounter_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSrtcGetSeconds_Expect() TEST_FAIL_MESSAGE("OSEKOSrtcGetSeconds requires _ExpectAndReturn");
+#define OSEKOSrtcGetSeconds_ExpectAndReturn(cmock_retval) OSEKOSrtcGetSeconds_CMockExpectAndReturn(__LINE__, cmock_retval)
+void OSEKOSrtcGetSeconds_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned long cmock_to_return);
+typedef struct _CMOCK_OSEKOSrtcGetSeconds_EXPECT_ROW
+{
+  unsigned long ReturnVal;
+} OSEKOSrtcGetSeconds_ExpectRow;
+#define OSEKOSrtcGetSeconds_ExpectTable(cmock_rows, cmock_count) OSEKOSrtcGetSeconds_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSrtcGetSeconds_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSrtcGetSeconds_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSrtcIncrement_ExpectAndReturn(nsec, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSrtcIncrement requires _Expect (not AndReturn)");
+#define OSEKOSrtcIncrement_Expect(nsec) OSEKOSrtcIncrement_CMockExpect(__LINE__, nsec)
+void OSEKOSrtcIncrement_CMockExpect(UNITY_LINE_TYPE cmock_line, unsigned long nsec);
+typedef struct _CMOCK_OSEKOSrtcIncrement_EXPECT_ROW
+{
+  unsigned long nsec;
+} OSEKOSrtcIncrement_ExpectRow;
+#define OSEKOSrtcIncrement_ExpectTable(cmock_rows, cmock_count) OSEKOSrtcIncrement_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSrtcIncrement_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSrtcIncrement_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSError_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSError requires _ExpectAndReturn");
+#define OSEKOSError_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSError_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSError_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1, StatusType cmock_to_return);
+typedef struct _CMOCK_OSEKOSError_EXPECT_ROW
+{
+  StatusType cmock_arg1;
+  StatusType ReturnVal;
+} OSEKOSError_ExpectRow;
+#define OSEKOSError_ExpectTable(cmock_rows, cmock_count) OSEKOSError_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSError_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSError_ExpectRow* cmock_rows, size_t cmock_count);
+#define ErrorHook_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("ErrorHook requires _Expect (not AndReturn)");
+#define ErrorHook_Expect(cmock_arg1) ErrorHook_CMockExpect(__LINE__, cmock_arg1)
+void ErrorHook_CMockExpect(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1);
+typedef struct _CMOCK_ErrorHook_EXPECT_ROW
+{
+  StatusType cmock_arg1;
+} ErrorHook_ExpectRow;
+#define ErrorHook_ExpectTable(cmock_rows, cmock_count) ErrorHook_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ErrorHook_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ErrorHook_ExpectRow* cmock_rows, size_t cmock_count);
+#define StartupHook_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("StartupHook requires _Expect (not AndReturn)");
+#define StartupHook_Expect() StartupHook_CMockExpect(__LINE__)
+void StartupHook_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define ShutdownHook_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("ShutdownHook requires _Expect (not AndReturn)");
+#define ShutdownHook_Expect(cmock_arg1) ShutdownHook_CMockExpect(__LINE__, cmock_arg1)
+void ShutdownHook_CMockExpect(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1);
+typedef struct _CMOCK_ShutdownHook_EXPECT_ROW
+{
+  StatusType cmock_arg1;
+} ShutdownHook_ExpectRow;
+#define ShutdownHook_ExpectTable(cmock_rows, cmock_count) ShutdownHook_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ShutdownHook_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ShutdownHook_ExpectRow* cmock_rows, size_t cmock_count);
+#define getUsedTaskStack_Expect(cmock_arg1) TEST_FAIL_MESSAGE("getUsedTaskStack requires _ExpectAndReturn");
+#define getUsedTaskStack_ExpectAndReturn(cmock_arg1, cmock_retval) getUsedTaskStack_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void getUsedTaskStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, int cmock_to_return);
+typedef struct _CMOCK_getUsedTaskStack_EXPECT_ROW
+{
+  TaskType cmock_arg1;
+  int ReturnVal;
+} getUsedTaskStack_ExpectRow;
+#define getUsedTaskStack_ExpectTable(cmock_rows, cmock_count) getUsedTaskStack_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void getUsedTaskStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUsedTaskStack_ExpectRow* cmock_rows, size_t cmock_count);
+#define getUnusedTaskStack_Expect(cmock_arg1) TEST_FAIL_MESSAGE("getUnusedTaskStack requires _ExpectAndReturn");
+#define getUnusedTaskStack_ExpectAndReturn(cmock_arg1, cmock_retval) getUnusedTaskStack_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void getUnusedTaskStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, int cmock_to_return);
+typedef struct _CMOCK_getUnusedTaskStack_EXPECT_ROW
+{
+  TaskType cmock_arg1;
+  int ReturnVal;
+} getUnusedTaskStack_ExpectRow;
+#define getUnusedTaskStack_ExpectTable(cmock_rows, cmock_count) getUnusedTaskStack_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void getUnusedTaskStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUnusedTaskStack_ExpectRow* cmock_rows, size_t cmock_count);
+#define getUsedIsrStack_Expect() TEST_FAIL_MESSAGE("getUsedIsrStack requires _ExpectAndReturn");
+#define getUsedIsrStack_ExpectAndReturn(cmock_retval) getUsedIsrStack_CMockExpectAndReturn(__LINE__, cmock_retval)
+void getUsedIsrStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_getUsedIsrStack_EXPECT_ROW
+{
+  int ReturnVal;
+} getUsedIsrStack_ExpectRow;
+#define getUsedIsrStack_ExpectTable(cmock_rows, cmock_count) getUsedIsrStack_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void getUsedIsrStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUsedIsrStack_ExpectRow* cmock_rows, size_t cmock_count);
+#define getUnusedIsrStack_Expect() TEST_FAIL_MESSAGE("getUnusedIsrStack requires _ExpectAndReturn");
+#define getUnusedIsrStack_ExpectAndReturn(cmock_retval) getUnusedIsrStack_CMockExpectAndReturn(__LINE__, cmock_retval)
+void getUnusedIsrStack_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_getUnusedIsrStack_EXPECT_ROW
+{
+  int ReturnVal;
+} getUnusedIsrStack_ExpectRow;
+#define getUnusedIsrStack_ExpectTable(cmock_rows, cmock_count) getUnusedIsrStack_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void getUnusedIsrStack_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const getUnusedIsrStack_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOStaskStackCheckInit_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOStaskStackCheckInit requires _Expect (not AndReturn)");
+#define OSEKOStaskStackCheckInit_Expect() OSEKOStaskStackCheckInit_CMockExpect(__LINE__)
+void OSEKOStaskStackCheckInit_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOStaskStackCheck_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOStaskStackCheck requires _ExpectAndReturn");
+#define OSEKOStaskStackCheck_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOStaskStackCheck_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOStaskStackCheck_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1, signed char cmock_to_return);
+typedef struct _CMOCK_OSEKOStaskStackCheck_EXPECT_ROW
+{
+  OSEK_U8* cmock_arg1;
+  signed char ReturnVal;
+} OSEKOStaskStackCheck_ExpectRow;
+#define OSEKOStaskStackCheck_ExpectTable(cmock_rows, cmock_count) OSEKOStaskStackCheck_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOStaskStackCheck_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOStaskStackCheck_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSisrStackCheck_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSisrStackCheck requires _ExpectAndReturn");
+#define OSEKOSisrStackCheck_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSisrStackCheck_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSisrStackCheck_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1, signed char cmock_to_return);
+typedef struct _CMOCK_OSEKOSisrStackCheck_EXPECT_ROW
+{
+  OSEK_U8* cmock_arg1;
+  signed char ReturnVal;
+} OSEKOSisrStackCheck_ExpectRow;
+#define OSEKOSisrStackCheck_ExpectTable(cmock_rows, cmock_count) OSEKOSisrStackCheck_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSisrStackCheck_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSisrStackCheck_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOStaskStackCheckFatal_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOStaskStackCheckFatal requires _Expect (not AndReturn)");
+#define OSEKOStaskStackCheckFatal_Expect(cmock_arg1) OSEKOStaskStackCheckFatal_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOStaskStackCheckFatal_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1);
+typedef struct _CMOCK_OSEKOStaskStackCheckFatal_EXPECT_ROW
+{
+  OSEK_U8* cmock_arg1;
+} OSEKOStaskStackCheckFatal_ExpectRow;
+#define OSEKOStaskStackCheckFatal_ExpectTable(cmock_rows, cmock_count) OSEKOStaskStackCheckFatal_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOStaskStackCheckFatal_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOStaskStackCheckFatal_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSisrStackCheckFatal_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSisrStackCheckFatal requires _Expect (not AndReturn)");
+#define OSEKOSisrStackCheckFatal_Expect(cmock_arg1) OSEKOSisrStackCheckFatal_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSisrStackCheckFatal_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_arg1);
+typedef struct _CMOCK_OSEKOSisrStackCheckFatal_EXPECT_ROW
+{
+  OSEK_U8* cmock_arg1;
+} OSEKOSisrStackCheckFatal_ExpectRow;
+#define OSEKOSisrStackCheckFatal_ExpectTable(cmock_rows, cmock_count) OSEKOSisrStackCheckFatal_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSisrStackCheckFatal_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSisrStackCheckFatal_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSgetStackPointer_Expect() TEST_FAIL_MESSAGE("OSEKOSgetStackPointer requires _ExpectAndReturn");
+#define OSEKOSgetStackPointer_ExpectAndReturn(cmock_retval) OSEKOSgetStackPointer_CMockExpectAndReturn(__LINE__, cmock_retval)
+void OSEKOSgetStackPointer_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, OSEK_U8* cmock_to_return);
+typedef struct _CMOCK_OSEKOSgetStackPointer_EXPECT_ROW
+{
+  OSEK_U8* ReturnVal;
+} OSEKOSgetStackPointer_ExpectRow;
+#define OSEKOSgetStackPointer_ExpectTable(cmock_rows, cmock_count) OSEKOSgetStackPointer_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSgetStackPointer_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSgetStackPointer_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSTaskSwitch_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSTaskSwitch requires _Expect (not AndReturn)");
+#define OSEKOSTaskSwitch_Expect() OSEKOSTaskSwitch_CMockExpect(__LINE__)
+void OSEKOSTaskSwitch_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSReturn_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSReturn requires _ExpectAndReturn");
+#define OSEKOSReturn_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSReturn_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSReturn_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1, StatusType cmock_to_return);
+typedef struct _CMOCK_OSEKOSReturn_EXPECT_ROW
+{
+  StatusType cmock_arg1;
+  StatusType ReturnVal;
+} OSEKOSReturn_ExpectRow;
+#define OSEKOSReturn_ExpectTable(cmock_rows, cmock_count) OSEKOSReturn_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSReturn_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSReturn_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSActivateTask_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSActivateTask requires _ExpectAndReturn");
+#define OSEKOSActivateTask_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSActivateTask_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSActivateTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, StatusType cmock_to_return);
+typedef struct _CMOCK_OSEKOSActivateTask_EXPECT_ROW
+{
+  TaskType cmock_arg1;
+  StatusType ReturnVal;
+} OSEKOSActivateTask_ExpectRow;
+#define OSEKOSActivateTask_ExpectTable(cmock_rows, cmock_count) OSEKOSActivateTask_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSActivateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSActivateTask_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSTerminateTask_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSTerminateTask requires _Expect (not AndReturn)");
+#define OSEKOSTerminateTask_Expect(cmock_arg1, cmock_arg2) OSEKOSTerminateTask_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void OSEKOSTerminateTask_CMockExpect(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, TaskType cmock_arg2);
+typedef struct _CMOCK_OSEKOSTerminateTask_EXPECT_ROW
+{
+  TaskType cmock_arg1;
+  TaskType cmock_arg2;
+} OSEKOSTerminateTask_ExpectRow;
+#define OSEKOSTerminateTask_ExpectTable(cmock_rows, cmock_count) OSEKOSTerminateTask_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSTerminateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSTerminateTask_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSSetEvent_Expect(cmock_arg1, cmock_arg2) TEST_FAIL_MESSAGE("OSEKOSSetEvent requires _ExpectAndReturn");
+#define OSEKOSSetEvent_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) OSEKOSSetEvent_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_arg2, cmock_retval)
+void OSEKOSSetEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType cmock_arg1, EventMaskType cmock_arg2, int cmock_to_return);
+typedef struct _CMOCK_OSEKOSSetEvent_EXPECT_ROW
+{
+  TaskType cmock_arg1;
+  EventMaskType cmock_arg2;
+  int ReturnVal;
+} OSEKOSSetEvent_ExpectRow;
+#define OSEKOSSetEvent_ExpectTable(cmock_rows, cmock_count) OSEKOSSetEvent_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSSetEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSSetEvent_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSWaitEvent_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSWaitEvent requires _ExpectAndReturn");
+#define OSEKOSWaitEvent_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSWaitEvent_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSWaitEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EventMaskType cmock_arg1, int cmock_to_return);
+typedef struct _CMOCK_OSEKOSWaitEvent_EXPECT_ROW
+{
+  EventMaskType cmock_arg1;
+  int ReturnVal;
+} OSEKOSWaitEvent_ExpectRow;
+#define OSEKOSWaitEvent_ExpectTable(cmock_rows, cmock_count) OSEKOSWaitEvent_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSWaitEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSWaitEvent_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSGetAlarm_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSGetAlarm requires _ExpectAndReturn");
+#define OSEKOSGetAlarm_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSGetAlarm_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSGetAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType cmock_arg1, TickType cmock_to_return);
+typedef struct _CMOCK_OSEKOSGetAlarm_EXPECT_ROW
+{
+  AlarmType cmock_arg1;
+  TickType ReturnVal;
+} OSEKOSGetAlarm_ExpectRow;
+#define OSEKOSGetAlarm_ExpectTable(cmock_rows, cmock_count) OSEKOSGetAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSGetAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSGetAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSSetAlarm_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_arg3, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSSetAlarm requires _Expect (not AndReturn)");
+#define OSEKOSSetAlarm_Expect(cmock_arg1, cmock_arg2, cmock_arg3) OSEKOSSetAlarm_CMockExpect(__LINE__, cmock_arg1, cmock_arg2, cmock_arg3)
+void OSEKOSSetAlarm_CMockExpect(UNITY_LINE_TYPE cmock_line, AlarmType cmock_arg1, TickType cmock_arg2, TickType cmock_arg3);
+typedef struct _CMOCK_OSEKOSSetAlarm_EXPECT_ROW
+{
+  AlarmType cmock_arg1;
+  TickType cmock_arg2;
+  TickType cmock_arg3;
+} OSEKOSSetAlarm_ExpectRow;
+#define OSEKOSSetAlarm_ExpectTable(cmock_rows, cmock_count) OSEKOSSetAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSSetAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSSetAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSSetAbsAlarm_Expect(a, b, c) TEST_FAIL_MESSAGE("OSEKOSSetAbsAlarm requires _ExpectAndReturn");
+#define OSEKOSSetAbsAlarm_ExpectAndReturn(a, b, c, cmock_retval) OSEKOSSetAbsAlarm_CMockExpectAndReturn(__LINE__, a, b, c, cmock_retval)
+void OSEKOSSetAbsAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType a, TickType b, TickType c, StatusType cmock_to_return);
+typedef struct _CMOCK_OSEKOSSetAbsAlarm_EXPECT_ROW
+{
+  AlarmType a;
+  TickType b;
+  TickType c;
+  StatusType ReturnVal;
+} OSEKOSSetAbsAlarm_ExpectRow;
+#define OSEKOSSetAbsAlarm_ExpectTable(cmock_rows, cmock_count) OSEKOSSetAbsAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSSetAbsAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSSetAbsAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSCancelAlarm_Expect(cmock_arg1) TEST_FAIL_MESSAGE("OSEKOSCancelAlarm requires _ExpectAndReturn");
+#define OSEKOSCancelAlarm_ExpectAndReturn(cmock_arg1, cmock_retval) OSEKOSCancelAlarm_CMockExpectAndReturn(__LINE__, cmock_arg1, cmock_retval)
+void OSEKOSCancelAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType cmock_arg1, StatusType cmock_to_return);
+typedef struct _CMOCK_OSEKOSCancelAlarm_EXPECT_ROW
+{
+  AlarmType cmock_arg1;
+  StatusType ReturnVal;
+} OSEKOSCancelAlarm_ExpectRow;
+#define OSEKOSCancelAlarm_ExpectTable(cmock_rows, cmock_count) OSEKOSCancelAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSCancelAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSCancelAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSAdvCntr_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSAdvCntr requires _Expect (not AndReturn)");
+#define OSEKOSAdvCntr_Expect() OSEKOSAdvCntr_CMockExpect(__LINE__)
+void OSEKOSAdvCntr_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define GetActiveApplicationMode_Expect() TEST_FAIL_MESSAGE("GetActiveApplicationMode requires _ExpectAndReturn");
+#define GetActiveApplicationMode_ExpectAndReturn(cmock_retval) GetActiveApplicationMode_CMockExpectAndReturn(__LINE__, cmock_retval)
+void GetActiveApplicationMode_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AppModeType cmock_to_return);
+typedef struct _CMOCK_GetActiveApplicationMode_EXPECT_ROW
+{
+  AppModeType ReturnVal;
+} GetActiveApplicationMode_ExpectRow;
+#define GetActiveApplicationMode_ExpectTable(cmock_rows, cmock_count) GetActiveApplicationMode_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetActiveApplicationMode_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetActiveApplicationMode_ExpectRow* cmock_rows, size_t cmock_count);
+#define StartOS_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("StartOS requires _Expect (not AndReturn)");
+#define StartOS_Expect(cmock_arg1) StartOS_CMockExpect(__LINE__, cmock_arg1)
+void StartOS_CMockExpect(UNITY_LINE_TYPE cmock_line, AppModeType cmock_arg1);
+typedef struct _CMOCK_StartOS_EXPECT_ROW
+{
+  AppModeType cmock_arg1;
+} StartOS_ExpectRow;
+#define StartOS_ExpectTable(cmock_rows, cmock_count) StartOS_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void StartOS_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const StartOS_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSShutdownOS_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSShutdownOS requires _Expect (not AndReturn)");
+#define OSEKOSShutdownOS_Expect(cmock_arg1) OSEKOSShutdownOS_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSShutdownOS_CMockExpect(UNITY_LINE_TYPE cmock_line, StatusType cmock_arg1);
+typedef struct _CMOCK_OSEKOSShutdownOS_EXPECT_ROW
+{
+  StatusType cmock_arg1;
+} OSEKOSShutdownOS_ExpectRow;
+#define OSEKOSShutdownOS_ExpectTable(cmock_rows, cmock_count) OSEKOSShutdownOS_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSShutdownOS_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSShutdownOS_ExpectRow* cmock_rows, size_t cmock_count);
+#define ActivateTask_Expect(A) TEST_FAIL_MESSAGE("ActivateTask requires _ExpectAndReturn");
+#define ActivateTask_ExpectAndReturn(A, cmock_retval) ActivateTask_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void ActivateTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, StatusType cmock_to_return);
+typedef struct _CMOCK_ActivateTask_EXPECT_ROW
+{
+  TaskType A;
+  StatusType ReturnVal;
+} ActivateTask_ExpectRow;
+#define ActivateTask_ExpectTable(cmock_rows, cmock_count) ActivateTask_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ActivateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ActivateTask_ExpectRow* cmock_rows, size_t cmock_count);
+#define TerminateTask_Expect() TEST_FAIL_MESSAGE("TerminateTask requires _ExpectAndReturn");
+#define TerminateTask_ExpectAndReturn(cmock_retval) TerminateTask_CMockExpectAndReturn(__LINE__, cmock_retval)
+void TerminateTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_to_return);
+typedef struct _CMOCK_TerminateTask_EXPECT_ROW
+{
+  StatusType ReturnVal;
+} TerminateTask_ExpectRow;
+#define TerminateTask_ExpectTable(cmock_rows, cmock_count) TerminateTask_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void TerminateTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const TerminateTask_ExpectRow* cmock_rows, size_t cmock_count);
+#define ChainTask_Expect(A) TEST_FAIL_MESSAGE("ChainTask requires _ExpectAndReturn");
+#define ChainTask_ExpectAndReturn(A, cmock_retval) ChainTask_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void ChainTask_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, StatusType cmock_to_return);
+typedef struct _CMOCK_ChainTask_EXPECT_ROW
+{
+  TaskType A;
+  StatusType ReturnVal;
+} ChainTask_ExpectRow;
+#define ChainTask_ExpectTable(cmock_rows, cmock_count) ChainTask_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ChainTask_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ChainTask_ExpectRow* cmock_rows, size_t cmock_count);
+#define GetTaskState_Expect(A, B) TEST_FAIL_MESSAGE("GetTaskState requires _ExpectAndReturn");
+#define GetTaskState_ExpectAndReturn(A, B, cmock_retval) GetTaskState_CMockExpectAndReturn(__LINE__, A, B, cmock_retval)
+void GetTaskState_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, TaskStateRefType B, StatusType cmock_to_return);
+typedef struct _CMOCK_GetTaskState_EXPECT_ROW
+{
+  TaskType A;
+  TaskStateRefType B;
+  StatusType ReturnVal;
+} GetTaskState_ExpectRow;
+#define GetTaskState_ExpectTable(cmock_rows, cmock_count) GetTaskState_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetTaskState_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetTaskState_ExpectRow* cmock_rows, size_t cmock_count);
+#define GetTaskID_Expect(A) TEST_FAIL_MESSAGE("GetTaskID requires _ExpectAndReturn");
+#define GetTaskID_ExpectAndReturn(A, cmock_retval) GetTaskID_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void GetTaskID_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskRefType A, StatusType cmock_to_return);
+typedef struct _CMOCK_GetTaskID_EXPECT_ROW
+{
+  TaskRefType A;
+  StatusType ReturnVal;
+} GetTaskID_ExpectRow;
+#define GetTaskID_ExpectTable(cmock_rows, cmock_count) GetTaskID_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetTaskID_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetTaskID_ExpectRow* cmock_rows, size_t cmock_count);
+#define Schedule_Expect() TEST_FAIL_MESSAGE("Schedule requires _ExpectAndReturn");
+#define Schedule_ExpectAndReturn(cmock_retval) Schedule_CMockExpectAndReturn(__LINE__, cmock_retval)
+void Schedule_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, StatusType cmock_to_return);
+typedef struct _CMOCK_Schedule_EXPECT_ROW
+{
+  StatusType ReturnVal;
+} Schedule_ExpectRow;
+#define Schedule_ExpectTable(cmock_rows, cmock_count) Schedule_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void Schedule_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const Schedule_ExpectRow* cmock_rows, size_t cmock_count);
+#define GetResource_Expect(A) TEST_FAIL_MESSAGE("GetResource requires _ExpectAndReturn");
+#define GetResource_ExpectAndReturn(A, cmock_retval) GetResource_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void GetResource_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, ResourceType A, StatusType cmock_to_return);
+typedef struct _CMOCK_GetResource_EXPECT_ROW
+{
+  ResourceType A;
+  StatusType ReturnVal;
+} GetResource_ExpectRow;
+#define GetResource_ExpectTable(cmock_rows, cmock_count) GetResource_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetResource_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetResource_ExpectRow* cmock_rows, size_t cmock_count);
+#define ReleaseResource_Expect(A) TEST_FAIL_MESSAGE("ReleaseResource requires _ExpectAndReturn");
+#define ReleaseResource_ExpectAndReturn(A, cmock_retval) ReleaseResource_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void ReleaseResource_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, ResourceType A, StatusType cmock_to_return);
+typedef struct _CMOCK_ReleaseResource_EXPECT_ROW
+{
+  ResourceType A;
+  StatusType ReturnVal;
+} ReleaseResource_ExpectRow;
+#define ReleaseResource_ExpectTable(cmock_rows, cmock_count) ReleaseResource_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ReleaseResource_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ReleaseResource_ExpectRow* cmock_rows, size_t cmock_count);
+#define SetEvent_Expect(A, B) TEST_FAIL_MESSAGE("SetEvent requires _ExpectAndReturn");
+#define SetEvent_ExpectAndReturn(A, B, cmock_retval) SetEvent_CMockExpectAndReturn(__LINE__, A, B, cmock_retval)
+void SetEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, EventMaskType B, StatusType cmock_to_return);
+typedef struct _CMOCK_SetEvent_EXPECT_ROW
+{
+  TaskType A;
+  EventMaskType B;
+  StatusType ReturnVal;
+} SetEvent_ExpectRow;
+#define SetEvent_ExpectTable(cmock_rows, cmock_count) SetEvent_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void SetEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const SetEvent_ExpectRow* cmock_rows, size_t cmock_count);
+#define ClearEvent_Expect(A) TEST_FAIL_MESSAGE("ClearEvent requires _ExpectAndReturn");
+#define ClearEvent_ExpectAndReturn(A, cmock_retval) ClearEvent_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void ClearEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EventMaskType A, StatusType cmock_to_return);
+typedef struct _CMOCK_ClearEvent_EXPECT_ROW
+{
+  EventMaskType A;
+  StatusType ReturnVal;
+} ClearEvent_ExpectRow;
+#define ClearEvent_ExpectTable(cmock_rows, cmock_count) ClearEvent_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ClearEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ClearEvent_ExpectRow* cmock_rows, size_t cmock_count);
+#define WaitEvent_Expect(A) TEST_FAIL_MESSAGE("WaitEvent requires _ExpectAndReturn");
+#define WaitEvent_ExpectAndReturn(A, cmock_retval) WaitEvent_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void WaitEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, EventMaskType A, StatusType cmock_to_return);
+typedef struct _CMOCK_WaitEvent_EXPECT_ROW
+{
+  EventMaskType A;
+  StatusType ReturnVal;
+} WaitEvent_ExpectRow;
+#define WaitEvent_ExpectTable(cmock_rows, cmock_count) WaitEvent_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void WaitEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const WaitEvent_ExpectRow* cmock_rows, size_t cmock_count);
+#define GetEvent_Expect(A, B) TEST_FAIL_MESSAGE("GetEvent requires _ExpectAndReturn");
+#define GetEvent_ExpectAndReturn(A, B, cmock_retval) GetEvent_CMockExpectAndReturn(__LINE__, A, B, cmock_retval)
+void GetEvent_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TaskType A, EventMaskRefType B, StatusType cmock_to_return);
+typedef struct _CMOCK_GetEvent_EXPECT_ROW
+{
+  TaskType A;
+  EventMaskRefType B;
+  StatusType ReturnVal;
+} GetEvent_ExpectRow;
+#define GetEvent_ExpectTable(cmock_rows, cmock_count) GetEvent_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetEvent_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetEvent_ExpectRow* cmock_rows, size_t cmock_count);
+#define GetAlarm_Expect(A, B) TEST_FAIL_MESSAGE("GetAlarm requires _ExpectAndReturn");
+#define GetAlarm_ExpectAndReturn(A, B, cmock_retval) GetAlarm_CMockExpectAndReturn(__LINE__, A, B, cmock_retval)
+void GetAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, TickRefType B, StatusType cmock_to_return);
+typedef struct _CMOCK_GetAlarm_EXPECT_ROW
+{
+  AlarmType A;
+  TickRefType B;
+  StatusType ReturnVal;
+} GetAlarm_ExpectRow;
+#define GetAlarm_ExpectTable(cmock_rows, cmock_count) GetAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define GetAlarmBase_Expect(A, B) TEST_FAIL_MESSAGE("GetAlarmBase requires _ExpectAndReturn");
+#define GetAlarmBase_ExpectAndReturn(A, B, cmock_retval) GetAlarmBase_CMockExpectAndReturn(__LINE__, A, B, cmock_retval)
+void GetAlarmBase_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, AlarmBaseRefType B, StatusType cmock_to_return);
+typedef struct _CMOCK_GetAlarmBase_EXPECT_ROW
+{
+  AlarmType A;
+  AlarmBaseRefType B;
+  StatusType ReturnVal;
+} GetAlarmBase_ExpectRow;
+#define GetAlarmBase_ExpectTable(cmock_rows, cmock_count) GetAlarmBase_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void GetAlarmBase_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const GetAlarmBase_ExpectRow* cmock_rows, size_t cmock_count);
+#define SetRelAlarm_Expect(A, B, C) TEST_FAIL_MESSAGE("SetRelAlarm requires _ExpectAndReturn");
+#define SetRelAlarm_ExpectAndReturn(A, B, C, cmock_retval) SetRelAlarm_CMockExpectAndReturn(__LINE__, A, B, C, cmock_retval)
+void SetRelAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, TickType B, TickType C, StatusType cmock_to_return);
+typedef struct _CMOCK_SetRelAlarm_EXPECT_ROW
+{
+  AlarmType A;
+  TickType B;
+  TickType C;
+  StatusType ReturnVal;
+} SetRelAlarm_ExpectRow;
+#define SetRelAlarm_ExpectTable(cmock_rows, cmock_count) SetRelAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void SetRelAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const SetRelAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define SetAbsAlarm_Expect(A, B, C) TEST_FAIL_MESSAGE("SetAbsAlarm requires _ExpectAndReturn");
+#define SetAbsAlarm_ExpectAndReturn(A, B, C, cmock_retval) SetAbsAlarm_CMockExpectAndReturn(__LINE__, A, B, C, cmock_retval)
+void SetAbsAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, TickType B, TickType C, StatusType cmock_to_return);
+typedef struct _CMOCK_SetAbsAlarm_EXPECT_ROW
+{
+  AlarmType A;
+  TickType B;
+  TickType C;
+  StatusType ReturnVal;
+} SetAbsAlarm_ExpectRow;
+#define SetAbsAlarm_ExpectTable(cmock_rows, cmock_count) SetAbsAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void SetAbsAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const SetAbsAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define CancelAlarm_Expect(A) TEST_FAIL_MESSAGE("CancelAlarm requires _ExpectAndReturn");
+#define CancelAlarm_ExpectAndReturn(A, cmock_retval) CancelAlarm_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void CancelAlarm_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, AlarmType A, StatusType cmock_to_return);
+typedef struct _CMOCK_CancelAlarm_EXPECT_ROW
+{
+  AlarmType A;
+  StatusType ReturnVal;
+} CancelAlarm_ExpectRow;
+#define CancelAlarm_ExpectTable(cmock_rows, cmock_count) CancelAlarm_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void CancelAlarm_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const CancelAlarm_ExpectRow* cmock_rows, size_t cmock_count);
+#define AdvCntr_Expect(A) TEST_FAIL_MESSAGE("AdvCntr requires _ExpectAndReturn");
+#define AdvCntr_ExpectAndReturn(A, cmock_retval) AdvCntr_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void AdvCntr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, CounterType A, StatusType cmock_to_return);
+typedef struct _CMOCK_AdvCntr_EXPECT_ROW
+{
+  CounterType A;
+  StatusType ReturnVal;
+} AdvCntr_ExpectRow;
+#define AdvCntr_ExpectTable(cmock_rows, cmock_count) AdvCntr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void AdvCntr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const AdvCntr_ExpectRow* cmock_rows, size_t cmock_count);
+#define IAdvCntr_Expect(A) TEST_FAIL_MESSAGE("IAdvCntr requires _ExpectAndReturn");
+#define IAdvCntr_ExpectAndReturn(A, cmock_retval) IAdvCntr_CMockExpectAndReturn(__LINE__, A, cmock_retval)
+void IAdvCntr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, CounterType A, StatusType cmock_to_return);
+typedef struct _CMOCK_IAdvCntr_EXPECT_ROW
+{
+  CounterType A;
+  StatusType ReturnVal;
+} IAdvCntr_ExpectRow;
+#define IAdvCntr_ExpectTable(cmock_rows, cmock_count) IAdvCntr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void IAdvCntr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const IAdvCntr_ExpectRow* cmock_rows, size_t cmock_count);
+#define SuspendOSInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("SuspendOSInterrupts requires _Expect (not AndReturn)");
+#define SuspendOSInterrupts_Expect() SuspendOSInterrupts_CMockExpect(__LINE__)
+void SuspendOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define ResumeOSInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ResumeOSInterrupts requires _Expect (not AndReturn)");
+#define ResumeOSInterrupts_Expect() ResumeOSInterrupts_CMockExpect(__LINE__)
+void ResumeOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define SuspendAllInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("SuspendAllInterrupts requires _Expect (not AndReturn)");
+#define SuspendAllInterrupts_Expect() SuspendAllInterrupts_CMockExpect(__LINE__)
+void SuspendAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define ResumeAllInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ResumeAllInterrupts requires _Expect (not AndReturn)");
+#define ResumeAllInterrupts_Expect() ResumeAllInterrupts_CMockExpect(__LINE__)
+void ResumeAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define DisableAllInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("DisableAllInterrupts requires _Expect (not AndReturn)");
+#define DisableAllInterrupts_Expect() DisableAllInterrupts_CMockExpect(__LINE__)
+void DisableAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define EnableAllInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("EnableAllInterrupts requires _Expect (not AndReturn)");
+#define EnableAllInterrupts_Expect() EnableAllInterrupts_CMockExpect(__LINE__)
+void EnableAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSDisable_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSDisable requires _Expect (not AndReturn)");
+#define OSEKOSDisable_Expect() OSEKOSDisable_CMockExpect(__LINE__)
+void OSEKOSDisable_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSEnable_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSEnable requires _Expect (not AndReturn)");
+#define OSEKOSEnable_Expect() OSEKOSEnable_CMockExpect(__LINE__)
+void OSEKOSEnable_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSAsmIDispatch_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSAsmIDispatch requires _Expect (not AndReturn)");
+#define OSEKOSAsmIDispatch_Expect(cmock_arg1) OSEKOSAsmIDispatch_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSAsmIDispatch_CMockExpect(UNITY_LINE_TYPE cmock_line, unsigned long* cmock_arg1);
+typedef struct _CMOCK_OSEKOSAsmIDispatch_EXPECT_ROW
+{
+  unsigned long* cmock_arg1;
+} OSEKOSAsmIDispatch_ExpectRow;
+#define OSEKOSAsmIDispatch_ExpectTable(cmock_rows, cmock_count) OSEKOSAsmIDispatch_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSAsmIDispatch_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSAsmIDispatch_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSAsmDispatch_ExpectAndReturn(p, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSAsmDispatch requires _Expect (not AndReturn)");
+#define OSEKOSAsmDispatch_Expect(p) OSEKOSAsmDispatch_CMockExpect(__LINE__, p)
+void OSEKOSAsmDispatch_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSPrioType p);
+typedef struct _CMOCK_OSEKOSAsmDispatch_EXPECT_ROW
+{
+  OSEKOSPrioType p;
+} OSEKOSAsmDispatch_ExpectRow;
+#define OSEKOSAsmDispatch_ExpectTable(cmock_rows, cmock_count) OSEKOSAsmDispatch_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSAsmDispatch_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSAsmDispatch_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSStartupEnable_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSStartupEnable requires _Expect (not AndReturn)");
+#define OSEKOSStartupEnable_Expect() OSEKOSStartupEnable_CMockExpect(__LINE__)
+void OSEKOSStartupEnable_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSNop_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSNop requires _Expect (not AndReturn)");
+#define OSEKOSNop_Expect() OSEKOSNop_CMockExpect(__LINE__)
+void OSEKOSNop_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSV850CheckIsrSwitch_Expect() TEST_FAIL_MESSAGE("OSEKOSV850CheckIsrSwitch requires _ExpectAndReturn");
+#define OSEKOSV850CheckIsrSwitch_ExpectAndReturn(cmock_retval) OSEKOSV850CheckIsrSwitch_CMockExpectAndReturn(__LINE__, cmock_retval)
+void OSEKOSV850CheckIsrSwitch_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int cmock_to_return);
+typedef struct _CMOCK_OSEKOSV850CheckIsrSwitch_EXPECT_ROW
+{
+  unsigned int ReturnVal;
+} OSEKOSV850CheckIsrSwitch_ExpectRow;
+#define OSEKOSV850CheckIsrSwitch_ExpectTable(cmock_rows, cmock_count) OSEKOSV850CheckIsrSwitch_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850CheckIsrSwitch_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850CheckIsrSwitch_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSV850InitInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850InitInterrupts requires _Expect (not AndReturn)");
+#define OSEKOSV850InitInterrupts_Expect() OSEKOSV850InitInterrupts_CMockExpect(__LINE__)
+void OSEKOSV850InitInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSV850SetupInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850SetupInterrupts requires _Expect (not AndReturn)");
+#define OSEKOSV850SetupInterrupts_Expect() OSEKOSV850SetupInterrupts_CMockExpect(__LINE__)
+void OSEKOSV850SetupInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSV850SyncContextLoad_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850SyncContextLoad requires _Expect (not AndReturn)");
+#define OSEKOSV850SyncContextLoad_Expect(cmock_arg1) OSEKOSV850SyncContextLoad_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSV850SyncContextLoad_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1);
+typedef struct _CMOCK_OSEKOSV850SyncContextLoad_EXPECT_ROW
+{
+  OSEKOSSaveType cmock_arg1;
+} OSEKOSV850SyncContextLoad_ExpectRow;
+#define OSEKOSV850SyncContextLoad_ExpectTable(cmock_rows, cmock_count) OSEKOSV850SyncContextLoad_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850SyncContextLoad_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850SyncContextLoad_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSV850SyncContextLoadFromIRQ_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850SyncContextLoadFromIRQ requires _Expect (not AndReturn)");
+#define OSEKOSV850SyncContextLoadFromIRQ_Expect(cmock_arg1) OSEKOSV850SyncContextLoadFromIRQ_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSV850SyncContextLoadFromIRQ_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1);
+typedef struct _CMOCK_OSEKOSV850SyncContextLoadFromIRQ_EXPECT_ROW
+{
+  OSEKOSSaveType cmock_arg1;
+} OSEKOSV850SyncContextLoadFromIRQ_ExpectRow;
+#define OSEKOSV850SyncContextLoadFromIRQ_ExpectTable(cmock_rows, cmock_count) OSEKOSV850SyncContextLoadFromIRQ_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850SyncContextLoadFromIRQ_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850SyncContextLoadFromIRQ_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSV850ASyncContextLoad_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850ASyncContextLoad requires _Expect (not AndReturn)");
+#define OSEKOSV850ASyncContextLoad_Expect(cmock_arg1) OSEKOSV850ASyncContextLoad_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSV850ASyncContextLoad_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1);
+typedef struct _CMOCK_OSEKOSV850ASyncContextLoad_EXPECT_ROW
+{
+  OSEKOSSaveType cmock_arg1;
+} OSEKOSV850ASyncContextLoad_ExpectRow;
+#define OSEKOSV850ASyncContextLoad_ExpectTable(cmock_rows, cmock_count) OSEKOSV850ASyncContextLoad_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850ASyncContextLoad_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850ASyncContextLoad_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSV850ASyncContextLoadFromIRQ_ExpectAndReturn(cmock_arg1, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850ASyncContextLoadFromIRQ requires _Expect (not AndReturn)");
+#define OSEKOSV850ASyncContextLoadFromIRQ_Expect(cmock_arg1) OSEKOSV850ASyncContextLoadFromIRQ_CMockExpect(__LINE__, cmock_arg1)
+void OSEKOSV850ASyncContextLoadFromIRQ_CMockExpect(UNITY_LINE_TYPE cmock_line, OSEKOSSaveType cmock_arg1);
+typedef struct _CMOCK_OSEKOSV850ASyncContextLoadFromIRQ_EXPECT_ROW
+{
+  OSEKOSSaveType cmock_arg1;
+} OSEKOSV850ASyncContextLoadFromIRQ_ExpectRow;
+#define OSEKOSV850ASyncContextLoadFromIRQ_ExpectTable(cmock_rows, cmock_count) OSEKOSV850ASyncContextLoadFromIRQ_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850ASyncContextLoadFromIRQ_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850ASyncContextLoadFromIRQ_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSV850StartContext_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850StartContext requires _Expect (not AndReturn)");
+#define OSEKOSV850StartContext_Expect(cmock_arg1, cmock_arg2) OSEKOSV850StartContext_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void OSEKOSV850StartContext_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_osek_func_ptr1 const cmock_arg1, OSEK_U8* const cmock_arg2);
+typedef struct _CMOCK_OSEKOSV850StartContext_EXPECT_ROW
+{
+  cmock_osek_func_ptr1 cmock_arg1;
+  OSEK_U8* cmock_arg2;
+} OSEKOSV850StartContext_ExpectRow;
+#define OSEKOSV850StartContext_ExpectTable(cmock_rows, cmock_count) OSEKOSV850StartContext_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850StartContext_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850StartContext_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSV850StartContextFromIRQ_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSV850StartContextFromIRQ requires _Expect (not AndReturn)");
+#define OSEKOSV850StartContextFromIRQ_Expect(cmock_arg1, cmock_arg2) OSEKOSV850StartContextFromIRQ_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void OSEKOSV850StartContextFromIRQ_CMockExpect(UNITY_LINE_TYPE cmock_line, cmock_osek_func_ptr2 const cmock_arg1, OSEK_U8* const cmock_arg2);
+typedef struct _CMOCK_OSEKOSV850StartContextFromIRQ_EXPECT_ROW
+{
+  cmock_osek_func_ptr2 cmock_arg1;
+  OSEK_U8* cmock_arg2;
+} OSEKOSV850StartContextFromIRQ_ExpectRow;
+#define OSEKOSV850StartContextFromIRQ_ExpectTable(cmock_rows, cmock_count) OSEKOSV850StartContextFromIRQ_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSV850StartContextFromIRQ_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSV850StartContextFromIRQ_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSSuspendOSInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSSuspendOSInterrupts requires _Expect (not AndReturn)");
+#define OSEKOSSuspendOSInterrupts_Expect() OSEKOSSuspendOSInterrupts_CMockExpect(__LINE__)
+void OSEKOSSuspendOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSResumeOSInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSResumeOSInterrupts requires _Expect (not AndReturn)");
+#define OSEKOSResumeOSInterrupts_Expect() OSEKOSResumeOSInterrupts_CMockExpect(__LINE__)
+void OSEKOSResumeOSInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSSuspendAllInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSSuspendAllInterrupts requires _Expect (not AndReturn)");
+#define OSEKOSSuspendAllInterrupts_Expect() OSEKOSSuspendAllInterrupts_CMockExpect(__LINE__)
+void OSEKOSSuspendAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSResumeAllInterrupts_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSResumeAllInterrupts requires _Expect (not AndReturn)");
+#define OSEKOSResumeAllInterrupts_Expect() OSEKOSResumeAllInterrupts_CMockExpect(__LINE__)
+void OSEKOSResumeAllInterrupts_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOScheckSuspendResumeNesting_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOScheckSuspendResumeNesting requires _Expect (not AndReturn)");
+#define OSEKOScheckSuspendResumeNesting_Expect() OSEKOScheckSuspendResumeNesting_CMockExpect(__LINE__)
+void OSEKOScheckSuspendResumeNesting_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSgetSR_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("OSEKOSgetSR requires _Expect (not AndReturn)");
+#define OSEKOSgetSR_Expect() OSEKOSgetSR_CMockExpect(__LINE__)
+void OSEKOSgetSR_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define OSEKOSEnableInterrupt_intern_ExpectAndReturn(nr, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSEnableInterrupt_intern requires _Expect (not AndReturn)");
+#define OSEKOSEnableInterrupt_intern_Expect(nr) OSEKOSEnableInterrupt_intern_CMockExpect(__LINE__, nr)
+void OSEKOSEnableInterrupt_intern_CMockExpect(UNITY_LINE_TYPE cmock_line, int nr);
+typedef struct _CMOCK_OSEKOSEnableInterrupt_intern_EXPECT_ROW
+{
+  int nr;
+} OSEKOSEnableInterrupt_intern_ExpectRow;
+#define OSEKOSEnableInterrupt_intern_ExpectTable(cmock_rows, cmock_count) OSEKOSEnableInterrupt_intern_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSEnableInterrupt_intern_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSEnableInterrupt_intern_ExpectRow* cmock_rows, size_t cmock_count);
+#define OSEKOSDisableInterrupt_intern_ExpectAndReturn(nr, cmock_retval) TEST_FAIL_MESSAGE("OSEKOSDisableInterrupt_intern requires _Expect (not AndReturn)");
+#define OSEKOSDisableInterrupt_intern_Expect(nr) OSEKOSDisableInterrupt_intern_CMockExpect(__LINE__, nr)
+void OSEKOSDisableInterrupt_intern_CMockExpect(UNITY_LINE_TYPE cmock_line, int nr);
+typedef struct _CMOCK_OSEKOSDisableInterrupt_intern_EXPECT_ROW
+{
+  int nr;
+} OSEKOSDisableInterrupt_intern_ExpectRow;
+#define OSEKOSDisableInterrupt_intern_ExpectTable(cmock_rows, cmock_count) OSEKOSDisableInterrupt_intern_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void OSEKOSDisableInterrupt_intern_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const OSEKOSDisableInterrupt_intern_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
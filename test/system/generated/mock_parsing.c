@@ -0,0 +1,1267 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_parsing.h"
+
+static const char* CMockString_I2CIntRegister = "I2CIntRegister";
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_cmock_arg1 = "cmock_arg1";
+static const char* CMockString_cmock_arg2 = "cmock_arg2";
+static const char* CMockString_cmock_arg3 = "cmock_arg3";
+static const char* CMockString_cmock_arg4 = "cmock_arg4";
+static const char* CMockString_cmock_arg5 = "cmock_arg5";
+static const char* CMockString_cmock_arg6 = "cmock_arg6";
+static const char* CMockString_cmock_arg7 = "cmock_arg7";
+static const char* CMockString_cmock_arg8 = "cmock_arg8";
+static const char* CMockString_cmock_arg9 = "cmock_arg9";
+static const char* CMockString_crazy_multiline = "crazy_multiline";
+static const char* CMockString_crazy_whitespace = "crazy_whitespace";
+static const char* CMockString_example_c99_type = "example_c99_type";
+static const char* CMockString_lint = "lint";
+static const char* CMockString_num = "num";
+static const char* CMockString_param1 = "param1";
+static const char* CMockString_pfnHandler = "pfnHandler";
+static const char* CMockString_ptr_ptr_return1 = "ptr_ptr_return1";
+static const char* CMockString_ptr_ptr_return2 = "ptr_ptr_return2";
+static const char* CMockString_ptr_ptr_return3 = "ptr_ptr_return3";
+static const char* CMockString_ptr_ptr_return4 = "ptr_ptr_return4";
+static const char* CMockString_ptr_return1 = "ptr_return1";
+static const char* CMockString_ptr_return2 = "ptr_return2";
+static const char* CMockString_ptr_return3 = "ptr_return3";
+static const char* CMockString_shot = "shot";
+static const char* CMockString_stack = "stack";
+static const char* CMockString_stuff = "stuff";
+static const char* CMockString_ui32Base = "ui32Base";
+static const char* CMockString_var_args1 = "var_args1";
+static const char* CMockString_var_args2 = "var_args2";
+static const char* CMockString_void_type_craziness1 = "void_type_craziness1";
+static const char* CMockString_void_type_craziness2 = "void_type_craziness2";
+
+typedef struct _CMOCK_var_args1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_a;
+
+} CMOCK_var_args1_CALL_INSTANCE;
+
+typedef struct _CMOCK_var_args2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_a;
+  int Expected_b;
+
+} CMOCK_var_args2_CALL_INSTANCE;
+
+typedef struct _CMOCK_void_type_craziness1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_cmock_arg1;
+  float Expected_cmock_arg2;
+  double Expected_cmock_arg3;
+  char Expected_cmock_arg4;
+  short Expected_cmock_arg5;
+  long Expected_cmock_arg6;
+  long int Expected_cmock_arg7;
+  long long Expected_cmock_arg8;
+  void* Expected_cmock_arg9;
+
+} CMOCK_void_type_craziness1_CALL_INSTANCE;
+
+typedef struct _CMOCK_void_type_craziness2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_void_type_craziness2_CALL_INSTANCE;
+
+typedef struct _CMOCK_crazy_whitespace_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_lint;
+  double Expected_shot;
+  short Expected_stack;
+
+} CMOCK_crazy_whitespace_CALL_INSTANCE;
+
+typedef struct _CMOCK_crazy_multiline_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ReturnVal;
+  int Expected_a;
+  unsigned int Expected_b;
+
+} CMOCK_crazy_multiline_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_return1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  U16* ReturnVal;
+  int Expected_a;
+
+} CMOCK_ptr_return1_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_return2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  U16* ReturnVal;
+  int Expected_a;
+
+} CMOCK_ptr_return2_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_return3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  U16* ReturnVal;
+  int Expected_a;
+
+} CMOCK_ptr_return3_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return1_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return2_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return3_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return4_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return4_CALL_INSTANCE;
+
+typedef struct _CMOCK_example_c99_type_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int32_t ReturnVal;
+  int32_t Expected_param1;
+
+} CMOCK_example_c99_type_CALL_INSTANCE;
+
+typedef struct _CMOCK_I2CIntRegister_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  uint32_t Expected_ui32Base;
+  cmock_parsing_func_ptr1 Expected_pfnHandler;
+
+} CMOCK_I2CIntRegister_CALL_INSTANCE;
+
+typedef struct _CMOCK_stuff_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int Expected_num;
+
+} CMOCK_stuff_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_parsingInstance
+{
+  CMOCK_MEM_INDEX_TYPE var_args1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE var_args2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE void_type_craziness1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE void_type_craziness2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE crazy_whitespace_CallInstance;
+  CMOCK_MEM_INDEX_TYPE crazy_multiline_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_return1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_return2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_return3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return4_CallInstance;
+  CMOCK_MEM_INDEX_TYPE example_c99_type_CallInstance;
+  CMOCK_MEM_INDEX_TYPE I2CIntRegister_CallInstance;
+  CMOCK_MEM_INDEX_TYPE stuff_CallInstance;
+} Mock;
+
+
+void mock_parsing_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.var_args1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_var_args1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.var_args2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_var_args2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.void_type_craziness1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_void_type_craziness1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.void_type_craziness2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_void_type_craziness2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.crazy_whitespace_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_crazy_whitespace);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.crazy_multiline_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_crazy_multiline);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_return1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_return1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_return2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_return2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_return3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_return3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return4_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return4);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.example_c99_type_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_example_c99_type);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.I2CIntRegister_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_I2CIntRegister);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.stuff_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_stuff);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_parsing_Init(void)
+{
+  mock_parsing_Destroy();
+}
+
+void mock_parsing_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void var_args1(int a, ...)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_var_args1);
+  cmock_call_instance = (CMOCK_var_args1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.var_args1_CallInstance);
+  Mock.var_args1_CallInstance = CMock_Guts_MemNext(Mock.var_args1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_var_args1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_var_args1(CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_var_args1(CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void var_args1_CMockExpect(UNITY_LINE_TYPE cmock_line, int a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_var_args1_CALL_INSTANCE));
+  CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance = (CMOCK_var_args1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.var_args1_CallInstance = CMock_Guts_MemChain(Mock.var_args1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_var_args1(cmock_call_instance, a);
+}
+
+void var_args1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_var_args1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.var_args1_CallInstance = CMock_Guts_MemChain(Mock.var_args1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_var_args1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_var_args1(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void var_args2(int a, int b, ...)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_var_args2);
+  cmock_call_instance = (CMOCK_var_args2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.var_args2_CallInstance);
+  Mock.var_args2_CallInstance = CMock_Guts_MemNext(Mock.var_args2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_var_args2,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_var_args2,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_var_args2(CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance, int a, int b);
+void CMockExpectParameters_var_args2(CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance, int a, int b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void var_args2_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, int b)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_var_args2_CALL_INSTANCE));
+  CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance = (CMOCK_var_args2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.var_args2_CallInstance = CMock_Guts_MemChain(Mock.var_args2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_var_args2(cmock_call_instance, a, b);
+}
+
+void var_args2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_var_args2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.var_args2_CallInstance = CMock_Guts_MemChain(Mock.var_args2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_var_args2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_var_args2(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void void_type_craziness1(int cmock_arg1, float cmock_arg2, double cmock_arg3, char cmock_arg4, short cmock_arg5, long cmock_arg6, long int cmock_arg7, long long cmock_arg8, void* cmock_arg9)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_void_type_craziness1);
+  cmock_call_instance = (CMOCK_void_type_craziness1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.void_type_craziness1_CallInstance);
+  Mock.void_type_craziness1_CallInstance = CMock_Guts_MemNext(Mock.void_type_craziness1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_cmock_arg1, cmock_arg1, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_FLOAT(cmock_call_instance->Expected_cmock_arg2, cmock_arg2, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg3);
+    UNITY_TEST_ASSERT_EQUAL_FLOAT(cmock_call_instance->Expected_cmock_arg3, cmock_arg3, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg4);
+    UNITY_TEST_ASSERT_EQUAL_INT8(cmock_call_instance->Expected_cmock_arg4, cmock_arg4, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg5);
+    UNITY_TEST_ASSERT_EQUAL_INT16(cmock_call_instance->Expected_cmock_arg5, cmock_arg5, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg6);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_cmock_arg6, cmock_arg6, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg7);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg7), (void*)(&cmock_arg7), sizeof(long int), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg8);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg8), (void*)(&cmock_arg8), sizeof(long long), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_cmock_arg9);
+    if (cmock_call_instance->Expected_cmock_arg9 == NULL)
+      { UNITY_TEST_ASSERT_NULL(cmock_arg9, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX8_ARRAY(cmock_call_instance->Expected_cmock_arg9, cmock_arg9, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_void_type_craziness1(CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance, int cmock_arg1, float cmock_arg2, double cmock_arg3, char cmock_arg4, short cmock_arg5, long cmock_arg6, long int cmock_arg7, long long cmock_arg8, void* cmock_arg9);
+void CMockExpectParameters_void_type_craziness1(CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance, int cmock_arg1, float cmock_arg2, double cmock_arg3, char cmock_arg4, short cmock_arg5, long cmock_arg6, long int cmock_arg7, long long cmock_arg8, void* cmock_arg9)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+  cmock_call_instance->Expected_cmock_arg2 = cmock_arg2;
+  cmock_call_instance->Expected_cmock_arg3 = cmock_arg3;
+  cmock_call_instance->Expected_cmock_arg4 = cmock_arg4;
+  cmock_call_instance->Expected_cmock_arg5 = cmock_arg5;
+  cmock_call_instance->Expected_cmock_arg6 = cmock_arg6;
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg7), (void*)(&cmock_arg7),
+         sizeof(long int[sizeof(cmock_arg7) == sizeof(long int) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg8), (void*)(&cmock_arg8),
+         sizeof(long long[sizeof(cmock_arg8) == sizeof(long long) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  cmock_call_instance->Expected_cmock_arg9 = cmock_arg9;
+}
+
+void void_type_craziness1_CMockExpect(UNITY_LINE_TYPE cmock_line, int cmock_arg1, float cmock_arg2, double cmock_arg3, char cmock_arg4, short cmock_arg5, long cmock_arg6, long int cmock_arg7, long long cmock_arg8, void* cmock_arg9)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_void_type_craziness1_CALL_INSTANCE));
+  CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance = (CMOCK_void_type_craziness1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.void_type_craziness1_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_void_type_craziness1(cmock_call_instance, cmock_arg1, cmock_arg2, cmock_arg3, cmock_arg4, cmock_arg5, cmock_arg6, cmock_arg7, cmock_arg8, cmock_arg9);
+}
+
+void void_type_craziness1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_void_type_craziness1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.void_type_craziness1_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_void_type_craziness1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_void_type_craziness1(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2, cmock_rows[cmock_row].cmock_arg3, cmock_rows[cmock_row].cmock_arg4, cmock_rows[cmock_row].cmock_arg5, cmock_rows[cmock_row].cmock_arg6, cmock_rows[cmock_row].cmock_arg7, cmock_rows[cmock_row].cmock_arg8, cmock_rows[cmock_row].cmock_arg9);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int void_type_craziness2(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_void_type_craziness2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_void_type_craziness2);
+  cmock_call_instance = (CMOCK_void_type_craziness2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.void_type_craziness2_CallInstance);
+  Mock.void_type_craziness2_CallInstance = CMock_Guts_MemNext(Mock.void_type_craziness2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void void_type_craziness2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_void_type_craziness2_CALL_INSTANCE));
+  CMOCK_void_type_craziness2_CALL_INSTANCE* cmock_call_instance = (CMOCK_void_type_craziness2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.void_type_craziness2_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void void_type_craziness2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_void_type_craziness2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_void_type_craziness2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.void_type_craziness2_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_void_type_craziness2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void crazy_whitespace(int lint, double shot, short stack)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_crazy_whitespace_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_crazy_whitespace);
+  cmock_call_instance = (CMOCK_crazy_whitespace_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.crazy_whitespace_CallInstance);
+  Mock.crazy_whitespace_CallInstance = CMock_Guts_MemNext(Mock.crazy_whitespace_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_whitespace,CMockString_lint);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_lint, lint, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_whitespace,CMockString_shot);
+    UNITY_TEST_ASSERT_EQUAL_FLOAT(cmock_call_instance->Expected_shot, shot, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_whitespace,CMockString_stack);
+    UNITY_TEST_ASSERT_EQUAL_INT16(cmock_call_instance->Expected_stack, stack, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_crazy_whitespace(CMOCK_crazy_whitespace_CALL_INSTANCE* cmock_call_instance, int lint, double shot, short stack);
+void CMockExpectParameters_crazy_whitespace(CMOCK_crazy_whitespace_CALL_INSTANCE* cmock_call_instance, int lint, double shot, short stack)
+{
+  cmock_call_instance->Expected_lint = lint;
+  cmock_call_instance->Expected_shot = shot;
+  cmock_call_instance->Expected_stack = stack;
+}
+
+void crazy_whitespace_CMockExpect(UNITY_LINE_TYPE cmock_line, int lint, double shot, short stack)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_crazy_whitespace_CALL_INSTANCE));
+  CMOCK_crazy_whitespace_CALL_INSTANCE* cmock_call_instance = (CMOCK_crazy_whitespace_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.crazy_whitespace_CallInstance = CMock_Guts_MemChain(Mock.crazy_whitespace_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_crazy_whitespace(cmock_call_instance, lint, shot, stack);
+}
+
+void crazy_whitespace_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const crazy_whitespace_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_crazy_whitespace_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_crazy_whitespace_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.crazy_whitespace_CallInstance = CMock_Guts_MemChain(Mock.crazy_whitespace_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_crazy_whitespace_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_crazy_whitespace(cmock_call_instance, cmock_rows[cmock_row].lint, cmock_rows[cmock_row].shot, cmock_rows[cmock_row].stack);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+char crazy_multiline(int a, unsigned int b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_crazy_multiline);
+  cmock_call_instance = (CMOCK_crazy_multiline_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.crazy_multiline_CallInstance);
+  Mock.crazy_multiline_CallInstance = CMock_Guts_MemNext(Mock.crazy_multiline_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_multiline,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_multiline,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_HEX32(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_crazy_multiline(CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance, int a, unsigned int b);
+void CMockExpectParameters_crazy_multiline(CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance, int a, unsigned int b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void crazy_multiline_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, unsigned int b, char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_crazy_multiline_CALL_INSTANCE));
+  CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance = (CMOCK_crazy_multiline_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.crazy_multiline_CallInstance = CMock_Guts_MemChain(Mock.crazy_multiline_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_crazy_multiline(cmock_call_instance, a, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void crazy_multiline_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const crazy_multiline_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_crazy_multiline_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.crazy_multiline_CallInstance = CMock_Guts_MemChain(Mock.crazy_multiline_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_crazy_multiline_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_crazy_multiline(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+U16* ptr_return1(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_return1);
+  cmock_call_instance = (CMOCK_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_return1_CallInstance);
+  Mock.ptr_return1_CallInstance = CMock_Guts_MemNext(Mock.ptr_return1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_return1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_return1(CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_ptr_return1(CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_return1_CALL_INSTANCE));
+  CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_return1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_return1(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_return1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_return1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_return1(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+U16* ptr_return2(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_return2);
+  cmock_call_instance = (CMOCK_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_return2_CallInstance);
+  Mock.ptr_return2_CallInstance = CMock_Guts_MemNext(Mock.ptr_return2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_return2,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_return2(CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_ptr_return2(CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_return2_CALL_INSTANCE));
+  CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_return2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_return2(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_return2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_return2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_return2(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+U16* ptr_return3(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_return3);
+  cmock_call_instance = (CMOCK_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_return3_CallInstance);
+  Mock.ptr_return3_CallInstance = CMock_Guts_MemNext(Mock.ptr_return3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_return3,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_return3(CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_ptr_return3(CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_return3_CALL_INSTANCE));
+  CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_return3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_return3(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return3_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_return3_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_return3_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_return3(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return1(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return1);
+  cmock_call_instance = (CMOCK_ptr_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return1_CallInstance);
+  Mock.ptr_ptr_return1_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return1(CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return1(CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return1_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return1(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return1(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return2(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return2);
+  cmock_call_instance = (CMOCK_ptr_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return2_CallInstance);
+  Mock.ptr_ptr_return2_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return2,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return2(CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return2(CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return2_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return2(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return2(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return3(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return3);
+  cmock_call_instance = (CMOCK_ptr_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return3_CallInstance);
+  Mock.ptr_ptr_return3_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return3,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return3(CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return3(CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return3_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return3(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return3_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return3_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return3_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return3(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return4(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return4);
+  cmock_call_instance = (CMOCK_ptr_ptr_return4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return4_CallInstance);
+  Mock.ptr_ptr_return4_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return4_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return4,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return4(CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return4(CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return4_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return4_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return4_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return4_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return4(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return4_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return4_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return4_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return4_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return4_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return4(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int32_t example_c99_type(int32_t param1)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_example_c99_type_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_example_c99_type);
+  cmock_call_instance = (CMOCK_example_c99_type_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.example_c99_type_CallInstance);
+  Mock.example_c99_type_CallInstance = CMock_Guts_MemNext(Mock.example_c99_type_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_example_c99_type,CMockString_param1);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_param1, param1, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_example_c99_type(CMOCK_example_c99_type_CALL_INSTANCE* cmock_call_instance, int32_t param1);
+void CMockExpectParameters_example_c99_type(CMOCK_example_c99_type_CALL_INSTANCE* cmock_call_instance, int32_t param1)
+{
+  cmock_call_instance->Expected_param1 = param1;
+}
+
+void example_c99_type_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int32_t param1, int32_t cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_example_c99_type_CALL_INSTANCE));
+  CMOCK_example_c99_type_CALL_INSTANCE* cmock_call_instance = (CMOCK_example_c99_type_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.example_c99_type_CallInstance = CMock_Guts_MemChain(Mock.example_c99_type_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_example_c99_type(cmock_call_instance, param1);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void example_c99_type_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const example_c99_type_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_example_c99_type_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_example_c99_type_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.example_c99_type_CallInstance = CMock_Guts_MemChain(Mock.example_c99_type_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_example_c99_type_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_example_c99_type(cmock_call_instance, cmock_rows[cmock_row].param1);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void I2CIntRegister(uint32_t ui32Base, cmock_parsing_func_ptr1 pfnHandler)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_I2CIntRegister_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_I2CIntRegister);
+  cmock_call_instance = (CMOCK_I2CIntRegister_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.I2CIntRegister_CallInstance);
+  Mock.I2CIntRegister_CallInstance = CMock_Guts_MemNext(Mock.I2CIntRegister_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_I2CIntRegister,CMockString_ui32Base);
+    UNITY_TEST_ASSERT_EQUAL_HEX32(cmock_call_instance->Expected_ui32Base, ui32Base, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_I2CIntRegister,CMockString_pfnHandler);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_pfnHandler, pfnHandler, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_I2CIntRegister(CMOCK_I2CIntRegister_CALL_INSTANCE* cmock_call_instance, uint32_t ui32Base, cmock_parsing_func_ptr1 pfnHandler);
+void CMockExpectParameters_I2CIntRegister(CMOCK_I2CIntRegister_CALL_INSTANCE* cmock_call_instance, uint32_t ui32Base, cmock_parsing_func_ptr1 pfnHandler)
+{
+  cmock_call_instance->Expected_ui32Base = ui32Base;
+  memcpy((void*)(&cmock_call_instance->Expected_pfnHandler), (void*)(&pfnHandler),
+         sizeof(cmock_parsing_func_ptr1[sizeof(pfnHandler) == sizeof(cmock_parsing_func_ptr1) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void I2CIntRegister_CMockExpect(UNITY_LINE_TYPE cmock_line, uint32_t ui32Base, cmock_parsing_func_ptr1 pfnHandler)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_I2CIntRegister_CALL_INSTANCE));
+  CMOCK_I2CIntRegister_CALL_INSTANCE* cmock_call_instance = (CMOCK_I2CIntRegister_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.I2CIntRegister_CallInstance = CMock_Guts_MemChain(Mock.I2CIntRegister_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_I2CIntRegister(cmock_call_instance, ui32Base, pfnHandler);
+}
+
+void I2CIntRegister_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const I2CIntRegister_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_I2CIntRegister_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_I2CIntRegister_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.I2CIntRegister_CallInstance = CMock_Guts_MemChain(Mock.I2CIntRegister_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_I2CIntRegister_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_I2CIntRegister(cmock_call_instance, cmock_rows[cmock_row].ui32Base, cmock_rows[cmock_row].pfnHandler);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+int stuff(int num)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_stuff_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_stuff);
+  cmock_call_instance = (CMOCK_stuff_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.stuff_CallInstance);
+  Mock.stuff_CallInstance = CMock_Guts_MemNext(Mock.stuff_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_stuff,CMockString_num);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_num, num, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_stuff(CMOCK_stuff_CALL_INSTANCE* cmock_call_instance, int num);
+void CMockExpectParameters_stuff(CMOCK_stuff_CALL_INSTANCE* cmock_call_instance, int num)
+{
+  cmock_call_instance->Expected_num = num;
+}
+
+void stuff_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int num, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_stuff_CALL_INSTANCE));
+  CMOCK_stuff_CALL_INSTANCE* cmock_call_instance = (CMOCK_stuff_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.stuff_CallInstance = CMock_Guts_MemChain(Mock.stuff_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_stuff(cmock_call_instance, num);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void stuff_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const stuff_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_stuff_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_stuff_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.stuff_CallInstance = CMock_Guts_MemChain(Mock.stuff_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_stuff_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_stuff(cmock_call_instance, cmock_rows[cmock_row].num);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
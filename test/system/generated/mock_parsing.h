@@ -0,0 +1,210 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_PARSING_H
+#define _MOCK_PARSING_H
+
+#include "unity.h"
+#include "parsing.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_parsing_Init(void);
+void mock_parsing_Destroy(void);
+void mock_parsing_Verify(void);
+
+
+typedef void(*cmock_parsing_func_ptr1)(void);
+
+
+#define var_args1_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("var_args1 requires _Expect (not AndReturn)");
+#define var_args1_Expect(a) var_args1_CMockExpect(__LINE__, a)
+void var_args1_CMockExpect(UNITY_LINE_TYPE cmock_line, int a);
+typedef struct _CMOCK_var_args1_EXPECT_ROW
+{
+  int a;
+} var_args1_ExpectRow;
+#define var_args1_ExpectTable(cmock_rows, cmock_count) var_args1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void var_args1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args1_ExpectRow* cmock_rows, size_t cmock_count);
+#define var_args2_ExpectAndReturn(a, b, cmock_retval) TEST_FAIL_MESSAGE("var_args2 requires _Expect (not AndReturn)");
+#define var_args2_Expect(a, b) var_args2_CMockExpect(__LINE__, a, b)
+void var_args2_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, int b);
+typedef struct _CMOCK_var_args2_EXPECT_ROW
+{
+  int a;
+  int b;
+} var_args2_ExpectRow;
+#define var_args2_ExpectTable(cmock_rows, cmock_count) var_args2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void var_args2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args2_ExpectRow* cmock_rows, size_t cmock_count);
+#define void_type_craziness1_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_arg3, cmock_arg4, cmock_arg5, cmock_arg6, cmock_arg7, cmock_arg8, cmock_arg9, cmock_retval) TEST_FAIL_MESSAGE("void_type_craziness1 requires _Expect (not AndReturn)");
+#define void_type_craziness1_Expect(cmock_arg1, cmock_arg2, cmock_arg3, cmock_arg4, cmock_arg5, cmock_arg6, cmock_arg7, cmock_arg8, cmock_arg9) void_type_craziness1_CMockExpect(__LINE__, cmock_arg1, cmock_arg2, cmock_arg3, cmock_arg4, cmock_arg5, cmock_arg6, cmock_arg7, cmock_arg8, cmock_arg9)
+void void_type_craziness1_CMockExpect(UNITY_LINE_TYPE cmock_line, int cmock_arg1, float cmock_arg2, double cmock_arg3, char cmock_arg4, short cmock_arg5, long cmock_arg6, long int cmock_arg7, long long cmock_arg8, void* cmock_arg9);
+typedef struct _CMOCK_void_type_craziness1_EXPECT_ROW
+{
+  int cmock_arg1;
+  float cmock_arg2;
+  double cmock_arg3;
+  char cmock_arg4;
+  short cmock_arg5;
+  long cmock_arg6;
+  long int cmock_arg7;
+  long long cmock_arg8;
+  void* cmock_arg9;
+} void_type_craziness1_ExpectRow;
+#define void_type_craziness1_ExpectTable(cmock_rows, cmock_count) void_type_craziness1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void void_type_craziness1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness1_ExpectRow* cmock_rows, size_t cmock_count);
+#define void_type_craziness2_Expect() TEST_FAIL_MESSAGE("void_type_craziness2 requires _ExpectAndReturn");
+#define void_type_craziness2_ExpectAndReturn(cmock_retval) void_type_craziness2_CMockExpectAndReturn(__LINE__, cmock_retval)
+void void_type_craziness2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_void_type_craziness2_EXPECT_ROW
+{
+  int ReturnVal;
+} void_type_craziness2_ExpectRow;
+#define void_type_craziness2_ExpectTable(cmock_rows, cmock_count) void_type_craziness2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void void_type_craziness2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness2_ExpectRow* cmock_rows, size_t cmock_count);
+#define crazy_whitespace_ExpectAndReturn(lint, shot, stack, cmock_retval) TEST_FAIL_MESSAGE("crazy_whitespace requires _Expect (not AndReturn)");
+#define crazy_whitespace_Expect(lint, shot, stack) crazy_whitespace_CMockExpect(__LINE__, lint, shot, stack)
+void crazy_whitespace_CMockExpect(UNITY_LINE_TYPE cmock_line, int lint, double shot, short stack);
+typedef struct _CMOCK_crazy_whitespace_EXPECT_ROW
+{
+  int lint;
+  double shot;
+  short stack;
+} crazy_whitespace_ExpectRow;
+#define crazy_whitespace_ExpectTable(cmock_rows, cmock_count) crazy_whitespace_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void crazy_whitespace_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const crazy_whitespace_ExpectRow* cmock_rows, size_t cmock_count);
+#define crazy_multiline_Expect(a, b) TEST_FAIL_MESSAGE("crazy_multiline requires _ExpectAndReturn");
+#define crazy_multiline_ExpectAndReturn(a, b, cmock_retval) crazy_multiline_CMockExpectAndReturn(__LINE__, a, b, cmock_retval)
+void crazy_multiline_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, unsigned int b, char cmock_to_return);
+typedef struct _CMOCK_crazy_multiline_EXPECT_ROW
+{
+  int a;
+  unsigned int b;
+  char ReturnVal;
+} crazy_multiline_ExpectRow;
+#define crazy_multiline_ExpectTable(cmock_rows, cmock_count) crazy_multiline_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void crazy_multiline_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const crazy_multiline_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_return1_Expect(a) TEST_FAIL_MESSAGE("ptr_return1 requires _ExpectAndReturn");
+#define ptr_return1_ExpectAndReturn(a, cmock_retval) ptr_return1_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return);
+typedef struct _CMOCK_ptr_return1_EXPECT_ROW
+{
+  int a;
+  U16* ReturnVal;
+} ptr_return1_ExpectRow;
+#define ptr_return1_ExpectTable(cmock_rows, cmock_count) ptr_return1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return1_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_return2_Expect(a) TEST_FAIL_MESSAGE("ptr_return2 requires _ExpectAndReturn");
+#define ptr_return2_ExpectAndReturn(a, cmock_retval) ptr_return2_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return);
+typedef struct _CMOCK_ptr_return2_EXPECT_ROW
+{
+  int a;
+  U16* ReturnVal;
+} ptr_return2_ExpectRow;
+#define ptr_return2_ExpectTable(cmock_rows, cmock_count) ptr_return2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return2_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_return3_Expect(a) TEST_FAIL_MESSAGE("ptr_return3 requires _ExpectAndReturn");
+#define ptr_return3_ExpectAndReturn(a, cmock_retval) ptr_return3_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return);
+typedef struct _CMOCK_ptr_return3_EXPECT_ROW
+{
+  int a;
+  U16* ReturnVal;
+} ptr_return3_ExpectRow;
+#define ptr_return3_ExpectTable(cmock_rows, cmock_count) ptr_return3_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return3_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return1_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return1 requires _ExpectAndReturn");
+#define ptr_ptr_return1_ExpectAndReturn(a, cmock_retval) ptr_ptr_return1_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return1_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return1_ExpectRow;
+#define ptr_ptr_return1_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return1_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return2_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return2 requires _ExpectAndReturn");
+#define ptr_ptr_return2_ExpectAndReturn(a, cmock_retval) ptr_ptr_return2_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return2_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return2_ExpectRow;
+#define ptr_ptr_return2_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return2_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return3_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return3 requires _ExpectAndReturn");
+#define ptr_ptr_return3_ExpectAndReturn(a, cmock_retval) ptr_ptr_return3_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return3_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return3_ExpectRow;
+#define ptr_ptr_return3_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return3_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return3_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return4_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return4 requires _ExpectAndReturn");
+#define ptr_ptr_return4_ExpectAndReturn(a, cmock_retval) ptr_ptr_return4_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return4_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return4_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return4_ExpectRow;
+#define ptr_ptr_return4_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return4_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return4_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return4_ExpectRow* cmock_rows, size_t cmock_count);
+#define example_c99_type_Expect(param1) TEST_FAIL_MESSAGE("example_c99_type requires _ExpectAndReturn");
+#define example_c99_type_ExpectAndReturn(param1, cmock_retval) example_c99_type_CMockExpectAndReturn(__LINE__, param1, cmock_retval)
+void example_c99_type_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int32_t param1, int32_t cmock_to_return);
+typedef struct _CMOCK_example_c99_type_EXPECT_ROW
+{
+  int32_t param1;
+  int32_t ReturnVal;
+} example_c99_type_ExpectRow;
+#define example_c99_type_ExpectTable(cmock_rows, cmock_count) example_c99_type_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void example_c99_type_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const example_c99_type_ExpectRow* cmock_rows, size_t cmock_count);
+#define I2CIntRegister_ExpectAndReturn(ui32Base, pfnHandler, cmock_retval) TEST_FAIL_MESSAGE("I2CIntRegister requires _Expect (not AndReturn)");
+#define I2CIntRegister_Expect(ui32Base, pfnHandler) I2CIntRegister_CMockExpect(__LINE__, ui32Base, pfnHandler)
+void I2CIntRegister_CMockExpect(UNITY_LINE_TYPE cmock_line, uint32_t ui32Base, cmock_parsing_func_ptr1 pfnHandler);
+typedef struct _CMOCK_I2CIntRegister_EXPECT_ROW
+{
+  uint32_t ui32Base;
+  cmock_parsing_func_ptr1 pfnHandler;
+} I2CIntRegister_ExpectRow;
+#define I2CIntRegister_ExpectTable(cmock_rows, cmock_count) I2CIntRegister_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void I2CIntRegister_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const I2CIntRegister_ExpectRow* cmock_rows, size_t cmock_count);
+#define stuff_Expect(num) TEST_FAIL_MESSAGE("stuff requires _ExpectAndReturn");
+#define stuff_ExpectAndReturn(num, cmock_retval) stuff_CMockExpectAndReturn(__LINE__, num, cmock_retval)
+void stuff_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int num, int cmock_to_return);
+typedef struct _CMOCK_stuff_EXPECT_ROW
+{
+  int num;
+  int ReturnVal;
+} stuff_ExpectRow;
+#define stuff_ExpectTable(cmock_rows, cmock_count) stuff_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void stuff_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const stuff_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
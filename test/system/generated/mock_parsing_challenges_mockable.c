@@ -0,0 +1,1403 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_parsing_challenges_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_c = "c";
+static const char* CMockString_caramel = "caramel";
+static const char* CMockString_crazy_multiline = "crazy_multiline";
+static const char* CMockString_fudge = "fudge";
+static const char* CMockString_incredible_descriptors = "incredible_descriptors";
+static const char* CMockString_oh_brackets1 = "oh_brackets1";
+static const char* CMockString_oh_brackets2 = "oh_brackets2";
+static const char* CMockString_oh_brackets3 = "oh_brackets3";
+static const char* CMockString_oh_brackets4 = "oh_brackets4";
+static const char* CMockString_ptr_ptr_return1 = "ptr_ptr_return1";
+static const char* CMockString_ptr_ptr_return2 = "ptr_ptr_return2";
+static const char* CMockString_ptr_ptr_return3 = "ptr_ptr_return3";
+static const char* CMockString_ptr_ptr_return4 = "ptr_ptr_return4";
+static const char* CMockString_ptr_return1 = "ptr_return1";
+static const char* CMockString_ptr_return2 = "ptr_return2";
+static const char* CMockString_ptr_return3 = "ptr_return3";
+static const char* CMockString_taffy = "taffy";
+static const char* CMockString_toffee = "toffee";
+static const char* CMockString_typedefvar = "typedefvar";
+static const char* CMockString_uses_typedef_like_names = "uses_typedef_like_names";
+static const char* CMockString_var_args1 = "var_args1";
+static const char* CMockString_var_args2 = "var_args2";
+static const char* CMockString_void_type_craziness1 = "void_type_craziness1";
+static const char* CMockString_void_type_craziness2 = "void_type_craziness2";
+static const char* CMockString_void_type_craziness3 = "void_type_craziness3";
+
+typedef struct _CMOCK_void_type_craziness1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int* Expected_a;
+  int* Expected_b;
+  int* Expected_c;
+
+} CMOCK_void_type_craziness1_CALL_INSTANCE;
+
+typedef struct _CMOCK_void_type_craziness2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_void_type_craziness2_CALL_INSTANCE;
+
+typedef struct _CMOCK_void_type_craziness3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  VOID_TYPE_CRAZINESS_CFG* Expected_a;
+
+} CMOCK_void_type_craziness3_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_return1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  U16* ReturnVal;
+  int Expected_a;
+
+} CMOCK_ptr_return1_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_return2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  U16* ReturnVal;
+  int Expected_a;
+
+} CMOCK_ptr_return2_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_return3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  U16* ReturnVal;
+  int Expected_a;
+
+} CMOCK_ptr_return3_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return1_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return2_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return3_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ptr_return4_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned int** ReturnVal;
+  unsigned int** Expected_a;
+
+} CMOCK_ptr_ptr_return4_CALL_INSTANCE;
+
+typedef struct _CMOCK_var_args1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_a;
+
+} CMOCK_var_args1_CALL_INSTANCE;
+
+typedef struct _CMOCK_var_args2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_a;
+  int Expected_b;
+
+} CMOCK_var_args2_CALL_INSTANCE;
+
+typedef struct _CMOCK_crazy_multiline_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ReturnVal;
+  int Expected_a;
+  unsigned int Expected_b;
+
+} CMOCK_crazy_multiline_CALL_INSTANCE;
+
+typedef struct _CMOCK_incredible_descriptors_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned long int ReturnVal;
+  unsigned short Expected_a;
+
+} CMOCK_incredible_descriptors_CALL_INSTANCE;
+
+typedef struct _CMOCK_uses_typedef_like_names_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  TypeDefInt ReturnVal;
+  TypeDefInt Expected_typedefvar;
+
+} CMOCK_uses_typedef_like_names_CALL_INSTANCE;
+
+typedef struct _CMOCK_oh_brackets1_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int* Expected_fudge;
+
+} CMOCK_oh_brackets1_CALL_INSTANCE;
+
+typedef struct _CMOCK_oh_brackets2_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int* Expected_caramel;
+
+} CMOCK_oh_brackets2_CALL_INSTANCE;
+
+typedef struct _CMOCK_oh_brackets3_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int* Expected_toffee;
+
+} CMOCK_oh_brackets3_CALL_INSTANCE;
+
+typedef struct _CMOCK_oh_brackets4_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int* Expected_taffy;
+
+} CMOCK_oh_brackets4_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_parsing_challenges_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE void_type_craziness1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE void_type_craziness2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE void_type_craziness3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_return1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_return2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_return3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ptr_return4_CallInstance;
+  CMOCK_MEM_INDEX_TYPE var_args1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE var_args2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE crazy_multiline_CallInstance;
+  CMOCK_MEM_INDEX_TYPE incredible_descriptors_CallInstance;
+  CMOCK_MEM_INDEX_TYPE uses_typedef_like_names_CallInstance;
+  CMOCK_MEM_INDEX_TYPE oh_brackets1_CallInstance;
+  CMOCK_MEM_INDEX_TYPE oh_brackets2_CallInstance;
+  CMOCK_MEM_INDEX_TYPE oh_brackets3_CallInstance;
+  CMOCK_MEM_INDEX_TYPE oh_brackets4_CallInstance;
+} Mock;
+
+
+void mock_parsing_challenges_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.void_type_craziness1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_void_type_craziness1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.void_type_craziness2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_void_type_craziness2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.void_type_craziness3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_void_type_craziness3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_return1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_return1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_return2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_return2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_return3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_return3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ptr_return4_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ptr_return4);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.var_args1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_var_args1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.var_args2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_var_args2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.crazy_multiline_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_crazy_multiline);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.incredible_descriptors_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_incredible_descriptors);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.uses_typedef_like_names_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_uses_typedef_like_names);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.oh_brackets1_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_oh_brackets1);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.oh_brackets2_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_oh_brackets2);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.oh_brackets3_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_oh_brackets3);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.oh_brackets4_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_oh_brackets4);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_parsing_challenges_mockable_Init(void)
+{
+  mock_parsing_challenges_mockable_Destroy();
+}
+
+void mock_parsing_challenges_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void void_type_craziness1(int* a, int* b, int* c)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_void_type_craziness1);
+  cmock_call_instance = (CMOCK_void_type_craziness1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.void_type_craziness1_CallInstance);
+  Mock.void_type_craziness1_CallInstance = CMock_Guts_MemNext(Mock.void_type_craziness1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_a, a, 1, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_b);
+    if (cmock_call_instance->Expected_b == NULL)
+      { UNITY_TEST_ASSERT_NULL(b, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_b, b, 1, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness1,CMockString_c);
+    if (cmock_call_instance->Expected_c == NULL)
+      { UNITY_TEST_ASSERT_NULL(c, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_c, c, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_void_type_craziness1(CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance, int* a, int* b, int* c);
+void CMockExpectParameters_void_type_craziness1(CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance, int* a, int* b, int* c)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+  cmock_call_instance->Expected_c = c;
+}
+
+void void_type_craziness1_CMockExpect(UNITY_LINE_TYPE cmock_line, int* a, int* b, int* c)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_void_type_craziness1_CALL_INSTANCE));
+  CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance = (CMOCK_void_type_craziness1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.void_type_craziness1_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_void_type_craziness1(cmock_call_instance, a, b, c);
+}
+
+void void_type_craziness1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_void_type_craziness1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_void_type_craziness1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.void_type_craziness1_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_void_type_craziness1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_void_type_craziness1(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b, cmock_rows[cmock_row].c);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void void_type_craziness2(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_void_type_craziness2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_void_type_craziness2);
+  cmock_call_instance = (CMOCK_void_type_craziness2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.void_type_craziness2_CallInstance);
+  Mock.void_type_craziness2_CallInstance = CMock_Guts_MemNext(Mock.void_type_craziness2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+}
+
+void void_type_craziness2_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_void_type_craziness2_CALL_INSTANCE));
+  CMOCK_void_type_craziness2_CALL_INSTANCE* cmock_call_instance = (CMOCK_void_type_craziness2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.void_type_craziness2_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+}
+
+void void_type_craziness3(VOID_TYPE_CRAZINESS_CFG* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_void_type_craziness3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_void_type_craziness3);
+  cmock_call_instance = (CMOCK_void_type_craziness3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.void_type_craziness3_CallInstance);
+  Mock.void_type_craziness3_CallInstance = CMock_Guts_MemNext(Mock.void_type_craziness3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_void_type_craziness3,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_void_type_craziness3(CMOCK_void_type_craziness3_CALL_INSTANCE* cmock_call_instance, VOID_TYPE_CRAZINESS_CFG* a);
+void CMockExpectParameters_void_type_craziness3(CMOCK_void_type_craziness3_CALL_INSTANCE* cmock_call_instance, VOID_TYPE_CRAZINESS_CFG* a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void void_type_craziness3_CMockExpect(UNITY_LINE_TYPE cmock_line, VOID_TYPE_CRAZINESS_CFG* a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_void_type_craziness3_CALL_INSTANCE));
+  CMOCK_void_type_craziness3_CALL_INSTANCE* cmock_call_instance = (CMOCK_void_type_craziness3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.void_type_craziness3_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_void_type_craziness3(cmock_call_instance, a);
+}
+
+void void_type_craziness3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness3_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_void_type_craziness3_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_void_type_craziness3_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.void_type_craziness3_CallInstance = CMock_Guts_MemChain(Mock.void_type_craziness3_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_void_type_craziness3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_void_type_craziness3(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+U16* ptr_return1(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_return1);
+  cmock_call_instance = (CMOCK_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_return1_CallInstance);
+  Mock.ptr_return1_CallInstance = CMock_Guts_MemNext(Mock.ptr_return1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_return1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_return1(CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_ptr_return1(CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_return1_CALL_INSTANCE));
+  CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_return1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_return1(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_return1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_return1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_return1(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+U16* ptr_return2(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_return2);
+  cmock_call_instance = (CMOCK_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_return2_CallInstance);
+  Mock.ptr_return2_CallInstance = CMock_Guts_MemNext(Mock.ptr_return2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_return2,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_return2(CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_ptr_return2(CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_return2_CALL_INSTANCE));
+  CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_return2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_return2(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_return2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_return2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_return2(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+U16* ptr_return3(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_return3);
+  cmock_call_instance = (CMOCK_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_return3_CallInstance);
+  Mock.ptr_return3_CallInstance = CMock_Guts_MemNext(Mock.ptr_return3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_return3,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_return3(CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_ptr_return3(CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_return3_CALL_INSTANCE));
+  CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_return3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_return3(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return3_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_return3_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_return3_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_return3(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return1(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return1);
+  cmock_call_instance = (CMOCK_ptr_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return1_CallInstance);
+  Mock.ptr_ptr_return1_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return1(CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return1(CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return1_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return1(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return1_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return1(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return2(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return2);
+  cmock_call_instance = (CMOCK_ptr_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return2_CallInstance);
+  Mock.ptr_ptr_return2_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return2,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return2(CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return2(CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return2_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return2(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return2_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return2(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return3(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return3);
+  cmock_call_instance = (CMOCK_ptr_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return3_CallInstance);
+  Mock.ptr_ptr_return3_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return3,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return3(CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return3(CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return3_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return3(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return3_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return3_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return3_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return3_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return3_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return3(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned int** ptr_ptr_return4(unsigned int** a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ptr_return4);
+  cmock_call_instance = (CMOCK_ptr_ptr_return4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ptr_return4_CallInstance);
+  Mock.ptr_ptr_return4_CallInstance = CMock_Guts_MemNext(Mock.ptr_ptr_return4_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ptr_return4,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_ptr_ptr_return4(CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance, unsigned int** a);
+void CMockExpectParameters_ptr_ptr_return4(CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance, unsigned int** a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void ptr_ptr_return4_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ptr_return4_CALL_INSTANCE));
+  CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ptr_return4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ptr_return4_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return4_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_ptr_ptr_return4(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ptr_ptr_return4_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return4_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ptr_return4_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ptr_return4_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ptr_return4_CallInstance = CMock_Guts_MemChain(Mock.ptr_ptr_return4_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ptr_return4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_ptr_ptr_return4(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void var_args1(int a, ...)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_var_args1);
+  cmock_call_instance = (CMOCK_var_args1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.var_args1_CallInstance);
+  Mock.var_args1_CallInstance = CMock_Guts_MemNext(Mock.var_args1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_var_args1,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_var_args1(CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_var_args1(CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void var_args1_CMockExpect(UNITY_LINE_TYPE cmock_line, int a)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_var_args1_CALL_INSTANCE));
+  CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance = (CMOCK_var_args1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.var_args1_CallInstance = CMock_Guts_MemChain(Mock.var_args1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_var_args1(cmock_call_instance, a);
+}
+
+void var_args1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_var_args1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_var_args1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.var_args1_CallInstance = CMock_Guts_MemChain(Mock.var_args1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_var_args1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_var_args1(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void var_args2(int a, int b, ...)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_var_args2);
+  cmock_call_instance = (CMOCK_var_args2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.var_args2_CallInstance);
+  Mock.var_args2_CallInstance = CMock_Guts_MemNext(Mock.var_args2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_var_args2,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_var_args2,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_var_args2(CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance, int a, int b);
+void CMockExpectParameters_var_args2(CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance, int a, int b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void var_args2_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, int b)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_var_args2_CALL_INSTANCE));
+  CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance = (CMOCK_var_args2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.var_args2_CallInstance = CMock_Guts_MemChain(Mock.var_args2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_var_args2(cmock_call_instance, a, b);
+}
+
+void var_args2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_var_args2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_var_args2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.var_args2_CallInstance = CMock_Guts_MemChain(Mock.var_args2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_var_args2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_var_args2(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+char crazy_multiline(int a, unsigned int b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_crazy_multiline);
+  cmock_call_instance = (CMOCK_crazy_multiline_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.crazy_multiline_CallInstance);
+  Mock.crazy_multiline_CallInstance = CMock_Guts_MemNext(Mock.crazy_multiline_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_multiline,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_crazy_multiline,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_HEX32(cmock_call_instance->Expected_b, b, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_crazy_multiline(CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance, int a, unsigned int b);
+void CMockExpectParameters_crazy_multiline(CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance, int a, unsigned int b)
+{
+  cmock_call_instance->Expected_a = a;
+  cmock_call_instance->Expected_b = b;
+}
+
+void crazy_multiline_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, unsigned int b, char cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_crazy_multiline_CALL_INSTANCE));
+  CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance = (CMOCK_crazy_multiline_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.crazy_multiline_CallInstance = CMock_Guts_MemChain(Mock.crazy_multiline_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_crazy_multiline(cmock_call_instance, a, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void crazy_multiline_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const crazy_multiline_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_crazy_multiline_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_crazy_multiline_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.crazy_multiline_CallInstance = CMock_Guts_MemChain(Mock.crazy_multiline_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_crazy_multiline_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_crazy_multiline(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+unsigned long int incredible_descriptors(const unsigned short a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_incredible_descriptors_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_incredible_descriptors);
+  cmock_call_instance = (CMOCK_incredible_descriptors_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.incredible_descriptors_CallInstance);
+  Mock.incredible_descriptors_CallInstance = CMock_Guts_MemNext(Mock.incredible_descriptors_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_incredible_descriptors,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_HEX16(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_incredible_descriptors(CMOCK_incredible_descriptors_CALL_INSTANCE* cmock_call_instance, const unsigned short a);
+void CMockExpectParameters_incredible_descriptors(CMOCK_incredible_descriptors_CALL_INSTANCE* cmock_call_instance, const unsigned short a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void incredible_descriptors_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const unsigned short a, unsigned long int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_incredible_descriptors_CALL_INSTANCE));
+  CMOCK_incredible_descriptors_CALL_INSTANCE* cmock_call_instance = (CMOCK_incredible_descriptors_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.incredible_descriptors_CallInstance = CMock_Guts_MemChain(Mock.incredible_descriptors_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_incredible_descriptors(cmock_call_instance, a);
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(unsigned long int[sizeof(cmock_to_return) == sizeof(unsigned long int) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void incredible_descriptors_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const incredible_descriptors_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_incredible_descriptors_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_incredible_descriptors_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.incredible_descriptors_CallInstance = CMock_Guts_MemChain(Mock.incredible_descriptors_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_incredible_descriptors_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_incredible_descriptors(cmock_call_instance, cmock_rows[cmock_row].a);
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(unsigned long int[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(unsigned long int) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+TypeDefInt uses_typedef_like_names(TypeDefInt typedefvar)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_uses_typedef_like_names_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_uses_typedef_like_names);
+  cmock_call_instance = (CMOCK_uses_typedef_like_names_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.uses_typedef_like_names_CallInstance);
+  Mock.uses_typedef_like_names_CallInstance = CMock_Guts_MemNext(Mock.uses_typedef_like_names_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_uses_typedef_like_names,CMockString_typedefvar);
+    UNITY_TEST_ASSERT_EQUAL_HEX8(cmock_call_instance->Expected_typedefvar, typedefvar, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_uses_typedef_like_names(CMOCK_uses_typedef_like_names_CALL_INSTANCE* cmock_call_instance, TypeDefInt typedefvar);
+void CMockExpectParameters_uses_typedef_like_names(CMOCK_uses_typedef_like_names_CALL_INSTANCE* cmock_call_instance, TypeDefInt typedefvar)
+{
+  cmock_call_instance->Expected_typedefvar = typedefvar;
+}
+
+void uses_typedef_like_names_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TypeDefInt typedefvar, TypeDefInt cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_uses_typedef_like_names_CALL_INSTANCE));
+  CMOCK_uses_typedef_like_names_CALL_INSTANCE* cmock_call_instance = (CMOCK_uses_typedef_like_names_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.uses_typedef_like_names_CallInstance = CMock_Guts_MemChain(Mock.uses_typedef_like_names_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_uses_typedef_like_names(cmock_call_instance, typedefvar);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void uses_typedef_like_names_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const uses_typedef_like_names_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_uses_typedef_like_names_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_uses_typedef_like_names_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.uses_typedef_like_names_CallInstance = CMock_Guts_MemChain(Mock.uses_typedef_like_names_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_uses_typedef_like_names_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_uses_typedef_like_names(cmock_call_instance, cmock_rows[cmock_row].typedefvar);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void oh_brackets1(int* fudge)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_oh_brackets1_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_oh_brackets1);
+  cmock_call_instance = (CMOCK_oh_brackets1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.oh_brackets1_CallInstance);
+  Mock.oh_brackets1_CallInstance = CMock_Guts_MemNext(Mock.oh_brackets1_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_oh_brackets1,CMockString_fudge);
+    if (cmock_call_instance->Expected_fudge == NULL)
+      { UNITY_TEST_ASSERT_NULL(fudge, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_fudge, fudge, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_oh_brackets1(CMOCK_oh_brackets1_CALL_INSTANCE* cmock_call_instance, int* fudge);
+void CMockExpectParameters_oh_brackets1(CMOCK_oh_brackets1_CALL_INSTANCE* cmock_call_instance, int* fudge)
+{
+  cmock_call_instance->Expected_fudge = fudge;
+}
+
+void oh_brackets1_CMockExpect(UNITY_LINE_TYPE cmock_line, int* fudge)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_oh_brackets1_CALL_INSTANCE));
+  CMOCK_oh_brackets1_CALL_INSTANCE* cmock_call_instance = (CMOCK_oh_brackets1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.oh_brackets1_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets1_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_oh_brackets1(cmock_call_instance, fudge);
+}
+
+void oh_brackets1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets1_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_oh_brackets1_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_oh_brackets1_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.oh_brackets1_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets1_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_oh_brackets1_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_oh_brackets1(cmock_call_instance, cmock_rows[cmock_row].fudge);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void oh_brackets2(int* caramel)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_oh_brackets2_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_oh_brackets2);
+  cmock_call_instance = (CMOCK_oh_brackets2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.oh_brackets2_CallInstance);
+  Mock.oh_brackets2_CallInstance = CMock_Guts_MemNext(Mock.oh_brackets2_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_oh_brackets2,CMockString_caramel);
+    if (cmock_call_instance->Expected_caramel == NULL)
+      { UNITY_TEST_ASSERT_NULL(caramel, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_caramel, caramel, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_oh_brackets2(CMOCK_oh_brackets2_CALL_INSTANCE* cmock_call_instance, int* caramel);
+void CMockExpectParameters_oh_brackets2(CMOCK_oh_brackets2_CALL_INSTANCE* cmock_call_instance, int* caramel)
+{
+  cmock_call_instance->Expected_caramel = caramel;
+}
+
+void oh_brackets2_CMockExpect(UNITY_LINE_TYPE cmock_line, int* caramel)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_oh_brackets2_CALL_INSTANCE));
+  CMOCK_oh_brackets2_CALL_INSTANCE* cmock_call_instance = (CMOCK_oh_brackets2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.oh_brackets2_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets2_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_oh_brackets2(cmock_call_instance, caramel);
+}
+
+void oh_brackets2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets2_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_oh_brackets2_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_oh_brackets2_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.oh_brackets2_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets2_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_oh_brackets2_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_oh_brackets2(cmock_call_instance, cmock_rows[cmock_row].caramel);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void oh_brackets3(int* toffee)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_oh_brackets3_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_oh_brackets3);
+  cmock_call_instance = (CMOCK_oh_brackets3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.oh_brackets3_CallInstance);
+  Mock.oh_brackets3_CallInstance = CMock_Guts_MemNext(Mock.oh_brackets3_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_oh_brackets3,CMockString_toffee);
+    if (cmock_call_instance->Expected_toffee == NULL)
+      { UNITY_TEST_ASSERT_NULL(toffee, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_toffee, toffee, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_oh_brackets3(CMOCK_oh_brackets3_CALL_INSTANCE* cmock_call_instance, int* toffee);
+void CMockExpectParameters_oh_brackets3(CMOCK_oh_brackets3_CALL_INSTANCE* cmock_call_instance, int* toffee)
+{
+  cmock_call_instance->Expected_toffee = toffee;
+}
+
+void oh_brackets3_CMockExpect(UNITY_LINE_TYPE cmock_line, int* toffee)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_oh_brackets3_CALL_INSTANCE));
+  CMOCK_oh_brackets3_CALL_INSTANCE* cmock_call_instance = (CMOCK_oh_brackets3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.oh_brackets3_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets3_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_oh_brackets3(cmock_call_instance, toffee);
+}
+
+void oh_brackets3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets3_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_oh_brackets3_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_oh_brackets3_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.oh_brackets3_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets3_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_oh_brackets3_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_oh_brackets3(cmock_call_instance, cmock_rows[cmock_row].toffee);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void oh_brackets4(int* taffy)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_oh_brackets4_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_oh_brackets4);
+  cmock_call_instance = (CMOCK_oh_brackets4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.oh_brackets4_CallInstance);
+  Mock.oh_brackets4_CallInstance = CMock_Guts_MemNext(Mock.oh_brackets4_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_oh_brackets4,CMockString_taffy);
+    if (cmock_call_instance->Expected_taffy == NULL)
+      { UNITY_TEST_ASSERT_NULL(taffy, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_taffy, taffy, 1, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_oh_brackets4(CMOCK_oh_brackets4_CALL_INSTANCE* cmock_call_instance, int* taffy);
+void CMockExpectParameters_oh_brackets4(CMOCK_oh_brackets4_CALL_INSTANCE* cmock_call_instance, int* taffy)
+{
+  cmock_call_instance->Expected_taffy = taffy;
+}
+
+void oh_brackets4_CMockExpect(UNITY_LINE_TYPE cmock_line, int* taffy)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_oh_brackets4_CALL_INSTANCE));
+  CMOCK_oh_brackets4_CALL_INSTANCE* cmock_call_instance = (CMOCK_oh_brackets4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.oh_brackets4_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets4_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_oh_brackets4(cmock_call_instance, taffy);
+}
+
+void oh_brackets4_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets4_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_oh_brackets4_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_oh_brackets4_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.oh_brackets4_CallInstance = CMock_Guts_MemChain(Mock.oh_brackets4_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_oh_brackets4_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_oh_brackets4(cmock_call_instance, cmock_rows[cmock_row].taffy);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,222 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_PARSING_CHALLENGES_MOCKABLE_H
+#define _MOCK_PARSING_CHALLENGES_MOCKABLE_H
+
+#include "unity.h"
+#include "parsing_challenges_types.h"
+#include "parsing_challenges_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_parsing_challenges_mockable_Init(void);
+void mock_parsing_challenges_mockable_Destroy(void);
+void mock_parsing_challenges_mockable_Verify(void);
+
+
+
+
+#define void_type_craziness1_ExpectAndReturn(a, b, c, cmock_retval) TEST_FAIL_MESSAGE("void_type_craziness1 requires _Expect (not AndReturn)");
+#define void_type_craziness1_Expect(a, b, c) void_type_craziness1_CMockExpect(__LINE__, a, b, c)
+void void_type_craziness1_CMockExpect(UNITY_LINE_TYPE cmock_line, int* a, int* b, int* c);
+typedef struct _CMOCK_void_type_craziness1_EXPECT_ROW
+{
+  int* a;
+  int* b;
+  int* c;
+} void_type_craziness1_ExpectRow;
+#define void_type_craziness1_ExpectTable(cmock_rows, cmock_count) void_type_craziness1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void void_type_craziness1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness1_ExpectRow* cmock_rows, size_t cmock_count);
+#define void_type_craziness2_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("void_type_craziness2 requires _Expect (not AndReturn)");
+#define void_type_craziness2_Expect() void_type_craziness2_CMockExpect(__LINE__)
+void void_type_craziness2_CMockExpect(UNITY_LINE_TYPE cmock_line);
+#define void_type_craziness3_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("void_type_craziness3 requires _Expect (not AndReturn)");
+#define void_type_craziness3_Expect(a) void_type_craziness3_CMockExpect(__LINE__, a)
+void void_type_craziness3_CMockExpect(UNITY_LINE_TYPE cmock_line, VOID_TYPE_CRAZINESS_CFG* a);
+typedef struct _CMOCK_void_type_craziness3_EXPECT_ROW
+{
+  VOID_TYPE_CRAZINESS_CFG* a;
+} void_type_craziness3_ExpectRow;
+#define void_type_craziness3_ExpectTable(cmock_rows, cmock_count) void_type_craziness3_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void void_type_craziness3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const void_type_craziness3_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_return1_Expect(a) TEST_FAIL_MESSAGE("ptr_return1 requires _ExpectAndReturn");
+#define ptr_return1_ExpectAndReturn(a, cmock_retval) ptr_return1_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return);
+typedef struct _CMOCK_ptr_return1_EXPECT_ROW
+{
+  int a;
+  U16* ReturnVal;
+} ptr_return1_ExpectRow;
+#define ptr_return1_ExpectTable(cmock_rows, cmock_count) ptr_return1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return1_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_return2_Expect(a) TEST_FAIL_MESSAGE("ptr_return2 requires _ExpectAndReturn");
+#define ptr_return2_ExpectAndReturn(a, cmock_retval) ptr_return2_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return);
+typedef struct _CMOCK_ptr_return2_EXPECT_ROW
+{
+  int a;
+  U16* ReturnVal;
+} ptr_return2_ExpectRow;
+#define ptr_return2_ExpectTable(cmock_rows, cmock_count) ptr_return2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return2_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_return3_Expect(a) TEST_FAIL_MESSAGE("ptr_return3 requires _ExpectAndReturn");
+#define ptr_return3_ExpectAndReturn(a, cmock_retval) ptr_return3_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, U16* cmock_to_return);
+typedef struct _CMOCK_ptr_return3_EXPECT_ROW
+{
+  int a;
+  U16* ReturnVal;
+} ptr_return3_ExpectRow;
+#define ptr_return3_ExpectTable(cmock_rows, cmock_count) ptr_return3_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_return3_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return1_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return1 requires _ExpectAndReturn");
+#define ptr_ptr_return1_ExpectAndReturn(a, cmock_retval) ptr_ptr_return1_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return1_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return1_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return1_ExpectRow;
+#define ptr_ptr_return1_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return1_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return2_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return2 requires _ExpectAndReturn");
+#define ptr_ptr_return2_ExpectAndReturn(a, cmock_retval) ptr_ptr_return2_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return2_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return2_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return2_ExpectRow;
+#define ptr_ptr_return2_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return2_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return3_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return3 requires _ExpectAndReturn");
+#define ptr_ptr_return3_ExpectAndReturn(a, cmock_retval) ptr_ptr_return3_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return3_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return3_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return3_ExpectRow;
+#define ptr_ptr_return3_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return3_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return3_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ptr_return4_Expect(a) TEST_FAIL_MESSAGE("ptr_ptr_return4 requires _ExpectAndReturn");
+#define ptr_ptr_return4_ExpectAndReturn(a, cmock_retval) ptr_ptr_return4_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void ptr_ptr_return4_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, unsigned int** a, unsigned int** cmock_to_return);
+typedef struct _CMOCK_ptr_ptr_return4_EXPECT_ROW
+{
+  unsigned int** a;
+  unsigned int** ReturnVal;
+} ptr_ptr_return4_ExpectRow;
+#define ptr_ptr_return4_ExpectTable(cmock_rows, cmock_count) ptr_ptr_return4_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ptr_return4_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ptr_return4_ExpectRow* cmock_rows, size_t cmock_count);
+#define var_args1_ExpectAndReturn(a, cmock_retval) TEST_FAIL_MESSAGE("var_args1 requires _Expect (not AndReturn)");
+#define var_args1_Expect(a) var_args1_CMockExpect(__LINE__, a)
+void var_args1_CMockExpect(UNITY_LINE_TYPE cmock_line, int a);
+typedef struct _CMOCK_var_args1_EXPECT_ROW
+{
+  int a;
+} var_args1_ExpectRow;
+#define var_args1_ExpectTable(cmock_rows, cmock_count) var_args1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void var_args1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args1_ExpectRow* cmock_rows, size_t cmock_count);
+#define var_args2_ExpectAndReturn(a, b, cmock_retval) TEST_FAIL_MESSAGE("var_args2 requires _Expect (not AndReturn)");
+#define var_args2_Expect(a, b) var_args2_CMockExpect(__LINE__, a, b)
+void var_args2_CMockExpect(UNITY_LINE_TYPE cmock_line, int a, int b);
+typedef struct _CMOCK_var_args2_EXPECT_ROW
+{
+  int a;
+  int b;
+} var_args2_ExpectRow;
+#define var_args2_ExpectTable(cmock_rows, cmock_count) var_args2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void var_args2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const var_args2_ExpectRow* cmock_rows, size_t cmock_count);
+#define crazy_multiline_Expect(a, b) TEST_FAIL_MESSAGE("crazy_multiline requires _ExpectAndReturn");
+#define crazy_multiline_ExpectAndReturn(a, b, cmock_retval) crazy_multiline_CMockExpectAndReturn(__LINE__, a, b, cmock_retval)
+void crazy_multiline_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, unsigned int b, char cmock_to_return);
+typedef struct _CMOCK_crazy_multiline_EXPECT_ROW
+{
+  int a;
+  unsigned int b;
+  char ReturnVal;
+} crazy_multiline_ExpectRow;
+#define crazy_multiline_ExpectTable(cmock_rows, cmock_count) crazy_multiline_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void crazy_multiline_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const crazy_multiline_ExpectRow* cmock_rows, size_t cmock_count);
+#define incredible_descriptors_Expect(a) TEST_FAIL_MESSAGE("incredible_descriptors requires _ExpectAndReturn");
+#define incredible_descriptors_ExpectAndReturn(a, cmock_retval) incredible_descriptors_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void incredible_descriptors_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, const unsigned short a, unsigned long int cmock_to_return);
+typedef struct _CMOCK_incredible_descriptors_EXPECT_ROW
+{
+  unsigned short a;
+  unsigned long int ReturnVal;
+} incredible_descriptors_ExpectRow;
+#define incredible_descriptors_ExpectTable(cmock_rows, cmock_count) incredible_descriptors_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void incredible_descriptors_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const incredible_descriptors_ExpectRow* cmock_rows, size_t cmock_count);
+#define uses_typedef_like_names_Expect(typedefvar) TEST_FAIL_MESSAGE("uses_typedef_like_names requires _ExpectAndReturn");
+#define uses_typedef_like_names_ExpectAndReturn(typedefvar, cmock_retval) uses_typedef_like_names_CMockExpectAndReturn(__LINE__, typedefvar, cmock_retval)
+void uses_typedef_like_names_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, TypeDefInt typedefvar, TypeDefInt cmock_to_return);
+typedef struct _CMOCK_uses_typedef_like_names_EXPECT_ROW
+{
+  TypeDefInt typedefvar;
+  TypeDefInt ReturnVal;
+} uses_typedef_like_names_ExpectRow;
+#define uses_typedef_like_names_ExpectTable(cmock_rows, cmock_count) uses_typedef_like_names_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void uses_typedef_like_names_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const uses_typedef_like_names_ExpectRow* cmock_rows, size_t cmock_count);
+#define oh_brackets1_ExpectAndReturn(fudge, cmock_retval) TEST_FAIL_MESSAGE("oh_brackets1 requires _Expect (not AndReturn)");
+#define oh_brackets1_Expect(fudge) oh_brackets1_CMockExpect(__LINE__, fudge)
+void oh_brackets1_CMockExpect(UNITY_LINE_TYPE cmock_line, int* fudge);
+typedef struct _CMOCK_oh_brackets1_EXPECT_ROW
+{
+  int* fudge;
+} oh_brackets1_ExpectRow;
+#define oh_brackets1_ExpectTable(cmock_rows, cmock_count) oh_brackets1_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void oh_brackets1_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets1_ExpectRow* cmock_rows, size_t cmock_count);
+#define oh_brackets2_ExpectAndReturn(caramel, cmock_retval) TEST_FAIL_MESSAGE("oh_brackets2 requires _Expect (not AndReturn)");
+#define oh_brackets2_Expect(caramel) oh_brackets2_CMockExpect(__LINE__, caramel)
+void oh_brackets2_CMockExpect(UNITY_LINE_TYPE cmock_line, int* caramel);
+typedef struct _CMOCK_oh_brackets2_EXPECT_ROW
+{
+  int* caramel;
+} oh_brackets2_ExpectRow;
+#define oh_brackets2_ExpectTable(cmock_rows, cmock_count) oh_brackets2_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void oh_brackets2_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets2_ExpectRow* cmock_rows, size_t cmock_count);
+#define oh_brackets3_ExpectAndReturn(toffee, cmock_retval) TEST_FAIL_MESSAGE("oh_brackets3 requires _Expect (not AndReturn)");
+#define oh_brackets3_Expect(toffee) oh_brackets3_CMockExpect(__LINE__, toffee)
+void oh_brackets3_CMockExpect(UNITY_LINE_TYPE cmock_line, int* toffee);
+typedef struct _CMOCK_oh_brackets3_EXPECT_ROW
+{
+  int* toffee;
+} oh_brackets3_ExpectRow;
+#define oh_brackets3_ExpectTable(cmock_rows, cmock_count) oh_brackets3_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void oh_brackets3_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets3_ExpectRow* cmock_rows, size_t cmock_count);
+#define oh_brackets4_ExpectAndReturn(taffy, cmock_retval) TEST_FAIL_MESSAGE("oh_brackets4 requires _Expect (not AndReturn)");
+#define oh_brackets4_Expect(taffy) oh_brackets4_CMockExpect(__LINE__, taffy)
+void oh_brackets4_CMockExpect(UNITY_LINE_TYPE cmock_line, int* taffy);
+typedef struct _CMOCK_oh_brackets4_EXPECT_ROW
+{
+  int* taffy;
+} oh_brackets4_ExpectRow;
+#define oh_brackets4_ExpectTable(cmock_rows, cmock_count) oh_brackets4_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void oh_brackets4_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const oh_brackets4_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,381 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_record_and_replay_mockable.h"
+
+static const char* CMockString_read_value = "read_value";
+static const char* CMockString_reset = "reset";
+static const char* CMockString_value = "value";
+static const char* CMockString_write_value = "write_value";
+
+typedef struct _CMOCK_read_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int CallOrder;
+
+} CMOCK_read_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_value;
+
+} CMOCK_write_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_reset_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+
+} CMOCK_reset_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_record_and_replay_mockableInstance
+{
+  CMOCK_read_value_REAL read_value_RecordFunctionPointer;
+  CMOCK_MEM_INDEX_TYPE read_value_CallInstance;
+  CMOCK_write_value_REAL write_value_RecordFunctionPointer;
+  CMOCK_MEM_INDEX_TYPE write_value_CallInstance;
+  CMOCK_reset_REAL reset_RecordFunctionPointer;
+  CMOCK_MEM_INDEX_TYPE reset_CallInstance;
+} Mock;
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+void mock_record_and_replay_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.read_value_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_read_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.write_value_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_write_value);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.reset_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_reset);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_record_and_replay_mockable_Init(void)
+{
+  mock_record_and_replay_mockable_Destroy();
+}
+
+void mock_record_and_replay_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
+int read_value(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_value);
+  cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_value_CallInstance);
+  Mock.read_value_CallInstance = CMock_Guts_MemNext(Mock.read_value_CallInstance);
+  if (Mock.read_value_RecordFunctionPointer != NULL)
+  {
+    read_value_ExpectRow cmock_record;
+    memset(&cmock_record, 0, sizeof(cmock_record));
+    cmock_record.ReturnVal = Mock.read_value_RecordFunctionPointer();
+    CMock_Record_Write(0x1946678Fu, &cmock_record, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_record));
+    UNITY_CLR_DETAILS();
+    return cmock_record.ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void read_value_Record(CMOCK_read_value_REAL Real)
+{
+  Mock.read_value_RecordFunctionPointer = Real;
+}
+
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_value_CALL_INSTANCE));
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_value(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_value);
+  cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_value_CallInstance);
+  Mock.write_value_CallInstance = CMock_Guts_MemNext(Mock.write_value_CallInstance);
+  if (Mock.write_value_RecordFunctionPointer != NULL)
+  {
+    write_value_ExpectRow cmock_record;
+    memset(&cmock_record, 0, sizeof(cmock_record));
+    cmock_record.value = value;
+    Mock.write_value_RecordFunctionPointer(value);
+    CMock_Record_Write(0xD1A47646u, &cmock_record, (CMOCK_MEM_INDEX_TYPE)sizeof(cmock_record));
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_write_value,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void write_value_Record(CMOCK_write_value_REAL Real)
+{
+  Mock.write_value_RecordFunctionPointer = Real;
+}
+
+void write_value_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_value_CALL_INSTANCE));
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_write_value(cmock_call_instance, value);
+}
+
+void write_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_value_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_value_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_value_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_write_value(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void reset(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_reset_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_reset);
+  cmock_call_instance = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.reset_CallInstance);
+  Mock.reset_CallInstance = CMock_Guts_MemNext(Mock.reset_CallInstance);
+  if (Mock.reset_RecordFunctionPointer != NULL)
+  {
+    Mock.reset_RecordFunctionPointer();
+    CMock_Record_Write(0x650D33C0u, NULL, 0);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  UNITY_CLR_DETAILS();
+}
+
+void reset_Record(CMOCK_reset_REAL Real)
+{
+  Mock.reset_RecordFunctionPointer = Real;
+}
+
+void reset_CMockExpect(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_reset_CALL_INSTANCE));
+  CMOCK_reset_CALL_INSTANCE* cmock_call_instance = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.reset_CallInstance = CMock_Guts_MemChain(Mock.reset_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+}
+
+#ifndef CMOCK_RECORD
+#error "The record plugin needs CMOCK_RECORD defined for cmock.c and the mocks."
+#endif
+
+void mock_record_and_replay_mockable_Replay(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE cmock_cursor = 0;
+  CMOCK_MEM_INDEX_TYPE cmock_size;
+  UNITY_UINT32 cmock_id;
+  const void* cmock_data;
+  int cmock_origin = CMock_Replay_Origin(GlobalExpectCount);
+  int cmock_ordinal = 0;
+  CMOCK_MEM_INDEX_TYPE cmock_read_value_count = 0;
+  CMOCK_MEM_INDEX_TYPE cmock_read_value_next = CMOCK_GUTS_NONE;
+  CMOCK_MEM_INDEX_TYPE cmock_write_value_count = 0;
+  CMOCK_MEM_INDEX_TYPE cmock_write_value_next = CMOCK_GUTS_NONE;
+  CMOCK_MEM_INDEX_TYPE cmock_reset_count = 0;
+  CMOCK_MEM_INDEX_TYPE cmock_reset_next = CMOCK_GUTS_NONE;
+  while ((cmock_data = CMock_Replay_Next(&cmock_cursor, &cmock_id, &cmock_size)) != NULL)
+  {
+    switch (cmock_id)
+    {
+      case 0x1946678Fu:
+        if (cmock_size != sizeof(read_value_ExpectRow))
+        {
+          UNITY_SET_DETAIL(CMockString_read_value);
+          UNITY_TEST_FAIL(cmock_line, CMockStringMismatch);
+        }
+        cmock_read_value_count++;
+        break;
+      case 0xD1A47646u:
+        if (cmock_size != sizeof(write_value_ExpectRow))
+        {
+          UNITY_SET_DETAIL(CMockString_write_value);
+          UNITY_TEST_FAIL(cmock_line, CMockStringMismatch);
+        }
+        cmock_write_value_count++;
+        break;
+      case 0x650D33C0u:
+        if (cmock_size != 0)
+        {
+          UNITY_SET_DETAIL(CMockString_reset);
+          UNITY_TEST_FAIL(cmock_line, CMockStringMismatch);
+        }
+        cmock_reset_count++;
+        break;
+      default:
+        break;
+    }
+  }
+  if (cmock_read_value_count != 0)
+  {
+    cmock_read_value_next = CMock_Guts_MemNewChain(sizeof(CMOCK_read_value_CALL_INSTANCE), cmock_read_value_count);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_read_value_next), cmock_line, CMockStringOutOfMemory);
+    Mock.read_value_CallInstance = CMock_Guts_MemChain(Mock.read_value_CallInstance, cmock_read_value_next);
+  }
+  if (cmock_write_value_count != 0)
+  {
+    cmock_write_value_next = CMock_Guts_MemNewChain(sizeof(CMOCK_write_value_CALL_INSTANCE), cmock_write_value_count);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_write_value_next), cmock_line, CMockStringOutOfMemory);
+    Mock.write_value_CallInstance = CMock_Guts_MemChain(Mock.write_value_CallInstance, cmock_write_value_next);
+  }
+  if (cmock_reset_count != 0)
+  {
+    cmock_reset_next = CMock_Guts_MemNewChain(sizeof(CMOCK_reset_CALL_INSTANCE), cmock_reset_count);
+    UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_reset_next), cmock_line, CMockStringOutOfMemory);
+    Mock.reset_CallInstance = CMock_Guts_MemChain(Mock.reset_CallInstance, cmock_reset_next);
+  }
+  cmock_cursor = 0;
+  while ((cmock_data = CMock_Replay_Next(&cmock_cursor, &cmock_id, &cmock_size)) != NULL)
+  {
+    cmock_ordinal++;
+    switch (cmock_id)
+    {
+      case 0x1946678Fu:
+      {
+        CMOCK_read_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_read_value_next);
+        read_value_ExpectRow cmock_row;
+        memcpy(&cmock_row, cmock_data, sizeof(cmock_row));
+        cmock_call_instance->LineNumber = cmock_line;
+        cmock_call_instance->CallOrder = cmock_origin + cmock_ordinal;
+        cmock_call_instance->ReturnVal = cmock_row.ReturnVal;
+        cmock_read_value_next = CMock_Guts_MemNext(cmock_read_value_next);
+        break;
+      }
+      case 0xD1A47646u:
+      {
+        CMOCK_write_value_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_value_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_write_value_next);
+        write_value_ExpectRow cmock_row;
+        memcpy(&cmock_row, cmock_data, sizeof(cmock_row));
+        cmock_call_instance->LineNumber = cmock_line;
+        cmock_call_instance->CallOrder = cmock_origin + cmock_ordinal;
+        CMockExpectParameters_write_value(cmock_call_instance, cmock_row.value);
+        cmock_write_value_next = CMock_Guts_MemNext(cmock_write_value_next);
+        break;
+      }
+      case 0x650D33C0u:
+      {
+        CMOCK_reset_CALL_INSTANCE* cmock_call_instance = (CMOCK_reset_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_reset_next);
+        cmock_call_instance->LineNumber = cmock_line;
+        cmock_call_instance->CallOrder = cmock_origin + cmock_ordinal;
+        cmock_reset_next = CMock_Guts_MemNext(cmock_reset_next);
+        break;
+      }
+      default:
+        break;
+    }
+  }
+  if (GlobalExpectCount < (cmock_origin + cmock_ordinal))
+    GlobalExpectCount = cmock_origin + cmock_ordinal;
+}
+
@@ -0,0 +1,1154 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_return_thru_ptr_ignore_arg_mockable.h"
+
+static const char* CMockString_len = "len";
+static const char* CMockString_ptr_ret_abstract = "ptr_ret_abstract";
+static const char* CMockString_ptr_ret_abstract_array = "ptr_ret_abstract_array";
+static const char* CMockString_ptr_ret_array = "ptr_ret_array";
+static const char* CMockString_ptr_ret_const_int = "ptr_ret_const_int";
+static const char* CMockString_ptr_ret_int = "ptr_ret_int";
+static const char* CMockString_ptr_ret_ints = "ptr_ret_ints";
+static const char* CMockString_ptr_ret_string = "ptr_ret_string";
+static const char* CMockString_ptr_ret_struct = "ptr_ret_struct";
+static const char* CMockString_ptr_ret_typedef = "ptr_ret_typedef";
+static const char* CMockString_r = "r";
+static const char* CMockString_s = "s";
+
+typedef struct _CMOCK_ptr_ret_int_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int* Expected_r;
+  int Expected_r_Depth;
+  char ReturnThruPtr_r_Used;
+  int const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_int_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_ints_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int* Expected_r;
+  int* Expected_s;
+  int Expected_r_Depth;
+  int Expected_s_Depth;
+  char ReturnThruPtr_r_Used;
+  int const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+  char ReturnThruPtr_s_Used;
+  int const* ReturnThruPtr_s_Val;
+  size_t ReturnThruPtr_s_Size;
+
+} CMOCK_ptr_ret_ints_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_array_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  char* Expected_r;
+  int Expected_len;
+  char ReturnThruPtr_r_Used;
+  char const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_array_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_typedef_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  intptr Expected_r;
+  char ReturnThruPtr_r_Used;
+  intptr ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_typedef_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_struct_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  struct a_struct* Expected_r;
+  int Expected_r_Depth;
+  char ReturnThruPtr_r_Used;
+  struct a_struct const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_struct_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_abstract_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  abs_struct* Expected_r;
+  int Expected_r_Depth;
+  char ReturnThruPtr_r_Used;
+  abs_struct const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_abstract_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_abstract_array_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  abs_struct* Expected_r;
+  int Expected_len;
+  int Expected_r_Depth;
+  char ReturnThruPtr_r_Used;
+  abs_struct const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_abstract_array_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_const_int_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  int* Expected_r;
+  const int* Expected_s;
+  int Expected_r_Depth;
+  int Expected_s_Depth;
+  char ReturnThruPtr_r_Used;
+  int const* ReturnThruPtr_r_Val;
+  size_t ReturnThruPtr_r_Size;
+
+} CMOCK_ptr_ret_const_int_CALL_INSTANCE;
+
+typedef struct _CMOCK_ptr_ret_string_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  char ExpectAnyArgsBool;
+  char* Expected_s;
+  char ReturnThruPtr_s_Used;
+  char const* ReturnThruPtr_s_Val;
+  size_t ReturnThruPtr_s_Size;
+
+} CMOCK_ptr_ret_string_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_return_thru_ptr_ignore_arg_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE ptr_ret_int_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_ints_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_array_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_typedef_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_struct_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_abstract_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_abstract_array_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_const_int_CallInstance;
+  CMOCK_MEM_INDEX_TYPE ptr_ret_string_CallInstance;
+} Mock;
+
+
+void mock_return_thru_ptr_ignore_arg_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.ptr_ret_int_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_int);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_ints_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_ints);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_array_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_array);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_typedef_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_typedef);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_struct_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_struct);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_abstract_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_abstract);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_abstract_array_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_abstract_array);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_const_int_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_const_int);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.ptr_ret_string_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ptr_ret_string);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_return_thru_ptr_ignore_arg_mockable_Init(void)
+{
+  mock_return_thru_ptr_ignore_arg_mockable_Destroy();
+}
+
+void mock_return_thru_ptr_ignore_arg_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void ptr_ret_int(int* r)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_int);
+  cmock_call_instance = (CMOCK_ptr_ret_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_int_CallInstance);
+  Mock.ptr_ret_int_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_int_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_int,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_r_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_r, r, cmock_call_instance->Expected_r_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_int(CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance, int* r, int r_Depth);
+void CMockExpectParameters_ptr_ret_int(CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance, int* r, int r_Depth)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->Expected_r_Depth = r_Depth;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+}
+
+void ptr_ret_int_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_int_CALL_INSTANCE));
+  CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_int_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_int_CMockExpect(UNITY_LINE_TYPE cmock_line, int* r)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_int_CALL_INSTANCE));
+  CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_int_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_int(cmock_call_instance, r, 1);
+}
+
+void ptr_ret_int_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_int_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_int_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_int_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_int(cmock_call_instance, cmock_rows[cmock_row].r, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_int_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, int* r, int r_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_int_CALL_INSTANCE));
+  CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_int_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_int(cmock_call_instance, r, r_Depth);
+}
+
+void ptr_ret_int_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, int const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_int_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_ints(int* r, int* s)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_ints);
+  cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_ints_CallInstance);
+  Mock.ptr_ret_ints_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_ints_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_ints,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_r_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_r, r, cmock_call_instance->Expected_r_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_ints,CMockString_s);
+    if (cmock_call_instance->Expected_s == NULL)
+      { UNITY_TEST_ASSERT_NULL(s, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_s_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_s, s, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_s, s, cmock_call_instance->Expected_s_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }
+  if (cmock_call_instance->ReturnThruPtr_s_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(s, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)s, (const void*)cmock_call_instance->ReturnThruPtr_s_Val, 
+      cmock_call_instance->ReturnThruPtr_s_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_ints(CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance, int* r, int r_Depth, int* s, int s_Depth);
+void CMockExpectParameters_ptr_ret_ints(CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance, int* r, int r_Depth, int* s, int s_Depth)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->Expected_r_Depth = r_Depth;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+  cmock_call_instance->Expected_s = s;
+  cmock_call_instance->Expected_s_Depth = s_Depth;
+  cmock_call_instance->ReturnThruPtr_s_Used = 0;
+}
+
+void ptr_ret_ints_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_ints_CALL_INSTANCE));
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_ints_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_ints_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_ints_CMockExpect(UNITY_LINE_TYPE cmock_line, int* r, int* s)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_ints_CALL_INSTANCE));
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_ints_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_ints_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_ints(cmock_call_instance, r, 1, s, 1);
+}
+
+void ptr_ret_ints_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_ints_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_ints_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_ints_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_ints_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_ints(cmock_call_instance, cmock_rows[cmock_row].r, 1, cmock_rows[cmock_row].s, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_ints_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, int* r, int r_Depth, int* s, int s_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_ints_CALL_INSTANCE));
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_ints_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_ints_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_ints(cmock_call_instance, r, r_Depth, s, s_Depth);
+}
+
+void ptr_ret_ints_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, int const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_ints_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+
+void ptr_ret_ints_CMockReturnMemThruPtr_s(UNITY_LINE_TYPE cmock_line, int const* s, size_t cmock_size)
+{
+  CMOCK_ptr_ret_ints_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_ints_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_ints_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_s_Used = 1;
+  cmock_call_instance->ReturnThruPtr_s_Val = s;
+  cmock_call_instance->ReturnThruPtr_s_Size = cmock_size;
+}
+
+void ptr_ret_array(char* r, int len)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_array);
+  cmock_call_instance = (CMOCK_ptr_ret_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_array_CallInstance);
+  Mock.ptr_ret_array_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_array_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_array,CMockString_r);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_array,CMockString_len);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_len, len, cmock_line, CMockStringMismatch);
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_array(CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance, char* r, int len);
+void CMockExpectParameters_ptr_ret_array(CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance, char* r, int len)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+  cmock_call_instance->Expected_len = len;
+}
+
+void ptr_ret_array_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_array_CALL_INSTANCE));
+  CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_array_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_array_CMockExpect(UNITY_LINE_TYPE cmock_line, char* r, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_array_CALL_INSTANCE));
+  CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_array_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_array(cmock_call_instance, r, len);
+}
+
+void ptr_ret_array_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_array_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_array_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_array_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_array(cmock_call_instance, cmock_rows[cmock_row].r, cmock_rows[cmock_row].len);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_array_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, char const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_array_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_typedef(intptr r)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_typedef);
+  cmock_call_instance = (CMOCK_ptr_ret_typedef_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_typedef_CallInstance);
+  Mock.ptr_ret_typedef_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_typedef_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_typedef,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_r, r, 1, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_typedef(CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance, intptr r);
+void CMockExpectParameters_ptr_ret_typedef(CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance, intptr r)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+}
+
+void ptr_ret_typedef_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_typedef_CALL_INSTANCE));
+  CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_typedef_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_typedef_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_typedef_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_typedef_CMockExpect(UNITY_LINE_TYPE cmock_line, intptr r)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_typedef_CALL_INSTANCE));
+  CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_typedef_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_typedef_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_typedef_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_typedef(cmock_call_instance, r);
+}
+
+void ptr_ret_typedef_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_typedef_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_typedef_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_typedef_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_typedef_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_typedef_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_typedef(cmock_call_instance, cmock_rows[cmock_row].r);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_typedef_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, intptr r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_typedef_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_typedef_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_typedef_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_struct(struct a_struct* r)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_struct);
+  cmock_call_instance = (CMOCK_ptr_ret_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_struct_CallInstance);
+  Mock.ptr_ret_struct_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_struct_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_struct,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_r_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_r), (void*)(r), sizeof(struct a_struct), cmock_call_instance->Expected_r_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_struct(CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance, struct a_struct* r, int r_Depth);
+void CMockExpectParameters_ptr_ret_struct(CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance, struct a_struct* r, int r_Depth)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->Expected_r_Depth = r_Depth;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+}
+
+void ptr_ret_struct_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_struct_CALL_INSTANCE));
+  CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_struct_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_struct_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_struct_CMockExpect(UNITY_LINE_TYPE cmock_line, struct a_struct* r)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_struct_CALL_INSTANCE));
+  CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_struct_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_struct_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_struct(cmock_call_instance, r, 1);
+}
+
+void ptr_ret_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_struct_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_struct_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_struct_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_struct_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_struct(cmock_call_instance, cmock_rows[cmock_row].r, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_struct_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, struct a_struct* r, int r_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_struct_CALL_INSTANCE));
+  CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_struct_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_struct_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_struct(cmock_call_instance, r, r_Depth);
+}
+
+void ptr_ret_struct_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, struct a_struct const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_struct_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_abstract(abs_struct* r)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_abstract);
+  cmock_call_instance = (CMOCK_ptr_ret_abstract_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_abstract_CallInstance);
+  Mock.ptr_ret_abstract_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_abstract_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_abstract,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_r_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_PTR_ARRAY(cmock_call_instance->Expected_r, r, cmock_call_instance->Expected_r_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_abstract(CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance, abs_struct* r, int r_Depth);
+void CMockExpectParameters_ptr_ret_abstract(CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance, abs_struct* r, int r_Depth)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->Expected_r_Depth = r_Depth;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+}
+
+void ptr_ret_abstract_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_abstract_CALL_INSTANCE));
+  CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_abstract_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_abstract_CMockExpect(UNITY_LINE_TYPE cmock_line, abs_struct* r)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_abstract_CALL_INSTANCE));
+  CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_abstract_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_abstract(cmock_call_instance, r, 1);
+}
+
+void ptr_ret_abstract_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_abstract_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_abstract_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_abstract_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_abstract_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_abstract(cmock_call_instance, cmock_rows[cmock_row].r, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_abstract_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, abs_struct* r, int r_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_abstract_CALL_INSTANCE));
+  CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_abstract_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_abstract(cmock_call_instance, r, r_Depth);
+}
+
+void ptr_ret_abstract_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, abs_struct const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_abstract_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_abstract_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_abstract_array(abs_struct* r, int len)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_abstract_array);
+  cmock_call_instance = (CMOCK_ptr_ret_abstract_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_abstract_array_CallInstance);
+  Mock.ptr_ret_abstract_array_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_abstract_array_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_abstract_array,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_r_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_PTR_ARRAY(cmock_call_instance->Expected_r, r, cmock_call_instance->Expected_r_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_abstract_array,CMockString_len);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_len, len, cmock_line, CMockStringMismatch);
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_abstract_array(CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance, abs_struct* r, int r_Depth, int len);
+void CMockExpectParameters_ptr_ret_abstract_array(CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance, abs_struct* r, int r_Depth, int len)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->Expected_r_Depth = r_Depth;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+  cmock_call_instance->Expected_len = len;
+}
+
+void ptr_ret_abstract_array_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_abstract_array_CALL_INSTANCE));
+  CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_abstract_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_array_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_abstract_array_CMockExpect(UNITY_LINE_TYPE cmock_line, abs_struct* r, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_abstract_array_CALL_INSTANCE));
+  CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_abstract_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_array_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_abstract_array(cmock_call_instance, r, len, len);
+}
+
+void ptr_ret_abstract_array_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_abstract_array_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_abstract_array_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_abstract_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_array_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_abstract_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_abstract_array(cmock_call_instance, cmock_rows[cmock_row].r, cmock_rows[cmock_row].len, cmock_rows[cmock_row].len);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_abstract_array_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, abs_struct* r, int r_Depth, int len)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_abstract_array_CALL_INSTANCE));
+  CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_abstract_array_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_abstract_array_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_abstract_array(cmock_call_instance, r, r_Depth, len);
+}
+
+void ptr_ret_abstract_array_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, abs_struct const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_abstract_array_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_abstract_array_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_abstract_array_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_const_int(int* r, const int* s)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_const_int);
+  cmock_call_instance = (CMOCK_ptr_ret_const_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_const_int_CallInstance);
+  Mock.ptr_ret_const_int_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_const_int_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_const_int,CMockString_r);
+    if (cmock_call_instance->Expected_r == NULL)
+      { UNITY_TEST_ASSERT_NULL(r, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_r_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_r, r, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_r, r, cmock_call_instance->Expected_r_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_const_int,CMockString_s);
+    if (cmock_call_instance->Expected_s == NULL)
+      { UNITY_TEST_ASSERT_NULL(s, cmock_line, CMockStringExpNULL); }
+    else if (cmock_call_instance->Expected_s_Depth == 0)
+      { UNITY_TEST_ASSERT_EQUAL_PTR(cmock_call_instance->Expected_s, s, cmock_line, CMockStringMismatch); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_s, s, cmock_call_instance->Expected_s_Depth, cmock_line, CMockStringMismatch); }
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_r_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(r, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)r, (const void*)cmock_call_instance->ReturnThruPtr_r_Val, 
+      cmock_call_instance->ReturnThruPtr_r_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_const_int(CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance, int* r, int r_Depth, const int* s, int s_Depth);
+void CMockExpectParameters_ptr_ret_const_int(CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance, int* r, int r_Depth, const int* s, int s_Depth)
+{
+  cmock_call_instance->Expected_r = r;
+  cmock_call_instance->Expected_r_Depth = r_Depth;
+  cmock_call_instance->ReturnThruPtr_r_Used = 0;
+  cmock_call_instance->Expected_s = s;
+  cmock_call_instance->Expected_s_Depth = s_Depth;
+}
+
+void ptr_ret_const_int_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_const_int_CALL_INSTANCE));
+  CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_const_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_const_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_const_int_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_const_int_CMockExpect(UNITY_LINE_TYPE cmock_line, int* r, const int* s)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_const_int_CALL_INSTANCE));
+  CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_const_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_const_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_const_int_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_const_int(cmock_call_instance, r, 1, s, 1);
+}
+
+void ptr_ret_const_int_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_const_int_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_const_int_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_const_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_const_int_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_const_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_const_int(cmock_call_instance, cmock_rows[cmock_row].r, 1, cmock_rows[cmock_row].s, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_const_int_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, int* r, int r_Depth, const int* s, int s_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_const_int_CALL_INSTANCE));
+  CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_const_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_const_int_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_const_int_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_const_int(cmock_call_instance, r, r_Depth, s, s_Depth);
+}
+
+void ptr_ret_const_int_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, int const* r, size_t cmock_size)
+{
+  CMOCK_ptr_ret_const_int_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_const_int_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_const_int_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_r_Used = 1;
+  cmock_call_instance->ReturnThruPtr_r_Val = r;
+  cmock_call_instance->ReturnThruPtr_r_Size = cmock_size;
+}
+
+void ptr_ret_string(char* s)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ptr_ret_string);
+  cmock_call_instance = (CMOCK_ptr_ret_string_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ptr_ret_string_CallInstance);
+  Mock.ptr_ret_string_CallInstance = CMock_Guts_MemNext(Mock.ptr_ret_string_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (!cmock_call_instance->ExpectAnyArgsBool)
+  {
+  {
+    UNITY_SET_DETAILS(CMockString_ptr_ret_string,CMockString_s);
+    UNITY_TEST_ASSERT_EQUAL_STRING(cmock_call_instance->Expected_s, s, cmock_line, CMockStringMismatch);
+  }
+  }
+  if (cmock_call_instance->ReturnThruPtr_s_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(s, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)s, (const void*)cmock_call_instance->ReturnThruPtr_s_Val, 
+      cmock_call_instance->ReturnThruPtr_s_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_ptr_ret_string(CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance, char* s);
+void CMockExpectParameters_ptr_ret_string(CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance, char* s)
+{
+  cmock_call_instance->Expected_s = s;
+  cmock_call_instance->ReturnThruPtr_s_Used = 0;
+}
+
+void ptr_ret_string_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_string_CALL_INSTANCE));
+  CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_string_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_string_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_string_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  cmock_call_instance->ExpectAnyArgsBool = (char)1;
+}
+
+void ptr_ret_string_CMockExpect(UNITY_LINE_TYPE cmock_line, char* s)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ptr_ret_string_CALL_INSTANCE));
+  CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_string_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ptr_ret_string_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_string_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ExpectAnyArgsBool = (char)0;
+  CMockExpectParameters_ptr_ret_string(cmock_call_instance, s);
+}
+
+void ptr_ret_string_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_string_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ptr_ret_string_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ptr_ret_string_CallInstance = CMock_Guts_MemChain(Mock.ptr_ret_string_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ptr_ret_string_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ExpectAnyArgsBool = (char)0;
+    CMockExpectParameters_ptr_ret_string(cmock_call_instance, cmock_rows[cmock_row].s);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void ptr_ret_string_CMockReturnMemThruPtr_s(UNITY_LINE_TYPE cmock_line, char const* s, size_t cmock_size)
+{
+  CMOCK_ptr_ret_string_CALL_INSTANCE* cmock_call_instance = (CMOCK_ptr_ret_string_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.ptr_ret_string_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_s_Used = 1;
+  cmock_call_instance->ReturnThruPtr_s_Val = s;
+  cmock_call_instance->ReturnThruPtr_s_Size = cmock_size;
+}
+
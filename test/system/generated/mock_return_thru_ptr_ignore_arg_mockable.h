@@ -0,0 +1,213 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_RETURN_THRU_PTR_IGNORE_ARG_MOCKABLE_H
+#define _MOCK_RETURN_THRU_PTR_IGNORE_ARG_MOCKABLE_H
+
+#include "unity.h"
+#include "return_thru_ptr_ignore_arg_types.h"
+#include "return_thru_ptr_ignore_arg_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_return_thru_ptr_ignore_arg_mockable_Init(void);
+void mock_return_thru_ptr_ignore_arg_mockable_Destroy(void);
+void mock_return_thru_ptr_ignore_arg_mockable_Verify(void);
+
+
+
+
+
+#define ptr_ret_int_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_int requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_int_ExpectAnyArgs() ptr_ret_int_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_int_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_int_ExpectAndReturn(r, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_int requires _Expect (not AndReturn)");
+#define ptr_ret_int_Expect(r) ptr_ret_int_CMockExpect(__LINE__, r)
+void ptr_ret_int_CMockExpect(UNITY_LINE_TYPE cmock_line, int* r);
+typedef struct _CMOCK_ptr_ret_int_EXPECT_ROW
+{
+  int* r;
+} ptr_ret_int_ExpectRow;
+#define ptr_ret_int_ExpectTable(cmock_rows, cmock_count) ptr_ret_int_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_int_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_int_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_int_ExpectWithArrayAndReturn(r, r_Depth, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_int requires _ExpectWithArray (not AndReturn)");
+#define ptr_ret_int_ExpectWithArray(r, r_Depth) ptr_ret_int_CMockExpectWithArray(__LINE__, r, (r_Depth))
+void ptr_ret_int_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, int* r, int r_Depth);
+#define ptr_ret_int_ReturnThruPtr_r(r) ptr_ret_int_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(int))
+#define ptr_ret_int_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_int_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_int_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_int_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_int_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, int const* r, size_t cmock_size);
+#define ptr_ret_ints_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_ints requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_ints_ExpectAnyArgs() ptr_ret_ints_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_ints_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_ints_ExpectAndReturn(r, s, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_ints requires _Expect (not AndReturn)");
+#define ptr_ret_ints_Expect(r, s) ptr_ret_ints_CMockExpect(__LINE__, r, s)
+void ptr_ret_ints_CMockExpect(UNITY_LINE_TYPE cmock_line, int* r, int* s);
+typedef struct _CMOCK_ptr_ret_ints_EXPECT_ROW
+{
+  int* r;
+  int* s;
+} ptr_ret_ints_ExpectRow;
+#define ptr_ret_ints_ExpectTable(cmock_rows, cmock_count) ptr_ret_ints_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_ints_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_ints_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_ints_ExpectWithArrayAndReturn(r, r_Depth, s, s_Depth, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_ints requires _ExpectWithArray (not AndReturn)");
+#define ptr_ret_ints_ExpectWithArray(r, r_Depth, s, s_Depth) ptr_ret_ints_CMockExpectWithArray(__LINE__, r, (r_Depth), s, (s_Depth))
+void ptr_ret_ints_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, int* r, int r_Depth, int* s, int s_Depth);
+#define ptr_ret_ints_ReturnThruPtr_r(r) ptr_ret_ints_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(int))
+#define ptr_ret_ints_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_ints_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_ints_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_ints_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_ints_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, int const* r, size_t cmock_size);
+#define ptr_ret_ints_ReturnThruPtr_s(s) ptr_ret_ints_CMockReturnMemThruPtr_s(__LINE__, s, sizeof(int))
+#define ptr_ret_ints_ReturnArrayThruPtr_s(s, cmock_len) ptr_ret_ints_CMockReturnMemThruPtr_s(__LINE__, s, (cmock_len * sizeof(*s)))
+#define ptr_ret_ints_ReturnMemThruPtr_s(s, cmock_size) ptr_ret_ints_CMockReturnMemThruPtr_s(__LINE__, s, (cmock_size))
+void ptr_ret_ints_CMockReturnMemThruPtr_s(UNITY_LINE_TYPE cmock_line, int const* s, size_t cmock_size);
+#define ptr_ret_array_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_array requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_array_ExpectAnyArgs() ptr_ret_array_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_array_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_array_ExpectAndReturn(r, len, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_array requires _Expect (not AndReturn)");
+#define ptr_ret_array_Expect(r, len) ptr_ret_array_CMockExpect(__LINE__, r, len)
+void ptr_ret_array_CMockExpect(UNITY_LINE_TYPE cmock_line, char* r, int len);
+typedef struct _CMOCK_ptr_ret_array_EXPECT_ROW
+{
+  char* r;
+  int len;
+} ptr_ret_array_ExpectRow;
+#define ptr_ret_array_ExpectTable(cmock_rows, cmock_count) ptr_ret_array_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_array_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_array_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_array_ReturnThruPtr_r(r) ptr_ret_array_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(char))
+#define ptr_ret_array_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_array_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_array_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_array_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_array_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, char const* r, size_t cmock_size);
+#define ptr_ret_typedef_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_typedef requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_typedef_ExpectAnyArgs() ptr_ret_typedef_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_typedef_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_typedef_ExpectAndReturn(r, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_typedef requires _Expect (not AndReturn)");
+#define ptr_ret_typedef_Expect(r) ptr_ret_typedef_CMockExpect(__LINE__, r)
+void ptr_ret_typedef_CMockExpect(UNITY_LINE_TYPE cmock_line, intptr r);
+typedef struct _CMOCK_ptr_ret_typedef_EXPECT_ROW
+{
+  intptr r;
+} ptr_ret_typedef_ExpectRow;
+#define ptr_ret_typedef_ExpectTable(cmock_rows, cmock_count) ptr_ret_typedef_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_typedef_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_typedef_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_typedef_ReturnThruPtr_r(r) ptr_ret_typedef_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(*r))
+#define ptr_ret_typedef_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_typedef_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_typedef_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_typedef_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_typedef_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, intptr r, size_t cmock_size);
+#define ptr_ret_struct_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_struct requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_struct_ExpectAnyArgs() ptr_ret_struct_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_struct_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_struct_ExpectAndReturn(r, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_struct requires _Expect (not AndReturn)");
+#define ptr_ret_struct_Expect(r) ptr_ret_struct_CMockExpect(__LINE__, r)
+void ptr_ret_struct_CMockExpect(UNITY_LINE_TYPE cmock_line, struct a_struct* r);
+typedef struct _CMOCK_ptr_ret_struct_EXPECT_ROW
+{
+  struct a_struct* r;
+} ptr_ret_struct_ExpectRow;
+#define ptr_ret_struct_ExpectTable(cmock_rows, cmock_count) ptr_ret_struct_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_struct_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_struct_ExpectWithArrayAndReturn(r, r_Depth, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_struct requires _ExpectWithArray (not AndReturn)");
+#define ptr_ret_struct_ExpectWithArray(r, r_Depth) ptr_ret_struct_CMockExpectWithArray(__LINE__, r, (r_Depth))
+void ptr_ret_struct_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, struct a_struct* r, int r_Depth);
+#define ptr_ret_struct_ReturnThruPtr_r(r) ptr_ret_struct_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(struct a_struct))
+#define ptr_ret_struct_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_struct_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_struct_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_struct_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_struct_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, struct a_struct const* r, size_t cmock_size);
+#define ptr_ret_abstract_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_abstract requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_abstract_ExpectAnyArgs() ptr_ret_abstract_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_abstract_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_abstract_ExpectAndReturn(r, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_abstract requires _Expect (not AndReturn)");
+#define ptr_ret_abstract_Expect(r) ptr_ret_abstract_CMockExpect(__LINE__, r)
+void ptr_ret_abstract_CMockExpect(UNITY_LINE_TYPE cmock_line, abs_struct* r);
+typedef struct _CMOCK_ptr_ret_abstract_EXPECT_ROW
+{
+  abs_struct* r;
+} ptr_ret_abstract_ExpectRow;
+#define ptr_ret_abstract_ExpectTable(cmock_rows, cmock_count) ptr_ret_abstract_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_abstract_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_abstract_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_abstract_ExpectWithArrayAndReturn(r, r_Depth, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_abstract requires _ExpectWithArray (not AndReturn)");
+#define ptr_ret_abstract_ExpectWithArray(r, r_Depth) ptr_ret_abstract_CMockExpectWithArray(__LINE__, r, (r_Depth))
+void ptr_ret_abstract_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, abs_struct* r, int r_Depth);
+#define ptr_ret_abstract_ReturnThruPtr_r(r) ptr_ret_abstract_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(abs_struct))
+#define ptr_ret_abstract_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_abstract_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_abstract_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_abstract_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_abstract_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, abs_struct const* r, size_t cmock_size);
+#define ptr_ret_abstract_array_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_abstract_array requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_abstract_array_ExpectAnyArgs() ptr_ret_abstract_array_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_abstract_array_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_abstract_array_ExpectAndReturn(r, len, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_abstract_array requires _Expect (not AndReturn)");
+#define ptr_ret_abstract_array_Expect(r, len) ptr_ret_abstract_array_CMockExpect(__LINE__, r, len)
+void ptr_ret_abstract_array_CMockExpect(UNITY_LINE_TYPE cmock_line, abs_struct* r, int len);
+typedef struct _CMOCK_ptr_ret_abstract_array_EXPECT_ROW
+{
+  abs_struct* r;
+  int len;
+} ptr_ret_abstract_array_ExpectRow;
+#define ptr_ret_abstract_array_ExpectTable(cmock_rows, cmock_count) ptr_ret_abstract_array_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_abstract_array_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_abstract_array_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_abstract_array_ExpectWithArrayAndReturn(r, r_Depth, len, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_abstract_array requires _ExpectWithArray (not AndReturn)");
+#define ptr_ret_abstract_array_ExpectWithArray(r, r_Depth, len) ptr_ret_abstract_array_CMockExpectWithArray(__LINE__, r, (r_Depth), len)
+void ptr_ret_abstract_array_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, abs_struct* r, int r_Depth, int len);
+#define ptr_ret_abstract_array_ReturnThruPtr_r(r) ptr_ret_abstract_array_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(abs_struct))
+#define ptr_ret_abstract_array_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_abstract_array_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_abstract_array_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_abstract_array_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_abstract_array_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, abs_struct const* r, size_t cmock_size);
+#define ptr_ret_const_int_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_const_int requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_const_int_ExpectAnyArgs() ptr_ret_const_int_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_const_int_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_const_int_ExpectAndReturn(r, s, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_const_int requires _Expect (not AndReturn)");
+#define ptr_ret_const_int_Expect(r, s) ptr_ret_const_int_CMockExpect(__LINE__, r, s)
+void ptr_ret_const_int_CMockExpect(UNITY_LINE_TYPE cmock_line, int* r, const int* s);
+typedef struct _CMOCK_ptr_ret_const_int_EXPECT_ROW
+{
+  int* r;
+  const int* s;
+} ptr_ret_const_int_ExpectRow;
+#define ptr_ret_const_int_ExpectTable(cmock_rows, cmock_count) ptr_ret_const_int_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_const_int_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_const_int_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_const_int_ExpectWithArrayAndReturn(r, r_Depth, s, s_Depth, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_const_int requires _ExpectWithArray (not AndReturn)");
+#define ptr_ret_const_int_ExpectWithArray(r, r_Depth, s, s_Depth) ptr_ret_const_int_CMockExpectWithArray(__LINE__, r, (r_Depth), s, (s_Depth))
+void ptr_ret_const_int_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, int* r, int r_Depth, const int* s, int s_Depth);
+#define ptr_ret_const_int_ReturnThruPtr_r(r) ptr_ret_const_int_CMockReturnMemThruPtr_r(__LINE__, r, sizeof(int))
+#define ptr_ret_const_int_ReturnArrayThruPtr_r(r, cmock_len) ptr_ret_const_int_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_len * sizeof(*r)))
+#define ptr_ret_const_int_ReturnMemThruPtr_r(r, cmock_size) ptr_ret_const_int_CMockReturnMemThruPtr_r(__LINE__, r, (cmock_size))
+void ptr_ret_const_int_CMockReturnMemThruPtr_r(UNITY_LINE_TYPE cmock_line, int const* r, size_t cmock_size);
+#define ptr_ret_string_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_string requires _ExpectAnyArgs (not AndReturn)");
+#define ptr_ret_string_ExpectAnyArgs() ptr_ret_string_CMockExpectAnyArgs(__LINE__)
+void ptr_ret_string_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define ptr_ret_string_ExpectAndReturn(s, cmock_retval) TEST_FAIL_MESSAGE("ptr_ret_string requires _Expect (not AndReturn)");
+#define ptr_ret_string_Expect(s) ptr_ret_string_CMockExpect(__LINE__, s)
+void ptr_ret_string_CMockExpect(UNITY_LINE_TYPE cmock_line, char* s);
+typedef struct _CMOCK_ptr_ret_string_EXPECT_ROW
+{
+  char* s;
+} ptr_ret_string_ExpectRow;
+#define ptr_ret_string_ExpectTable(cmock_rows, cmock_count) ptr_ret_string_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ptr_ret_string_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ptr_ret_string_ExpectRow* cmock_rows, size_t cmock_count);
+#define ptr_ret_string_ReturnThruPtr_s(s) ptr_ret_string_CMockReturnMemThruPtr_s(__LINE__, s, sizeof(char))
+#define ptr_ret_string_ReturnArrayThruPtr_s(s, cmock_len) ptr_ret_string_CMockReturnMemThruPtr_s(__LINE__, s, (cmock_len * sizeof(*s)))
+#define ptr_ret_string_ReturnMemThruPtr_s(s, cmock_size) ptr_ret_string_CMockReturnMemThruPtr_s(__LINE__, s, (cmock_size))
+void ptr_ret_string_CMockReturnMemThruPtr_s(UNITY_LINE_TYPE cmock_line, char const* s, size_t cmock_size);
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,122 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "mock_sharded_mocks_mockable_internal.h"
+
+CMOCK_THREAD_STORAGE struct mock_sharded_mocks_mockableInstance Mock;
+
+const char CMockString_channel[] = "channel";
+const char CMockString_flush[] = "flush";
+const char CMockString_read_a[] = "read_a";
+const char CMockString_read_b[] = "read_b";
+const char CMockString_value[] = "value";
+const char CMockString_write_a[] = "write_a";
+const char CMockString_write_b[] = "write_b";
+
+CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY CMockRegistry = { mock_sharded_mocks_mockable_Verify, mock_sharded_mocks_mockable_Destroy, NULL, 0 };
+
+void CMockActivate(void)
+{
+  CMock_Register(&CMockRegistry);
+}
+
+void mock_sharded_mocks_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  int cmock_touched;
+  for (cmock_touched = 0; cmock_touched < Mock.CMockTouchedCount; cmock_touched++)
+  {
+    switch (Mock.CMockTouchedList[cmock_touched])
+    {
+      case CMOCK_read_a_ID:
+        call_instance = Mock.read_a_CallInstance;
+        if (Mock.read_a_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_read_a);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        break;
+      case CMOCK_read_b_ID:
+        call_instance = Mock.read_b_CallInstance;
+        if (Mock.read_b_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_read_b);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        break;
+      case CMOCK_write_a_ID:
+        call_instance = Mock.write_a_CallInstance;
+        if (Mock.write_a_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_write_a);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        break;
+      case CMOCK_write_b_ID:
+        call_instance = Mock.write_b_CallInstance;
+        if (Mock.write_b_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_write_b);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        break;
+      case CMOCK_flush_ID:
+        call_instance = Mock.flush_CallInstance;
+        if (Mock.flush_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_flush);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        break;
+      default:
+        break;
+    }
+  }
+}
+
+void mock_sharded_mocks_mockable_Init(void)
+{
+  mock_sharded_mocks_mockable_Destroy();
+}
+
+void mock_sharded_mocks_mockable_Destroy(void)
+{
+  int cmock_touched;
+  CMock_Guts_MemFreeAll();
+  for (cmock_touched = 0; cmock_touched < Mock.CMockTouchedCount; cmock_touched++)
+  {
+    switch (Mock.CMockTouchedList[cmock_touched])
+    {
+      case CMOCK_read_a_ID:
+        CMOCK_CLEAR(read_a);
+        break;
+      case CMOCK_read_b_ID:
+        CMOCK_CLEAR(read_b);
+        break;
+      case CMOCK_write_a_ID:
+        CMOCK_CLEAR(write_a);
+        break;
+      case CMOCK_write_b_ID:
+        CMOCK_CLEAR(write_b);
+        break;
+      case CMOCK_flush_ID:
+        CMOCK_CLEAR(flush);
+        break;
+      default:
+        break;
+    }
+  }
+  Mock.CMockTouchedCount = 0;
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
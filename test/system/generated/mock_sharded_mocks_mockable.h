@@ -0,0 +1,134 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_SHARDED_MOCKS_MOCKABLE_H
+#define _MOCK_SHARDED_MOCKS_MOCKABLE_H
+
+#include "unity.h"
+#include "sharded_mocks_types.h"
+#include "sharded_mocks_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_sharded_mocks_mockable_Init(void);
+void mock_sharded_mocks_mockable_Destroy(void);
+void mock_sharded_mocks_mockable_Verify(void);
+
+
+
+
+
+#define read_a_Ignore() TEST_FAIL_MESSAGE("read_a requires _IgnoreAndReturn");
+#define read_a_IgnoreAndReturn(cmock_retval) read_a_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_a_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_a_StopIgnore() read_a_CMockStopIgnore()
+void read_a_CMockStopIgnore(void);
+#define read_a_Expect(channel) TEST_FAIL_MESSAGE("read_a requires _ExpectAndReturn");
+#define read_a_ExpectAndReturn(channel, cmock_retval) read_a_CMockExpectAndReturn(__LINE__, channel, cmock_retval)
+void read_a_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int channel, int cmock_to_return);
+typedef struct _CMOCK_read_a_EXPECT_ROW
+{
+  int channel;
+  int ReturnVal;
+} read_a_ExpectRow;
+#define read_a_ExpectTable(cmock_rows, cmock_count) read_a_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_a_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define read_a_IgnoreArg_channel() read_a_CMockIgnoreArg_channel(__LINE__)
+void read_a_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line);
+
+#define read_b_Ignore() TEST_FAIL_MESSAGE("read_b requires _IgnoreAndReturn");
+#define read_b_IgnoreAndReturn(cmock_retval) read_b_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_b_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_b_StopIgnore() read_b_CMockStopIgnore()
+void read_b_CMockStopIgnore(void);
+#define read_b_Expect(channel) TEST_FAIL_MESSAGE("read_b requires _ExpectAndReturn");
+#define read_b_ExpectAndReturn(channel, cmock_retval) read_b_CMockExpectAndReturn(__LINE__, channel, cmock_retval)
+void read_b_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int channel, int cmock_to_return);
+typedef struct _CMOCK_read_b_EXPECT_ROW
+{
+  int channel;
+  int ReturnVal;
+} read_b_ExpectRow;
+#define read_b_ExpectTable(cmock_rows, cmock_count) read_b_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_b_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define read_b_IgnoreArg_channel() read_b_CMockIgnoreArg_channel(__LINE__)
+void read_b_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line);
+
+#define write_a_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("write_a requires _Ignore (not AndReturn)");
+#define write_a_Ignore() write_a_CMockIgnore()
+void write_a_CMockIgnore(void);
+#define write_a_StopIgnore() write_a_CMockStopIgnore()
+void write_a_CMockStopIgnore(void);
+#define write_a_ExpectAndReturn(channel, value, cmock_retval) TEST_FAIL_MESSAGE("write_a requires _Expect (not AndReturn)");
+#define write_a_Expect(channel, value) write_a_CMockExpect(__LINE__, channel, value)
+void write_a_CMockExpect(UNITY_LINE_TYPE cmock_line, int channel, int value);
+typedef struct _CMOCK_write_a_EXPECT_ROW
+{
+  int channel;
+  int value;
+} write_a_ExpectRow;
+#define write_a_ExpectTable(cmock_rows, cmock_count) write_a_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_a_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define write_a_IgnoreArg_channel() write_a_CMockIgnoreArg_channel(__LINE__)
+void write_a_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line);
+
+#define write_a_IgnoreArg_value() write_a_CMockIgnoreArg_value(__LINE__)
+void write_a_CMockIgnoreArg_value(UNITY_LINE_TYPE cmock_line);
+
+#define write_b_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("write_b requires _Ignore (not AndReturn)");
+#define write_b_Ignore() write_b_CMockIgnore()
+void write_b_CMockIgnore(void);
+#define write_b_StopIgnore() write_b_CMockStopIgnore()
+void write_b_CMockStopIgnore(void);
+#define write_b_ExpectAndReturn(channel, value, cmock_retval) TEST_FAIL_MESSAGE("write_b requires _Expect (not AndReturn)");
+#define write_b_Expect(channel, value) write_b_CMockExpect(__LINE__, channel, value)
+void write_b_CMockExpect(UNITY_LINE_TYPE cmock_line, int channel, int value);
+typedef struct _CMOCK_write_b_EXPECT_ROW
+{
+  int channel;
+  int value;
+} write_b_ExpectRow;
+#define write_b_ExpectTable(cmock_rows, cmock_count) write_b_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_b_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define write_b_IgnoreArg_channel() write_b_CMockIgnoreArg_channel(__LINE__)
+void write_b_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line);
+
+#define write_b_IgnoreArg_value() write_b_CMockIgnoreArg_value(__LINE__)
+void write_b_CMockIgnoreArg_value(UNITY_LINE_TYPE cmock_line);
+
+#define flush_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("flush requires _Ignore (not AndReturn)");
+#define flush_Ignore() flush_CMockIgnore()
+void flush_CMockIgnore(void);
+#define flush_StopIgnore() flush_CMockStopIgnore()
+void flush_CMockStopIgnore(void);
+#define flush_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("flush requires _Expect (not AndReturn)");
+#define flush_Expect() flush_CMockExpect(__LINE__)
+void flush_CMockExpect(UNITY_LINE_TYPE cmock_line);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,137 @@
+#ifndef _MOCK_SHARDED_MOCKS_MOCKABLE_INTERNAL_H
+#define _MOCK_SHARDED_MOCKS_MOCKABLE_INTERNAL_H
+
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <stddef.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_sharded_mocks_mockable.h"
+
+#define CMockString_channel mock_sharded_mocks_mockable_CMockString_channel
+extern const char CMockString_channel[];
+#define CMockString_flush mock_sharded_mocks_mockable_CMockString_flush
+extern const char CMockString_flush[];
+#define CMockString_read_a mock_sharded_mocks_mockable_CMockString_read_a
+extern const char CMockString_read_a[];
+#define CMockString_read_b mock_sharded_mocks_mockable_CMockString_read_b
+extern const char CMockString_read_b[];
+#define CMockString_value mock_sharded_mocks_mockable_CMockString_value
+extern const char CMockString_value[];
+#define CMockString_write_a mock_sharded_mocks_mockable_CMockString_write_a
+extern const char CMockString_write_a[];
+#define CMockString_write_b mock_sharded_mocks_mockable_CMockString_write_b
+extern const char CMockString_write_b[];
+
+#define Mock mock_sharded_mocks_mockable_Mock
+#define CMockRegistry mock_sharded_mocks_mockable_CMockRegistry
+#define CMockActivate mock_sharded_mocks_mockable_CMockActivate
+
+typedef struct _CMOCK_read_a_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int CallOrder;
+  int Expected_channel;
+  char IgnoreArg_channel;
+
+} CMOCK_read_a_CALL_INSTANCE;
+
+typedef struct _CMOCK_read_b_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int CallOrder;
+  int Expected_channel;
+  char IgnoreArg_channel;
+
+} CMOCK_read_b_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_a_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_channel;
+  int Expected_value;
+  char IgnoreArg_channel;
+  char IgnoreArg_value;
+
+} CMOCK_write_a_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_b_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_channel;
+  int Expected_value;
+  char IgnoreArg_channel;
+  char IgnoreArg_value;
+
+} CMOCK_write_b_CALL_INSTANCE;
+
+typedef struct _CMOCK_flush_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+
+} CMOCK_flush_CALL_INSTANCE;
+
+enum
+{
+  CMOCK_read_a_ID,
+  CMOCK_read_b_ID,
+  CMOCK_write_a_ID,
+  CMOCK_write_b_ID,
+  CMOCK_flush_ID,
+  CMOCK_mock_sharded_mocks_mockable_FUNCTION_COUNT
+};
+
+struct mock_sharded_mocks_mockableInstance
+{
+  char read_a_Touched;
+  char read_a_IgnoreBool;
+  int read_a_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE read_a_CallInstance;
+  char read_b_Touched;
+  char read_b_IgnoreBool;
+  int read_b_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE read_b_CallInstance;
+  char write_a_Touched;
+  char write_a_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE write_a_CallInstance;
+  char write_b_Touched;
+  char write_b_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE write_b_CallInstance;
+  char flush_Touched;
+  char flush_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE flush_CallInstance;
+  int CMockTouchedList[CMOCK_mock_sharded_mocks_mockable_FUNCTION_COUNT];
+  int CMockTouchedCount;
+};
+extern CMOCK_THREAD_STORAGE struct mock_sharded_mocks_mockableInstance Mock;
+
+#define CMOCK_TOUCH(func) \
+  do { if (!Mock.func##_Touched) { Mock.func##_Touched = 1; Mock.CMockTouchedList[Mock.CMockTouchedCount++] = CMOCK_##func##_ID; } } while (0)
+#define CMOCK_CLEAR(func) \
+  memset(&Mock.func##_Touched, 0, offsetof(struct mock_sharded_mocks_mockableInstance, func##_CallInstance) + sizeof(CMOCK_MEM_INDEX_TYPE) - offsetof(struct mock_sharded_mocks_mockableInstance, func##_Touched))
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+extern CMOCK_THREAD_STORAGE CMOCK_REGISTRY_ENTRY CMockRegistry;
+void CMockActivate(void);
+
+#define CMOCK_REGISTER() \
+  do { if (!CMockRegistry.Active) { CMockActivate(); } } while (0)
+
+void CMockExpectParameters_read_a(CMOCK_read_a_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_read_b(CMOCK_read_b_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_write_a(CMOCK_write_a_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+void CMockExpectParameters_write_b(CMOCK_write_b_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+
+#endif /* _MOCK_SHARDED_MOCKS_MOCKABLE_INTERNAL_H */
@@ -0,0 +1,223 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "mock_sharded_mocks_mockable_internal.h"
+
+int read_a(int channel)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_a);
+  cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_a_CallInstance);
+  Mock.read_a_CallInstance = CMock_Guts_MemNext(Mock.read_a_CallInstance);
+  if (Mock.read_a_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_a_FinalReturn;
+  Mock.read_a_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->IgnoreArg_channel)
+  {
+    UNITY_SET_DETAILS(CMockString_read_a,CMockString_channel);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_channel, channel, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_read_a(CMOCK_read_a_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_read_a(CMOCK_read_a_CALL_INSTANCE* cmock_call_instance, int channel)
+{
+  cmock_call_instance->Expected_channel = channel;
+  cmock_call_instance->IgnoreArg_channel = 0;
+}
+
+void read_a_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_a_CALL_INSTANCE));
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_a_CallInstance = CMock_Guts_MemChain(Mock.read_a_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(read_a);
+  Mock.read_a_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_a_IgnoreBool = (char)1;
+}
+
+void read_a_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(read_a);
+  if(Mock.read_a_IgnoreBool)
+    Mock.read_a_CallInstance = CMock_Guts_MemNext(Mock.read_a_CallInstance);
+  Mock.read_a_IgnoreBool = (char)0;
+}
+
+void read_a_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int channel, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_a_CALL_INSTANCE));
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_a_CallInstance = CMock_Guts_MemChain(Mock.read_a_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(read_a);
+  Mock.read_a_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_read_a(cmock_call_instance, channel);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_a_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_a_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_a_CallInstance = CMock_Guts_MemChain(Mock.read_a_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_REGISTER();
+    CMOCK_TOUCH(read_a);
+    Mock.read_a_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_read_a(cmock_call_instance, cmock_rows[cmock_row].channel);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void read_a_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.read_a_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_channel = 1;
+}
+
+int read_b(int channel)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_b);
+  cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_b_CallInstance);
+  Mock.read_b_CallInstance = CMock_Guts_MemNext(Mock.read_b_CallInstance);
+  if (Mock.read_b_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_b_FinalReturn;
+  Mock.read_b_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->IgnoreArg_channel)
+  {
+    UNITY_SET_DETAILS(CMockString_read_b,CMockString_channel);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_channel, channel, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_read_b(CMOCK_read_b_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_read_b(CMOCK_read_b_CALL_INSTANCE* cmock_call_instance, int channel)
+{
+  cmock_call_instance->Expected_channel = channel;
+  cmock_call_instance->IgnoreArg_channel = 0;
+}
+
+void read_b_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_b_CALL_INSTANCE));
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_b_CallInstance = CMock_Guts_MemChain(Mock.read_b_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(read_b);
+  Mock.read_b_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_b_IgnoreBool = (char)1;
+}
+
+void read_b_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(read_b);
+  if(Mock.read_b_IgnoreBool)
+    Mock.read_b_CallInstance = CMock_Guts_MemNext(Mock.read_b_CallInstance);
+  Mock.read_b_IgnoreBool = (char)0;
+}
+
+void read_b_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int channel, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_b_CALL_INSTANCE));
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_b_CallInstance = CMock_Guts_MemChain(Mock.read_b_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(read_b);
+  Mock.read_b_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_read_b(cmock_call_instance, channel);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_b_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_b_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_b_CallInstance = CMock_Guts_MemChain(Mock.read_b_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_REGISTER();
+    CMOCK_TOUCH(read_b);
+    Mock.read_b_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_read_b(cmock_call_instance, cmock_rows[cmock_row].channel);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void read_b_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.read_b_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_channel = 1;
+}
+
@@ -0,0 +1,219 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include "mock_sharded_mocks_mockable_internal.h"
+
+void write_a(int channel, int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_a);
+  cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_a_CallInstance);
+  Mock.write_a_CallInstance = CMock_Guts_MemNext(Mock.write_a_CallInstance);
+  if (Mock.write_a_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->IgnoreArg_channel)
+  {
+    UNITY_SET_DETAILS(CMockString_write_a,CMockString_channel);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_channel, channel, cmock_line, CMockStringMismatch);
+  }
+  if (!cmock_call_instance->IgnoreArg_value)
+  {
+    UNITY_SET_DETAILS(CMockString_write_a,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_a(CMOCK_write_a_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+void CMockExpectParameters_write_a(CMOCK_write_a_CALL_INSTANCE* cmock_call_instance, int channel, int value)
+{
+  cmock_call_instance->Expected_channel = channel;
+  cmock_call_instance->IgnoreArg_channel = 0;
+  cmock_call_instance->Expected_value = value;
+  cmock_call_instance->IgnoreArg_value = 0;
+}
+
+void write_a_CMockIgnore(void)
+{
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)1;
+}
+
+void write_a_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)0;
+}
+
+void write_a_CMockExpect(UNITY_LINE_TYPE cmock_line, int channel, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_a_CALL_INSTANCE));
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_a_CallInstance = CMock_Guts_MemChain(Mock.write_a_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_write_a(cmock_call_instance, channel, value);
+}
+
+void write_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_a_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_a_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_a_CallInstance = CMock_Guts_MemChain(Mock.write_a_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_REGISTER();
+    CMOCK_TOUCH(write_a);
+    Mock.write_a_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_write_a(cmock_call_instance, cmock_rows[cmock_row].channel, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_a_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.write_a_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_channel = 1;
+}
+
+void write_a_CMockIgnoreArg_value(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.write_a_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_value = 1;
+}
+
+void write_b(int channel, int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_b);
+  cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_b_CallInstance);
+  Mock.write_b_CallInstance = CMock_Guts_MemNext(Mock.write_b_CallInstance);
+  if (Mock.write_b_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (!cmock_call_instance->IgnoreArg_channel)
+  {
+    UNITY_SET_DETAILS(CMockString_write_b,CMockString_channel);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_channel, channel, cmock_line, CMockStringMismatch);
+  }
+  if (!cmock_call_instance->IgnoreArg_value)
+  {
+    UNITY_SET_DETAILS(CMockString_write_b,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_b(CMOCK_write_b_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+void CMockExpectParameters_write_b(CMOCK_write_b_CALL_INSTANCE* cmock_call_instance, int channel, int value)
+{
+  cmock_call_instance->Expected_channel = channel;
+  cmock_call_instance->IgnoreArg_channel = 0;
+  cmock_call_instance->Expected_value = value;
+  cmock_call_instance->IgnoreArg_value = 0;
+}
+
+void write_b_CMockIgnore(void)
+{
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)1;
+}
+
+void write_b_CMockStopIgnore(void)
+{
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)0;
+}
+
+void write_b_CMockExpect(UNITY_LINE_TYPE cmock_line, int channel, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_b_CALL_INSTANCE));
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_b_CallInstance = CMock_Guts_MemChain(Mock.write_b_CallInstance, cmock_guts_index);
+  CMOCK_REGISTER();
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_write_b(cmock_call_instance, channel, value);
+}
+
+void write_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_b_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_b_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_b_CallInstance = CMock_Guts_MemChain(Mock.write_b_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_REGISTER();
+    CMOCK_TOUCH(write_b);
+    Mock.write_b_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_write_b(cmock_call_instance, cmock_rows[cmock_row].channel, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_b_CMockIgnoreArg_channel(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.write_b_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_channel = 1;
+}
+
+void write_b_CMockIgnoreArg_value(UNITY_LINE_TYPE cmock_line)
+{
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.write_b_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringIgnPreExp);
+  cmock_call_instance->IgnoreArg_value = 1;
+}
+
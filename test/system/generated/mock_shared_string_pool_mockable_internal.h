@@ -0,0 +1,52 @@
+#ifndef _MOCK_SHARED_STRING_POOL_MOCKABLE_INTERNAL_H
+#define _MOCK_SHARED_STRING_POOL_MOCKABLE_INTERNAL_H
+
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "cmock_strings.h"
+#include "mock_shared_string_pool_mockable.h"
+
+#define Mock mock_shared_string_pool_mockable_Mock
+
+typedef struct _CMOCK_read_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int Expected_channel;
+
+} CMOCK_read_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_value_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int Expected_channel;
+  int Expected_value;
+
+} CMOCK_write_value_CALL_INSTANCE;
+
+typedef struct _CMOCK_flush_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+
+} CMOCK_flush_CALL_INSTANCE;
+
+struct mock_shared_string_pool_mockableInstance
+{
+  char read_value_IgnoreBool;
+  int read_value_FinalReturn;
+  CMOCK_MEM_INDEX_TYPE read_value_CallInstance;
+  char write_value_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE write_value_CallInstance;
+  char flush_IgnoreBool;
+  CMOCK_MEM_INDEX_TYPE flush_CallInstance;
+};
+extern CMOCK_THREAD_STORAGE struct mock_shared_string_pool_mockableInstance Mock;
+
+
+void CMockExpectParameters_read_value(CMOCK_read_value_CALL_INSTANCE* cmock_call_instance, int channel);
+void CMockExpectParameters_write_value(CMOCK_write_value_CALL_INSTANCE* cmock_call_instance, int channel, int value);
+
+#endif /* _MOCK_SHARED_STRING_POOL_MOCKABLE_INTERNAL_H */
@@ -0,0 +1,336 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_shared_verify_helpers_mockable.h"
+
+static const char* CMockString_data = "data";
+static const char* CMockString_flags = "flags";
+static const char* CMockString_key = "key";
+static const char* CMockString_length = "length";
+static const char* CMockString_move = "move";
+static const char* CMockString_place = "place";
+static const char* CMockString_point = "point";
+static const char* CMockString_put = "put";
+static const char* CMockString_send = "send";
+static const char* CMockString_value = "value";
+
+typedef struct _CMOCK_put_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const char* Expected_key;
+  int Expected_value;
+  unsigned char Expected_flags;
+
+} CMOCK_put_CALL_INSTANCE;
+
+typedef struct _CMOCK_place_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T Expected_point;
+
+} CMOCK_place_CALL_INSTANCE;
+
+typedef struct _CMOCK_move_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  POINT_T* Expected_point;
+  int Expected_point_Depth;
+
+} CMOCK_move_CALL_INSTANCE;
+
+typedef struct _CMOCK_send_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  const short* Expected_data;
+  int Expected_length;
+  int Expected_data_Depth;
+
+} CMOCK_send_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_shared_verify_helpers_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE put_CallInstance;
+  CMOCK_MEM_INDEX_TYPE place_CallInstance;
+  CMOCK_MEM_INDEX_TYPE move_CallInstance;
+  CMOCK_MEM_INDEX_TYPE send_CallInstance;
+} Mock;
+
+
+void mock_shared_verify_helpers_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.put_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_put);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.place_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_place);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.move_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_move);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.send_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_send);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_shared_verify_helpers_mockable_Init(void)
+{
+  mock_shared_verify_helpers_mockable_Destroy();
+}
+
+void mock_shared_verify_helpers_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void put(const char* key, int value, unsigned char flags)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_put);
+  cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.put_CallInstance);
+  Mock.put_CallInstance = CMock_Guts_MemNext(Mock.put_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  { CMock_VerifyString(CMockString_put, CMockString_key, cmock_call_instance->Expected_key, key, cmock_line); }
+  { CMock_VerifyNumber(CMockString_put, CMockString_value, (UNITY_INT)(cmock_call_instance->Expected_value), (UNITY_INT)(value), UNITY_DISPLAY_STYLE_INT, cmock_line); }
+  { CMock_VerifyNumber(CMockString_put, CMockString_flags, (UNITY_INT)(UNITY_INT8)(cmock_call_instance->Expected_flags), (UNITY_INT)(UNITY_INT8)(flags), UNITY_DISPLAY_STYLE_HEX8, cmock_line); }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_put(CMOCK_put_CALL_INSTANCE* cmock_call_instance, const char* key, int value, unsigned char flags);
+void CMockExpectParameters_put(CMOCK_put_CALL_INSTANCE* cmock_call_instance, const char* key, int value, unsigned char flags)
+{
+  cmock_call_instance->Expected_key = key;
+  cmock_call_instance->Expected_value = value;
+  cmock_call_instance->Expected_flags = flags;
+}
+
+void put_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* key, int value, unsigned char flags)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_put_CALL_INSTANCE));
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.put_CallInstance = CMock_Guts_MemChain(Mock.put_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_put(cmock_call_instance, key, value, flags);
+}
+
+void put_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const put_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_put_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_put_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.put_CallInstance = CMock_Guts_MemChain(Mock.put_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_put_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_put(cmock_call_instance, cmock_rows[cmock_row].key, cmock_rows[cmock_row].value, cmock_rows[cmock_row].flags);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void place(POINT_T point)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_place);
+  cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.place_CallInstance);
+  Mock.place_CallInstance = CMock_Guts_MemNext(Mock.place_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  { CMock_VerifyMemory(CMockString_place, CMockString_point, (const void*)(&cmock_call_instance->Expected_point), (const void*)(&point), sizeof(POINT_T), 1, 1, cmock_line); }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_place(CMOCK_place_CALL_INSTANCE* cmock_call_instance, POINT_T point);
+void CMockExpectParameters_place(CMOCK_place_CALL_INSTANCE* cmock_call_instance, POINT_T point)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_point), (void*)(&point),
+         sizeof(POINT_T[sizeof(point) == sizeof(POINT_T) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void place_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T point)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_place_CALL_INSTANCE));
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.place_CallInstance = CMock_Guts_MemChain(Mock.place_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_place(cmock_call_instance, point);
+}
+
+void place_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const place_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_place_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_place_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.place_CallInstance = CMock_Guts_MemChain(Mock.place_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_place_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_place(cmock_call_instance, cmock_rows[cmock_row].point);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void move(POINT_T* point)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_move);
+  cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.move_CallInstance);
+  Mock.move_CallInstance = CMock_Guts_MemNext(Mock.move_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  { CMock_VerifyMemory(CMockString_move, CMockString_point, (const void*)(cmock_call_instance->Expected_point), (const void*)(point), sizeof(POINT_T), cmock_call_instance->Expected_point_Depth, 1, cmock_line); }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* point, int point_Depth);
+void CMockExpectParameters_move(CMOCK_move_CALL_INSTANCE* cmock_call_instance, POINT_T* point, int point_Depth)
+{
+  cmock_call_instance->Expected_point = point;
+  cmock_call_instance->Expected_point_Depth = point_Depth;
+}
+
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* point)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, point, 1);
+}
+
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_move_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_move(cmock_call_instance, cmock_rows[cmock_row].point, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void move_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* point, int point_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_move_CALL_INSTANCE));
+  CMOCK_move_CALL_INSTANCE* cmock_call_instance = (CMOCK_move_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.move_CallInstance = CMock_Guts_MemChain(Mock.move_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_move(cmock_call_instance, point, point_Depth);
+}
+
+void send(const short* data, int length)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_send);
+  cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.send_CallInstance);
+  Mock.send_CallInstance = CMock_Guts_MemNext(Mock.send_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  { CMock_VerifyIntArray(CMockString_send, CMockString_data, (const void*)(cmock_call_instance->Expected_data), (const void*)(data), cmock_call_instance->Expected_data_Depth, 1, UNITY_DISPLAY_STYLE_INT16, cmock_line); }
+  { CMock_VerifyNumber(CMockString_send, CMockString_length, (UNITY_INT)(cmock_call_instance->Expected_length), (UNITY_INT)(length), UNITY_DISPLAY_STYLE_INT, cmock_line); }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_send(CMOCK_send_CALL_INSTANCE* cmock_call_instance, const short* data, int data_Depth, int length);
+void CMockExpectParameters_send(CMOCK_send_CALL_INSTANCE* cmock_call_instance, const short* data, int data_Depth, int length)
+{
+  cmock_call_instance->Expected_data = data;
+  cmock_call_instance->Expected_data_Depth = data_Depth;
+  cmock_call_instance->Expected_length = length;
+}
+
+void send_CMockExpect(UNITY_LINE_TYPE cmock_line, const short* data, int length)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_send(cmock_call_instance, data, length, length);
+}
+
+void send_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const send_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_send_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_send(cmock_call_instance, cmock_rows[cmock_row].data, cmock_rows[cmock_row].length, cmock_rows[cmock_row].length);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void send_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, const short* data, int data_Depth, int length)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_send_CALL_INSTANCE));
+  CMOCK_send_CALL_INSTANCE* cmock_call_instance = (CMOCK_send_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.send_CallInstance = CMock_Guts_MemChain(Mock.send_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_send(cmock_call_instance, data, data_Depth, length);
+}
+
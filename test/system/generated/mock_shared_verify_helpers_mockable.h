@@ -0,0 +1,88 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_SHARED_VERIFY_HELPERS_MOCKABLE_H
+#define _MOCK_SHARED_VERIFY_HELPERS_MOCKABLE_H
+
+#include "unity.h"
+#include "shared_verify_helpers_types.h"
+#include "shared_verify_helpers_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_shared_verify_helpers_mockable_Init(void);
+void mock_shared_verify_helpers_mockable_Destroy(void);
+void mock_shared_verify_helpers_mockable_Verify(void);
+
+
+
+
+#define put_ExpectAndReturn(key, value, flags, cmock_retval) TEST_FAIL_MESSAGE("put requires _Expect (not AndReturn)");
+#define put_Expect(key, value, flags) put_CMockExpect(__LINE__, key, value, flags)
+void put_CMockExpect(UNITY_LINE_TYPE cmock_line, const char* key, int value, unsigned char flags);
+typedef struct _CMOCK_put_EXPECT_ROW
+{
+  const char* key;
+  int value;
+  unsigned char flags;
+} put_ExpectRow;
+#define put_ExpectTable(cmock_rows, cmock_count) put_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void put_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const put_ExpectRow* cmock_rows, size_t cmock_count);
+#define place_ExpectAndReturn(point, cmock_retval) TEST_FAIL_MESSAGE("place requires _Expect (not AndReturn)");
+#define place_Expect(point) place_CMockExpect(__LINE__, point)
+void place_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T point);
+typedef struct _CMOCK_place_EXPECT_ROW
+{
+  POINT_T point;
+} place_ExpectRow;
+#define place_ExpectTable(cmock_rows, cmock_count) place_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void place_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const place_ExpectRow* cmock_rows, size_t cmock_count);
+#define move_ExpectAndReturn(point, cmock_retval) TEST_FAIL_MESSAGE("move requires _Expect (not AndReturn)");
+#define move_Expect(point) move_CMockExpect(__LINE__, point)
+void move_CMockExpect(UNITY_LINE_TYPE cmock_line, POINT_T* point);
+typedef struct _CMOCK_move_EXPECT_ROW
+{
+  POINT_T* point;
+} move_ExpectRow;
+#define move_ExpectTable(cmock_rows, cmock_count) move_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void move_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const move_ExpectRow* cmock_rows, size_t cmock_count);
+#define move_ExpectWithArrayAndReturn(point, point_Depth, cmock_retval) TEST_FAIL_MESSAGE("move requires _ExpectWithArray (not AndReturn)");
+#define move_ExpectWithArray(point, point_Depth) move_CMockExpectWithArray(__LINE__, point, (point_Depth))
+void move_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, POINT_T* point, int point_Depth);
+#define send_ExpectAndReturn(data, length, cmock_retval) TEST_FAIL_MESSAGE("send requires _Expect (not AndReturn)");
+#define send_Expect(data, length) send_CMockExpect(__LINE__, data, length)
+void send_CMockExpect(UNITY_LINE_TYPE cmock_line, const short* data, int length);
+typedef struct _CMOCK_send_EXPECT_ROW
+{
+  const short* data;
+  int length;
+} send_ExpectRow;
+#define send_ExpectTable(cmock_rows, cmock_count) send_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void send_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const send_ExpectRow* cmock_rows, size_t cmock_count);
+#define send_ExpectWithArrayAndReturn(data, data_Depth, length, cmock_retval) TEST_FAIL_MESSAGE("send requires _ExpectWithArray (not AndReturn)");
+#define send_ExpectWithArray(data, data_Depth, length) send_CMockExpectWithArray(__LINE__, data, (data_Depth), length)
+void send_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, const short* data, int data_Depth, int length);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,53 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_SKELETON_MOCKABLE_H
+#define _MOCK_SKELETON_MOCKABLE_H
+
+#include "unity.h"
+#include "skeleton_types.h"
+#include "skeleton_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_skeleton_mockable_Init(void);
+void mock_skeleton_mockable_Destroy(void);
+void mock_skeleton_mockable_Verify(void);
+
+
+
+
+#define something_Expect(a) TEST_FAIL_MESSAGE("something requires _ExpectAndReturn");
+#define something_ExpectAndReturn(a, cmock_retval) something_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void something_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, UINT32 cmock_to_return);
+typedef struct _CMOCK_something_EXPECT_ROW
+{
+  int a;
+  UINT32 ReturnVal;
+} something_ExpectRow;
+#define something_ExpectTable(cmock_rows, cmock_count) something_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void something_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const something_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,104 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_skeleton_update_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_something = "something";
+
+typedef struct _CMOCK_something_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  UINT32 ReturnVal;
+  int Expected_a;
+
+} CMOCK_something_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_skeleton_update_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE something_CallInstance;
+} Mock;
+
+
+void mock_skeleton_update_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.something_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_something);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_skeleton_update_mockable_Init(void)
+{
+  mock_skeleton_update_mockable_Destroy();
+}
+
+void mock_skeleton_update_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+UINT32 something(int a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_something_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_something);
+  cmock_call_instance = (CMOCK_something_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.something_CallInstance);
+  Mock.something_CallInstance = CMock_Guts_MemNext(Mock.something_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_something,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_a, a, cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_something(CMOCK_something_CALL_INSTANCE* cmock_call_instance, int a);
+void CMockExpectParameters_something(CMOCK_something_CALL_INSTANCE* cmock_call_instance, int a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void something_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int a, UINT32 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_something_CALL_INSTANCE));
+  CMOCK_something_CALL_INSTANCE* cmock_call_instance = (CMOCK_something_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.something_CallInstance = CMock_Guts_MemChain(Mock.something_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_something(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void something_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const something_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_something_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_something_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.something_CallInstance = CMock_Guts_MemChain(Mock.something_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_something_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_something(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
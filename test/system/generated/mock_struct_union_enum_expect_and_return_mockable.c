@@ -0,0 +1,449 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_struct_union_enum_expect_and_return_mockable.h"
+#include "struct_union_enum_expect_and_return_unity_helper.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_cmock_arg1 = "cmock_arg1";
+static const char* CMockString_cmock_arg2 = "cmock_arg2";
+static const char* CMockString_foo_enum = "foo_enum";
+static const char* CMockString_foo_struct = "foo_struct";
+static const char* CMockString_foo_union = "foo_union";
+static const char* CMockString_foobar_enum = "foobar_enum";
+static const char* CMockString_foobar_struct = "foobar_struct";
+static const char* CMockString_foobar_union = "foobar_union";
+
+typedef struct _CMOCK_foo_struct_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  struct THING* Expected_cmock_arg1;
+  struct THING Expected_cmock_arg2;
+
+} CMOCK_foo_struct_CALL_INSTANCE;
+
+typedef struct _CMOCK_foobar_struct_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  struct THING ReturnVal;
+
+} CMOCK_foobar_struct_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_union_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  union STARS_AND_STRIPES* Expected_cmock_arg1;
+  union STARS_AND_STRIPES Expected_cmock_arg2;
+
+} CMOCK_foo_union_CALL_INSTANCE;
+
+typedef struct _CMOCK_foobar_union_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  union STARS_AND_STRIPES ReturnVal;
+
+} CMOCK_foobar_union_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_enum_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  enum HOKEY_POKEY Expected_a;
+  enum HOKEY_POKEY* Expected_b;
+
+} CMOCK_foo_enum_CALL_INSTANCE;
+
+typedef struct _CMOCK_foobar_enum_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  enum HOKEY_POKEY ReturnVal;
+
+} CMOCK_foobar_enum_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_struct_union_enum_expect_and_return_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE foo_struct_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foobar_struct_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foo_union_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foobar_union_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foo_enum_CallInstance;
+  CMOCK_MEM_INDEX_TYPE foobar_enum_CallInstance;
+} Mock;
+
+
+void mock_struct_union_enum_expect_and_return_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_struct_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_struct);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foobar_struct_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foobar_struct);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foo_union_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_union);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foobar_union_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foobar_union);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foo_enum_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_enum);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.foobar_enum_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foobar_enum);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_struct_union_enum_expect_and_return_mockable_Init(void)
+{
+  mock_struct_union_enum_expect_and_return_mockable_Destroy();
+}
+
+void mock_struct_union_enum_expect_and_return_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void foo_struct(struct THING* cmock_arg1, struct THING cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_struct);
+  cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_struct_CallInstance);
+  Mock.foo_struct_CallInstance = CMock_Guts_MemNext(Mock.foo_struct_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_struct,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(struct THING), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_struct,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(struct THING), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo_struct(CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance, struct THING* cmock_arg1, struct THING cmock_arg2);
+void CMockExpectParameters_foo_struct(CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance, struct THING* cmock_arg1, struct THING cmock_arg2)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(struct THING[sizeof(cmock_arg2) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_struct_CMockExpect(UNITY_LINE_TYPE cmock_line, struct THING* cmock_arg1, struct THING cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_struct_CALL_INSTANCE));
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_struct_CallInstance = CMock_Guts_MemChain(Mock.foo_struct_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_struct(cmock_call_instance, cmock_arg1, cmock_arg2);
+}
+
+void foo_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_struct_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_struct_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_struct_CallInstance = CMock_Guts_MemChain(Mock.foo_struct_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_struct(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+struct THING foobar_struct(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foobar_struct);
+  cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foobar_struct_CallInstance);
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemNext(Mock.foobar_struct_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void foobar_struct_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, struct THING cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_struct_CALL_INSTANCE));
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemChain(Mock.foobar_struct_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(struct THING[sizeof(cmock_to_return) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foobar_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_struct_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foobar_struct_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemChain(Mock.foobar_struct_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(struct THING[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_union(union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_union);
+  cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_union_CallInstance);
+  Mock.foo_union_CallInstance = CMock_Guts_MemNext(Mock.foo_union_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_union,CMockString_cmock_arg1);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(union STARS_AND_STRIPES), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_union,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(union STARS_AND_STRIPES), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo_union(CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance, union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2);
+void CMockExpectParameters_foo_union(CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance, union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_arg2) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_union_CMockExpect(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_union_CALL_INSTANCE));
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_union_CallInstance = CMock_Guts_MemChain(Mock.foo_union_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_union(cmock_call_instance, cmock_arg1, cmock_arg2);
+}
+
+void foo_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_union_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_union_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_union_CallInstance = CMock_Guts_MemChain(Mock.foo_union_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_union(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+union STARS_AND_STRIPES foobar_union(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foobar_union);
+  cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foobar_union_CallInstance);
+  Mock.foobar_union_CallInstance = CMock_Guts_MemNext(Mock.foobar_union_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void foobar_union_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_union_CALL_INSTANCE));
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_union_CallInstance = CMock_Guts_MemChain(Mock.foobar_union_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_to_return) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foobar_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_union_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foobar_union_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foobar_union_CallInstance = CMock_Guts_MemChain(Mock.foobar_union_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_enum(enum HOKEY_POKEY a, enum HOKEY_POKEY* b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_enum);
+  cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_enum_CallInstance);
+  Mock.foo_enum_CallInstance = CMock_Guts_MemNext(Mock.foo_enum_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_enum,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_a), (void*)(&a), sizeof(enum HOKEY_POKEY), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_enum,CMockString_b);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(cmock_call_instance->Expected_b), (void*)(b), sizeof(enum HOKEY_POKEY), cmock_line, CMockStringMismatch);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo_enum(CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance, enum HOKEY_POKEY a, enum HOKEY_POKEY* b);
+void CMockExpectParameters_foo_enum(CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance, enum HOKEY_POKEY a, enum HOKEY_POKEY* b)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(enum HOKEY_POKEY[sizeof(a) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  cmock_call_instance->Expected_b = b;
+}
+
+void foo_enum_CMockExpect(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY a, enum HOKEY_POKEY* b)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_enum_CALL_INSTANCE));
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_enum_CallInstance = CMock_Guts_MemChain(Mock.foo_enum_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_enum(cmock_call_instance, a, b);
+}
+
+void foo_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_enum_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_enum_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_enum_CallInstance = CMock_Guts_MemChain(Mock.foo_enum_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_enum(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+enum HOKEY_POKEY foobar_enum(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foobar_enum);
+  cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foobar_enum_CallInstance);
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemNext(Mock.foobar_enum_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void foobar_enum_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_enum_CALL_INSTANCE));
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemChain(Mock.foobar_enum_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(enum HOKEY_POKEY[sizeof(cmock_to_return) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foobar_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_enum_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foobar_enum_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemChain(Mock.foobar_enum_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(enum HOKEY_POKEY[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
@@ -0,0 +1,101 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_STRUCT_UNION_ENUM_EXPECT_AND_RETURN_MOCKABLE_H
+#define _MOCK_STRUCT_UNION_ENUM_EXPECT_AND_RETURN_MOCKABLE_H
+
+#include "unity.h"
+#include "struct_union_enum_expect_and_return_types.h"
+#include "struct_union_enum_expect_and_return_unity_helper.h"
+#include "struct_union_enum_expect_and_return_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_struct_union_enum_expect_and_return_mockable_Init(void);
+void mock_struct_union_enum_expect_and_return_mockable_Destroy(void);
+void mock_struct_union_enum_expect_and_return_mockable_Verify(void);
+
+
+
+
+#define foo_struct_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("foo_struct requires _Expect (not AndReturn)");
+#define foo_struct_Expect(cmock_arg1, cmock_arg2) foo_struct_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void foo_struct_CMockExpect(UNITY_LINE_TYPE cmock_line, struct THING* cmock_arg1, struct THING cmock_arg2);
+typedef struct _CMOCK_foo_struct_EXPECT_ROW
+{
+  struct THING* cmock_arg1;
+  struct THING cmock_arg2;
+} foo_struct_ExpectRow;
+#define foo_struct_ExpectTable(cmock_rows, cmock_count) foo_struct_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_struct_ExpectRow* cmock_rows, size_t cmock_count);
+#define foobar_struct_Expect() TEST_FAIL_MESSAGE("foobar_struct requires _ExpectAndReturn");
+#define foobar_struct_ExpectAndReturn(cmock_retval) foobar_struct_CMockExpectAndReturn(__LINE__, cmock_retval)
+void foobar_struct_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, struct THING cmock_to_return);
+typedef struct _CMOCK_foobar_struct_EXPECT_ROW
+{
+  struct THING ReturnVal;
+} foobar_struct_ExpectRow;
+#define foobar_struct_ExpectTable(cmock_rows, cmock_count) foobar_struct_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foobar_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_struct_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_union_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("foo_union requires _Expect (not AndReturn)");
+#define foo_union_Expect(cmock_arg1, cmock_arg2) foo_union_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void foo_union_CMockExpect(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2);
+typedef struct _CMOCK_foo_union_EXPECT_ROW
+{
+  union STARS_AND_STRIPES* cmock_arg1;
+  union STARS_AND_STRIPES cmock_arg2;
+} foo_union_ExpectRow;
+#define foo_union_ExpectTable(cmock_rows, cmock_count) foo_union_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_union_ExpectRow* cmock_rows, size_t cmock_count);
+#define foobar_union_Expect() TEST_FAIL_MESSAGE("foobar_union requires _ExpectAndReturn");
+#define foobar_union_ExpectAndReturn(cmock_retval) foobar_union_CMockExpectAndReturn(__LINE__, cmock_retval)
+void foobar_union_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES cmock_to_return);
+typedef struct _CMOCK_foobar_union_EXPECT_ROW
+{
+  union STARS_AND_STRIPES ReturnVal;
+} foobar_union_ExpectRow;
+#define foobar_union_ExpectTable(cmock_rows, cmock_count) foobar_union_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foobar_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_union_ExpectRow* cmock_rows, size_t cmock_count);
+#define foo_enum_ExpectAndReturn(a, b, cmock_retval) TEST_FAIL_MESSAGE("foo_enum requires _Expect (not AndReturn)");
+#define foo_enum_Expect(a, b) foo_enum_CMockExpect(__LINE__, a, b)
+void foo_enum_CMockExpect(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY a, enum HOKEY_POKEY* b);
+typedef struct _CMOCK_foo_enum_EXPECT_ROW
+{
+  enum HOKEY_POKEY a;
+  enum HOKEY_POKEY* b;
+} foo_enum_ExpectRow;
+#define foo_enum_ExpectTable(cmock_rows, cmock_count) foo_enum_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_enum_ExpectRow* cmock_rows, size_t cmock_count);
+#define foobar_enum_Expect() TEST_FAIL_MESSAGE("foobar_enum requires _ExpectAndReturn");
+#define foobar_enum_ExpectAndReturn(cmock_retval) foobar_enum_CMockExpectAndReturn(__LINE__, cmock_retval)
+void foobar_enum_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY cmock_to_return);
+typedef struct _CMOCK_foobar_enum_EXPECT_ROW
+{
+  enum HOKEY_POKEY ReturnVal;
+} foobar_enum_ExpectRow;
+#define foobar_enum_ExpectTable(cmock_rows, cmock_count) foobar_enum_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foobar_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_enum_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,917 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_struct_union_enum_expect_and_return_with_plugins_mockable.h"
+#include "struct_union_enum_expect_and_return_with_plugins_unity_helper.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_b = "b";
+static const char* CMockString_cmock_arg1 = "cmock_arg1";
+static const char* CMockString_cmock_arg2 = "cmock_arg2";
+static const char* CMockString_foo_enum = "foo_enum";
+static const char* CMockString_foo_struct = "foo_struct";
+static const char* CMockString_foo_union = "foo_union";
+static const char* CMockString_foobar_enum = "foobar_enum";
+static const char* CMockString_foobar_struct = "foobar_struct";
+static const char* CMockString_foobar_union = "foobar_union";
+
+typedef struct _CMOCK_foo_struct_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  struct THING* Expected_cmock_arg1;
+  struct THING Expected_cmock_arg2;
+  int Expected_cmock_arg1_Depth;
+  char ReturnThruPtr_cmock_arg1_Used;
+  struct THING const* ReturnThruPtr_cmock_arg1_Val;
+  size_t ReturnThruPtr_cmock_arg1_Size;
+
+} CMOCK_foo_struct_CALL_INSTANCE;
+
+typedef struct _CMOCK_foobar_struct_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  struct THING ReturnVal;
+
+} CMOCK_foobar_struct_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_union_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  union STARS_AND_STRIPES* Expected_cmock_arg1;
+  union STARS_AND_STRIPES Expected_cmock_arg2;
+  int Expected_cmock_arg1_Depth;
+  char ReturnThruPtr_cmock_arg1_Used;
+  union STARS_AND_STRIPES const* ReturnThruPtr_cmock_arg1_Val;
+  size_t ReturnThruPtr_cmock_arg1_Size;
+
+} CMOCK_foo_union_CALL_INSTANCE;
+
+typedef struct _CMOCK_foobar_union_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  union STARS_AND_STRIPES ReturnVal;
+
+} CMOCK_foobar_union_CALL_INSTANCE;
+
+typedef struct _CMOCK_foo_enum_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  enum HOKEY_POKEY Expected_a;
+  enum HOKEY_POKEY* Expected_b;
+  int Expected_b_Depth;
+  char ReturnThruPtr_b_Used;
+  enum HOKEY_POKEY const* ReturnThruPtr_b_Val;
+  size_t ReturnThruPtr_b_Size;
+
+} CMOCK_foo_enum_CALL_INSTANCE;
+
+typedef struct _CMOCK_foobar_enum_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  enum HOKEY_POKEY ReturnVal;
+
+} CMOCK_foobar_enum_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_struct_union_enum_expect_and_return_with_plugins_mockableInstance
+{
+  char foo_struct_IgnoreBool;
+  char foo_struct_CallbackBool;
+  CMOCK_foo_struct_CALLBACK foo_struct_CallbackFunctionPointer;
+  int foo_struct_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foo_struct_CallInstance;
+  char foobar_struct_IgnoreBool;
+  struct THING foobar_struct_FinalReturn;
+  char foobar_struct_CallbackBool;
+  CMOCK_foobar_struct_CALLBACK foobar_struct_CallbackFunctionPointer;
+  int foobar_struct_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foobar_struct_CallInstance;
+  char foo_union_IgnoreBool;
+  char foo_union_CallbackBool;
+  CMOCK_foo_union_CALLBACK foo_union_CallbackFunctionPointer;
+  int foo_union_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foo_union_CallInstance;
+  char foobar_union_IgnoreBool;
+  union STARS_AND_STRIPES foobar_union_FinalReturn;
+  char foobar_union_CallbackBool;
+  CMOCK_foobar_union_CALLBACK foobar_union_CallbackFunctionPointer;
+  int foobar_union_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foobar_union_CallInstance;
+  char foo_enum_IgnoreBool;
+  char foo_enum_CallbackBool;
+  CMOCK_foo_enum_CALLBACK foo_enum_CallbackFunctionPointer;
+  int foo_enum_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foo_enum_CallInstance;
+  char foobar_enum_IgnoreBool;
+  enum HOKEY_POKEY foobar_enum_FinalReturn;
+  char foobar_enum_CallbackBool;
+  CMOCK_foobar_enum_CALLBACK foobar_enum_CallbackFunctionPointer;
+  int foobar_enum_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foobar_enum_CallInstance;
+} Mock;
+
+
+void mock_struct_union_enum_expect_and_return_with_plugins_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_struct_CallInstance;
+  if (Mock.foo_struct_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_struct);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foo_struct_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.foobar_struct_CallInstance;
+  if (Mock.foobar_struct_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foobar_struct);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foobar_struct_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.foo_union_CallInstance;
+  if (Mock.foo_union_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_union);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foo_union_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.foobar_union_CallInstance;
+  if (Mock.foobar_union_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foobar_union);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foobar_union_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.foo_enum_CallInstance;
+  if (Mock.foo_enum_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo_enum);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foo_enum_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.foobar_enum_CallInstance;
+  if (Mock.foobar_enum_IgnoreBool)
+    call_instance = CMOCK_GUTS_NONE;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foobar_enum);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foobar_enum_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+}
+
+void mock_struct_union_enum_expect_and_return_with_plugins_mockable_Init(void)
+{
+  mock_struct_union_enum_expect_and_return_with_plugins_mockable_Destroy();
+}
+
+void mock_struct_union_enum_expect_and_return_with_plugins_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void foo_struct(struct THING* cmock_arg1, struct THING cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_struct);
+  cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_struct_CallInstance);
+  Mock.foo_struct_CallInstance = CMock_Guts_MemNext(Mock.foo_struct_CallInstance);
+  if (Mock.foo_struct_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.foo_struct_CallbackBool &&
+      Mock.foo_struct_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_struct_CallbackFunctionPointer(cmock_arg1, cmock_arg2, Mock.foo_struct_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_struct,CMockString_cmock_arg1);
+    if (cmock_call_instance->Expected_cmock_arg1 == NULL)
+      { UNITY_TEST_ASSERT_NULL(cmock_arg1, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(struct THING), cmock_call_instance->Expected_cmock_arg1_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_struct,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(struct THING), cmock_line, CMockStringMismatch);
+  }
+  if (Mock.foo_struct_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_struct_CallbackFunctionPointer(cmock_arg1, cmock_arg2, Mock.foo_struct_CallbackCalls++);
+  }
+  if (cmock_call_instance->ReturnThruPtr_cmock_arg1_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(cmock_arg1, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)cmock_arg1, (const void*)cmock_call_instance->ReturnThruPtr_cmock_arg1_Val, 
+      cmock_call_instance->ReturnThruPtr_cmock_arg1_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo_struct(CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance, struct THING* cmock_arg1, int cmock_arg1_Depth, struct THING cmock_arg2);
+void CMockExpectParameters_foo_struct(CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance, struct THING* cmock_arg1, int cmock_arg1_Depth, struct THING cmock_arg2)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+  cmock_call_instance->Expected_cmock_arg1_Depth = cmock_arg1_Depth;
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Used = 0;
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(struct THING[sizeof(cmock_arg2) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_struct_CMockIgnore(void)
+{
+  Mock.foo_struct_IgnoreBool = (char)1;
+}
+
+void foo_struct_CMockStopIgnore(void)
+{
+  Mock.foo_struct_IgnoreBool = (char)0;
+}
+
+void foo_struct_CMockExpect(UNITY_LINE_TYPE cmock_line, struct THING* cmock_arg1, struct THING cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_struct_CALL_INSTANCE));
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_struct_CallInstance = CMock_Guts_MemChain(Mock.foo_struct_CallInstance, cmock_guts_index);
+  Mock.foo_struct_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_struct(cmock_call_instance, cmock_arg1, 1, cmock_arg2);
+}
+
+void foo_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_struct_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_struct_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_struct_CallInstance = CMock_Guts_MemChain(Mock.foo_struct_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foo_struct_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_struct(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, 1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_struct_AddCallback(CMOCK_foo_struct_CALLBACK Callback)
+{
+  Mock.foo_struct_IgnoreBool = (char)0;
+  Mock.foo_struct_CallbackBool = (char)1;
+  Mock.foo_struct_CallbackFunctionPointer = Callback;
+}
+
+void foo_struct_Stub(CMOCK_foo_struct_CALLBACK Callback)
+{
+  Mock.foo_struct_IgnoreBool = (char)0;
+  Mock.foo_struct_CallbackBool = (char)0;
+  Mock.foo_struct_CallbackFunctionPointer = Callback;
+}
+
+void foo_struct_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, struct THING* cmock_arg1, int cmock_arg1_Depth, struct THING cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_struct_CALL_INSTANCE));
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_struct_CallInstance = CMock_Guts_MemChain(Mock.foo_struct_CallInstance, cmock_guts_index);
+  Mock.foo_struct_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_struct(cmock_call_instance, cmock_arg1, cmock_arg1_Depth, cmock_arg2);
+}
+
+void foo_struct_CMockReturnMemThruPtr_cmock_arg1(UNITY_LINE_TYPE cmock_line, struct THING const* cmock_arg1, size_t cmock_size)
+{
+  CMOCK_foo_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_struct_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Used = 1;
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Val = cmock_arg1;
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Size = cmock_size;
+}
+
+struct THING foobar_struct(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foobar_struct);
+  cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foobar_struct_CallInstance);
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemNext(Mock.foobar_struct_CallInstance);
+  if (Mock.foobar_struct_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.foobar_struct_FinalReturn;
+  memcpy((void*)(&Mock.foobar_struct_FinalReturn), (void*)(&cmock_call_instance->ReturnVal),
+         sizeof(struct THING[sizeof(cmock_call_instance->ReturnVal) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.foobar_struct_CallbackBool &&
+      Mock.foobar_struct_CallbackFunctionPointer != NULL)
+  {
+    struct THING cmock_cb_ret = Mock.foobar_struct_CallbackFunctionPointer(Mock.foobar_struct_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (Mock.foobar_struct_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.foobar_struct_CallbackFunctionPointer(Mock.foobar_struct_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void foobar_struct_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, struct THING cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_struct_CALL_INSTANCE));
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemChain(Mock.foobar_struct_CallInstance, cmock_guts_index);
+  Mock.foobar_struct_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.foobar_struct_IgnoreBool = (char)1;
+}
+
+void foobar_struct_CMockStopIgnore(void)
+{
+  if(Mock.foobar_struct_IgnoreBool)
+    Mock.foobar_struct_CallInstance = CMock_Guts_MemNext(Mock.foobar_struct_CallInstance);
+  Mock.foobar_struct_IgnoreBool = (char)0;
+}
+
+void foobar_struct_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, struct THING cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_struct_CALL_INSTANCE));
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemChain(Mock.foobar_struct_CallInstance, cmock_guts_index);
+  Mock.foobar_struct_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(struct THING[sizeof(cmock_to_return) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foobar_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_struct_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foobar_struct_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foobar_struct_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foobar_struct_CallInstance = CMock_Guts_MemChain(Mock.foobar_struct_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foobar_struct_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foobar_struct_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(struct THING[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(struct THING) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foobar_struct_AddCallback(CMOCK_foobar_struct_CALLBACK Callback)
+{
+  Mock.foobar_struct_IgnoreBool = (char)0;
+  Mock.foobar_struct_CallbackBool = (char)1;
+  Mock.foobar_struct_CallbackFunctionPointer = Callback;
+}
+
+void foobar_struct_Stub(CMOCK_foobar_struct_CALLBACK Callback)
+{
+  Mock.foobar_struct_IgnoreBool = (char)0;
+  Mock.foobar_struct_CallbackBool = (char)0;
+  Mock.foobar_struct_CallbackFunctionPointer = Callback;
+}
+
+void foo_union(union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_union);
+  cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_union_CallInstance);
+  Mock.foo_union_CallInstance = CMock_Guts_MemNext(Mock.foo_union_CallInstance);
+  if (Mock.foo_union_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.foo_union_CallbackBool &&
+      Mock.foo_union_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_union_CallbackFunctionPointer(cmock_arg1, cmock_arg2, Mock.foo_union_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_union,CMockString_cmock_arg1);
+    if (cmock_call_instance->Expected_cmock_arg1 == NULL)
+      { UNITY_TEST_ASSERT_NULL(cmock_arg1, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_cmock_arg1), (void*)(cmock_arg1), sizeof(union STARS_AND_STRIPES), cmock_call_instance->Expected_cmock_arg1_Depth, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_union,CMockString_cmock_arg2);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2), sizeof(union STARS_AND_STRIPES), cmock_line, CMockStringMismatch);
+  }
+  if (Mock.foo_union_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_union_CallbackFunctionPointer(cmock_arg1, cmock_arg2, Mock.foo_union_CallbackCalls++);
+  }
+  if (cmock_call_instance->ReturnThruPtr_cmock_arg1_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(cmock_arg1, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)cmock_arg1, (const void*)cmock_call_instance->ReturnThruPtr_cmock_arg1_Val, 
+      cmock_call_instance->ReturnThruPtr_cmock_arg1_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo_union(CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance, union STARS_AND_STRIPES* cmock_arg1, int cmock_arg1_Depth, union STARS_AND_STRIPES cmock_arg2);
+void CMockExpectParameters_foo_union(CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance, union STARS_AND_STRIPES* cmock_arg1, int cmock_arg1_Depth, union STARS_AND_STRIPES cmock_arg2)
+{
+  cmock_call_instance->Expected_cmock_arg1 = cmock_arg1;
+  cmock_call_instance->Expected_cmock_arg1_Depth = cmock_arg1_Depth;
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Used = 0;
+  memcpy((void*)(&cmock_call_instance->Expected_cmock_arg2), (void*)(&cmock_arg2),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_arg2) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foo_union_CMockIgnore(void)
+{
+  Mock.foo_union_IgnoreBool = (char)1;
+}
+
+void foo_union_CMockStopIgnore(void)
+{
+  Mock.foo_union_IgnoreBool = (char)0;
+}
+
+void foo_union_CMockExpect(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_union_CALL_INSTANCE));
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_union_CallInstance = CMock_Guts_MemChain(Mock.foo_union_CallInstance, cmock_guts_index);
+  Mock.foo_union_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_union(cmock_call_instance, cmock_arg1, 1, cmock_arg2);
+}
+
+void foo_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_union_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_union_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_union_CallInstance = CMock_Guts_MemChain(Mock.foo_union_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foo_union_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_union(cmock_call_instance, cmock_rows[cmock_row].cmock_arg1, 1, cmock_rows[cmock_row].cmock_arg2);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_union_AddCallback(CMOCK_foo_union_CALLBACK Callback)
+{
+  Mock.foo_union_IgnoreBool = (char)0;
+  Mock.foo_union_CallbackBool = (char)1;
+  Mock.foo_union_CallbackFunctionPointer = Callback;
+}
+
+void foo_union_Stub(CMOCK_foo_union_CALLBACK Callback)
+{
+  Mock.foo_union_IgnoreBool = (char)0;
+  Mock.foo_union_CallbackBool = (char)0;
+  Mock.foo_union_CallbackFunctionPointer = Callback;
+}
+
+void foo_union_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES* cmock_arg1, int cmock_arg1_Depth, union STARS_AND_STRIPES cmock_arg2)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_union_CALL_INSTANCE));
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_union_CallInstance = CMock_Guts_MemChain(Mock.foo_union_CallInstance, cmock_guts_index);
+  Mock.foo_union_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_union(cmock_call_instance, cmock_arg1, cmock_arg1_Depth, cmock_arg2);
+}
+
+void foo_union_CMockReturnMemThruPtr_cmock_arg1(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES const* cmock_arg1, size_t cmock_size)
+{
+  CMOCK_foo_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_union_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Used = 1;
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Val = cmock_arg1;
+  cmock_call_instance->ReturnThruPtr_cmock_arg1_Size = cmock_size;
+}
+
+union STARS_AND_STRIPES foobar_union(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foobar_union);
+  cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foobar_union_CallInstance);
+  Mock.foobar_union_CallInstance = CMock_Guts_MemNext(Mock.foobar_union_CallInstance);
+  if (Mock.foobar_union_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.foobar_union_FinalReturn;
+  memcpy((void*)(&Mock.foobar_union_FinalReturn), (void*)(&cmock_call_instance->ReturnVal),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_call_instance->ReturnVal) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.foobar_union_CallbackBool &&
+      Mock.foobar_union_CallbackFunctionPointer != NULL)
+  {
+    union STARS_AND_STRIPES cmock_cb_ret = Mock.foobar_union_CallbackFunctionPointer(Mock.foobar_union_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (Mock.foobar_union_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.foobar_union_CallbackFunctionPointer(Mock.foobar_union_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void foobar_union_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_union_CALL_INSTANCE));
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_union_CallInstance = CMock_Guts_MemChain(Mock.foobar_union_CallInstance, cmock_guts_index);
+  Mock.foobar_union_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.foobar_union_IgnoreBool = (char)1;
+}
+
+void foobar_union_CMockStopIgnore(void)
+{
+  if(Mock.foobar_union_IgnoreBool)
+    Mock.foobar_union_CallInstance = CMock_Guts_MemNext(Mock.foobar_union_CallInstance);
+  Mock.foobar_union_IgnoreBool = (char)0;
+}
+
+void foobar_union_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_union_CALL_INSTANCE));
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_union_CallInstance = CMock_Guts_MemChain(Mock.foobar_union_CallInstance, cmock_guts_index);
+  Mock.foobar_union_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_to_return) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foobar_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_union_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foobar_union_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foobar_union_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foobar_union_CallInstance = CMock_Guts_MemChain(Mock.foobar_union_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foobar_union_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foobar_union_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(union STARS_AND_STRIPES[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(union STARS_AND_STRIPES) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foobar_union_AddCallback(CMOCK_foobar_union_CALLBACK Callback)
+{
+  Mock.foobar_union_IgnoreBool = (char)0;
+  Mock.foobar_union_CallbackBool = (char)1;
+  Mock.foobar_union_CallbackFunctionPointer = Callback;
+}
+
+void foobar_union_Stub(CMOCK_foobar_union_CALLBACK Callback)
+{
+  Mock.foobar_union_IgnoreBool = (char)0;
+  Mock.foobar_union_CallbackBool = (char)0;
+  Mock.foobar_union_CallbackFunctionPointer = Callback;
+}
+
+void foo_enum(enum HOKEY_POKEY a, enum HOKEY_POKEY* b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo_enum);
+  cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_enum_CallInstance);
+  Mock.foo_enum_CallInstance = CMock_Guts_MemNext(Mock.foo_enum_CallInstance);
+  if (Mock.foo_enum_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.foo_enum_CallbackBool &&
+      Mock.foo_enum_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_enum_CallbackFunctionPointer(a, b, Mock.foo_enum_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo_enum,CMockString_a);
+    UNITY_TEST_ASSERT_EQUAL_MEMORY((void*)(&cmock_call_instance->Expected_a), (void*)(&a), sizeof(enum HOKEY_POKEY), cmock_line, CMockStringMismatch);
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_foo_enum,CMockString_b);
+    if (cmock_call_instance->Expected_b == NULL)
+      { UNITY_TEST_ASSERT_NULL(b, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_MEMORY_ARRAY((void*)(cmock_call_instance->Expected_b), (void*)(b), sizeof(enum HOKEY_POKEY), cmock_call_instance->Expected_b_Depth, cmock_line, CMockStringMismatch); }
+  }
+  if (Mock.foo_enum_CallbackFunctionPointer != NULL)
+  {
+    Mock.foo_enum_CallbackFunctionPointer(a, b, Mock.foo_enum_CallbackCalls++);
+  }
+  if (cmock_call_instance->ReturnThruPtr_b_Used)
+  {
+    UNITY_TEST_ASSERT_NOT_NULL(b, cmock_line, CMockStringPtrIsNULL);
+    memcpy((void*)b, (const void*)cmock_call_instance->ReturnThruPtr_b_Val, 
+      cmock_call_instance->ReturnThruPtr_b_Size);
+  }  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_foo_enum(CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance, enum HOKEY_POKEY a, enum HOKEY_POKEY* b, int b_Depth);
+void CMockExpectParameters_foo_enum(CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance, enum HOKEY_POKEY a, enum HOKEY_POKEY* b, int b_Depth)
+{
+  memcpy((void*)(&cmock_call_instance->Expected_a), (void*)(&a),
+         sizeof(enum HOKEY_POKEY[sizeof(a) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+  cmock_call_instance->Expected_b = b;
+  cmock_call_instance->Expected_b_Depth = b_Depth;
+  cmock_call_instance->ReturnThruPtr_b_Used = 0;
+}
+
+void foo_enum_CMockIgnore(void)
+{
+  Mock.foo_enum_IgnoreBool = (char)1;
+}
+
+void foo_enum_CMockStopIgnore(void)
+{
+  Mock.foo_enum_IgnoreBool = (char)0;
+}
+
+void foo_enum_CMockExpect(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY a, enum HOKEY_POKEY* b)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_enum_CALL_INSTANCE));
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_enum_CallInstance = CMock_Guts_MemChain(Mock.foo_enum_CallInstance, cmock_guts_index);
+  Mock.foo_enum_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_enum(cmock_call_instance, a, b, 1);
+}
+
+void foo_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_enum_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_enum_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_enum_CallInstance = CMock_Guts_MemChain(Mock.foo_enum_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foo_enum_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo_enum(cmock_call_instance, cmock_rows[cmock_row].a, cmock_rows[cmock_row].b, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_enum_AddCallback(CMOCK_foo_enum_CALLBACK Callback)
+{
+  Mock.foo_enum_IgnoreBool = (char)0;
+  Mock.foo_enum_CallbackBool = (char)1;
+  Mock.foo_enum_CallbackFunctionPointer = Callback;
+}
+
+void foo_enum_Stub(CMOCK_foo_enum_CALLBACK Callback)
+{
+  Mock.foo_enum_IgnoreBool = (char)0;
+  Mock.foo_enum_CallbackBool = (char)0;
+  Mock.foo_enum_CallbackFunctionPointer = Callback;
+}
+
+void foo_enum_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY a, enum HOKEY_POKEY* b, int b_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_enum_CALL_INSTANCE));
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_enum_CallInstance = CMock_Guts_MemChain(Mock.foo_enum_CallInstance, cmock_guts_index);
+  Mock.foo_enum_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo_enum(cmock_call_instance, a, b, b_Depth);
+}
+
+void foo_enum_CMockReturnMemThruPtr_b(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY const* b, size_t cmock_size)
+{
+  CMOCK_foo_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(CMock_Guts_MemEndOfChain(Mock.foo_enum_CallInstance));
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringPtrPreExp);
+  cmock_call_instance->ReturnThruPtr_b_Used = 1;
+  cmock_call_instance->ReturnThruPtr_b_Val = b;
+  cmock_call_instance->ReturnThruPtr_b_Size = cmock_size;
+}
+
+enum HOKEY_POKEY foobar_enum(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foobar_enum);
+  cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foobar_enum_CallInstance);
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemNext(Mock.foobar_enum_CallInstance);
+  if (Mock.foobar_enum_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.foobar_enum_FinalReturn;
+  memcpy((void*)(&Mock.foobar_enum_FinalReturn), (void*)(&cmock_call_instance->ReturnVal),
+         sizeof(enum HOKEY_POKEY[sizeof(cmock_call_instance->ReturnVal) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.foobar_enum_CallbackBool &&
+      Mock.foobar_enum_CallbackFunctionPointer != NULL)
+  {
+    enum HOKEY_POKEY cmock_cb_ret = Mock.foobar_enum_CallbackFunctionPointer(Mock.foobar_enum_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (Mock.foobar_enum_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.foobar_enum_CallbackFunctionPointer(Mock.foobar_enum_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void foobar_enum_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_enum_CALL_INSTANCE));
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemChain(Mock.foobar_enum_CallInstance, cmock_guts_index);
+  Mock.foobar_enum_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.foobar_enum_IgnoreBool = (char)1;
+}
+
+void foobar_enum_CMockStopIgnore(void)
+{
+  if(Mock.foobar_enum_IgnoreBool)
+    Mock.foobar_enum_CallInstance = CMock_Guts_MemNext(Mock.foobar_enum_CallInstance);
+  Mock.foobar_enum_IgnoreBool = (char)0;
+}
+
+void foobar_enum_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foobar_enum_CALL_INSTANCE));
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemChain(Mock.foobar_enum_CallInstance, cmock_guts_index);
+  Mock.foobar_enum_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_to_return),
+         sizeof(enum HOKEY_POKEY[sizeof(cmock_to_return) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+}
+
+void foobar_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_enum_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foobar_enum_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foobar_enum_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foobar_enum_CallInstance = CMock_Guts_MemChain(Mock.foobar_enum_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foobar_enum_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    Mock.foobar_enum_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    memcpy((void*)(&cmock_call_instance->ReturnVal), (void*)(&cmock_rows[cmock_row].ReturnVal),
+         sizeof(enum HOKEY_POKEY[sizeof(cmock_rows[cmock_row].ReturnVal) == sizeof(enum HOKEY_POKEY) ? 1 : -1])); /* add {arg['type']} to :treat_as_array if this causes an error */
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foobar_enum_AddCallback(CMOCK_foobar_enum_CALLBACK Callback)
+{
+  Mock.foobar_enum_IgnoreBool = (char)0;
+  Mock.foobar_enum_CallbackBool = (char)1;
+  Mock.foobar_enum_CallbackFunctionPointer = Callback;
+}
+
+void foobar_enum_Stub(CMOCK_foobar_enum_CALLBACK Callback)
+{
+  Mock.foobar_enum_IgnoreBool = (char)0;
+  Mock.foobar_enum_CallbackBool = (char)0;
+  Mock.foobar_enum_CallbackFunctionPointer = Callback;
+}
+
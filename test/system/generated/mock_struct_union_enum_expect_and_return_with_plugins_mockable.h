@@ -0,0 +1,179 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_MOCKABLE_H
+#define _MOCK_STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_MOCKABLE_H
+
+#include "unity.h"
+#include "struct_union_enum_expect_and_return_with_plugins_types.h"
+#include "struct_union_enum_expect_and_return_with_plugins_unity_helper.h"
+#include "struct_union_enum_expect_and_return_with_plugins_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_struct_union_enum_expect_and_return_with_plugins_mockable_Init(void);
+void mock_struct_union_enum_expect_and_return_with_plugins_mockable_Destroy(void);
+void mock_struct_union_enum_expect_and_return_with_plugins_mockable_Verify(void);
+
+
+
+
+
+#define foo_struct_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo_struct requires _Ignore (not AndReturn)");
+#define foo_struct_Ignore() foo_struct_CMockIgnore()
+void foo_struct_CMockIgnore(void);
+#define foo_struct_StopIgnore() foo_struct_CMockStopIgnore()
+void foo_struct_CMockStopIgnore(void);
+#define foo_struct_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("foo_struct requires _Expect (not AndReturn)");
+#define foo_struct_Expect(cmock_arg1, cmock_arg2) foo_struct_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void foo_struct_CMockExpect(UNITY_LINE_TYPE cmock_line, struct THING* cmock_arg1, struct THING cmock_arg2);
+typedef struct _CMOCK_foo_struct_EXPECT_ROW
+{
+  struct THING* cmock_arg1;
+  struct THING cmock_arg2;
+} foo_struct_ExpectRow;
+#define foo_struct_ExpectTable(cmock_rows, cmock_count) foo_struct_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_struct_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_foo_struct_CALLBACK)(struct THING* cmock_arg1, struct THING cmock_arg2, int cmock_num_calls);
+void foo_struct_AddCallback(CMOCK_foo_struct_CALLBACK Callback);
+void foo_struct_Stub(CMOCK_foo_struct_CALLBACK Callback);
+#define foo_struct_StubWithCallback foo_struct_Stub
+#define foo_struct_ExpectWithArrayAndReturn(cmock_arg1, cmock_arg1_Depth, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("foo_struct requires _ExpectWithArray (not AndReturn)");
+#define foo_struct_ExpectWithArray(cmock_arg1, cmock_arg1_Depth, cmock_arg2) foo_struct_CMockExpectWithArray(__LINE__, cmock_arg1, (cmock_arg1_Depth), cmock_arg2)
+void foo_struct_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, struct THING* cmock_arg1, int cmock_arg1_Depth, struct THING cmock_arg2);
+#define foo_struct_ReturnThruPtr_cmock_arg1(cmock_arg1) foo_struct_CMockReturnMemThruPtr_cmock_arg1(__LINE__, cmock_arg1, sizeof(struct THING))
+#define foo_struct_ReturnArrayThruPtr_cmock_arg1(cmock_arg1, cmock_len) foo_struct_CMockReturnMemThruPtr_cmock_arg1(__LINE__, cmock_arg1, (cmock_len * sizeof(*cmock_arg1)))
+#define foo_struct_ReturnMemThruPtr_cmock_arg1(cmock_arg1, cmock_size) foo_struct_CMockReturnMemThruPtr_cmock_arg1(__LINE__, cmock_arg1, (cmock_size))
+void foo_struct_CMockReturnMemThruPtr_cmock_arg1(UNITY_LINE_TYPE cmock_line, struct THING const* cmock_arg1, size_t cmock_size);
+#define foobar_struct_Ignore() TEST_FAIL_MESSAGE("foobar_struct requires _IgnoreAndReturn");
+#define foobar_struct_IgnoreAndReturn(cmock_retval) foobar_struct_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void foobar_struct_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, struct THING cmock_to_return);
+#define foobar_struct_StopIgnore() foobar_struct_CMockStopIgnore()
+void foobar_struct_CMockStopIgnore(void);
+#define foobar_struct_Expect() TEST_FAIL_MESSAGE("foobar_struct requires _ExpectAndReturn");
+#define foobar_struct_ExpectAndReturn(cmock_retval) foobar_struct_CMockExpectAndReturn(__LINE__, cmock_retval)
+void foobar_struct_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, struct THING cmock_to_return);
+typedef struct _CMOCK_foobar_struct_EXPECT_ROW
+{
+  struct THING ReturnVal;
+} foobar_struct_ExpectRow;
+#define foobar_struct_ExpectTable(cmock_rows, cmock_count) foobar_struct_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foobar_struct_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_struct_ExpectRow* cmock_rows, size_t cmock_count);
+typedef struct THING (* CMOCK_foobar_struct_CALLBACK)(int cmock_num_calls);
+void foobar_struct_AddCallback(CMOCK_foobar_struct_CALLBACK Callback);
+void foobar_struct_Stub(CMOCK_foobar_struct_CALLBACK Callback);
+#define foobar_struct_StubWithCallback foobar_struct_Stub
+
+#define foo_union_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo_union requires _Ignore (not AndReturn)");
+#define foo_union_Ignore() foo_union_CMockIgnore()
+void foo_union_CMockIgnore(void);
+#define foo_union_StopIgnore() foo_union_CMockStopIgnore()
+void foo_union_CMockStopIgnore(void);
+#define foo_union_ExpectAndReturn(cmock_arg1, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("foo_union requires _Expect (not AndReturn)");
+#define foo_union_Expect(cmock_arg1, cmock_arg2) foo_union_CMockExpect(__LINE__, cmock_arg1, cmock_arg2)
+void foo_union_CMockExpect(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2);
+typedef struct _CMOCK_foo_union_EXPECT_ROW
+{
+  union STARS_AND_STRIPES* cmock_arg1;
+  union STARS_AND_STRIPES cmock_arg2;
+} foo_union_ExpectRow;
+#define foo_union_ExpectTable(cmock_rows, cmock_count) foo_union_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_union_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_foo_union_CALLBACK)(union STARS_AND_STRIPES* cmock_arg1, union STARS_AND_STRIPES cmock_arg2, int cmock_num_calls);
+void foo_union_AddCallback(CMOCK_foo_union_CALLBACK Callback);
+void foo_union_Stub(CMOCK_foo_union_CALLBACK Callback);
+#define foo_union_StubWithCallback foo_union_Stub
+#define foo_union_ExpectWithArrayAndReturn(cmock_arg1, cmock_arg1_Depth, cmock_arg2, cmock_retval) TEST_FAIL_MESSAGE("foo_union requires _ExpectWithArray (not AndReturn)");
+#define foo_union_ExpectWithArray(cmock_arg1, cmock_arg1_Depth, cmock_arg2) foo_union_CMockExpectWithArray(__LINE__, cmock_arg1, (cmock_arg1_Depth), cmock_arg2)
+void foo_union_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES* cmock_arg1, int cmock_arg1_Depth, union STARS_AND_STRIPES cmock_arg2);
+#define foo_union_ReturnThruPtr_cmock_arg1(cmock_arg1) foo_union_CMockReturnMemThruPtr_cmock_arg1(__LINE__, cmock_arg1, sizeof(union STARS_AND_STRIPES))
+#define foo_union_ReturnArrayThruPtr_cmock_arg1(cmock_arg1, cmock_len) foo_union_CMockReturnMemThruPtr_cmock_arg1(__LINE__, cmock_arg1, (cmock_len * sizeof(*cmock_arg1)))
+#define foo_union_ReturnMemThruPtr_cmock_arg1(cmock_arg1, cmock_size) foo_union_CMockReturnMemThruPtr_cmock_arg1(__LINE__, cmock_arg1, (cmock_size))
+void foo_union_CMockReturnMemThruPtr_cmock_arg1(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES const* cmock_arg1, size_t cmock_size);
+#define foobar_union_Ignore() TEST_FAIL_MESSAGE("foobar_union requires _IgnoreAndReturn");
+#define foobar_union_IgnoreAndReturn(cmock_retval) foobar_union_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void foobar_union_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES cmock_to_return);
+#define foobar_union_StopIgnore() foobar_union_CMockStopIgnore()
+void foobar_union_CMockStopIgnore(void);
+#define foobar_union_Expect() TEST_FAIL_MESSAGE("foobar_union requires _ExpectAndReturn");
+#define foobar_union_ExpectAndReturn(cmock_retval) foobar_union_CMockExpectAndReturn(__LINE__, cmock_retval)
+void foobar_union_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, union STARS_AND_STRIPES cmock_to_return);
+typedef struct _CMOCK_foobar_union_EXPECT_ROW
+{
+  union STARS_AND_STRIPES ReturnVal;
+} foobar_union_ExpectRow;
+#define foobar_union_ExpectTable(cmock_rows, cmock_count) foobar_union_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foobar_union_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_union_ExpectRow* cmock_rows, size_t cmock_count);
+typedef union STARS_AND_STRIPES (* CMOCK_foobar_union_CALLBACK)(int cmock_num_calls);
+void foobar_union_AddCallback(CMOCK_foobar_union_CALLBACK Callback);
+void foobar_union_Stub(CMOCK_foobar_union_CALLBACK Callback);
+#define foobar_union_StubWithCallback foobar_union_Stub
+
+#define foo_enum_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("foo_enum requires _Ignore (not AndReturn)");
+#define foo_enum_Ignore() foo_enum_CMockIgnore()
+void foo_enum_CMockIgnore(void);
+#define foo_enum_StopIgnore() foo_enum_CMockStopIgnore()
+void foo_enum_CMockStopIgnore(void);
+#define foo_enum_ExpectAndReturn(a, b, cmock_retval) TEST_FAIL_MESSAGE("foo_enum requires _Expect (not AndReturn)");
+#define foo_enum_Expect(a, b) foo_enum_CMockExpect(__LINE__, a, b)
+void foo_enum_CMockExpect(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY a, enum HOKEY_POKEY* b);
+typedef struct _CMOCK_foo_enum_EXPECT_ROW
+{
+  enum HOKEY_POKEY a;
+  enum HOKEY_POKEY* b;
+} foo_enum_ExpectRow;
+#define foo_enum_ExpectTable(cmock_rows, cmock_count) foo_enum_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_enum_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_foo_enum_CALLBACK)(enum HOKEY_POKEY a, enum HOKEY_POKEY* b, int cmock_num_calls);
+void foo_enum_AddCallback(CMOCK_foo_enum_CALLBACK Callback);
+void foo_enum_Stub(CMOCK_foo_enum_CALLBACK Callback);
+#define foo_enum_StubWithCallback foo_enum_Stub
+#define foo_enum_ExpectWithArrayAndReturn(a, b, b_Depth, cmock_retval) TEST_FAIL_MESSAGE("foo_enum requires _ExpectWithArray (not AndReturn)");
+#define foo_enum_ExpectWithArray(a, b, b_Depth) foo_enum_CMockExpectWithArray(__LINE__, a, b, (b_Depth))
+void foo_enum_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY a, enum HOKEY_POKEY* b, int b_Depth);
+#define foo_enum_ReturnThruPtr_b(b) foo_enum_CMockReturnMemThruPtr_b(__LINE__, b, sizeof(enum HOKEY_POKEY))
+#define foo_enum_ReturnArrayThruPtr_b(b, cmock_len) foo_enum_CMockReturnMemThruPtr_b(__LINE__, b, (cmock_len * sizeof(*b)))
+#define foo_enum_ReturnMemThruPtr_b(b, cmock_size) foo_enum_CMockReturnMemThruPtr_b(__LINE__, b, (cmock_size))
+void foo_enum_CMockReturnMemThruPtr_b(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY const* b, size_t cmock_size);
+#define foobar_enum_Ignore() TEST_FAIL_MESSAGE("foobar_enum requires _IgnoreAndReturn");
+#define foobar_enum_IgnoreAndReturn(cmock_retval) foobar_enum_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void foobar_enum_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY cmock_to_return);
+#define foobar_enum_StopIgnore() foobar_enum_CMockStopIgnore()
+void foobar_enum_CMockStopIgnore(void);
+#define foobar_enum_Expect() TEST_FAIL_MESSAGE("foobar_enum requires _ExpectAndReturn");
+#define foobar_enum_ExpectAndReturn(cmock_retval) foobar_enum_CMockExpectAndReturn(__LINE__, cmock_retval)
+void foobar_enum_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, enum HOKEY_POKEY cmock_to_return);
+typedef struct _CMOCK_foobar_enum_EXPECT_ROW
+{
+  enum HOKEY_POKEY ReturnVal;
+} foobar_enum_ExpectRow;
+#define foobar_enum_ExpectTable(cmock_rows, cmock_count) foobar_enum_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foobar_enum_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foobar_enum_ExpectRow* cmock_rows, size_t cmock_count);
+typedef enum HOKEY_POKEY (* CMOCK_foobar_enum_CALLBACK)(int cmock_num_calls);
+void foobar_enum_AddCallback(CMOCK_foobar_enum_CALLBACK Callback);
+void foobar_enum_Stub(CMOCK_foobar_enum_CALLBACK Callback);
+#define foobar_enum_StubWithCallback foobar_enum_Stub
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,448 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_stubs_with_callbacks_mockable.h"
+
+static const char* CMockString_a = "a";
+static const char* CMockString_args = "args";
+static const char* CMockString_b = "b";
+static const char* CMockString_bar = "bar";
+static const char* CMockString_baz = "baz";
+static const char* CMockString_foo = "foo";
+static const char* CMockString_fuz = "fuz";
+static const char* CMockString_num = "num";
+
+typedef struct _CMOCK_foo_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  UINT32 ReturnVal;
+  custom_type* Expected_a;
+
+} CMOCK_foo_CALL_INSTANCE;
+
+typedef struct _CMOCK_bar_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  UINT32 ReturnVal;
+  custom_type* Expected_b;
+
+} CMOCK_bar_CALL_INSTANCE;
+
+typedef struct _CMOCK_baz_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+
+} CMOCK_baz_CALL_INSTANCE;
+
+typedef struct _CMOCK_fuz_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int* Expected_args;
+  int Expected_num;
+
+} CMOCK_fuz_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_stubs_with_callbacks_mockableInstance
+{
+  char foo_CallbackBool;
+  CMOCK_foo_CALLBACK foo_CallbackFunctionPointer;
+  int foo_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE foo_CallInstance;
+  char bar_CallbackBool;
+  CMOCK_bar_CALLBACK bar_CallbackFunctionPointer;
+  int bar_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE bar_CallInstance;
+  char baz_CallbackBool;
+  CMOCK_baz_CALLBACK baz_CallbackFunctionPointer;
+  int baz_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE baz_CallInstance;
+  char fuz_CallbackBool;
+  CMOCK_fuz_CALLBACK fuz_CallbackFunctionPointer;
+  int fuz_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE fuz_CallInstance;
+} Mock;
+
+
+void mock_stubs_with_callbacks_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.foo_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_foo);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.bar_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_bar);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.baz_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_baz);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.baz_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+  call_instance = Mock.fuz_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_fuz);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  if (Mock.fuz_CallbackFunctionPointer != NULL)
+  {
+    call_instance = CMOCK_GUTS_NONE;
+    (void)call_instance;
+  }
+}
+
+void mock_stubs_with_callbacks_mockable_Init(void)
+{
+  mock_stubs_with_callbacks_mockable_Destroy();
+}
+
+void mock_stubs_with_callbacks_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+UINT32 foo(custom_type* a)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_foo);
+  cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.foo_CallInstance);
+  Mock.foo_CallInstance = CMock_Guts_MemNext(Mock.foo_CallInstance);
+  if (!Mock.foo_CallbackBool &&
+      Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    UINT32 cmock_cb_ret = Mock.foo_CallbackFunctionPointer(a, Mock.foo_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_foo,CMockString_a);
+    if (cmock_call_instance->Expected_a == NULL)
+      { UNITY_TEST_ASSERT_NULL(a, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_a, a, 1, cmock_line, CMockStringMismatch); }
+  }
+  if (Mock.foo_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.foo_CallbackFunctionPointer(a, Mock.foo_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, custom_type* a);
+void CMockExpectParameters_foo(CMOCK_foo_CALL_INSTANCE* cmock_call_instance, custom_type* a)
+{
+  cmock_call_instance->Expected_a = a;
+}
+
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type* a, UINT32 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_foo_CALL_INSTANCE));
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_foo(cmock_call_instance, a);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_foo_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_foo_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.foo_CallInstance = CMock_Guts_MemChain(Mock.foo_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_foo_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_foo(cmock_call_instance, cmock_rows[cmock_row].a);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void foo_AddCallback(CMOCK_foo_CALLBACK Callback)
+{
+  Mock.foo_CallbackBool = (char)1;
+  Mock.foo_CallbackFunctionPointer = Callback;
+}
+
+void foo_Stub(CMOCK_foo_CALLBACK Callback)
+{
+  Mock.foo_CallbackBool = (char)0;
+  Mock.foo_CallbackFunctionPointer = Callback;
+}
+
+UINT32 bar(custom_type* b)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_bar);
+  cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.bar_CallInstance);
+  Mock.bar_CallInstance = CMock_Guts_MemNext(Mock.bar_CallInstance);
+  if (!Mock.bar_CallbackBool &&
+      Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    UINT32 cmock_cb_ret = Mock.bar_CallbackFunctionPointer(b, Mock.bar_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_bar,CMockString_b);
+    if (cmock_call_instance->Expected_b == NULL)
+      { UNITY_TEST_ASSERT_NULL(b, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_b, b, 1, cmock_line, CMockStringMismatch); }
+  }
+  if (Mock.bar_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.bar_CallbackFunctionPointer(b, Mock.bar_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, custom_type* b);
+void CMockExpectParameters_bar(CMOCK_bar_CALL_INSTANCE* cmock_call_instance, custom_type* b)
+{
+  cmock_call_instance->Expected_b = b;
+}
+
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type* b, UINT32 cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_bar_CALL_INSTANCE));
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_bar(cmock_call_instance, b);
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_bar_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_bar_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.bar_CallInstance = CMock_Guts_MemChain(Mock.bar_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_bar_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_bar(cmock_call_instance, cmock_rows[cmock_row].b);
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void bar_AddCallback(CMOCK_bar_CALLBACK Callback)
+{
+  Mock.bar_CallbackBool = (char)1;
+  Mock.bar_CallbackFunctionPointer = Callback;
+}
+
+void bar_Stub(CMOCK_bar_CALLBACK Callback)
+{
+  Mock.bar_CallbackBool = (char)0;
+  Mock.bar_CallbackFunctionPointer = Callback;
+}
+
+int baz(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_baz_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_baz);
+  cmock_call_instance = (CMOCK_baz_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.baz_CallInstance);
+  Mock.baz_CallInstance = CMock_Guts_MemNext(Mock.baz_CallInstance);
+  if (!Mock.baz_CallbackBool &&
+      Mock.baz_CallbackFunctionPointer != NULL)
+  {
+    int cmock_cb_ret = Mock.baz_CallbackFunctionPointer(Mock.baz_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (Mock.baz_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.baz_CallbackFunctionPointer(Mock.baz_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void baz_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_baz_CALL_INSTANCE));
+  CMOCK_baz_CALL_INSTANCE* cmock_call_instance = (CMOCK_baz_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.baz_CallInstance = CMock_Guts_MemChain(Mock.baz_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void baz_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const baz_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_baz_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_baz_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.baz_CallInstance = CMock_Guts_MemChain(Mock.baz_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_baz_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void baz_AddCallback(CMOCK_baz_CALLBACK Callback)
+{
+  Mock.baz_CallbackBool = (char)1;
+  Mock.baz_CallbackFunctionPointer = Callback;
+}
+
+void baz_Stub(CMOCK_baz_CALLBACK Callback)
+{
+  Mock.baz_CallbackBool = (char)0;
+  Mock.baz_CallbackFunctionPointer = Callback;
+}
+
+void fuz(int* args, int num)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_fuz_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_fuz);
+  cmock_call_instance = (CMOCK_fuz_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.fuz_CallInstance);
+  Mock.fuz_CallInstance = CMock_Guts_MemNext(Mock.fuz_CallInstance);
+  if (!Mock.fuz_CallbackBool &&
+      Mock.fuz_CallbackFunctionPointer != NULL)
+  {
+    Mock.fuz_CallbackFunctionPointer(args, num, Mock.fuz_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_fuz,CMockString_args);
+    if (cmock_call_instance->Expected_args == NULL)
+      { UNITY_TEST_ASSERT_NULL(args, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_INT_ARRAY(cmock_call_instance->Expected_args, args, 1, cmock_line, CMockStringMismatch); }
+  }
+  {
+    UNITY_SET_DETAILS(CMockString_fuz,CMockString_num);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_num, num, cmock_line, CMockStringMismatch);
+  }
+  if (Mock.fuz_CallbackFunctionPointer != NULL)
+  {
+    Mock.fuz_CallbackFunctionPointer(args, num, Mock.fuz_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_fuz(CMOCK_fuz_CALL_INSTANCE* cmock_call_instance, int* args, int num);
+void CMockExpectParameters_fuz(CMOCK_fuz_CALL_INSTANCE* cmock_call_instance, int* args, int num)
+{
+  cmock_call_instance->Expected_args = args;
+  cmock_call_instance->Expected_num = num;
+}
+
+void fuz_CMockExpect(UNITY_LINE_TYPE cmock_line, int* args, int num)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_fuz_CALL_INSTANCE));
+  CMOCK_fuz_CALL_INSTANCE* cmock_call_instance = (CMOCK_fuz_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.fuz_CallInstance = CMock_Guts_MemChain(Mock.fuz_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_fuz(cmock_call_instance, args, num);
+}
+
+void fuz_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fuz_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_fuz_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_fuz_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.fuz_CallInstance = CMock_Guts_MemChain(Mock.fuz_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_fuz_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_fuz(cmock_call_instance, cmock_rows[cmock_row].args, cmock_rows[cmock_row].num);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void fuz_AddCallback(CMOCK_fuz_CALLBACK Callback)
+{
+  Mock.fuz_CallbackBool = (char)1;
+  Mock.fuz_CallbackFunctionPointer = Callback;
+}
+
+void fuz_Stub(CMOCK_fuz_CALLBACK Callback)
+{
+  Mock.fuz_CallbackBool = (char)0;
+  Mock.fuz_CallbackFunctionPointer = Callback;
+}
+
@@ -0,0 +1,98 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_STUBS_WITH_CALLBACKS_MOCKABLE_H
+#define _MOCK_STUBS_WITH_CALLBACKS_MOCKABLE_H
+
+#include "unity.h"
+#include "stubs_with_callbacks_types.h"
+#include "stubs_with_callbacks_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_stubs_with_callbacks_mockable_Init(void);
+void mock_stubs_with_callbacks_mockable_Destroy(void);
+void mock_stubs_with_callbacks_mockable_Verify(void);
+
+
+
+
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type* a, UINT32 cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  custom_type* a;
+  UINT32 ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+typedef UINT32 (* CMOCK_foo_CALLBACK)(custom_type* a, int cmock_num_calls);
+void foo_AddCallback(CMOCK_foo_CALLBACK Callback);
+void foo_Stub(CMOCK_foo_CALLBACK Callback);
+#define foo_StubWithCallback foo_Stub
+#define bar_Expect(b) TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(b, cmock_retval) bar_CMockExpectAndReturn(__LINE__, b, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type* b, UINT32 cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  custom_type* b;
+  UINT32 ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+typedef UINT32 (* CMOCK_bar_CALLBACK)(custom_type* b, int cmock_num_calls);
+void bar_AddCallback(CMOCK_bar_CALLBACK Callback);
+void bar_Stub(CMOCK_bar_CALLBACK Callback);
+#define bar_StubWithCallback bar_Stub
+#define baz_Expect() TEST_FAIL_MESSAGE("baz requires _ExpectAndReturn");
+#define baz_ExpectAndReturn(cmock_retval) baz_CMockExpectAndReturn(__LINE__, cmock_retval)
+void baz_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_baz_EXPECT_ROW
+{
+  int ReturnVal;
+} baz_ExpectRow;
+#define baz_ExpectTable(cmock_rows, cmock_count) baz_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void baz_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const baz_ExpectRow* cmock_rows, size_t cmock_count);
+typedef int (* CMOCK_baz_CALLBACK)(int cmock_num_calls);
+void baz_AddCallback(CMOCK_baz_CALLBACK Callback);
+void baz_Stub(CMOCK_baz_CALLBACK Callback);
+#define baz_StubWithCallback baz_Stub
+#define fuz_ExpectAndReturn(args, num, cmock_retval) TEST_FAIL_MESSAGE("fuz requires _Expect (not AndReturn)");
+#define fuz_Expect(args, num) fuz_CMockExpect(__LINE__, args, num)
+void fuz_CMockExpect(UNITY_LINE_TYPE cmock_line, int* args, int num);
+typedef struct _CMOCK_fuz_EXPECT_ROW
+{
+  int* args;
+  int num;
+} fuz_ExpectRow;
+#define fuz_ExpectTable(cmock_rows, cmock_count) fuz_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void fuz_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const fuz_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_fuz_CALLBACK)(int* args, int num, int cmock_num_calls);
+void fuz_AddCallback(CMOCK_fuz_CALLBACK Callback);
+void fuz_Stub(CMOCK_fuz_CALLBACK Callback);
+#define fuz_StubWithCallback fuz_Stub
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
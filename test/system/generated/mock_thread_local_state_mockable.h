@@ -0,0 +1,73 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_THREAD_LOCAL_STATE_MOCKABLE_H
+#define _MOCK_THREAD_LOCAL_STATE_MOCKABLE_H
+
+#include "unity.h"
+#include "thread_local_state_types.h"
+#include "thread_local_state_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_thread_local_state_mockable_Init(void);
+void mock_thread_local_state_mockable_Destroy(void);
+void mock_thread_local_state_mockable_Verify(void);
+
+
+
+
+
+#define read_value_Ignore() TEST_FAIL_MESSAGE("read_value requires _IgnoreAndReturn");
+#define read_value_IgnoreAndReturn(cmock_retval) read_value_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_value_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_value_StopIgnore() read_value_CMockStopIgnore()
+void read_value_CMockStopIgnore(void);
+#define read_value_Expect() TEST_FAIL_MESSAGE("read_value requires _ExpectAndReturn");
+#define read_value_ExpectAndReturn(cmock_retval) read_value_CMockExpectAndReturn(__LINE__, cmock_retval)
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_read_value_EXPECT_ROW
+{
+  int ReturnVal;
+} read_value_ExpectRow;
+#define read_value_ExpectTable(cmock_rows, cmock_count) read_value_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define write_value_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("write_value requires _Ignore (not AndReturn)");
+#define write_value_Ignore() write_value_CMockIgnore()
+void write_value_CMockIgnore(void);
+#define write_value_StopIgnore() write_value_CMockStopIgnore()
+void write_value_CMockStopIgnore(void);
+#define write_value_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("write_value requires _Expect (not AndReturn)");
+#define write_value_Expect(value) write_value_CMockExpect(__LINE__, value)
+void write_value_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_write_value_EXPECT_ROW
+{
+  int value;
+} write_value_ExpectRow;
+#define write_value_ExpectTable(cmock_rows, cmock_count) write_value_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_value_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
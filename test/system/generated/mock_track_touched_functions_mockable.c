@@ -0,0 +1,932 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <stddef.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_track_touched_functions_mockable.h"
+
+static const char* CMockString_read_a = "read_a";
+static const char* CMockString_read_b = "read_b";
+static const char* CMockString_unused_c = "unused_c";
+static const char* CMockString_unused_d = "unused_d";
+static const char* CMockString_value = "value";
+static const char* CMockString_write_a = "write_a";
+static const char* CMockString_write_b = "write_b";
+
+typedef struct _CMOCK_read_a_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int CallOrder;
+
+} CMOCK_read_a_CALL_INSTANCE;
+
+typedef struct _CMOCK_read_b_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int ReturnVal;
+  int CallOrder;
+
+} CMOCK_read_b_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_a_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_value;
+
+} CMOCK_write_a_CALL_INSTANCE;
+
+typedef struct _CMOCK_write_b_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_value;
+
+} CMOCK_write_b_CALL_INSTANCE;
+
+typedef struct _CMOCK_unused_c_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_value;
+
+} CMOCK_unused_c_CALL_INSTANCE;
+
+typedef struct _CMOCK_unused_d_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  int CallOrder;
+  int Expected_value;
+
+} CMOCK_unused_d_CALL_INSTANCE;
+
+enum
+{
+  CMOCK_read_a_ID,
+  CMOCK_read_b_ID,
+  CMOCK_write_a_ID,
+  CMOCK_write_b_ID,
+  CMOCK_unused_c_ID,
+  CMOCK_unused_d_ID,
+  CMOCK_mock_track_touched_functions_mockable_FUNCTION_COUNT
+};
+
+static CMOCK_THREAD_STORAGE struct mock_track_touched_functions_mockableInstance
+{
+  char read_a_Touched;
+  char read_a_IgnoreBool;
+  int read_a_FinalReturn;
+  char read_a_CallbackBool;
+  CMOCK_read_a_CALLBACK read_a_CallbackFunctionPointer;
+  int read_a_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE read_a_CallInstance;
+  char read_b_Touched;
+  char read_b_IgnoreBool;
+  int read_b_FinalReturn;
+  char read_b_CallbackBool;
+  CMOCK_read_b_CALLBACK read_b_CallbackFunctionPointer;
+  int read_b_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE read_b_CallInstance;
+  char write_a_Touched;
+  char write_a_IgnoreBool;
+  char write_a_CallbackBool;
+  CMOCK_write_a_CALLBACK write_a_CallbackFunctionPointer;
+  int write_a_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE write_a_CallInstance;
+  char write_b_Touched;
+  char write_b_IgnoreBool;
+  char write_b_CallbackBool;
+  CMOCK_write_b_CALLBACK write_b_CallbackFunctionPointer;
+  int write_b_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE write_b_CallInstance;
+  char unused_c_Touched;
+  char unused_c_IgnoreBool;
+  char unused_c_CallbackBool;
+  CMOCK_unused_c_CALLBACK unused_c_CallbackFunctionPointer;
+  int unused_c_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE unused_c_CallInstance;
+  char unused_d_Touched;
+  char unused_d_IgnoreBool;
+  char unused_d_CallbackBool;
+  CMOCK_unused_d_CALLBACK unused_d_CallbackFunctionPointer;
+  int unused_d_CallbackCalls;
+  CMOCK_MEM_INDEX_TYPE unused_d_CallInstance;
+  int CMockTouchedList[CMOCK_mock_track_touched_functions_mockable_FUNCTION_COUNT];
+  int CMockTouchedCount;
+} Mock;
+
+#define CMOCK_TOUCH(func) \
+  do { if (!Mock.func##_Touched) { Mock.func##_Touched = 1; Mock.CMockTouchedList[Mock.CMockTouchedCount++] = CMOCK_##func##_ID; } } while (0)
+#define CMOCK_CLEAR(func) \
+  memset(&Mock.func##_Touched, 0, offsetof(struct mock_track_touched_functions_mockableInstance, func##_CallInstance) + sizeof(CMOCK_MEM_INDEX_TYPE) - offsetof(struct mock_track_touched_functions_mockableInstance, func##_Touched))
+
+#ifdef CMOCK_OWN_ORDERING
+#define GlobalExpectCount CMock_GlobalExpectCount
+#define GlobalVerifyOrder CMock_GlobalVerifyOrder
+#endif
+extern CMOCK_ORDERING_STORAGE int GlobalExpectCount;
+extern CMOCK_ORDERING_STORAGE int GlobalVerifyOrder;
+
+void mock_track_touched_functions_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  int cmock_touched;
+  for (cmock_touched = 0; cmock_touched < Mock.CMockTouchedCount; cmock_touched++)
+  {
+    switch (Mock.CMockTouchedList[cmock_touched])
+    {
+      case CMOCK_read_a_ID:
+        call_instance = Mock.read_a_CallInstance;
+        if (Mock.read_a_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_read_a);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        if (Mock.read_a_CallbackFunctionPointer != NULL)
+        {
+          call_instance = CMOCK_GUTS_NONE;
+          (void)call_instance;
+        }
+        break;
+      case CMOCK_read_b_ID:
+        call_instance = Mock.read_b_CallInstance;
+        if (Mock.read_b_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_read_b);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        if (Mock.read_b_CallbackFunctionPointer != NULL)
+        {
+          call_instance = CMOCK_GUTS_NONE;
+          (void)call_instance;
+        }
+        break;
+      case CMOCK_write_a_ID:
+        call_instance = Mock.write_a_CallInstance;
+        if (Mock.write_a_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_write_a);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        if (Mock.write_a_CallbackFunctionPointer != NULL)
+        {
+          call_instance = CMOCK_GUTS_NONE;
+          (void)call_instance;
+        }
+        break;
+      case CMOCK_write_b_ID:
+        call_instance = Mock.write_b_CallInstance;
+        if (Mock.write_b_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_write_b);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        if (Mock.write_b_CallbackFunctionPointer != NULL)
+        {
+          call_instance = CMOCK_GUTS_NONE;
+          (void)call_instance;
+        }
+        break;
+      case CMOCK_unused_c_ID:
+        call_instance = Mock.unused_c_CallInstance;
+        if (Mock.unused_c_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_unused_c);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        if (Mock.unused_c_CallbackFunctionPointer != NULL)
+        {
+          call_instance = CMOCK_GUTS_NONE;
+          (void)call_instance;
+        }
+        break;
+      case CMOCK_unused_d_ID:
+        call_instance = Mock.unused_d_CallInstance;
+        if (Mock.unused_d_IgnoreBool)
+          call_instance = CMOCK_GUTS_NONE;
+        if (CMOCK_GUTS_NONE != call_instance)
+        {
+          UNITY_SET_DETAIL(CMockString_unused_d);
+          UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+        }
+        if (Mock.unused_d_CallbackFunctionPointer != NULL)
+        {
+          call_instance = CMOCK_GUTS_NONE;
+          (void)call_instance;
+        }
+        break;
+      default:
+        break;
+    }
+  }
+}
+
+void mock_track_touched_functions_mockable_Init(void)
+{
+  mock_track_touched_functions_mockable_Destroy();
+}
+
+void mock_track_touched_functions_mockable_Destroy(void)
+{
+  int cmock_touched;
+  CMock_Guts_MemFreeAll();
+  for (cmock_touched = 0; cmock_touched < Mock.CMockTouchedCount; cmock_touched++)
+  {
+    switch (Mock.CMockTouchedList[cmock_touched])
+    {
+      case CMOCK_read_a_ID:
+        CMOCK_CLEAR(read_a);
+        break;
+      case CMOCK_read_b_ID:
+        CMOCK_CLEAR(read_b);
+        break;
+      case CMOCK_write_a_ID:
+        CMOCK_CLEAR(write_a);
+        break;
+      case CMOCK_write_b_ID:
+        CMOCK_CLEAR(write_b);
+        break;
+      case CMOCK_unused_c_ID:
+        CMOCK_CLEAR(unused_c);
+        break;
+      case CMOCK_unused_d_ID:
+        CMOCK_CLEAR(unused_d);
+        break;
+      default:
+        break;
+    }
+  }
+  Mock.CMockTouchedCount = 0;
+  GlobalExpectCount = 0;
+  GlobalVerifyOrder = 0;
+}
+
+int read_a(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_a);
+  cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_a_CallInstance);
+  Mock.read_a_CallInstance = CMock_Guts_MemNext(Mock.read_a_CallInstance);
+  if (Mock.read_a_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_a_FinalReturn;
+  Mock.read_a_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.read_a_CallbackBool &&
+      Mock.read_a_CallbackFunctionPointer != NULL)
+  {
+    int cmock_cb_ret = Mock.read_a_CallbackFunctionPointer(Mock.read_a_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.read_a_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.read_a_CallbackFunctionPointer(Mock.read_a_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void read_a_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_a_CALL_INSTANCE));
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_a_CallInstance = CMock_Guts_MemChain(Mock.read_a_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(read_a);
+  Mock.read_a_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_a_IgnoreBool = (char)1;
+}
+
+void read_a_CMockStopIgnore(void)
+{
+  CMOCK_TOUCH(read_a);
+  if(Mock.read_a_IgnoreBool)
+    Mock.read_a_CallInstance = CMock_Guts_MemNext(Mock.read_a_CallInstance);
+  Mock.read_a_IgnoreBool = (char)0;
+}
+
+void read_a_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_a_CALL_INSTANCE));
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_a_CallInstance = CMock_Guts_MemChain(Mock.read_a_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(read_a);
+  Mock.read_a_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_a_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_a_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_a_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_a_CallInstance = CMock_Guts_MemChain(Mock.read_a_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_TOUCH(read_a);
+    Mock.read_a_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void read_a_AddCallback(CMOCK_read_a_CALLBACK Callback)
+{
+  CMOCK_TOUCH(read_a);
+  Mock.read_a_IgnoreBool = (char)0;
+  Mock.read_a_CallbackBool = (char)1;
+  Mock.read_a_CallbackFunctionPointer = Callback;
+}
+
+void read_a_Stub(CMOCK_read_a_CALLBACK Callback)
+{
+  CMOCK_TOUCH(read_a);
+  Mock.read_a_IgnoreBool = (char)0;
+  Mock.read_a_CallbackBool = (char)0;
+  Mock.read_a_CallbackFunctionPointer = Callback;
+}
+
+int read_b(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_read_b);
+  cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.read_b_CallInstance);
+  Mock.read_b_CallInstance = CMock_Guts_MemNext(Mock.read_b_CallInstance);
+  if (Mock.read_b_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    if (cmock_call_instance == NULL)
+      return Mock.read_b_FinalReturn;
+  Mock.read_b_FinalReturn = cmock_call_instance->ReturnVal;
+    return cmock_call_instance->ReturnVal;
+  }
+  if (!Mock.read_b_CallbackBool &&
+      Mock.read_b_CallbackFunctionPointer != NULL)
+  {
+    int cmock_cb_ret = Mock.read_b_CallbackFunctionPointer(Mock.read_b_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return cmock_cb_ret;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  if (Mock.read_b_CallbackFunctionPointer != NULL)
+  {
+    cmock_call_instance->ReturnVal = Mock.read_b_CallbackFunctionPointer(Mock.read_b_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void read_b_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_b_CALL_INSTANCE));
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_b_CallInstance = CMock_Guts_MemChain(Mock.read_b_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(read_b);
+  Mock.read_b_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+  Mock.read_b_IgnoreBool = (char)1;
+}
+
+void read_b_CMockStopIgnore(void)
+{
+  CMOCK_TOUCH(read_b);
+  if(Mock.read_b_IgnoreBool)
+    Mock.read_b_CallInstance = CMock_Guts_MemNext(Mock.read_b_CallInstance);
+  Mock.read_b_IgnoreBool = (char)0;
+}
+
+void read_b_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_read_b_CALL_INSTANCE));
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.read_b_CallInstance = CMock_Guts_MemChain(Mock.read_b_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(read_b);
+  Mock.read_b_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void read_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_b_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_read_b_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_read_b_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.read_b_CallInstance = CMock_Guts_MemChain(Mock.read_b_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_read_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_TOUCH(read_b);
+    Mock.read_b_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void read_b_AddCallback(CMOCK_read_b_CALLBACK Callback)
+{
+  CMOCK_TOUCH(read_b);
+  Mock.read_b_IgnoreBool = (char)0;
+  Mock.read_b_CallbackBool = (char)1;
+  Mock.read_b_CallbackFunctionPointer = Callback;
+}
+
+void read_b_Stub(CMOCK_read_b_CALLBACK Callback)
+{
+  CMOCK_TOUCH(read_b);
+  Mock.read_b_IgnoreBool = (char)0;
+  Mock.read_b_CallbackBool = (char)0;
+  Mock.read_b_CallbackFunctionPointer = Callback;
+}
+
+void write_a(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_a);
+  cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_a_CallInstance);
+  Mock.write_a_CallInstance = CMock_Guts_MemNext(Mock.write_a_CallInstance);
+  if (Mock.write_a_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.write_a_CallbackBool &&
+      Mock.write_a_CallbackFunctionPointer != NULL)
+  {
+    Mock.write_a_CallbackFunctionPointer(value, Mock.write_a_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_write_a,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  if (Mock.write_a_CallbackFunctionPointer != NULL)
+  {
+    Mock.write_a_CallbackFunctionPointer(value, Mock.write_a_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_a(CMOCK_write_a_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_write_a(CMOCK_write_a_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void write_a_CMockIgnore(void)
+{
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)1;
+}
+
+void write_a_CMockStopIgnore(void)
+{
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)0;
+}
+
+void write_a_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_a_CALL_INSTANCE));
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_a_CallInstance = CMock_Guts_MemChain(Mock.write_a_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_write_a(cmock_call_instance, value);
+}
+
+void write_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_a_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_a_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_a_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_a_CallInstance = CMock_Guts_MemChain(Mock.write_a_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_a_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_TOUCH(write_a);
+    Mock.write_a_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_write_a(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_a_AddCallback(CMOCK_write_a_CALLBACK Callback)
+{
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)0;
+  Mock.write_a_CallbackBool = (char)1;
+  Mock.write_a_CallbackFunctionPointer = Callback;
+}
+
+void write_a_Stub(CMOCK_write_a_CALLBACK Callback)
+{
+  CMOCK_TOUCH(write_a);
+  Mock.write_a_IgnoreBool = (char)0;
+  Mock.write_a_CallbackBool = (char)0;
+  Mock.write_a_CallbackFunctionPointer = Callback;
+}
+
+void write_b(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_write_b);
+  cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.write_b_CallInstance);
+  Mock.write_b_CallInstance = CMock_Guts_MemNext(Mock.write_b_CallInstance);
+  if (Mock.write_b_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.write_b_CallbackBool &&
+      Mock.write_b_CallbackFunctionPointer != NULL)
+  {
+    Mock.write_b_CallbackFunctionPointer(value, Mock.write_b_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_write_b,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  if (Mock.write_b_CallbackFunctionPointer != NULL)
+  {
+    Mock.write_b_CallbackFunctionPointer(value, Mock.write_b_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_write_b(CMOCK_write_b_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_write_b(CMOCK_write_b_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void write_b_CMockIgnore(void)
+{
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)1;
+}
+
+void write_b_CMockStopIgnore(void)
+{
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)0;
+}
+
+void write_b_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_write_b_CALL_INSTANCE));
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.write_b_CallInstance = CMock_Guts_MemChain(Mock.write_b_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_write_b(cmock_call_instance, value);
+}
+
+void write_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_b_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_write_b_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_write_b_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.write_b_CallInstance = CMock_Guts_MemChain(Mock.write_b_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_write_b_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_TOUCH(write_b);
+    Mock.write_b_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_write_b(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void write_b_AddCallback(CMOCK_write_b_CALLBACK Callback)
+{
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)0;
+  Mock.write_b_CallbackBool = (char)1;
+  Mock.write_b_CallbackFunctionPointer = Callback;
+}
+
+void write_b_Stub(CMOCK_write_b_CALLBACK Callback)
+{
+  CMOCK_TOUCH(write_b);
+  Mock.write_b_IgnoreBool = (char)0;
+  Mock.write_b_CallbackBool = (char)0;
+  Mock.write_b_CallbackFunctionPointer = Callback;
+}
+
+void unused_c(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_unused_c_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_unused_c);
+  cmock_call_instance = (CMOCK_unused_c_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.unused_c_CallInstance);
+  Mock.unused_c_CallInstance = CMock_Guts_MemNext(Mock.unused_c_CallInstance);
+  if (Mock.unused_c_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.unused_c_CallbackBool &&
+      Mock.unused_c_CallbackFunctionPointer != NULL)
+  {
+    Mock.unused_c_CallbackFunctionPointer(value, Mock.unused_c_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_unused_c,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  if (Mock.unused_c_CallbackFunctionPointer != NULL)
+  {
+    Mock.unused_c_CallbackFunctionPointer(value, Mock.unused_c_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_unused_c(CMOCK_unused_c_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_unused_c(CMOCK_unused_c_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void unused_c_CMockIgnore(void)
+{
+  CMOCK_TOUCH(unused_c);
+  Mock.unused_c_IgnoreBool = (char)1;
+}
+
+void unused_c_CMockStopIgnore(void)
+{
+  CMOCK_TOUCH(unused_c);
+  Mock.unused_c_IgnoreBool = (char)0;
+}
+
+void unused_c_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_unused_c_CALL_INSTANCE));
+  CMOCK_unused_c_CALL_INSTANCE* cmock_call_instance = (CMOCK_unused_c_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.unused_c_CallInstance = CMock_Guts_MemChain(Mock.unused_c_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(unused_c);
+  Mock.unused_c_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_unused_c(cmock_call_instance, value);
+}
+
+void unused_c_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const unused_c_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_unused_c_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_unused_c_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.unused_c_CallInstance = CMock_Guts_MemChain(Mock.unused_c_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_unused_c_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_TOUCH(unused_c);
+    Mock.unused_c_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_unused_c(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void unused_c_AddCallback(CMOCK_unused_c_CALLBACK Callback)
+{
+  CMOCK_TOUCH(unused_c);
+  Mock.unused_c_IgnoreBool = (char)0;
+  Mock.unused_c_CallbackBool = (char)1;
+  Mock.unused_c_CallbackFunctionPointer = Callback;
+}
+
+void unused_c_Stub(CMOCK_unused_c_CALLBACK Callback)
+{
+  CMOCK_TOUCH(unused_c);
+  Mock.unused_c_IgnoreBool = (char)0;
+  Mock.unused_c_CallbackBool = (char)0;
+  Mock.unused_c_CallbackFunctionPointer = Callback;
+}
+
+void unused_d(int value)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_unused_d_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_unused_d);
+  cmock_call_instance = (CMOCK_unused_d_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.unused_d_CallInstance);
+  Mock.unused_d_CallInstance = CMock_Guts_MemNext(Mock.unused_d_CallInstance);
+  if (Mock.unused_d_IgnoreBool)
+  {
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  if (!Mock.unused_d_CallbackBool &&
+      Mock.unused_d_CallbackFunctionPointer != NULL)
+  {
+    Mock.unused_d_CallbackFunctionPointer(value, Mock.unused_d_CallbackCalls++);
+    UNITY_CLR_DETAILS();
+    return;
+  }
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  if (cmock_call_instance->CallOrder > ++GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledEarly);
+  if (cmock_call_instance->CallOrder < GlobalVerifyOrder)
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLate);
+  {
+    UNITY_SET_DETAILS(CMockString_unused_d,CMockString_value);
+    UNITY_TEST_ASSERT_EQUAL_INT(cmock_call_instance->Expected_value, value, cmock_line, CMockStringMismatch);
+  }
+  if (Mock.unused_d_CallbackFunctionPointer != NULL)
+  {
+    Mock.unused_d_CallbackFunctionPointer(value, Mock.unused_d_CallbackCalls++);
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_unused_d(CMOCK_unused_d_CALL_INSTANCE* cmock_call_instance, int value);
+void CMockExpectParameters_unused_d(CMOCK_unused_d_CALL_INSTANCE* cmock_call_instance, int value)
+{
+  cmock_call_instance->Expected_value = value;
+}
+
+void unused_d_CMockIgnore(void)
+{
+  CMOCK_TOUCH(unused_d);
+  Mock.unused_d_IgnoreBool = (char)1;
+}
+
+void unused_d_CMockStopIgnore(void)
+{
+  CMOCK_TOUCH(unused_d);
+  Mock.unused_d_IgnoreBool = (char)0;
+}
+
+void unused_d_CMockExpect(UNITY_LINE_TYPE cmock_line, int value)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_unused_d_CALL_INSTANCE));
+  CMOCK_unused_d_CALL_INSTANCE* cmock_call_instance = (CMOCK_unused_d_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.unused_d_CallInstance = CMock_Guts_MemChain(Mock.unused_d_CallInstance, cmock_guts_index);
+  CMOCK_TOUCH(unused_d);
+  Mock.unused_d_IgnoreBool = (char)0;
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->CallOrder = ++GlobalExpectCount;
+  CMockExpectParameters_unused_d(cmock_call_instance, value);
+}
+
+void unused_d_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const unused_d_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_unused_d_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_unused_d_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.unused_d_CallInstance = CMock_Guts_MemChain(Mock.unused_d_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_unused_d_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    CMOCK_TOUCH(unused_d);
+    Mock.unused_d_IgnoreBool = (char)0;
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->CallOrder = ++GlobalExpectCount;
+    CMockExpectParameters_unused_d(cmock_call_instance, cmock_rows[cmock_row].value);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void unused_d_AddCallback(CMOCK_unused_d_CALLBACK Callback)
+{
+  CMOCK_TOUCH(unused_d);
+  Mock.unused_d_IgnoreBool = (char)0;
+  Mock.unused_d_CallbackBool = (char)1;
+  Mock.unused_d_CallbackFunctionPointer = Callback;
+}
+
+void unused_d_Stub(CMOCK_unused_d_CALLBACK Callback)
+{
+  CMOCK_TOUCH(unused_d);
+  Mock.unused_d_IgnoreBool = (char)0;
+  Mock.unused_d_CallbackBool = (char)0;
+  Mock.unused_d_CallbackFunctionPointer = Callback;
+}
+
@@ -0,0 +1,157 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_TRACK_TOUCHED_FUNCTIONS_MOCKABLE_H
+#define _MOCK_TRACK_TOUCHED_FUNCTIONS_MOCKABLE_H
+
+#include "unity.h"
+#include "track_touched_functions_types.h"
+#include "track_touched_functions_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_track_touched_functions_mockable_Init(void);
+void mock_track_touched_functions_mockable_Destroy(void);
+void mock_track_touched_functions_mockable_Verify(void);
+
+
+
+
+
+#define read_a_Ignore() TEST_FAIL_MESSAGE("read_a requires _IgnoreAndReturn");
+#define read_a_IgnoreAndReturn(cmock_retval) read_a_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_a_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_a_StopIgnore() read_a_CMockStopIgnore()
+void read_a_CMockStopIgnore(void);
+#define read_a_Expect() TEST_FAIL_MESSAGE("read_a requires _ExpectAndReturn");
+#define read_a_ExpectAndReturn(cmock_retval) read_a_CMockExpectAndReturn(__LINE__, cmock_retval)
+void read_a_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_read_a_EXPECT_ROW
+{
+  int ReturnVal;
+} read_a_ExpectRow;
+#define read_a_ExpectTable(cmock_rows, cmock_count) read_a_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_a_ExpectRow* cmock_rows, size_t cmock_count);
+typedef int (* CMOCK_read_a_CALLBACK)(int cmock_num_calls);
+void read_a_AddCallback(CMOCK_read_a_CALLBACK Callback);
+void read_a_Stub(CMOCK_read_a_CALLBACK Callback);
+#define read_a_StubWithCallback read_a_Stub
+
+#define read_b_Ignore() TEST_FAIL_MESSAGE("read_b requires _IgnoreAndReturn");
+#define read_b_IgnoreAndReturn(cmock_retval) read_b_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_b_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_b_StopIgnore() read_b_CMockStopIgnore()
+void read_b_CMockStopIgnore(void);
+#define read_b_Expect() TEST_FAIL_MESSAGE("read_b requires _ExpectAndReturn");
+#define read_b_ExpectAndReturn(cmock_retval) read_b_CMockExpectAndReturn(__LINE__, cmock_retval)
+void read_b_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_read_b_EXPECT_ROW
+{
+  int ReturnVal;
+} read_b_ExpectRow;
+#define read_b_ExpectTable(cmock_rows, cmock_count) read_b_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_b_ExpectRow* cmock_rows, size_t cmock_count);
+typedef int (* CMOCK_read_b_CALLBACK)(int cmock_num_calls);
+void read_b_AddCallback(CMOCK_read_b_CALLBACK Callback);
+void read_b_Stub(CMOCK_read_b_CALLBACK Callback);
+#define read_b_StubWithCallback read_b_Stub
+
+#define write_a_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("write_a requires _Ignore (not AndReturn)");
+#define write_a_Ignore() write_a_CMockIgnore()
+void write_a_CMockIgnore(void);
+#define write_a_StopIgnore() write_a_CMockStopIgnore()
+void write_a_CMockStopIgnore(void);
+#define write_a_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("write_a requires _Expect (not AndReturn)");
+#define write_a_Expect(value) write_a_CMockExpect(__LINE__, value)
+void write_a_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_write_a_EXPECT_ROW
+{
+  int value;
+} write_a_ExpectRow;
+#define write_a_ExpectTable(cmock_rows, cmock_count) write_a_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_a_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_a_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_write_a_CALLBACK)(int value, int cmock_num_calls);
+void write_a_AddCallback(CMOCK_write_a_CALLBACK Callback);
+void write_a_Stub(CMOCK_write_a_CALLBACK Callback);
+#define write_a_StubWithCallback write_a_Stub
+
+#define write_b_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("write_b requires _Ignore (not AndReturn)");
+#define write_b_Ignore() write_b_CMockIgnore()
+void write_b_CMockIgnore(void);
+#define write_b_StopIgnore() write_b_CMockStopIgnore()
+void write_b_CMockStopIgnore(void);
+#define write_b_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("write_b requires _Expect (not AndReturn)");
+#define write_b_Expect(value) write_b_CMockExpect(__LINE__, value)
+void write_b_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_write_b_EXPECT_ROW
+{
+  int value;
+} write_b_ExpectRow;
+#define write_b_ExpectTable(cmock_rows, cmock_count) write_b_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_b_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_b_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_write_b_CALLBACK)(int value, int cmock_num_calls);
+void write_b_AddCallback(CMOCK_write_b_CALLBACK Callback);
+void write_b_Stub(CMOCK_write_b_CALLBACK Callback);
+#define write_b_StubWithCallback write_b_Stub
+
+#define unused_c_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("unused_c requires _Ignore (not AndReturn)");
+#define unused_c_Ignore() unused_c_CMockIgnore()
+void unused_c_CMockIgnore(void);
+#define unused_c_StopIgnore() unused_c_CMockStopIgnore()
+void unused_c_CMockStopIgnore(void);
+#define unused_c_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("unused_c requires _Expect (not AndReturn)");
+#define unused_c_Expect(value) unused_c_CMockExpect(__LINE__, value)
+void unused_c_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_unused_c_EXPECT_ROW
+{
+  int value;
+} unused_c_ExpectRow;
+#define unused_c_ExpectTable(cmock_rows, cmock_count) unused_c_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void unused_c_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const unused_c_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_unused_c_CALLBACK)(int value, int cmock_num_calls);
+void unused_c_AddCallback(CMOCK_unused_c_CALLBACK Callback);
+void unused_c_Stub(CMOCK_unused_c_CALLBACK Callback);
+#define unused_c_StubWithCallback unused_c_Stub
+
+#define unused_d_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("unused_d requires _Ignore (not AndReturn)");
+#define unused_d_Ignore() unused_d_CMockIgnore()
+void unused_d_CMockIgnore(void);
+#define unused_d_StopIgnore() unused_d_CMockStopIgnore()
+void unused_d_CMockStopIgnore(void);
+#define unused_d_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("unused_d requires _Expect (not AndReturn)");
+#define unused_d_Expect(value) unused_d_CMockExpect(__LINE__, value)
+void unused_d_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_unused_d_EXPECT_ROW
+{
+  int value;
+} unused_d_ExpectRow;
+#define unused_d_ExpectTable(cmock_rows, cmock_count) unused_d_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void unused_d_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const unused_d_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_unused_d_CALLBACK)(int value, int cmock_num_calls);
+void unused_d_AddCallback(CMOCK_unused_d_CALLBACK Callback);
+void unused_d_Stub(CMOCK_unused_d_CALLBACK Callback);
+#define unused_d_StubWithCallback unused_d_Stub
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,261 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "mock_unity_void_pointer_compare_mockable.h"
+
+static const char* CMockString_get_v_ptr = "get_v_ptr";
+static const char* CMockString_get_v_ptr_typedefed = "get_v_ptr_typedefed";
+static const char* CMockString_ptr = "ptr";
+static const char* CMockString_ret_v_ptr = "ret_v_ptr";
+
+typedef struct _CMOCK_ret_v_ptr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  void* ReturnVal;
+
+} CMOCK_ret_v_ptr_CALL_INSTANCE;
+
+typedef struct _CMOCK_get_v_ptr_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  void* Expected_ptr;
+  int Expected_ptr_Depth;
+
+} CMOCK_get_v_ptr_CALL_INSTANCE;
+
+typedef struct _CMOCK_get_v_ptr_typedefed_CALL_INSTANCE
+{
+  UNITY_LINE_TYPE LineNumber;
+  unsigned char* Expected_ptr;
+  int Expected_ptr_Depth;
+
+} CMOCK_get_v_ptr_typedefed_CALL_INSTANCE;
+
+static CMOCK_THREAD_STORAGE struct mock_unity_void_pointer_compare_mockableInstance
+{
+  CMOCK_MEM_INDEX_TYPE ret_v_ptr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE get_v_ptr_CallInstance;
+  CMOCK_MEM_INDEX_TYPE get_v_ptr_typedefed_CallInstance;
+} Mock;
+
+
+void mock_unity_void_pointer_compare_mockable_Verify(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_MEM_INDEX_TYPE call_instance;
+  call_instance = Mock.ret_v_ptr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_ret_v_ptr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.get_v_ptr_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_get_v_ptr);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+  call_instance = Mock.get_v_ptr_typedefed_CallInstance;
+  if (CMOCK_GUTS_NONE != call_instance)
+  {
+    UNITY_SET_DETAIL(CMockString_get_v_ptr_typedefed);
+    UNITY_TEST_FAIL(cmock_line, CMockStringCalledLess);
+  }
+}
+
+void mock_unity_void_pointer_compare_mockable_Init(void)
+{
+  mock_unity_void_pointer_compare_mockable_Destroy();
+}
+
+void mock_unity_void_pointer_compare_mockable_Destroy(void)
+{
+  CMock_Guts_MemFreeAll();
+  memset(&Mock, 0, sizeof(Mock));
+}
+
+void* ret_v_ptr(void)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_ret_v_ptr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_ret_v_ptr);
+  cmock_call_instance = (CMOCK_ret_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.ret_v_ptr_CallInstance);
+  Mock.ret_v_ptr_CallInstance = CMock_Guts_MemNext(Mock.ret_v_ptr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  UNITY_CLR_DETAILS();
+  return cmock_call_instance->ReturnVal;
+}
+
+void ret_v_ptr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, void* cmock_to_return)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_ret_v_ptr_CALL_INSTANCE));
+  CMOCK_ret_v_ptr_CALL_INSTANCE* cmock_call_instance = (CMOCK_ret_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.ret_v_ptr_CallInstance = CMock_Guts_MemChain(Mock.ret_v_ptr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  cmock_call_instance->ReturnVal = cmock_to_return;
+}
+
+void ret_v_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ret_v_ptr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_ret_v_ptr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_ret_v_ptr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.ret_v_ptr_CallInstance = CMock_Guts_MemChain(Mock.ret_v_ptr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_ret_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    cmock_call_instance->ReturnVal = cmock_rows[cmock_row].ReturnVal;
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void get_v_ptr(void* ptr)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_get_v_ptr_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_get_v_ptr);
+  cmock_call_instance = (CMOCK_get_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.get_v_ptr_CallInstance);
+  Mock.get_v_ptr_CallInstance = CMock_Guts_MemNext(Mock.get_v_ptr_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_get_v_ptr,CMockString_ptr);
+    if (cmock_call_instance->Expected_ptr == NULL)
+      { UNITY_TEST_ASSERT_NULL(ptr, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX8_ARRAY(cmock_call_instance->Expected_ptr, ptr, cmock_call_instance->Expected_ptr_Depth, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_get_v_ptr(CMOCK_get_v_ptr_CALL_INSTANCE* cmock_call_instance, void* ptr, int ptr_Depth);
+void CMockExpectParameters_get_v_ptr(CMOCK_get_v_ptr_CALL_INSTANCE* cmock_call_instance, void* ptr, int ptr_Depth)
+{
+  cmock_call_instance->Expected_ptr = ptr;
+  cmock_call_instance->Expected_ptr_Depth = ptr_Depth;
+}
+
+void get_v_ptr_CMockExpect(UNITY_LINE_TYPE cmock_line, void* ptr)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_v_ptr_CALL_INSTANCE));
+  CMOCK_get_v_ptr_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.get_v_ptr_CallInstance = CMock_Guts_MemChain(Mock.get_v_ptr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get_v_ptr(cmock_call_instance, ptr, 1);
+}
+
+void get_v_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_v_ptr_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_get_v_ptr_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_get_v_ptr_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.get_v_ptr_CallInstance = CMock_Guts_MemChain(Mock.get_v_ptr_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_get_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_get_v_ptr(cmock_call_instance, cmock_rows[cmock_row].ptr, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void get_v_ptr_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, void* ptr, int ptr_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_v_ptr_CALL_INSTANCE));
+  CMOCK_get_v_ptr_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_v_ptr_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.get_v_ptr_CallInstance = CMock_Guts_MemChain(Mock.get_v_ptr_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get_v_ptr(cmock_call_instance, ptr, ptr_Depth);
+}
+
+void get_v_ptr_typedefed(VOID_PTR ptr)
+{
+  UNITY_LINE_TYPE cmock_line = TEST_LINE_NUM;
+  CMOCK_get_v_ptr_typedefed_CALL_INSTANCE* cmock_call_instance;
+  UNITY_SET_DETAIL(CMockString_get_v_ptr_typedefed);
+  cmock_call_instance = (CMOCK_get_v_ptr_typedefed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(Mock.get_v_ptr_typedefed_CallInstance);
+  Mock.get_v_ptr_typedefed_CallInstance = CMock_Guts_MemNext(Mock.get_v_ptr_typedefed_CallInstance);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringCalledMore);
+  cmock_line = cmock_call_instance->LineNumber;
+  {
+    UNITY_SET_DETAILS(CMockString_get_v_ptr_typedefed,CMockString_ptr);
+    if (cmock_call_instance->Expected_ptr == NULL)
+      { UNITY_TEST_ASSERT_NULL(ptr, cmock_line, CMockStringExpNULL); }
+    else
+      { UNITY_TEST_ASSERT_EQUAL_HEX8_ARRAY(cmock_call_instance->Expected_ptr, ptr, cmock_call_instance->Expected_ptr_Depth, cmock_line, CMockStringMismatch); }
+  }
+  UNITY_CLR_DETAILS();
+}
+
+void CMockExpectParameters_get_v_ptr_typedefed(CMOCK_get_v_ptr_typedefed_CALL_INSTANCE* cmock_call_instance, unsigned char* ptr, int ptr_Depth);
+void CMockExpectParameters_get_v_ptr_typedefed(CMOCK_get_v_ptr_typedefed_CALL_INSTANCE* cmock_call_instance, unsigned char* ptr, int ptr_Depth)
+{
+  cmock_call_instance->Expected_ptr = ptr;
+  cmock_call_instance->Expected_ptr_Depth = ptr_Depth;
+}
+
+void get_v_ptr_typedefed_CMockExpect(UNITY_LINE_TYPE cmock_line, VOID_PTR ptr)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_v_ptr_typedefed_CALL_INSTANCE));
+  CMOCK_get_v_ptr_typedefed_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_v_ptr_typedefed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.get_v_ptr_typedefed_CallInstance = CMock_Guts_MemChain(Mock.get_v_ptr_typedefed_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get_v_ptr_typedefed(cmock_call_instance, ptr, 1);
+}
+
+void get_v_ptr_typedefed_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_v_ptr_typedefed_ExpectRow* cmock_rows, size_t cmock_count)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index;
+  CMOCK_get_v_ptr_typedefed_CALL_INSTANCE* cmock_call_instance;
+  size_t cmock_row;
+  if (cmock_count == 0)
+    return;
+  /* a count the index type can't hold would claim fewer rows than the loop fills */
+  UNITY_TEST_ASSERT((size_t)(CMOCK_MEM_INDEX_TYPE)cmock_count == cmock_count, cmock_line, CMockStringOutOfMemory);
+  cmock_guts_index = CMock_Guts_MemNewChain(sizeof(CMOCK_get_v_ptr_typedefed_CALL_INSTANCE), (CMOCK_MEM_INDEX_TYPE)cmock_count);
+  UNITY_TEST_ASSERT_NOT_NULL(CMock_Guts_GetAddressFor(cmock_guts_index), cmock_line, CMockStringOutOfMemory);
+  Mock.get_v_ptr_typedefed_CallInstance = CMock_Guts_MemChain(Mock.get_v_ptr_typedefed_CallInstance, cmock_guts_index);
+  for (cmock_row = 0; cmock_row < cmock_count; cmock_row++)
+  {
+    cmock_call_instance = (CMOCK_get_v_ptr_typedefed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+    cmock_call_instance->LineNumber = cmock_line;
+    CMockExpectParameters_get_v_ptr_typedefed(cmock_call_instance, cmock_rows[cmock_row].ptr, 1);
+    cmock_guts_index = CMock_Guts_MemNext(cmock_guts_index);
+  }
+}
+
+void get_v_ptr_typedefed_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, unsigned char* ptr, int ptr_Depth)
+{
+  CMOCK_MEM_INDEX_TYPE cmock_guts_index = CMock_Guts_MemNew(sizeof(CMOCK_get_v_ptr_typedefed_CALL_INSTANCE));
+  CMOCK_get_v_ptr_typedefed_CALL_INSTANCE* cmock_call_instance = (CMOCK_get_v_ptr_typedefed_CALL_INSTANCE*)CMock_Guts_GetAddressFor(cmock_guts_index);
+  UNITY_TEST_ASSERT_NOT_NULL(cmock_call_instance, cmock_line, CMockStringOutOfMemory);
+  memset(cmock_call_instance, 0, sizeof(*cmock_call_instance));
+  Mock.get_v_ptr_typedefed_CallInstance = CMock_Guts_MemChain(Mock.get_v_ptr_typedefed_CallInstance, cmock_guts_index);
+  cmock_call_instance->LineNumber = cmock_line;
+  CMockExpectParameters_get_v_ptr_typedefed(cmock_call_instance, ptr, ptr_Depth);
+}
+
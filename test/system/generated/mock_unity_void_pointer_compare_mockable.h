@@ -0,0 +1,76 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_UNITY_VOID_POINTER_COMPARE_MOCKABLE_H
+#define _MOCK_UNITY_VOID_POINTER_COMPARE_MOCKABLE_H
+
+#include "unity.h"
+#include "unity_void_pointer_compare_types.h"
+#include "unity_void_pointer_compare_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_unity_void_pointer_compare_mockable_Init(void);
+void mock_unity_void_pointer_compare_mockable_Destroy(void);
+void mock_unity_void_pointer_compare_mockable_Verify(void);
+
+
+
+
+#define ret_v_ptr_Expect() TEST_FAIL_MESSAGE("ret_v_ptr requires _ExpectAndReturn");
+#define ret_v_ptr_ExpectAndReturn(cmock_retval) ret_v_ptr_CMockExpectAndReturn(__LINE__, cmock_retval)
+void ret_v_ptr_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, void* cmock_to_return);
+typedef struct _CMOCK_ret_v_ptr_EXPECT_ROW
+{
+  void* ReturnVal;
+} ret_v_ptr_ExpectRow;
+#define ret_v_ptr_ExpectTable(cmock_rows, cmock_count) ret_v_ptr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void ret_v_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const ret_v_ptr_ExpectRow* cmock_rows, size_t cmock_count);
+#define get_v_ptr_ExpectAndReturn(ptr, cmock_retval) TEST_FAIL_MESSAGE("get_v_ptr requires _Expect (not AndReturn)");
+#define get_v_ptr_Expect(ptr) get_v_ptr_CMockExpect(__LINE__, ptr)
+void get_v_ptr_CMockExpect(UNITY_LINE_TYPE cmock_line, void* ptr);
+typedef struct _CMOCK_get_v_ptr_EXPECT_ROW
+{
+  void* ptr;
+} get_v_ptr_ExpectRow;
+#define get_v_ptr_ExpectTable(cmock_rows, cmock_count) get_v_ptr_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void get_v_ptr_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_v_ptr_ExpectRow* cmock_rows, size_t cmock_count);
+#define get_v_ptr_ExpectWithArrayAndReturn(ptr, ptr_Depth, cmock_retval) TEST_FAIL_MESSAGE("get_v_ptr requires _ExpectWithArray (not AndReturn)");
+#define get_v_ptr_ExpectWithArray(ptr, ptr_Depth) get_v_ptr_CMockExpectWithArray(__LINE__, ptr, (ptr_Depth))
+void get_v_ptr_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, void* ptr, int ptr_Depth);
+#define get_v_ptr_typedefed_ExpectAndReturn(ptr, cmock_retval) TEST_FAIL_MESSAGE("get_v_ptr_typedefed requires _Expect (not AndReturn)");
+#define get_v_ptr_typedefed_Expect(ptr) get_v_ptr_typedefed_CMockExpect(__LINE__, ptr)
+void get_v_ptr_typedefed_CMockExpect(UNITY_LINE_TYPE cmock_line, VOID_PTR ptr);
+typedef struct _CMOCK_get_v_ptr_typedefed_EXPECT_ROW
+{
+  unsigned char* ptr;
+} get_v_ptr_typedefed_ExpectRow;
+#define get_v_ptr_typedefed_ExpectTable(cmock_rows, cmock_count) get_v_ptr_typedefed_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void get_v_ptr_typedefed_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const get_v_ptr_typedefed_ExpectRow* cmock_rows, size_t cmock_count);
+#define get_v_ptr_typedefed_ExpectWithArrayAndReturn(ptr, ptr_Depth, cmock_retval) TEST_FAIL_MESSAGE("get_v_ptr_typedefed requires _ExpectWithArray (not AndReturn)");
+#define get_v_ptr_typedefed_ExpectWithArray(ptr, ptr_Depth) get_v_ptr_typedefed_CMockExpectWithArray(__LINE__, ptr, (ptr_Depth))
+void get_v_ptr_typedefed_CMockExpectWithArray(UNITY_LINE_TYPE cmock_line, unsigned char* ptr, int ptr_Depth);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,101 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_USAGE_SOURCES_MOCKABLE_H
+#define _MOCK_USAGE_SOURCES_MOCKABLE_H
+
+#include "unity.h"
+#include "usage_sources_types.h"
+#include "usage_sources_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_usage_sources_mockable_Init(void);
+void mock_usage_sources_mockable_Destroy(void);
+void mock_usage_sources_mockable_Verify(void);
+
+
+
+
+
+#define read_value_Ignore() TEST_FAIL_MESSAGE("read_value requires _IgnoreAndReturn");
+#define read_value_IgnoreAndReturn(cmock_retval) read_value_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void read_value_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define read_value_StopIgnore() read_value_CMockStopIgnore()
+void read_value_CMockStopIgnore(void);
+#define read_value_Expect() TEST_FAIL_MESSAGE("read_value requires _ExpectAndReturn");
+#define read_value_ExpectAndReturn(cmock_retval) read_value_CMockExpectAndReturn(__LINE__, cmock_retval)
+void read_value_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+typedef struct _CMOCK_read_value_EXPECT_ROW
+{
+  int ReturnVal;
+} read_value_ExpectRow;
+#define read_value_ExpectTable(cmock_rows, cmock_count) read_value_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void read_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const read_value_ExpectRow* cmock_rows, size_t cmock_count);
+typedef int (* CMOCK_read_value_CALLBACK)(int cmock_num_calls);
+void read_value_AddCallback(CMOCK_read_value_CALLBACK Callback);
+void read_value_Stub(CMOCK_read_value_CALLBACK Callback);
+#define read_value_StubWithCallback read_value_Stub
+
+#define write_value_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("write_value requires _Ignore (not AndReturn)");
+#define write_value_Ignore() write_value_CMockIgnore()
+void write_value_CMockIgnore(void);
+#define write_value_StopIgnore() write_value_CMockStopIgnore()
+void write_value_CMockStopIgnore(void);
+#define write_value_ExpectAndReturn(value, cmock_retval) TEST_FAIL_MESSAGE("write_value requires _Expect (not AndReturn)");
+#define write_value_Expect(value) write_value_CMockExpect(__LINE__, value)
+void write_value_CMockExpect(UNITY_LINE_TYPE cmock_line, int value);
+typedef struct _CMOCK_write_value_EXPECT_ROW
+{
+  int value;
+} write_value_ExpectRow;
+#define write_value_ExpectTable(cmock_rows, cmock_count) write_value_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void write_value_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const write_value_ExpectRow* cmock_rows, size_t cmock_count);
+typedef void (* CMOCK_write_value_CALLBACK)(int value, int cmock_num_calls);
+void write_value_AddCallback(CMOCK_write_value_CALLBACK Callback);
+void write_value_Stub(CMOCK_write_value_CALLBACK Callback);
+#define write_value_StubWithCallback write_value_Stub
+
+#define filter_Ignore() TEST_FAIL_MESSAGE("filter requires _IgnoreAndReturn");
+#define filter_IgnoreAndReturn(cmock_retval) filter_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void filter_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, int cmock_to_return);
+#define filter_StopIgnore() filter_CMockStopIgnore()
+void filter_CMockStopIgnore(void);
+#define filter_Expect(value) TEST_FAIL_MESSAGE("filter requires _ExpectAndReturn");
+#define filter_ExpectAndReturn(value, cmock_retval) filter_CMockExpectAndReturn(__LINE__, value, cmock_retval)
+void filter_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, int value, int cmock_to_return);
+typedef struct _CMOCK_filter_EXPECT_ROW
+{
+  int value;
+  int ReturnVal;
+} filter_ExpectRow;
+#define filter_ExpectTable(cmock_rows, cmock_count) filter_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void filter_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const filter_ExpectRow* cmock_rows, size_t cmock_count);
+typedef int (* CMOCK_filter_CALLBACK)(int value, int cmock_num_calls);
+void filter_AddCallback(CMOCK_filter_CALLBACK Callback);
+void filter_Stub(CMOCK_filter_CALLBACK Callback);
+#define filter_StubWithCallback filter_Stub
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
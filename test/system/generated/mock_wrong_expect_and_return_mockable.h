@@ -0,0 +1,126 @@
+/* AUTOGENERATED FILE. DO NOT EDIT. */
+#ifndef _MOCK_WRONG_EXPECT_AND_RETURN_MOCKABLE_H
+#define _MOCK_WRONG_EXPECT_AND_RETURN_MOCKABLE_H
+
+#include "unity.h"
+#include "wrong_expect_and_return_types.h"
+#include "wrong_expect_and_return_mockable.h"
+
+/* Ignore the following warnings, since we are copying code */
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic push
+#endif
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mock_wrong_expect_and_return_mockable_Init(void);
+void mock_wrong_expect_and_return_mockable_Destroy(void);
+void mock_wrong_expect_and_return_mockable_Verify(void);
+
+
+
+
+
+#define foo_Ignore() TEST_FAIL_MESSAGE("foo requires _IgnoreAndReturn");
+#define foo_IgnoreAndReturn(cmock_retval) foo_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void foo_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define foo_StopIgnore() foo_CMockStopIgnore()
+void foo_CMockStopIgnore(void);
+
+#define foo_ExpectAnyArgs() TEST_FAIL_MESSAGE("foo requires _ExpectAnyArgsAndReturn");
+#define foo_ExpectAnyArgsAndReturn(cmock_retval) foo_CMockExpectAnyArgsAndReturn(__LINE__, cmock_retval)
+void foo_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define foo_Expect(a) TEST_FAIL_MESSAGE("foo requires _ExpectAndReturn");
+#define foo_ExpectAndReturn(a, cmock_retval) foo_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return);
+typedef struct _CMOCK_foo_EXPECT_ROW
+{
+  custom_type a;
+  UINT32 ReturnVal;
+} foo_ExpectRow;
+#define foo_ExpectTable(cmock_rows, cmock_count) foo_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define bar_Ignore() TEST_FAIL_MESSAGE("bar requires _IgnoreAndReturn");
+#define bar_IgnoreAndReturn(cmock_retval) bar_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void bar_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define bar_StopIgnore() bar_CMockStopIgnore()
+void bar_CMockStopIgnore(void);
+#define bar_Expect() TEST_FAIL_MESSAGE("bar requires _ExpectAndReturn");
+#define bar_ExpectAndReturn(cmock_retval) bar_CMockExpectAndReturn(__LINE__, cmock_retval)
+void bar_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+typedef struct _CMOCK_bar_EXPECT_ROW
+{
+  UINT32 ReturnVal;
+} bar_ExpectRow;
+#define bar_ExpectTable(cmock_rows, cmock_count) bar_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void bar_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const bar_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define foo_varargs_Ignore() TEST_FAIL_MESSAGE("foo_varargs requires _IgnoreAndReturn");
+#define foo_varargs_IgnoreAndReturn(cmock_retval) foo_varargs_CMockIgnoreAndReturn(__LINE__, cmock_retval)
+void foo_varargs_CMockIgnoreAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define foo_varargs_StopIgnore() foo_varargs_CMockStopIgnore()
+void foo_varargs_CMockStopIgnore(void);
+
+#define foo_varargs_ExpectAnyArgs() TEST_FAIL_MESSAGE("foo_varargs requires _ExpectAnyArgsAndReturn");
+#define foo_varargs_ExpectAnyArgsAndReturn(cmock_retval) foo_varargs_CMockExpectAnyArgsAndReturn(__LINE__, cmock_retval)
+void foo_varargs_CMockExpectAnyArgsAndReturn(UNITY_LINE_TYPE cmock_line, UINT32 cmock_to_return);
+#define foo_varargs_Expect(a) TEST_FAIL_MESSAGE("foo_varargs requires _ExpectAndReturn");
+#define foo_varargs_ExpectAndReturn(a, cmock_retval) foo_varargs_CMockExpectAndReturn(__LINE__, a, cmock_retval)
+void foo_varargs_CMockExpectAndReturn(UNITY_LINE_TYPE cmock_line, custom_type a, UINT32 cmock_to_return);
+typedef struct _CMOCK_foo_varargs_EXPECT_ROW
+{
+  custom_type a;
+  UINT32 ReturnVal;
+} foo_varargs_ExpectRow;
+#define foo_varargs_ExpectTable(cmock_rows, cmock_count) foo_varargs_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void foo_varargs_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const foo_varargs_ExpectRow* cmock_rows, size_t cmock_count);
+
+#define do_it_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("do_it requires _Ignore (not AndReturn)");
+#define do_it_Ignore() do_it_CMockIgnore()
+void do_it_CMockIgnore(void);
+#define do_it_StopIgnore() do_it_CMockStopIgnore()
+void do_it_CMockStopIgnore(void);
+#define do_it_ExpectAndReturn(cmock_retval) TEST_FAIL_MESSAGE("do_it requires _Expect (not AndReturn)");
+#define do_it_Expect() do_it_CMockExpect(__LINE__)
+void do_it_CMockExpect(UNITY_LINE_TYPE cmock_line);
+
+#define do_another_IgnoreAndReturn(cmock_retval) TEST_FAIL_MESSAGE("do_another requires _Ignore (not AndReturn)");
+#define do_another_Ignore() do_another_CMockIgnore()
+void do_another_CMockIgnore(void);
+#define do_another_StopIgnore() do_another_CMockStopIgnore()
+void do_another_CMockStopIgnore(void);
+
+#define do_another_ExpectAnyArgsAndReturn(cmock_retval) TEST_FAIL_MESSAGE("do_another requires _ExpectAnyArgs (not AndReturn)");
+#define do_another_ExpectAnyArgs() do_another_CMockExpectAnyArgs(__LINE__)
+void do_another_CMockExpectAnyArgs(UNITY_LINE_TYPE cmock_line);
+#define do_another_ExpectAndReturn(i, cmock_retval) TEST_FAIL_MESSAGE("do_another requires _Expect (not AndReturn)");
+#define do_another_Expect(i) do_another_CMockExpect(__LINE__, i)
+void do_another_CMockExpect(UNITY_LINE_TYPE cmock_line, int i);
+typedef struct _CMOCK_do_another_EXPECT_ROW
+{
+  int i;
+} do_another_ExpectRow;
+#define do_another_ExpectTable(cmock_rows, cmock_count) do_another_CMockExpectTable(__LINE__, cmock_rows, cmock_count)
+void do_another_CMockExpectTable(UNITY_LINE_TYPE cmock_line, const do_another_ExpectRow* cmock_rows, size_t cmock_count);
+
+#ifdef __cplusplus
+}
+#endif
+
+#if defined(__GNUC__) && !defined(__ICC) && !defined(__TMS470__)
+#if __GNUC__ > 4 || (__GNUC__ == 4 && (__GNUC_MINOR__ > 6 || (__GNUC_MINOR__ == 6 && __GNUC_PATCHLEVEL__ > 0)))
+#pragma GCC diagnostic pop
+#endif
+#endif
+
+#endif
@@ -0,0 +1,16 @@
+#include "newer_standards_stuff1_types.h"
+#include "newer_standards_stuff1_mockable.h"
+#include "newer_standards_stuff1.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int8_t function_a(void) {
+  return (int8_t)(INT_MIN == foo(INT_MAX));
+}
+
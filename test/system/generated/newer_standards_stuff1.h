@@ -0,0 +1,17 @@
+#ifndef _NEWER_STANDARDS_STUFF1
+#define _NEWER_STANDARDS_STUFF1
+
+#include "newer_standards_stuff1_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int8_t function_a(void);
+
+#endif // _NEWER_STANDARDS_STUFF1
+
@@ -0,0 +1,17 @@
+#ifndef _NEWER_STANDARDS_STUFF1_MOCKABLE_H
+#define _NEWER_STANDARDS_STUFF1_MOCKABLE_H
+
+#include "newer_standards_stuff1_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int32_t foo(int32_t a);
+
+#endif // _NEWER_STANDARDS_STUFF1_MOCKABLE_H
+
@@ -0,0 +1,17 @@
+#ifndef _NEWER_STANDARDS_STUFF1_TYPES_H
+#define _NEWER_STANDARDS_STUFF1_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include <stdint.h>
+#include <limits.h>
+
+#endif // _NEWER_STANDARDS_STUFF1_TYPES_H
+
@@ -0,0 +1,19 @@
+#include "nonstandard_parsed_stuff_1_types.h"
+#include "nonstandard_parsed_stuff_1_mockable.h"
+#include "nonstandard_parsed_stuff_1.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_c(void) {
+  CEXCEPTION_T e;
+  Try {
+    foos(bars());
+  } Catch(e) { foos("err"); }
+}
+
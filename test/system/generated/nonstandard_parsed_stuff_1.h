@@ -0,0 +1,21 @@
+#ifndef _NONSTANDARD_PARSED_STUFF_1
+#define _NONSTANDARD_PARSED_STUFF_1
+
+#include "nonstandard_parsed_stuff_1_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h" 
+void function_a(void);
+void function_b(void);
+void function_c(void);
+int function_d(void);
+
+#endif // _NONSTANDARD_PARSED_STUFF_1
+
@@ -0,0 +1,19 @@
+#ifndef _NONSTANDARD_PARSED_STUFF_1_MOCKABLE_H
+#define _NONSTANDARD_PARSED_STUFF_1_MOCKABLE_H
+
+#include "nonstandard_parsed_stuff_1_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include  "CException.h"
+void foos(const char const * a);
+const char const * bars(void);
+
+#endif // _NONSTANDARD_PARSED_STUFF_1_MOCKABLE_H
+
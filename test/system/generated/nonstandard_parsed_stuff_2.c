@@ -0,0 +1,16 @@
+#include "nonstandard_parsed_stuff_2_types.h"
+#include "nonstandard_parsed_stuff_2_mockable.h"
+#include "nonstandard_parsed_stuff_2.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void) {
+  foo(bar());
+}
+
@@ -0,0 +1,17 @@
+#ifndef _NONSTANDARD_PARSED_STUFF_2
+#define _NONSTANDARD_PARSED_STUFF_2
+
+#include "nonstandard_parsed_stuff_2_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void);
+
+#endif // _NONSTANDARD_PARSED_STUFF_2
+
@@ -0,0 +1,18 @@
+#ifndef _NONSTANDARD_PARSED_STUFF_2_MOCKABLE_H
+#define _NONSTANDARD_PARSED_STUFF_2_MOCKABLE_H
+
+#include "nonstandard_parsed_stuff_2_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void foo(unsigned char** a);
+unsigned char** bar(void);
+
+#endif // _NONSTANDARD_PARSED_STUFF_2_MOCKABLE_H
+
@@ -0,0 +1,62 @@
+#include "parsing_challenges_types.h"
+#include "parsing_challenges_mockable.h"
+#include "parsing_challenges.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int A, B, C;
+unsigned int *pA, *pB, *pC;
+
+U16* exercise_return_pointers(int a)
+{
+  ptr_return1(a);
+  ptr_return2(a);
+  return ptr_return3(a);
+}
+
+void exercise_var_args(int a, int b)
+{
+  var_args1(a, 3);
+  var_args2(a, b, 'c');
+}
+
+void exercise_arglist_pointers(void)
+{
+  void_type_craziness1(&A, &B, &C);
+  void_type_craziness2();
+}
+
+char exercise_multiline_declarations(int a, unsigned int b)
+{
+  return crazy_multiline(a, b);
+}
+
+void exercise_double_pointers(unsigned int** a)
+{
+  ptr_ptr_return1((unsigned int**)a);
+  ptr_ptr_return2((unsigned int**)a);
+  ptr_ptr_return3((unsigned int**)a);
+  ptr_ptr_return4((unsigned int**)a);
+}
+
+int exercise_many_descriptors(int a)
+{
+  return (int)incredible_descriptors((unsigned short)a);
+}
+
+void exercise_type_craziness3(VOID_TYPE_CRAZINESS_CFG* a)
+{
+  void_type_craziness3(a);
+}
+
+TypeDefInt exercise_typedef_like_names(TypeDefInt a)
+{
+  return uses_typedef_like_names(a);
+}
+
@@ -0,0 +1,24 @@
+#ifndef _PARSING_CHALLENGES
+#define _PARSING_CHALLENGES
+
+#include "parsing_challenges_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+U16* exercise_return_pointers(int a);
+void exercise_var_args(int a, int b);
+void exercise_arglist_pointers(void);
+char exercise_multiline_declarations(int a, unsigned int b);
+void exercise_double_pointers(unsigned int** a);
+int  exercise_many_descriptors(int a);
+void exercise_type_craziness3(VOID_TYPE_CRAZINESS_CFG* a);
+TypeDefInt exercise_typedef_like_names(TypeDefInt a);
+
+#endif // _PARSING_CHALLENGES
+
@@ -0,0 +1,65 @@
+#ifndef _PARSING_CHALLENGES_MOCKABLE_H
+#define _PARSING_CHALLENGES_MOCKABLE_H
+
+#include "parsing_challenges_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+/* Make sure we ignore the following
+#include "NonExistantFile.h
+*/
+//#include "AndIgnoreThisToo.h"
+#ifdef __cplusplus
+extern "C" {
+#endif
+#define SHOULD_IGNORE_NEXT_FUNC_DEF_AS_PART_OF_MACRO   \
+        void IgnoredFunction(NotAValidType ToMakeItFailIfWeActuallyMockedThis);
+
+// typedef edge case; must be in mockable.h for test to compile
+// not ANSI C but it has been done and will break cmock if not handled
+typedef void VOID_TYPE_CRAZINESS_LCL;
+
+VOID_TYPE_CRAZINESS_LCL void_type_craziness1(int * a, int *b, int* c);
+void void_type_craziness2(VOID_TYPE_CRAZINESS_CFG);
+void void_type_craziness3(VOID_TYPE_CRAZINESS_CFG* a);
+
+// pointer parsing exercise
+U16  *ptr_return1(int a);
+U16*  ptr_return2(int a);
+U16 * ptr_return3(int a);
+
+unsigned int** ptr_ptr_return1(unsigned int** a);
+unsigned int* *ptr_ptr_return2(unsigned int* *a);
+unsigned int **ptr_ptr_return3(unsigned int **a);
+unsigned int ** ptr_ptr_return4(unsigned int ** a);
+
+// variable argument lists
+void var_args1(int a, ...);
+void var_args2(int a, int b, ...);
+
+// parsing "stress tests"
+char
+crazy_multiline(
+  int a,
+  unsigned int b);
+
+unsigned long int incredible_descriptors(register const unsigned short a);
+
+TypeDefInt uses_typedef_like_names(TypeDefInt typedefvar);
+
+void oh_brackets1(int fudge[5]);
+void oh_brackets2(int caramel[]);
+void oh_brackets3(int toffee[(32)]);
+void oh_brackets4(int taffy[ (64) ]);
+#ifdef __cplusplus
+}
+#endif
+
+#endif // _PARSING_CHALLENGES_MOCKABLE_H
+
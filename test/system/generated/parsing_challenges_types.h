@@ -0,0 +1,23 @@
+#ifndef _PARSING_CHALLENGES_TYPES_H
+#define _PARSING_CHALLENGES_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef unsigned short U16;
+typedef struct _POINT_T
+{
+  int x;
+  int y;
+} POINT_T;
+typedef void VOID_TYPE_CRAZINESS_CFG;
+typedef int TypeDefInt;
+
+#endif // _PARSING_CHALLENGES_TYPES_H
+
@@ -0,0 +1,24 @@
+#include "record_and_replay_types.h"
+#include "record_and_replay_mockable.h"
+#include "record_and_replay.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int scaled_copy(int factor)
+{
+  int value = read_value();
+  write_value(value * factor);
+  return value;
+}
+void reset_then_copy(void)
+{
+  reset();
+  scaled_copy(1);
+}
+
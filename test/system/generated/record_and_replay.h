@@ -0,0 +1,18 @@
+#ifndef _RECORD_AND_REPLAY
+#define _RECORD_AND_REPLAY
+
+#include "record_and_replay_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int scaled_copy(int factor);
+void reset_then_copy(void);
+
+#endif // _RECORD_AND_REPLAY
+
@@ -0,0 +1,19 @@
+#ifndef _RECORD_AND_REPLAY_MOCKABLE_H
+#define _RECORD_AND_REPLAY_MOCKABLE_H
+
+#include "record_and_replay_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(void);
+void write_value(int value);
+void reset(void);
+
+#endif // _RECORD_AND_REPLAY_MOCKABLE_H
+
@@ -0,0 +1,16 @@
+#ifndef _RECORD_AND_REPLAY_TYPES_H
+#define _RECORD_AND_REPLAY_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+
+
+#endif // _RECORD_AND_REPLAY_TYPES_H
+
@@ -0,0 +1,17 @@
+#ifndef _REGISTRY_VERIFY_ALL
+#define _REGISTRY_VERIFY_ALL
+
+#include "registry_verify_all_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(void);
+
+#endif // _REGISTRY_VERIFY_ALL
+
@@ -0,0 +1,14 @@
+#include "return_thru_ptr_and_expect_any_args_types.h"
+#include "return_thru_ptr_and_expect_any_args_mockable.h"
+#include "return_thru_ptr_and_expect_any_args.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+
+
@@ -0,0 +1,25 @@
+#ifndef _RETURN_THRU_PTR_AND_EXPECT_ANY_ARGS_MOCKABLE_H
+#define _RETURN_THRU_PTR_AND_EXPECT_ANY_ARGS_MOCKABLE_H
+
+#include "return_thru_ptr_and_expect_any_args_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void ptr_ret_int(int *r);
+void ptr_ret_ints(int *r, int *s);
+void ptr_ret_array(char r[], int len);
+void ptr_ret_typedef(intptr r);
+void ptr_ret_struct(struct a_struct *r);
+void ptr_ret_abstract(abs_struct *r);
+void ptr_ret_abstract_array(abs_struct *r, int len);
+void ptr_ret_const_int(int *r, const int *s);
+void ptr_ret_string(char *s);
+
+#endif // _RETURN_THRU_PTR_AND_EXPECT_ANY_ARGS_MOCKABLE_H
+
@@ -0,0 +1,31 @@
+#ifndef _RETURN_THRU_PTR_AND_EXPECT_ANY_ARGS_TYPES_H
+#define _RETURN_THRU_PTR_AND_EXPECT_ANY_ARGS_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef int *intptr;
+
+struct a_struct
+{
+    int i1;
+    int i2;
+    int i3;
+};
+
+struct _abs_struct
+{
+    int abs_i1;
+    int abs_i2;
+};
+
+typedef struct _abs_struct abs_struct;
+
+#endif // _RETURN_THRU_PTR_AND_EXPECT_ANY_ARGS_TYPES_H
+
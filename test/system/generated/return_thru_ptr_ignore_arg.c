@@ -0,0 +1,14 @@
+#include "return_thru_ptr_ignore_arg_types.h"
+#include "return_thru_ptr_ignore_arg_mockable.h"
+#include "return_thru_ptr_ignore_arg.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+
+
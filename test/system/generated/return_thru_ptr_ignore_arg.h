@@ -0,0 +1,18 @@
+#ifndef _RETURN_THRU_PTR_IGNORE_ARG
+#define _RETURN_THRU_PTR_IGNORE_ARG
+
+#include "return_thru_ptr_ignore_arg_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include <string.h>
+#define lengthof(x) (sizeof(x)/sizeof((x)[0]))
+
+#endif // _RETURN_THRU_PTR_IGNORE_ARG
+
@@ -0,0 +1,23 @@
+#include "sharded_mocks_types.h"
+#include "sharded_mocks_mockable.h"
+#include "sharded_mocks.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_a_to_b(int channel)
+{
+  write_b(channel, read_a(channel));
+  flush();
+}
+void copy_b_to_a(int channel)
+{
+  write_a(channel, read_b(channel));
+  flush();
+}
+
@@ -0,0 +1,18 @@
+#ifndef _SHARDED_MOCKS
+#define _SHARDED_MOCKS
+
+#include "sharded_mocks_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_a_to_b(int channel);
+void copy_b_to_a(int channel);
+
+#endif // _SHARDED_MOCKS
+
@@ -0,0 +1,21 @@
+#ifndef _SHARDED_MOCKS_MOCKABLE_H
+#define _SHARDED_MOCKS_MOCKABLE_H
+
+#include "sharded_mocks_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_a(int channel);
+int read_b(int channel);
+void write_a(int channel, int value);
+void write_b(int channel, int value);
+void flush(void);
+
+#endif // _SHARDED_MOCKS_MOCKABLE_H
+
@@ -0,0 +1,18 @@
+#include "shared_string_pool_types.h"
+#include "shared_string_pool_mockable.h"
+#include "shared_string_pool.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(int from, int to)
+{
+  write_value(to, read_value(from));
+  flush();
+}
+
@@ -0,0 +1,19 @@
+#ifndef _SHARED_STRING_POOL_MOCKABLE_H
+#define _SHARED_STRING_POOL_MOCKABLE_H
+
+#include "shared_string_pool_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(int channel);
+void write_value(int channel, int value);
+void flush(void);
+
+#endif // _SHARED_STRING_POOL_MOCKABLE_H
+
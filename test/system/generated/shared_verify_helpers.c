@@ -0,0 +1,35 @@
+#include "shared_verify_helpers_types.h"
+#include "shared_verify_helpers_mockable.h"
+#include "shared_verify_helpers.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void put_both(const char* key, int value)
+{
+  put(key, value, 0x80);
+  put(key, value + 1, 0x81);
+}
+void place_at(int x, int y)
+{
+  POINT_T point = {x, y};
+  place(point);
+}
+void move_to(int x, int y)
+{
+  POINT_T point = {x, y};
+  move(&point);
+}
+void send_two(short first, short second)
+{
+  short data[2];
+  data[0] = first;
+  data[1] = second;
+  send(data, 2);
+}
+
@@ -0,0 +1,20 @@
+#ifndef _SHARED_VERIFY_HELPERS
+#define _SHARED_VERIFY_HELPERS
+
+#include "shared_verify_helpers_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void put_both(const char* key, int value);
+void place_at(int x, int y);
+void move_to(int x, int y);
+void send_two(short first, short second);
+
+#endif // _SHARED_VERIFY_HELPERS
+
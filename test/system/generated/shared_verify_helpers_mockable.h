@@ -0,0 +1,20 @@
+#ifndef _SHARED_VERIFY_HELPERS_MOCKABLE_H
+#define _SHARED_VERIFY_HELPERS_MOCKABLE_H
+
+#include "shared_verify_helpers_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void put(const char* key, int value, unsigned char flags);
+void place(POINT_T point);
+void move(POINT_T* point);
+void send(const short* data, int length);
+
+#endif // _SHARED_VERIFY_HELPERS_MOCKABLE_H
+
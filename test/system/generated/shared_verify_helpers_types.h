@@ -0,0 +1,16 @@
+#ifndef _SHARED_VERIFY_HELPERS_TYPES_H
+#define _SHARED_VERIFY_HELPERS_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+typedef struct _POINT_T { int x; int y; } POINT_T;
+
+#endif // _SHARED_VERIFY_HELPERS_TYPES_H
+
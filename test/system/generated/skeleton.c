@@ -0,0 +1,26 @@
+#include <string.h>
+#include <stdlib.h>
+#include <setjmp.h>
+#include "cmock.h"
+#include "skeleton.h"
+
+
+void function_a(void)
+{
+  /*TODO: Implement Haha Me!*/
+}
+
+int function_b(int a, int b)
+{
+  /*TODO: Implement Haha Me!*/
+  (void)a;
+  (void)b;
+  return (int)0;
+}
+
+const char* function_c(void)
+{
+  /*TODO: Implement Haha Me!*/
+  return (const char*)0;
+}
+
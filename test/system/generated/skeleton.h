@@ -0,0 +1,19 @@
+#ifndef _SKELETON
+#define _SKELETON
+
+#include "skeleton_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void);
+int function_b(int a, int b);
+const char* function_c(void);
+
+#endif // _SKELETON
+
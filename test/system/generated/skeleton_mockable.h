@@ -0,0 +1,17 @@
+#ifndef _SKELETON_MOCKABLE_H
+#define _SKELETON_MOCKABLE_H
+
+#include "skeleton_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 something(int a);
+
+#endif // _SKELETON_MOCKABLE_H
+
@@ -0,0 +1,36 @@
+#include "skeleton_update_types.h"
+#include "skeleton_update_mockable.h"
+#include "skeleton_update.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+const char* donuts = "donuts";
+const char* function_c(void)
+{
+  return donuts;
+}
+
+int function_d(void)
+{
+  return 77;
+}
+
+void function_a(void)
+{
+  /*TODO: Implement Haha Me!*/
+}
+
+int function_b(int a, int b)
+{
+  /*TODO: Implement Haha Me!*/
+  (void)a;
+  (void)b;
+  return (int)0;
+}
+
@@ -0,0 +1,19 @@
+#ifndef _SKELETON_UPDATE
+#define _SKELETON_UPDATE
+
+#include "skeleton_update_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void);
+int function_b(int a, int b);
+const char* function_c(void);
+
+#endif // _SKELETON_UPDATE
+
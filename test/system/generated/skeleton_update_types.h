@@ -0,0 +1,16 @@
+#ifndef _SKELETON_UPDATE_TYPES_H
+#define _SKELETON_UPDATE_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#define UINT32 unsigned int
+
+#endif // _SKELETON_UPDATE_TYPES_H
+
@@ -0,0 +1,42 @@
+#include "struct_union_enum_expect_and_return_types.h"
+#include "struct_union_enum_expect_and_return_mockable.h"
+#include "struct_union_enum_expect_and_return.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void exercise_struct(struct THING* a, struct THING b)
+{
+  foo_struct(a, b);
+}
+
+struct THING return_struct(void)
+{
+  return foobar_struct();
+}
+
+void exercise_union(union STARS_AND_STRIPES* a, union STARS_AND_STRIPES b)
+{
+  foo_union(a, b);
+}
+
+union STARS_AND_STRIPES return_union(void)
+{
+  return foobar_union();
+}
+
+void exercise_enum(enum HOKEY_POKEY a, enum HOKEY_POKEY * b)
+{
+  foo_enum(a, b);
+}
+
+enum HOKEY_POKEY return_enum(void)
+{
+  return foobar_enum();
+}
+
@@ -0,0 +1,24 @@
+#ifndef _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS
+#define _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS
+
+#include "struct_union_enum_expect_and_return_with_plugins_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void exercise_struct(struct THING* a, struct THING b);
+struct THING return_struct(void);
+
+void exercise_union(union STARS_AND_STRIPES* a, union STARS_AND_STRIPES b);
+union STARS_AND_STRIPES return_union(void);
+
+void exercise_enum(enum HOKEY_POKEY a, enum HOKEY_POKEY * b);
+enum HOKEY_POKEY return_enum(void);
+
+#endif // _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS
+
@@ -0,0 +1,24 @@
+#ifndef _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_MOCKABLE_H
+#define _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_MOCKABLE_H
+
+#include "struct_union_enum_expect_and_return_with_plugins_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void foo_struct(struct THING*, struct THING);
+struct THING foobar_struct(void);
+
+void foo_union(union STARS_AND_STRIPES*, union STARS_AND_STRIPES);
+union STARS_AND_STRIPES foobar_union(void);
+
+void foo_enum(enum HOKEY_POKEY a, enum HOKEY_POKEY * b);
+enum HOKEY_POKEY foobar_enum(void);
+
+#endif // _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_MOCKABLE_H
+
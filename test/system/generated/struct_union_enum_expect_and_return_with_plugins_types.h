@@ -0,0 +1,20 @@
+#ifndef _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_TYPES_H
+#define _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+struct THING { int a; int b; };
+
+union STARS_AND_STRIPES { int a; char b; };
+
+enum HOKEY_POKEY { IN, OUT, SHAKE_IT_ALL_ABOUT };
+
+#endif // _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_TYPES_H
+
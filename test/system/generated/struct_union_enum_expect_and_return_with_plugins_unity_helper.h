@@ -0,0 +1,21 @@
+#ifndef _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_UNITY_HELPER_H
+#define _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_UNITY_HELPER_H
+
+#include "struct_union_enum_expect_and_return_with_plugins_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void AssertEqualTHINGStruct(struct THING expected, struct THING actual);
+void AssertEqualSTARS_AND_STRIPESUnion(union STARS_AND_STRIPES expected, union STARS_AND_STRIPES actual);
+
+#define TEST_ASSERT_EQUAL_THING(expected, actual) {AssertEqualTHINGStruct(expected, actual);}
+#define TEST_ASSERT_EQUAL_STARS_AND_STRIPES(expected, actual) {AssertEqualSTARS_AND_STRIPESUnion(expected, actual);}
+
+#endif // _STRUCT_UNION_ENUM_EXPECT_AND_RETURN_WITH_PLUGINS_UNITY_HELPER_H
+
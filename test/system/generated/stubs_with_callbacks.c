@@ -0,0 +1,33 @@
+#include "stubs_with_callbacks_types.h"
+#include "stubs_with_callbacks_mockable.h"
+#include "stubs_with_callbacks.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(int a, int b)
+{
+  int args[6] = {0, 1, 2, 3, 5, 5};
+  args[0] = a;
+  fuz(args, b);
+}
+
+UINT32 function_b(void)
+{
+  UINT32 sum = 0;
+  custom_type a = 0;
+  custom_type b = 0;
+  sum = foo(&a) + bar(&b);
+  return (UINT32)((custom_type)sum + a + b);
+}
+
+int function_c(void)
+{
+  return (baz() + baz() + baz());
+}
+
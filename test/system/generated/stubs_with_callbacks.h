@@ -0,0 +1,19 @@
+#ifndef _STUBS_WITH_CALLBACKS
+#define _STUBS_WITH_CALLBACKS
+
+#include "stubs_with_callbacks_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void   function_a(int a, int b);
+UINT32 function_b(void);
+int    function_c(void);
+
+#endif // _STUBS_WITH_CALLBACKS
+
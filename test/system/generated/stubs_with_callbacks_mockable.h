@@ -0,0 +1,20 @@
+#ifndef _STUBS_WITH_CALLBACKS_MOCKABLE_H
+#define _STUBS_WITH_CALLBACKS_MOCKABLE_H
+
+#include "stubs_with_callbacks_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 foo(custom_type* a);
+UINT32 bar(custom_type* b);
+int    baz(void);
+void   fuz(int* args, int num);
+
+#endif // _STUBS_WITH_CALLBACKS_MOCKABLE_H
+
@@ -0,0 +1,56 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_aggregate_mocks_mockable.h"
+#include "aggregate_mocks.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should run a mock built only through the aggregate
+void test1(void)
+{
+  read_value_ExpectAndReturn(1, 10);
+  write_value_Expect(2, 10);
+  flush_Expect();
+  copy_value(1, 2);
+}
+
+// should keep the registry of an aggregated mock working
+void test2(void)
+{
+  read_value_ExpectAnyArgsAndReturn(3);
+  write_value_ExpectAnyArgs();
+  flush_Ignore();
+  copy_value(4, 5);
+  CMock_VerifyAll();
+}
+
+// should report the names of an aggregated mock in failures
+void test3(void)
+{
+  read_value_ExpectAndReturn(1, 10);
+  write_value_Expect(3, 10);
+  flush_Expect();
+  copy_value(1, 2);
+}
+
+// should report leftovers of an aggregated mock
+void test4(void)
+{
+  read_value_ExpectAndReturn(1, 10);
+  write_value_Expect(2, 10);
+  flush_Expect();
+  flush_Expect();
+  copy_value(1, 2);
+  CMock_VerifyAll();
+}
+
+
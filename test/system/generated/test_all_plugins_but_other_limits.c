@@ -0,0 +1,267 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_all_plugins_but_other_limits_mockable.h"
+#include "all_plugins_but_other_limits.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle the situation where we pass nulls to pointers
+void test1(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we expected nulls to pointers but did not get that
+void test2(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we did not expect nulls to pointers but got null
+void test3(void)
+{
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and it is wrong
+void test4(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and use array handler
+void test5(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 1);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and use array handler and it is wrong
+void test6(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 1);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler
+void test7(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 4}, {5, 6}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler and it is wrong at end
+void test8(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 4}, {5, 9}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass single array element with expect
+void test9(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(&ex);
+
+  function_b();
+}
+
+// should handle standard c string as null terminated and not do crappy memory compares of a byte, passing
+void test10(void)
+{
+  const char* constretval = "This is a\0 silly string";
+  char* retval = (char*)constretval;
+  bars_ExpectAndReturn(retval);
+  foos_Expect("This is a\0 wacky string");
+
+  function_c();
+}
+
+// should handle standard c string as null terminated and not do crappy memory compares of a byte, finding failures
+void test11(void)
+{
+  const char* constretval = "This is a silly string";
+  char* retval = (char*)constretval;
+  bars_ExpectAndReturn(retval);
+  foos_Expect("This is a wacky string");
+
+  function_c();
+}
+
+// should handle creating array expects when we have mixed arguments for single object
+void test12(void)
+{
+  int expect_list[] = { 1, 9 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAndReturn(6, expect_list, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments and handle failures for single object
+void test13(void)
+{
+  int expect_list[] = { 9, 1 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAndReturn(6, expect_list, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments for multiple objects
+void test14(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments and handle failures for multiple objects
+void test15(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 5, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle an exception being caught
+void test16(void)
+{
+  const char* constretval = "This is a\0 silly string";
+  char* retval = (char*)constretval;
+  bars_ExpectAndReturn(retval);
+  foos_ExpectAndThrow("This is a\0 wacky string", 55);
+  foos_Expect("err");
+
+  function_c();
+}
+
+// should handle an exception being caught but still catch following errors
+void test17(void)
+{
+  const char* constretval = "This is a\0 silly string";
+  char* retval = (char*)constretval;
+  bars_ExpectAndReturn(retval);
+  foos_ExpectAndThrow("This is a\0 wacky string", 55);
+  foos_Expect("wrong error");
+
+  function_c();
+}
+
+// should fail strict ordering problems even though we would otherwise have passed
+void test18(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+  no_pointers_Expect(1, "silly");
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should properly ExpectAnyArgs first function but the other will work properly
+void test19(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_ExpectAnyArgs();
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should properly ExpectAnyArgs last function but the other will work properly
+void test20(void)
+{
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAnyArgsAndReturn(13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should be ok if we ExpectAnyArgs a call each because we are counting calls
+void test21(void)
+{
+  foos_ExpectAnyArgs();
+  foos_ExpectAnyArgs();
+  foos_ExpectAnyArgs();
+
+  function_e();
+}
+
+// should be ok if we ExpectAnyArgs and Expect intermixed because we are counting calls
+void test22(void)
+{
+  foos_Expect("Hello");
+  foos_ExpectAnyArgs();
+  foos_ExpectAnyArgs();
+
+  function_e();
+}
+
+// should be able to detect Expect problem if we ExpectAnyArgs and Expect intermixed
+void test23(void)
+{
+  foos_Expect("Hello");
+  foos_ExpectAnyArgs();
+  foos_Expect("Wrong");
+
+  function_e();
+}
+
+// should fail if we do not ExpectAnyArgs a call once because we are counting calls
+void test24(void)
+{
+  foos_ExpectAnyArgs();
+  foos_ExpectAnyArgs();
+
+  function_e();
+}
+
+
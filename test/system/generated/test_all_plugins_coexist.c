@@ -0,0 +1,329 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_all_plugins_coexist_mockable.h"
+#include "all_plugins_coexist.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void setUp(void) {}
+void tearDown(void) {}
+void my_foo_callback(POINT_T* a) { TEST_ASSERT_EQUAL_INT(2, a->x); }
+int  my_mixed_callback(int a, int* b, int c) { return a + *b + c; }
+
+// should handle the situation where we pass nulls to pointers
+void test1(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we expected nulls to pointers but did not get that
+void test2(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we did not expect nulls to pointers but got null
+void test3(void)
+{
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and it is wrong
+void test4(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and use array handler
+void test5(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 1);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and use array handler and it is wrong
+void test6(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 1);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler
+void test7(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 4}, {5, 6}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler and it is wrong at end
+void test8(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 4}, {5, 9}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass single array element with expect
+void test9(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(&ex);
+
+  function_b();
+}
+
+// should handle standard c string as null terminated and not do crappy memory compares of a byte, passing
+void test10(void)
+{
+  const char* retval = "This is a\0 silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_Expect("This is a\0 wacky string");
+
+  function_c();
+}
+
+// should handle standard c string as null terminated and not do crappy memory compares of a byte, finding failures
+void test11(void)
+{
+  const char* retval = "This is a silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_Expect("This is a wacky string");
+
+  function_c();
+}
+
+// should handle creating array expects when we have mixed arguments for single object
+void test12(void)
+{
+  int expect_list[] = { 1, 9 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAndReturn(6, expect_list, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments and handle failures for single object
+void test13(void)
+{
+  int expect_list[] = { 9, 1 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAndReturn(6, expect_list, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments for multiple objects
+void test14(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments and handle failures for multiple objects
+void test15(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 5, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle an exception being caught
+void test16(void)
+{
+  const char* retval = "This is a\0 silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_ExpectAndThrow("This is a\0 wacky string", 55);
+  foos_Expect("err");
+
+  function_c();
+}
+
+// should handle an exception being caught but still catch following errors
+void test17(void)
+{
+  const char* retval = "This is a\0 silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_ExpectAndThrow("This is a\0 wacky string", 55);
+  foos_Expect("wrong error");
+
+  function_c();
+}
+
+// should fail strict ordering problems even though we would otherwise have passed
+void test18(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+  no_pointers_Expect(1, "silly");
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should that we can properly ignore last  function but the other will work properly
+void test19(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+  no_pointers_Ignore();
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should that we can properly ignore first function but the other will work properly
+void test20(void)
+{
+  mixed_IgnoreAndReturn(13);
+  no_pointers_Expect(1, "silly");
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should that we just have to ignore a call once because we are not counting calls
+void test21(void)
+{
+  foos_Ignore();
+
+  function_e();
+}
+
+// should that we can use a callback and an expect
+void test22(void)
+{
+  POINT_T pt1 = {2, 3};
+  POINT_T pt2 = {2, 3};
+  bar_ExpectAndReturn(&pt1);
+  foo_Expect(&pt2);
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)my_foo_callback);
+
+  function_a();
+}
+
+// should that we can fail even when using a callback if we want to expect call but did not and we are checking that
+void test23(void)
+{
+  POINT_T pt = {2, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)my_foo_callback);
+
+  function_a();
+}
+
+// should that we can fail even when using a callback if args are wrong and we are checking those
+void test24(void)
+{
+  POINT_T pt1 = {2, 3};
+  POINT_T pt2 = {1, 3};
+  bar_ExpectAndReturn(&pt1);
+  foo_Expect(&pt2);
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)my_foo_callback);
+
+  function_a();
+}
+
+// should that we can fail from the callback itself
+void test25(void)
+{
+  POINT_T pt = {3, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&pt);
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)my_foo_callback);
+
+  function_a();
+}
+
+// should that a callback return value overrides the one from ExpectAndReturn
+void test26(void)
+{
+  int b = 2;
+  POINT_T pt1 = {3, 4};
+  bar_ExpectAndReturn(&pt1);
+  mixed_StubWithCallback((CMOCK_mixed_CALLBACK)my_mixed_callback);
+  mixed_ExpectAndReturn(1,&b,3,100);
+
+  TEST_ASSERT_EQUAL(8, function_f());
+}
+
+// should that a callback return value overrides the one from ExpectAndReturn AND ReturnThruPtr still works
+void test27(void)
+{
+  int b_in = 2;
+  int b_out = 3;
+  POINT_T pt1 = {3, 4};
+  bar_ExpectAndReturn(&pt1);
+  mixed_StubWithCallback((CMOCK_mixed_CALLBACK)my_mixed_callback);
+  mixed_ExpectAndReturn(1,&b_in,3,100);
+  mixed_ReturnThruPtr_b(&b_out);
+
+  TEST_ASSERT_EQUAL(9, function_f()); // (a=1, bin=2, c=pt.x=3, bout=3, sum=9)
+}
+
+// should that a callback return value overrides the one from ExpectAnyArgs
+void test28(void)
+{
+  POINT_T pt1 = {5, 4};
+  bar_ExpectAndReturn(&pt1);
+  mixed_StubWithCallback((CMOCK_mixed_CALLBACK)my_mixed_callback);
+  mixed_ExpectAnyArgsAndReturn(100);
+
+  TEST_ASSERT_EQUAL(10, function_f()); // (a=1, bin=2, c=pt.x=5, bout=2, sum=10)
+}
+
+// should that a callback return value overrides the one from ExpectAnyArgs AND ReturnThruPtr still works
+void test29(void)
+{
+  int b_out = 3;
+  POINT_T pt1 = {5, 4};
+  bar_ExpectAndReturn(&pt1);
+  mixed_StubWithCallback((CMOCK_mixed_CALLBACK)my_mixed_callback);
+  mixed_ExpectAnyArgsAndReturn(100);
+  mixed_ReturnThruPtr_b(&b_out);
+
+  TEST_ASSERT_EQUAL(11, function_f()); // (a=1, bin=2, c=pt.x=5, bout=3, sum=11)
+}
+
+
@@ -0,0 +1,80 @@
+#include "unity.h"
+#include "cmock.h"
+#include "CException.h"
+#include "mock_all_plugins_coexist_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+extern void test14(void);
+extern void test15(void);
+extern void test16(void);
+extern void test17(void);
+extern void test18(void);
+extern void test19(void);
+extern void test20(void);
+extern void test21(void);
+extern void test22(void);
+extern void test23(void);
+extern void test24(void);
+extern void test25(void);
+extern void test26(void);
+extern void test27(void);
+extern void test28(void);
+extern void test29(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_all_plugins_coexist_mockable_Init(); }
+static void CMock_Verify(void) { mock_all_plugins_coexist_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_all_plugins_coexist_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CEXCEPTION_T e; CMock_Init(); UNITY_CLR_DETAILS(); setUp(); Try { func(); } Catch(e) { UNITY_TEST_ASSERT_EQUAL_HEX32(CEXCEPTION_NONE, e, line, "Unhandled Exception!"); } }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_all_plugins_coexist.c");
+  run_test(test1, "test1", 21);
+  run_test(test2, "test2", 30);
+  run_test(test3, "test3", 40);
+  run_test(test4, "test4", 50);
+  run_test(test5, "test5", 61);
+  run_test(test6, "test6", 72);
+  run_test(test7, "test7", 83);
+  run_test(test8, "test8", 94);
+  run_test(test9, "test9", 105);
+  run_test(test10, "test10", 116);
+  run_test(test11, "test11", 126);
+  run_test(test12, "test12", 136);
+  run_test(test13, "test13", 146);
+  run_test(test14, "test14", 156);
+  run_test(test15, "test15", 166);
+  run_test(test16, "test16", 176);
+  run_test(test17, "test17", 187);
+  run_test(test18, "test18", 198);
+  run_test(test19, "test19", 208);
+  run_test(test20, "test20", 218);
+  run_test(test21, "test21", 227);
+  run_test(test22, "test22", 235);
+  run_test(test23, "test23", 247);
+  run_test(test24, "test24", 257);
+  run_test(test25, "test25", 269);
+  run_test(test26, "test26", 280);
+  run_test(test27, "test27", 292);
+  run_test(test28, "test28", 306);
+  run_test(test29, "test29", 317);
+  return UnityEnd();
+}
@@ -0,0 +1,329 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_array_and_pointer_handling_mockable.h"
+#include "array_and_pointer_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle the situation where we pass nulls to pointers
+void test1(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we expected nulls to pointers but did not get that
+void test2(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we did not expect nulls to pointers but got null
+void test3(void)
+{
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where it falls back to pointers because you asked it to compare 0 elements
+void test4(void)
+{
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&ex);
+  foo_ExpectWithArray(&ex, 0);
+
+  function_a();
+}
+
+// should handle the situation where it fails because you asked it to compare zero elements and the pointers do not match
+void test5(void)
+{
+  POINT_T ex = {1, 2};
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 0);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect
+void test6(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and it is wrong
+void test7(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and use array handler
+void test8(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 1);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and use array handler and it is wrong
+void test9(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectWithArray(&ex, 1);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler
+void test10(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 4}, {5, 6}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler and it is wrong at start
+void test11(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{9, 2}, {3, 4}, {5, 6}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler and it is wrong at end
+void test12(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 4}, {5, 9}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass multiple objects with expect and use array handler and it is wrong in middle
+void test13(void)
+{
+  POINT_T pt[] = {{1, 2}, {3, 4}, {5, 6}};
+  POINT_T ex[] = {{1, 2}, {3, 9}, {5, 6}};
+  bar_ExpectAndReturn(pt);
+  foo_ExpectWithArray(ex, 3);
+
+  function_a();
+}
+
+// should handle the situation where we pass nulls to pointers and fail
+void test14(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we pass nulls to arrays
+void test15(void)
+{
+  bar_ExpectAndReturn(NULL);
+  fooa_Expect(NULL);
+
+  function_b();
+}
+
+// should handle the situation where we pass single array element with expect
+void test16(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(&ex);
+
+  function_b();
+}
+
+// should handle the situation where we pass single array element with expect and it is wrong
+void test17(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(&ex);
+
+  function_b();
+}
+
+// should handle the situation where we pass nulls to arrays and fail
+void test18(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(NULL);
+
+  function_b();
+}
+
+// should handle standard c string as null terminated on not do crappy memory compares of a byte, passing
+void test19(void)
+{
+  const char* retval = "This is a\0 silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_Expect("This is a\0 wacky string");
+
+  function_c();
+}
+
+// should handle standard c string as null terminated on not do crappy memory compares of a byte, finding failures
+void test20(void)
+{
+  const char* retval = "This is a silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_Expect("This is a wacky string");
+
+  function_c();
+}
+
+// should handle creating array expects when we have mixed arguments for single object
+void test21(void)
+{
+  int expect_list[] = { 1, 9 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAndReturn(6, expect_list, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments and handle failures for single object
+void test22(void)
+{
+  int expect_list[] = { 9, 1 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectAndReturn(6, expect_list, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments for multiple objects
+void test23(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 4, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle creating array expects when we have mixed arguments and handle failures for multiple objects
+void test24(void)
+{
+  int expect_list[] = { 1, 2, 3, 4, 6 };
+  no_pointers_Expect(1, "silly");
+  mixed_ExpectWithArrayAndReturn(6, expect_list, 5, 7, 13);
+
+  TEST_ASSERT_EQUAL(13, function_d());
+}
+
+// should handle a passing version of a potential packing problem (particularly try with ARM simulators)
+void test25(void)
+{
+  short expect_list[] = { -2, -3, -4 };
+  potential_packing_problem_ExpectWithArray(expect_list, 3);
+
+  function_e();
+}
+
+// should handle a failing version of a potential packing problem (particularly try with ARM simulators)
+void test26(void)
+{
+  short expect_list[] = { -2, -3, 4 };
+  potential_packing_problem_ExpectWithArray(expect_list, 3);
+
+  function_e();
+}
+
+// should handle a void pointers as arguments and still be able to use the array plugin
+void test27(void)
+{
+  char expect_list[6] = "hello";
+  voidpointerfunc_ExpectWithArray(expect_list, 5);
+
+  function_f();
+}
+
+// should handle a void pointers as arguments and still be able to use the array plugin (short)
+void test28(void)
+{
+  char expect_list[6] = "help!";
+  voidpointerfunc_ExpectWithArray(expect_list, 3);
+
+  function_f();
+}
+
+// should handle a void pointers as arguments and still be able to use the array plugin (fail)
+void test29(void)
+{
+  char expect_list[6] = "help!";
+  voidpointerfunc_ExpectWithArray(expect_list, 4);
+
+  function_f();
+}
+
+// should handle a void pointer with a standard expectation (pass)
+void test30(void)
+{
+  char expect_list[2] = "h";
+  voidpointerfunc_Expect(expect_list);
+
+  function_f();
+}
+
+// should handle a void pointer with a standard expectation (fail)
+void test31(void)
+{
+  char expect_list[2] = "g";
+  voidpointerfunc_Expect(expect_list);
+
+  function_f();
+}
+
+
@@ -0,0 +1,81 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_array_and_pointer_handling_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+extern void test14(void);
+extern void test15(void);
+extern void test16(void);
+extern void test17(void);
+extern void test18(void);
+extern void test19(void);
+extern void test20(void);
+extern void test21(void);
+extern void test22(void);
+extern void test23(void);
+extern void test24(void);
+extern void test25(void);
+extern void test26(void);
+extern void test27(void);
+extern void test28(void);
+extern void test29(void);
+extern void test30(void);
+extern void test31(void);
+static void CMock_Init(void) { mock_array_and_pointer_handling_mockable_Init(); }
+static void CMock_Verify(void) { mock_array_and_pointer_handling_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_array_and_pointer_handling_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_array_and_pointer_handling.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 37);
+  run_test(test4, "test4", 47);
+  run_test(test5, "test5", 57);
+  run_test(test6, "test6", 68);
+  run_test(test7, "test7", 79);
+  run_test(test8, "test8", 90);
+  run_test(test9, "test9", 101);
+  run_test(test10, "test10", 112);
+  run_test(test11, "test11", 123);
+  run_test(test12, "test12", 134);
+  run_test(test13, "test13", 145);
+  run_test(test14, "test14", 156);
+  run_test(test15, "test15", 166);
+  run_test(test16, "test16", 175);
+  run_test(test17, "test17", 186);
+  run_test(test18, "test18", 197);
+  run_test(test19, "test19", 207);
+  run_test(test20, "test20", 217);
+  run_test(test21, "test21", 227);
+  run_test(test22, "test22", 237);
+  run_test(test23, "test23", 247);
+  run_test(test24, "test24", 257);
+  run_test(test25, "test25", 267);
+  run_test(test26, "test26", 276);
+  run_test(test27, "test27", 285);
+  run_test(test28, "test28", 294);
+  run_test(test29, "test29", 303);
+  run_test(test30, "test30", 312);
+  run_test(test31, "test31", 321);
+  return UnityEnd();
+}
@@ -0,0 +1,78 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_basic_expect_and_return_mockable.h"
+#include "basic_expect_and_return.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise two simple ExpectAndReturn mock calls
+void test1(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because bar() is not called but is expected
+void test2(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because bar() is called but is not expected
+void test3(void)
+{
+  bar_ExpectAndReturn((custom_type)1, 10);
+  function_b();
+}
+
+// should consume var args passed to mocked function
+void test4(void)
+{
+  foo_varargs_ExpectAndReturn((custom_type)3, 10);
+  TEST_ASSERT_EQUAL(10, function_c(3));
+}
+
+// should handle char strings
+void test5(void)
+{
+  const char* retval = "moe";
+  foo_char_strings_ExpectAndReturn("larry", "curly", (char*)retval);
+  TEST_ASSERT_EQUAL_STRING("moe", function_d("larry", "curly"));
+}
+
+// should successfully exercise multiple cycles of expecting and mocking and pass
+void test6(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+
+  foo_ExpectAndReturn((custom_type)3, 30);
+  bar_ExpectAndReturn((custom_type)4, 40);
+  TEST_ASSERT_EQUAL(70, function_a(3, 4));
+}
+
+// should successfully exercise multiple cycles of expecting and mocking and fail
+void test7(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+
+  foo_ExpectAndReturn((custom_type)3, 30);
+  bar_ExpectAndReturn((custom_type)4, 40);
+  TEST_ASSERT_EQUAL(70, function_a(3, 5));
+}
+
+
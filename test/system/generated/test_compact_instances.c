@@ -0,0 +1,82 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_compact_instances_mockable.h"
+#include "compact_instances.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should return data through pointers set on a packed call instance
+void test1(void)
+{
+  int filled[4] = {1, 2, 3, 4};
+  POINT_T where = {10, 20};
+  fill_ExpectAndReturn(NULL, 4, 'a', NULL, 5);
+  fill_IgnoreArg_values();
+  fill_IgnoreArg_where();
+  fill_ReturnArrayThruPtr_values(filled, 4);
+  fill_ReturnThruPtr_where(&where);
+  TEST_ASSERT_EQUAL(45, fill_and_sum(4, 'a'));
+}
+
+// should keep each ignored argument flag separate
+void test2(void)
+{
+  fill_ExpectAndReturn(NULL, 2, 'b', NULL, 1);
+  fill_IgnoreArg_values();
+  fill_IgnoreArg_tag();
+  fill_IgnoreArg_where();
+  TEST_ASSERT_EQUAL(1, fill_and_sum(2, 'z'));
+}
+
+// should still check the arguments which are not ignored
+void test3(void)
+{
+  fill_ExpectAndReturn(NULL, 2, 'b', NULL, 1);
+  fill_IgnoreArg_values();
+  fill_IgnoreArg_where();
+  fill_and_sum(2, 'z');
+}
+
+// should ignore all arguments of an ExpectAnyArgs instance
+void test4(void)
+{
+  fill_ExpectAnyArgsAndReturn(7);
+  send_ExpectAnyArgs();
+  TEST_ASSERT_EQUAL(7, fill_and_sum(0, 'c'));
+  send_two(1, 2);
+}
+
+// should compare arrays up to the depth stored in the instance
+void test5(void)
+{
+  short expected[2] = {3, 4};
+  send_ExpectWithArray(expected, 2, 2);
+  send_two(3, 4);
+}
+
+// should fail on an array element beyond the first
+void test6(void)
+{
+  short expected[2] = {3, 5};
+  send_ExpectWithArray(expected, 2, 2);
+  send_two(3, 4);
+}
+
+// should fail when packed expectations are left over
+void test7(void)
+{
+  send_ExpectAnyArgs();
+  send_ExpectAnyArgs();
+  send_two(1, 2);
+}
+
+
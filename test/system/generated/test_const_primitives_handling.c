@@ -0,0 +1,50 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_const_primitives_handling_mockable.h"
+#include "const_primitives_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+extern const char* A;
+extern char* const B;
+extern const char* C;
+extern const char* D;
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully pass several const parameters
+void test1(void)
+{
+  foo_Expect( A, B, C );
+  exercise_const1( A, B, C );
+}
+
+// should should fail upon wrong const arguments passed
+void test2(void)
+{
+  foo_Expect( A, B, C );
+  exercise_const1( (const char*)B, (char * const)A, C );
+}
+
+// should should fail upon wrong const arguments passed
+void test3(void)
+{
+  foo_Expect( A, B, C );
+  exercise_const1( A, B, D );
+}
+
+// should should fail upon wrong const arguments passed
+void test4(void)
+{
+  bar_Expect( A, B, C );
+  exercise_const2( A, (char * const)C, (const char *)B );
+}
+
+
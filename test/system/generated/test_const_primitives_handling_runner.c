@@ -0,0 +1,27 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_const_primitives_handling_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+static void CMock_Init(void) { mock_const_primitives_handling_mockable_Init(); }
+static void CMock_Verify(void) { mock_const_primitives_handling_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_const_primitives_handling_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_const_primitives_handling.c");
+  run_test(test1, "test1", 23);
+  run_test(test2, "test2", 30);
+  run_test(test3, "test3", 37);
+  run_test(test4, "test4", 44);
+  return UnityEnd();
+}
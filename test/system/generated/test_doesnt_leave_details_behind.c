@@ -0,0 +1,223 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_doesnt_leave_details_behind_mockable.h"
+#include "doesnt_leave_details_behind.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void setUp(void) {}
+void tearDown(void) {}
+void my_foo_callback(POINT_T* a) { TEST_ASSERT_EQUAL_INT(2, a->x); }
+
+// should just pass if we do not insert anything ugly into it
+void test1(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  no_args_Expect();
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after an expect and return
+void test2(void)
+{
+  bar_ExpectAndReturn(NULL);
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+  foo_Expect(NULL);
+  no_args_Expect();
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after an expect
+void test3(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+  no_args_Expect();
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after throw expectation
+void test4(void)
+{
+  CEXCEPTION_T e;
+
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  no_args_ExpectAndThrow(5);
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+
+  Try { function_a(); } Catch(e) {}
+}
+
+// should not contain mock details in failed assertion after a mock call
+void test5(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  no_args_Expect();
+
+  function_a();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after throw
+void test6(void)
+{
+  CEXCEPTION_T e;
+
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  no_args_ExpectAndThrow(5);
+
+  Try { function_a(); } Catch(e) {}
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after ignore
+void test7(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  no_args_Ignore();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after ignored mock
+void test8(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+  no_args_Ignore();
+
+  function_a();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after callback setup
+void test9(void)
+{
+  POINT_T pt = { 2, 2 };
+  bar_ExpectAndReturn(&pt);
+  foo_StubWithCallback(my_foo_callback);
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+
+  no_args_Expect();
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after mock with callback
+void test10(void)
+{
+  POINT_T pt = { 2, 2 };
+  bar_ExpectAndReturn(&pt);
+  foo_StubWithCallback(my_foo_callback);
+  no_args_Expect();
+
+  function_a();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after expect any args
+void test11(void)
+{
+  POINT_T pt = { 2, 2 };
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectAnyArgs();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+
+  no_args_Expect();
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after mock which expected any args
+void test12(void)
+{
+  POINT_T pt = { 2, 2 };
+  bar_ExpectAndReturn(&pt);
+  foo_ExpectAnyArgs();
+  no_args_Expect();
+
+  function_a();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after ignored arg
+void test13(void)
+{
+  POINT_T pt = { 2, 2 };
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+  foo_IgnoreArg_a();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+
+  no_args_Expect();
+
+  function_a();
+}
+
+// should not contain mock details in failed assertion after mock which ignored an arg
+void test14(void)
+{
+  POINT_T pt = { 2, 2 };
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+  foo_IgnoreArg_a();
+  no_args_Expect();
+
+  function_a();
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after mock which threw a CException
+void test15(void)
+{
+  CEXCEPTION_T e;
+  bar_ExpectAndThrow(0x12);
+
+  Try {
+    function_a();
+  }
+  Catch(e) {}
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(1,2,"CustomFail");
+}
+
+// should not contain mock details in failed assertion after mock which used a return thru ptr
+void test16(void)
+{
+  POINT_T pt1 = { 1, 2 };
+  POINT_T pt2 = { 3, 4 };
+
+  foo_Expect(&pt1);
+  foo_ReturnThruPtr_a(&pt2);
+
+  TEST_ASSERT_EQUAL_INT_MESSAGE(3, function_b(), "CustomFail");
+}
+
+
@@ -0,0 +1,54 @@
+#include "unity.h"
+#include "cmock.h"
+#include "CException.h"
+#include "mock_doesnt_leave_details_behind_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+extern void test14(void);
+extern void test15(void);
+extern void test16(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_doesnt_leave_details_behind_mockable_Init(); }
+static void CMock_Verify(void) { mock_doesnt_leave_details_behind_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_doesnt_leave_details_behind_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CEXCEPTION_T e; CMock_Init(); UNITY_CLR_DETAILS(); setUp(); Try { func(); } Catch(e) { UNITY_TEST_ASSERT_EQUAL_HEX32(CEXCEPTION_NONE, e, line, "Unhandled Exception!"); } }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_doesnt_leave_details_behind.c");
+  run_test(test1, "test1", 20);
+  run_test(test2, "test2", 30);
+  run_test(test3, "test3", 41);
+  run_test(test4, "test4", 52);
+  run_test(test5, "test5", 65);
+  run_test(test6, "test6", 77);
+  run_test(test7, "test7", 91);
+  run_test(test8, "test8", 103);
+  run_test(test9, "test9", 115);
+  run_test(test10, "test10", 129);
+  run_test(test11, "test11", 142);
+  run_test(test12, "test12", 156);
+  run_test(test13, "test13", 169);
+  run_test(test14, "test14", 184);
+  run_test(test15, "test15", 198);
+  run_test(test16, "test16", 212);
+  return UnityEnd();
+}
@@ -0,0 +1,155 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_enforce_strict_ordering_mockable.h"
+#include "enforce_strict_ordering.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise two simple ExpectAndReturn mock calls
+void test1(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because bar() is called but is not expected
+void test2(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because bar() is called twice but is expected once
+void test3(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  bar_ExpectAndReturn((custom_type)3, 30);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because bar and foo called in reverse order
+void test4(void)
+{
+  bar_ExpectAndReturn((custom_type)2, 20);
+  foo_ExpectAndReturn((custom_type)1, 10);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should pass because bar and foo called in order with multiple params
+void test5(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)2, 10);
+  bar_ExpectAndReturn((custom_type)3, 20);
+  bar_ExpectAndReturn((custom_type)4, 10);
+  foo_ExpectAndReturn((custom_type)5, 10);
+  function_c();
+}
+
+// should fail because bar and foo called out of order at end
+void test6(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)2, 10);
+  bar_ExpectAndReturn((custom_type)3, 20);
+  foo_ExpectAndReturn((custom_type)5, 10);
+  bar_ExpectAndReturn((custom_type)4, 10);
+  function_c();
+}
+
+// should fail because bar and foo called out of order at start
+void test7(void)
+{
+  foo_ExpectAndReturn((custom_type)2, 10);
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)3, 20);
+  bar_ExpectAndReturn((custom_type)4, 10);
+  foo_ExpectAndReturn((custom_type)5, 10);
+  function_c();
+}
+
+// should pass because we are properly ignoring baz
+void test8(void)
+{
+  baz_Ignore();
+  foo_ExpectAndReturn((custom_type)2, 10);
+  bar_ExpectAndReturn((custom_type)3, 20);
+  foo_ExpectAndReturn((custom_type)5, 10);
+  bar_ExpectAndReturn((custom_type)6, 10);
+  function_b();
+}
+
+// should fail because bar and foo out of order, even though baz is ignored
+void test9(void)
+{
+  baz_Ignore();
+  foo_ExpectAndReturn((custom_type)2, 10);
+  foo_ExpectAndReturn((custom_type)5, 10);
+  bar_ExpectAndReturn((custom_type)3, 20);
+  bar_ExpectAndReturn((custom_type)6, 10);
+  function_b();
+}
+
+// should pass when using cexception, as long as the order is right
+void test10(void)
+{
+  foo_ExpectAndThrow((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  foo_ExpectAndReturn((custom_type)3, 10);
+  function_d();
+}
+
+// should fail when an throw call is made out of order
+void test11(void)
+{
+  bar_ExpectAndReturn((custom_type)2, 20);
+  foo_ExpectAndThrow((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)3, 10);
+  function_d();
+}
+
+// should successfully handle back to back ExpectAndReturn setup and mock calls
+void test12(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+
+  foo_ExpectAndReturn((custom_type)3, 30);
+  bar_ExpectAndReturn((custom_type)4, 40);
+  TEST_ASSERT_EQUAL(70, function_a(3, 4));
+
+  foo_ExpectAndReturn((custom_type)1, 50);
+  bar_ExpectAndReturn((custom_type)9, 60);
+  TEST_ASSERT_EQUAL(110, function_a(1, 9));
+}
+
+// should successfully catch errors during back to back ExpectAndReturn setup and mock calls
+void test13(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  bar_ExpectAndReturn((custom_type)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+
+  foo_ExpectAndReturn((custom_type)3, 30);
+  bar_ExpectAndReturn((custom_type)4, 40);
+  TEST_ASSERT_EQUAL(70, function_a(3, 4));
+
+  bar_ExpectAndReturn((custom_type)9, 60);
+  foo_ExpectAndReturn((custom_type)1, 50);
+  TEST_ASSERT_EQUAL(110, function_a(1, 9));
+}
+
+
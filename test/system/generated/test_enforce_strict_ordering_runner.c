@@ -0,0 +1,48 @@
+#include "unity.h"
+#include "cmock.h"
+#include "CException.h"
+#include "mock_enforce_strict_ordering_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_enforce_strict_ordering_mockable_Init(); }
+static void CMock_Verify(void) { mock_enforce_strict_ordering_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_enforce_strict_ordering_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CEXCEPTION_T e; CMock_Init(); UNITY_CLR_DETAILS(); setUp(); Try { func(); } Catch(e) { UNITY_TEST_ASSERT_EQUAL_HEX32(CEXCEPTION_NONE, e, line, "Unhandled Exception!"); } }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_enforce_strict_ordering.c");
+  run_test(test1, "test1", 19);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 34);
+  run_test(test4, "test4", 43);
+  run_test(test5, "test5", 51);
+  run_test(test6, "test6", 62);
+  run_test(test7, "test7", 73);
+  run_test(test8, "test8", 84);
+  run_test(test9, "test9", 95);
+  run_test(test10, "test10", 106);
+  run_test(test11, "test11", 115);
+  run_test(test12, "test12", 124);
+  run_test(test13, "test13", 140);
+  return UnityEnd();
+}
@@ -0,0 +1,61 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_and_return_custom_types_mockable.h"
+#include "expect_and_return_custom_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise simple ExpectAndReturn mock calls
+void test1(void)
+{
+  EXAMPLE_STRUCT_T c = {1,2};
+  EXAMPLE_STRUCT_T d = {3,4};
+  EXAMPLE_STRUCT_T e = {2,4};
+  EXAMPLE_STRUCT_T f = {5,8};
+  foo_ExpectAndReturn(c, e);
+  TEST_ASSERT_EQUAL_EXAMPLE_STRUCT_T(f, function_a(c,d));
+}
+
+// should fail because it is expecting to call foo with c not d
+void test2(void)
+{
+  EXAMPLE_STRUCT_T c = {1,2};
+  EXAMPLE_STRUCT_T d = {3,4};
+  EXAMPLE_STRUCT_T e = {2,4};
+  EXAMPLE_STRUCT_T f = {5,8};
+  foo_ExpectAndReturn(d, e);
+  TEST_ASSERT_EQUAL_EXAMPLE_STRUCT_T(f, function_a(c,d));
+}
+
+// should successfully exercise simple ExpectAndReturn mock calls on other function
+void test3(void)
+{
+  EXAMPLE_STRUCT_T c = {1,2};
+  EXAMPLE_STRUCT_T d = {3,4};
+  EXAMPLE_STRUCT_T e = {2,4};
+  EXAMPLE_STRUCT_T f = {2,8};
+  foo_ExpectAndReturn(d, e);
+  TEST_ASSERT_EQUAL_EXAMPLE_STRUCT_T(f, function_b(c,d));
+}
+
+// should fail because it is expecting to call foo with d not c
+void test4(void)
+{
+  EXAMPLE_STRUCT_T c = {1,2};
+  EXAMPLE_STRUCT_T d = {3,4};
+  EXAMPLE_STRUCT_T e = {2,4};
+  EXAMPLE_STRUCT_T f = {2,8};
+  foo_ExpectAndReturn(c, e);
+  TEST_ASSERT_EQUAL_EXAMPLE_STRUCT_T(f, function_b(c,d));
+}
+
+
@@ -0,0 +1,100 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_and_return_treat_as_mockable.h"
+#include "expect_and_return_treat_as.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise two simple ExpectAndReturn mock calls
+void test1(void)
+{
+  foo_ExpectAndReturn((MY_HEX)1, 10);
+  bar_ExpectAndReturn((MY_HEX)2, 20);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because bar() is expected but not called
+void test2(void)
+{
+  foo_ExpectAndReturn((MY_HEX)1, 10);
+  TEST_ASSERT_EQUAL(30, function_a(1, 2));
+}
+
+// should fail because foo_char_strings() is called but is not expected
+void test3(void)
+{
+  foo_char_strings_ExpectAndReturn((MY_STRING)"jello", (MY_STRING)"jiggle", (MY_STRING)"boing!");
+  function_a(1,2);
+}
+
+// should handle char strings
+void test4(void)
+{
+  foo_char_strings_ExpectAndReturn((MY_STRING)"jello", (MY_STRING)"jiggle", (MY_STRING)"boing!");
+  TEST_ASSERT_EQUAL_STRING("boing!", function_b((MY_STRING)"jello", (MY_STRING)"jiggle"));
+}
+
+// should handle floating point numbers with Unity support: pass
+void test5(void)
+{
+  float_adder_ExpectAndReturn(1.2345f, 6.7890f, 8.0235f);
+  TEST_ASSERT_EQUAL_FLOAT(8.0235f, function_c(6.7890f, 1.2345f));
+}
+
+// should handle floating point numbers with Unity support: fail
+void test6(void)
+{
+  float_adder_ExpectAndReturn(1.2345f, 6.7892f, 8.0235f);
+  TEST_ASSERT_EQUAL_FLOAT(8.0235f, function_c(6.7890f, 1.2345f));
+}
+
+// should handle pointers to treat_as values just as cleanly as the treat_as itself for passes
+void test7(void)
+{
+  MY_HEX TestHex = (MY_HEX)45;
+  MY_INT TestInt = (MY_INT)33;
+  pointer_foo_ExpectAndReturn(&TestHex, &TestInt);
+  TEST_ASSERT_EQUAL_INT(33, function_d(45));
+}
+
+// should handle pointers to treat_as values just as cleanly as the treat_as itself for failures
+void test8(void)
+{
+  MY_HEX TestHex = (MY_HEX)45;
+  MY_INT TestInt = (MY_INT)33;
+  pointer_foo_ExpectAndReturn(&TestHex, &TestInt);
+  TEST_ASSERT_EQUAL_INT(33, function_d(43));
+}
+
+// should handle treat_as values containing pointers for passes
+void test9(void)
+{
+  MY_INT ExpInt = (MY_INT)33;
+  PTR_INT ExpPtr = (PTR_INT)(&ExpInt);
+  MY_INT ActInt = (MY_INT)33;
+  PTR_INT ActPtr = (PTR_INT)(&ActInt);
+  pointer_bar_Expect(ExpPtr);
+  function_e(ActPtr);
+}
+
+// should handle treat_as values containing pointers for failures
+void test10(void)
+{
+  MY_INT ExpInt = (MY_INT)33;
+  PTR_INT ExpPtr = (PTR_INT)(&ExpInt);
+  MY_INT ActInt = (MY_INT)45;
+  PTR_INT ActPtr = (PTR_INT)(&ActInt);
+  pointer_bar_Expect(ExpPtr);
+  function_e(ActPtr);
+}
+
+
@@ -0,0 +1,115 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_and_throw_mockable.h"
+#include "expect_and_throw.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise a simple ExpectAndReturn mock calls
+void test1(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  TEST_ASSERT_EQUAL(10, function_a(1));
+}
+
+// should successfully throw an error on first call
+void test2(void)
+{
+  foo_ExpectAndThrow((custom_type)1, 55);
+  TEST_ASSERT_EQUAL(110, function_a(1));
+}
+
+// should successfully throw an error on later calls
+void test3(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)2, 20);
+  foo_ExpectAndThrow((custom_type)3, 15);
+  foo_ExpectAndReturn((custom_type)4, 40);
+  TEST_ASSERT_EQUAL(10, function_a(1));
+  TEST_ASSERT_EQUAL(20, function_a(2));
+  TEST_ASSERT_EQUAL(30, function_a(3));
+  TEST_ASSERT_EQUAL(40, function_a(4));
+}
+
+// should pass because we nothing happens
+void test4(void)
+{
+  function_b(0);
+}
+
+// should fail because we did not expect function B to throw
+void test5(void)
+{
+  function_b(1);
+}
+
+// should fail because we expect function B to throw
+void test6(void)
+{
+  CEXCEPTION_T e;
+  Try
+  {
+    function_b(3);
+    TEST_FAIL_MESSAGE("Should Have Thrown");
+  }
+  Catch(e)
+  {
+    TEST_ASSERT_EQUAL(3, e);
+  }
+}
+
+// should successfully throw an error on consecutive calls
+void test7(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)1, 20);
+  foo_ExpectAndThrow((custom_type)1, 15);
+  foo_ExpectAndThrow((custom_type)3, 40);
+  TEST_ASSERT_EQUAL(10, function_a(1));
+  TEST_ASSERT_EQUAL(20, function_a(1));
+  TEST_ASSERT_EQUAL(30, function_a(1));
+  TEST_ASSERT_EQUAL(80, function_a(3));
+}
+
+// should successfully throw an error on later calls and after a previous mock call
+void test8(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)1, 20);
+  foo_ExpectAndThrow((custom_type)1, 15);
+  TEST_ASSERT_EQUAL(10, function_a(1));
+  TEST_ASSERT_EQUAL(20, function_a(1));
+  TEST_ASSERT_EQUAL(30, function_a(1));
+  
+  foo_ExpectAndReturn((custom_type)2, 20);
+  foo_ExpectAndThrow((custom_type)3, 40);
+  TEST_ASSERT_EQUAL(20, function_a(2));
+  TEST_ASSERT_EQUAL(80, function_a(3));
+}
+
+// should successfully throw an error if expects and mocks called before it
+void test9(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 10);
+  foo_ExpectAndReturn((custom_type)1, 20);
+  TEST_ASSERT_EQUAL(10, function_a(1));
+  TEST_ASSERT_EQUAL(20, function_a(1));
+  
+  foo_ExpectAndReturn((custom_type)2, 20);
+  foo_ExpectAndThrow((custom_type)3, 40);
+  TEST_ASSERT_EQUAL(20, function_a(2));
+  TEST_ASSERT_EQUAL(80, function_a(3));
+}
+
+
@@ -0,0 +1,38 @@
+#include "unity.h"
+#include "cmock.h"
+#include "CException.h"
+#include "mock_expect_and_throw_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+static void CMock_Init(void) { mock_expect_and_throw_mockable_Init(); }
+static void CMock_Verify(void) { mock_expect_and_throw_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_expect_and_throw_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CEXCEPTION_T e; CMock_Init(); UNITY_CLR_DETAILS(); setUp(); Try { func(); } Catch(e) { UNITY_TEST_ASSERT_EQUAL_HEX32(CEXCEPTION_NONE, e, line, "Unhandled Exception!"); } }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_expect_and_throw.c");
+  run_test(test1, "test1", 19);
+  run_test(test2, "test2", 26);
+  run_test(test3, "test3", 33);
+  run_test(test4, "test4", 46);
+  run_test(test5, "test5", 52);
+  run_test(test6, "test6", 58);
+  run_test(test7, "test7", 73);
+  run_test(test8, "test8", 86);
+  run_test(test9, "test9", 102);
+  return UnityEnd();
+}
@@ -0,0 +1,192 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_any_args_mockable.h"
+#include "expect_any_args.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise simple ExpectAndReturn mock calls
+void test1(void)
+{
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 10);
+  foo_ExpectAndReturn(2, 20);
+  foo_ExpectAndReturn(3, 30);
+  TEST_ASSERT_EQUAL(60, function(1, 2, 3));
+}
+
+// should ignore foo() call details
+void test2(void)
+{
+  bar_Expect(4);
+  foo_ExpectAnyArgsAndReturn(10);
+  foo_ExpectAnyArgsAndReturn(40);
+  foo_ExpectAnyArgsAndReturn(80);
+  TEST_ASSERT_EQUAL(130, function(3, 4, 3));
+}
+
+// should ignore foo() call details and notice if we called foo() more times than expected
+void test3(void)
+{
+  bar_Expect(4);
+  foo_ExpectAnyArgsAndReturn(20);
+  foo_ExpectAnyArgsAndReturn(30);
+  TEST_ASSERT_EQUAL(50, function(3, 4, 9));
+}
+
+// should ignore foo() call details and notice if we called foo() fewer times than expected
+void test4(void)
+{
+  bar_Expect(4);
+  foo_ExpectAnyArgsAndReturn(20);
+  foo_ExpectAnyArgsAndReturn(10);
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAnyArgsAndReturn(60);
+  TEST_ASSERT_EQUAL(70, function(3, 4, 9));
+}
+
+// should ignore bar() and foo() call details
+void test5(void)
+{
+  bar_ExpectAnyArgs();
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAnyArgsAndReturn(50);
+  TEST_ASSERT_EQUAL(150, function(0, 0, 0));
+}
+
+// should be able to handle an expect after ignore calls since we are ignoring args only
+void test6(void)
+{
+  bar_ExpectAnyArgs();
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAndReturn(3, 50);
+  TEST_ASSERT_EQUAL(150, function(1, 2, 3));
+}
+
+// should be able to handle an ignore after an expect call since we are ignoring args only
+void test7(void)
+{
+  bar_ExpectAnyArgs();
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAnyArgsAndReturn(50);
+  TEST_ASSERT_EQUAL(150, function(1, 2, 3));
+}
+
+// should be able to handle an ignore within expect calls since we are ignoring args only
+void test8(void)
+{
+  bar_ExpectAnyArgs();
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAndReturn(3, 50);
+  TEST_ASSERT_EQUAL(150, function(1, 2, 3));
+}
+
+// should be able to detect problems with an expect even when using ignores
+void test9(void)
+{
+  bar_ExpectAnyArgs();
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAndReturn(4, 50);
+  TEST_ASSERT_EQUAL(150, function(1, 2, 3));
+}
+
+// should be able to handle a lone ExpectAnyArg call
+void test10(void)
+{
+  bar_ExpectAnyArgs();
+  func_b(1);
+}
+
+// should be able to handle a lone ExpectAnyArg call that does not get called
+void test11(void)
+{
+  bar_ExpectAnyArgs();
+}
+
+// should be able to handle a missing ExpectAnyArg call
+void test12(void)
+{
+  func_b(1);
+}
+
+// should ignore foo() calls over multiple mock calls
+void test13(void)
+{
+  bar_ExpectAnyArgs();
+  foo_ExpectAnyArgsAndReturn(50);
+  foo_ExpectAnyArgsAndReturn(60);
+  foo_ExpectAnyArgsAndReturn(70);
+  TEST_ASSERT_EQUAL(180, function(0, 0, 0));
+
+  bar_ExpectAnyArgs();
+  foo_ExpectAnyArgsAndReturn(30);
+  foo_ExpectAnyArgsAndReturn(80);
+  foo_ExpectAnyArgsAndReturn(10);
+  TEST_ASSERT_EQUAL(120, function(0, 0, 0));
+
+  bar_ExpectAnyArgs();
+  foo_ExpectAnyArgsAndReturn(70);
+  foo_ExpectAnyArgsAndReturn(20);
+  foo_ExpectAnyArgsAndReturn(20);
+  TEST_ASSERT_EQUAL(110, function(0, 0, 0));
+}
+
+// should have multiple cycles of expects still pass when this plugin enabled
+void test14(void)
+{
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(8);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(7, 8, 9));
+}
+
+// should have multiple cycles of expects still fail when this plugin enabled
+void test15(void)
+{
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(8);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(0, 8, 9));
+}
+
+
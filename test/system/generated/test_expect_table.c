@@ -0,0 +1,94 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_table_mockable.h"
+#include "expect_table.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should queue every row of a table and return their values in order
+void test1(void)
+{
+  const read_reg_ExpectRow reads[3] = { {10, 1}, {11, 2}, {12, 4} };
+  const write_reg_ExpectRow writes[3] = { {20, 1}, {21, 2}, {22, 4} };
+  int i;
+  for (i = 0; i < 3; i++)
+  {
+    read_reg_ExpectTable(&reads[i], 1);
+    write_reg_ExpectTable(&writes[i], 1);
+  }
+  sync_Expect();
+  TEST_ASSERT_EQUAL(7, copy_regs(10, 20, 3));
+}
+
+// should append a table to expectations queued before it
+void test2(void)
+{
+  const read_reg_ExpectRow reads[2] = { {11, 5}, {12, 6} };
+  read_reg_ExpectAndReturn(10, 4);
+  write_reg_Expect(20, 4);
+  read_reg_ExpectTable(reads, 1);
+  write_reg_Expect(21, 5);
+  read_reg_ExpectTable(&reads[1], 1);
+  write_reg_Expect(22, 6);
+  sync_Expect();
+  TEST_ASSERT_EQUAL(15, copy_regs(10, 20, 3));
+}
+
+// should queue nothing for an empty table
+void test3(void)
+{
+  read_reg_ExpectTable(NULL, 0);
+  sync_Expect();
+  TEST_ASSERT_EQUAL(0, copy_regs(10, 20, 0));
+}
+
+// should fail when a row has the wrong argument
+void test4(void)
+{
+  const write_reg_ExpectRow writes[2] = { {20, 1}, {21, 3} };
+  read_reg_ExpectAndReturn(10, 1);
+  write_reg_ExpectTable(writes, 1);
+  read_reg_ExpectAndReturn(11, 2);
+  write_reg_ExpectTable(&writes[1], 1);
+  sync_Expect();
+  copy_regs(10, 20, 2);
+}
+
+// should fail when the rows are called out of order
+void test5(void)
+{
+  const read_reg_ExpectRow reads[2] = { {10, 1}, {11, 2} };
+  const write_reg_ExpectRow writes[2] = { {20, 1}, {21, 2} };
+  read_reg_ExpectTable(reads, 2);
+  write_reg_ExpectTable(writes, 2);
+  sync_Expect();
+  copy_regs(10, 20, 2);
+}
+
+// should fail when fewer calls are made than the table holds
+void test6(void)
+{
+  const read_reg_ExpectRow reads[3] = { {10, 1}, {11, 2}, {12, 3} };
+  read_reg_ExpectTable(reads, 3);
+  TEST_ASSERT_EQUAL(1, read_reg(10));
+  TEST_ASSERT_EQUAL(2, read_reg(11));
+}
+
+// should refuse a count which the memory index can not hold
+void test7(void)
+{
+  const read_reg_ExpectRow reads[1] = { {10, 1} };
+  /* one more row than the index type can count, which a cast would turn into a single row */
+  read_reg_ExpectTable(reads, ((size_t)1 << (sizeof(CMOCK_MEM_INDEX_TYPE) * 8)) + 1);
+}
+
+
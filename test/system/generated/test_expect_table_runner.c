@@ -0,0 +1,35 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_table_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_expect_table_mockable_Init(); }
+static void CMock_Verify(void) { mock_expect_table_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_expect_table_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_expect_table.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 33);
+  run_test(test3, "test3", 47);
+  run_test(test4, "test4", 55);
+  run_test(test5, "test5", 67);
+  run_test(test6, "test6", 78);
+  run_test(test7, "test7", 87);
+  return UnityEnd();
+}
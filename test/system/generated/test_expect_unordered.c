@@ -0,0 +1,99 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_unordered_mockable.h"
+#include "expect_unordered.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should accept calls in the opposite order of the expectations
+void test1(void)
+{
+  get_ExpectUnorderedAndReturn(3, 300);
+  get_ExpectUnorderedAndReturn(2, 20);
+  get_ExpectUnorderedAndReturn(1, 1);
+  TEST_ASSERT_EQUAL(321, sum_of(1, 2, 3));
+}
+
+// should consume ordered expectations before unordered ones
+void test2(void)
+{
+  get_ExpectUnorderedAndReturn(3, 300);
+  get_ExpectUnorderedAndReturn(2, 20);
+  get_ExpectAndReturn(1, 1);
+  TEST_ASSERT_EQUAL(321, sum_of(1, 2, 3));
+}
+
+// should match strings which are not hashed by their text whatever the order of the calls
+void test3(void)
+{
+  char second[] = "second";
+  put_ExpectUnordered("first", 1);
+  put_ExpectUnordered(second, 1);
+  store("second", "first", 1);
+}
+
+// should match pointers which are not hashed by the data they point to whatever the order of the calls
+void test4(void)
+{
+  POINT_T a = {1, 2};
+  POINT_T b = {3, 4};
+  POINT_T expected_a = {1, 2};
+  POINT_T expected_b = {3, 4};
+  move_ExpectUnordered(&expected_a, 7);
+  move_ExpectUnordered(&expected_b, 7);
+  move_both(&b, &a, 7);
+}
+
+// should accept functions without arguments in any order
+void test5(void)
+{
+  get_ExpectUnorderedAndReturn(5, 5);
+  reset_ExpectUnordered();
+  reset_and_get(5);
+}
+
+// should fail when a call has a value which no expectation has
+void test6(void)
+{
+  get_ExpectUnorderedAndReturn(3, 300);
+  get_ExpectUnorderedAndReturn(2, 20);
+  get_ExpectUnorderedAndReturn(4, 1);
+  sum_of(1, 2, 3);
+}
+
+// should fail on the argument which differs when only the hashed arguments match
+void test7(void)
+{
+  put_ExpectUnordered("first", 1);
+  put_ExpectUnordered("other", 1);
+  store("second", "first", 1);
+}
+
+// should fail when an unordered expectation is left over
+void test8(void)
+{
+  get_ExpectUnorderedAndReturn(3, 300);
+  get_ExpectUnorderedAndReturn(2, 20);
+  get_ExpectUnorderedAndReturn(1, 1);
+  get_ExpectUnorderedAndReturn(4, 1);
+  sum_of(1, 2, 3);
+}
+
+// should fail when there are more calls than expectations
+void test9(void)
+{
+  get_ExpectUnorderedAndReturn(2, 20);
+  get_ExpectUnorderedAndReturn(1, 1);
+  sum_of(1, 2, 3);
+}
+
+
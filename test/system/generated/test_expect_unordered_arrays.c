@@ -0,0 +1,47 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_unordered_arrays_mockable.h"
+#include "expect_unordered_arrays.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should match arrays which only differ past their first element whatever the order of the calls
+void test1(void)
+{
+  short lower[3] = {1, 2, 3};
+  short upper[3] = {1, 2, 4};
+  send_ExpectUnordered(lower, 3);
+  send_ExpectUnordered(upper, 3);
+  send_two(1, 2, 4);
+}
+
+// should match arrays of structs which only differ past their first element whatever the order of the calls
+void test2(void)
+{
+  POINT_T crossed[2] = { {0, 0}, {6, 5} };
+  POINT_T straight[2] = { {0, 0}, {5, 6} };
+  move_ExpectUnordered(crossed, 2);
+  move_ExpectUnordered(straight, 2);
+  move_two(5, 6);
+}
+
+// should fail on the element which differs when no array matches
+void test3(void)
+{
+  short lower[3] = {1, 2, 3};
+  short upper[3] = {1, 2, 4};
+  send_ExpectUnordered(lower, 3);
+  send_ExpectUnordered(upper, 3);
+  send_two(1, 2, 5);
+}
+
+
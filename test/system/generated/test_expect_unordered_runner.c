@@ -0,0 +1,37 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_expect_unordered_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+static void CMock_Init(void) { mock_expect_unordered_mockable_Init(); }
+static void CMock_Verify(void) { mock_expect_unordered_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_expect_unordered_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_expect_unordered.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 36);
+  run_test(test4, "test4", 45);
+  run_test(test5, "test5", 57);
+  run_test(test6, "test6", 65);
+  run_test(test7, "test7", 74);
+  run_test(test8, "test8", 82);
+  run_test(test9, "test9", 92);
+  return UnityEnd();
+}
@@ -0,0 +1,145 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_fancy_pointer_handling_mockable.h"
+#include "fancy_pointer_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle the situation where we pass nulls to pointers
+void test1(void)
+{
+  bar_ExpectAndReturn(NULL);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect
+void test2(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass single object with expect and it is wrong
+void test3(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(&ex);
+
+  function_a();
+}
+
+// should handle the situation where we pass nulls to pointers and fail
+void test4(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  foo_Expect(NULL);
+
+  function_a();
+}
+
+// should handle the situation where we pass nulls to arrays
+void test5(void)
+{
+  bar_ExpectAndReturn(NULL);
+  fooa_Expect(NULL);
+
+  function_b();
+}
+
+// should handle the situation where we pass single array element with expect
+void test6(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(&ex);
+
+  function_b();
+}
+
+// should handle the situation where we pass single array element with expect and it is wrong
+void test7(void)
+{
+  POINT_T pt = {1, 2};
+  POINT_T ex = {1, 3};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(&ex);
+
+  function_b();
+}
+
+// should handle the situation where we pass nulls to arrays and fail
+void test8(void)
+{
+  POINT_T pt = {1, 2};
+  bar_ExpectAndReturn(&pt);
+  fooa_Expect(NULL);
+
+  function_b();
+}
+
+// should handle standard c string as null terminated on not do crappy memory compares of a byte, passing
+void test9(void)
+{
+  const char* retval = "This is a\0 silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_Expect("This is a\0 wacky string");
+
+  function_c();
+}
+
+// should handle standard c string as null terminated on not do crappy memory compares of a byte, finding failures
+void test10(void)
+{
+  const char* retval = "This is a silly string";
+  bars_ExpectAndReturn((char*)retval);
+  foos_Expect("This is a wacky string");
+
+  function_c();
+}
+
+// should handle handle typedefs that ARE pointers by using treat_as
+void test11(void)
+{
+  int e = 456;
+  int r = 789;
+  INT_PTR ptr_e = (INT_PTR)(&e);
+  INT_PTR ptr_r = (INT_PTR)(&r);
+
+  zoink_ExpectAndReturn(ptr_e, ptr_r);
+
+  TEST_ASSERT_EQUAL(r, function_d());
+}
+
+// should handle handle typedefs that ARE pointers by using treat_as and catch failures
+void test12(void)
+{
+  int e = 457;
+  int r = 789;
+  INT_PTR ptr_e = (INT_PTR)(&e);
+  INT_PTR ptr_r = (INT_PTR)(&r);
+
+  zoink_ExpectAndReturn(ptr_e, ptr_r);
+
+  TEST_ASSERT_EQUAL(r, function_d());
+}
+
+
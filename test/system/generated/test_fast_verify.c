@@ -0,0 +1,90 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_fast_verify_mockable.h"
+#include "fast_verify.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should accept calls whose integer arguments all match
+void test1(void)
+{
+  get_ExpectAndReturn(3, 0x80, 10);
+  get_ExpectAndReturn(3, 0x80, 20);
+  TEST_ASSERT_EQUAL(30, get_twice(3, 0x80));
+}
+
+// should fall back to the detailed checks for equal strings at different addresses
+void test2(void)
+{
+  char key[] = "speed";
+  put_Expect("speed", 5);
+  store(key, 5);
+}
+
+// should accept structs and floats passed by value with the same bytes
+void test3(void)
+{
+  POINT_T expected = {1, 2};
+  place_Expect(expected, 1.5f);
+  place_at(1, 2, 1.5f);
+}
+
+// should fall back to the detailed checks for pointers to equal data
+void test4(void)
+{
+  POINT_T expected = {4, 5};
+  move_Expect(&expected);
+  move_to(4, 5);
+}
+
+// should skip ignored arguments in the combined comparison
+void test5(void)
+{
+  get_ExpectAndReturn(3, 0, 10);
+  get_IgnoreArg_flags();
+  get_ExpectAndReturn(3, 0, 20);
+  get_IgnoreArg_flags();
+  TEST_ASSERT_EQUAL(30, get_twice(3, 0x7F));
+}
+
+// should fail on an integer argument which differs
+void test6(void)
+{
+  get_ExpectAndReturn(3, 0x81, 10);
+  get_ExpectAndReturn(3, 0x80, 20);
+  get_twice(3, 0x80);
+}
+
+// should fail on a string which differs
+void test7(void)
+{
+  put_Expect("speed", 5);
+  store("sped", 5);
+}
+
+// should fail on a struct passed by value which differs
+void test8(void)
+{
+  POINT_T expected = {1, 2};
+  place_Expect(expected, 1.5f);
+  place_at(1, 3, 1.5f);
+}
+
+// should fail on pointed-to data which differs
+void test9(void)
+{
+  POINT_T expected = {4, 5};
+  move_Expect(&expected);
+  move_to(4, 6);
+}
+
+
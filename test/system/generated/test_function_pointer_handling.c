@@ -0,0 +1,31 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_function_pointer_handling_mockable.h"
+#include "function_pointer_handling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should expect a function pointer param
+void test1(void)
+{
+  takes_function_ptr_Expect(dummy_function1);
+  exercise_function_pointer_param();
+}
+
+// should return a function pointer
+void test2(void)
+{
+  returns_function_ptr_ExpectAndReturn('z', dummy_function2);
+  TEST_ASSERT_EQUAL_PTR(dummy_function2, exercise_function_pointer_return('z'));
+}
+
+
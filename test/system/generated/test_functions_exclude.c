@@ -0,0 +1,30 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_functions_exclude_mockable.h"
+#include "functions_exclude.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should leave out functions returning function pointers by their own names
+void test1(void)
+{
+  read_value_ExpectAndReturn(3);
+  TEST_ASSERT_EQUAL(7, call_hooks(5));
+}
+
+// should still mock the functions which are not excluded
+void test2(void)
+{
+  call_hooks(5);
+}
+
+
@@ -0,0 +1,23 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_functions_exclude_mockable.h"
+extern void test1(void);
+extern void test2(void);
+static void CMock_Init(void) { mock_functions_exclude_mockable_Init(); }
+static void CMock_Verify(void) { mock_functions_exclude_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_functions_exclude_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_functions_exclude.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 25);
+  return UnityEnd();
+}
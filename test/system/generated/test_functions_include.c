@@ -0,0 +1,54 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_functions_include_mockable.h"
+#include "functions_include.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should mock the functions matching a glob
+void test1(void)
+{
+  io_read_ExpectAndReturn(3);
+  io_write_Expect(3);
+  copy_io();
+}
+
+// should mock the functions matching a regular expression
+void test2(void)
+{
+  dev_read_ExpectAndReturn(4);
+  dev_write_Expect(4);
+  copy_dev();
+}
+
+// should leave excluded and unmatched functions to their real definitions
+void test3(void)
+{
+  TEST_ASSERT_EQUAL(49, debug_and_status());
+}
+
+// should check the arguments of the functions which are mocked
+void test4(void)
+{
+  dev_read_ExpectAndReturn(4);
+  dev_write_Expect(5);
+  copy_dev();
+}
+
+// should fail unexpected calls to the functions which are mocked
+void test5(void)
+{
+  io_read_ExpectAndReturn(3);
+  copy_io();
+}
+
+
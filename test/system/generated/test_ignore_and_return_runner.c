@@ -0,0 +1,55 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_ignore_and_return_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+extern void test14(void);
+extern void test15(void);
+extern void test16(void);
+extern void test17(void);
+extern void test18(void);
+static void CMock_Init(void) { mock_ignore_and_return_mockable_Init(); }
+static void CMock_Verify(void) { mock_ignore_and_return_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_ignore_and_return_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_ignore_and_return.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 28);
+  run_test(test3, "test3", 38);
+  run_test(test4, "test4", 45);
+  run_test(test5, "test5", 54);
+  run_test(test6, "test6", 62);
+  run_test(test7, "test7", 70);
+  run_test(test8, "test8", 90);
+  run_test(test9, "test9", 112);
+  run_test(test10, "test10", 134);
+  run_test(test11, "test11", 140);
+  run_test(test12, "test12", 164);
+  run_test(test13, "test13", 188);
+  run_test(test14, "test14", 208);
+  run_test(test15, "test15", 228);
+  run_test(test16, "test16", 239);
+  run_test(test17, "test17", 257);
+  run_test(test18, "test18", 273);
+  return UnityEnd();
+}
@@ -0,0 +1,275 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_ignore_and_return_stateless_mockable.h"
+#include "ignore_and_return_stateless.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully exercise simple ExpectAndReturn mock calls
+void test1(void)
+{
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 10);
+  foo_ExpectAndReturn(2, 20);
+  foo_ExpectAndReturn(3, 30);
+  TEST_ASSERT_EQUAL(60, function(1, 2, 3));
+}
+
+// should ignore foo() calls
+void test2(void)
+{
+  bar_Expect(4);
+  foo_IgnoreAndReturn(40);
+  TEST_ASSERT_EQUAL(120, function(3, 4, 3));
+}
+
+// should ignore the situation where foo() is not called even though we explicitly ignored it
+void test3(void)
+{
+  foo_IgnoreAndReturn(20);
+  //notice we do not call foo
+}
+
+// should ignore foo() calls and always return last item
+void test4(void)
+{
+  bar_Expect(4);
+  foo_IgnoreAndReturn(20);
+  foo_IgnoreAndReturn(30);
+  TEST_ASSERT_EQUAL(90, function(3, 4, 9));
+}
+
+// should ignore bar() and foo() calls
+void test5(void)
+{
+  bar_Ignore();
+  foo_IgnoreAndReturn(50);
+  TEST_ASSERT_EQUAL(150, function(0, 0, 0));
+}
+
+// should multiple cycles of expects still pass when ignores enabled
+void test6(void)
+{
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(8);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(7, 8, 9));
+}
+
+// should multiple cycles of expects still fail when ignores enabled
+void test7(void)
+{
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(8);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(0, 8, 9));
+}
+
+// should With "fail_on_unexpected_calls" enabled, Expect/Ignore/... of bar is required and test fails.
+void test8(void)
+{
+  function(1, 2, 3);
+}
+
+// should we can override an ignore with an expect and pass
+void test9(void)
+{
+  bar_Ignore();
+
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(8);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(7, 8, 9));
+}
+
+// should we can override an ignore with an expect and fail
+void test10(void)
+{
+  bar_Ignore();
+
+  bar_Expect(2);
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(9);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(7, 8, 9));
+}
+
+// should we can override an ignore and return with an expect and pass
+void test11(void)
+{
+  bar_Ignore();
+  foo_IgnoreAndReturn(30);
+  TEST_ASSERT_EQUAL(90, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(8);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(7, 8, 9));
+}
+
+// should we can override an ignore and return with an expect and fail
+void test12(void)
+{
+  bar_Ignore();
+  foo_IgnoreAndReturn(0);
+  TEST_ASSERT_EQUAL(0, function(1, 2, 3));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 80);
+  foo_ExpectAndReturn(6, 10);
+  TEST_ASSERT_EQUAL(120, function(4, 5, 6));
+
+  bar_Expect(9);
+  foo_ExpectAndReturn(7, 70);
+  foo_ExpectAndReturn(8, 20);
+  foo_ExpectAndReturn(9, 20);
+  TEST_ASSERT_EQUAL(110, function(7, 8, 9));
+}
+
+// should we can override an expect with an ignore
+void test13(void)
+{
+  bar_Expect(5);
+  bar_Ignore();
+  foo_ExpectAndReturn(1, 50);
+  foo_ExpectAndReturn(2, 60);
+  foo_ExpectAndReturn(3, 70);
+  TEST_ASSERT_EQUAL(180, function(1, 2, 3));
+}
+
+// should we can override an expect with an ignore and return and fail after
+void test14(void)
+{
+  bar_Expect(5);
+  foo_ExpectAndReturn(4, 30);
+  foo_ExpectAndReturn(5, 50);
+  foo_IgnoreAndReturn(20);
+  TEST_ASSERT_EQUAL(100, function(4, 5, 6));
+
+  bar_Expect(5);
+  foo_ExpectAndReturn(9, 30); //THIS ONE WILL FAIL
+  foo_ExpectAndReturn(2, 80);
+  foo_ExpectAndReturn(3, 60);
+  TEST_ASSERT_EQUAL(170, function(1, 2, 3));
+}
+
+// should we can override an expect with an ignore and return and only the ignore and return is acknowledged
+void test15(void)
+{
+  bar_Expect(5);
+  foo_ExpectAndReturn(2, 30); //NOTE THIS WOULD NORMALLY FAIL
+  foo_ExpectAndReturn(5, 50);
+  foo_IgnoreAndReturn(20);    //BUT WE SAID WE NO LONGER CARE
+  TEST_ASSERT_EQUAL(60, function(4, 5, 6));
+}
+
+// should fail when function is called after ignore is stopped
+void test16(void)
+{
+  bar_Ignore();
+  foo_IgnoreAndReturn(10);
+  function(0, 0, 0);
+  bar_StopIgnore();
+  function(0, 0, 0);
+}
+
+// should delete expect after ignore is stopped
+void test17(void)
+{
+  bar_Ignore();
+  foo_ExpectAndReturn(0, 40);
+  foo_ExpectAndReturn(0, 30);
+  foo_ExpectAndReturn(0, 40);
+
+  foo_IgnoreAndReturn(20);
+  foo_StopIgnore();
+  
+  TEST_ASSERT_EQUAL(110, function(0, 0, 0));  // THIS SHOULD FAIL
+}
+
+// should delete expected return values after ignore is stopped
+void test18(void)
+{
+  bar_Ignore();
+  foo_ExpectAndReturn(0, 40);
+  foo_ExpectAndReturn(0, 30);
+  foo_ExpectAndReturn(0, 40);
+
+  foo_IgnoreAndReturn(20);
+  foo_StopIgnore();
+  
+  foo_ExpectAndReturn(0, 50);
+  foo_ExpectAndReturn(0, 30);
+  foo_ExpectAndReturn(0, 40);
+  TEST_ASSERT_EQUAL(120, function(0, 0, 0));
+}
+
+
@@ -0,0 +1,55 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_ignore_and_return_stateless_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+extern void test14(void);
+extern void test15(void);
+extern void test16(void);
+extern void test17(void);
+extern void test18(void);
+static void CMock_Init(void) { mock_ignore_and_return_stateless_mockable_Init(); }
+static void CMock_Verify(void) { mock_ignore_and_return_stateless_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_ignore_and_return_stateless_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_ignore_and_return_stateless.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 28);
+  run_test(test3, "test3", 36);
+  run_test(test4, "test4", 43);
+  run_test(test5, "test5", 52);
+  run_test(test6, "test6", 60);
+  run_test(test7, "test7", 82);
+  run_test(test8, "test8", 104);
+  run_test(test9, "test9", 110);
+  run_test(test10, "test10", 134);
+  run_test(test11, "test11", 158);
+  run_test(test12, "test12", 178);
+  run_test(test13, "test13", 198);
+  run_test(test14, "test14", 209);
+  run_test(test15, "test15", 225);
+  run_test(test16, "test16", 235);
+  run_test(test17, "test17", 245);
+  run_test(test18, "test18", 259);
+  return UnityEnd();
+}
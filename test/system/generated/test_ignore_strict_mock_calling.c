@@ -0,0 +1,23 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_ignore_strict_mock_calling_mockable.h"
+#include "ignore_strict_mock_calling.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should With "fail_on_unexpected_calls" disabled, Expect/Ignore/... of bar is NOT required.
+void test1(void)
+{
+  function(1, 2, 3);
+}
+
+
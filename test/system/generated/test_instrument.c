@@ -0,0 +1,71 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_instrument_mockable.h"
+#include "instrument.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+static int stub_read(int calls) { return calls; }
+
+// should count the calls which met an expectation
+void test1(void)
+{
+  read_value_ExpectAndReturn(1);
+  write_value_Expect(1);
+  read_value_ExpectAndReturn(2);
+  write_value_Expect(2);
+  copy_value();
+  copy_value();
+  TEST_ASSERT_EQUAL(2, read_value_GetStats()->Calls);
+  TEST_ASSERT_EQUAL(2, write_value_GetStats()->Calls);
+  TEST_ASSERT_EQUAL(0, unused_GetStats()->Calls);
+}
+
+// should count the calls which were ignored or handled by a callback
+void test2(void)
+{
+  mock_instrument_mockable_ResetStats();
+  read_value_StubWithCallback(stub_read);
+  write_value_Ignore();
+  copy_value();
+  copy_value();
+  copy_value();
+  TEST_ASSERT_EQUAL(3, read_value_GetStats()->Calls);
+  TEST_ASSERT_EQUAL(3, write_value_GetStats()->Calls);
+}
+
+// should keep the statistics of the previous test until they are reset
+void test3(void)
+{
+  TEST_ASSERT_EQUAL(3, read_value_GetStats()->Calls);
+  TEST_ASSERT_EQUAL(3, write_value_GetStats()->Calls);
+  mock_instrument_mockable_ResetStats();
+  TEST_ASSERT_EQUAL(0, read_value_GetStats()->Calls);
+  TEST_ASSERT_EQUAL(0, write_value_GetStats()->Calls);
+}
+
+// should count each call only once
+void test4(void)
+{
+  read_value_ExpectAndReturn(1);
+  write_value_Expect(1);
+  copy_value();
+  TEST_ASSERT_EQUAL(2, write_value_GetStats()->Calls);
+}
+
+// should still fail calls which match no expectation
+void test5(void)
+{
+  read_value_ExpectAndReturn(1);
+  copy_value();
+}
+
+
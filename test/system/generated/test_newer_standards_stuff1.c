@@ -0,0 +1,33 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_newer_standards_stuff1_mockable.h"
+#include "newer_standards_stuff1.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle handle a simple comparison of C99 types which pass
+void test1(void)
+{
+  foo_ExpectAndReturn(INT_MAX, INT_MIN);
+  
+  TEST_ASSERT_TRUE(function_a());
+}
+
+// should handle handle a simple comparison of C99 types which fail
+void test2(void)
+{
+  foo_ExpectAndReturn(INT_MIN, INT_MIN);
+  
+  TEST_ASSERT_TRUE(function_a());
+}
+
+
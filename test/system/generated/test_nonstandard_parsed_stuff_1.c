@@ -0,0 +1,56 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_nonstandard_parsed_stuff_1_mockable.h"
+#include "nonstandard_parsed_stuff_1.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "CException.h"
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle standard c string as null terminated on not do crappy memory compares of a byte, passing
+void test1(void)
+{
+  bars_ExpectAndReturn("This is a\0 silly string");
+  foos_Expect("This is a\0 wacky string");
+  
+  function_c();
+}
+
+// should handle standard c string as null terminated on not do crappy memory compares of a byte, finding failures
+void test2(void)
+{
+  bars_ExpectAndReturn("This is a silly string");
+  foos_Expect("This is a wacky string");
+  
+  function_c();
+}
+
+// should handle an exception being caught
+void test3(void)
+{
+  bars_ExpectAndReturn("This is a\0 silly string");
+  foos_ExpectAndThrow("This is a\0 wacky string", 55);
+  foos_Expect("err");
+  
+  function_c();
+}
+
+// should handle an exception being caught but still catch following errors
+void test4(void)
+{
+  bars_ExpectAndReturn("This is a\0 silly string");
+  foos_ExpectAndThrow("This is a\0 wacky string", 55);
+  foos_Expect("wrong error");
+  
+  function_c();
+}
+
+
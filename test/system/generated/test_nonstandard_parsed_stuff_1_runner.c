@@ -0,0 +1,30 @@
+#include "unity.h"
+#include "cmock.h"
+#include "CException.h"
+#include "mock_nonstandard_parsed_stuff_1_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_nonstandard_parsed_stuff_1_mockable_Init(); }
+static void CMock_Verify(void) { mock_nonstandard_parsed_stuff_1_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_nonstandard_parsed_stuff_1_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CEXCEPTION_T e; CMock_Init(); UNITY_CLR_DETAILS(); setUp(); Try { func(); } Catch(e) { UNITY_TEST_ASSERT_EQUAL_HEX32(CEXCEPTION_NONE, e, line, "Unhandled Exception!"); } }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_nonstandard_parsed_stuff_1.c");
+  run_test(test1, "test1", 19);
+  run_test(test2, "test2", 28);
+  run_test(test3, "test3", 37);
+  run_test(test4, "test4", 47);
+  return UnityEnd();
+}
@@ -0,0 +1,43 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_nonstandard_parsed_stuff_2_mockable.h"
+#include "nonstandard_parsed_stuff_2.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle two dimensional array of unsigned characters just like we would handle a single dimensional array in expect (where we really only care about first element)
+void test1(void)
+{
+  unsigned char a[] = { 1, 2, 3, 4, 5, 6 };
+  unsigned char** pa = (unsigned char**)(&a);
+
+  bar_ExpectAndReturn(pa);
+  foo_Expect(pa);
+
+  function_a();
+}
+
+// should handle two dimensional array of unsigned characters just like we would handle a single dimensional array in expect as failures (where we really only care about first element)
+void test2(void)
+{
+  unsigned char a[] = { 1, 2, 3, 4, 5, 6 };
+  unsigned char b[] = { 5, 6, 7, 8, 9, 0 };
+  unsigned char** pa = (unsigned char**)(&a);
+  unsigned char** pb = (unsigned char**)(&b);
+
+  bar_ExpectAndReturn(pa);
+  foo_Expect(pb);
+
+  function_a();
+}
+
+
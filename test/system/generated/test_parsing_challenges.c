@@ -0,0 +1,100 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_parsing_challenges_mockable.h"
+#include "parsing_challenges.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+extern int A, B, C;
+extern unsigned int *pA, *pB, *pC;
+
+void setUp(void)
+{
+  A = 100;
+  B = 200;
+  C = 300;
+  pA = (unsigned int*)(&A);
+  pB = (unsigned int*)(&B);
+  pC = (unsigned int*)(&C);
+}
+void tearDown(void) {}
+
+// should execute simple pointer return value check
+void test1(void)
+{
+  U16 retval;
+  ptr_return1_ExpectAndReturn(2, NULL);
+  ptr_return2_ExpectAndReturn(2, NULL);
+  ptr_return3_ExpectAndReturn(2, &retval);
+  TEST_ASSERT_EQUAL_PTR(&retval, exercise_return_pointers(2));
+}
+
+// should ignore var args in expect prototype generation
+void test2(void)
+{
+  var_args1_Expect(2);
+  var_args2_Expect(2, 3);
+  exercise_var_args(2, 3);
+}
+
+// should not process a typedef'd void as anything other than void
+void test3(void)
+{
+  void_type_craziness1_Expect(&A, &B, &C);
+  void_type_craziness2_Expect();
+  exercise_arglist_pointers();
+}
+
+// should successfully mock crazy multline function prototypes
+void test4(void)
+{
+  crazy_multiline_ExpectAndReturn(-10, 11, 'z');
+  TEST_ASSERT_EQUAL('z', exercise_multiline_declarations(-10, 11));
+}
+
+// should mock double pointers just fine
+void test5(void)
+{
+  ptr_ptr_return1_ExpectAndReturn(&pA, &pB);
+  ptr_ptr_return2_ExpectAndReturn(&pA, &pB);
+  ptr_ptr_return3_ExpectAndReturn(&pA, &pB);
+  ptr_ptr_return4_ExpectAndReturn(&pA, &pB);
+  exercise_double_pointers((unsigned int**)(&pA));
+}
+
+// should mock prototypes with long lists of return and parameter type descriptors
+void test6(void)
+{
+  incredible_descriptors_ExpectAndReturn(888, 777);
+  TEST_ASSERT_EQUAL(777, exercise_many_descriptors(888));
+}
+
+// should handle words like typdef as PART of a variable or type
+void test7(void)
+{
+  uses_typedef_like_names_ExpectAndReturn((TypeDefInt)54, (TypeDefInt)53);
+  TEST_ASSERT_EQUAL(53, exercise_typedef_like_names((TypeDefInt)54));
+}
+
+// should handle words like typdef as PART of a variable or type during failing tests
+void test8(void)
+{
+  uses_typedef_like_names_ExpectAndReturn((TypeDefInt)52, (TypeDefInt)53);
+  TEST_ASSERT_EQUAL(53, exercise_typedef_like_names((TypeDefInt)54));
+}
+
+// should handle typedef of void used as a void pointer
+void test9(void)
+{
+  char blah[5] = "blah";
+  void_type_craziness3_Expect(blah);
+  exercise_type_craziness3(blah);
+}
+
+
@@ -0,0 +1,82 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_record_and_replay_mockable.h"
+#include "record_and_replay.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#define TRACE_PATH "./system/build/record_and_replay.trace"
+static int real_value = 0;
+static int real_written = 0;
+static int real_resets = 0;
+static int real_read(void) { return ++real_value; }
+static void real_write(int value) { real_written += value; }
+static void real_reset(void) { real_resets++; }
+static void record_trace(void)
+{
+  TEST_ASSERT_TRUE(CMock_Record_Open(TRACE_PATH));
+  read_value_Record(real_read);
+  write_value_Record(real_write);
+  reset_Record(real_reset);
+  scaled_copy(2);
+  reset_then_copy();
+  CMock_Record_Close();
+}
+void setUp(void) {}
+void tearDown(void) { CMock_Replay_Unload(); }
+
+// should forward recorded calls to the real functions
+void test1(void)
+{
+  record_trace();
+  TEST_ASSERT_EQUAL(2, real_value);
+  TEST_ASSERT_EQUAL(4, real_written);
+  TEST_ASSERT_EQUAL(1, real_resets);
+}
+
+// should replay a trace as the same calls in the same order
+void test2(void)
+{
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TRACE_PATH));
+  mock_record_and_replay_mockable_Replay();
+  TEST_ASSERT_EQUAL(1, scaled_copy(2));
+  reset_then_copy();
+}
+
+// should fail a replayed call with a different argument
+void test3(void)
+{
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TRACE_PATH));
+  mock_record_and_replay_mockable_Replay();
+  scaled_copy(3);
+}
+
+// should fail replayed calls made out of the recorded order
+void test4(void)
+{
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TRACE_PATH));
+  mock_record_and_replay_mockable_Replay();
+  reset();
+}
+
+// should fail when replayed calls are left over
+void test5(void)
+{
+  TEST_ASSERT_TRUE(CMock_Replay_Load(TRACE_PATH));
+  mock_record_and_replay_mockable_Replay();
+  scaled_copy(2);
+}
+
+// should refuse a trace which does not exist
+void test6(void)
+{
+  TEST_ASSERT_TRUE(CMock_Replay_Load("./system/build/no_such.trace"));
+}
+
+
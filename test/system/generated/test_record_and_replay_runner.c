@@ -0,0 +1,33 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_record_and_replay_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_record_and_replay_mockable_Init(); }
+static void CMock_Verify(void) { mock_record_and_replay_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_record_and_replay_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_record_and_replay.c");
+  run_test(test1, "test1", 35);
+  run_test(test2, "test2", 44);
+  run_test(test3, "test3", 53);
+  run_test(test4, "test4", 61);
+  run_test(test5, "test5", 69);
+  run_test(test6, "test6", 77);
+  return UnityEnd();
+}
@@ -0,0 +1,75 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_registry_verify_all_mockable.h"
+#include "registry_verify_all.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should verify the active mocks through CMock_VerifyAll
+void test1(void)
+{
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(3);
+  copy_value();
+  CMock_VerifyAll();
+}
+
+// should report leftover expectations through CMock_VerifyAll
+void test2(void)
+{
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(3);
+  write_value_Expect(4);
+  copy_value();
+  CMock_VerifyAll();
+}
+
+// should clear the active mocks through CMock_DestroyAll
+void test3(void)
+{
+  write_value_Expect(5);
+  CMock_DestroyAll();
+  CMock_VerifyAll();
+}
+
+// should register a mock again when it is configured after CMock_DestroyAll
+void test4(void)
+{
+  write_value_Expect(5);
+  CMock_DestroyAll();
+  write_value_Expect(6);
+  CMock_VerifyAll();
+}
+
+// should forget ignores cleared by CMock_DestroyAll
+void test5(void)
+{
+  read_value_IgnoreAndReturn(1);
+  write_value_Ignore();
+  CMock_DestroyAll();
+  copy_value();
+}
+
+// should mix the registry calls with the per-mock functions
+void test6(void)
+{
+  read_value_ExpectAndReturn(8);
+  write_value_Expect(8);
+  copy_value();
+  CMock_VerifyAll();
+  CMock_DestroyAll();
+  read_value_ExpectAndReturn(9);
+  write_value_Expect(9);
+  copy_value();
+}
+
+
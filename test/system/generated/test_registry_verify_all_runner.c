@@ -0,0 +1,31 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_registry_verify_all_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+static void CMock_Init(void) { mock_registry_verify_all_mockable_Init(); }
+static void CMock_Verify(void) { mock_registry_verify_all_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_registry_verify_all_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_registry_verify_all.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 37);
+  run_test(test4, "test4", 45);
+  run_test(test5, "test5", 54);
+  run_test(test6, "test6", 63);
+  return UnityEnd();
+}
@@ -0,0 +1,169 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_return_thru_ptr_ignore_arg_mockable.h"
+#include "return_thru_ptr_ignore_arg.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle a single int* argument
+void test1(void)
+{
+  int r = 1;
+  int res = 4;
+
+  ptr_ret_int_Expect(&r);
+  ptr_ret_int_ReturnThruPtr_r(&res);
+  ptr_ret_int(&r);
+  TEST_ASSERT_EQUAL(4, r);
+}
+
+// should handle multiple calls
+void test2(void)
+{
+  int r = 1;
+  int res1 = 4;
+  int res2 = 8;
+  int res3 = 16;
+
+  ptr_ret_int_Expect(&r);
+  ptr_ret_int_ReturnThruPtr_r(&res1);
+  ptr_ret_int_Expect(&r);
+  ptr_ret_int_ReturnThruPtr_r(&res2);
+  ptr_ret_int_Expect(&r);
+  ptr_ret_int_ReturnThruPtr_r(&res3);
+
+  ptr_ret_int(&r);
+  TEST_ASSERT_EQUAL(4, r);
+  ptr_ret_int(&r);
+  TEST_ASSERT_EQUAL(8, r);
+  ptr_ret_int(&r);
+  TEST_ASSERT_EQUAL(16, r);
+
+}
+
+// should ignore an argument
+void test3(void)
+{
+  int s = 2;
+  int res = 4;
+
+  ptr_ret_int_ExpectAnyArgs();
+  ptr_ret_int_ReturnThruPtr_r(&res);
+  ptr_ret_int(&s);
+  TEST_ASSERT_EQUAL(4, s);
+}
+
+// should ignore a null pointer argument
+void test4(void)
+{
+  int r = 1;
+  int res = 4;
+
+  ptr_ret_int_ExpectAnyArgs();
+  ptr_ret_int_ReturnThruPtr_r(&res);
+  ptr_ret_int(&r);
+  TEST_ASSERT_EQUAL(4, r);
+}
+
+// should handle multiple int* arguments
+void test5(void)
+{
+  int r, s = 0x0880AA55;
+  int r_res = 4;
+  int s_res = 6;
+
+  ptr_ret_ints_Expect(&r, &s);
+  ptr_ret_ints_ReturnThruPtr_r(&r_res);
+  ptr_ret_ints_ReturnThruPtr_s(&s_res);
+  ptr_ret_ints(&r, &s);
+  TEST_ASSERT_EQUAL(4, r);
+  TEST_ASSERT_EQUAL(6, s);
+}
+
+// should only return through pointer when asked to
+void test6(void)
+{
+  int r = 0x0880AA55;
+  int s = 0xAA55;
+  int r_res = 4;
+
+  ptr_ret_ints_Expect(&r, &s);
+  ptr_ret_ints_ReturnThruPtr_r(&r_res);
+  ptr_ret_ints(&r, &s);
+  TEST_ASSERT_EQUAL(4, r);
+  TEST_ASSERT_EQUAL(0xAA55, s);
+}
+
+// should return an array through a pointer correctly
+void test7(void)
+{
+  char r_a[] = "booboorooboo";
+  char r_a_ret[] = "FEEFI";
+
+  ptr_ret_array_Expect(r_a, lengthof(r_a));
+  ptr_ret_array_ReturnArrayThruPtr_r(r_a_ret, (int)strlen(r_a_ret));
+  ptr_ret_array(r_a, lengthof(r_a));
+  TEST_ASSERT_EQUAL_STRING("FEEFIorooboo", r_a);
+}
+
+// should handle structs
+void test8(void)
+{
+  struct a_struct r_s = { .i1 = 2, .i2 = 3, .i3 = 4, };
+  struct a_struct r_s_ret = { .i1 = 8, .i2 = 16, .i3 = 32, };
+
+  ptr_ret_struct_Expect(&r_s);
+  ptr_ret_struct_ReturnThruPtr_r(&r_s_ret);
+  ptr_ret_struct(&r_s);
+  TEST_ASSERT_EQUAL_MEMORY(&r_s_ret, &r_s, sizeof(struct a_struct));
+}
+
+// should handle typedefs
+void test9(void)
+{
+  abs_struct r_as = {.abs_i1 = 0x1234, .abs_i2 = 0x4567};
+  abs_struct r_as_ret = {.abs_i1 = 0xFFAA55, .abs_i2 = 0xAAFFAA};
+  ptr_ret_abstract_Expect(&r_as);
+  ptr_ret_abstract_ReturnMemThruPtr_r(&r_as_ret, sizeof(abs_struct));
+  ptr_ret_abstract(&r_as);
+  TEST_ASSERT_EQUAL_MEMORY(&r_as_ret, &r_as, sizeof(abs_struct));
+}
+
+// should only generate ReturnThruPtr definitions for non-const arguments
+void test10(void)
+{
+#if !defined(ptr_ret_const_int_ReturnThruPtr_r)
+    TEST_FAIL_MESSAGE("ReturnThruPtr not defined for a pointer argument.");
+#endif
+
+#if defined(ptr_ret_const_int_ReturnThruPtr_s)
+    TEST_FAIL_MESSAGE("ReturnThruPtr defined for a const pointer argument.");
+#endif
+}
+
+// should generate ReturnThruPtr definitions for string arguments
+void test11(void)
+{
+#if !defined(ptr_ret_string_ReturnThruPtr_s)
+    TEST_FAIL_MESSAGE("ReturnThruPtr not defined for a string argument.");
+#endif
+}
+
+// should generate ExpectAnyArgs definitions
+void test12(void)
+{
+#if !defined(ptr_ret_array_ExpectAnyArgs)
+    TEST_FAIL_MESSAGE("ExpectAnyArgs not defined for an argument.");
+#endif
+}
+
+
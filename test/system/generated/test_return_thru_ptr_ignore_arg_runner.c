@@ -0,0 +1,43 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_return_thru_ptr_ignore_arg_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+static void CMock_Init(void) { mock_return_thru_ptr_ignore_arg_mockable_Init(); }
+static void CMock_Verify(void) { mock_return_thru_ptr_ignore_arg_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_return_thru_ptr_ignore_arg_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_return_thru_ptr_ignore_arg.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 30);
+  run_test(test3, "test3", 54);
+  run_test(test4, "test4", 66);
+  run_test(test5, "test5", 78);
+  run_test(test6, "test6", 93);
+  run_test(test7, "test7", 107);
+  run_test(test8, "test8", 119);
+  run_test(test9, "test9", 131);
+  run_test(test10, "test10", 142);
+  run_test(test11, "test11", 154);
+  run_test(test12, "test12", 162);
+  return UnityEnd();
+}
@@ -0,0 +1,69 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_sharded_mocks_mockable.h"
+#include "sharded_mocks.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle calls to functions spread over several parts
+void test1(void)
+{
+  read_a_ExpectAndReturn(1, 10);
+  write_b_Expect(1, 10);
+  flush_Expect();
+  read_b_ExpectAndReturn(2, 20);
+  write_a_Expect(2, 20);
+  flush_Expect();
+  copy_a_to_b(1);
+  copy_b_to_a(2);
+}
+
+// should share ignores between the parts and the core
+void test2(void)
+{
+  read_a_IgnoreAndReturn(5);
+  write_b_Expect(1, 0);
+  write_b_IgnoreArg_value();
+  flush_Ignore();
+  copy_a_to_b(1);
+  CMock_VerifyAll();
+}
+
+// should name the function and argument which differ
+void test3(void)
+{
+  read_a_ExpectAndReturn(1, 10);
+  write_b_Expect(1, 11);
+  flush_Expect();
+  copy_a_to_b(1);
+}
+
+// should enforce the call order across parts
+void test4(void)
+{
+  flush_Expect();
+  read_a_ExpectAndReturn(1, 10);
+  write_b_Expect(1, 10);
+  copy_a_to_b(1);
+}
+
+// should report leftovers from the core Verify
+void test5(void)
+{
+  read_a_ExpectAndReturn(1, 10);
+  write_b_Expect(1, 10);
+  flush_Expect();
+  flush_Expect();
+  copy_a_to_b(1);
+}
+
+
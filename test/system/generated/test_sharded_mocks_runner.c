@@ -0,0 +1,31 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_sharded_mocks_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_sharded_mocks_mockable_Init(); }
+static void CMock_Verify(void) { mock_sharded_mocks_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_sharded_mocks_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_sharded_mocks.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 31);
+  run_test(test3, "test3", 42);
+  run_test(test4, "test4", 51);
+  run_test(test5, "test5", 60);
+  return UnityEnd();
+}
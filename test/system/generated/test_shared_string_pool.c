@@ -0,0 +1,43 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_shared_string_pool_mockable.h"
+#include "shared_string_pool.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should run mocks whose names come from the shared pool
+void test1(void)
+{
+  read_value_ExpectAndReturn(1, 10);
+  write_value_Expect(2, 10);
+  flush_Ignore();
+  copy_value(1, 2);
+}
+
+// should report function and argument names from the pool
+void test2(void)
+{
+  read_value_ExpectAndReturn(1, 10);
+  write_value_Expect(2, 11);
+  flush_Expect();
+  copy_value(1, 2);
+}
+
+// should report unexpected calls with names from the pool
+void test3(void)
+{
+  read_value_ExpectAndReturn(1, 10);
+  write_value_Expect(2, 10);
+  copy_value(1, 2);
+}
+
+
@@ -0,0 +1,82 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_shared_verify_helpers_mockable.h"
+#include "shared_verify_helpers.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should accept matching integers and strings
+void test1(void)
+{
+  char key[] = "speed";
+  put_Expect("speed", 5, 0x80);
+  put_Expect("speed", 6, 0x81);
+  put_both(key, 5);
+}
+
+// should accept matching structs and pointed-to data
+void test2(void)
+{
+  POINT_T expected = {1, 2};
+  place_Expect(expected);
+  move_Expect(&expected);
+  place_at(1, 2);
+  move_to(1, 2);
+}
+
+// should accept matching arrays
+void test3(void)
+{
+  short expected[2] = {3, 4};
+  send_ExpectWithArray(expected, 2, 2);
+  send_two(3, 4);
+}
+
+// should report an integer which differs
+void test4(void)
+{
+  put_Expect("speed", 5, 0x80);
+  put_Expect("speed", 7, 0x81);
+  put_both("speed", 5);
+}
+
+// should report a string which differs
+void test5(void)
+{
+  put_Expect("speed", 5, 0x80);
+  put_both("sped", 5);
+}
+
+// should report pointed-to data which differs
+void test6(void)
+{
+  POINT_T expected = {1, 2};
+  move_Expect(&expected);
+  move_to(1, 3);
+}
+
+// should report an array element which differs
+void test7(void)
+{
+  short expected[2] = {3, 5};
+  send_ExpectWithArray(expected, 2, 2);
+  send_two(3, 4);
+}
+
+// should report a NULL pointer where data was expected
+void test8(void)
+{
+  send_ExpectWithArray(NULL, 0, 2);
+  send_two(3, 4);
+}
+
+
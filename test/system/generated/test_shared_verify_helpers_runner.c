@@ -0,0 +1,35 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_shared_verify_helpers_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+static void CMock_Init(void) { mock_shared_verify_helpers_mockable_Init(); }
+static void CMock_Verify(void) { mock_shared_verify_helpers_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_shared_verify_helpers_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_shared_verify_helpers.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 37);
+  run_test(test4, "test4", 45);
+  run_test(test5, "test5", 53);
+  run_test(test6, "test6", 60);
+  run_test(test7, "test7", 68);
+  run_test(test8, "test8", 76);
+  return UnityEnd();
+}
@@ -0,0 +1,35 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_skeleton_mockable.h"
+#include "skeleton.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should generate an empty shell for functions with no return values
+void test1(void)
+{
+  function_a();
+}
+
+// should return numerical zero for numerical return values
+void test2(void)
+{
+  TEST_ASSERT_EQUAL_INT(0, function_b(1, 2));
+}
+
+// should return null for pointer return values
+void test3(void)
+{
+  TEST_ASSERT_NULL(function_c());
+}
+
+
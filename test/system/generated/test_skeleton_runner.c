@@ -0,0 +1,25 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_skeleton_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+static void CMock_Init(void) { mock_skeleton_mockable_Init(); }
+static void CMock_Verify(void) { mock_skeleton_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_skeleton_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_skeleton.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 24);
+  run_test(test3, "test3", 30);
+  return UnityEnd();
+}
@@ -0,0 +1,42 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_skeleton_update_mockable.h"
+#include "skeleton_update.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+extern int function_d(void);
+
+// should generate an empty shell for functions with no return values
+void test1(void)
+{
+  function_a();
+}
+
+// should return numerical zero for numerical return values
+void test2(void)
+{
+  TEST_ASSERT_EQUAL_INT(0, function_b(1, 2));
+}
+
+// should not overwrite functions that already exist
+void test3(void)
+{
+  TEST_ASSERT_EQUAL_STRING("donuts", function_c());
+}
+
+// should leave functions it has never heard of
+void test4(void)
+{
+  TEST_ASSERT_EQUAL_INT(77, function_d());
+}
+
+
@@ -0,0 +1,49 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_struct_union_enum_expect_and_return_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+extern void test13(void);
+extern void test14(void);
+extern void test15(void);
+static void CMock_Init(void) { mock_struct_union_enum_expect_and_return_mockable_Init(); }
+static void CMock_Verify(void) { mock_struct_union_enum_expect_and_return_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_struct_union_enum_expect_and_return_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_struct_union_enum_expect_and_return.c");
+  run_test(test1, "test1", 66);
+  run_test(test2, "test2", 73);
+  run_test(test3, "test3", 80);
+  run_test(test4, "test4", 87);
+  run_test(test5, "test5", 94);
+  run_test(test6, "test6", 101);
+  run_test(test7, "test7", 108);
+  run_test(test8, "test8", 115);
+  run_test(test9, "test9", 122);
+  run_test(test10, "test10", 129);
+  run_test(test11, "test11", 136);
+  run_test(test12, "test12", 143);
+  run_test(test13, "test13", 150);
+  run_test(test14, "test14", 157);
+  run_test(test15, "test15", 164);
+  return UnityEnd();
+}
@@ -0,0 +1,169 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_struct_union_enum_expect_and_return_with_plugins_mockable.h"
+#include "struct_union_enum_expect_and_return_with_plugins.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+struct THING struct1;
+struct THING struct2;
+struct THING struct3;
+struct THING struct4;
+struct THING struct5;
+struct THING struct6;
+
+union STARS_AND_STRIPES union1;
+union STARS_AND_STRIPES union2;
+union STARS_AND_STRIPES union3;
+union STARS_AND_STRIPES union4;
+union STARS_AND_STRIPES union5;
+union STARS_AND_STRIPES union6;
+
+enum HOKEY_POKEY enum1;
+enum HOKEY_POKEY enum2;
+
+void setUp(void)
+{
+  struct1.a = 1;
+  struct1.b = 2;
+
+  struct2.a = 3;
+  struct2.b = 4;
+
+  struct3.a = 5;
+  struct3.b = 6;
+
+  struct4.a = 7;
+  struct4.b = 8;
+
+  struct5.a = 9;
+  struct5.b = 10;
+
+  struct6.a = 9;
+  struct6.b = 10;
+
+  union1.a = 1;
+  union2.a = 2;
+  union3.a = 3;
+  union4.a = 4;
+  union5.a = 5;
+  union6.a = 5;
+
+  enum1 = OUT;
+  enum2 = IN;
+}
+
+void tearDown(void) {}
+
+// should successfully compare structs
+void test1(void)
+{
+  foo_struct_Expect(&struct1, struct2);
+  exercise_struct(&struct1, struct2);
+}
+
+// should blow up on bad struct pointer comparison
+void test2(void)
+{
+  foo_struct_Expect(&struct1, struct2);
+  exercise_struct(&struct3, struct2);
+}
+
+// should blow up on bad structure comparison
+void test3(void)
+{
+  foo_struct_Expect(&struct1, struct2);
+  exercise_struct(&struct1, struct4);
+}
+
+// should compare returned structs as equal
+void test4(void)
+{
+  foobar_struct_ExpectAndReturn(struct5);
+  TEST_ASSERT_EQUAL_THING(struct6, return_struct());
+}
+
+// should compare returned structs as unequal
+void test5(void)
+{
+  foobar_struct_ExpectAndReturn(struct4);
+  TEST_ASSERT_EQUAL_THING(struct5, return_struct());
+}
+
+// should successfully compare unions
+void test6(void)
+{
+  foo_union_Expect(&union1, union2);
+  exercise_union(&union1, union2);
+}
+
+// should blow up on bad union pointer comparison
+void test7(void)
+{
+  foo_union_Expect(&union1, union2);
+  exercise_union(&union3, union2);
+}
+
+// should blow up on bad union comparison
+void test8(void)
+{
+  foo_union_Expect(&union1, union2);
+  exercise_union(&union1, union4);
+}
+
+// should compare returned unions as equal
+void test9(void)
+{
+  foobar_union_ExpectAndReturn(union5);
+  TEST_ASSERT_EQUAL_STARS_AND_STRIPES(union6, return_union());
+}
+
+// should compare returned unions as unequal
+void test10(void)
+{
+  foobar_union_ExpectAndReturn(union4);
+  TEST_ASSERT_EQUAL_STARS_AND_STRIPES(union5, return_union());
+}
+
+// should successfully pass enum values
+void test11(void)
+{
+  foo_enum_Expect(OUT, &enum1);
+  exercise_enum(OUT, &enum1);
+}
+
+// should blow up on bad enum pointer comparison
+void test12(void)
+{
+  foo_enum_Expect(IN, &enum1);
+  exercise_enum(IN, &enum2);
+}
+
+// should blow up on bad enum comparison
+void test13(void)
+{
+  foo_enum_Expect(IN, &enum1);
+  exercise_enum(SHAKE_IT_ALL_ABOUT, &enum1);
+}
+
+// should compare returned enums as equal
+void test14(void)
+{
+  foobar_enum_ExpectAndReturn(OUT);
+  TEST_ASSERT_EQUAL(OUT, return_enum());
+}
+
+// should compare returned unions as unequal
+void test15(void)
+{
+  foobar_enum_ExpectAndReturn(OUT);
+  TEST_ASSERT_EQUAL(IN, return_enum());
+}
+
+
@@ -0,0 +1,160 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_stubs_with_callbacks_mockable.h"
+#include "stubs_with_callbacks.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+UINT32 FooAndBarHelper(custom_type* data, int num)
+{
+    num++;
+    *data = (custom_type)(num * 2);
+    return (UINT32)(*data * 2);
+}
+
+int BazCallbackPointless(int num)
+{
+    return num;
+}
+
+int BazCallbackComplainsIfCalledMoreThanTwice(int num)
+{
+    TEST_ASSERT_MESSAGE(num < 2, "Do Not Call Baz More Than Twice");
+    return num;
+}
+
+void FuzVerifier(int* args, int num_args, int num_calls)
+{
+    int i;
+    TEST_ASSERT_MESSAGE(num_args < 5, "No More Than 5 Args Allowed");
+    for (i = 0; i < num_args; i++)
+    {
+        TEST_ASSERT_EQUAL(num_calls + i, args[i]);
+    }
+}
+
+// should successfully exercise two simple ExpectAndReturn mock calls the normal way
+void test1(void)
+{
+  custom_type exp = 0;
+  foo_ExpectAndReturn(&exp, 10);
+  bar_ExpectAndReturn(&exp, 20);
+  TEST_ASSERT_EQUAL(30, function_b());
+}
+
+// should successfully exercise two simple ExpectAndReturn mock calls and catch failure the normal way
+void test2(void)
+{
+  custom_type exp = 1;
+  foo_ExpectAndReturn(&exp, 10);
+  bar_ExpectAndReturn(&exp, 20);
+  TEST_ASSERT_EQUAL(30, function_b());
+}
+
+// should successfully exercise using some basic callbacks
+void test3(void)
+{
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)FooAndBarHelper);
+  bar_StubWithCallback((CMOCK_bar_CALLBACK)FooAndBarHelper);
+  TEST_ASSERT_EQUAL(12, function_b());
+}
+
+// should successfully exercise using some basic callbacks even if there were expects
+void test4(void)
+{
+  custom_type exp = 500;
+  foo_ExpectAndReturn(&exp, 10);
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)FooAndBarHelper);
+  bar_StubWithCallback((CMOCK_bar_CALLBACK)FooAndBarHelper);
+  TEST_ASSERT_EQUAL(12, function_b());
+}
+
+// should successfully exercise using some basic callbacks and notice failures
+void test5(void)
+{
+  foo_StubWithCallback((CMOCK_foo_CALLBACK)FooAndBarHelper);
+  bar_StubWithCallback((CMOCK_bar_CALLBACK)FooAndBarHelper);
+  TEST_ASSERT_EQUAL(10, function_b());
+}
+
+// should successfully exercise a callback with no arguments
+void test6(void)
+{
+  baz_StubWithCallback((CMOCK_baz_CALLBACK)BazCallbackPointless);
+  TEST_ASSERT_EQUAL(3, function_c());
+}
+
+// should successfully throw a failure from within a callback function
+void test7(void)
+{
+  baz_StubWithCallback((CMOCK_baz_CALLBACK)BazCallbackComplainsIfCalledMoreThanTwice);
+  function_c();
+}
+
+// should be usable for things like dynamically sized memory checking for passing conditions
+void test8(void)
+{
+  fuz_StubWithCallback((CMOCK_fuz_CALLBACK)FuzVerifier);
+  function_a(0, 4);
+}
+
+// should be usable for things like dynamically sized memory checking for failing conditions
+void test9(void)
+{
+  fuz_StubWithCallback((CMOCK_fuz_CALLBACK)FuzVerifier);
+  function_a(0, 5);
+}
+
+// should be usable for things like dynamically sized memory checking for failing conditions 2
+void test10(void)
+{
+  fuz_StubWithCallback((CMOCK_fuz_CALLBACK)FuzVerifier);
+  function_a(1, 4);
+}
+
+// should run them interlaced
+void test11(void)
+{
+  custom_type exp = 0;
+  foo_ExpectAndReturn(&exp, 10);
+  foo_ExpectAndReturn(&exp, 15);
+  bar_ExpectAndReturn(&exp, 20);
+  bar_ExpectAndReturn(&exp, 40);
+  fuz_StubWithCallback((CMOCK_fuz_CALLBACK)FuzVerifier);
+  baz_StubWithCallback((CMOCK_baz_CALLBACK)BazCallbackPointless);
+
+  TEST_ASSERT_EQUAL(30, function_b());
+  TEST_ASSERT_EQUAL(55, function_b());
+  function_a(0, 4);
+  TEST_ASSERT_EQUAL(3, function_c());
+}
+
+// should run them back to back
+void test12(void)
+{
+  custom_type exp = 0;
+  foo_ExpectAndReturn(&exp, 10);
+  bar_ExpectAndReturn(&exp, 20);
+  TEST_ASSERT_EQUAL(30, function_b());
+
+  foo_ExpectAndReturn(&exp, 15);
+  bar_ExpectAndReturn(&exp, 40);
+  TEST_ASSERT_EQUAL(55, function_b());
+
+  fuz_StubWithCallback((CMOCK_fuz_CALLBACK)FuzVerifier);
+  function_a(0, 4);
+
+  baz_StubWithCallback((CMOCK_baz_CALLBACK)BazCallbackPointless);
+  TEST_ASSERT_EQUAL(3, function_c());
+}
+
+
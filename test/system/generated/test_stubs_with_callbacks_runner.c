@@ -0,0 +1,43 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_stubs_with_callbacks_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+extern void test9(void);
+extern void test10(void);
+extern void test11(void);
+extern void test12(void);
+static void CMock_Init(void) { mock_stubs_with_callbacks_mockable_Init(); }
+static void CMock_Verify(void) { mock_stubs_with_callbacks_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_stubs_with_callbacks_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_stubs_with_callbacks.c");
+  run_test(test1, "test1", 46);
+  run_test(test2, "test2", 55);
+  run_test(test3, "test3", 64);
+  run_test(test4, "test4", 72);
+  run_test(test5, "test5", 82);
+  run_test(test6, "test6", 90);
+  run_test(test7, "test7", 97);
+  run_test(test8, "test8", 104);
+  run_test(test9, "test9", 111);
+  run_test(test10, "test10", 118);
+  run_test(test11, "test11", 125);
+  run_test(test12, "test12", 142);
+  return UnityEnd();
+}
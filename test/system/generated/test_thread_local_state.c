@@ -0,0 +1,52 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_thread_local_state_mockable.h"
+#include "thread_local_state.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should link thread-local mocks against a runner with plain ordering counters
+void test1(void)
+{
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(3);
+  copy_value();
+}
+
+// should enforce the order of calls with thread-local mock state
+void test2(void)
+{
+  write_value_Expect(3);
+  read_value_ExpectAndReturn(3);
+  copy_value();
+}
+
+// should verify leftovers in the thread-local registry
+void test3(void)
+{
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(3);
+  write_value_Expect(4);
+  copy_value();
+  CMock_VerifyAll();
+}
+
+// should start the next test with cleared thread-local state
+void test4(void)
+{
+  read_value_IgnoreAndReturn(5);
+  write_value_Expect(5);
+  copy_value();
+  CMock_VerifyAll();
+}
+
+
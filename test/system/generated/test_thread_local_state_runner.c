@@ -0,0 +1,29 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_thread_local_state_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_thread_local_state_mockable_Init(); }
+static void CMock_Verify(void) { mock_thread_local_state_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_thread_local_state_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_thread_local_state.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 26);
+  run_test(test3, "test3", 34);
+  run_test(test4, "test4", 44);
+  return UnityEnd();
+}
@@ -0,0 +1,93 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_thread_local_threads_mockable.h"
+#include "thread_local_threads.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include <pthread.h>
+
+void setUp(void) {}
+void tearDown(void) {}
+
+/* the workers take turns at each barrier, so their expectations are queued and used
+ * interleaved. A failure would longjmp back into the main thread's stack, so the workers
+ * only report what they got and the main thread does the asserting */
+static pthread_barrier_t turns;
+
+typedef struct _WORKER_T
+{
+  int value;
+  int first;
+  int got;
+} WORKER_T;
+
+static void* worker(void* arg)
+{
+  WORKER_T* self = (WORKER_T*)arg;
+  if (self->first)
+  {
+    /* queue first, call last */
+    read_value_ExpectAndReturn(self->value);
+    write_value_Expect(self->value);
+    pthread_barrier_wait(&turns);
+    pthread_barrier_wait(&turns);
+    pthread_barrier_wait(&turns);
+    self->got = copy_value();
+  }
+  else
+  {
+    /* queue second, call first */
+    pthread_barrier_wait(&turns);
+    read_value_ExpectAndReturn(self->value);
+    write_value_Expect(self->value);
+    pthread_barrier_wait(&turns);
+    self->got = copy_value();
+    pthread_barrier_wait(&turns);
+  }
+  CMock_VerifyAll();
+  CMock_DestroyAll();
+  CMock_Guts_MemFreeFinal();
+  return NULL;
+}
+
+static void run_workers(WORKER_T* first, WORKER_T* second)
+{
+  pthread_t threads[2];
+  pthread_barrier_init(&turns, NULL, 2);
+  pthread_create(&threads[0], NULL, worker, first);
+  pthread_create(&threads[1], NULL, worker, second);
+  pthread_join(threads[0], NULL);
+  pthread_join(threads[1], NULL);
+  pthread_barrier_destroy(&turns);
+}
+
+// should keep the expectations and call order of two threads running at once apart
+void test1(void)
+{
+  WORKER_T first = { 10, 1, 0 };
+  WORKER_T second = { 20, 0, 0 };
+  run_workers(&first, &second);
+  TEST_ASSERT_EQUAL(10, first.got);
+  TEST_ASSERT_EQUAL(20, second.got);
+}
+
+// should leave the main thread with nothing queued by the workers
+void test2(void)
+{
+  WORKER_T first = { 1, 1, 0 };
+  WORKER_T second = { 2, 0, 0 };
+  run_workers(&first, &second);
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(3);
+  TEST_ASSERT_EQUAL(3, copy_value());
+  CMock_VerifyAll();
+}
+
+
@@ -0,0 +1,80 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_track_touched_functions_mockable.h"
+#include "track_touched_functions.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+static int stub_read(int calls) { return calls + 40; }
+
+// should verify expectations on the functions a test configured
+void test1(void)
+{
+  read_a_ExpectAndReturn(7);
+  write_b_Expect(7);
+  TEST_ASSERT_EQUAL(7, copy_a_to_b());
+}
+
+// should report an expectation left over on a touched function
+void test2(void)
+{
+  write_a_Expect(1);
+  write_b_Expect(1);
+  write_a_Expect(2);
+  write_both(1);
+}
+
+// should start from a clean slate after a test left expectations behind
+void test3(void)
+{
+  write_a_Expect(3);
+  write_b_Expect(3);
+  write_both(3);
+}
+
+// should still enforce the order of calls across functions
+void test4(void)
+{
+  write_b_Expect(4);
+  write_a_Expect(4);
+  write_both(4);
+}
+
+// should honour ignores and callbacks set up by the test
+void test5(void)
+{
+  read_a_StubWithCallback(stub_read);
+  write_b_Ignore();
+  TEST_ASSERT_EQUAL(40, copy_a_to_b());
+  TEST_ASSERT_EQUAL(41, copy_a_to_b());
+}
+
+// should forget the callback of the previous test
+void test6(void)
+{
+  write_b_Expect(0);
+  copy_a_to_b();
+}
+
+// should forget the ignore of an earlier test
+void test7(void)
+{
+  read_a_ExpectAndReturn(5);
+  copy_a_to_b();
+}
+
+// should fail a call to a function the test never touched
+void test8(void)
+{
+  write_both(6);
+}
+
+
@@ -0,0 +1,37 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_track_touched_functions_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+int GlobalExpectCount;
+int GlobalVerifyOrder;
+static void CMock_Init(void) { GlobalExpectCount = 0; GlobalVerifyOrder = 0; mock_track_touched_functions_mockable_Init(); }
+static void CMock_Verify(void) { mock_track_touched_functions_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_track_touched_functions_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_track_touched_functions.c");
+  run_test(test1, "test1", 19);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 36);
+  run_test(test4, "test4", 44);
+  run_test(test5, "test5", 52);
+  run_test(test6, "test6", 61);
+  run_test(test7, "test7", 68);
+  run_test(test8, "test8", 75);
+  return UnityEnd();
+}
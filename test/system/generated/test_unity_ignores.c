@@ -0,0 +1,104 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_unity_ignores_mockable.h"
+#include "unity_ignores.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should ignore incorrect expects after the TEST_IGNORE call
+void test1(void)
+{
+  TEST_IGNORE();
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(40, function_a(30));
+}
+
+// should ignore missing expects after the TEST_IGNORE call
+void test2(void)
+{
+  TEST_IGNORE();
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(20, function_a(10));
+}
+
+// should ignore extra expects after the TEST_IGNORE call
+void test3(void)
+{
+  TEST_IGNORE();
+  bar_Expect();
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  foo_ExpectAndReturn(10, 20);
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(20, function_a(10));
+}
+
+// should ignore no expects after the TEST_IGNORE call
+void test4(void)
+{
+  TEST_IGNORE();
+  TEST_ASSERT_EQUAL(20, function_a(10));
+}
+
+// should ignore extra expects after the TEST_IGNORE call even if it happens later
+void test5(void)
+{
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  function_a(10);
+  
+  TEST_IGNORE();
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(40, function_a(30));
+}
+
+// should still fail if there are expect problems before the TEST_IGNORE
+void test6(void)
+{
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  function_a(30);
+  
+  TEST_IGNORE();
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(40, function_a(30));
+}
+
+// should still fail if there are missing expect problems before the TEST_IGNORE
+void test7(void)
+{
+  bar_Expect();
+  function_a(10);
+  
+  TEST_IGNORE();
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(40, function_a(30));
+}
+
+// should ignore if extra expects before the TEST_IGNORE because it ignored the rest of the test that might have made calls to it
+void test8(void)
+{
+  bar_Expect();
+  bar_Expect();
+  foo_ExpectAndReturn(10, 20);
+  function_a(10);
+  
+  TEST_IGNORE();
+  foo_ExpectAndReturn(10, 20);
+  TEST_ASSERT_EQUAL(40, function_a(30));
+}
+
+
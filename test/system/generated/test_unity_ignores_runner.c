@@ -0,0 +1,35 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_unity_ignores_mockable.h"
+extern void test1(void);
+extern void test2(void);
+extern void test3(void);
+extern void test4(void);
+extern void test5(void);
+extern void test6(void);
+extern void test7(void);
+extern void test8(void);
+static void CMock_Init(void) { mock_unity_ignores_mockable_Init(); }
+static void CMock_Verify(void) { mock_unity_ignores_mockable_Verify(); }
+static void CMock_Destroy(void) { mock_unity_ignores_mockable_Destroy(); }
+static void run_test(void (*func)(void), const char* name, int line)
+{
+  Unity.CurrentTestName = name; Unity.NumberOfTests++;
+  if (TEST_PROTECT()) { CMock_Init(); UNITY_CLR_DETAILS(); setUp(); func(); }
+  if (TEST_PROTECT()) { tearDown(); CMock_Verify(); }
+  CMock_Destroy();
+  UnityConcludeTest(line);
+}
+int main(void)
+{
+  UnityBegin("test_unity_ignores.c");
+  run_test(test1, "test1", 18);
+  run_test(test2, "test2", 27);
+  run_test(test3, "test3", 35);
+  run_test(test4, "test4", 47);
+  run_test(test5, "test5", 54);
+  run_test(test6, "test6", 67);
+  run_test(test7, "test7", 80);
+  run_test(test8, "test8", 92);
+  return UnityEnd();
+}
@@ -0,0 +1,65 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_unity_void_pointer_compare_mockable.h"
+#include "unity_void_pointer_compare.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should handle passing working expects
+void test1(void)
+{
+  char* a = "Hello";
+  char* b = "Hello";
+  ret_v_ptr_ExpectAndReturn(a);
+  get_v_ptr_Expect(b);
+  get_v_ptr_typedefed_Expect((VOID_PTR)b);
+
+  function_a();
+}
+
+// should handle passing array expects
+void test2(void)
+{
+  char* a = "Hello";
+  char* b = "Hello";
+  ret_v_ptr_ExpectAndReturn(a);
+  get_v_ptr_ExpectWithArray(b,5);
+  get_v_ptr_typedefed_ExpectWithArray((VOID_PTR)b,5);
+
+  function_a();
+}
+
+// should handle failing expects
+void test3(void)
+{
+  char* a = "Hello";
+  char* b = "Jello";
+  ret_v_ptr_ExpectAndReturn(a);
+  get_v_ptr_Expect(b);
+  get_v_ptr_typedefed_Expect((VOID_PTR)b);
+
+  function_a();
+}
+
+// should handle failing array expects
+void test4(void)
+{
+  char* a = "Hello";
+  char* b = "Hella";
+  ret_v_ptr_ExpectAndReturn(a);
+  get_v_ptr_ExpectWithArray(b,5);
+  get_v_ptr_typedefed_ExpectWithArray((VOID_PTR)b,5);
+
+  function_a();
+}
+
+
@@ -0,0 +1,49 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_usage_sources_mockable.h"
+#include "usage_sources.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+static int halve(int value, int calls) { (void)calls; return value / 2; }
+
+// should generate the full API for functions the test references
+void test1(void)
+{
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(3);
+  copy_value();
+}
+
+// should count a callback reference as a use
+void test2(void)
+{
+  read_value_IgnoreAndReturn(8);
+  filter_StubWithCallback(halve);
+  write_value_Expect(4);
+  copy_filtered();
+}
+
+// should still check the arguments of referenced functions
+void test3(void)
+{
+  read_value_ExpectAndReturn(3);
+  write_value_Expect(4);
+  copy_value();
+}
+
+// should fail a call to a function the tests never reference
+void test4(void)
+{
+  notify(1);
+}
+
+
@@ -0,0 +1,88 @@
+#include "unity.h"
+#include "cmock.h"
+#include "mock_wrong_expect_and_return_mockable.h"
+#include "wrong_expect_and_return.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void setUp(void) {}
+void tearDown(void) {}
+
+// should successfully report using Expect instead of ExpectAndReturn with args
+void test1(void)
+{
+  foo_Expect((custom_type)1);
+  bar_ExpectAndReturn(2);
+  function_a(1);
+}
+
+// should successfully report using Expect instead of ExpectAndReturn without args
+void test2(void)
+{
+  foo_ExpectAndReturn((custom_type)1, 4);
+  bar_Expect();
+  function_a(1);
+}
+
+// should successfully report using Expect instead of ExpectAndReturn with varargs
+void test3(void)
+{
+  foo_varargs_Expect((custom_type)3);
+  function_c(3);
+}
+
+// should successfully report using ExpectAndReturn instead of Expect with args
+void test4(void)
+{
+  do_it_Expect();
+  do_another_ExpectAndReturn(2, 2);
+  function_d();
+}
+
+// should successfully report using ExpectAndReturn instead of Expect without args
+void test5(void)
+{
+  do_it_ExpectAndReturn(6);
+  do_another_Expect(2);
+  function_d();
+}
+
+// should successfully report using ExpectAnyArgs instead of ExpectAnyArgsAndReturn
+void test6(void)
+{
+  foo_ExpectAnyArgs();
+  bar_ExpectAndReturn(2);
+  function_a(1);
+}
+
+// should successfully report using ExpectAnyArgsAndReturn instead of ExpectAnyArgs
+void test7(void)
+{
+  do_it_Expect();
+  do_another_ExpectAnyArgsAndReturn(2);
+  function_d();
+}
+
+// should successfully report using Ignore instead of IgnoreAndReturn
+void test8(void)
+{
+  foo_Ignore();
+  bar_IgnoreAndReturn(2);
+  function_a(1);
+}
+
+// should successfully report using IgnoreAndReturn instead of Ignore
+void test9(void)
+{
+  do_it_Ignore();
+  do_another_IgnoreAndReturn(2);
+  function_d();
+}
+
+
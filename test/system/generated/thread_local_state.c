@@ -0,0 +1,17 @@
+#include "thread_local_state_types.h"
+#include "thread_local_state_mockable.h"
+#include "thread_local_state.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(void)
+{
+  write_value(read_value());
+}
+
@@ -0,0 +1,18 @@
+#ifndef _THREAD_LOCAL_STATE_MOCKABLE_H
+#define _THREAD_LOCAL_STATE_MOCKABLE_H
+
+#include "thread_local_state_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(void);
+void write_value(int value);
+
+#endif // _THREAD_LOCAL_STATE_MOCKABLE_H
+
@@ -0,0 +1,19 @@
+#include "thread_local_threads_types.h"
+#include "thread_local_threads_mockable.h"
+#include "thread_local_threads.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int copy_value(void)
+{
+  int value = read_value();
+  write_value(value);
+  return value;
+}
+
@@ -0,0 +1,17 @@
+#ifndef _THREAD_LOCAL_THREADS
+#define _THREAD_LOCAL_THREADS
+
+#include "thread_local_threads_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int copy_value(void);
+
+#endif // _THREAD_LOCAL_THREADS
+
@@ -0,0 +1,18 @@
+#ifndef _THREAD_LOCAL_THREADS_MOCKABLE_H
+#define _THREAD_LOCAL_THREADS_MOCKABLE_H
+
+#include "thread_local_threads_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(void);
+void write_value(int value);
+
+#endif // _THREAD_LOCAL_THREADS_MOCKABLE_H
+
@@ -0,0 +1,24 @@
+#include "track_touched_functions_types.h"
+#include "track_touched_functions_mockable.h"
+#include "track_touched_functions.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int copy_a_to_b(void)
+{
+  int value = read_a();
+  write_b(value);
+  return value;
+}
+void write_both(int value)
+{
+  write_a(value);
+  write_b(value);
+}
+
@@ -0,0 +1,18 @@
+#ifndef _TRACK_TOUCHED_FUNCTIONS
+#define _TRACK_TOUCHED_FUNCTIONS
+
+#include "track_touched_functions_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int copy_a_to_b(void);
+void write_both(int value);
+
+#endif // _TRACK_TOUCHED_FUNCTIONS
+
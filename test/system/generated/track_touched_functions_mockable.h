@@ -0,0 +1,22 @@
+#ifndef _TRACK_TOUCHED_FUNCTIONS_MOCKABLE_H
+#define _TRACK_TOUCHED_FUNCTIONS_MOCKABLE_H
+
+#include "track_touched_functions_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_a(void);
+int read_b(void);
+void write_a(int value);
+void write_b(int value);
+void unused_c(int value);
+void unused_d(int value);
+
+#endif // _TRACK_TOUCHED_FUNCTIONS_MOCKABLE_H
+
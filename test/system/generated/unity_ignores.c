@@ -0,0 +1,23 @@
+#include "unity_ignores_types.h"
+#include "unity_ignores_mockable.h"
+#include "unity_ignores.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a)    
+{
+  bar();
+  return foo((UINT32)a);
+}    
+
+void function_b(void) 
+{
+  bar();
+}
+
@@ -0,0 +1,18 @@
+#ifndef _UNITY_IGNORES
+#define _UNITY_IGNORES
+
+#include "unity_ignores_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a);
+void function_b(void);
+
+#endif // _UNITY_IGNORES
+
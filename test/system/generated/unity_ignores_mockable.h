@@ -0,0 +1,18 @@
+#ifndef _UNITY_IGNORES_MOCKABLE_H
+#define _UNITY_IGNORES_MOCKABLE_H
+
+#include "unity_ignores_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 foo(UINT32 a);
+void bar(void);
+
+#endif // _UNITY_IGNORES_MOCKABLE_H
+
@@ -0,0 +1,16 @@
+#ifndef _UNITY_IGNORES_TYPES_H
+#define _UNITY_IGNORES_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#define UINT32 unsigned int
+
+#endif // _UNITY_IGNORES_TYPES_H
+
@@ -0,0 +1,18 @@
+#include "unity_void_pointer_compare_types.h"
+#include "unity_void_pointer_compare_mockable.h"
+#include "unity_void_pointer_compare.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void) {
+  void* stuff = ret_v_ptr();
+  get_v_ptr(stuff);
+  get_v_ptr_typedefed((VOID_PTR)stuff);
+}
+
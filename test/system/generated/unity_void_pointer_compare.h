@@ -0,0 +1,17 @@
+#ifndef _UNITY_VOID_POINTER_COMPARE
+#define _UNITY_VOID_POINTER_COMPARE
+
+#include "unity_void_pointer_compare_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void function_a(void);
+
+#endif // _UNITY_VOID_POINTER_COMPARE
+
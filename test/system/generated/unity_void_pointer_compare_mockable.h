@@ -0,0 +1,19 @@
+#ifndef _UNITY_VOID_POINTER_COMPARE_MOCKABLE_H
+#define _UNITY_VOID_POINTER_COMPARE_MOCKABLE_H
+
+#include "unity_void_pointer_compare_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void* ret_v_ptr(void);
+void get_v_ptr(void* ptr);
+void get_v_ptr_typedefed(VOID_PTR ptr);
+
+#endif // _UNITY_VOID_POINTER_COMPARE_MOCKABLE_H
+
@@ -0,0 +1,17 @@
+#ifndef _UNITY_VOID_POINTER_COMPARE_TYPES_H
+#define _UNITY_VOID_POINTER_COMPARE_TYPES_H
+
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+#include "unity_internals.h"
+typedef void* VOID_PTR;
+
+#endif // _UNITY_VOID_POINTER_COMPARE_TYPES_H
+
@@ -0,0 +1,25 @@
+#include "usage_sources_types.h"
+#include "usage_sources_mockable.h"
+#include "usage_sources.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(void)
+{
+  write_value(read_value());
+}
+void copy_filtered(void)
+{
+  write_value(filter(read_value()));
+}
+void notify(int value)
+{
+  unreferenced(value);
+}
+
@@ -0,0 +1,19 @@
+#ifndef _USAGE_SOURCES
+#define _USAGE_SOURCES
+
+#include "usage_sources_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+void copy_value(void);
+void copy_filtered(void);
+void notify(int value);
+
+#endif // _USAGE_SOURCES
+
@@ -0,0 +1,20 @@
+#ifndef _USAGE_SOURCES_MOCKABLE_H
+#define _USAGE_SOURCES_MOCKABLE_H
+
+#include "usage_sources_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+int read_value(void);
+void write_value(int value);
+int filter(int value);
+void unreferenced(int value);
+
+#endif // _USAGE_SOURCES_MOCKABLE_H
+
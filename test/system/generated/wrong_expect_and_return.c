@@ -0,0 +1,30 @@
+#include "wrong_expect_and_return_types.h"
+#include "wrong_expect_and_return_mockable.h"
+#include "wrong_expect_and_return.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a)
+{
+  return foo((custom_type)a) + bar();
+}
+
+void function_b(void) { }
+
+UINT32 function_c(int a)
+{
+  return foo_varargs((custom_type)a, "ignored", 5);
+}
+
+void function_d(void)
+{
+  do_it();
+  do_another(2);
+}
+
@@ -0,0 +1,20 @@
+#ifndef _WRONG_EXPECT_AND_RETURN
+#define _WRONG_EXPECT_AND_RETURN
+
+#include "wrong_expect_and_return_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 function_a(int a);
+void function_b(void);
+UINT32 function_c(int a);
+void function_d(void);
+
+#endif // _WRONG_EXPECT_AND_RETURN
+
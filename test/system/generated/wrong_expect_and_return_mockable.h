@@ -0,0 +1,21 @@
+#ifndef _WRONG_EXPECT_AND_RETURN_MOCKABLE_H
+#define _WRONG_EXPECT_AND_RETURN_MOCKABLE_H
+
+#include "wrong_expect_and_return_types.h"
+
+#if defined(__GNUC__) && !defined(__ICC)
+#if !defined(__clang__)
+#pragma GCC diagnostic ignored "-Wpragmas"
+#endif
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+#pragma GCC diagnostic ignored "-Wduplicate-decl-specifier"
+#endif
+
+UINT32 foo(custom_type a);
+UINT32 bar(void);
+UINT32 foo_varargs(custom_type a, ...);
+void do_it(void);
+void do_another(int i);
+
+#endif // _WRONG_EXPECT_AND_RETURN_MOCKABLE_H
+
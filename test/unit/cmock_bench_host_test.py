@@ -0,0 +1,114 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import re
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BENCH_HOST = os.path.join(ROOT, 'benchmarks', 'bench_host.py')
+UNITY = os.path.join(ROOT, 'vendor', 'unity')
+CC = os.getenv('CC', 'gcc')
+
+COMBINATIONS = ['array_smart', 'callback', 'expect', 'ignore_return_thru_ptr']
+COMMON_METRICS = ['destroy', 'expect_call', 'expect_setup', 'pointer_call', 'pointer_setup', 'verify']
+PLUGIN_METRICS = {
+    'expect': [],
+    'ignore_return_thru_ptr': ['ignore_call', 'return_thru_ptr_call'],
+    'array_smart': ['array_call', 'array_setup'],
+    'callback': ['callback_call'],
+}
+
+
+@unittest.skipUnless(os.path.exists(os.path.join(UNITY, 'src', 'unity.c')) and shutil.which(CC),
+                     "needs the Unity sources in vendor/unity and a host compiler")
+class BenchHostTest(unittest.TestCase):
+    """
+    bench_host.py builds and runs the generated mocks of each plugin combination, and
+    reports compile times, object sizes and the cost per expectation.
+    """
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp(prefix='cmock_bench_host_')
+        self.json = os.path.join(self.work, 'host.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.work)
+
+    def run_bench(self, *args, check=True):
+        return subprocess.run([sys.executable, BENCH_HOST, '--functions', '3', '--counts', '2,4', '--cflags=-O0', *args],
+                              check=check, capture_output=True, text=True)
+
+    def read_json(self, *args):
+        self.run_bench('--json', self.json, *args)
+        with open(self.json) as f:
+            return json.load(f)
+
+    def kept_path(self, output):
+        kept = re.search(r'^sources kept in (.+)$', output, re.M).group(1)
+        self.addCleanup(shutil.rmtree, kept)
+        return kept
+
+    def test_json_reports_every_combination(self):
+        results = self.read_json()
+        self.assertEqual(COMBINATIONS, sorted(results))
+        for name, result in results.items():
+            self.assertEqual(['compile_seconds', 'object_bytes', 'runtime_ns'], sorted(result))
+            self.assertEqual(['Mockbench_api.c', 'Mockbench_synthetic.c'], sorted(result['compile_seconds']))
+            self.assertEqual(['Mockbench_api.c', 'Mockbench_synthetic.c'], sorted(result['object_bytes']))
+            self.assertTrue(all(size > 0 for size in result['object_bytes'].values()))
+            self.assertEqual(sorted(COMMON_METRICS + PLUGIN_METRICS[name]), sorted(result['runtime_ns']), name)
+            for by_count in result['runtime_ns'].values():
+                self.assertEqual(['2', '4'], sorted(by_count))
+
+    def test_only_runs_the_chosen_combinations_and_prints_them(self):
+        output = self.run_bench('--only', 'callback', '--only', 'expect', '--json', self.json).stdout
+        with open(self.json) as f:
+            self.assertEqual(['callback', 'expect'], sorted(json.load(f)))
+        self.assertRegex(output, re.compile(r"^callback\n  compile Mockbench_api\.c +[\d.]+ ms +\d+ bytes$", re.M))
+        self.assertRegex(output, r"  callback_call +n=2: [\d.]+ ns  n=4: [\d.]+ ns")
+        self.assertNotIn('array_smart', output)
+
+    def test_keep_leaves_the_sources_and_functions_sizes_the_synthetic_header(self):
+        kept = self.kept_path(self.run_bench('--only', 'expect', '--keep', '--functions', '7').stdout)
+        for name in ['Mockbench_api.c', 'Mockbench_synthetic.c', 'bench_driver.c', 'bench_driver']:
+            self.assertTrue(os.path.exists(os.path.join(kept, 'expect', name)), name)
+        with open(os.path.join(kept, 'bench_synthetic.h')) as f:
+            self.assertEqual(7, len(re.findall(r'\bbench_synthetic_Function\d+\(', f.read())))
+
+    def test_sources_are_removed_without_keep(self):
+        before = set(os.listdir(tempfile.gettempdir()))
+        output = self.run_bench('--only', 'expect').stdout
+        self.assertNotIn('sources kept in', output)
+        self.assertEqual([], [name for name in set(os.listdir(tempfile.gettempdir())) - before if name.startswith('cmock_bench_')])
+
+    def test_cc_and_cflags_are_used_for_every_object(self):
+        log = os.path.join(self.work, 'cc.log')
+        wrapper = os.path.join(self.work, 'cc')
+        with open(wrapper, 'w') as f:
+            f.write(f"#!/bin/sh\necho \"$@\" >> {log}\nexec {CC} \"$@\"\n")
+        os.chmod(wrapper, 0o755)
+        self.run_bench('--only', 'expect', '--cc', wrapper, '--cflags=-O1 -DBENCH_TEST_FLAG')
+        with open(log) as f:
+            compiles = [line for line in f.read().splitlines() if ' -c ' in line]
+        self.assertEqual(['Mockbench_api.c', 'Mockbench_synthetic.c', 'bench_driver.c', 'cmock.c', 'unity.c'],
+                         sorted(os.path.basename(line.split(' -c ')[1].split()[0]) for line in compiles))
+        self.assertTrue(all(line.startswith('-O1 -DBENCH_TEST_FLAG ') for line in compiles))
+
+    def test_unity_has_to_be_found(self):
+        result = self.run_bench('--unity', os.path.join(self.work, 'missing'), check=False)
+        self.assertNotEqual(0, result.returncode)
+        self.assertIn(f"ERROR: no Unity sources found in {os.path.join(self.work, 'missing')}", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import re
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BENCHMARKS = os.path.join(ROOT, 'benchmarks')
+sys.path.insert(0, BENCHMARKS)
+
+from bench_pipeline import compare
+from synthetic_header import SyntheticHeader
+
+
+class SyntheticHeaderTest(unittest.TestCase):
+    """
+    synthetic_header.py gives the same header for the same seed and settings, shaped by them.
+    """
+
+    def run_script(self, *args):
+        return subprocess.run([sys.executable, os.path.join(BENCHMARKS, 'synthetic_header.py'), *args],
+                              check=True, capture_output=True, text=True).stdout
+
+    def test_same_seed_gives_the_same_header(self):
+        self.assertEqual(self.run_script('--seed', '7'), self.run_script('--seed', '7'))
+        self.assertNotEqual(self.run_script('--seed', '7'), self.run_script('--seed', '8'))
+
+    def test_script_matches_the_class(self):
+        self.assertEqual(SyntheticHeader(seed=3, functions=20).generate('Named'),
+                         self.run_script('--seed', '3', '--functions', '20', '--name', 'Named'))
+
+    def test_functions_and_arguments(self):
+        header = SyntheticHeader(functions=25, args=0, comments=0.0).generate()
+        self.assertEqual(25, len(re.findall(r'^\w+ Synthetic_Function\d+\(void\);$', header, re.M)))
+        header = SyntheticHeader(functions=25, args=3).generate()
+        self.assertTrue(all(line.count(',') <= 2 for line in header.splitlines() if 'Function' in line))
+
+    def test_pointers_arrays_and_function_pointers(self):
+        header = SyntheticHeader(functions=40, args=6, pointers=1.0, arrays=0.0, func_ptrs=0.0).generate()
+        args = re.findall(r'\w+\* arg\d+', header)
+        self.assertTrue(args)
+        self.assertEqual(len(args), len(re.findall(r'arg\d+', header)))
+        header = SyntheticHeader(functions=40, args=6, pointers=0.0, arrays=1.0, func_ptrs=0.0).generate()
+        self.assertEqual(len(re.findall(r'arg\d+\[\d+\]', header)), len(re.findall(r'arg\d+', header)))
+        header = SyntheticHeader(functions=40, args=6, pointers=0.0, arrays=0.0, func_ptrs=1.0).generate()
+        self.assertEqual(len(re.findall(r'void \(\*arg\d+\)\(int, void\*\)', header)), len(re.findall(r'arg\d+', header)))
+
+    def test_inlines_and_nesting(self):
+        header = SyntheticHeader(functions=10, inlines=1.0, nesting=3).generate()
+        self.assertEqual(10, header.count('static inline '))
+        self.assertIn('volatile int cmock_local0', header)
+        self.assertIn('      if (cmock_local1 > 0) {', header)
+        self.assertNotIn('static inline', SyntheticHeader(functions=10, inlines=0.0).generate())
+
+    def test_comment_density(self):
+        self.assertNotIn('//', SyntheticHeader(functions=50, comments=0.0).generate())
+        self.assertNotIn('/**', SyntheticHeader(functions=50, comments=0.0).generate())
+        header = SyntheticHeader(functions=50, comments=1.0, structs=0).generate()
+        self.assertEqual(50, header.count('// ') + header.count('/**'))
+
+
+class BenchPipelineTest(unittest.TestCase):
+    """
+    bench_pipeline.py times every stage of a corpus, stores baselines and flags regressions.
+    """
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp(prefix='cmock_bench_pipeline_')
+        self.baseline = os.path.join(self.work, 'baseline.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.work)
+
+    def run_bench(self, *args, check=True):
+        return subprocess.run([sys.executable, os.path.join(BENCHMARKS, 'bench_pipeline.py'), '--repeat', '1',
+                               '--baseline', self.baseline, *args], check=check, capture_output=True, text=True)
+
+    def read_baseline(self):
+        with open(self.baseline) as f:
+            return json.load(f)
+
+    def write_baseline(self, baseline):
+        with open(self.baseline, 'w') as f:
+            json.dump(baseline, f)
+
+    def test_save_baseline_stores_every_stage_of_the_chosen_corpora(self):
+        output = self.run_bench('--only', 'synthetic_small', '--only', 'parsing', '--save-baseline').stdout
+        self.assertIn(f"baseline written to {self.baseline}", output)
+        baseline = self.read_baseline()
+        self.assertEqual(['parsing', 'synthetic_small'], sorted(baseline))
+        for result in baseline.values():
+            self.assertEqual(['peak_bytes', 'stages'], sorted(result))
+            self.assertGreater(result['peak_bytes'], 0)
+            for stage in ['total', 'parse', 'import_source', 'parse_declaration', 'generate', 'create_file',
+                          'Expect.mock_implementation', 'Ignore.mock_interfaces', 'Cexception.mock_implementation']:
+                self.assertIn(stage, result['stages'])
+            self.assertGreaterEqual(result['stages']['total'], result['stages']['parse'])
+        self.assertRegex(output, r"synthetic_small  \(peak \d+ KiB\)\n  total +[\d.]+ ms")
+
+    def test_without_a_baseline_it_says_how_to_make_one(self):
+        result = self.run_bench('--only', 'synthetic_small')
+        self.assertIn(f"no baseline at {self.baseline}, run with --save-baseline to create one", result.stdout)
+        self.assertFalse(os.path.exists(self.baseline))
+
+    def test_a_slower_run_than_the_baseline_fails(self):
+        self.write_baseline({'synthetic_small': {'stages': {'total': 1e-6, 'parse': 1e-6}, 'peak_bytes': 1}})
+        result = self.run_bench('--only', 'synthetic_small', check=False)
+        self.assertEqual(1, result.returncode)
+        self.assertRegex(result.stdout, r"REGRESSION synthetic_small total: 0\.00 ms -> [\d.]+ ms")
+        self.assertRegex(result.stdout, r"REGRESSION synthetic_small parse: ")
+        self.assertRegex(result.stdout, r"REGRESSION synthetic_small peak memory: 1 -> \d+ bytes")
+
+    def test_a_run_within_the_thresholds_passes(self):
+        self.write_baseline({'synthetic_small': {'stages': {'total': 1e-6}, 'peak_bytes': 1}})
+        result = self.run_bench('--only', 'synthetic_small', '--threshold', '1e9', '--min-ms', '1e6', check=False)
+        self.assertEqual(0, result.returncode)
+        self.assertNotIn('REGRESSION', result.stdout)
+
+    def test_compare_needs_both_thresholds_to_flag_a_stage(self):
+        baseline = {'corpus': {'stages': {'parse': 0.010}, 'peak_bytes': 1000}}
+        slower = {'corpus': {'stages': {'parse': 0.020}, 'peak_bytes': 1000}}
+        self.assertEqual(['corpus parse: 10.00 ms -> 20.00 ms'], compare(slower, baseline, 0.15, 0.001))
+        # relatively slower, but by less than min_seconds
+        self.assertEqual([], compare(slower, baseline, 0.15, 0.05))
+        # more than min_seconds slower, but within the relative threshold
+        self.assertEqual([], compare(slower, baseline, 1.5, 0.001))
+
+    def test_compare_flags_peak_memory_by_the_relative_threshold(self):
+        baseline = {'corpus': {'stages': {}, 'peak_bytes': 1000}}
+        self.assertEqual(['corpus peak memory: 1000 -> 1200 bytes'],
+                         compare({'corpus': {'stages': {}, 'peak_bytes': 1200}}, baseline, 0.15, 0.001))
+        self.assertEqual([], compare({'corpus': {'stages': {}, 'peak_bytes': 1100}}, baseline, 0.15, 0.001))
+
+    def test_compare_skips_what_the_baseline_does_not_know(self):
+        results = {'new_corpus': {'stages': {'parse': 1.0}, 'peak_bytes': 10 ** 9},
+                   'corpus': {'stages': {'new_stage': 1.0}, 'peak_bytes': 10}}
+        self.assertEqual([], compare(results, {'corpus': {'stages': {}, 'peak_bytes': 10}}, 0.15, 0.001))
+
+
+if __name__ == '__main__':
+    unittest.main()
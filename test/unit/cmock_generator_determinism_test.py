@@ -0,0 +1,100 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEADER = """
+typedef void MY_VOID;
+typedef void OTHER_VOID;
+typedef struct { int a; } custom_t;
+int __stdcall conv_stdcall(int a, custom_t b);
+short __cdecl conv_cdecl(unsigned char* buf, int len);
+MY_VOID __fastcall conv_fastcall(VOID_A a);
+long attributed(const char* name, size_t count);
+OTHER_VOID no_args(void);
+"""
+
+VOID_HEADER = """
+typedef void X;
+X reset(void);
+"""
+
+ALIAS_HEADER = """
+X get_value(void);
+int count(X* item);
+"""
+
+HELPER = """
+#define UNITY_TEST_ASSERT_EQUAL_custom_t(e, a, l, m) UNITY_TEST_ASSERT_EQUAL_MEMORY(&e, &a, sizeof(e), l, m)
+"""
+
+CONFIG = """:cmock:
+  :mock_path: mocks
+  :plugins: [ignore, callback, expect_any_args, array, return_thru_ptr, ignore_arg]
+  :c_calling_conventions: [__stdcall, __cdecl, __fastcall, __vectorcall, __thiscall]
+  :attributes: [__ramfunc, __irq, __fiq, register, extern, __packed]
+  :treat_as_void: [VOID_A, VOID_B, VOID_C, VOID_D]
+  :array_size_type: [size_t, uint16_t, uint32_t, unsigned]
+  :treat_as: {uint8: HEX8, uint16: HEX16, uint32: UINT32, int8: INT8, bool: UINT8}
+  :includes_c_post_header: [post_a.h, post_b.h, post_c.h, post_d.h]
+  :unity_helper_path: [helper_a.h, helper_b.h, helper_c.h]
+"""
+
+HASH_SEEDS = ['0', '1', '42', '4242']
+
+
+class CMockGeneratorDeterminismTest(unittest.TestCase):
+    """
+    Byte-identical inputs have to give byte-identical mocks, whatever the hash seed,
+    or compiler caches keyed on the sources miss for nothing.
+    """
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp(prefix='cmock_determinism_')
+        files = {'determinism.h': HEADER, 'void.h': VOID_HEADER, 'alias.h': ALIAS_HEADER, 'config.yml': CONFIG,
+                 'helper_a.h': HELPER, 'helper_b.h': HELPER, 'helper_c.h': HELPER}
+        for name, content in files.items():
+            with open(os.path.join(self.work, name), 'w') as f:
+                f.write(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.work)
+
+    def generate(self, seed, headers=('determinism.h',)):
+        mock_path = os.path.join(self.work, 'mocks')
+        shutil.rmtree(mock_path, ignore_errors=True)
+        subprocess.run([sys.executable, os.path.join(ROOT, 'lib', 'cmock.py'), '-oconfig.yml', *headers],
+                       cwd=self.work, env={**os.environ, 'PYTHONHASHSEED': seed}, check=True, capture_output=True)
+        mocks = {}
+        for name in sorted(os.listdir(mock_path)):
+            with open(os.path.join(mock_path, name), 'rb') as f:
+                mocks[name] = f.read()
+        return mocks
+
+    def test_mocks_are_identical_for_different_hash_seeds(self):
+        expected = self.generate(HASH_SEEDS[0])
+        self.assertEqual(['Mockdeterminism.c', 'Mockdeterminism.h'], sorted(expected))
+        for seed in HASH_SEEDS[1:]:
+            self.assertEqual(expected, self.generate(seed), f"PYTHONHASHSEED={seed} changed the generated mocks")
+
+    def test_mocks_do_not_depend_on_headers_parsed_before_them(self):
+        alone = self.generate(HASH_SEEDS[0], ['alias.h'])
+        batched = self.generate(HASH_SEEDS[0], ['void.h', 'alias.h'])
+        self.assertEqual(['Mockalias.c', 'Mockalias.h', 'Mockvoid.c', 'Mockvoid.h'], sorted(batched))
+        for name in ['Mockalias.c', 'Mockalias.h']:
+            self.assertEqual(alone[name], batched[name], f"typedef void X in void.h changed {name}")
+
+
+if __name__ == '__main__':
+    unittest.main()
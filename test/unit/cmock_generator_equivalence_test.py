@@ -0,0 +1,136 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from cmock import CMock, CMockBatch
+
+COMPILATION_HEADERS = os.path.join(ROOT, 'test', 'system', 'test_compilation')
+
+# functions of the same shape under different names, a few odd ones in between, and
+# argument names which are also words of a type
+HEADER = """
+typedef struct { int a; char b[4]; } shape_t;
+typedef int (*handler_t)(int, const char*);
+int read_a(int channel);
+int read_b(int channel);
+int read_c(int port);
+void write_a(int channel, const unsigned char* data, unsigned short length);
+void write_b(int channel, const unsigned char* data, unsigned short length);
+shape_t* find_a(const shape_t* key, int count);
+shape_t* find_b(const shape_t* key, int count);
+const char* name_of(shape_t shape);
+void store(int values[8], size_t count);
+void hook(handler_t handler, int (*other)(void));
+int sum(int first, ...);
+void nothing(void);
+unsigned long long wide(signed char a, volatile int* b);
+struct point { int x; int y; };
+typedef int count;
+void move_to(struct point* point);
+void move_by(struct point* p);
+void set_count(count count);
+void add_count(count c);
+"""
+
+BASE_OPTIONS = {
+    ':plugins': ['ignore', 'callback', 'expect_any_args', 'array', 'return_thru_ptr', 'ignore_arg'],
+    ':treat_as_void': ['OSEK_TASK', 'VOID_TYPE_CRAZINESS'],
+    ':treat_inlines': ':include',
+    ':verbosity': 1,
+}
+
+
+class CMockGeneratorEquivalenceTest(unittest.TestCase):
+    """
+    Options which only make the generation faster or leaner have to give the same mocks,
+    byte for byte, as generating them without those options.
+    """
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp(prefix='cmock_equivalence_')
+        self.headers = [os.path.join(self.work, 'equivalence.h')]
+        with open(self.headers[0], 'w') as f:
+            f.write(HEADER)
+        for name in ['callingconv.h', 'const.h', 'inline.h', 'osek.h', 'parsing.h']:
+            self.headers.append(os.path.join(COMPILATION_HEADERS, name))
+
+    def tearDown(self):
+        shutil.rmtree(self.work)
+
+    def read_mocks(self, mock_path):
+        mocks = {}
+        for name in sorted(os.listdir(mock_path)):
+            with open(os.path.join(mock_path, name), 'rb') as f:
+                mocks[name] = f.read()
+        return mocks
+
+    def generate(self, name, options, headers=None):
+        mock_path = os.path.join(self.work, name)
+        CMock({**BASE_OPTIONS, **options, ':mock_path': mock_path}).setup_mocks(headers or self.headers)
+        return self.read_mocks(mock_path)
+
+    def assert_same_mocks(self, options, base_options=None):
+        expected = self.generate('default', base_options or {})
+        self.assertIn('Mockequivalence.c', expected)
+        actual = self.generate('optimized', {**(base_options or {}), **options})
+        self.assertEqual(sorted(expected), sorted(actual))
+        for name in expected:
+            self.assertEqual(expected[name], actual[name], f"{options} changed {name}")
+
+    def test_render_cache_gives_the_same_mocks(self):
+        self.assert_same_mocks({':render_cache': True})
+
+    def test_streaming_gives_the_same_mocks(self):
+        # streaming needs inline functions to be left out
+        self.assert_same_mocks({':streaming': True}, {':treat_inlines': ':exclude'})
+
+    def test_render_workers_give_the_same_mocks(self):
+        self.assert_same_mocks({':render_workers': 2, ':render_workers_threshold': 1})
+
+    def test_closing_cmock_shuts_the_render_workers_down(self):
+        options = {**BASE_OPTIONS, ':render_workers': 2, ':render_workers_threshold': 1, ':mock_path': self.work}
+        with CMock(options) as cmock:
+            cmock.generate_mock(self.headers[0], None)
+            self.assertIsNotNone(cmock.cm_generator.render_pool.executor)
+        self.assertIsNone(cmock.cm_generator.render_pool.executor)
+
+    def test_batch_targets_get_the_same_mocks_as_separate_runs(self):
+        # the first two targets share a parse, the third parses with its own options
+        targets = [{}, {':plugins': ['ignore'], ':mock_prefix': 'Fake'}, {':treat_as_void': ['OSEK_TASK'], ':treat_externs': ':include'}]
+        CMockBatch([({**BASE_OPTIONS, **options}, os.path.join(self.work, f'batch{index}'))
+                    for index, options in enumerate(targets)]).setup_mocks(self.headers)
+        for index, options in enumerate(targets):
+            expected = self.generate(f'single{index}', options)
+            actual = self.read_mocks(os.path.join(self.work, f'batch{index}'))
+            self.assertEqual(expected, actual, f"batch target {options} differs from a separate run")
+
+    def test_incremental_parse_gives_the_same_mocks(self):
+        self.assert_same_mocks({':incremental_parse': True})
+
+    def test_incremental_parse_of_an_edited_header_gives_the_same_mocks(self):
+        edited = HEADER.replace('int read_c(int port);', 'long read_c(int port, int (*ready)(void));')
+        edited = edited.replace('void nothing(void);', 'void added(handler_t handler);')
+        header = [self.headers[0]]
+        options = {**BASE_OPTIONS, ':incremental_parse': True, ':mock_path': os.path.join(self.work, 'incremental')}
+        with CMock(options) as cmock:
+            cmock.setup_mocks(header)
+            with open(header[0], 'w') as f:
+                f.write(edited)
+            cmock.setup_mocks(header)
+        self.assertEqual(self.generate('full', {}, header), self.read_mocks(options[':mock_path']))
+
+
+if __name__ == '__main__':
+    unittest.main()
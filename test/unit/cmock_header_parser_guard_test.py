@@ -0,0 +1,95 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(ROOT, 'lib'))
+
+from cmock_config import CMockConfig
+from cmock_header_parser import CMockHeaderParser
+
+HEADER = """
+typedef struct { int a; char b[4]; } shape_t;
+typedef int (*handler_t)(int, const char*);
+int read_a(int channel);
+void write_a(int channel, const unsigned char* data, unsigned short length);
+shape_t* find_a(const shape_t* key, int count);
+void hook(handler_t handler, int (*other)(void));
+int sum(int first, ...);
+unsigned long long wide(signed char a, volatile int* b);
+"""
+
+# without the guard, every line start rescans the rest of this run, which takes minutes
+WORD_RUN = "word\n" * 20000 + ";\n"
+
+LONG_DECLARATION = "int huge(" + ", ".join(f"int arg{index}" for index in range(1000)) + ");\n"
+
+UNPARSEABLE = "int (*(get_paren)(void))(int);\n"
+
+
+class CMockHeaderParserGuardTest(unittest.TestCase):
+    """
+    With :parse_guard, statements which are too long or can't be parsed are skipped with a
+    warning, and everything else parses just like without it.
+    """
+
+    def parse(self, source, **options):
+        parser = CMockHeaderParser(CMockConfig({':parse_guard': True, ':verbosity': 1, **options}))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            parsed = parser.parse('guarded', source)
+        return [function['name'] for function in parsed['functions']], output.getvalue()
+
+    def test_well_formed_prototypes_parse_the_same_as_without_the_guard(self):
+        expected = CMockHeaderParser(CMockConfig({':verbosity': 1})).parse('guarded', HEADER)['functions']
+        parser = CMockHeaderParser(CMockConfig({':parse_guard': True, ':verbosity': 1}))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            actual = parser.parse('guarded', HEADER)['functions']
+        self.assertEqual(expected, actual)
+        self.assertEqual('', output.getvalue())
+
+    def test_a_long_run_of_words_is_cut_out_before_the_stages_run(self):
+        names, output = self.parse(HEADER + WORD_RUN + "int after(int a);\n")
+        self.assertEqual(['read_a', 'write_a', 'find_a', 'hook', 'sum', 'wide', 'after'], names)
+        self.assertRegex(output, r"WARNING: Skipped \d{6} character statement in 'import' at guarded:\?: 'word word ")
+        self.assertEqual(1, output.count('WARNING'))
+
+    def test_a_long_declaration_is_skipped_with_a_warning(self):
+        names, output = self.parse(LONG_DECLARATION + HEADER)
+        self.assertNotIn('huge', names)
+        self.assertIn('read_a', names)
+        self.assertIn("WARNING: Skipped", output)
+        self.assertIn("'int huge(int arg0, int arg1", output)
+
+    def test_a_longer_limit_lets_the_long_declaration_through(self):
+        names, output = self.parse(LONG_DECLARATION + HEADER, **{':parse_max_statement_length': 20000})
+        self.assertIn('huge', names)
+        self.assertEqual('', output)
+
+    def test_a_declaration_which_can_not_be_parsed_is_skipped_with_a_warning(self):
+        names, output = self.parse(UNPARSEABLE + HEADER)
+        self.assertEqual(['read_a', 'write_a', 'find_a', 'hook', 'sum', 'wide'], names)
+        self.assertIn("WARNING: Skipped declaration which could not be parsed", output)
+
+    def test_skips_are_silent_when_ignored(self):
+        names, output = self.parse(LONG_DECLARATION + WORD_RUN + HEADER, **{':when_parse_budget_exceeded': ':ignore'})
+        self.assertNotIn('huge', names)
+        self.assertEqual('', output)
+
+    def test_skips_stop_the_generation_on_error(self):
+        with self.assertRaisesRegex(Exception, r"ERROR: Skipped \d{6} character statement in 'import'"):
+            self.parse(WORD_RUN + HEADER, **{':when_parse_budget_exceeded': ':error'})
+
+
+if __name__ == '__main__':
+    unittest.main()
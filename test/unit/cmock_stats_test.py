@@ -0,0 +1,144 @@
+# =========================================================================
+#   pyCMock - Automatic Mock Generation for C
+#
+#   Copyright (c) 2025 Christian Renzel
+#   SPDX-License-Identifier: MIT
+# =========================================================================
+
+import os
+import sys
+import json
+import pstats
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIRST_HEADER = """
+int read_a(int channel);
+void reset(void);
+char* name_of(const char* prefix, int index);
+"""
+
+SECOND_HEADER = """
+int status(void);
+void store(int* value);
+"""
+
+CONFIG = """:cmock:
+  :mock_path: mocks
+  :plugins: [ignore, array]
+"""
+
+OTHER_CONFIG = """:cmock:
+  :mock_path: other
+  :plugins: [ignore]
+"""
+
+HEADERS = ['first.h', 'second.h']
+
+
+class CMockStatsTest(unittest.TestCase):
+    """
+    --stats, --stats-json and --profile report what a run of cmock.py did.
+    """
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp(prefix='cmock_stats_')
+        files = {'first.h': FIRST_HEADER, 'second.h': SECOND_HEADER, 'config.yml': CONFIG, 'other.yml': OTHER_CONFIG}
+        for name, content in files.items():
+            with open(os.path.join(self.work, name), 'w') as f:
+                f.write(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.work)
+
+    def run_cmock(self, *args):
+        return subprocess.run([sys.executable, os.path.join(ROOT, 'lib', 'cmock.py'), *args],
+                              cwd=self.work, check=True, capture_output=True, text=True).stdout
+
+    def read_json(self, *args):
+        self.run_cmock('-oconfig.yml', '--stats-json', 'stats.json', *args)
+        with open(os.path.join(self.work, 'stats.json')) as f:
+            return json.load(f)
+
+    def mock_size(self, mock_path, name):
+        return sum(os.path.getsize(os.path.join(self.work, mock_path, f"Mock{name}.{ext}")) for ext in ['c', 'h'])
+
+    def test_json_has_totals_files_and_stages(self):
+        stats = self.read_json(*HEADERS)
+        self.assertEqual(['files', 'stages', 'totals'], sorted(stats))
+        self.assertEqual(['bytes_written', 'files_rewritten', 'files_written', 'functions', 'headers', 'seconds'],
+                         sorted(stats['totals']))
+        self.assertEqual(HEADERS, sorted(stats['files']))
+        for entry in stats['files'].values():
+            self.assertEqual(['bytes_written', 'files_rewritten', 'files_written', 'functions', 'generate_seconds', 'parse_seconds'],
+                             sorted(entry))
+        for entry in stats['stages'].values():
+            self.assertEqual(['calls', 'seconds'], sorted(entry))
+
+    def test_json_counts_functions_files_and_bytes_of_each_header(self):
+        stats = self.read_json(*HEADERS)
+        for name, functions in [('first', 3), ('second', 2)]:
+            entry = stats['files'][f"{name}.h"]
+            self.assertEqual(functions, entry['functions'])
+            self.assertEqual(2, entry['files_written'])
+            self.assertEqual(2, entry['files_rewritten'])
+            self.assertEqual(self.mock_size('mocks', name), entry['bytes_written'])
+        totals = stats['totals']
+        self.assertEqual(2, totals['headers'])
+        self.assertEqual(5, totals['functions'])
+        self.assertEqual(4, totals['files_written'])
+        self.assertEqual(self.mock_size('mocks', 'first') + self.mock_size('mocks', 'second'), totals['bytes_written'])
+
+    def test_json_counts_the_calls_of_each_stage(self):
+        stages = self.read_json(*HEADERS)['stages']
+        self.assertEqual(2, stages['parse']['calls'])
+        self.assertEqual(2, stages['generate']['calls'])
+        self.assertEqual(4, stages['write.render']['calls'])
+        # each plugin hook is counted once for every function it is asked about
+        self.assertEqual(5, stages['plugin.Expect.mock_implementation']['calls'])
+        self.assertEqual(5, stages['plugin.Ignore.mock_interfaces']['calls'])
+        self.assertNotIn('plugin.Ignore.mock_implementation', stages)
+        self.assertGreaterEqual(stages['parse']['seconds'], stages['parse.import_source']['seconds'])
+
+    def test_json_counts_unchanged_files_as_not_rewritten(self):
+        self.read_json(*HEADERS)
+        totals = self.read_json(*HEADERS)['totals']
+        self.assertEqual(4, totals['files_written'])
+        self.assertEqual(0, totals['files_rewritten'])
+
+    def test_json_adds_up_the_targets_of_a_batch(self):
+        stats = self.read_json('--target', 'config.yml', 'mocks', '--target', 'other.yml', 'other', *HEADERS)
+        entry = stats['files']['first.h']
+        self.assertEqual(6, entry['functions'])
+        self.assertEqual(4, entry['files_written'])
+        self.assertEqual(self.mock_size('mocks', 'first') + self.mock_size('other', 'first'), entry['bytes_written'])
+
+    def test_summary_prints_the_same_counts(self):
+        output = self.run_cmock('-oconfig.yml', '--stats', *HEADERS)
+        self.assertRegex(output, r"CMock stats: 2 headers, 5 functions in [\d.]+ ms")
+        self.assertIn("4 files written, 4 rewritten, 0 unchanged, "
+                      f"{self.mock_size('mocks', 'first') + self.mock_size('mocks', 'second')} bytes", output)
+        self.assertRegex(output, r"first\.h +3 +[\d.]+ +[\d.]+ +\d+ +2 of 2")
+        self.assertRegex(output, r"second\.h +2 +[\d.]+ +[\d.]+ +\d+ +2 of 2")
+        self.assertRegex(output, r"\n  parse +[\d.]+ +2\n")
+
+    def test_summary_is_only_printed_when_asked_for(self):
+        output = self.run_cmock('-oconfig.yml', '--stats-json', 'stats.json', *HEADERS)
+        self.assertNotIn('CMock stats', output)
+
+    def test_profile_covers_the_whole_run(self):
+        self.run_cmock('-oconfig.yml', '--profile', 'run.pstats', *HEADERS)
+        profile = pstats.Stats(os.path.join(self.work, 'run.pstats'))
+        functions = {name for _, _, name in profile.stats}
+        self.assertIn('setup_mocks', functions)
+        self.assertIn('parse', functions)
+        self.assertIn('create_mock', functions)
+        self.assertFalse(os.path.exists(os.path.join(self.work, 'stats.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()